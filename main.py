@@ -7,27 +7,53 @@ Refactored for maintainability and security
 import sys
 import os
 import json
-import base64
 import logging
 import tempfile
 import time
 import random
+import operator
+import hashlib
+import shutil
+import re
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import List, Dict, Any
 from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: pybase64 is a SIMD-accelerated drop-in for the stdlib codec
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Optional: orjson parses UTF-8 bytes directly in C, much faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(raw: bytes):
+        return json.loads(raw.decode())
 
 # Setup Python path for package imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
+# --check-alarm 모드: PyQt6 및 GUI 모듈을 불러오기 전에 알람만 확인하고 종료
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--check-alarm":
+    _alarm_logger = logging.getLogger('Croquis')
+    _alarm_logger.setLevel(logging.INFO)
+    _alarm_logger.addHandler(logging.NullHandler())
+    from core.alarm_service import check_and_trigger_alarms
+    check_and_trigger_alarms()
+    sys.exit(0)
+
 # Core modules
 from core.models import CroquisSettings, UIConstants, DEFAULT_SHORTCUTS
 from core.key_manager import encrypt_data, decrypt_data
-from core.alarm_service import check_and_trigger_alarms
 
 # Utils
 from utils.helpers import get_data_path, tr, get_app_icon
-from utils.log_manager import LOG_MESSAGES
+from utils.log_manager import LogKey, format_log
 from utils.language_manager import TRANSLATIONS
 from utils.qt_resource_loader import QtResourceLoader
 
@@ -47,6 +73,18 @@ HISTORY_GRID_WIDTH = UIConstants.HISTORY_GRID_WIDTH
 HISTORY_GRID_HEIGHT = UIConstants.HISTORY_GRID_HEIGHT
 HISTORY_SPACING = UIConstants.HISTORY_SPACING
 
+# Characters stripped from renamed image filenames
+_INVALID_NAME_CHARS = str.maketrans('', '', '\\/:*?"<>|.')
+# One tag per '#'; anything before the first '#' is ignored
+_TAG_RE = re.compile(r'#([^#]*)')
+# Image URLs in dropped HTML, tried in order: <img src>, then any bare image link
+_HTML_IMAGE_URL_PATTERNS = (
+    re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'https?://[^\s<>"\']+\.(?:jpg|jpeg|png|gif|bmp|webp)', re.IGNORECASE),
+)
+# Star color per difficulty level 1-5
+_DIFFICULTY_COLORS = ("#FFD700", "#FFA500", "#FF8C00", "#FF4500", "#FF0000")
+
 # Note: GUI modules already imported from gui.widgets above
 
 # PyQt6 imports
@@ -100,7 +138,7 @@ def setup_logging():
 # Initialize logger (skip if in alarm check mode)
 if not (len(sys.argv) > 1 and sys.argv[1] == "--check-alarm"):
     logger = setup_logging()
-    logger.info(LOG_MESSAGES["program_started"])
+    logger.info(format_log(LogKey.program_started))
 else:
     logger = logging.getLogger('Croquis')
     logger.setLevel(logging.INFO)
@@ -126,15 +164,16 @@ from PyQt6.QtWidgets import (
     QLineEdit, QTextEdit, QTabWidget, QSplitter, QTableWidget,
     QTableWidgetItem, QHeaderView, QMenu, QToolBar, QStatusBar,
     QFrame, QSpacerItem, QSizePolicy, QListWidget, QListWidgetItem,
-    QTreeWidget, QTreeWidgetItem, QCalendarWidget, QTimeEdit, QDateEdit
+    QTreeWidget, QTreeWidgetItem, QCalendarWidget, QTimeEdit, QDateEdit,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle
 )
 from PyQt6.QtCore import (
     Qt, QTimer, pyqtSignal, QPoint, QRect, QSize, QThread,
     QDate, QTime, QDateTime, QUrl, QPropertyAnimation, QEasingCurve,
-    QEvent, QMimeData
+    QEvent, QMimeData, QRunnable, QThreadPool
 )
 from PyQt6.QtGui import (
-    QPixmap, QImage, QPainter, QColor, QBrush, QPen, QFont,
+    QPixmap, QPixmapCache, QImage, QImageReader, QPainter, QColor, QBrush, QPen, QFont,
     QIcon, QPaintEvent, QMouseEvent, QKeyEvent, QDragEnterEvent,
     QDropEvent, QGuiApplication, QAction, QCursor, QFontMetrics
 )
@@ -205,9 +244,7 @@ class ImageRenameDialog(QDialog):
         new_name = self.name_edit.text().strip()
         
         # Remove disallowed characters
-        invalid_chars = ['\\', '/', ':', '*', '?', '"', '<', '>', '|', '.']
-        for char in invalid_chars:
-            new_name = new_name.replace(char, '')
+        new_name = new_name.translate(_INVALID_NAME_CHARS)
         
         return new_name + self.extension if new_name else None
 
@@ -255,26 +292,10 @@ class ImageTagDialog(QDialog):
     
     def get_tags(self) -> List[str]:
         """Return tag list"""
-        text = self.tag_edit.text().strip()
-        if not text:
-            return []
-        
-        # If not starting with '#', trim everything before the first '#'
-        if not text.startswith('#'):
-            hash_pos = text.find('#')
-            if hash_pos > 0:
-                text = text[hash_pos:]
-            elif hash_pos == -1:
-                # No '#', return empty list
-                return []
-        
-        # Split by '#'
-        tags = [tag.strip() for tag in text.split('#') if tag.strip()]
+        tags = (tag.strip() for tag in _TAG_RE.findall(self.tag_edit.text()))
         
-        # Limit each tag to 24 characters
-        tags = [tag[:24] for tag in tags]
-        
-        return tags
+        # Drop empty tags and limit each tag to 24 characters
+        return [tag[:24] for tag in tags if tag]
 
 
 class ImagePropertiesDialog(QDialog):
@@ -359,19 +380,382 @@ class DeckListWidget(QListWidget):
             super().keyPressEvent(event)
 
 
+# ============== Deck item delegate ==============
+# Item data role holding the difficulty painted by DeckItemDelegate
+_DIFFICULTY_ROLE = Qt.ItemDataRole.UserRole + 1
+# Item data role holding the image digest; the editor maps it back to its deck_images entries
+_IMAGE_KEY_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class DeckItemDelegate(QStyledItemDelegate):
+    """Paints deck items, drawing the difficulty overlay over the plain thumbnail"""
+    
+    def __init__(self, editor: "DeckEditorWindow"):
+        super().__init__(editor.image_list)
+        self.editor = editor
+    
+    def initStyleOption(self, option: QStyleOptionViewItem, index):
+        super().initStyleOption(option, index)
+        # Thumbnails are looked up at paint time, so only rows on screen hold (or request) a pixmap
+        key = index.data(_IMAGE_KEY_ROLE)
+        if key is not None:
+            option.icon = QIcon(self.editor._list_thumbnail(key))
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        # Same drawing as QStyledItemDelegate.paint, keeping the option to locate the icon
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        difficulty = index.data(_DIFFICULTY_ROLE)
+        if difficulty is None:
+            return
+        
+        icon_rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemDecoration, opt, opt.widget)
+        
+        badge, badge_x, badge_y = self.editor._difficulty_badge(difficulty)
+        painter.drawPixmap(icon_rect.x() + badge_x, icon_rect.y() + badge_y, badge)
+
+
 # ============== Croquis deck editor ==============
+# Bounding box of stored "thumb_data" (covers the largest 200% icon, 200x240)
+_THUMB_DATA_SIZE = 256
+
+
+def _smooth_fit(image: QImage, width: int, height: int) -> QImage:
+    """Smooth-scale image to fit width x height (KeepAspectRatio)"""
+    if image.width() > 4 * width and image.height() > 4 * height:
+        # Nearest-neighbour down to twice the target first, so the smooth filter
+        # only runs over a small image; the result is visually the same
+        image = image.scaled(
+            2 * width,
+            2 * height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
+    return image.scaled(
+        width,
+        height,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def _thumb_png(image: QImage, size: int) -> str:
+    """Return image scaled to fit size x size as base64 PNG, or "" if it already fits"""
+    if image.isNull() or (image.width() <= size and image.height() <= size):
+        return ""
+    return _png_b64(_smooth_fit(image, size, size))
+
+
+def _png_b64(image: QImage) -> str:
+    """Return image encoded as base64 PNG"""
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return base64.b64encode(buffer.data().data()).decode()
+
+
+def _fit_on_canvas(image: QImage, width: int, height: int) -> QImage:
+    """Scale image into width x height (KeepAspectRatio), centered on a transparent canvas"""
+    scaled = _smooth_fit(image, width, height)
+    canvas = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    canvas.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(canvas)
+    painter.drawImage((width - scaled.width()) // 2, (height - scaled.height()) // 2, scaled)
+    painter.end()
+    return canvas
+
+
+def _build_image_entry(image_bytes: bytes, filename: str, original_path: str, difficulty: int = 1):
+    """Return the deck dict for encoded image bytes, or None if they are not a readable image"""
+    # Only the header is read for validation and size; pixels are decoded when displayed
+    buffer = QBuffer()
+    buffer.setData(image_bytes)
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer)
+    size = reader.size()
+    if not reader.canRead() or not size.isValid():
+        return None
+    
+    image_data = {
+        "filename": filename,
+        "original_path": original_path,
+        "width": size.width(),
+        "height": size.height(),
+        "size": len(image_bytes),
+        "image_data": image_bytes,
+        "digest": _digest_bytes(image_bytes),
+        "difficulty": difficulty,
+        "tags": []
+    }
+    
+    # Small pre-scaled copy for list thumbnails; decoders like JPEG decode straight to the reduced size
+    if size.width() > _THUMB_DATA_SIZE or size.height() > _THUMB_DATA_SIZE:
+        reader.setScaledSize(size.scaled(_THUMB_DATA_SIZE, _THUMB_DATA_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+        thumb = reader.read()
+        if not thumb.isNull():
+            image_data["thumb_data"] = _png_b64(thumb)
+    return image_data
+
+
+def _digest_bytes(image_bytes: bytes) -> str:
+    """Return the content digest identifying image_bytes in caches and the deck"""
+    return hashlib.blake2b(image_bytes, digest_size=16).hexdigest()
+
+
+def _image_digest(img_data: dict) -> str:
+    """Return the deck entry's image digest, computing and storing it for entries saved without one"""
+    digest = img_data.get("digest")
+    if digest is None:
+        digest = img_data["digest"] = _digest_bytes(img_data["image_data"])
+    return digest
+
+
+def _decode_image_data(images: List[dict]) -> List[dict]:
+    """Turn loaded deck entries' base64 "image_data" into the raw bytes kept in memory"""
+    for img in images:
+        data = img.get("image_data")
+        if isinstance(data, str):
+            img["image_data"] = base64.b64decode(data)
+    return images
+
+
+def _encode_image_data(images: List[dict]) -> List[dict]:
+    """Base64-encode deck entries' raw "image_data" for the deck file (inverse of _decode_image_data)"""
+    for img in images:
+        data = img.get("image_data")
+        if isinstance(data, bytes):
+            img["image_data"] = base64.b64encode(data).decode()
+    return images
+
+
+def _prepare_image_record(path: str, difficulty: int = 1):
+    """Read an image file and return its deck dict (None if unreadable); safe on worker threads"""
+    # Store the file's own bytes; every reader decodes with loadFromData, which sniffs the format
+    with open(path, "rb") as f:
+        image_bytes = f.read()
+        mtime = os.fstat(f.fileno()).st_mtime
+    image_data = _build_image_entry(image_bytes, os.path.basename(path), path, difficulty)
+    if image_data is not None:
+        # Recorded now so sorting by date never has to stat the original files
+        image_data["mtime"] = mtime
+    return image_data
+
+
+class _ThumbnailTask(QRunnable):
+    """Decode and scale one deck thumbnail on a worker thread"""
+    
+    def __init__(self, img_data: dict, job: tuple, width: int, height: int, done):
+        super().__init__()
+        # Only immutable values cross threads (thumb_data str, image_data bytes); the dict stays with the GUI thread
+        self.thumb_data = img_data.get("thumb_data")
+        self.image_data = img_data["image_data"]
+        self.job = job
+        self.width = width
+        self.height = height
+        self.done = done
+    
+    def run(self):
+        new_thumb_data = ""
+        try:
+            image = QImage()
+            if self.thumb_data:
+                image.loadFromData(base64.b64decode(self.thumb_data))
+            else:
+                image.loadFromData(self.image_data)
+                size = _THUMB_DATA_SIZE
+                if image.width() > size or image.height() > size:
+                    # The stored thumbnail doubles as the source for the icon
+                    image = _smooth_fit(image, size, size)
+                    new_thumb_data = _png_b64(image)
+            canvas = _fit_on_canvas(image, self.width, self.height)
+        except Exception:
+            canvas = QImage()
+        try:
+            self.done(self.job, canvas, new_thumb_data)
+        except RuntimeError:
+            # Editor was closed while rendering
+            pass
+
+
+def _fast_copyfile(src, dst):
+    """Copy src to dst with its metadata (like shutil.copy2), cloning in the kernel when possible"""
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        # Reflink on Btrfs/XFS and server-side copy on NFS; nothing passes through user space
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            pass
+    if not copied:
+        # shutil already uses sendfile (Linux), fcopyfile (macOS) or a large readinto buffer (Windows)
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+class _TempFileWriteTask(QRunnable):
+    """Encrypt a deck snapshot and write it to the temp file on a worker thread"""
+    
+    def __init__(self, data: dict, path: Path, lang: str):
+        super().__init__()
+        self.data = data
+        self.path = path
+        self.lang = lang
+    
+    def run(self):
+        try:
+            # Base64 only for the file; the entries are the snapshot's own copies
+            _encode_image_data(self.data["images"])
+            encrypted = encrypt_data(self.data)
+            with open(self.path, "wb") as f:
+                f.write(encrypted)
+        except Exception as e:
+            print(tr("temp_file_save_failed", self.lang).format(e))
+
+
+class _DeckSaveTask(QRunnable):
+    """Copy the temp file to a deck path on a worker thread; done=None leaves the result in error"""
+    
+    def __init__(self, src: Path, dst: str, edit_count: int, done=None):
+        super().__init__()
+        self.src = src
+        self.dst = dst
+        self.edit_count = edit_count
+        self.done = done
+        self.error = ""
+    
+    def run(self):
+        try:
+            _fast_copyfile(self.src, self.dst)
+        except Exception as e:
+            self.error = str(e)
+        if self.done is None:
+            return
+        try:
+            self.done(str(self.src), self.dst, self.edit_count, self.error)
+        except RuntimeError:
+            # Editor was closed while saving
+            pass
+
+
+class _UrlDownloadTask(QRunnable):
+    """Fetch an image URL on a worker thread, resolving Pinterest pages to their image first"""
+    
+    _HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    # Image URL patterns on a Pinterest page, best first; matched on the raw bytes
+    _PINTEREST_PATTERNS = (
+        re.compile(rb'"url":"(https://i\.pinimg\.com/originals/[^"]+)"'),
+        re.compile(rb'"url":"(https://i\.pinimg\.com/[0-9]+x/[^"]+)"'),
+        re.compile(rb'<meta property="og:image" content="([^"]+)"'),
+    )
+    
+    def __init__(self, url: str, done):
+        super().__init__()
+        self.url = url
+        self.done = done
+    
+    def run(self):
+        url = self.url
+        image_data = b""
+        error_kind = ""
+        error = ""
+        
+        # If Pinterest URL, try to extract the image URL
+        if 'pinterest.com' in url:
+            try:
+                url = self._resolve_pinterest(url)
+            except Exception as e:
+                error_kind, error = "pinterest", str(e)
+        
+        if not error_kind:
+            try:
+                import urllib.request
+                
+                # Download image
+                logger.info(format_log(LogKey.downloading_image, url))
+                req = urllib.request.Request(url, headers=self._HEADERS)
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    image_data = response.read()
+            except Exception as e:
+                error_kind, error = "download", str(e)
+        
+        try:
+            self.done(url, image_data, error_kind, error)
+        except RuntimeError:
+            # Editor was closed while downloading
+            pass
+    
+    def _resolve_pinterest(self, url: str) -> str:
+        """Return the image URL found on a Pinterest page (or url itself if none is found)"""
+        import ssl
+        import urllib.request
+        
+        # Create SSL context
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        
+        req = urllib.request.Request(url, headers=self._HEADERS)
+        with urllib.request.urlopen(req, context=context, timeout=10) as response:
+            html = response.read()
+        
+        # Find image URL patterns (Pinterest originals); only the match is decoded
+        for pattern in self._PINTEREST_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                # Use the first (largest) image URL
+                image_url = match.group(1).decode('utf-8').replace('\\/', '/')
+                logger.info(format_log(LogKey.pinterest_image_extracted, image_url))
+                return image_url
+        return url
+
+
 # ============== Croquis deck editor ==============
 class DeckEditorWindow(QMainWindow):
     """Croquis deck editor window"""
     
+    _thumbnail_ready = pyqtSignal(object, QImage, str)  # (image hash, icon scale), thumbnail, new thumb_data
+    _url_downloaded = pyqtSignal(str, object, str, str)  # final url, image bytes, error kind, error
+    _deck_saved = pyqtSignal(str, str, int, str)  # temp file, deck path, edit count when queued, error ("" on success)
+    
+    # QPixmapCache limit (KB); its LRU eviction bounds thumbnail memory, evicted rows re-render when shown
+    _PIXMAP_CACHE_KB = 100 * 1024
+    
+    # Rendered difficulty overlays and their (x, y), keyed by (difficulty, icon_scale); shared by all editors
+    _DIFFICULTY_BADGE_CACHE: Dict[tuple, tuple] = {}
+    
+    # View menu entries; each action carries its value in QAction.data()
+    _SORT_FIELDS = ("name", "size", "difficulty", "date")
+    _SORT_ORDERS = ("asc", "desc")
+    _ICON_SCALE_PRESETS = (50, 75, 100, 125, 150, 200)
+    
     def __init__(self, lang: str = "ko", dark_mode: bool = False, parent=None):
         super().__init__(parent)
         self.lang = lang
         self.dark_mode = dark_mode
         self.deck_images: List[Dict[str, Any]] = []  # List of image info dicts
+        self._filename_index: Dict[str, int] = {}  # filename -> position in deck_images
         self.current_deck_path = None
         self.temp_file_path = None  # Temp file path
+        # Coalesces bursts of edits into one temp file write; active means a write is pending
+        self._temp_save_timer = QTimer(self)
+        self._temp_save_timer.setSingleShot(True)
+        self._temp_save_timer.setInterval(1000)
+        self._temp_save_timer.timeout.connect(self._save_temp_file_async)
+        # A single writer thread keeps temp file writes in order and off the GUI thread
+        self._temp_write_pool = QThreadPool(self)
+        self._temp_write_pool.setMaxThreadCount(1)
         self.is_modified = False  # Tracks unsaved changes
+        self._edit_count = 0  # Bumped by mark_modified; tells a finished save whether edits followed it
         
         # Sort settings
         self.sort_by = "name"  # name, size, difficulty, date
@@ -379,15 +763,24 @@ class DeckEditorWindow(QMainWindow):
         
         # Icon scale
         self.icon_scale = 100  # Default 100%
-        
-        # Lazy loading settings
-        self.lazy_load_batch_size = 50  # Load 50 items at a time
-        self.lazy_load_current_index = 0
-        self.lazy_load_timer = QTimer(self)
-        self.lazy_load_timer.timeout.connect(self._load_next_batch)
+        self._update_scaled_sizes()
+        # Scaled thumbnails (without overlay) live in QPixmapCache under _thumb_cache_key
+        if QPixmapCache.cacheLimit() < self._PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(self._PIXMAP_CACHE_KB)
+        # Thumbnails being rendered on the pool, as (image digest, icon scale) jobs
+        self._thumb_inflight: set = set()
+        # Image digest -> the deck_images entries holding that image (rebuilt by update_image_list)
+        self._entries_by_image: Dict[str, List[dict]] = {}
+        # Empty icons shown until a render arrives, keyed by icon_scale
+        self._thumb_placeholders: Dict[int, QPixmap] = {}
+        self._thumb_pool = QThreadPool.globalInstance()
+        self._thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._url_downloaded.connect(self._on_url_downloaded)
+        self._deck_saved.connect(self._on_deck_saved)
         
         # Recent files (max 5)
         self.recent_files = self.load_recent_files()
+        self._saved_recent_files = tuple(self.recent_files)  # Last list written to recent.dat
         
         self.setup_temp_file()
         self.setup_ui()
@@ -408,27 +801,30 @@ class DeckEditorWindow(QMainWindow):
         self.save_temp_file()
     
     def save_temp_file(self):
-        """Save current deck state to temp file (async)"""
+        """Save current deck state to temp file (debounced)"""
         if not self.temp_file_path:
             return
         
-        # Use QTimer for async save
-        QTimer.singleShot(0, self._save_temp_file_async)
+        # Restart the debounce window; the write happens once edits pause
+        self._temp_save_timer.start()
+    
+    def flush_temp_file(self):
+        """Write a pending temp file save immediately and wait for the writer thread"""
+        if self._temp_save_timer.isActive():
+            self._temp_save_timer.stop()
+            self._save_temp_file_async()
+        self._temp_write_pool.waitForDone()
     
     def _save_temp_file_async(self):
-        """Async temp file save"""
-        try:
-            data = {
-                "images": self.deck_images,
-                "current_path": self.current_deck_path
-            }
-            
-            encrypted = encrypt_data(data)
-            
-            with open(self.temp_file_path, "wb") as f:
-                f.write(encrypted)
-        except Exception as e:
-            print(tr("temp_file_save_failed", self.lang).format(e))
+        """Snapshot the deck and hand encryption and the file write to the writer thread"""
+        if not self.temp_file_path:
+            return
+        # Shallow copies suffice: edits replace dict values rather than mutating them
+        data = {
+            "images": [dict(img) for img in self.deck_images],
+            "current_path": self.current_deck_path
+        }
+        self._temp_write_pool.start(_TempFileWriteTask(data, self.temp_file_path, self.lang))
     
     def load_temp_file(self, source_path: str = None):
         """Load temp file (copy from deck file or start new)"""
@@ -438,19 +834,24 @@ class DeckEditorWindow(QMainWindow):
                 with open(source_path, "rb") as f:
                     encrypted = f.read()
                 data = decrypt_data(encrypted)
-                self.deck_images = data.get("images", [])
+                self.deck_images = _decode_image_data(data.get("images", []))
             else:
                 # Start fresh
                 self.deck_images = []
+            self._rebuild_index()
             
             self.save_temp_file()
             self.update_image_list()
         except Exception as e:
             print(tr("temp_file_load_failed", self.lang).format(e))
             self.deck_images = []
+            self._rebuild_index()
     
     def cleanup_temp_file(self):
         """Remove temp file"""
+        # A pending or running write would recreate the file
+        self._temp_save_timer.stop()
+        self._temp_write_pool.waitForDone()
         if self.temp_file_path and os.path.exists(self.temp_file_path):
             try:
                 os.unlink(self.temp_file_path)
@@ -495,71 +896,40 @@ class DeckEditorWindow(QMainWindow):
         sort_menu = view_menu.addMenu(tr("sort", self.lang))
         
         # Sort criteria
-        self.sort_name_action = QAction(tr("sort_name", self.lang), self)
-        self.sort_name_action.triggered.connect(lambda: self.set_sort_by("name"))
-        sort_menu.addAction(self.sort_name_action)
-        
-        self.sort_size_action = QAction(tr("sort_size", self.lang), self)
-        self.sort_size_action.triggered.connect(lambda: self.set_sort_by("size"))
-        sort_menu.addAction(self.sort_size_action)
-        
-        self.sort_difficulty_action = QAction(tr("sort_difficulty", self.lang), self)
-        self.sort_difficulty_action.triggered.connect(lambda: self.set_sort_by("difficulty"))
-        sort_menu.addAction(self.sort_difficulty_action)
-        
-        self.sort_date_action = QAction(tr("sort_date", self.lang), self)
-        self.sort_date_action.triggered.connect(lambda: self.set_sort_by("date"))
-        sort_menu.addAction(self.sort_date_action)
+        self.sort_by_actions: Dict[str, QAction] = {}
+        for sort_by in self._SORT_FIELDS:
+            action = QAction(tr(f"sort_{sort_by}", self.lang), self)
+            action.setData(sort_by)
+            action.triggered.connect(self._on_sort_by_action)
+            sort_menu.addAction(action)
+            self.sort_by_actions[sort_by] = action
         
         sort_menu.addSeparator()
         
         # Sort order
-        self.sort_asc_action = QAction(tr("sort_asc", self.lang), self)
-        self.sort_asc_action.triggered.connect(lambda: self.set_sort_order("asc"))
-        sort_menu.addAction(self.sort_asc_action)
-        
-        self.sort_desc_action = QAction(tr("sort_desc", self.lang), self)
-        self.sort_desc_action.triggered.connect(lambda: self.set_sort_order("desc"))
-        sort_menu.addAction(self.sort_desc_action)
-        
-        # Default sort (name asc); kept non-checkable
-        # self.sort_name_action.setChecked(True)
-        # self.sort_asc_action.setChecked(True)
+        self.sort_order_actions: Dict[str, QAction] = {}
+        for order in self._SORT_ORDERS:
+            action = QAction(tr(f"sort_{order}", self.lang), self)
+            action.setData(order)
+            action.triggered.connect(self._on_sort_order_action)
+            sort_menu.addAction(action)
+            self.sort_order_actions[order] = action
         
         # Icon size submenu
         icon_size_menu = view_menu.addMenu(tr("icon_size", self.lang))
         
-        self.icon_50_action = QAction("50%", self)
-        self.icon_50_action.triggered.connect(lambda: self.set_icon_scale(50))
-        icon_size_menu.addAction(self.icon_50_action)
-        
-        self.icon_75_action = QAction("75%", self)
-        self.icon_75_action.triggered.connect(lambda: self.set_icon_scale(75))
-        icon_size_menu.addAction(self.icon_75_action)
-        
-        self.icon_100_action = QAction("100%", self)
-        self.icon_100_action.triggered.connect(lambda: self.set_icon_scale(100))
-        icon_size_menu.addAction(self.icon_100_action)
-        
-        self.icon_125_action = QAction("125%", self)
-        self.icon_125_action.triggered.connect(lambda: self.set_icon_scale(125))
-        icon_size_menu.addAction(self.icon_125_action)
-        
-        self.icon_150_action = QAction("150%", self)
-        self.icon_150_action.triggered.connect(lambda: self.set_icon_scale(150))
-        icon_size_menu.addAction(self.icon_150_action)
-        
-        self.icon_200_action = QAction("200%", self)
-        self.icon_200_action.triggered.connect(lambda: self.set_icon_scale(200))
-        icon_size_menu.addAction(self.icon_200_action)
+        self.icon_scale_actions: Dict[int, QAction] = {}
+        for scale in self._ICON_SCALE_PRESETS:
+            action = QAction(f"{scale}%", self)
+            action.setData(scale)
+            action.triggered.connect(self._on_icon_scale_action)
+            icon_size_menu.addAction(action)
+            self.icon_scale_actions[scale] = action
         
         self.icon_custom_action = QAction(tr("custom", self.lang), self)
         self.icon_custom_action.triggered.connect(self.set_custom_icon_scale)
         icon_size_menu.addAction(self.icon_custom_action)
         
-        # Default icon scale (100%); kept non-checkable
-        # self.icon_100_action.setChecked(True)
-        
         # Central widget
         central = QWidget()
         self.setCentralWidget(central)
@@ -584,19 +954,21 @@ class DeckEditorWindow(QMainWindow):
         left_layout.addLayout(button_layout)
         
         self.image_list = DeckListWidget()
-        self.image_list.setIconSize(QSize(DECK_ICON_WIDTH, DECK_ICON_HEIGHT))
-        self.image_list.setGridSize(QSize(DECK_GRID_WIDTH, DECK_GRID_HEIGHT))
+        self._item_delegate = DeckItemDelegate(self)
+        self.image_list.setItemDelegate(self._item_delegate)
+        self.image_list.setIconSize(QSize(self._icon_width, self._icon_height))
+        self.image_list.setGridSize(self._grid_size)
         self.image_list.setViewMode(QListWidget.ViewMode.IconMode)
         self.image_list.setResizeMode(QListWidget.ResizeMode.Adjust)
         self.image_list.setMovement(QListWidget.Movement.Static)  # Keep static movement
         self.image_list.setFlow(QListWidget.Flow.LeftToRight)
         self.image_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)  # Allow multi-select via drag
         self.image_list.setSpacing(DECK_SPACING)
-        self.image_list.setWordWrap(True)
         self.image_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.image_list.setTextElideMode(Qt.TextElideMode.ElideMiddle)  # Ellipsize long filenames in the middle
+        # Single-line labels elided in the middle; no word wrap, so every item keeps the uniform grid size
+        self.image_list.setTextElideMode(Qt.TextElideMode.ElideMiddle)
         self.image_list.setUniformItemSizes(True)  # Enable uniform item sizes for performance
-        self.image_list.verticalScrollBar().valueChanged.connect(self._on_image_list_scroll)
+        self.image_list.setLayoutMode(QListWidget.LayoutMode.Batched)  # Lay out large decks incrementally
         self.image_list.setStyleSheet("""
             QListWidget::item {
                 text-align: center;
@@ -664,14 +1036,16 @@ class DeckEditorWindow(QMainWindow):
         # Handle URL drops
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
+            paths = []
             for url in urls:
                 path = url.toLocalFile()
                 if path and path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')):
-                    self.add_image_to_deck(path)
+                    paths.append(path)
                 elif not path:  # URL drop that is not a local file
                     url_str = url.toString()
                     if url_str.startswith('http://') or url_str.startswith('https://'):
                         self.download_image_from_url(url_str)
+            self.add_images_to_deck(paths)
         
         # Handle text/URL drops (e.g., Pinterest links)
         elif event.mimeData().hasText():
@@ -684,309 +1058,252 @@ class DeckEditorWindow(QMainWindow):
         elif event.mimeData().hasHtml():
             html = event.mimeData().html()
             # Extract URLs from HTML
-            import re
-            # Find img src patterns
-            img_patterns = [
-                r'<img[^>]+src=["\']([^"\']+)["\']',
-                r'https?://[^\s<>"\']+(\.(jpg|jpeg|png|gif|bmp|webp))',
-            ]
-            for pattern in img_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
+            for pattern in _HTML_IMAGE_URL_PATTERNS:
+                matches = pattern.findall(html)
                 if matches:
-                    for match in matches:
-                        url = match if isinstance(match, str) else match[0]
+                    for url in matches:
                         if url.startswith('http://') or url.startswith('https://'):
                             self.download_image_from_url(url)
                             break
                     break
     
     def download_image_from_url(self, url: str):
-        """Download image from URL"""
+        """Download image from URL (fetched on a worker thread; added in _on_url_downloaded)"""
+        QThreadPool.globalInstance().start(_UrlDownloadTask(url, self._url_downloaded.emit))
+    
+    def _on_url_downloaded(self, url: str, image_data: bytes, error_kind: str, error: str):
+        """Add an image fetched by _UrlDownloadTask to the deck"""
+        if error_kind == "pinterest":
+            logger.error(format_log(LogKey.pinterest_extraction_failed, error))
+            print(tr("pinterest_extract_failed_msg", self.lang).format(error))
+            QMessageBox.warning(self, tr("warning", self.lang), tr("pinterest_extract_failed", self.lang))
+            return
+        
         try:
-            import urllib.request
-            import tempfile
-            import re
+            if error_kind:
+                raise RuntimeError(error)
+            
             from urllib.parse import urlparse, unquote
             
-            # If Pinterest URL, try to extract the image URL
-            if 'pinterest.com' in url:
-                # Attempt to extract image URL from Pinterest page
-                try:
-                    import ssl
-                    import json
-                    
-                    # Create SSL context
-                    context = ssl.create_default_context()
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    
-                    # Add User-Agent header
-                    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-                    req = urllib.request.Request(url, headers=headers)
-                    
-                    with urllib.request.urlopen(req, context=context, timeout=10) as response:
-                        html = response.read().decode('utf-8')
-                        
-                        # Find image URL patterns (Pinterest originals)
-                        patterns = [
-                            r'"url":"(https://i\.pinimg\.com/originals/[^"]+)"',
-                            r'"url":"(https://i\.pinimg\.com/[0-9]+x/[^"]+)"',
-                            r'<meta property="og:image" content="([^"]+)"'
-                        ]
-                        
-                        for pattern in patterns:
-                            matches = re.findall(pattern, html)
-                            if matches:
-                                # Use the first (largest) image URL
-                                image_url = matches[0].replace('\\/', '/')
-                                logger.info(LOG_MESSAGES["pinterest_image_extracted"].format(image_url))
-                                # Recurse with the extracted URL
-                                self.download_image_from_url(image_url)
-                                return
-                except Exception as e:
-                    logger.error(LOG_MESSAGES["pinterest_extraction_failed"].format(e))
-                    print(tr("pinterest_extract_failed_msg", self.lang).format(e))
-                    QMessageBox.warning(self, tr("warning", self.lang), tr("pinterest_extract_failed", self.lang))
-                    return
+            # Build filename
+            parsed_url = urlparse(url)
+            filename = os.path.basename(unquote(parsed_url.path))
             
-            # Download image
-            logger.info(LOG_MESSAGES["downloading_image"].format(url))
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            req = urllib.request.Request(url, headers=headers)
+            # If missing name or extension, fall back to a stable content digest
+            if not filename or '.' not in filename:
+                filename = f"downloaded_{hashlib.blake2s(image_data, digest_size=8).hexdigest()}.jpg"
+            
+            # Check for duplicates by filename (same rule as add_images_to_deck)
+            if filename in self._filename_index:
+                return  # Already added
+            
+            # Keep the downloaded bytes as-is (see add_image_to_deck)
+            image_data_dict = _build_image_entry(image_data, filename, url)  # Store URL as original path
+            if image_data_dict is None:
+                QMessageBox.warning(self, tr("warning", self.lang), tr("invalid_image", self.lang))
+                return
+            
+            # Add to deck
+            self.deck_images.append(image_data_dict)
+            logger.info(format_log(LogKey.image_added_to_deck, filename))
+            self.save_temp_file()
+            self.update_image_list()
+            self.mark_modified()
             
-            with urllib.request.urlopen(req, timeout=10) as response:
-                image_data = response.read()
-                
-                # Build filename
-                parsed_url = urlparse(url)
-                filename = os.path.basename(unquote(parsed_url.path))
-                
-                # If missing name or extension, fall back
-                if not filename or '.' not in filename:
-                    filename = f"downloaded_{hash(url) % 100000}.jpg"
-                
-                # Handle directly in memory
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-                
-                if pixmap.isNull():
-                    QMessageBox.warning(self, tr("warning", self.lang), tr("invalid_image", self.lang))
-                    return
-                
-                # Convert image to bytes
-                from PyQt6.QtCore import QBuffer, QIODevice
-                buffer = QBuffer()
-                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                pixmap.save(buffer, "PNG")
-                image_bytes = buffer.data().data()
-                
-                # Build image info dictionary
-                image_data_dict = {
-                    "filename": filename,
-                    "original_path": url,  # Store URL as original path
-                    "width": pixmap.width(),
-                    "height": pixmap.height(),
-                    "size": len(image_bytes),
-                    "image_data": base64.b64encode(image_bytes).decode(),
-                    "difficulty": 1,
-                    "tags": []
-                }
-                
-                # Add to deck
-                self.deck_images.append(image_data_dict)
-                logger.info(LOG_MESSAGES["image_added_to_deck"].format(filename))
-                self.save_temp_file()
-                self.update_image_list()
-                self.mark_modified()
-                
         except Exception as e:
-            logger.error(LOG_MESSAGES["url_download_failed"].format(e))
+            logger.error(format_log(LogKey.url_download_failed, e))
             QMessageBox.warning(self, "오류", f"이미지를 다운로드하는 중 오류가 발생했습니다:\n{str(e)}")
                 
     def add_image_to_deck(self, path: str, difficulty: int = 1):
         """Add image to deck and store metadata"""
-        # Check for duplicates by filename
-        filename = os.path.basename(path)
-        logger.info(f"Added image to deck: {filename}")
-        for img_data in self.deck_images:
-            if img_data.get("filename") == filename:
-                return  # Already added
+        self.add_images_to_deck([path], difficulty)
+    
+    def add_images_to_deck(self, paths: List[str], difficulty: int = 1):
+        """Add images to deck, then save and refresh the list once for the whole batch"""
+        # Check for duplicates by filename (including earlier files of this batch)
+        filenames = set(self._filename_index)
+        new_paths = []
+        for path in paths:
+            filename = os.path.basename(path)
+            logger.info(f"Added image to deck: {filename}")
+            if filename in filenames:
+                continue  # Already added
+            filenames.add(filename)
+            new_paths.append(path)
+        
+        # Reading, header parsing and thumbnail decoding run in parallel (Qt and file I/O release the GIL)
+        with ThreadPoolExecutor(max_workers=max(1, min(len(new_paths), os.cpu_count() or 1))) as executor:
+            futures = [executor.submit(_prepare_image_record, path, difficulty) for path in new_paths]
+        
+        added = []
+        # Collected in submission order so the deck keeps the selected order
+        for path, future in zip(new_paths, futures):
+            try:
+                image_data = future.result()
+                if image_data is None:
+                    QMessageBox.warning(self, tr("warning", self.lang), f"{tr('invalid_image', self.lang)}: {os.path.basename(path)}")
+                    continue
+                added.append(image_data)
+                
+            except Exception as e:
+                QMessageBox.warning(self, "오류", f"이미지 추가 실패: {str(e)}")
         
-        try:
-            # Validate image and extract info
-            pixmap = QPixmap(path)
-            if pixmap.isNull():
-                QMessageBox.warning(self, tr("warning", self.lang), f"{tr('invalid_image', self.lang)}: {filename}")
-                return
-            
-            # Convert image to bytes (QBuffer)
-            from PyQt6.QtCore import QBuffer, QIODevice
-            buffer = QBuffer()
-            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-            pixmap.save(buffer, "PNG")
-            image_bytes = buffer.data().data()
-            
-            # Build image info dictionary
-            image_data = {
-                "filename": filename,
-                "original_path": path,
-                "width": pixmap.width(),
-                "height": pixmap.height(),
-                "size": len(image_bytes),
-                "image_data": base64.b64encode(image_bytes).decode(),
-                "difficulty": difficulty,
-                "tags": []  # Add tag field
-            }
-            
-            self.deck_images.append(image_data)
+        if added:
+            self.deck_images.extend(added)
             self.save_temp_file()  # Update temp file
             self.update_image_list()  # Refresh UI
             self.mark_modified()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"이미지 추가 실패: {str(e)}")
     
-    def create_thumbnail_with_difficulty(self, img_data: dict) -> QPixmap:
-        """Create thumbnail with difficulty overlay"""
-        # Build pixmap from image data
-        image_bytes = base64.b64decode(img_data["image_data"])
-        pixmap = QPixmap()
-        pixmap.loadFromData(image_bytes)
+    def _list_thumbnail(self, key: str) -> QPixmap:
+        """Return the list icon for the image with digest key; uncached thumbnails are rendered on the thread pool"""
+        icon_width, icon_height = self._icon_width, self._icon_height
+        
+        base = QPixmapCache.find(self._thumb_cache_key(key, self.icon_scale))
+        if base is None:
+            job = (key, self.icon_scale)
+            entries = self._entries_by_image.get(key)
+            if entries and job not in self._thumb_inflight:
+                self._thumb_inflight.add(job)
+                self._thumb_pool.start(_ThumbnailTask(
+                    entries[0], job, icon_width, icon_height, self._thumbnail_ready.emit
+                ))
+            # Empty canvas until the image arrives (keeps the overlay position stable)
+            base = self._thumb_placeholders.get(self.icon_scale)
+            if base is None:
+                base = QPixmap(icon_width, icon_height)
+                base.fill(Qt.GlobalColor.transparent)
+                self._thumb_placeholders[self.icon_scale] = base
+        return base
+    
+    def _on_thumbnail_ready(self, job: tuple, image: QImage, thumb_data: str):
+        """Cache a thumbnail rendered by _ThumbnailTask and repaint the list to show it"""
+        self._thumb_inflight.discard(job)
+        if thumb_data:
+            # Attach to the real deck entries so the temp file (and saved deck) keeps it
+            attached = False
+            for img_data in self._entries_by_image.get(job[0], ()):
+                if "thumb_data" not in img_data:
+                    img_data["thumb_data"] = thumb_data
+                    attached = True
+            if attached:
+                self.save_temp_file()
         
-        # Compute sizes
-        icon_width = int(DECK_ICON_WIDTH * self.icon_scale / 100)
-        icon_height = int(DECK_ICON_HEIGHT * self.icon_scale / 100)
-        
-        # Generate thumbnail (KeepAspectRatio)
-        scaled_thumb = pixmap.scaled(
-            icon_width, 
-            icon_height, 
-            Qt.AspectRatioMode.KeepAspectRatio, 
-            Qt.TransformationMode.SmoothTransformation
+        if image.isNull():
+            return
+        # Cached even for a stale scale; switching back to it is then free
+        QPixmapCache.insert(self._thumb_cache_key(*job), QPixmap.fromImage(image))
+        if job[1] == self.icon_scale:
+            self.image_list.viewport().update()
+    
+    @staticmethod
+    def _full_pixmap(img_data: dict) -> QPixmap:
+        """Return the full-size pixmap of a deck entry, decoded once and kept in QPixmapCache"""
+        key = f"deck-full:{_image_digest(img_data)}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap()
+            pixmap.loadFromData(img_data["image_data"])
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    @staticmethod
+    def _thumb_cache_key(digest: str, icon_scale: int) -> str:
+        """Return the QPixmapCache key of a deck thumbnail"""
+        return f"deck:{digest}:{icon_scale}"
+    
+    def _update_scaled_sizes(self):
+        """Recompute the icon and grid sizes for the current icon scale"""
+        self._icon_width = int(DECK_ICON_WIDTH * self.icon_scale / 100)
+        self._icon_height = int(DECK_ICON_HEIGHT * self.icon_scale / 100)
+        self._grid_size = QSize(
+            int(DECK_GRID_WIDTH * self.icon_scale / 100),
+            int(DECK_GRID_HEIGHT * self.icon_scale / 100)
         )
-        
-        # Center on canvas
-        thumbnail = QPixmap(icon_width, icon_height)
-        thumbnail.fill(Qt.GlobalColor.transparent)
-        thumb_painter = QPainter(thumbnail)
-        thumb_x = (icon_width - scaled_thumb.width()) // 2
-        thumb_y = (icon_height - scaled_thumb.height()) // 2
-        thumb_painter.drawPixmap(thumb_x, thumb_y, scaled_thumb)
-        
-        # Add difficulty overlay (bottom-right) scaled by icon size
-        difficulty = img_data.get("difficulty", 1)
-        colors = ["#FFD700", "#FFA500", "#FF8C00", "#FF4500", "#FF0000"]
-        star_color = colors[difficulty - 1] if 1 <= difficulty <= 5 else "#FFD700"
-        
-        # Scale overlay size
-        overlay_width = int(32 * self.icon_scale / 100)
-        overlay_height = int(18 * self.icon_scale / 100)
-        overlay_offset_x = int(35 * self.icon_scale / 100)
-        overlay_offset_y = int(20 * self.icon_scale / 100)
-        font_size = max(8, int(10 * self.icon_scale / 100))
-        
-        # Semi-transparent dark background
-        bg_rect = QRect(icon_width - overlay_offset_x, icon_height - overlay_offset_y, overlay_width, overlay_height)
-        thumb_painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
-        thumb_painter.setPen(Qt.PenStyle.NoPen)
-        thumb_painter.drawRoundedRect(bg_rect, 8, 8)
-        
-        # Difficulty number (white)
-        thumb_painter.setPen(QColor(255, 255, 255))
-        thumb_painter.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
-        thumb_painter.drawText(icon_width - int(32 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), str(difficulty))
-        
-        # Star indicator (colored)
-        thumb_painter.setPen(QColor(star_color))
-        thumb_painter.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
-        thumb_painter.drawText(icon_width - int(20 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), "★")
-        
-        thumb_painter.end()
-        return thumbnail
+    
+    def _difficulty_badge(self, difficulty: int) -> tuple:
+        """Return the pre-rendered difficulty overlay and its (x, y) on the thumbnail"""
+        key = (difficulty, self.icon_scale)
+        cached = self._DIFFICULTY_BADGE_CACHE.get(key)
+        if cached is None:
+            icon_width, icon_height = self._icon_width, self._icon_height
+            # The overlay spans the bottom-right corner; extra height leaves room for glyph ascent
+            overlay_offset_x = int(35 * self.icon_scale / 100)
+            overlay_offset_y = int(20 * self.icon_scale / 100)
+            badge_x = icon_width - overlay_offset_x
+            badge_y = icon_height - 2 * overlay_offset_y
+            
+            star_color = _DIFFICULTY_COLORS[difficulty - 1] if 1 <= difficulty <= 5 else _DIFFICULTY_COLORS[0]
+            
+            # Scale overlay size
+            overlay_width = int(32 * self.icon_scale / 100)
+            overlay_height = int(18 * self.icon_scale / 100)
+            font_size = max(8, int(10 * self.icon_scale / 100))
+            font = QFont("Arial", font_size, QFont.Weight.Bold)
+            
+            badge = QPixmap(overlay_offset_x, 2 * overlay_offset_y)
+            badge.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(badge)
+            # Draw in thumbnail coordinates so the layout matches the original overlay
+            painter.translate(-badge_x, -badge_y)
+            
+            # Semi-transparent dark background
+            bg_rect = QRect(icon_width - overlay_offset_x, icon_height - overlay_offset_y, overlay_width, overlay_height)
+            painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(bg_rect, 8, 8)
+            
+            painter.setFont(font)
+            
+            # Difficulty number (white)
+            painter.setPen(QColor(255, 255, 255))
+            painter.drawText(icon_width - int(32 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), str(difficulty))
+            
+            # Star indicator (colored)
+            painter.setPen(QColor(star_color))
+            painter.drawText(icon_width - int(20 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), "★")
+            
+            painter.end()
+            cached = self._DIFFICULTY_BADGE_CACHE[key] = (badge, badge_x, badge_y)
+        return cached
+    
+    def _attach_thumb_data(self, img_data: dict, image: QImage):
+        """Store a small PNG of image as img_data["thumb_data"] (small images are their own thumbnail)"""
+        thumb_data = _thumb_png(image, _THUMB_DATA_SIZE)
+        if thumb_data:
+            img_data["thumb_data"] = thumb_data
+    
+    def _rebuild_index(self):
+        """Recompute _filename_index after deck_images was reordered, added to or shrunk"""
+        self._filename_index = {img.get("filename"): i for i, img in enumerate(self.deck_images)}
+    
+    def _entry_for_item(self, item: QListWidgetItem):
+        """Return the deck_images entry shown by an image list item, or None"""
+        i = self._filename_index.get(item.data(Qt.ItemDataRole.UserRole))
+        return self.deck_images[i] if i is not None else None
     
     def update_image_list(self):
-        """Update image list UI with lazy loading"""
+        """Rebuild the image list; DeckItemDelegate fetches thumbnails for the rows it paints"""
+        self._rebuild_index()
+        self._entries_by_image.clear()
+        self.image_list.setUpdatesEnabled(False)
         self.image_list.clear()
-        self.lazy_load_current_index = 0
-        self.lazy_load_timer.stop()
-        
-        # Start lazy loading
-        if self.deck_images:
-            self._load_next_batch()
-    
-    def _load_next_batch(self):
-        """Load next batch of images"""
-        start_idx = self.lazy_load_current_index
-        end_idx = min(start_idx + self.lazy_load_batch_size, len(self.deck_images))
         
-        if start_idx >= len(self.deck_images):
-            return
-        
-        for idx in range(start_idx, end_idx):
+        grid_size = self._grid_size
+        # Identical images share one bytes object in memory (and so one cached thumbnail)
+        shared_data: Dict[str, bytes] = {}
+        for img_data in self.deck_images:
             try:
-                img_data = self.deck_images[idx]
-                
-                # Compute sizes
-                icon_width = int(DECK_ICON_WIDTH * self.icon_scale / 100)
-                icon_height = int(DECK_ICON_HEIGHT * self.icon_scale / 100)
-                grid_width = int(DECK_GRID_WIDTH * self.icon_scale / 100)
-                grid_height = int(DECK_GRID_HEIGHT * self.icon_scale / 100)
-                
-                # Build pixmap from image data
-                image_bytes = base64.b64decode(img_data["image_data"])
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_bytes)
-                
-                # Generate thumbnail (KeepAspectRatio)
-                scaled_thumb = pixmap.scaled(
-                    icon_width, 
-                    icon_height, 
-                    Qt.AspectRatioMode.KeepAspectRatio, 
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                # Center on canvas
-                thumbnail = QPixmap(icon_width, icon_height)
-                thumbnail.fill(Qt.GlobalColor.transparent)
-                thumb_painter = QPainter(thumbnail)
-                thumb_x = (icon_width - scaled_thumb.width()) // 2
-                thumb_y = (icon_height - scaled_thumb.height()) // 2
-                thumb_painter.drawPixmap(thumb_x, thumb_y, scaled_thumb)
-                
-                # Add difficulty overlay (bottom-right) scaled by icon size
+                key = _image_digest(img_data)
+                img_data["image_data"] = shared_data.setdefault(key, img_data["image_data"])
+                self._entries_by_image.setdefault(key, []).append(img_data)
                 difficulty = img_data.get("difficulty", 1)
-                colors = ["#FFD700", "#FFA500", "#FF8C00", "#FF4500", "#FF0000"]
-                star_color = colors[difficulty - 1] if 1 <= difficulty <= 5 else "#FFD700"
-                
-                # Scale overlay size
-                overlay_width = int(32 * self.icon_scale / 100)
-                overlay_height = int(18 * self.icon_scale / 100)
-                overlay_offset_x = int(35 * self.icon_scale / 100)
-                overlay_offset_y = int(20 * self.icon_scale / 100)
-                font_size = max(8, int(10 * self.icon_scale / 100))
-                
-                # Semi-transparent dark background
-                bg_rect = QRect(icon_width - overlay_offset_x, icon_height - overlay_offset_y, overlay_width, overlay_height)
-                thumb_painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
-                thumb_painter.setPen(Qt.PenStyle.NoPen)
-                thumb_painter.drawRoundedRect(bg_rect, 8, 8)
-                
-                # Difficulty number (white)
-                thumb_painter.setPen(QColor(255, 255, 255))
-                thumb_painter.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
-                thumb_painter.drawText(icon_width - int(32 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), str(difficulty))
-                
-                # Star indicator (colored)
-                thumb_painter.setPen(QColor(star_color))
-                thumb_painter.setFont(QFont("Arial", font_size, QFont.Weight.Bold))
-                thumb_painter.drawText(icon_width - int(20 * self.icon_scale / 100), icon_height - int(6 * self.icon_scale / 100), "★")
-                
-                thumb_painter.end()
                 
                 # Create list item
                 item = QListWidgetItem()
-                item.setIcon(QIcon(thumbnail))
-                item.setSizeHint(QSize(grid_width, grid_height))
+                item.setData(_IMAGE_KEY_ROLE, key)
+                item.setData(_DIFFICULTY_ROLE, difficulty)
+                item.setSizeHint(grid_size)
                 
                 # Filename label
                 filename = img_data.get("filename", "")
@@ -999,28 +1316,15 @@ class DeckEditorWindow(QMainWindow):
                     tooltip += f"\n태그: {', '.join(tags)}"
                 item.setToolTip(tooltip)
                 
-                # Store image data in UserRole
-                item.setData(Qt.ItemDataRole.UserRole, img_data)
+                # The filename resolves the item back to its deck_images entry
+                item.setData(Qt.ItemDataRole.UserRole, filename)
                 
                 self.image_list.addItem(item)
                 
             except Exception as e:
                 print(tr("image_load_failed", self.lang).format(e))
         
-        self.lazy_load_current_index = end_idx
-        
-        # Continue loading if there are more items
-        if self.lazy_load_current_index < len(self.deck_images):
-            self.lazy_load_timer.start(100)  # Load next batch after 100ms
-    
-    def _on_image_list_scroll(self, value):
-        """Trigger loading when scrolling near the bottom"""
-        scrollbar = self.image_list.verticalScrollBar()
-        if scrollbar.maximum() > 0:
-            # Load more when scrolled to 80% of the way
-            if value >= scrollbar.maximum() * 0.8:
-                if self.lazy_load_current_index < len(self.deck_images) and not self.lazy_load_timer.isActive():
-                    self._load_next_batch()
+        self.image_list.setUpdatesEnabled(True)
             
     def import_images(self):
         files, _ = QFileDialog.getOpenFileNames(
@@ -1029,8 +1333,7 @@ class DeckEditorWindow(QMainWindow):
             "",
             "Images (*.png *.jpg *.jpeg *.gif *.bmp *.webp)"
         )
-        for f in files:
-            self.add_image_to_deck(f)
+        self.add_images_to_deck(files)
         
         # Refresh Save As menu state
         if files:
@@ -1038,7 +1341,7 @@ class DeckEditorWindow(QMainWindow):
             
     def on_image_selected(self, item: QListWidgetItem):
         """Show croquis list for the selected image"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1052,7 +1355,7 @@ class DeckEditorWindow(QMainWindow):
             
     def new_deck(self):
         """Create a new deck"""
-        logger.info(LOG_MESSAGES["deck_created"])
+        logger.info(format_log(LogKey.deck_created))
         if self.is_modified:
             reply = QMessageBox.question(
                 self,
@@ -1062,7 +1365,8 @@ class DeckEditorWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.save_deck()
+                if not self._save_before_discard():
+                    return
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
         
@@ -1085,7 +1389,7 @@ class DeckEditorWindow(QMainWindow):
         
     def open_deck(self):
         """Open an existing deck"""
-        logger.info(LOG_MESSAGES["deck_loaded"])
+        logger.info(format_log(LogKey.deck_loaded))
         if self.is_modified:
             reply = QMessageBox.question(
                 self,
@@ -1095,7 +1399,8 @@ class DeckEditorWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.save_deck()
+                if not self._save_before_discard():
+                    return
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
         
@@ -1125,7 +1430,7 @@ class DeckEditorWindow(QMainWindow):
                 
     def save_deck(self):
         """Save deck by copying temp file"""
-        logger.info(LOG_MESSAGES["deck_saved"])
+        logger.info(format_log(LogKey.deck_saved))
         if self.current_deck_path:
             self._save_to_path(self.current_deck_path)
         else:
@@ -1133,35 +1438,80 @@ class DeckEditorWindow(QMainWindow):
             
     def save_deck_as(self):
         """Save deck as..."""
+        path = self._ask_save_path()
+        if path:
+            self._save_to_path(path)
+    
+    def _ask_save_path(self):
+        """Ask for a deck file to save to; None if cancelled"""
         path, _ = QFileDialog.getSaveFileName(
             self,
             tr("save_as", self.lang),
             "",
             "Croquis Deck Files (*.crdk)"
         )
-        if path:
-            if not path.endswith('.crdk'):
-                path += '.crdk'
-            self._save_to_path(path)
+        if not path:
+            return None
+        if not path.endswith('.crdk'):
+            path += '.crdk'
+        return path
+    
+    def _save_before_discard(self) -> bool:
+        """Save and wait before the deck is closed or replaced; False if it was not saved"""
+        logger.info(format_log(LogKey.deck_saved))
+        path = self.current_deck_path or self._ask_save_path()
+        return bool(path) and self._save_to_path(path, wait=True)
             
-    def _save_to_path(self, path: str):
-        """Persist to file by copying temp to target path"""
+    def _save_to_path(self, path: str, wait: bool = False) -> bool:
+        """Persist to file by copying temp to target path; with wait, block until copied and return success"""
         try:
-            # Ensure temp file exists
-            if not self.temp_file_path or not os.path.exists(self.temp_file_path):
+            # Pending edits are written first, then copied, both in order on the single writer thread;
+            # cleanup_temp_file waits for them, so the temp file outlives the copy
+            if self._temp_save_timer.isActive():
+                self._temp_save_timer.stop()
+                self._save_temp_file_async()
+            # With nothing queued on the writer, no write can still create the file
+            if not self.temp_file_path or (
+                self._temp_write_pool.activeThreadCount() == 0 and not os.path.exists(self.temp_file_path)
+            ):
                 QMessageBox.warning(self, "저장 오류", "임시 파일을 찾을 수 없습니다.")
-                return
-            
-            # Copy temp file to target path
-            import shutil
-            shutil.copy2(self.temp_file_path, path)
+                return False
             
+            # Taken right away so Save during the copy targets the same file instead of asking again
             self.current_deck_path = path
-            self.is_modified = False
-            self.update_title()
+            if not wait:
+                self._temp_write_pool.start(_DeckSaveTask(
+                    self.temp_file_path, path, self._edit_count, self._deck_saved.emit
+                ))
+                self.update_title()
+                return True
+            
+            task = _DeckSaveTask(self.temp_file_path, path, self._edit_count)
+            task.setAutoDelete(False)  # Read back below
+            self._temp_write_pool.start(task)
+            self._temp_write_pool.waitForDone()
+            return self._finish_deck_save(task.edit_count, task.error)
             
         except Exception as e:
             QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류가 발생했습니다:\n{str(e)}")
+            return False
+    
+    def _on_deck_saved(self, temp_path: str, path: str, edit_count: int, error: str):
+        """Finish a background _DeckSaveTask for the deck still being edited"""
+        if temp_path != str(self.temp_file_path) or not self.isVisible():
+            return  # Another deck was opened (or a new one started), or the editor closed, while copying
+        self._finish_deck_save(edit_count, error)
+    
+    def _finish_deck_save(self, edit_count: int, error: str) -> bool:
+        """Mark the deck saved after a successful copy, or report the failure"""
+        if error:
+            QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류가 발생했습니다:\n{error}")
+            return False
+        # Edits made after the save was queued are not in the copy
+        if edit_count == self._edit_count:
+            self.is_modified = False
+        self.update_title()
+        return True
     
     def load_recent_files(self) -> List[str]:
         """Load recent files from encrypted dat file"""
@@ -1183,7 +1533,10 @@ class DeckEditorWindow(QMainWindow):
             return []
     
     def save_recent_files(self):
-        """Save recent files to encrypted dat file"""
+        """Save recent files to encrypted dat file (skipped when the list is unchanged)"""
+        if tuple(self.recent_files) == self._saved_recent_files:
+            return
+        
         dat_dir = get_data_path() / "dat"
         dat_dir.mkdir(exist_ok=True)
         recent_path = dat_dir / "recent.dat"
@@ -1192,8 +1545,12 @@ class DeckEditorWindow(QMainWindow):
             data = {"recent_files": self.recent_files}
             encrypted = encrypt_data(data)
             
-            with open(recent_path, "wb") as f:
+            # Write beside the target and swap it in, so a crash never leaves a truncated file
+            tmp_path = recent_path.with_suffix(".dat.tmp")
+            with open(tmp_path, "wb") as f:
                 f.write(encrypted)
+            os.replace(tmp_path, recent_path)
+            self._saved_recent_files = tuple(self.recent_files)
         except Exception as e:
             logger.error(f"Failed to save recent files: {e}")
     
@@ -1224,7 +1581,8 @@ class DeckEditorWindow(QMainWindow):
         else:
             for file_path in self.recent_files:
                 action = QAction(os.path.basename(file_path), self)
-                action.triggered.connect(lambda checked, p=file_path: self.open_recent_file(p))
+                action.setData(file_path)
+                action.triggered.connect(self._on_recent_file_action)
                 self.recent_menu.addAction(action)
             
             self.recent_menu.addSeparator()
@@ -1233,6 +1591,10 @@ class DeckEditorWindow(QMainWindow):
             clear_action.triggered.connect(self.clear_recent_files)
             self.recent_menu.addAction(clear_action)
     
+    def _on_recent_file_action(self):
+        """Recent files menu handler"""
+        self.open_recent_file(self.sender().data())
+    
     def open_recent_file(self, file_path: str):
         """Open a recent file"""
         if not os.path.exists(file_path):
@@ -1252,7 +1614,8 @@ class DeckEditorWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.save_deck()
+                if not self._save_before_discard():
+                    return
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
         
@@ -1271,7 +1634,7 @@ class DeckEditorWindow(QMainWindow):
             
             self.update_title()
             
-            logger.info(LOG_MESSAGES["deck_loaded"])
+            logger.info(format_log(LogKey.deck_loaded))
         except Exception as e:
             QMessageBox.critical(self, "오류", f"덱 불러오기 실패:\n{e}")
             logger.error(f"Failed to open recent file: {e}")
@@ -1288,16 +1651,14 @@ class DeckEditorWindow(QMainWindow):
         if not selected_items:
             return
         
-        logger.info(LOG_MESSAGES["images_deleted"].format(len(selected_items)))
+        logger.info(format_log(LogKey.images_deleted, len(selected_items)))
         
         # Collect filenames of selected items
-        filenames_to_delete = []
+        filenames_to_delete = set()
         for item in selected_items:
-            img_data = item.data(Qt.ItemDataRole.UserRole)
-            if img_data and isinstance(img_data, dict):
-                filenames_to_delete.append(img_data["filename"])
+            filenames_to_delete.add(item.data(Qt.ItemDataRole.UserRole))
         
-        # Remove from deck_images
+        # Remove from deck_images (update_image_list rebuilds the index)
         self.deck_images = [img for img in self.deck_images if img["filename"] not in filenames_to_delete]
         
         # Refresh UI
@@ -1313,7 +1674,7 @@ class DeckEditorWindow(QMainWindow):
     
     def on_deck_item_clicked(self, item: QListWidgetItem):
         """Show croquis list when a deck item is clicked"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1354,8 +1715,8 @@ class DeckEditorWindow(QMainWindow):
             # Difficulty submenu
             difficulty_menu = menu.addMenu(tr("set_difficulty", self.lang))
             for i in range(1, 6):
-                action = difficulty_menu.addAction(f"★{i}")
-                action.triggered.connect(lambda checked, d=i, it=item: self.set_item_difficulty(it, d))
+                difficulty_menu.addAction(f"★{i}").setData(i)
+            difficulty_menu.triggered.connect(lambda action: self.set_item_difficulty(item, action.data()))
             
             # Set tags
             tag_action = menu.addAction(tr("set_tags", self.lang))
@@ -1377,7 +1738,7 @@ class DeckEditorWindow(QMainWindow):
         if text and (text.startswith('http://') or text.startswith('https://')):
             # Handle Pinterest pin URL
             if 'pinterest.com/pin/' in text:
-                logger.info(LOG_MESSAGES["pinterest_url_detected"].format(text))
+                logger.info(format_log(LogKey.pinterest_url_detected, text))
                 self.download_image_from_url(text)
             elif any(ext in text.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']):
                 # Generic image URL
@@ -1392,32 +1753,32 @@ class DeckEditorWindow(QMainWindow):
             from PyQt6.QtGui import QImage
             image = clipboard.image()
             if not image.isNull():
-                # Process image in memory
-                pixmap = QPixmap.fromImage(image)
-                
                 # Build filename
                 import time
                 filename = f"clipboard_{int(time.time())}.png"
                 
-                # Convert image to bytes
+                # Convert image to bytes (encoded straight from the QImage, no QPixmap round trip)
                 from PyQt6.QtCore import QBuffer, QIODevice
                 buffer = QBuffer()
                 buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                pixmap.save(buffer, "PNG")
+                image.save(buffer, "PNG")
                 image_bytes = buffer.data().data()
                 
                 # Build image info dictionary
                 image_data_dict = {
                     "filename": filename,
                     "original_path": "클립보드",
-                    "width": pixmap.width(),
-                    "height": pixmap.height(),
+                    "width": image.width(),
+                    "height": image.height(),
                     "size": len(image_bytes),
-                    "image_data": base64.b64encode(image_bytes).decode(),
+                    "image_data": image_bytes,
                     "difficulty": 1,
                     "tags": []
                 }
                 
+                # Small pre-scaled copy for list thumbnails
+                self._attach_thumb_data(image_data_dict, image)
+                
                 # Add to deck
                 self.deck_images.append(image_data_dict)
                 logger.info(f"Image added to deck: {filename}")
@@ -1430,7 +1791,7 @@ class DeckEditorWindow(QMainWindow):
     
     def export_image(self, item: QListWidgetItem):
         """Export image at original size"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1449,7 +1810,7 @@ class DeckEditorWindow(QMainWindow):
         
         try:
             # Load image bytes
-            image_bytes = base64.b64decode(img_data["image_data"])
+            image_bytes = img_data["image_data"]
             
             # Write to file
             with open(file_path, 'wb') as f:
@@ -1463,7 +1824,7 @@ class DeckEditorWindow(QMainWindow):
     
     def cycle_item_difficulty(self, item: QListWidgetItem):
         """Cycle item difficulty (1→2→3→4→5→1)"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1473,34 +1834,25 @@ class DeckEditorWindow(QMainWindow):
     
     def set_item_difficulty(self, item: QListWidgetItem, difficulty: int):
         """Set item difficulty"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
         img_data["difficulty"] = difficulty
         logger.info(f"Difficulty changed: {img_data['filename']} -> {difficulty}")
         
-        # Update deck_images
-        filename = img_data["filename"]
-        for i, deck_img in enumerate(self.deck_images):
-            if deck_img.get("filename") == filename:
-                self.deck_images[i]["difficulty"] = difficulty
-                break
-        
-        # Rebuild thumbnail (with overlay)
-        thumbnail = self.create_thumbnail_with_difficulty(img_data)
-        item.setIcon(QIcon(thumbnail))
+        # The delegate repaints the overlay from this role
+        item.setData(_DIFFICULTY_ROLE, difficulty)
         
         # Update tooltip
         item.setToolTip(f"{tr('difficulty', self.lang)}: {difficulty} {'★' * difficulty}")
-        item.setData(Qt.ItemDataRole.UserRole, img_data)
         
         self.save_temp_file()
         self.mark_modified()
     
     def rename_image(self, item: QListWidgetItem):
         """Rename an image"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1514,22 +1866,19 @@ class DeckEditorWindow(QMainWindow):
                 img_data["filename"] = new_name
                 logger.info(f"Filename changed: {current_name} -> {new_name}")
                 
-                # Update deck_images
-                for i, deck_img in enumerate(self.deck_images):
-                    if deck_img.get("filename") == current_name:
-                        self.deck_images[i]["filename"] = new_name
-                        break
+                # Re-key the index and the item on the new name
+                self._filename_index[new_name] = self._filename_index.pop(current_name)
                 
                 # Update item label
                 item.setText(new_name)
-                item.setData(Qt.ItemDataRole.UserRole, img_data)
+                item.setData(Qt.ItemDataRole.UserRole, new_name)
                 
                 self.save_temp_file()
                 self.mark_modified()
     
     def set_image_tags(self, item: QListWidgetItem):
         """Set tags for an image"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1543,26 +1892,18 @@ class DeckEditorWindow(QMainWindow):
             img_data["tags"] = new_tags
             logger.info(f"{tr('set_tags', self.lang)}: {img_data['filename']} -> {new_tags}")
             
-            # Update deck_images
-            filename = img_data["filename"]
-            for i, deck_img in enumerate(self.deck_images):
-                if deck_img.get("filename") == filename:
-                    self.deck_images[i]["tags"] = new_tags
-                    break
-            
             # Update tooltip
             tooltip = f"{tr('difficulty', self.lang)}: {img_data.get('difficulty', 1)} {'★' * img_data.get('difficulty', 1)}"
             if new_tags:
                 tooltip += f"\n{tr('tag', self.lang)}: {', '.join(new_tags)}"
             item.setToolTip(tooltip)
-            item.setData(Qt.ItemDataRole.UserRole, img_data)
             
             self.save_temp_file()
             self.mark_modified()
     
     def show_image_preview(self, item: QListWidgetItem):
         """Show large image preview dialog"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1572,9 +1913,7 @@ class DeckEditorWindow(QMainWindow):
             return
         
         try:
-            image_bytes = base64.b64decode(image_data)
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_bytes)
+            pixmap = self._full_pixmap(img_data)
             if pixmap.isNull():
                 return
         except Exception as e:
@@ -1626,7 +1965,7 @@ class DeckEditorWindow(QMainWindow):
     
     def show_image_properties(self, item: QListWidgetItem):
         """Show image properties"""
-        img_data = item.data(Qt.ItemDataRole.UserRole)
+        img_data = self._entry_for_item(item)
         if not img_data:
             return
         
@@ -1666,10 +2005,9 @@ class DeckEditorWindow(QMainWindow):
         self.sort_by = sort_by
         
         # Update menu labels
-        self.sort_name_action.setText(f"{tr('sort_name', self.lang)} ✔" if sort_by == "name" else tr('sort_name', self.lang))
-        self.sort_size_action.setText(f"{tr('sort_size', self.lang)} ✔" if sort_by == "size" else tr('sort_size', self.lang))
-        self.sort_difficulty_action.setText(f"{tr('sort_difficulty', self.lang)} ✔" if sort_by == "difficulty" else tr('sort_difficulty', self.lang))
-        self.sort_date_action.setText(f"{tr('sort_date', self.lang)} ✔" if sort_by == "date" else tr('sort_date', self.lang))
+        for key, action in self.sort_by_actions.items():
+            label = tr(f"sort_{key}", self.lang)
+            action.setText(f"{label} ✔" if key == sort_by else label)
         
         # Apply sorting
         self.apply_sort()
@@ -1679,12 +2017,21 @@ class DeckEditorWindow(QMainWindow):
         self.sort_order = order
         
         # Update menu labels
-        self.sort_asc_action.setText(f"{tr('sort_asc', self.lang)} ✔" if order == "asc" else tr('sort_asc', self.lang))
-        self.sort_desc_action.setText(f"{tr('sort_desc', self.lang)} ✔" if order == "desc" else tr('sort_desc', self.lang))
+        for key, action in self.sort_order_actions.items():
+            label = tr(f"sort_{key}", self.lang)
+            action.setText(f"{label} ✔" if key == order else label)
         
         # Apply sorting
         self.apply_sort()
     
+    def _on_sort_by_action(self):
+        """Sort field menu handler"""
+        self.set_sort_by(self.sender().data())
+    
+    def _on_sort_order_action(self):
+        """Sort order menu handler"""
+        self.set_sort_order(self.sender().data())
+    
     def apply_sort(self):
         """Apply sorting"""
         if not self.deck_images:
@@ -1698,13 +2045,16 @@ class DeckEditorWindow(QMainWindow):
         elif self.sort_by == "difficulty":
             key_func = lambda x: x.get("difficulty", 1)
         elif self.sort_by == "date":
-            # Sort by original path mtime, fallback to 0 if missing
-            def get_mtime(img_data):
-                path = img_data.get("original_path", "")
-                if path and os.path.exists(path):
-                    return os.path.getmtime(path)
-                return 0
-            key_func = get_mtime
+            # Sort by original path mtime (recorded at import), fallback to 0 if missing
+            for img_data in self.deck_images:
+                if "mtime" not in img_data:
+                    # Entries from older decks or URL/clipboard: stat once and keep the result
+                    path = img_data.get("original_path", "")
+                    try:
+                        img_data["mtime"] = os.stat(path).st_mtime if path else 0
+                    except (OSError, ValueError):
+                        img_data["mtime"] = 0
+            key_func = operator.itemgetter("mtime")
         else:
             key_func = lambda x: x.get("filename", "").lower()
         
@@ -1721,18 +2071,18 @@ class DeckEditorWindow(QMainWindow):
         self.icon_scale = scale
         
         # Update menu labels
-        self.icon_50_action.setText("50% ✔" if scale == 50 else "50%")
-        self.icon_75_action.setText("75% ✔" if scale == 75 else "75%")
-        self.icon_100_action.setText("100% ✔" if scale == 100 else "100%")
-        self.icon_125_action.setText("125% ✔" if scale == 125 else "125%")
-        self.icon_150_action.setText("150% ✔" if scale == 150 else "150%")
-        self.icon_200_action.setText("200% ✔" if scale == 200 else "200%")
+        for preset, action in self.icon_scale_actions.items():
+            action.setText(f"{preset}% ✔" if preset == scale else f"{preset}%")
         # Reset custom menu label
         self.icon_custom_action.setText(self.tr("custom"))
         
         # Apply icon size
         self.apply_icon_scale()
     
+    def _on_icon_scale_action(self):
+        """Icon size preset menu handler"""
+        self.set_icon_scale(self.sender().data())
+    
     def set_custom_icon_scale(self):
         """Set a custom icon scale"""
         from PyQt6.QtWidgets import QInputDialog
@@ -1750,12 +2100,8 @@ class DeckEditorWindow(QMainWindow):
         if ok:
             self.icon_scale = scale
             # Clear checkmarks on preset sizes
-            self.icon_50_action.setText("50%")
-            self.icon_75_action.setText("75%")
-            self.icon_100_action.setText("100%")
-            self.icon_125_action.setText("125%")
-            self.icon_150_action.setText("150%")
-            self.icon_200_action.setText("200%")
+            for preset, action in self.icon_scale_actions.items():
+                action.setText(f"{preset}%")
             # Add checkmark to custom menu
             self.icon_custom_action.setText(f"{self.tr('custom_with_value').format(scale=scale)} ✔")
             
@@ -1765,20 +2111,18 @@ class DeckEditorWindow(QMainWindow):
     def apply_icon_scale(self):
         """Apply icon size to the list"""
         # Compute sizes
-        icon_width = int(DECK_ICON_WIDTH * self.icon_scale / 100)
-        icon_height = int(DECK_ICON_HEIGHT * self.icon_scale / 100)
-        grid_width = int(DECK_GRID_WIDTH * self.icon_scale / 100)
-        grid_height = int(DECK_GRID_HEIGHT * self.icon_scale / 100)
+        self._update_scaled_sizes()
         
         # Apply to image_list
-        self.image_list.setIconSize(QSize(icon_width, icon_height))
-        self.image_list.setGridSize(QSize(grid_width, grid_height))
+        self.image_list.setIconSize(QSize(self._icon_width, self._icon_height))
+        self.image_list.setGridSize(self._grid_size)
         
         # Refresh UI (regenerate thumbnails)
         self.update_image_list()
     
     def mark_modified(self):
         """Mark deck as modified"""
+        self._edit_count += 1
         if not self.is_modified:
             self.is_modified = True
             self.update_title()
@@ -1805,20 +2149,25 @@ class DeckEditorWindow(QMainWindow):
         #     return
         
         image_filename = os.path.basename(image_path)
+        # Pairs are saved as "{timestamp}_{image stem}.croq"; other images' files need no decrypting
+        name_suffix = f"_{os.path.splitext(image_filename)[0]}.croq"
         found_count = 0
         
         try:
+            # Use key_manager for decryption (one cipher for every file)
+            from core.key_manager import get_key_manager
+            fernet = get_key_manager().get_fernet()
+            
             # Iterate .croq files
             for file in sorted(pairs_dir.glob("*.croq"), reverse=True):
+                if not file.name.endswith(name_suffix):
+                    continue
                 try:
                     with open(file, "rb") as f:
                         encrypted = f.read()
                     
-                    # Use key_manager for decryption
-                    from core.key_manager import get_key_manager
-                    fernet = get_key_manager().get_fernet()
                     decrypted = fernet.decrypt(encrypted)
-                    data = json.loads(decrypted.decode())
+                    data = _json_loads(decrypted)
                     
                     # Validate metadata
                     metadata = data.get("image_metadata", {})
@@ -1927,7 +2276,7 @@ class DeckEditorWindow(QMainWindow):
         if not data:
             return
         
-        logger.info(LOG_MESSAGES["croquis_large_view_selected"])
+        logger.info(format_log(LogKey.croquis_large_view_selected))
         croquis_file_path = data.get("file_path")
         dialog = CroquisLargeViewDialog(data, self.lang, croquis_file_path, self)
         dialog.exec()
@@ -1964,7 +2313,7 @@ class DeckEditorWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle close event; prompt to save if modified"""
-        logger.info(LOG_MESSAGES["deck_editor_closed"])
+        logger.info(format_log(LogKey.deck_editor_closed))
         if self.is_modified:
             reply = QMessageBox.question(
                 self,
@@ -1974,7 +2323,9 @@ class DeckEditorWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.save_deck()
+                if not self._save_before_discard():
+                    event.ignore()
+                    return
                 self.cleanup_temp_file()
                 event.accept()
             elif reply == QMessageBox.StandardButton.No:
@@ -2158,7 +2509,7 @@ Set WshShell = Nothing
         import shutil
         shutil.copy2(vbs_path, startup_link)
         
-        logger.info(LOG_MESSAGES["alarm_service_installed"])
+        logger.info(format_log(LogKey.alarm_service_installed))
         return True
         
     except Exception as e:
@@ -2189,7 +2540,7 @@ def remove_alarm_background_service():
         if startup_link.exists():
             startup_link.unlink()
         
-        logger.info(LOG_MESSAGES["alarm_service_removed"])
+        logger.info(format_log(LogKey.alarm_service_removed))
         return True
         
     except Exception as e:
@@ -2286,17 +2637,18 @@ class HistoryWindow(QDialog):
         self.history_data = []
         dates_set = set()
         
+        # Use key_manager for decryption (one cipher for every file)
+        from core.key_manager import get_key_manager
+        fernet = get_key_manager().get_fernet()
+        
         # Load and decrypt files
         for file in sorted(history_dir.glob("*.croq"), reverse=True):
             try:
                 with open(file, "rb") as f:
                     encrypted = f.read()
                 
-                # Use key_manager for decryption
-                from core.key_manager import get_key_manager
-                fernet = get_key_manager().get_fernet()
                 decrypted = fernet.decrypt(encrypted)
-                data = json.loads(decrypted.decode())
+                data = _json_loads(decrypted)
                 
                 # Extract date
                 timestamp = data.get("timestamp", file.stem)
@@ -2510,7 +2862,7 @@ class CroquisLargeViewDialog(QDialog):
         self.lang = lang
         self.croquis_file_path = croquis_file_path
         self.setup_ui()
-        logger.info(LOG_MESSAGES["croquis_large_view_opened"])
+        logger.info(format_log(LogKey.croquis_large_view_opened))
     
     def setup_ui(self):
         self.setWindowTitle(tr("croquis_large_view", self.lang))
@@ -2604,7 +2956,7 @@ class CroquisMemoDialog(QDialog):
         self.lang = lang
         self.setup_ui()
         self.load_memo()
-        logger.info(LOG_MESSAGES["memo_dialog_opened"].format(os.path.basename(croquis_file_path)))
+        logger.info(format_log(LogKey.memo_dialog_opened, os.path.basename(croquis_file_path)))
     
     def setup_ui(self):
         self.setWindowTitle(tr("memo", self.lang))
@@ -2635,12 +2987,12 @@ class CroquisMemoDialog(QDialog):
                 from core.key_manager import get_key_manager
                 fernet = get_key_manager().get_fernet()
                 decrypted = fernet.decrypt(encrypted)
-                data = json.loads(decrypted.decode())
+                data = _json_loads(decrypted)
                 
                 memo_text = data.get("memo", "")
                 self.memo_edit.setPlainText(memo_text)
             except Exception as e:
-                logger.error(LOG_MESSAGES["memo_loading_failed"].format(e))
+                logger.error(format_log(LogKey.memo_loading_failed, e))
     
     def save_and_close(self):
         """Persist memo and close dialog."""
@@ -2655,7 +3007,7 @@ class CroquisMemoDialog(QDialog):
             from core.key_manager import get_key_manager
             fernet = get_key_manager().get_fernet()
             decrypted = fernet.decrypt(encrypted)
-            data = json.loads(decrypted.decode())
+            data = _json_loads(decrypted)
             
             # Update memo content
             data["memo"] = memo_text
@@ -2665,10 +3017,10 @@ class CroquisMemoDialog(QDialog):
             with open(self.croquis_file_path, "wb") as f:
                 f.write(encrypted_new)
             
-            logger.info(LOG_MESSAGES["memo_saved"].format(os.path.basename(self.croquis_file_path)))
+            logger.info(format_log(LogKey.memo_saved, os.path.basename(self.croquis_file_path)))
             self.accept()
         except Exception as e:
-            logger.error(LOG_MESSAGES["memo_saving_failed"].format(e))
+            logger.error(format_log(LogKey.memo_saving_failed, e))
             QMessageBox.warning(self, tr("error", self.lang), tr("memo_save_failed", self.lang).format(str(e)))
     
     @staticmethod
@@ -2683,7 +3035,7 @@ class CroquisMemoDialog(QDialog):
                 from core.key_manager import get_key_manager
                 fernet = get_key_manager().get_fernet()
                 decrypted = fernet.decrypt(encrypted)
-                data = json.loads(decrypted.decode())
+                data = _json_loads(decrypted)
                 
                 return data.get("memo", "").strip()
             except:
@@ -3036,7 +3388,7 @@ class TagFilterDialog(QDialog):
             
         except Exception as e:
             self.loading_label.setText(f"태그 로드 실패: {str(e)}")
-            logger.error(LOG_MESSAGES["tag_loading_failed"].format(e))
+            logger.error(format_log(LogKey.tag_loading_failed, e))
     
     def update_tags_ui(self):
         """Refresh tag selection UI."""
@@ -3716,7 +4068,7 @@ class MainWindow(QMainWindow):
             f"{tr('croquis_deck_file', self.lang)} (*.crdk)"
         )
         if file_path:
-            logger.info(LOG_MESSAGES["deck_selected"].format(os.path.basename(file_path)))
+            logger.info(format_log(LogKey.deck_selected, os.path.basename(file_path)))
             self.load_deck_file(file_path)
             
     def load_deck_file(self, file_path: str):
@@ -3792,22 +4144,22 @@ class MainWindow(QMainWindow):
         
     def on_width_changed(self, value: int):
         self.settings.image_width = value
-        logger.info(LOG_MESSAGES["image_width_changed"].format(value))
+        logger.info(format_log(LogKey.image_width_changed, value))
         self.save_settings()
         
     def on_height_changed(self, value: int):
         self.settings.image_height = value
-        logger.info(LOG_MESSAGES["image_height_changed"].format(value))
+        logger.info(format_log(LogKey.image_height_changed, value))
         self.save_settings()
         
     def on_grayscale_changed(self, state: int):
         self.settings.grayscale = state == Qt.CheckState.Checked.value
-        logger.info(LOG_MESSAGES["grayscale_mode"].format(self.settings.grayscale))
+        logger.info(format_log(LogKey.grayscale_mode, self.settings.grayscale))
         self.save_settings()
         
     def on_flip_changed(self, state: int):
         self.settings.flip_horizontal = state == Qt.CheckState.Checked.value
-        logger.info(LOG_MESSAGES["flip_horizontal"].format(self.settings.flip_horizontal))
+        logger.info(format_log(LogKey.flip_horizontal, self.settings.flip_horizontal))
         self.save_settings()
         
     def on_timer_pos_changed(self, text: str):
@@ -3822,7 +4174,7 @@ class MainWindow(QMainWindow):
         }
         internal_value = pos_map.get(text, "bottom_right")
         self.settings.timer_position = internal_value
-        logger.info(LOG_MESSAGES["timer_position_changed"].format(internal_value))
+        logger.info(format_log(LogKey.timer_position_changed, internal_value))
         self.save_settings()
         
     def on_timer_font_changed(self, text: str):
@@ -3837,7 +4189,7 @@ class MainWindow(QMainWindow):
         self.settings.timer_font_size = font_map.get(text, "large")
         # Only log when value actually changes
         if old_size != self.settings.timer_font_size:
-            logger.info(LOG_MESSAGES["timer_font_size_changed"].format(self.settings.timer_font_size))
+            logger.info(format_log(LogKey.timer_font_size_changed, self.settings.timer_font_size))
         self.save_settings()
     
     def on_today_pos_changed(self, text: str):
@@ -3866,7 +4218,7 @@ class MainWindow(QMainWindow):
         
     def on_time_changed(self, value: int):
         self.settings.time_seconds = value
-        logger.info(LOG_MESSAGES["timer_time_changed"].format(value))
+        logger.info(format_log(LogKey.timer_time_changed, value))
         self.save_settings()
         
     def on_language_changed(self, text: str):
@@ -3877,14 +4229,14 @@ class MainWindow(QMainWindow):
         else:
             self.settings.language = "en"
         self.lang = self.settings.language  # Update lang attribute
-        logger.info(LOG_MESSAGES["language_changed"].format(self.lang))
+        logger.info(format_log(LogKey.language_changed, self.lang))
         
         self.apply_language()
         self.save_settings()
         
     def on_dark_mode_changed(self, state: int):
         self.settings.dark_mode = state == Qt.CheckState.Checked.value
-        logger.info(LOG_MESSAGES["dark_mode"].format(self.settings.dark_mode))
+        logger.info(format_log(LogKey.dark_mode, self.settings.dark_mode))
         # Note: Dark mode is now always on via QSS, this setting is kept for compatibility
         self.save_settings()
         
@@ -3906,7 +4258,7 @@ class MainWindow(QMainWindow):
         dialog = TagFilterDialog(deck_path, self.lang, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.enabled_tags = dialog.get_enabled_tags()
-            logger.info(LOG_MESSAGES["tags_enabled"].format(self.enabled_tags))
+            logger.info(format_log(LogKey.tags_enabled, self.enabled_tags))
             
             # Reload images with tag filters applied
             self.load_images_from_deck(deck_path)
@@ -3916,11 +4268,12 @@ class MainWindow(QMainWindow):
         if not self.image_files:
             return
         
-        logger.info(LOG_MESSAGES["croquis_started"].format(len(self.image_files)))
+        logger.info(format_log(LogKey.croquis_started, len(self.image_files)))
         self.viewer = ImageViewerWindow(
             self.settings,
             self.image_files.copy(),
-            self.lang
+            self.lang,
+            today_count=self.heatmap_widget.today_count
         )
         self.viewer.croquis_completed.connect(self.on_croquis_completed)
         self.viewer.croquis_saved.connect(self.on_croquis_saved)
@@ -4000,23 +4353,23 @@ class MainWindow(QMainWindow):
         
     def open_deck_editor(self):
         """Open deck editor window."""
-        logger.info(LOG_MESSAGES["deck_editor_opened"])
+        logger.info(format_log(LogKey.deck_editor_opened))
         self.deck_editor = DeckEditorWindow(self.lang, self.settings.dark_mode)
         self.deck_editor.show()
         
     def open_history(self):
         """Open croquis history dialog."""
-        logger.info(LOG_MESSAGES["history_opened"])
+        logger.info(format_log(LogKey.history_opened))
         dialog = HistoryWindow(self.lang, self, self.settings.dark_mode)
         dialog.exec()
-        logger.info(LOG_MESSAGES["history_closed"])
+        logger.info(format_log(LogKey.history_closed))
         
     def open_alarm(self):
         """Open alarm settings dialog."""
-        logger.info(LOG_MESSAGES["alarm_settings_opened"])
+        logger.info(format_log(LogKey.alarm_settings_opened))
         dialog = AlarmWindow(self.lang, self)
         dialog.exec()
-        logger.info(LOG_MESSAGES["alarm_settings_closed"])
+        logger.info(format_log(LogKey.alarm_settings_closed))
         
     def open_shortcut_settings(self):
         """Open shortcut key configuration dialog."""
@@ -4061,17 +4414,12 @@ class MainWindow(QMainWindow):
             f.write(encrypted)
             
     def closeEvent(self, event):
-        logger.info(LOG_MESSAGES["program_closed"])
+        logger.info(format_log(LogKey.program_closed))
         self.save_settings()
         super().closeEvent(event)
 
 
 def main():
-    # --check-alarm 인수로 실행된 경우 알람만 확인하고 종료
-    if len(sys.argv) > 1 and sys.argv[1] == "--check-alarm":
-        check_and_trigger_alarms()
-        sys.exit(0)
-    
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     
@@ -3,17 +3,143 @@ Qt 리소스 컴파일 스크립트
 resources.qrc를 resources_rc.py로 컴파일 (PyQt6 호환)
 """
 
-import base64
+import hashlib
+import os
+import py_compile
+import zlib
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
+# 생성 모듈 템플릿 - ${resources}/${aliases} 자리에 _RESOURCES/_ALIASES 항목이 들어감
+_MODULE_TEMPLATE = '''# -*- coding: utf-8 -*-
+
+"""
+Qt Resources Module
+Auto-generated from resources.qrc
+DO NOT EDIT MANUALLY
+"""
+
+import zlib
+from functools import lru_cache
+
+# Qt-style resource path prefix accepted by the lookup helpers
+_PREFIX_SLASH = ":/"
+
+# Resource data
+_RESOURCES = {
+${resources}}
+
+# Resources whose content is identical to another entry
+_ALIASES = {
+${aliases}}
+
+def qInitResources():
+    """Initialize Qt resources"""
+    pass
+
+def qCleanupResources():
+    """Cleanup Qt resources"""
+    pass
+@lru_cache(maxsize=256)
+def _decode(name: str) -> bytes:
+    """Decompress a resource once; keyed by the normalized resource name"""
+    return zlib.decompress(_RESOURCES[name])
+
+def get_resource_data(resource_path: str, _r=_RESOURCES, _a=_ALIASES, _dec=_decode, _EMPTY=b"") -> bytes:
+    """Get resource data by path (e.g., ":/buttons/정지.png")"""
+    # Remove :/ prefix if present and resolve aliases; misses are not cached
+    name = resource_path.removeprefix(_PREFIX_SLASH)
+    name = _a.get(name, name)
+    return _dec(name) if name in _r else _EMPTY
+
+def resource_exists(resource_path: str, _r=_RESOURCES, _a=_ALIASES) -> bool:
+    """Check if resource exists"""
+    name = resource_path.removeprefix(_PREFIX_SLASH)
+    return name in _r or name in _a
+
+# Auto-initialize
+qInitResources()
+'''
+
+# 템플릿은 임포트 시 한 번만 분할해 두고, 생성 시에는 블록 단위로 그대로 기록
+_MODULE_HEADER, _MODULE_FOOTER = _MODULE_TEMPLATE.split('${resources}')
+_MODULE_MIDDLE, _MODULE_FOOTER = _MODULE_FOOTER.split('${aliases}')
+_RESOURCE_ENTRY = '    "%s": %s,\n'
+_ALIAS_ENTRY = '    "%s": "%s",\n'
+
+# 파일 읽기 청크 크기
+_READ_CHUNK_SIZE = 48 * 1024
+
+def _encode_file(path):
+    """파일을 청크 단위로 읽어 zlib 압축한 bytes 리터럴 소스, 원본 크기, 내용 해시를 반환"""
+    compressor = zlib.compressobj(9)
+    content_hash = hashlib.blake2b(digest_size=16)
+    chunks = []
+    file_size = 0
+    with open(path, 'rb') as f:
+        buffer = bytearray(_READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            file_size += read
+            content_hash.update(view[:read])
+            chunks.append(compressor.compress(view[:read]))
+    chunks.append(compressor.flush())
+    return repr(b''.join(chunks)), file_size, content_hash.digest()
+
+# 생성 모듈 첫 줄에 기록되는 입력 지문 접두어
+_FINGERPRINT_PREFIX = '# fingerprint: '
+
+def _compute_fingerprint(qrc_file, entries):
+    """QRC 내용, 템플릿, 각 리소스 파일의 (이름, 크기, 내용 해시)로 입력 지문 계산
+
+    mtime은 넣지 않음 - clone/checkout/캐시 복원 후에도 내용이 같으면 지문이 같아야 함
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(qrc_file.read_bytes())
+    digest.update(_MODULE_TEMPLATE.encode('utf-8'))
+    buffer = bytearray(_READ_CHUNK_SIZE)
+    view = memoryview(buffer)
+    for resource_name, path in entries:
+        digest.update(f"{resource_name}\0{os.stat(path).st_size}\0".encode('utf-8'))
+        with open(path, 'rb') as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                digest.update(view[:read])
+    return digest.hexdigest()
+
+def _is_newer_than_inputs(output_file, input_paths):
+    """출력 파일의 mtime이 모든 입력 파일보다 새로운지 확인 (Make 방식 증분 검사)"""
+    try:
+        output_mtime = os.stat(output_file).st_mtime_ns
+        return output_mtime > max(os.stat(path).st_mtime_ns for path in input_paths)
+    except OSError:
+        return False
+
+def _read_fingerprint(output_file):
+    """기존 생성 모듈의 첫 줄에서 지문을 읽음 (없으면 None)"""
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            first_line = f.readline().rstrip('\n')
+    except OSError:
+        return None
+    if first_line.startswith(_FINGERPRINT_PREFIX):
+        return first_line[len(_FINGERPRINT_PREFIX):]
+    return None
+
 def compile_resources():
     """Qt 리소스 파일을 Python 모듈로 컴파일"""
     # 프로젝트 루트에서 실행
     project_root = Path(__file__).parent.parent
-    qrc_file = project_root / "src" / "assets" / "resources.qrc"
-    output_file = project_root / "src" / "assets" / "resources_rc.py"
+    assets_dir = project_root / "src" / "assets"
+    qrc_file = assets_dir / "resources.qrc"
+    output_file = assets_dir / "resources_rc.py"
     
     print(f"Compiling {qrc_file} -> {output_file}")
     
@@ -22,85 +148,81 @@ def compile_resources():
         sys.exit(1)
     
     try:
-        # QRC 파일 파싱
-        tree = ET.parse(qrc_file)
-        root = tree.getroot()
-        
         resources = {}
+        aliases = {}
+        entries = []
+        prefix = ''
         
-        # 각 qresource 처리
-        for qresource in root.findall('qresource'):
-            prefix = qresource.get('prefix', '')
+        # QRC 파일 스트리밍 파싱 (C accelerator 사용, 전체 트리를 메모리에 두지 않음)
+        for event, elem in ET.iterparse(qrc_file, events=("start", "end")):
+            if event == "start":
+                # qresource 시작 시 prefix 갱신
+                if elem.tag == 'qresource':
+                    prefix = elem.get('prefix', '')
+                continue
+            
+            if elem.tag == 'qresource':
+                prefix = ''
+                elem.clear()
+                continue
             
             # 각 파일 처리
-            for file_elem in qresource.findall('file'):
-                file_path = file_elem.text
-                resource_name = f"{prefix}/{file_path.split('/')[-1]}"
+            if elem.tag == 'file':
+                file_path = elem.text
+                elem.clear()
+                resource_name = f"{prefix}/{os.path.basename(file_path)}"
                 
                 # 실제 파일 경로 (src/assets 기준)
-                actual_path = project_root / "src" / "assets" / file_path
+                actual_path = assets_dir.joinpath(file_path)
                 
-                if not actual_path.exists():
+                if not os.path.isfile(actual_path):
                     print(f"  Warning: File not found: {actual_path}")
                     continue
                 
-                # 파일 읽기 및 base64 인코딩
-                with open(actual_path, 'rb') as f:
-                    file_data = f.read()
-                    encoded = base64.b64encode(file_data).decode('ascii')
-                
+                entries.append((resource_name, actual_path))
+        
+        # 출력이 모든 입력(QRC, 리소스 파일, 이 스크립트)보다 새로우면 stat만으로 재생성 생략
+        if _is_newer_than_inputs(output_file, [qrc_file, Path(__file__)] + [path for _, path in entries]):
+            print("  Up-to-date (mtime), skipping regeneration")
+            return True
+        
+        # 입력이 바뀌지 않았으면 재생성 생략
+        fingerprint = _compute_fingerprint(qrc_file, entries)
+        if _read_fingerprint(output_file) == fingerprint:
+            print("  Up-to-date, skipping regeneration")
+            return True
+        
+        # 파일 읽기 및 압축을 스레드 풀에서 병렬 처리 (map은 순서를 보존)
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_encode_file, [path for _, path in entries])
+            content_by_hash = {}
+            for (resource_name, _), (encoded, file_size, content_hash) in zip(entries, results):
+                # 내용이 같은 리소스는 한 번만 저장하고 별칭으로 연결
+                if content_hash in content_by_hash:
+                    aliases[resource_name] = content_by_hash[content_hash]
+                    print(f"  Aliased: {resource_name} -> {aliases[resource_name]}")
+                    continue
+                content_by_hash[content_hash] = resource_name
                 resources[resource_name] = encoded
-                print(f"  Added: {resource_name} ({len(file_data)} bytes)")
+                print(f"  Added: {resource_name} ({file_size} bytes)")
         
-            # Python 모듈 생성
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('# -*- coding: utf-8 -*-\n\n')
-            f.write('"""\n')
-            f.write('Qt Resources Module\n')
-            f.write('Auto-generated from resources.qrc\n')
-            f.write('DO NOT EDIT MANUALLY\n')
-            f.write('"""\n\n')
-            f.write('import base64\n')
-            f.write('from PyQt6.QtCore import QResource\n\n')
-            f.write('# Resource data\n')
-            f.write('_RESOURCES = {\n')
-            
-            for name, data in resources.items():
-                f.write(f'    "{name}": "{data}",\n')
-            
-            f.write('}\n\n')
-            
-            # 리소스 등록 함수 - Not needed anymore, we access _RESOURCES directly
-            f.write('def qInitResources():\n')
-            f.write('    """Initialize Qt resources"""\n')
-            f.write('    pass\n\n')
-            
-            f.write('def qCleanupResources():\n')
-            f.write('    """Cleanup Qt resources"""\n')
-            f.write('    pass\n')
-            
-            f.write('def get_resource_data(resource_path: str) -> bytes:\n')
-            f.write('    """Get resource data by path (e.g., ":/buttons/정지.png")"""\n')
-            f.write('    # Remove :/ prefix if present\n')
-            f.write('    if resource_path.startswith(":/"): \n')
-            f.write('        resource_path = resource_path[2:]\n')
-            f.write('    \n')
-            f.write('    if resource_path in _RESOURCES:\n')
-            f.write('        return base64.b64decode(_RESOURCES[resource_path])\n')
-            f.write('    return b""\n\n')
-            
-            f.write('def resource_exists(resource_path: str) -> bool:\n')
-            f.write('    """Check if resource exists"""\n')
-            f.write('    if resource_path.startswith(":/"): \n')
-            f.write('        resource_path = resource_path[2:]\n')
-            f.write('    return resource_path in _RESOURCES\n\n')
-            
-            f.write('# Auto-initialize\n')
-            f.write('qInitResources()\n')
+        # Python 모듈 생성 - 템플릿 블록과 항목을 파일 핸들에 직접 스트리밍
+        with open(output_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(_FINGERPRINT_PREFIX + fingerprint + '\n')
+            f.write(_MODULE_HEADER)
+            f.writelines(_RESOURCE_ENTRY % item for item in resources.items())
+            f.write(_MODULE_MIDDLE)
+            f.writelines(_ALIAS_ENTRY % item for item in aliases.items())
+            f.write(_MODULE_FOOTER)
+        
+        # 바이트코드 미리 생성 - 첫 임포트 시 거대한 리터럴 파싱을 생략하고 unmarshal만 수행
+        pyc_file = py_compile.compile(str(output_file), doraise=True)
+        print(f"  Bytecode: {pyc_file}")
         
         print(f"\n✓ Resources compiled successfully!")
         print(f"  Output: {output_file}")
-        print(f"  Total resources: {len(resources)}")
+        print(f"  Total resources: {len(resources) + len(aliases)} ({len(aliases)} aliased)")
         return True
         
     except Exception as e:
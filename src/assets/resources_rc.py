@@ -1,3 +1,4 @@
+# fingerprint: 7faaf81a34a50848eabb89399b05c3bb
 # -*- coding: utf-8 -*-
 
 """
@@ -6,18 +7,25 @@ Auto-generated from resources.qrc
 DO NOT EDIT MANUALLY
 """
 
-import base64
-from PyQt6.QtCore import QResource
+import zlib
+from functools import lru_cache
+
+# Qt-style resource path prefix accepted by the lookup helpers
+_PREFIX_SLASH = ":/"
 
 # Resource data
 _RESOURCES = {
-    "/buttons/정지.png": "iVBORw0KGgoAAAANSUhEUgAAAmoAAAJqCAYAAACb0mx/AAAACXBIWXMAAAsSAAALEgHS3X78AAAAG3RFWHRTb2Z0d2FyZQBDZWxzeXMgU3R1ZGlvIFRvb2zBp+F8AAAeTElEQVR4nO3dcaynV13n8c/MZNhsaCoYBiETs7SsFPln05a0mLV1LaspUVYhy6YgwkIFoQZ3S0tLweBxdaWttQaNRWlagaJ2wYWoGEjYVm3XtW064CYbLZi2bJTUgJFxbLPZIc7sH8+QcMhCz53f+Z3fuff3eiU30/DH9zl/Xd73eZ5znn0nT54MAADz2SfUAADmJNQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdTYJoeTPC/JWUmenuQpSZ526r//aZJ/srmlAV/n/yb5P0m+nORokseTPJHk0SSfS/KFzS0NxhFq7EUHk1yY5KIkL0jynUmen+Spm1wU0NUTSR5K8hdJ/jzJvUnuT/KVTS4KehNq7AX7k7wwyYuTXJwl0EQZbJ8nsgTbPUnuSvJgkhMbXRGsSKixm52T5EdO/Zy94bUA83kkyceTvD/JZza7FDg9Qo3d5lCSy5K8Nsn5G14LsHscSfKBJHcm+dKG1wLNhBq7xaEkVyf5iXisCZy+41mC7WdiQwK7gFBjds9JcmWSN2XZpQnQw/EkH07yc0k+u+G1wDck1JjVoSQ3J3lVls0CAOtwIsltSd4Zj0SZkFBjNvuT/PskNyR5xmaXAmyRo0neleRXY6coExFqzOTcJLckedGmFwJsrSNJrkjywKYXAolQYw4Hk1yf5D/GY05g804kuSnJT8UBumyYUGPTDif5nbiLBsznSJJ/m+TzG14HW0yosUkvTfLBLN/bBJjR0SSvSfL7m14I20mosQn7k/xClmM39m14LQBP5mSW31nXxUYDBhNqjHYwyW8mecWmFwKwQx/J8sk6760xjFBjpDOy/KK7dNMLAThNdyX54SSPb3ohbAehxiiHkvxebBoAdr8jSV4SB+QygFBjhENJ7kty9qYXcsqxJA9l+c7f46d+jm10RcD/z5lZ7sSfkWWH+PNP/W8zeCTLH55ijbUSaqzbGUn+KMn5G7r+sST3Jrk7yYNZAu2LG1oLsLpnZgm2Fya5JMlF2Uy8nUjymST/Kh6DskZCjXU6mOQTSV48+LqPZTn242NZ4uwfB18fGOdAlmh7WZZjNJ49+Pp3ZXkMaoMBayHUWJf9Se7MuN2dx5N8NMntWe6eiTPYPgeSfF+S1yZ5eZKnDLruR5JcFkd3sAZCjXX5xSRvHXCd40luy3LG0aMDrgfsDmcleVuSyzMm2G5Mcu2A67BlhBrr8NIkv5v1HmZ7MsmvJflPSf5mjdcBdrfDSd6Z5E1Z/++kH4ovGNCZUKO3w0n+LMkz1niNTye5Isn9a7wGsLecm+WPuwvWeI2jp67z+TVegy0j1OjpYJJ7sr6z0o4nuTrJLfEOGrBzB7L8kXdT1vc49L4kF8fmAjoRavS0zvfSPpvklVm2wwOs4twsGwCeu6b53lejG6FGLxck+dMsuz17uzPJj8ehtEA/Zyb59Sy7NXs7keS7kjywhtlsGaFGD/uT/EnW88jzl5JcleVFXYCe9iX56VM/vR3J8gesIztYiVCjh7ck+eXOM08muS7JDZ3nAny9tyR5T/rvCv3JJL/SeSZbRqixqkNJPpfkaR1nnsxy9tFvdJwJ8M28LsuZjD1j7WiS58X3QFmBUGNVdyR5deeZVyW5ufNMgCfz1iybonq6NckbO89kiwg1VvGcJA+n7waC67M88gTYhOvTd8fmiSQvyLJzHXZMqLGK9yV5Q8d5dyZ5VWwcADZnX5LfSt/doO6qcdqEGqfrcJJH0u/QyIeTnBdHcACbd2aWozXO6TTveJKzk3yh0zy2iFDjdL0ny46mHo5nOdrDYbbALM7N8pWBXn+M3pzl/VvYEaHG6TiU5NEkT+00zxZ2YEY9Nxc8keSs2AHKDgk1TsdVWb6V18OnsxwK6dudwGwOJPkf6fchd3+UsmNCjdPxYJLzO8w5meUzK/d3mAWwDhdm+Txej/PVjiR5YYc5bBGhxk6dk+ShTrPem+SKTrMA1uXWJD/Wadbz46gOdkCosVM3JLmmwxy7oIDd4llJ/nf6bCz42STv6jCHLSHU2In9Sf4yS2Ctyt00YDe5JcmbO8x5JMl3xMfaaSTU2IkL0ud9suNZbv8/2mEWwAhnZXnto8ddtfPiOCIaCTV24rokP99hzp1JXtlhDsBIv50+Xyy4Ov2/KcoeJdTYiU8kubTDnO9P8qkOcwBGujTL78FVfTLJSzrMYQsINVodTPLlrH7I7WNJvj3OTQN2nwNJ/irJs1ec80SSpyf5ysorYs8TarT67iT3dphzfZZHqAC70c1Jruww56Ik/73DHPY4oUarXu+nvSgOuAV2rwuzfAN0Ve9I8u4Oc9jjhBqt7kjy6hVnHEvyrfHYE9i9DiT5uyRnrjjnQ0l+dPXlsNcJNVr1+GzUHyT5wQ5rAdikjyf5gRVn+JwUTYQaLfYl+YesvpHgqizvdwDsZm/N6sdrHM2yoQC+KaFGi8NJ/rrDnO9Jck+HOQCbdHGSP+4w55lJvtRhDnuYUKPF9ya5u8Ocb0vyxQ5zADbpWVmOGlrVJUn+sMMc9jChRovXJ7ltxRnHknxLh7UAzODvs/qGgsuT3N5hLexhQo0WVyW5acUZD2TZ1g6wFxzJ8s3OVTiigycl1GjR4wy1jyV5eYe1AMzgo0letuKMG5Nc22Et7GFCjRY3JLlmxRl3JHlNh7UAzOCDWf0ctFuTvLHDWtjDhBot3pfkDSvOeG+SKzqsBWAGtyR584ozHHrLkxJqtOjxVQLf+AT2kuuz+mNLocaTEmq0+HCSV6w442eSlNWXAjCFkuSnV5zxkST/bvWlsJcJNVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi2EGkCtRKgxgFCjhVADqJUINQYQarQQagC1EqHGAEKNFkINoFYi1BhAqNFCqAHUSoQaAwg1Wgg1gFqJUGMAoUYLoQZQKxFqDCDUaCHUAGolQo0BhBothBpArUSoMYBQo4VQA6iVCDUGEGq0EGoAtRKhxgBCjRZCDaBWItQYQKjRQqgB1EqEGgMINVoINYBaiVBjAKFGC6EGUCsRagwg1Ggh1ABqJUKNAYQaLYQaQK1EqDGAUKOFUAOolQg1BhBqtBBqALUSocYAQo0WQg2gViLUGECo0UKoAdRKhBoDCDVaCDWAWolQYwChRguhBlArEWoMINRoIdQAaiVCjQGEGi3uSPLqFWdcn+S6DmsBmMH1Sa5dccaHkvxoh7Wwhwk1WrwvyRtWnPHeJFd0WAvADG5J8uYVZwg1npRQo8UNSa5ZccYdSV7TYS0AM/hgVo+sW5O8scNa2MOEGi2uS/LzK874WJKXd1gLwAw+nuQHVpxxY1Z/fMoeJ9RocVWSm1ac8UCSCzusBWAGR5Kct+KMq5P8Yoe1sIcJNVq8PsltK844luRbOqwFYAZ/n+TMFWdcnuT2DmthDxNqtPjeJHd3mPNtSb7YYQ7AJj0ryWMd5lyS5A87zGEPE2q0OJzkrzvM+Z4k93SYA7BJFyf54w5znpnkSx3msIcJNVrsS/IPSZ664pyrkty8+nIANuraLOeoreJokqd3WAt7nFCj1YNJzl9xxh8k+cEOawHYpB47Pu9L8l0d1sIeJ9Ro1ePrBMeSfGuSf1x9OQAbcSDJ32X1jQQOu6WJUKNVj7PUkuRFSe7vMAdgE3q9n/aOJO/uMIc9TqjR6ruT3Nthzg1J3t5hDsAm3Jzkyg5zLsxyviR8U0KNVgeTfDmrbyh4LMm3x+NPYPc5kOSvkjx7xTlPZNlI8JWVV8SeJ9TYiU8kubTDnO9P8qkOcwBGujTL78FVfTLJSzrMYQsINXai13tqdyZ5ZYc5ACP9dpLLOszx6SiaCTV24oL02QhwPMnzkzzaYRbACGcleSjJUzrMOi/JZzrMYQsINXZif5K/THJ2h1nvTXJFhzkAI9ya5Mc6zHkkyXckOdFhFltAqLFTNyS5psOc41mC7wsdZgGs0+EsgdXjbtrPJnlXhzlsCaHGTp2T5fZ/D+6qAbtBr7tpyfLax2c7zWILCDVOR4/PSSXJySyfUHEALjCrC5P8aZZvHq/KZ6PYMaHG6XhLkl/uNOvTWTYpOFcNmM2BLIfSntdp3k8m+ZVOs9gSQo3TcSjLjs1VD7/9Kr+8gBm9Nf2O0Xgiy87RL3Wax5YQapyu92QJrB6OZ/kGqO3qwCwuTHJP+mwgSJZPT13VaRZbRKhxunrugkqSh7M8XjjWaR7A6Tozy2sZz+00zy53TptQYxXvS/KGjvPuTPKqLJsMADZhX5L/muRlHWfemuSNHeexRYQaq3hOljth+zvOvCHJ2zvOA9iJm5Nc2XHe8SzHGn2+40y2iFBjVb3vqiXLexw3d54J8GSuTXJ955nuprESocaqDiX5XJKndZx5MsnlSX6j40yAb+Z1SW5Ln/PSvupvk7wgdnqyAqFGDz3PVfuqk0muy/IoFGCd3pJlJ3vPSEuWPzhv7zyTLSPU6GF/kj/JcsRGb7+U5G1xIC7Q374k787yyLO3I1kO8/bxdVYi1OjlgiyfWem5seCr7kzy43F0B9DPmUnen767O7/qRJIXxtmQdCDU6OmGJNesafbDSV4Rv/iA1V2Y5DfT75y0r3dj1nOXji0k1OjpYJaTvNfxCDRZtrlfl+VdEo9CgZ06kOQ/ZHnc2euw7q93X5KLk3xlTfPZMkKN3g4n+bMkz1jjNT6d5Iok96/xGsDecm6SX8vymsa6HD11nc+v8RpsGaHGOrw0ye+m/w6qr3Uyy1b6Ep9lAb6xw1l+T1ye9f9O+qEkv7/Ga7CFhBrrss731b7W8SzB9gtJHh1wPWB3OCvJO5K8Jut7zPm1vJfGWgg11mV/kg8kefWg6x1P8tFT1/xUvMMG2+hAku9L8tokL8+YQEuSD2UJQv+HSndCjXU6mOQTSV48+LqPZTnS478keTCiDfayA0n+ZZIfTnJZkmcPvv4nk/yb2DzAmgg11u2MJH+U5PwNXf9YknuT3J0l2j6X5G82tBZgdc9K8rws55RdkuSiLGeibcJ9We7gPb6h67MFhBojHMryC+3sTS/klGNJHsqyCeHxUz/HTv24+wabdyBLfJ2Z5Y+9M5L8syT/PJuLsq91IsvOzhfFdzxZM6HGKIeS/F7Wd8YawChHkrwkIo0BhBojnZHkI0ku3fRCAE7TXVneh/O4kyGEGqMdTHJ7xu0GBejlQ0leHxsHGEiosQn7s3zC5W1Z7wGUAD2czHJW49vjCA4GE2ps0kuz3F1b5+emAFbxt1nuovniABsh1Ni0w0l+JzYZAPO5L8kr49udbJBQYwYHk/xckquzPBYF2KQTSW5K8lPxPhobJtSYyblJbom7a8DmHElyRZIHNr0QSIQa89mX5HVZPuru3TVglKNJ3pXkV7PcUYMpCDVmdSjJf05yeTwOBdbneJIPJHlnHGDLhIQas3tOkiuTvCnJUza7FGAPOZ7kw1nej/3shtcC35BQY7c4lGWzwU8keeqG1wLsXk8kuS3JjVm+9wtTE2rsNoeSXJbktUnO3/BagN3jviS/leTOeMTJLiLU2M3OSfIjp37O3vBagPk8kuTjSd6f5DObXQqcHqHGXrA/yb9IckmSf53kong8CtvoiST3JvlvSe5O8j9jBye7nFBjLzqY5MIswfaCJN+Z5LlJnrbJRQFdHU3ycJK/SPLnSe7KctfMAbXsKUKNbXI4yfOSnJXk6UmeeerfRMTBjI6e+vfLSb546t9Hk/yveM+MLSHUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACYl1AAAJiXUAAAmJdQAACb1/wCnmQfwNwPOQAAAAABJRU5ErkJggg==",
-    "/buttons/재생.png": "iVBORw0KGgoAAAANSUhEUgAAAmoAAAJqCAYAAACb0mx/AAAACXBIWXMAAAsSAAALEgHS3X78AAAAG3RFWHRTb2Z0d2FyZQBDZWxzeXMgU3R1ZGlvIFRvb2zBp+F8AAAgAElEQVR4nO3df6z29X3f9ye6jezSAh4DCUVECM2sFkVj2Lh0mDWou7Mljtpmjh01jVN7qHXrJcyN7YCNIfwoGOzYwbEdt3PidE3cpYvRUtlLbc0MidX30tCGhG1BQcFFK43LBurulA4HlYj98T0Xt39g+J77XOd8P+e6Hg8JWVWr73m3deynrh+v65TnnnsuAADGc4pQAwAYk1ADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUAMAGJRQAwAYlFADABiUUOMwO1KdU51V/XvVGTv/61dUf1gdr/7tzr/+m+r3q68tcikAnAShxmHx8upPVZdVr63+4+ri6rRdPOPZ6ivV//51//xW9dhaLwWANRFqjOyV1V+o3lR9b/Wyffo7D1Wf3/nn2D79DQDYNaHGaF5Z/WD1X1ZH2784+3a+Ut1d/Xz1yAH/bQD4BkKNUbyquqb6q+3u7cz98lz1P1U3Vw8sewoA20qosbSLmmLoTdUpy57ybX2xurO6b+lDANguQo2lnFPdVl3dwb+9ebI+X72zenTpQwDYDkKNJfyV6iPV2UsfchKerm6tPlz90cK3ALDhhBoH6dzq71bfs/Qha3CsenvTN0YBYF8INQ7Kd1X/ffUdSx+yRs81fUP0urwdCsA+EGochL9Z/VSH57Nou/V09XeavnDwxMK3ALBBhBr76Uj109V/s/QhB+R4U6x9LD9VBcAaCDX2y5Hql6s3L33IAr5a3VJ9Ol84AGAPhBr74Uj131VvWfiOpT1c3dj0OTb/gwbArgk11u2U6hcTaV/v/up91b1LHwLA4SLUWLebq5uWPmJQX6zeWz249CEAHA5CjXV6c/U/NO5PQY1gNelxfX70HYCXINRYl4uqf9pyP6j+VPVk0zcv/6D649Urq9ObfgFhtGmQZ6tPNv2MlkkPAF6QUGMdXl79RnXJAf29P2x6G/GfVL/Z9Fbii8XOaU0heWn1H1XfV12wzzfO9XTTxtxHmmITAJ4n1FiHj1Tv2ue/8Wz1q9Vnq19rCpyTdUr12uoHq/+qMX5z9Mmmz/f9fPXMsqcAMAqhxl69punVtP16a/Gp6meaRmT34y3CM6q/Wv1E02+RLu0rTT/6/vezwQaw9YQae3Gk+t+qP71Pz/9UdUMH8xmu05omNN7bGJ9ne7Dpni8sfQgAyxFq7MXbq/92H577aNNbkvftw7NfymXV360uXuBvv5B7mn70/YGlDwHg4Ak1TtbLq9+rvnPNz/1H1Y9U/3rNz92NU5teWfuJpm+NLs2kB8CWEmqcrL9Z3bXmZ36q+rHq3635uSfrnOonq7/RGG+HPlv9QtOg8OML3wLAARBqnIwj1b+ovmONz/xUUxCN+G/I85p+s/Pqxgi2p6uPV3c27cYBsKGEGifjzdWvrPF5/6D6y40ZaV/vkuoD1RuWPmTHk02x9olMegBsJKHGyfhy9fo1Peu3qivb2y7aQfuuppHa1y19yI7Hmr4da9IDYMMINXbroup31vSsp5qmPX53Tc87aEebPqc3yjdEH2oazb278V+dBGAGocZu3dz0YfZ1+LHqZ9f0rKWcWr2taaR2hMHcqmNNkx7Hlj4EgL0RauzW71Z/cg3P+afVf9LmvFV3WnVN00jtmQvfsvL5ppmRh5Y+BICTI9TYjVc1baetw1UtM2i7386qrq3eWb1i4VvqxAbbdU1DwgAcIkKN3VjXLxF8ufpP1/CckZ1X3Vb9cONMevyd6m9l0gPg0BBq7MavNE1z7NWbm17l2QYXVbdX37/0ITuON016fKz62sK3APAShBq78S/a+09GPd70atOmfDZtriuqDzZNkYzgq9Ut1afbvv+/ADg0hBpznVP9P2t4zieaPnS/rd7QFGyjTHo83PSrCyY9AAYk1Jjrz1X/yxqe831NP7y+zY5Ub2wKtgsWvmXl/qZvrN679CEAnCDUmOtHm14N24tnm6YrDtOvEOynUzsx6XH2wresfLFp0uPBpQ8BQKgx351NEw978VvVa9Zwy6Y5o3pH9f7q9IVvqROTHtdXjyx8C8BWE2rM9UvVW/b4jL/XtOLPCzuv6fNiVzfGpMez1SebZkaeWPgWgK0k1JjrS02/bbkXtzWFCC/uwqZJj3VMoazD000/Qv+Rpt9nBeCACDXm+nL1+j0+4+3Vz63hlm1xWXVHew/kdXmy6bdef756ZtlTALaDUGOu364u2eMzfqT6zBpu2TZHqw9Vly59yI7Hml4dtcEGsM+EGnP9TtPK/l5s0y8SrNspTT9HdWvjTHo82PSN1S8sfQjAphJqzCXUxnBq0xcybq3OXfaU5x1r+kbwsaUPAdg0Qo25hNpYTuvEBtuZC9+yck/1zuqhpQ8B2BRCjbmE2pjOqq5tCqRXLHxLTZMev1Dd1PS7rgDsgVBjLqE2tvObBmpH2WB7uvp401Dy8YVvATi0hBpzCbXD4aKmCY1RNtiON8Xax6qvLXwLwKEj1JhLqB0uVzT96PuVSx+yw6QHwEkQaswl1A6no9Vd1cVLH7LjoaZX/O5u+k1RAF6EUGMuoXZ4Hane2PQK2ygbbPc3fQnivqUPARiZUGMuoXb4jTrp8Z6m8VwAvolQYy6htjlGm/R4runfF9dVjy58C8BQhBpzCbXNc151Y+NMeqw22G6onlj4FoAhCDXmEmqb69VNP0k1yqTHaoPt9uqphW8BWJRQYy6htvkub9o8u2rhO1aebIq1j2fSA9hSQo25hNr2OFp9qLp06UN2PNz0Fq1JD2DrCDXmEmrbZdRJj/dV9y59CMBBEWrMJdS206nV25o+w3busqc8756mb4g+sPQhAPtNqDGXUNtuZ1TvqN5fnb7wLXVi0uP66pGFbwHYN0KNuYQaVedU726cDbbVpMdN1eML3wKwdkKNuYQaX+/8plez3r70ITtMegAbSagxl1DjhVxW3dH0TdERPFl9uPpo9czCtwDsmVBjLqHGixlt0uOx6rbq09lgAw4xocZcQo2Xckr1pqa3Hy9c+JaVh6qbq88ufAfASRFqzCXUmGvESY9jTZMex5Y+BGA3hBpzCTV267TqmqaR2jMXvmXlnqZvrD609CEAcwg15hJqnKyzqmsz6QGwa0KNuYQae7Wa9Li6etnCt9SJSY87q+ML3wLwgoQacwk11uWipg/4v3nhO1aON8Xax6qvLXwLwDcQaswl1Fi3K5p+9P3KpQ/ZYdIDGI5QYy6hxn45Wt1VXbz0ITtWkx53N/2mKMBihBpzCTX205HqjU2vsF2w8C0r9zd9CeK+pQ8BtpdQYy6hxkEYddLjPdWDSx8CbB+hxlxCjYM02qTHc03/3r2uenThW4AtItSYS6ixhPOqGxtn0mO1wXZD9cTCtwBbQKgxl1BjSa9u+kmqUSY9Vhtst1dPLXwLsMGEGnMJNUZwedPm2VUL37HyZFOsfTyTHsA+EGrMJdQYydHqQ9WlSx+y4+Gmt2hNegBrJdSYS6gxmlEnPd5X3bv0IcBmEGrMJdQY1anV25o+w3busqc8756mb4g+sPQhwOEm1JhLqDG6M6p3VO+vTl/4ljox6XF99cjCtwCHlFBjLqHGYXFO9e7G2WBbTXrcVD2+8C3AISPUmEuocdicX91SvXXpQ3aY9AB2Tagxl1DjsLqsuqPpm6IjeLL6cPXR6pmFbwEGJ9SYS6hx2I026fFYdVv16WywAd+GUGMuocYmOKV6U9PbjxcufMvKQ9XN1WcXvgMYkFBjLqHGJhlx0uNY06THsaUPAcYh1JhLqLGJTquuaRqpPXPhW1Y+X70rkx5AQo35hBqb7Kzq2kx6AIMRaswl1NgG5zcN1F5dvWzhW+rEpMed1fGFbwEWINSYS6ixTS5q+oD/mxe+Y+V4U6yZ9IAtI9SYS6ixja5o+tH3K5c+ZIdJD9gyQo25hBrb7Gh1V3Xx0ofsMOkBW0KoMZdQY9sdqd7Y9ArbBQvfsnJ/05cg7lv6EGB/CDXmEmowGXHS457qPdWDSx8CrJdQYy6hBt9otEmP55r+5+u66tGFbwHWRKgxl1CDF3ZedWPjTHqsNthuqJ5Y+BZgj4Qacwk1eHGvbvpJqlEmPVYbbLdXTy18C3CShBpzCTWY5/KmzbOrFr5j5cmmWPt4Jj3g0BFqzCXUYHeOVh+qLl36kB0PN71Fe3fT59mAQ0CoMZdQg90bddLjfdW9Sx8CvDShxlxCDU7eqdXbqg9UZy97yvPuafqG6ANLHwJ8e0KNuYQa7N0Z1Tuq91enL3xLnZj0uL56ZOFbgBcg1JhLqMH6nFO9u3E22FaTHjdVjy98C/B1hBpzCTVYv/OrW6q3Ln3IDpMeMBihxlxCDfbPZdUdTd8UHcGT1Yerj1bPLHwLbDWhxlxCDfbfaJMej1W3VZ/OBhssQqgxl1CDg3FK9aamtx8vXPiWlYeqm6vPLnwHbB2hxlxCDQ7WatLj1urcZU953rGmSY9jSx8C20KoMZdQg2WcVl3TNFJ75sK3rHy+elcmPWDfCTXmEmqwrLOqazPpAVtFqDGXUIMxnN80UHt19bKFb6kTkx53VscXvgU2jlBjLqEGY7mo6QP+b174jpXjTbFm0gPWSKgxl1CDMV3R9KPvVy59yA6THrBGQo25hBqM7Wh1V3Xx0ofsMOkBayDUmEuowfiOVD9U/VTjTHrc3/QliPuWPgQOI6HGXEINDo8RJz3uqd5TPbj0IXCYCDXmEmpw+Iw26fFc038GXFc9uvAtcCgINeYSanB4nVfd2DiTHqsNthuqJxa+BYYm1JhLqMHh9+qmn6QaZdJjtcF2e/XUwrfAkIQacwk12ByXN22eXbXwHStfrW7JpAd8C6HGXEINNs/R6kPVpUsfsuPhprdo7276PBtsPaHGXEINNtOR6o1No7kXLHzLyv1N31i9d+lDYGlCjbmEGmy2U6u3VR+ozl72lOfd0/QN0QeWPgSWItSYS6jBdjijekf1/ur0hW+pE5Me11ePLHwLHDihxlxCDbbLOdW7d/4ZadLjpurxhW+BAyPUmEuowXY6v+kbmW9d+pAdJj3YKkKNuYQabLfLqjuavik6gierD1cfrZ5Z+BbYN0KNuYQaUONNejxW3ZYNNjaUUGMuoQasnFK9qentxwsXvmXloerm6rML3wFrJdSYS6gB32w16XFrde6ypzzvWNOkx7GlD4F1EGrMJdSAb+e06pqmkdozF75l5fPVuzLpwSEn1JhLqAEv5azq2uqd1SsWvqVMerABhBpzCTVgrvObBmqvbowNttWkx53V8YVvgV0Raswl1IDduqjpA/5vXviOleNNsWbSg0NDqDGXUANO1hVNP/p+5dKH7DDpwaEh1JhLqAF7dbS6q7p46UN2mPRgeEKNuYQasA5Hqh+qfqpxJj3ub/oSxH1LHwLfTKgxl1AD1mnESY97qvdUDy59CKwINeYSasB+GG3S47mm/5y6rnp04VtAqDGbUAP203nVjY0z6bHaYLuhemLhW9hiQo25hBpwEF7d9JNUo0x6rDbYbq+eWvgWtpBQYy6hBhyky5s2z65a+I6Vr1a3ZNKDAybUmEuoAUs4Wn2ounTpQ3Y83PQW7d1Nn2eDfSXUmEuoAUtZTXrcWl2w8C0r9zf96PuxpQ9hswk15hJqwNJOq/5G06TH2QvfUtMXDt5bfWTpQ9hcQo25hBowijOqn2jaPBth0uODTcEGayfUmEuoAaM5p3r3zj9LT3r8dFM4+i9V1kqoMZdQA0Z1YdN8xtKTHj/dFI2wNkKNuYQaMLrLqjuavim6FLHGWgk15hJqwGGx9KSHWGNthBpzCTXgMFl60uPG6rYF/i4bRqgxl1ADDqNTq7c1Bdu5B/h3n6u+r/rCAf5NNpBQYy6hBhxmp1XXNG2wnXlAf/N49frqoQP6e2wgocZcQg3YBOdUP9k0nHsQkx4PNX3J4WsH8LfYQEKNuYQasEnOr66vrm7/g80gLidNqDGXUAM20UXVze3vBtuz1eXVA/v4N9hQQo25hBqwya5oeuXryn16/v07f+OP9un5bCihxlxCDdh0p1Q/UH2g6dcO1u2t1S/uw3PZYEKNuYQasC1Orf5h9YY1P/cr1Z/Mq2rsglBjLqEGbJNTq1+pvn/Nz/WqGrsi1JhLqAHb5kj1meovrfGZXlVjV4Qacwk1YBvtxytrf7H63BqfxwYTaswl1IBtdVr1G9XFa3reZ6sfXNOz2HBCjbmEGrDNLqx+szp9Dc96tvqO6ok1PIsNJ9SYS6gB2+5Hq0+s6Vk/Vv3smp7FBhNqzCXUgG13pPr16nVreNY91Xev4TlsOKHGXEINYNpW+7U1POfp6qzqmTU8iw0m1JhLqAFM7m89r6pdVd23huewwYQacwk1gMlfqz61hufc0vSD8PBtCTXmEmoAkzOqf9nevwH6xep7934Om0yoMZdQAzjhV9v7CO5Xqlet4RY2mFBjLqEGcMI6pjqerf5EvlDAixBqzCXUAE64pPrtNTznT1UPreE5bCihxlxCDeCE06r/bw3PeUP1hTU8hw0l1JhLqAF8o39eXbDHZ/xg029/wgsSaswl1AC+0T+urtzjM/5665n6YEMJNeYSagDf6EvV0T0+48erj67hFjaUUGMuoQbwjdYx0XFjddsabmFDCTXmEmoA38grauw7ocZcQg3gG/mMGvtOqDGXUAP4Rr71yb4Taswl1ABOsKPGgRBqzCXUAE7wywQcCKHGXEIN4IR3VR/Z4zP81icvSagxl1ADOOHXmt623IuvVK9awy1sMKHGXEINYHJW9fvVK/b4nC9W37v3c9hkQo25hBrA5EerT6zhOcZueUlCjbmEGkAdafoSwcVreNaV1bE1PIcNJtSYS6gB1FuqX1rDc55uegvVFwl4UUKNuYQasO1Oq/7P9j5yWz6fxkxCjbmEGrDt7qyuW9Oz/HQUswg15hJqwDa7vPpy9bI1POvp6tzqqTU8iw0n1JhLqAHb6qzqn7WetzyrPlP9yJqexYYTaswl1IBtdGr1P1dXrfGZ/1l17xqfxwYTaswl1IBtc6T65ab/7FqXB6tLK//lyyxCjbmEGrBNjlSfrt665uf+xepza34mG0yoMZdQA7bFfkWaV9PYNaHGXEIN2AZHqw9Ur9uHZ3s1jV0Taswl1IBNdlF1c+v9PNrXM3DLSRFqzCXUgE10fnV99fZ9/BtPN/026KP7+DfYUEKNuYQasEnOqd5dvbN6xT7/rR+vPrrPf4MNJdSYS6gBm+Cs6toOJtCq7qm+p/qjA/hbbCChxlxCDTjMTq3e1vRFgbMP6G9+tXpt9fgB/T02kFBjLqEGHEarQLu16fc1D8qzTb9mcOwA/yYbSKgxl1ADDpNTqjdVt1cXLvD3f6z62QX+LhtGqDGXUAMOi/3cQpvjlqapD9gzocZcQg0Y3WXVHU2htpS/Xf3XC/59NoxQYy6hBozq1U2fQduvsdq5PtP0eTjf8GRthBpzCTVgNOdVN1ZXVy9b+BaRxr4Qaswl1IBRnFW9t7qmg9lCeymfanq7U6SxdkKNuYQasLTTmuLsfdWZC99S9Vz1oaZ7/Jcp+0KoMZdQA5ZyatNvcd7QwW6hvZiHm34a6gtLH8JmE2rMJdSAg7b0FtoL+WrT/Man81YnB0CoMZdQAw7S0aa3FS9d+pAdx6s7q49VX1v4FraIUGMuoQYchMubguiqhe9Yebr6eNNNxxe+hS0k1JhLqAH7aZQttJVnq1+obsqPqrMgocZcQg3YDyNtodX07c27q+urRxa+BYQaswk1YJ3Oqq6t3tkYW2hV91TXVQ8sfQisCDXmEmrAOoy2hVZ1f9M99y59CHwzocZcQg3Yi1ObfmLp1sbaQrux6T+X/JchQxJqzCXUgJMx4hbaY9Vt2ULjEBBqzCXUgN2yhQZ7JNSYS6gBc9lCgzURaswl1ICXclF1c7bQYG2EGnMJNeDbsYUG+0SoMZdQA76ZLTTYZ0KNuYQasGILDQ6IUGMuoQaMuIX2UNPn4myhsZGEGnMJNdheR6o3Vh+sLlj4lhVbaGwFocZcQg2202hbaE9WH64+Wj2z8C2w74Qacwk12C620GAAQo25hBpsB1toMBChxlxCDTbb+U27Y7bQYCBCjbmEGmymc6p3N94W2nuqB5c+BJYm1JhLqMFmOaN6R/X+6vSFb1m5v2lA976lD4FRCDXmEmqwGUbeQvvswnfAcIQacwk1ONxsocEhJNSYS6jB4WULDQ4pocZcQg0OnyuaXkG7culDdqy20G6vnlr4FjgUhBpzCTU4PGyhwYYQaswl1GB8o26hXVc9uvAtcCgJNeYSajAuW2iwoYQacwk1GM+IW2jHmu6xhQZrINSYS6jBOFZbaB+ozl72lOfZQoN9INSYS6jB8myhwZYRaswl1GBZR6u7qouXPmSHLTQ4AEKNuYQaLMMWGmwxocZcQg0Oli00QKgxm1CDg7HaQnv70ofssIUGCxJqzCXUYH/ZQgO+hVBjLqEG+2PULbTrdv4VWJBQYy6hButlCw14SUKNuYQarIctNGA2ocZcQg32zhYasCtCjbmEGpw8W2jASRFqzCXUYPcuafqSwGhbaDdUTyx8CzCDUGMuoQbzXdj0atUogWYLDQ4pocZcQg1e2nnVjdXV1csWvmXFFhocYkKNuYQafHtnVdc21litLTTYAEKNuYQafKvTqmuq91VnLnzLyoNNb7vaQoMNINSYS6jBCaux2lurc5c95XkPN73tenfTZ9KADSDUmEuoQZ1SvanpFasLF75l5avVLRmrhY0k1JhLqLHtjlYfqi5d+pAdx6s7q49VX1v4FmCfCDXmEmpsq8uqO5pCbQSrsdo7m2IN2GBCjbmEGtvm1U2fQRtlC201VntT9fjCtwAHRKgxl1BjW4y2hbYaq72+emThW4ADJtSYS6ix6UbcQrunaQvtgaUPAZYh1JhLqLGpRtxCu7/pnnuXPgRYllBjLqHGprGFBgxPqDGXUGNTjLiF9lh1W7bQgG8i1JhLqLEJbKEBh4pQYy6hxmF2eVMQXbXwHSu20IBZhBpzCTUOI1towKEm1JhLqHGY2EIDNoJQYy6hxmFgCw3YKEKNuYQaI7OFBmwkocZcQo0R2UIDNppQYy6hxkiOVG+sPlhdsPAtK7bQgLUTaswl1BjFaFtoT1Yfrj5aPbPwLcCGEWrMJdRYmi00YOsINeYSaizlourmbKEBW0ioMZdQ46DZQgO2nlBjLqHGQbGFBrBDqDGXUGO/jbqFdm1139KHANtJqDGXUGO/jLiF9lDT5+JsoQGLEmrMJdRYN1toAC9BqDGXUGOdbKEBzCDUmEuosQ5XVLdnCw1gFqHGXEKNvbCFBnAShBpzCTVOxvlNu2O20ABOglBjLqHGbpxTvbvxttDeUz249CEAcwk15hJqzHFG9Y7q/dXpC9+ycqzpHltowKEj1JhLqPFiRt5C++zCdwCcNKHGXEKNF2ILDWAfCTXmEmp8s6PVXdXFSx+ywxYasHGEGnMJNVauaHoF7cqlD9mx2kK7vXpq4VsA1kqoMZdQwxYawAETaswl1LbXqFto11WPLnwLwL4Saswl1LaPLTSAhQk15hJq22PULbTrdv4VYGsINeYSaptvtYX2gersZU95ni00YKsJNeYSapvLFhrAoIQacwm1zWQLDWBgQo25hNpmsYUGcAgINeYSapth1C20G6onFr4FYDhCjbmE2uG22kJ7+9KH7LCFBjCDUGMuoXY4rbbQ3t0YY7VlCw1gNqHGXELtcDmr+vGmsVpbaACHlFBjLqF2OJxWXVO9rzpz4VtWbKEBnCShxlxCbWyrsdpbq3OXPeV5ttAA9kioMZdQG9Mp1ZuaZi0uXPiWFVtoAGsi1JhLqI3naPWh6tKlD9lxvPqZ6iPZQgNYC6HGXEJtHJdVdzSF2ghWY7V3NsUaAGsi1JhLqC3v1U2fQRttrPam6vGFbwHYSEKNuX67umSPz/iR6jNruGXbnFfdWF3dGFtoq7Ha66tHFr4FYKMJNeb6cvX6PT7j7dXPreGWbXFW9d6muY1XLHzLyj1NW2gPLH0IwDYQasz1pfb+maifrP7WGm7ZdKd14tcERtlCu79pm+3epQ8B2CZCjbl+qXrLHp/x95q2vnhhpza96nhD42yhPdz0tuvdTW95AnCAhBpz3dn0ltde/Fb1mjXcsmlG3EL7anVLxmoBFiXUmP3vg8MAAAc0SURBVOtHq0/s8Rl/WP37TXMOTN7QtN4/0hbabdUnq68tfAvA1hNqzPW91T9aw3O+u+kD6dvu8qZXKa9a+I4VW2gAAxJqzHVu9a/W8Jy7qnet4TmH1UVNb3F+/9KH7Hi26Zu4t2YLDWA4Qo3d+P3qO/b4jMebdsG27XNPttAA2DWhxm58rvrza3jO97Wet1EPg3OaZi3e0ThbaF+s3p8tNIDhCTV2Yx1fKKjpM2rfvYbnjOyM6p3VT1SnL3zLyv3VtdV9Sx8CwDxCjd14VfV7a3rWVW1mMJzatBV3a7bQANgjocZuPVL9B2t4zperP9vmhMOR6oeaAu2ChW9ZeaxpPPfvt32fCQTYCEKN3bq5umlNz9qU3/58Q/XB6uKlD9nxZNPMxieqZxa+BYA9EGrs1kXV76zpWX9QXVL9X2t63kGzhQbAvhJqnIzfqP70mp715erPVf9uTc87CCNuoX2yuiNbaAAbRahxMv5K0w+sr8th+bH285t+//KtSx+y47mmz5/9ZPXowrcAsA+EGifj5dU/b+/jt19v5F8sOKtp1uKdjbOFdk91XbbQADaaUONkXdf0Wah1uqtpd2yUbyiOuIV2rOn/7Y8tfQgA+0+ocbL+WNNUxzpfVav6h01vLf6bNT93N05t+kbqzdXZC97x9R5q+oWDzy19CAAHR6ixF+v6pYJv9nvVX67+2T48+6V8V9P/nUaZ2rCFBrDFhBp7caT6zaaJjXV7tmlq4uYO5tW1C5vGav/SAfytOZ5s+mbp384WGsDWEmrs1eurf1ydsk/Pf7L6cNMw7r/eh+dfUv149cPVy/bh+bv1dPVT1Ueqpxa+BYCFCTXW4ZPVO/b5bzxV/Y/Vr1Rfam+7a2dVP9A0M3Ll3k9bi9UW2m3VEwvfAsAghBrr8MeaPk920QH9vaeaRnf/1+rXq9+t/uWL/J8/p3pd9drqP6/+TGO8ela20AB4EUKNdbmkKdaWCqA/rP5V008n/UH1x5sC8vzGmdb4Zp+v3tv0jU4A+BZCjXVa9y8WbKr7mwZ071v6EADGJtRYtzubBln5Vg82baF9YelDADgchBrrdqT65erNSx8ykK80TX/YQgNgV4Qa++FI9avVn1/6kIWtpkU+mi00AE6CUGO/vLz6bNsZa8ebdtB+JltoAOyBUGM/HWnaBnv70occkGerjzV9Ts8WGgB7JtQ4CDc0fUZrv369YGnPVv+gur7ptzkBYC2EGgfle6tfrM5e+pA1s4UGwL4Rahyk72z6Rujrlz5kDY41zZAcW/oQADaXUOOgnVL9teqD1SsXvuVkHG8KtJ9r+vknANg3Qo2lfGf1geqHOxyfXXu6+njTFwWOL3wLAFtCqLG011S3V9+z9CHfxtPVz1d3VI8vfAsAW0aoMYrXVH+9ekt12sK31DRW+7M7/5jaAGARQo3RnFu9tXpj9boO9m3RZ5t+UeEz1a/l554AWJhQY2TfWf1A9V9Uf6b9+fLBk9UXqy9Vn8vnzwAYiFDjsDhSXVL92eq11X+4889u4u3p6veq/6P6J9WvVw/mlTMABiXUOOzOaXrl7ZXVn9j511fs/O/9v9W/rf7vpl8M8FkzAA4VoQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADAooQYAMCihBgAwKKEGADCo/x9pytT/NRK5vwAAAABJRU5ErkJggg==",
-    "/buttons/일시 정지.png": "iVBORw0KGgoAAAANSUhEUgAAAmoAAAJqCAYAAACb0mx/AAAACXBIWXMAAAsSAAALEgHS3X78AAAAG3RFWHRTb2Z0d2FyZQBDZWxzeXMgU3R1ZGlvIFRvb2zBp+F8AAAUDUlEQVR4nO3cv+v/+/zH8ftJOcN3URhIZBEDxfAdlIHNj43RoCxHNsu3FIqkvn8AyWCyGGx+DAyU6asU0kmYDZTyLQud7/Ae799Tx+19Oz73z6fLZX48nt16T9eer9fr/dxLL700AADc85xQAwC4SagBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQA1peOzMfnJkPzMzbZ+almfn9zPx0Zn42M/98ctOemDfMzMdm5r0z86aZ+evM/HZmfjAzv3uCu4CnhFADHuu5mfn0zHxpZt7yMmf+MDOfn5nv/rtGPWGvm5mvzsPf5fmXOfPDmfnczLz47xoFPH2EGvAYz8/Md2bm46/w/Ldm5jPzbL9de+fM/Ghm3vYKzv59Zj45M997VRcBTy2hBqSem4c3ZJ/4F+99fWY+259zwptn5hfz8DHnK/WPmfnwzPz4VVkEPNWEGpD61Mx8O7z70Xn4ntaz5vsz85Hg3p9m5h0z87fuHOBpJ9SAxGtm5o8z89bw/i9n5n29OSe8f2Z+/oj7n5+Zr5W2AM8IoQYkPjQzP3nkM949M78pbLniGzPzwiPuvzgz7yptAZ4RQg1IfGFmvvzIZ7wwM98sbLniV/MQn6mXZuaNM/OXzhzgWSDUgMRj3x7NzHxlZr5Y2HLFn2fm9Y98xntm5teFLcAzQqgBiW/Pw48JHuO/Z+a/Hj/ljP+dmf945DP+c2b+p7AFeEYINSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSAh1DahBtQJNSDxjZl54ZHP+MrMfLGw5Yo/z8zrH/mM98zMrwtbgGeEUAMSX5iZLz/yGS/MzDcLW6741cy8+xH3X5qZN87MXzpzgGeBUAMSH5qZnzzyGe+emd8Utlzx2LeML87Mu0pbgGeEUAMSr5mZP87MW8P7v5yZ9/XmnPD+mfn5I+5/fma+VtoCPCOEGpD61Dz8qCDx0Zn5QW/KGd+fmY8E9/40M++Ymb915wBPO6EGpJ6bme/OzCf+xXtfn5nP9uec8OaZ+cXMvOlfuPOPmfnwzPz4VVkEPNWEGvAYz8/Md2bm46/w/Ldm5jMz889XbdGT986Z+dHMvO0VnP37zHxyZr73qi4CnlpCDXis52bm0zPzpZl5y8uc+cM8fAfru/+uUU/Y62bmq/Pwd3n+Zc78cGY+Nw8/IgD4fwk1oOW1M/PBmfnAzLx9Hv7dxO9n5qcz87N5tt+ivZw3zMzHZua98/Bx6F9n5rfz8P283z3BXcBTQqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABwl1AAAjhJqAABHCTUAgKOEGgDAUUINAOAooQYAcJRQAwA4SqgBABz1f8CyseHL/RWyAAAAAElFTkSuQmCC",
-    "/buttons/이전.png": "iVBORw0KGgoAAAANSUhEUgAAAmoAAAJqCAYAAACb0mx/AAAACXBIWXMAAAsSAAALEgHS3X78AAAAG3RFWHRTb2Z0d2FyZQBDZWxzeXMgU3R1ZGlvIFRvb2zBp+F8AAAgAElEQVR4nO3dadRlZXnu+38VTdEVfS/SCIKKAiKITe0RA5URz4Z0W9wCxhDpPPSggEBBUfSggCDSnlAcDDBgB3IyQpOcbWH0jKAoqHQqiCAofS99W5wPNzPgYiJV9c73ve811//3ZX+R+V4je8xa15zzeZ570muvvYYkSZLqmWRRkyRJqsmiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTpIkzBdgKmAasDbwK3AF8D/hPYG5WMKnnJhP33aeA9wILAXcT9901wItZwd6JRU2Sxt/SwJ7APsCqb/O/uR04GPiXiQoljYApwI7AV4D13+Z/8yBwNHAWUK4UWdQkafwsD+xLFLRl5/G/+SawP75dk8ZiCWBX4EDgXfP431wJfA54brxCLQiLmiR1bxXgy8DuwNQF+O9PIn5gJM2fpYE9iIedlRfgv78S+CsKPShZ1CSpO2sQBWtXYPExXmtL4D/GnEgaDSsQb673BpYb47X2BM4cc6KOWNQkaezWIdaX/T2waEfXvJZY/Czp7a3KG2+vl+romg8BawIvdXS9MbGoSdKC2wA4FNgBWHgcrr8ecOc4XFcadmsSb693Zuxvr9v8BfEZNJ1FTZLm30ZEQfssse1/vPwd8I/jeH1p2KxHvL3+At29vW5zAnDIOF5/nlnUJGnebQ7MAP4SmDQBf+8Q4gdDGnUbEg9HnyPOQBtv3yaO9UhnUZOkd/ZJ4il+ayamoDUOJHaASqNqY+IMtB2YmILWmE18Vk1nUZOktzcdOAz4k6S//z+Bf0r621KmacTb608n/f1ZwJFJf/sPWNQk6Q9NIt6czQA+lpjjVeK4jwcTM0gT7c+Iey/r4ajxKeD7yRkAi5okNSYDf0O8QdskOQvAvxIHb0p9NwnYhihoWyRngZi/uwFFxklZ1CSNuoWA7YiFyh9IztJ4GdgUuDU7iDSOJhM7pw8ldlJX8TcUmrlrUZM0qhYltvgfTGz5r2R34OzsENI4WYTYHHAI8eaqktOJCQdlWNQkjZrFiN1cBxGHZlbyIrAfljT10xTgi8BXgbVzo7zFa8DJxL8LpYqRRU3SqFgS+BJwALBacpY2/0b8gN2SHUTq2JLAbsS9t3pyljY3EPfed7ODtLGoSeq7qcBOxCfOVZOzDHoNuAo4Gvhxchapa82991VqPhxdC5xIjIoqW4YsapL6agVgb2K9yXLJWQbNBa4mzmr6SW4UqXOV7z14o6BdkR1kXljUJPXNSsCexFqvZZKzDJoLXA7MBG5LziJ1bWVgD2reewBzgMOB67KDzA+LmqS+WAXYn3iSXyI5y6CXgEuJT5x3JGeRurYmMeZpV2Dx5CyDhv7ttUVN0rBbmyhouxE7Oit5EbiAKGj3JmeRurYO8fbsS8SOzkpeBi4BjmPI315b1CQNq/cQi5R3AhZOzjLoGWKo84nA/clZpK59kDjGYnvq3Xu9e3ttUZM0bJofiR2IqQKVPA2cCXwNeDw5i9S1jYlPnJ8npgpU8ixwHnHv3ZecpVMWNUnDYhNi1My2xGzASh4FzgBOBZ5MziJ1bRrx9npr6t17TwPnA8cDDyZnGRcWNUnVfZI4A63ij8TDwFnAKcBTyVmkrk0DjgCmZwdp0TwcnQY8kZxlXFnUJFXVPMVvkx2kxW+JcnYu8HxyFqlLk4h7bgawRXKWNiP3cGRRk1TNdGIh8Meyg7T4DfEEfzaxo1Pqi8nEW+sjgI8kZ2lzD/ANRvDhyKImqYLmR2ImsFlyljY/JxYpXwy8kpxF6tIixO7NQ4D3JWdpcxfwTUb44ciiJinTZOAzwJHA+5OztLkZOBm4CHg1OYvUpUWB7YiT+tdLztLmVuDr+HBkUZOUonmKnwGsn5ylzQ+JXWSlhzVLC2BJYBfgQOBdyVna3Eh84ryQmCow8ixqkiZS8xQ/E1g3OUuboRrWLM2HqcTh0AcDqyZnadPcez4cDbCoSZoI1Z/iryXK43ezg0gdWxHYC9gHWC45S5triQ0M12QHqcqiJmk8VX6Kfw24ithh+uPkLFLXVgb2IObgLp2cZVBz7x0D/Cg5S3kWNUnjYQVgb2o+xc8Friae4n+anEXq2lrAl4FdgcWTswzy3lsAFjVJXVoJ2BPYD1gmOcugl4FLgOOA25KzSF17D3FA9BeJzTqVeO+NgUVNUhdWIT6x7A0skZxl0EvApcQnzjuSs0hd+yBwELADsFBylkHNvXcU8OvkLEPLoiZpLNYmCtpuwGK5Ud7iReACoqDdm5xF6tomwKHAttSbgfsscB5xSPR9yVmGnkVN0oJYl3iK3wlYODnLoGeA2cAJwAPJWaSuVZ6B+zRwPnEG4YPJWXrDoiZpfnyIOGKj4meWp4hhzV8DHk/OInVtGjAL2Co5R5tHgTOAU4Enk7P0jkVN0ryo/JnFHwn11STizdlhwEeTs7R5mHg4OoV4UNI4sKhJ+mMqf2Z5mPiBOB14LjmL1KXJwNbEG7RNc6O0uocY83Qu8Hxylt6zqElqM40462h6dpAW/kior5oZuIcCGyRnaXMXMebpfOLIDU0Ai5qkN5tO7JL8WHaQFr8BTgPOJnZ0Sn1RfQbuLcBJwEXAq8lZRo5FTVLzmWUmsFlyljY/JzYIXAy8kpxF6tJSwM7EDurVk7O0uZE4pPYyHJSexqImja7JwGeAI4H3J2dpczNwMj7Fq3+mEnM4DyTGrVVzLfGJ84rsILKoSaOoWQczA1g/OUubHxBnoF2JT/HqlxWBvYB9gWWTs7S5lniz/t3sIHqDRU0aHVOAHYmt/u9OztLGp3j1VeURa68BVxFrU3+cnEUtLGpS/y0J7ELddTA+xauv1qbuiLW5wNXE7u6fJmfRH2FRk/prKjHi6WBg1eQsg3yKV59VHrH2MnAJcCxwe3IWzQOLmtQ/KxCfWPYBlkvOMsinePVZ5RFrLwIXAMcAv0vOovlgUZP6Y2ViJ9l+wDLJWQY1T/HHAbclZ5G69mHgEGqOWHsGmE2s/7w/OYsWgEVNGn5rAl8BdgUWT84y6CXgUuAo4NfJWaSuVR6x9jRwJnEG4ePJWTQGFjVpeK1N3YXKzWeWo4F7k7NIXZtGnD+4ZXaQFo8CZwCnAk8mZ1EHLGrS8Km8ULn5zHIC8EByFqlLk4g3Z4cDmydnafMQMQP3dOC55CzqkEVNGh6VFyo/BZyFn1nUP80Ej1nAB3KjtLqbeHt2DvBCbhSNB4uaVN8mwKHUXKjsZxb1VTMoveoEjzuJB6PZOAO31yxqUl2VFyr7mUV9VX2Cxy3ASTgDd2RY1KR6phGfWbZKztHmHqKgnQs8n5xF6tJSwM7UneDxM+B44DKcgTtSLGpSHdOJwyi3yA7S4i7gm8DZxI5OqS+WBnYnCtryyVnaOAN3xFnUpFyTga2Jk/o/kpylzc+JdTAX4zoY9ctKwJ7AvsCyyVnazCFm4P4wO4hyWdSkHM1OsiOB9ydnaXMTcAqug1H/rEKcP7g3sERylkHNiLWjgOuTs6gIi5o0sarvJPsBcQbalbgORv2yNnUPiJ4LXE6sTf1FbhRVY1GTJkb1nWSug1FfVT4guhmxdgzwq+QsKsqiJo2vJYFdqLuTzHUw6quNgAOoeUB0M2LtGOB3yVlUnEVNGh9TiSf4Q4g1MZW8BlyF62DUT58g7rutqXdAdDNi7UTg/uQsGhIWNalbKwJ7AfsAyyVnGdQsVD4C+GlyFqlrlQ+IdsSaFphFTerGysAexGLlpZOzDHoZuAQ4Frg9OYvUtenE2+GPZwdp8QhwJo5Y0xhY1KSxWRP4CrArsHhylkHNQuWjgF8nZ5G61Jw/OBPYLDlLG0esqTMWNWnBrAPsR82t/s8C5xGfWe5LziJ1qfr5g3cTb8/OAV7IjaK+sKhJ8+cDwMHA9tTb6t8sVD4BeCA5i9Sl5vzBw4D3Jmdp8wtig4ATPNQ5i5o0bz4EHEjNrf4uVFZfNecPHg6skZylzc3AyTjBQ+PIoib9cR8mtvpvS72t/i5UVl8tBexM7OJcLTlLGyd4aMJY1KR2lbf6u1BZfbU0sDtxQPTyyVnaOMFDE86iJv2hacS8va2Sc7S5hyhoLlRW36wE7Els0FkmOUubOcTn1+uyg2j0WNSk+KS5DTEofYvkLG3uIp7izyfORJP6ovLxNs0B0UcCNyRn0QizqGmUNWcxHQF8JDlLm1uBr+NCZfVP5eNt5gKXE/8u/DI5i2RR00iqfhbTTcApwIXEj4bUFxsSaz8rHm/THBB9NHBHchbpv1jUNEqqn8XULFR2J5n6ZmPiE2fF421eBC4gCtq9yVmkt7CoaRQsAexCnINW8Syma4BjgO8l55C6No1Y+/np7CAtngLOIDboPJKcRXpbFjX1WXMW00HA6slZ2swhZhX+MDuI1LHKx9s8BnwL+CYeEK0hYFFTH00F9qDmWUyvAVcRg9KvT84idW068QnxY9lBWjxMTPD4BvD75CzSPLOoqU9WBPYC9gWWTc4yqNnqPxP4WXIWqUvN7umZwGbJWdr8lticcy7wfHIWab5Z1NQHKxNv0PYnTjav5GXgEuBY4PbkLFKXFiF2bx4CvC85S5vfAKfhAdEachY1DbPKh2U2W/2PAn6dnEXqUvXd0z8HvgZcDLySnEUaM4uahlFzWOaXgCnJWQY9C5xH/FDcl5xF6tKSxO7pA6i5e7o5f9ADotUrFjUNk8qHZT4DzAaOBx5MziJ1aSqwE3AwsGpyljaeP6hes6hpGHyY+Mzy18TC5UoeJ9bBfBN4MjmL1KUViY05e1Fvcw7Ad4i1n9/PDiKNJ4uaKvswsVB5W2JweiWPAGfiVn/1T7M5Zz9gmeQsbeYAhwPXZQeRJoJFTRV9iniDtlVyjjb3EoPS/y/c6q9+qbw5pzneZhbwk9wo0sSyqKmSacSg9C2zg7S4h3h75lZ/9U3lzTnN8TbHAbclZ5FSWNSUbRIxZuYw4KPJWdrcRSxUno1b/dUvHySmd1TcnOPxNtLrLGrK0pxmPgvYNDdKq1uJT5xu9VffbEx84vw89TbneLyNNMCipolW/TTzm4idZJfhVn/1SzMofWvqbc55Gjgfj7eR3sKipokyBfgi8allneQsbf6TKGj/nh1E6tifAzOA/5YdpMWjxPE2p+PuaamVRU3jbQqwI7GdvuJp5s1hmVdkB5E61Kz9nAFskZylzcPAWcQkgaeSs0ilWdQ0XpYCdiY+tayWnKWNZzGpj5q1n0cAH0nO0qbZPX0uHm8jzROLmro2lTgs8yBg+eQsg14DriJ2kl2fnEXqUvW1n3cR0zvOBl5MziINFYuaurIiMWpmX+qNm2kOy5wJ/Cw5i9SlRYHtiLfD6yVnadPsnr4Yj7eRFohFTWO1MvBlYG9gieQsg5rDMo8Fbk/OInVpSWAX4EDgXclZ2txIfOK8kHhQkrSALGpaUGsRBa3iuBkPy1RfTQV2Ag4GVk3O0qbZnHMlHm8jdcKipvlVedyMh2Wqr5qlBfsAyyVnaXMtsYHhmuwgUt9Y1DSvNiR2cFYcN/MMMeLJwzLVNysTm3P2B5ZOzjKo2ZxzDPCj5CxSb1nU9E42Ag4AdgAWSs4y6DHgW8SBmU8kZ5G6VHlpQbM55wjgp8lZpN6zqOntfILY6l9x3MwjwJnEYmVPM1efvId4c/1F4siNStycIyWwqGlQMw9wm+wgLR4iytnpwHPJWaQufYjYwVnxzbWbc6REFjU1pgFHAltmB2lxN3AqcA7wQm4UqVObAIcC21LvzbWbc6QCLGqjrZkHeBjw0eQsbe4itvrPxsMy1S+V31w/DZyPm3OkEixqo6mZBzgL2DQ3SqvmNPOLgFeTs0hdmkbcd1sl52jzKHAG8fb6yeQskl5nURst1ecB3kQsVL4MD8tUf1R/c/0wcAqxg/rZ5CySBljURkMzD/Aw4L3JWdp4mrn6qPqb63uIzTnnAs8nZ5H0Nixq/TYF2JEY2LxGcpY2TUG7IjuI1KHmzfWhwAbJWdo0az/PJ47ckFSYRa2flgJ2JhYrr5acpc0cojxelx1E6tAU4HPATGDd5CxtbgFOwrWf0lCxqPXL0sDuwEHA8slZBjWnmR8FXJ+cRepS82B0ELB6cpY2NwLH4dpPaShZ1PqhGdi8L7BscpZBc4HLiXU6v8iNInVqKjGH80BgheQsbVxaIPWARW24rUzMA9wbWCI5yyDHzaivKj8YQRS0mcB3s4NIGjuL2nCqPLC5GTdzJHBnchapS6sA+1Pzweg14CrgaODHyVkkdciiNlzWAfYDvkQsXK7EcTPqq7WJgrYbsFhulLdo1n4eAfw0OYukcWBRGw4bEjs4twcWTs4yyHEz6qt1iQ0CO1HvvnNpgTQiLGq1bQQcAOwALJScZdBjxEnmpwFPJGeRuvQhYoNAxfvuReAC4Bjgd8lZJE0Ai1pNnyDGPG1NjJ+p5BHgTOJE898nZ5G69GHivtuWevfdM8BsYhfn/clZJE0gi1ot04hPnNtkB2nxEFHOTgeeS84idanyffcUcBax9vPx5CySEljUaphGHAT7p9lBWtwNnAqcA7yQG0Xq1DRid/KW2UFaPAqcQdx7TyZnkZTIopZnEvEEfziweXKWNs08wNnAK8lZpK40g9Kr3ne+uZb0ByxqE6/5oZgFbJobpdWtwNdxHqD6ZTLwGeK++0BulFZ345trSS0sahNnEeJ4jUOBDZKztHEeoPpoUWA7YAawfnKWNncS6898cy2plUVt/DU/FIcD6yVnadPMA7wSC5r6YwqwI3AY8O7kLG1uAU7CN9eS3oFFbfw0PxSHA2skZ2njwGb10VLAzsRBtasnZ2nzM+JwaN9cS5onFrXuNT8UXwVWS87SZg5RHq/LDiJ1aGlgd6KgLZ+cpY0PRpIWiEWtO5V/KJp5gEcCNyRnkbq0ErAnsC+wbHKWNnOAmcAPs4NIGk4WtbFbEdiLmj8Uc4HLiYHNv0zOInVpFWJQ+t7AEslZBjUPRkcB1ydnkTTkLGoLrvIPRTOw+RjgV8lZpC6tTdx3uwGL5UZ5i+bBaBbwi9wokvrCojb/1gK+DOwKLJ6cZdBLwKXEJ847k7NIXVqXWFawE7BwcpZBzX3ng5GkzlnU5t17iA0CXyTORKvkWeA84jym+5KzSF3aCDgA2AFYKDnLoBeBC4iC9rvkLJJ6yqL2zj5IPMlvT70n+aeB84nt/g8mZ5G69AngEGKKx6TkLIOeIQ6oPRG4PzmLpJ6zqL29jYGvAJ8nxs9U8hjwLeA04InkLFKXphFvrrfJDtLiKeAs4s3148lZJI0Ii9pbVX6SfwQ4kxja/PvkLFKXphO7JD+eHaRFc9+dCjyZnEXSiLGovaHyk/xDRDk7HXguOYvUlcnEA9FMYLPkLG0eJMqZ952kNBa12k/ydxM/FOcAL+RGkTozGfgMsTv5/clZ2tyN952kIka1qE0i3pwdDmyenKXNncQ6mNnAK8lZpK4sCmxHDEp/b3KWNj8n7ruL8b6TVMSoFbXmU8ssYNPcKK1uAU4CLgJeTc4idWUKsCPxYLRGcpY2NwMn430nqaBRKWqLEMdrHApskJylzY3AccBlwEj8f4hGwlLAzsTaz9WSs7T5AXACcCXed5KK6ntRaz61HA6sl5ylzbXEWUxXZAeROrQCMVptb2D55CxtvO8kDY2+FrUlgV2AA4F3JWdpcy3x+XVOcg6pSysBewL7AcskZ2kzh3houy47iCTNq74VteqfWvyhUB+tSRwOXXH+7VzgamKH6Q3JWSRpvvWlqC1KfGaZASyXnGXQXOBy4FjgpuQsUpdWIN4M70bcg5W8QuzePB64LTmLJC2wPhS16cSZRxtmBxnQFLQjgF8mZ5G6tDCwEzGMfKXkLINeAi4FjgbuSM4iSWM2zEVtVWIg+aezgwx4Cfg28SR/V3IWqWubAxdQ76Da54BzieNt7kvOIkmdGdaithnxtmrN7CBv8hLwfxNvGX6XG0UaF18gTuuvtA7tGeJg6BOAB5KzSFLnhrGo7UbM3quyJuZZ4Dxiu//9yVmk8TCFOLF/n+wgb/IY8C3gNOCJ5CySNG6GragdDxycHeJ1vycK46nEj4bUR4sBVwFbZgd53YPEFIGzibdpktRrw1TUDiFO78/mk7xGxSLAPxNzcbP9FjiFWIf2fHIWSZoww1LUdgfOTM7wILFQ+Rx8klf/LUTMvvxcco47iPVnFxLrQCVppAxDUfs/iFl8k5P+/u+I9Tn/ALyQlEGaaCcCByX+/VuJpQ6X4qB0SSOselFbEbiZnCkDdxPrz87BgqbRMg34HvFWbaLdRHzivAgLmiSVL2r/C/jsBP/NO4k3aLOJ082lUbIMUZbWmuC/2wxKvxIo/Y+SJE2kykXtb4F/nMC/dyMx5umfiakC0iiaDXxxAv/ed4j77vsT+DclaWhULWqLArcDa0/A37qR2E16GT7Ja7RtSCw1mIj1oHOAw4HrJuBvSdLQqlrU9iSOwBhPzaeWK8b570jD4nLgf4zj9ecCVxOD3H8yjn9HknqjYlFbjNiSv8Y4Xf9aYlD6NeN0fWkYfYh4uzweb9NeBi4h3lzfNg7Xl6TeqljUdiaOwujaVcBRwI/H4drSsLsY2L7ja75C3MsnEruoJUnzqWJRmwNs1eH17iQOzP1Oh9eU+mRJ4KHX/9+u/AexhOGXHV5TkkZOtaK2CnAf3Z3f9O/EW4InO7qe1EfbE2/UunIiMAPPQZOkMatW1PYiBp13YQ4xo/DFjq4n9dW/An/R0bVmAUd2dC1JGnnVitpVwH/v4Dp3ARvjTE7pnSwMPAUs3sG1LgW26+A6kqTXVStqDxKfP8dqS2KNjKQ/bmNit+dYPQasDzzewbUkSa+rVNTeDfy2g+v8b+DPO7iONAq62mV9MLE2TZLUoUpF7a+B/6eD6/wlHmIrzasziV3RY/ESsBq+TZOkzlUqavsDp4zxGs8AK+IGAmle/Rvw6TFe42pg6w6ySJIGVCpqRxGz/8bi+8Cnxh5FGhnXAVuM8RqHEYPVJUkdq1TUvgnsPcZrnM3YP+NIo+Q2YIMxXuN/0M2yBUnSgEpF7R+Bvx3jNY4jDtqUNG8eAlYe4zX+FPje2KNIkgZVKmrfBr4wxmscDxzaQRZpVHRxJI7H4UjSOKlU1Lr49HkO8H92kEUaFV18+vwM8M8dZJEkDahU1I4EZo7xGv8f8CcdZJFGxQ+Bj43xGocDx3SQRZI0oFJR6+J4jmeJ4zleGHscaSR0cTzHv9HN6DdJ0oBKRe0viOHQY+UONGnenQ7sNcZrvEwcePvY2ONIkt6sUlFbHbivg+vMAf6sg+tIo+DvgfM7uM6hxGYeSVKHKhU1gAeAVTu4znTgmg6uI/XdRsBNHVzncWIou2/VJKlD1YralXQziuZuYGPgqQ6uJfXZwsR9sngH17oM+GwH15Ekva5aUdsT+FZH1/ouUfrcWCD9cf8C/FVH1zoKOKKja0nSyKtW1FYh1qkt1NH1/jewPfFZRlK7zwGXdHi9k4CDgVc7vKYkjaRqRQ3gO8Qas678hpj/+f92eE2pT5YkRkkt2eE1vw/sAfyiw2tK0sipWNR2As4bh+teTRyq++NxuLY07C4EPt/xNV8h7uUTiHWjkqT5VLGoLQr8ClhrnK5/LTCLOMZDUvggsftz8jhc+2Xi0+pxxMgqSdI8qljUID5VnjnOf+Na4ETginH+O9Kw+Cdg23G8/lzizfYs4Cfj+HckqTeqFrVFgNuBdSbgb91IPOlfBpT8P4Y0QTYEbmZ83qoNmkPMCL1uAv6WJA2tqkUNYr3MhRP4924EjgX+mXjyl0bRPwA7T+Df+w5x331/Av+mJA2NykUNYl3L5yb4b94JfA2YTSyGlkbJUsDPgPUm+O82SxGuxDfbkvRfqhe1ZYlPMe9O+Nt3A6cC591q3KMAABsASURBVOChuRotnyTecHV1nuH8uAk4BbgIz2GTpPJFDeDPgavI+dEA+B3xhu0fsLBpdBxLDFrPcisx5P1SLGySRtgwFDWAXYk3W5MSMzxInLh+DvBMYg5pIkwGLgD+NjnHHcQ5bBcCLyVnkaQJNyxFDWAf4LTsEMBjxDzS04AnkrNI42khYp3oeB7ZMa9+S3wSPRd4PjmLJE2YYSpqAMcAM7JDvO73wOnEOrbHkrNI42UKscC/y7FuY/EgcDJwNr7ZljQChq2oAfwd8Y/04tlBXvcsMSbna8RAealvFiYekr6aHeRNmjfb3wQeT84iSeNmGIsawKbEeWfjNWZqQbxELHw+kjjiQ+qbzxOfHpfIDvImzxBH6ZwAPJCcRZI6N6xFDWAV4h/o/54dZMBLwLeJHWt3JWeRuvYRYpPBhtlBBjxHlMiT8M22pB4Z5qLWmE6sE6v2wzEXuBw4AvhlchapS5OJ3aAnASslZxnUvNk+mtgxKklDrQ9FDWI26N7AYcByyVkGNYXtWOIwT6kvlic+9e8GLJqcZdArwMXEm+3bkrNI0gLrS1FrLEXMKfwqsFpyljYOolYfrQl8BdiFWuvXIB6UriYK5Q3JWSRpvvWtqDWWJH40DgDWSM7SpplreEV2EKlDKwF7AvsByyRnaTMHmAn8MDuIJM2rvha1xqLAdsRbrIkeMj0vHEStPloa2B04iPg8Wo0PSpKGRt+LWmMRYHtiduEGyVna3AgcB1yGhU39UX0pwg+IYz18UJJU1qgUtcZkYGtgFnEWWzW3EDvpLsJB1OqPKcCOxJvtiksRbiamHXjfSSpn1IpaYxKwDfHDsXlyljZ3EpMOZhO716Q+aJYizADWT87SxvtOUjmjWtTebBpwFPCn2UFa3E2cEXcO8EJuFKkzk4HPEDsx35+cpc3deN9JKsKi9oZpxFqabbKDtHgI+AYxBP655CxSV5qlCFXfbHvfSUpnUXurTwCHED8gk5KzDHoEOJP48fh9chapS9OJN9sfzw7SornvTgWeTM4iacRY1N7exsQhnjsACyVnGfQY8C3gNOCJ5CxSlyq/2X4KOItYx/Z4chZJI8Ki9s42JH44tgcWTs4y6GngfGJMzoPJWaQuVX6z/Qyx4eBE4P7kLJJ6zqI2794D7At8iThuoJJngfOIJ/37krNIXdqImDBS8c32i8AFwDHA75KzSOopi9r8Wwv4MrArsHhylkEvAZcSu+nuTM4idWldYtLBTtR7s93cd8cAv0rOIqlnLGoLbmWisO1NvUHULwOX4A+H+mdtYH9gN2Cx3ChvMRe4nDhQ+xe5UST1hUVt7FYE9iI+iy6bnGWQPxzqq1WIwlbxQWkucDWxi/X65CyShpxFrTuVB1E3PxxHAjckZ5G6tBKwJzUflCAGwM8EvpsdRNJwsqh1r/og6jnEAaPXZQeROlT5QQmisJ0IXJEdRNJwsaiNn+qDqP3hUB81D0oHAasnZ2nzM+I4ncsA//GV9I4sauOvGUR9OLBecpY2TWG7En841B/Ng9JhwLuTs7S5BTgJuAh4NTmLpMIsahNnEeLQ3EOA9yVnaXMTcCw+6atfmvtuBrB+cpY2dxLnH84GXknOIqkgi9rEawZRzwI2zY3S6lbg6/ikr36ZDHyGuO8+kBul1d3ELNFzgBdyo0iqxKKWZxIxz/Aw4KPJWdrcRXwS9UlffdLcd4cDmydnafMQ8A3gdOC55CySCrCo1TCNODpjy+wgLe7GJ331U+X77lHgDOLeezI5i6REFrVaphHHemyTHaSFT/rqq8r33dPAmcRyhMeSs0hKYFGr6RPEpoOtiU81lTxC/HB8A/h9chapSx8m7rttqXffPUMsQzgRuD85i6QJZFGrbSPgAGAHYKHkLIMeA74FnAY8kZxF6tKHgAOped+9CPwv4pPtnclZJE0Ai9pw2JD4NLM9sHBylkFPA+cTh3g+mJxF6tK6xMG5O1HvvnsZuIQ4Uuf25CySxpFFbbisA+wHfIk40LOSZ4HziDOh7kvOInVpLeDLwG7AYslZBjVzfI8AfpqcRdI4sKgNp+aHY1dg8eQsg14CLgWOAn6dnEXq0irA/sDewBLJWQa9BlwFHA38ODmLpA5Z1IbbykRhq/jD4acZ9dWKwF7AvsCyyVnaXEu8YbsmO4iksbOo9UPlH47m08xMYiC11BdTgT2IjQcrJGdp08zxvSI7iKQFZ1Hrl6WB3YkF0MsnZxnUfJo5Crg+OYvUpSWBXYj7bvXkLG1uBI7DOb7SULKo9dNSwM7ETtHVkrO0mUOM8LkuO4jUoUWB7Yi3x+smZ2lzC3ASzvGVhopFrd+mADsSpWiN5Cxt/DSjPlqEOErnUGCD5Cxtmjm+5xNrSSUVZlEbDc2T/mHAe5OztGkK25X4aUb9MZmYLjIL2DQ3Sqt7iAkj5wLPJ2eR9DYsaqOledI/BHhfcpY2NwGnABcSmxCkPphEzBE9DPhocpY2DwNnEffeU8lZJA2wqI2m6k/6txJDqF1Lo76ZRtx3WyXnaPMocAaOhZNKsaiNtupP+s1amtnAK8lZpC5NIzb7bJMdpIVj4aRCLGpqTCMGPW+ZHaRFs5bmHOCF5CxSlzYhNh1sSzw4VeJYOKkAi5oGVX7Sf4gobKcDzyVnkbr0QeIcth2AhZKzDHIsnJTIoqa383HiSX9r6j3pPwKcSZS23ydnkbr0HmLCyJeI43UqacbCHQfclpxFGhkWNb2TjYADqPmk/xSxW+1rwOPJWaQurUXM8d0VWDw5y6BmLNws4Ce5UaT+s6hpXm1IfBLdHlg4OcugZ4gNBycADyRnkbq0MjFPdH9iRFwlzVi4Y4AfJWeResuipvm1DrAfNT/NuPhZfbUisBewD7BccpY21xJv2OYk55B6x6KmBbUm8BVqfppx8bP6aiqwE3AwsGpyljZOGZE6ZlHTWFX+NNMsfj4WuD05i9SlJYFdgAOBdyVnaXMjsdnHKSPSGFnU1JXm08y+wLLJWQY1i59nAj9LziJ1qZnjeziwXnKWNs2UkYvx0GppgVjU1LWpxBu2g4Dlk7MMahY/HwVcn5xF6lL1Ob6/IUZTnQ28mJxFGioWNY2XpYCdicK2enKWNnOIN2w/zA4idaiZ43sE8JHkLG1+Swx/Pxd4PjmLNBQsahpvU4AdiU8zayRnadMsfr4iO4jUoWaO7wxgi+QsbR4mzkD00GrpHVjUNFGmAF8k3rCtk5ylzX8Smw7+PTuI1LE/Jwrbf8sO0uJR4pPo6VjYpFYWNU20ycBniHViFdfS3ER8mnG3mvqmmeNbcSzc08D5wPHAg8lZpFIsaspSfS1Ns1vtIuDV5CxSlzYmzkD8PHEfVtIcWv114N7kLFIJFjVla9bSHAZ8NDlLm7uINWznE+eySX3xQWIpQsWxcM2h1UcDdyRnkVJZ1FTJNOBIYMvsIC3uIRY+nwO8kJxF6lLlsXDNodXHAbclZ5FSWNRUUbOWZpvsIC0eIgrb6cBzyVmkLlUeC9ccWn0kcENyFmlCWdRU2YeJAzy3pd7i50eAM/F4AfVPMxZuP2CZ5Cxt5hDH/VyXHUSaCBY1DYMPE2vY/pp6i58fJ44X+CbwZHIWqUsrEiPh9qLeWDiA7xBH6nw/O4g0nixqGiYfAA6m5uLnZ4DZwAnAA8lZpC5NBXYiliOslpylTXNo9ZXEmDipVyxqGkaVFz83xwt8DbgvOYvUpSWBXYADqDllpDkD0SN11CsWNQ2zyoufm+MFjgJ+nZxF6tKiwHbEcoT3Jmdp83PiQeli4JXkLNKYWdTUB83i5/2BpZOzDGqOFzgWuD05i9SlZsrIkcD7k7O0+Q2xftQjdTTULGrqkxWJhc/7Um/xc3O8wBHAT5OzSF1qpozMBDZLztLmt8Qn0XOB55OzSPPNoqY+mkq8YTsIWD45y6DXgKuIT6LXJ2eRujadmCbwsewgLTxSR0PJoqY+WwrYmShsqydnaTOHeAvxw+wgUscqH1r9GPAt4kidx5OzSO/IoqZRsASxW+1Aau5WuwY4Bvhecg6pa9OAGcCns4O0eAo4g3jD9khyFultWdQ0SprdajOA9ZOztPkBcQ6b50GpbzYmdmjvACyUnGXQi8AFxCfbe5OzSG9hUdMoqr5brTkP6kJiE4LUFxsSn0QrHlrdHKlzNHBHchbpv1jUNMqa3WpHAB9JztLmVuDreB6U+qc5tHo3YLHkLIPmApcT/y78MjmLZFGTXjedWCe2RXaQFncRI3LOJ85lk/qiObR6F2ItaSXNkTpHAjckZ9EIs6hJf2gaMAvYKjlHm3uIhc+eB6W+WQnYk3jLtkxyljbu0FYai5rUrvLxAg8Rhe104LnkLFKXlgZ2p+YZiPDGAPgrsoNodFjUpD9uE+BQYFtgUnKWQY8SxwucCjyZnEXqUnMG4leB1ZKztHGHtiaMRU2aNx8izmGreLzAU8BZxCBqD/BUn0wBdgQOp+YZiDcDJwMXAa8mZ1FPWdSk+bMu8VlmJ+odL/AMMJt40n8gOYvUpepnIN5JPCjNxh3a6phFTVowawP7U/N4AQ/wVF9VPwPxbmIpwjnAC7lR1BcWNWlsmuMFdgUWT84yqDnA8yjg18lZpC41ZyAeDmyenKWNG37UGYua1I2VgT2oebzAy8AlwLHA7clZpK5NJx5GPp4dpMUjwJm44UdjYFGTurUCsDewD7BccpZBzQGeRwA/Tc4ida3ykTpu+NECs6hJ42MqseHgYGDV5CyDXgOuIt5CXJ+cReraJ4BDiE+j1Y7UaTb8nAjcn5xFQ8KiJo2vJYnxOAcBqydnaXMtceL6d7ODSB3bCDiAmkfqNBt+jgF+l5xFxVnUpInRnAd1GPDu5CxtPHFdfVX5SJ1mw88xwK+Ss6goi5o0sRYBtqfueVCeuK6+Wpu6R+rMBS4n5gz/IjeKqrGoSTmqnwflievqq1WIwrY3sERylkGuH9VbWNSkXM15UDOBzZKztPk5sVPtYjxxXf2yErAnsC+wbHKWNq4fFWBRkyqZTqxV2SI7SIvfAKcBZxMLoaW+WBrYnVjHtnxyljauHx1xFjWpnmnEWpWtknO0uYc4cf1c4PnkLFKXlgJ2pu4O7Z8BxwOX4frRkWJRk+qqfIDnw8ApOCJH/VN9h/YtwEm4fnRkWNSk+jYBDgW2pd4Bno8CZ+CIHPVP9R3adxLrR2fj+tFes6hJw+NDwIHUPMDTETnqq2aH9izgA7lRWt1NPCidA7yQG0XjwaImDZ/KB3g2I3JOAB5IziJ1aRKxDOFwYPPkLG0eItaPuhyhZyxq0vBam7oHeDYjco4G7k3OInVtGnEG4pbZQVq4HKFnLGrS8Hs3MdNwV2Dx5CyDmhE5RwN3JGeRulZ5w8/TwJnA14HHkrNoDCxqUn80B3juByyTnGXQy8AlwHHAbclZpK59GDiEmht+muUIJwL3J2fRArCoSf2zAjEeZx9gueQsg+YCVwNHAD9NziJ1rfKGn+bt9pHEjlENCYua1F9TiQ0HBwOrJmcZ1Mw0PBr4cXIWqWuVN/w0b7ePBW5PzqJ5YFGT+m9JYBfqnrjuTEP11VrAl6m54ce320PCoiaNjkWB7YhStG5yljbONFRfrULs0N4bWCI5yyDfbhdnUZNGT/UT139AnMN2Jc40VL+sCOwF7Assm5ylzbXEG7ZrsoPoDRY1aXQ1J64fCbw/OUubm4GTcaah+qdZP3oI8batGt9uF2JRkzQZ2Jr4JLpZcpY2PydGU12MMw3VL8360QOBdyVnaXMjcaTOZfh2O41FTdKbTSfWqnwsO0iL3wCnAWcTkw+kvqi+fvRW4uBc324nsKhJalP5xPXfAqcA5wLPJ2eRutSsHz0U2CA5S5u7iE+i5xPHfGgCWNQk/TFNYduaeieuP0wUNodQq2+a5QizgE1zo7S6hxgA78PSBLCoSZoXmxBP+RVH5DiEWn01iXirfRjw0eQsbR4GziIemJ5KztJbFjVJ86PyiJxmCPXXgMeTs0hdm0a8YdsqOUeb5mHpNOCJ5Cy9Y1GTtCAqj8hphlCfADyQnEXqWuX1o08T69eOBx5MztIbFjVJY7E2ceJ6xRE5LwIXELtY703OInWt8nKEZ4HziLfb9yVnGXoWNUldqDwi5yXgUqKw3ZGcReraB4m32xWXIzT33lHAr5OzDC2LmqQurQTsCewHLJOcZdBc4HLirKrbkrNIXXsPMZrqS8CU5CyDXgYuIQ7P9d6bTxY1SeNhBeLt2j7AcslZBs0FriYWZv8kN4rUubWALwO7AosnZxnkvbcALGqSxlMz0/BgYNXkLINeA64iPon+ODmL1LWVgT2IJQlLJ2cZ1Nx7xwA/Ss5SnkVN0kSoPtPwWuKT6Hezg0gdWxHYi5pvtyHuvVnAnOQcZVnUJE2k6jMNryVG5FyRHUTqWOW32/DGvXclDoD/AxY1SRmamYYzgPWTs7T5GXEW1GX4o6F+qf52+yZi0sGFxJq2kWdRk5RpMvAZ4tPHB3KjtLoZOBm4CHg1OYvUpebt9uHAeslZ2twKfB24GHglOUsqi5qkCpoh1DOBzZKztPk5cXjnyP9oqHeat9uHAO9LztLmN8RoqrOJQ6xHjkVNUjXTiZ2YH8sO0mLkfzTUW83D0hHAR5KztPkt8Un0XOD55CwTyqImqarKMw1H9kdDvTeJuOdmAFskZ2nzMHAW8A3g98lZJoRFTVJ1nyR2qm1NvZmGzY/GKcBTyVmkrlV+WHoM+BbxhvuJ5CzjyqImaVhsTDzlVxxC/ShwBnAq8GRyFqlrTWGr+LD0NHA+cALwQHKWcWFRkzRsKg+hfho4k9h48HhyFqlrGwNfAT5PrGmr5FngPGKn6L3JWTplUZM0rN5DPOXvBCycnGXQM8Bs4gDP+5OzSF1rHpa2p9699xJwKbEh6Y7kLJ2wqEkadmsT8wx3AxbLjfIWLwIXED8avXrKl4B1gP2ALwFTkrMMehm4BDgOuC05y5hY1CT1xSpEYdsbWCI5y6DePeVLb7Im8Ul0V2Dx5CyD5gJXA0cCNyRnWSAWNUl9sxKwJ/Gkv0xylkFzgcuJg32H+ilfarEysAc17z2Iwe+HA9dlB5kfFjVJfbUC8XZtH2C55CyDmqf8WcBPcqNInat878EbA+CvyA4yLyxqkvpuKrHh4GBg1eQsg14DrgKOAX6UnEXqWnPvfRVYLTlLm6awXUnciyVZ1CSNiiWJRc8HUPNH49+IH7RbsoNIHVuS2OxzALB6cpY2NxD33nezg7SxqEkaNYsBOxPHC6yZnGXQi8T6nrOzg0jjYArwRaIUrZ0b5S1eA04m/l0oVYwsapJG1aLAF4hPouslZxm0O5Y19dcixIHVhwAbJGcZdDqxtq4Mi5qkUbcQsB1wKPCB5CyNl4FNgVuzg0jjaDLwWeLe2yg5y5v9DfAv2SEaFjVJCpOJf6APAzZJzgLwr8BfZYeQJsAkYvD7DGCL5CwQZx1uQJFPoBY1SfpDk4jh0zOAjyXmeBVYA3gwMYM00f6MuPf+JDnHp4DvJ2cALGqS9MdMJ96wZf1o/E/gn5L+tpRpGlHYPp3092cR0wzSWdQk6Z19kth0sDXxxm2iHAR8fQL/nlTNxsR4qh2I9aQT5XziDLh0FjVJmnebE0/5f8nEFLZDgBMm4O9I1W1IbDr4HBNT2L4N7DgBf+cdWdQkaf5tRPxofJbYhDBe/g74x3G8vjRs1iPebn+BOGJnvJxAPCils6hJ0oLbgChsOwALj8P11wPuHIfrSsNuTeBA4vDqxcfh+n9BjJZKZ1GTpLFbh3jK/3u6e8q/llhQLentrQp8mTgkeqmOrvkQUQRf6uh6Y2JRk6TurEE85e/K2J/ytwT+Y8yJpNGwAjFRYG9guTFea0/gzDEn6ohFTZK6twpvPOVPXYD//iSi8EmaP0sDewD7AysvwH9/JXHQ9NwuQ42FRU2Sxs/ywL7Ek/6y8/jffJP4kSnzQyENoSWIN9sHAu+ax//mSmJX6XPjFWpBWNQkafwtTXxO2YdYU9PmdmKdW5kZg1IPTCGO2fgKsP7b/G8eBI4GzqLI2Kg3s6hJ0sSZAmxFbBJYmxgTdQfwPeA/8S2aNF4mE/fdp4D3Emex3U3cd9cAL2YFeycWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkov5/u8kDLLWYqUAAAAAASUVORK5CYII=",
-    "/buttons/다음.png": "iVBORw0KGgoAAAANSUhEUgAAAmoAAAJqCAYAAACb0mx/AAAACXBIWXMAAAsSAAALEgHS3X78AAAAG3RFWHRTb2Z0d2FyZQBDZWxzeXMgU3R1ZGlvIFRvb2zBp+F8AAAgAElEQVR4nO3dd/hmdXnv+/cMvfcqSBNEOvYy59II2SfZcHJybcgOkL0loUrvfQaGIkW6CAgKhKgciHiZBPDozuiOZwsSC1ItIIJI79LrzPnjztriw0Jm5ree330/63m//sp1Bdfv888z67PW+n6/95Q5c+YgSZKkeqZY1CRJkmqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVUvaosAWwHTgLWB14G7gH8Dvg/Mzgom9dxU4nf3CWB9YAHgXuJ39x3g5axgkjROqha1KcBewAxg1bf4b+4EzgQux5uG1KW/BE4F3v0W//+Hgc8B5wPPTFYoSRpHFYva4sBVwLZz+d8/AJwOfBF4YVihpDEwFTgb2H8u//unicJ2LvDksEJJ0jirVtSmAv/M3Je0N3qUuMlcgE/50vw4HTh0Pv53zwIXAmcBj3SaSJLGXLWitjfxOWUingLOI570n5hwImk8/Anw3Qle40XizfbpwP0TTiRJKlXUFgbuA1bp6HrP8fun/Ic7uqbUV98HPtbRtV4B/p5Y53ZPR9eUpLFUqahtC1wzhOu+CFxCPOXfN4TrS6NuPeBXQ7jua8AVwMnAL4dwfUnqvUpF7RTgyCFe/xXgy8RT/jBuStKo+u/APwzx+rOBrxGF7dYh/h1J6p1KRe1y4FOT8HdeJ3aVngzcMQl/T6ruSOJBadjmAP8CfAb40ST8PUkaeZWK2qXA303i35sDXAecCPxwEv+uVM1hwGcn+W9eDxxHHJ4rSXoLlYraccDMpL/9LeIp//tJf1/K9FfAPyb97e8BJwGzkv6+JJVWqah9nBgNlel7RGH71+Qc0mRalThOY4HEDDcSv73riLfdkiRqFbUpxM6w9bODAP9O3DSuxZuGxsM/A3+RHQK4mXjD9g2c5StJpYoaxIzBb2SHeINbiU0HX8ObhvptE+AmYKHsIP/hZ8Rv70piA5AkjaVqRQ1iosB+2SEG/JLYFXcF8GpyFmlYPk0cEl3Jr4gjdb5MHLEjSWOlYlGbQuxAO+Q//u9K7gVOAy4DXs6NIg3Fp4FzgEWygwy4j/h34RLgpeQskjRpKha1xieJUvT+7CAtHgTOAC4Gnk/OInVtU+K39+fZQVo8RPz2LsLfnqQxULmoNaYRx3ZslZyjzePEEPlziWHwUp9sTrzZ/htganKWQf72JI2FUShqjWnAEcA21Psk+izxOfQUHACv/tkEOBzYEVgwOcsgf3uSem2UilpjC+BoYHvqFbbniTU0nwUeSM4idW1d4mHp76izO7TR/PZOI5YmSFIvjGJRa1R+yn+FmCd6Ag6AV/+sBRwM7AEsmpxl0MvE3OCTgN8mZ5GkCRvlotZYFzgA2JN6O9VeJc6BOhn4RXIWqWurAAcRx+ksnpxlUPPbOwm4MzmLJM23PhS1RvOUvzuwWHKWQbOBbxKbIn6SG0Xq3ErAPsQD07LJWQbNBr5OzBL+eXIWSZpnfSpqjZWBvYkn/aWTswyaQ8wyPIkYUyX1ydLAXsSShOWTswxqHpaOB36cnEWS5lofi1pjRWBfYH9gueQsba4nFj5fkx1E6tiSwK7ExoPVkrO0mQVMx4clSSOgz0WtsRSwC3AksGpyljZNYXMAvPpmCWA34FBgjeQsba4nPol+JzuIJL2VcShqjeamcRjwjuQsbW4BzgK+ggPg1S8LAzsAM4B3JWdp49ttSWWNU1FrVL9p3A6cTgyAfy05i9SlhYjjdI4G3p2cpc3NxA7tq/HttqQixrGoNZqbxlHAhslZ2txDjMf5Ag6AV79MJSaMzATemxul1W3EPNGvAq8nZ5E05sa5qDWam8ZxwPuSs7S5j/gkejHwYnIWqUtTgG2Jt9sfSM7S5m5iysil+HZbUhKL2u81N41jgA8lZ2nzKHAhcDbwu+QsUtemEZM8/iQ7SIt7gXOAi4CXcqNIGjcWtXbNAPhts4O0eAL4PPFZ9KnkLFLXKv/2fguciW+3JU0ii9of9zHiWI9tqDcA/lngMuBU4KHkLFLXPkqsH63423sMuADfbkuaBBa1ubM5cAiwE7BAcpZBzwOXEDtF70/OInWt8m/Pt9uShs6iNm82Jj7L7AgsmJxl0CvAVcCJwF3JWaSuVf7tNW+3TwEeTs4iqWcsavNnHeBAYE9gkeQsgxxCrT6r/Ntr3m6fBjyYnEVST1jUJuadxGeZ3YHFkrMMcgi1+mwt4GBq/vZeAf4eOInYgCBJ882i1o2Vgb2JJ/1lkrO0mUWcVXVjdhCpYysThW0/YPHkLINeBa4kCtudyVkkjSiLWrdWIG4Y+wPLJWdp40xD9dWKwL7AAcCyyVkGuRxB0nyzqA3HksCuxOLn1ZKztGkK27U401D9sjSwF3A4sHxylkEuR5A0zyxqw7UEsBtwKLBGcpY2txDjqZxpqL6p/rDkcgRJc8WiNjkWBnYApgPrJ2dpcwcx0/AKnGmoflkE2JkoRRUfllyOIOmPsqhNrqnAdsSnj/ckZ2lzD3F4pzMN1TfNw9IM4F3JWdq4HEFSK4tajqnEaJxjgfcnZ2lzH/FJ9IvAC8lZpC4tRByaexSwYXKWNjcDJwNXY2GThEWtgq2JaQIfzg7SwpmG6qvmYWkm8N7cKK1uA87A9aPS2LOo1TGNWPi8bXaQFs8AFxLr2J5MziJ1aQrxm5sOfDA5S5u7id/dpbh+VBpLFrV6Pkp8ltmGuIlU8hxxwzgVeCg5i9S1acT60U9mB2lxL3AOrh+Vxo5Fra7NiGM9dgIWSM4y6GXgcuKT7f3JWaSuVX67/QixFOE8XD8qjQWLWn0bEzeNHYEFk7MMegW4CkfkqJ8qv912/ag0Jixqo2MdYpboHsCiyVkGOSJHfVb57fYTwOeJY3WeSs4iaQgsaqNnVaKwVRxC3YzIOQH4UXIWqWuV324/C1wGnAI8nJxFUocsaqNrJWAforQtk5ylzSzinLgfZAeROta83d6TmHxQyfPAJcRO0QeSs0jqgEVt9FUeQg2OyFF/rQUcDOwOLJacZVCzfvR44ogPSSPKotYf1YdQ30Ac6+GIHPXNykRhq7gc4VXgStzwI40si1r/NEOopwNrJmdpcytwJp64rv5ZEdgXOABYNjnLoGbDz0zgZ7lRJM0Li1p/NUOojwE2SM7SxhPX1VdLAXtTczlCs+HneODHyVkkzQWLWv9NBbYjnqQ3yo3S6l48cV39VH05wixgBnBjdhBJb82iNj6aIdQzgA8kZ2njievqq2Y5wgxgjeQsbdzwIxVmURtPWxNnnX0kO0iL5sT1c4Cnk7NIXWqWI0wH1k/O0qYpbG74kQqxqI23yjMNnwEuJNaxPZmcRerSQsShuUcBGyZnaXML8BngaixsUjqLmgC2JG4a21NvpuFzxIaD04AHk7NIXWqWI8wE3psbpdXtwOm4Q1tKZVHTG1WeafgycDlxHtRvk7NIXZpCvNWeDnwwOUubXxMPSu7QlhJY1NRmPeJogV2oN9PQAzzVZ9OIozM+mR2kxb24Q1uadBY1/TFrAwcBewCL5kZ5Ew/wVJ9VXj/qDm1pElnUNDdWIQpbxRE5c4DriF2sP0rOInWt8vrRZof22cDvkrNIvWVR07xYCdiHmiNyII4XOBb4bnYQqWOV148+AXweOBd4KjmL1DsWNc2PpYG9qDkiBzzAU/21MfFJdEfqrR99FrgMOAV4ODmL1BsWNU1EMyLncGD15CxtfkrcNDwPSn2zDnAgsCcx+aCS54FLiDMQH0jOIo08i5q60IzImQ6smZylzW3AGXgelPrnncAhwO7AYslZBr0CXEWsH/1VchZpZFnU1KXmxPWjgXcnZ2lzN/GU73lQ6puVgb2JTT9LJ2cZ1Byp8xngl8lZpJFjUdMwNCeuH0/sWqvmN8RONc+DUt+sCOxLzQ0/s4FvEht+fpqcRRoZFjUNU/UT1z0PSn21FPGGreKGH4/UkeaBRU2TpfKJ648D5xOnrj+dnEXqUvUNP7OAGcCN2UGkqixqmmyVT1x/ljjA83TibCipL5oNPzOANZKztPFIHektWNSUpfKJ6x4voL5aGNiBWI6wfnKWNk1huxaP1JEAi5rybQocRs0T15vjBY4ndoxKfTEV2I5YJ7ZhcpY2twBnAV8hNiFIY8uipirWJT6J/h1xzEclHi+gvmp2aB8HvC85S5vbiaUInoGosWVRUzVrAQdT8wDP5niB44CbkrNIXWp2aB8DfCg5S5tfE59EPQNRY8eipqpWIQ7v3A9YPDnLoOZ4gROBHyZnkbo2DZgJbJWco41nIGrsWNRU3UpEYduHeieuA3yL+CT6/ewgUsc+QWw6qFjY7ic+iX4Jz0BUz1nUNCqWAnYBjgRWTc7SxuMF1FeVd2g/Rhyp4xmI6i2LmkbNEsBuxE7RdyRnaXMzcDJwNR4voH7ZDDiUmju0nwEuJI7UeTI5i9Qpi5pGVXMe1AzgXclZ2rhbTX21EfFme0dgweQsg54jNhycCjyUnEXqhEVNo24h4oZxNPDu5Cxtfg18DvgC8HJyFqlL6wAHAnsSkw8q8dBq9YZFTX3RnAc1E3hvbpRWzW61i4EXk7NIXXoncAg1j9RpDq0+AfhVchZpvljU1DfVz4N6lFhLcxaxrkbqi5WBvYld2tV2aHtotUaWRU19Vvk8qMeB84FzgaeSs0hdWhHYFzgAWDY5yyAPrdbIsahpHHyceMP2p9lBWjwNfJ4obI8nZ5G6tCywP1HYlk/OMmg28E/AScBPk7NIf5RFTeNkC2LTQcXzoFz8rL5aEtgVOBxYPTlLm1nAscAPsoNIbSxqGkebEDeNiscLuPhZfbUYseHgMGCN5CxtvkO8Yfu35BzSH7CoaZytS3yWqXi8QLP4+WTgF8lZpC41ZyBOB9ZPztLmBuIctmvx0GoVYFGTYC3gYGoeL9Asfp4J/CQ3itSpqcB2wPHAe5KztLmF2J3todVKZVGTfq/y8QJzgOuITzP/npxF6lJzBuJxwPuSs7S5g1g7egXwWnIWjSGLmvRmzfEC+wPLJWdp4wB49dXWxMNIxTMQnTKiFBY16a0tA+xHrGNbMTlLm/9FHOD57ewgUsf+jDhSZ1p2kBb3EG/YLsPCpklgUZPe3hLAbsRutXckZ2nTrKX5CrGmTeqLacARxLSRah4hxsKdB7yQnEU9ZlGT5l6zW20G8K7kLG1uB07HtTTqny2Bo6h5BmIzZeQc4gBrqVMWNWneLUScwXYUsGFyljb3EJMOXEujvtmUeLO9E7BAcpZBzxBzfD8LPJmcRT1iUZPmX/XdavcRn0QvBl5MziJ1aSPgSGoeWv0ccClxFttDyVnUAxY1aeKmEGtojgY+nJylzaPEk/7ZwO+Ss0hdWgc4ENgDWDQ5y6CXgcuBE4H7k7NohFnUpG5VXvz8BL8fAP9UchapS+8EDqHmodWOhdOEWNSk4fgY8WlmG+otfn6WOFrATzPqm8qHVjsWTvPFoiYN1+bEk37Fxc/PA5cQO0X9NKM+aQ6tPgBYNjnLoGYs3HHATclZNAIsatLk2Jj4JFpx8XPzaeZE4K7kLFKXlgJ2IXZor5KcZVAzFu5E4IfJWVSYRU2aXM3i5z2BRZKzDJoNfJ140v95chapS0sCuwKHA6snZ2lzPXAs8N3sIKrHoiblqLz4ufk0czzw4+QsUpcWAXYGpgNrJmdp4xxfvYlFTcrVLH4+kJgtWs0sYhLDjdlBpA41U0aOATZIztLmBmKzz7XEJ1KNMYuaVMMKxAD4/YHlkrO08UlffTQV2I54e/ye5CxtbgXOBL4KvJ6cRUksalItzVqaI4DVkrO0aQqbT/rqk+pTRu4gRlM5x3cMWdSkmpq1NDOANZKztLmFGE/lk776ZmvgJOBD2UFaOMd3DFnUpNqatTTTgfWTs7TxSV99NQ2YCWyVnKPNb4iRcM7xHQMWNWk0VF9L0zzpXwS8lJxF6lLlsXCPEm+2zwNeSM6iIbGoSaOlWUtzLPD+5Cxt7iNuHF/EG4f6ZQvgaGB76o2Fexw4HzgHeDo5izpmUZNG19bEqeYfzg7S4jHgAuLzzO+Ss0hd2hQ4jJpj4Z4BLiSWIzyZnEUdsahJo6/ypxlvHOqr9YhJB7tQbyzcc8ClxFlsDyVn0QRZ1KT++Cgx03Ab6n2a8cahvlobOAjYA1g0N8qbvAxcTrx5vz85i+aTRU3qn82AQ6n5acYbh/qq8li4V4CriN/dXclZNI8salJ/bUx8Et2Rep9mmhvHScCdyVmkLlUeC/cqcCVwMvCL5CyaSxY1qf/WIW4aFT/NzAa+TpwI//PkLFKXKo+Fmw18k/jd3ZScRW/DoiaNj1WJwrYfsHhylkHNjeME4EfJWaQuLUVsODiS+A1WMge4jvgk+sPkLHoLFjVp/KwE7EPNTzMAs4hz4n6QHUTq0BLAbsRO0dWTs7S5nvjdfTc7iP6QRU0aX0sDexE3juWTs7RpBsBfkx1E6lAzx3c6sGZyljb+7oqxqElaEtiV2HiwWnKWNjcQx3pcS3yqkfpgIWKjzzHABslZ2vwAOAV/d+ksapIa1Z/0bwXOBL4KvJ6cRepK9Tm+/u6SWdQkDVoY2IG6T/p3E5MOLgVeS84idaX6HN87iN/dFfi7m1QWNUlvpXnSnwlslBul1b3EEOqLgJdyo0id2po4Y/BD2UFa3AOcC3yBOMBaQ2ZRk/R2mif9GcAHkrO0eYQY/n4e8EJyFqlL04gHpa2Sc7S5DzgLuBh4MTlLr1nUJM2LrYmzzj6SHaTFY8AFxFu2p5OzSF2aRmz22TY7SItHicLmg9KQWNQkzY/KN45ngAuJ9TRPJmeRurQFcDSwPTAlOcugx4Hz8UGpcxY1SROxJXAUNW8czxEbDk4DHkzOInVpU+AwYCdggeQsg54l3mz7oNQRi5qkLmwGHErNG8fLwOXE4uzfJmeRurQecWD1LsCCyVkGNQ9KpwIPJWcZaRY1SV2qfON4FbiSKGx3JmeRurQ2cBCwB7BobpQ3aR6UTgTuT84ykixqkoZhbereOGYDXyd20/0sN4rUqTWJN9u7A4slZxn0CnAVUdjuSs4yUixqkoZpFaKw7Qcsnpxl0BzgOmIX64+Ss0hdWgnYBzgQWCY5y6DmQelY4BfJWUaCRU3SZGhuHAcAyyZnaXM9ceP4bnYQqUMrEA9J+wPLJWcZNBv4JvFm+ye5UWqzqEmaTEsDexHr2JZPztLmemKX6DXZQaQOLUWsGz0SWDU5y6DmzfaJwA+Ts5RkUZOUYUlgV6KwrZ6cpc1PgVOAq4kbidQHSwC7Ufd355vtFhY1SZkWAXYGphMLoau5DTgD+CrwenIWqSsLA39L3d+db7bfwKImqYKFgB2JU9ffnZylzd3EAZ6XAq8lZ5G60vzujgE2SM7SxjfbWNQk1dIMgJ8JvDc3SqvfEAPgLwJeSs4idWUqsB1wPPCe5CxtbgXOZEzfbFvUJFU0hZgjOh34YHKWNo8Qhc1B1OqT5kHpWOD9yVna3EG82b6CMXqzbVGTVN004kn/k9lBWjiIWn21NbET88PZQVrcA5wLfIGYfNBrFjVJo2IacATxpq2aZ4HLgJOJt21SX1T+3d0HnAVcDLyYnGVoLGqSRs2WwFHA9sQn0kqeBy4hPs88kJxF6lJT2Lah3u/uUeBCorQ9k5ylcxY1SaNqU+AwYCdggeQsg5q5hscTO0alvtiC2J1d8UGpl0sRLGqSRt2GxBu2nYAFk7MMeoX4LHMc8GRyFqlLmxPHemxHbEKo5CngM8Rmn1eSs0yYRU1SX6wFHAzsDiyWnGXQU8QBnmfTgxuH9AbrEZMOdqHeg9JdRJn8WnaQibCoSeqbdwCHAnsAiydnGfQz4FM4hFr9sy7xZvtTxOSDSv5fokg+nB1kfljUJPXVisC+wAHAsslZ3uhlIteXsoNIQ7AKcBCwH7UelB4k1tX9IDvIvLKoSeq7pYin6SOBVZOzvNHFxM3MT6Hqo5WAfYADgWWSszReIT7TnpsdZF5Y1CSNiyWBTwOHUKewzSLOp+r9oZ0aWysQZW0/6hS2zxBTT0aCRU3SuFkY2AGYAbwrOQvAvxA758ZmJI7GUrU320cQ5x2WZ1GTNK4WBv4bceNYPznLV4CdgdnJOaRhWxLYk9jwk1nY5hBv2C9OzDBXLGqSxt0CwF8TO9Y2ScwxUp9jpAlaFNiNWDO2ZlKG2cB/Br6d9PfnikVNksIUYr3YMcCHEv7+bGLw/PcS/raUZSFgR+J3t0HC338Q2Ax4IuFvzxWLmiS92TRgJrDVJP/de4gRPb2bVyi9janEWs2ZwEaT/Le/AfyXSf6bc82iJklv7ePEk/6fTuLf/BIxXUEaR1OJ0nQM8dAyWXYC/p9J/HtzzaImSW9vMgdRz/6Pv3fbkP+OVN3WwInAhyfhb/2G+PRa7lxDi5okzb1NiMXPOzLcuYb/SGxwkBRLEY4g1pAO0x7AF4f8N+aZRU2S5t26xGiqPYFFhnD9OcCWwC1DuLY0qj5GHKezDcN5s30f8Vat1AHUFjVJmn9rE0/6u9H9G7avEue8SfpDHwSOI47W6NrfApcP4brzzaImSRO3EXA+8IkOr/kcMeD6hQ6vKfXJfwIuJN5wd+XbwJ91eL0Js6hJUjcWAE4m1rB15a+J9WqS2i1P7Nb8Tx1d7zVgdeCxjq43YRY1SerWCcQc0S6UPt9JKmJh4J+AP+/oensTb+pKsKhJUveuJg7vnKjngWWA1zu4ltRnSxObb9bu4FrXAH/RwXU6YVGTpO6tANxJfJaZqE2B2zu4jtR3WwP/2sF1HgTe0cF1OmFRk6ThOAY4qYPr/C3FdqFJhX2HmJk7UasDD3VwnQmzqEnScCxP/EO/8ASvcx6w/8TjSGNhe+BrHVzn/wKu7eA6E2ZRk6Th+TYT3412HcM/kV3qi8WAx4HFJ3idA4FzJx5n4ixqkjQ8xwEzJ3iNG4gT2SXNne8z8d/M8Uz8t9sJi5okDU8Xn2F+ThyoK2nuXAzsPsFrnEu8VUtnUZOk4fkksbh5Ih4GVusgizQuTiVGu03EPwA7d5BlwixqkjQ8WwGzJniNh4gdaJLmzmlMfELI5cSO63QWNUkanr9i4iOg/PQpzRs/fUqS5spMYkPBRFwPTJt4FGls3AB8ZILXOI4YB5fOoiZJw+PxHNLkWpwYqD7R4zkOAD438TgTZ1GTpOFYkVhftuAEr1PmE4w0Av4rcFUH19kG+GYH15kwi5okDcd04MQOrvMp4MsdXEcaB/8T+EQH11mN2HGdzqImSd1bEfgl3Qxl3wS4o4PrSH33p8D/6OA6DwBrdHCdTljUJKl7/wT83x1c53lgGeD1Dq4l9dmywC3AOzu41r/Qze+3ExY1SerWycBRHV3r68R0A0lvbWGiXP2fHV3v08BFHV1rwixqktSNBYmDNg/u8Jr/lYmPoJL6bAXgSmDrjq73KnHA9OMdXW/CLGqSNHEbAxcC/0eH13wWWAV4scNrSn3yZ8Tvbu0Or/kt4M87vN6EWdQkaf6tDRwJ7MrEj+EY9GVix6ekP/RB4kDa/zyEa5fbZW1Rk6R5ty5xIOaewCJDuP5sYEvg1iFcWxpV04hh69sAU4Zw/d8AGwCvDOHa882iJklzbxNi2PNOwAJD/DtXAjsO8frSKGkK2rAndOwGXDLkvzHPLGqS9Pa2AI4mdmAO40n+jV4HNiWGsUvjbGvi0OgPT8LfKvk2DSxqkvTHfBw4hjhIc7J8EdhjEv+eVMlU4L8Qv7stJvHv7kA3o6c6Z1GTpDebBswEtprkv3sPsDmx41MaJ1OB7YDjgfdM8t8ufV6hRU2SwhRiDcx0YlfZZJsN/Anw/yX8bSnLQsR6zGOIT4+T7QFgM+DJhL89VyxqksbdAsBfE9MENknMcTzxFk8aB4sSi/cPB9ZMyvA6cdRf4FwAABp9SURBVBbbrKS/P1csapLG1cLAfyPOQVs/OcvfA7sA/oOsvluSONbmUGDVxBxziKJ4aWKGuWJRkzRuFiYWDh8LrJecBeCfifUxr2UHkYZoKeJh5EhyC1rjMOCM7BBzw6ImaVwsSQxbPoQaNwqA/wH8BfBydhBpSFYADgT2A5ZJztI4gZhsMBIsapL6rnmSP4qYnVnFxcTNq9y5TVIHVgL2IUpalYL2MrAv8KXsIPPCoiapr1Yk/lE+AFg2OcsbvUTkKncCutSBNYn1Z7sDiyVneaMHiCUGN2YHmVcWNUl98w7iRrEHsHhylkG3AzsDN2UHkTq2LvHW+lPEOtBKrgV2BR7NDjI/LGqS+mIt4GCioC2anGXQU8TxG+fjpgH1y3rEERu7AAsmZxl0F/FvwrXZQSbCoiZp1G1IPMnvRL0bxSvEWrTjKHygpjQfNicOqd2OmCpQyVPAScB5wKvJWSbMoiZpVG1KbLHfiTi0tpJXiLmBxwN3J2eRurQFcDSx3mtKcpZBjxNvrc8Bnk7O0hmLmqRRsyXxBq3ijeI54gDN04AHk7NIXZoGHEGMWavmUeBC4CzgmeQsnbOoSRoVlW8UzwIXAKcDTyRnkbo0jfh0v3V2kBb3EeXsYuDF5CxDY1GTVN004hPiJ7ODtOjlpxaJKGYnAh/ODtLiHuBc4AuMwWHRFjVJFU0h3pzNAD6QnKXNI8DZxGLlF5KzSF2ZCmxDjFd7f3KWNncAnwWuYIx2T1vUJFUyldhFNhPYKDdKq3uJt2cXEQfXSn3Q/O6OB96TnKXNrcCZwFeB15OzTDqLmqQKFgJ2JLb7b5Ccpc3dxJP8pYzRk7x6r/rv7gfAKcQ5aGNbVixqkjItQpzUP50YPVPNbcAZjOmTvHqr+u/uemLn9DXZQSqwqEnKsCQx0uVwYPXkLG1+SjzJX80YP8mrd5YAdqPu7+56Yn3cd7ODVGJRkzSZlgb2Im4UyydnaeOTvPpoKWLE05HAqslZBs0BriN2mP4wOUtJFjVJk2ElYB/gAGDZ5CxtfJJXH60A7AfsDyyXnGXQbOCbxBltNyVnKc2iJmmYVgEOIm4WiydnGdQ8yZ8A/Cg5i9SllYG9gQOBZZKzDHoVuBI4GfhFcpaRYFGTNAxrEwVtD2DR3ChvMhv4OnEEyM9yo0ideidwCLA7sFhylkHN/NsTgbuSs4wUi5qkLq1HrD/bBVgwOcug5kZxEnBnchapS2tT98HoZeByoqDdn5xlJFnUJHVhM+BQYCdggeQsg5obxUnAb5OzSF2q/GD0HHHu4KnAQ8lZRppFTdJEfBQ4ihg7MyU5y6DmRnEa8GByFqlLmwKHUfPB6BngQuKA6CeTs/SCRU3S/JgGHEHM46zGG4X6agvgaGB76j0YPQ6cT4xYezo5S69Y1CTNi62JXZIfyQ7S4jHgArxRqH8qPxg9CpwFnAe8kJyllyxqkt7OVOLT5gzgA8lZ2jwCnI03CvXPNGJ38lbJOdr8hvjdXQy8mJyl1yxqkt7KVGA74HjgPclZ2txLvD27CHgpN4rUqa2JzS8fyg7S4h7gXOALxEYdDZlFTdKghYEdgGOADZKztLmbWH92KfBachapK82b6+OA9yVnaXMH8bu7An93k8qiJqmxCLAz8YlzjeQsbW4FzgS+CryenEXqSvU31/7uklnUJC0J7EosVl4tOUubG4izmK4lxj5JfVD9zbW/uyIsatL4WhrYizgwc/nkLG2uJ85AuyY7iNSh5s31dGDN5Cxt/N0VY1GTxs9KwD7UHNgMMAs4FvhBdhCpQ0sAuxEPRqsnZ2lzPfG7+252EP0hi5o0PpqBzbsBiydnGTQb+CaxTufHyVmkLi1FjHg6ClglOcugOcB1xBzOHyZn0VuwqEn9tw7x9qziwObZwNeJnW4/T84idWlFYF9gf2C55CyDmgej44CbkrPobVjUpP7amNggsCP1Bja/AlxFPMnflZxF6tLKwN7AQcQ60EpeBa4ETgZ+kZxFc8miJvXP5sQnzooDm18GLicK2v3JWaQuNUsLdgcWS84yqHkwOgH4VXIWzSOLmtQfHwOOJA7NrDaw+TnigNpTgYeSs0hdqry0wAejHrCoSaOv8sDmZ4ALiRPNn0zOInVpI+LBqOLSAh+MesSiJo2urYkn5Q9nB2nxGHABMbT5d8lZpC5tChxGzaUFPhj1kEVNGi3NPMBjgfcnZ2lzH3AW8EXgheQsUpe2JI7Y2J56SwseB84HzgGeTs6ijlnUpNFQfR7gPcC5wEXAS8lZpC5VXlrwKPFgdB4+GPWWRU2qrZkHOB1YPzlLmzuIzyxXAK8lZ5G6NA2YCWyVnKPNb4hlBRcDLyZn0ZBZ1KSamnEzhwJrJGdpcwvxJP9V4PXkLFJXphBvzo4BPpScpc2vgc8BXyB2dGoMWNSkWppxM0cAqyVnadMMbL6WGD8j9UGz9vM44H3JWdr45nqMWdSkGlYA9qPmuBn4fUG7JjuI1KHqaz99cy2LmpSsGTdzILBMcpY2s4AZwI3ZQaQOVV/7eQNxBppvrmVRk5JUHjfTDGw+HvhxchapS4sAOxMFbc3kLG18c603sahJk6sZN7MncdOoxIHN6qslgV2Bw4HVk7O0uZ54c/0/s4OoHouaNDk2IW4SFcfNNAObTwTuSs4idWkpYmnB4cDyyVkGzQGuIwal/yg5iwqzqEnDtTnxifNviIXLlTwPXAKcjgOb1S8rAvsCBwDLJmcZ1CwtOA64KTmLRoBFTRqO5jTzbag3buZZ4DLgFODh5CxSl5rNOQcBSydnGdQsLfgM8MvkLBohFjWpW5XHzTwBfJ4Y9fRUchapS5U35zRLC04AfpWcRSPIoiZNXPXTzB8FLiRGzvwuOYvUpcqbc1xaoE5Y1KT5V/008/uIwzKdB6i+2Qg4kpqbc54DLiXOQXsoOYt6wKImzbuFiBvEUcCGyVna3EN83nQeoPpmM2L+7U7AAslZBj1DvLn+LPBkchb1iEVNmnvNaeYzgHclZ2lzO/GZxXmA6pstiQej7am3Oecx4ALgHODp5CzqIYua9PaWAHYDDgPekZylTTMP8CvE1n+pLypvznmEWPd5HvBCchb1mEVNemvLEIPSDyDOZarmfxFb/b+dHUTq2J8Rm3OmZQdpcQ/xefMyXFqgSWBRk96sOSxzf2C55CxtrgdmEgPTpb6ovnv618QczsuIM9GkSWFRk36v8mGZzbiZk4B/T84idan67mnXfiqVRU2CtYCDqXlYZjNuZibwk9woUqemAtsRB8FW3D3t2k+VYFHTOFuXWH9W8bDMZtzMycAvkrNIXWp2T08H1k/O0uYG4gy0a4k32VIqi5rG0SbA4dQ8i8lxM+qrRYCdieNt1kjO0uZ6Yg3aNdlBpDeyqGmcbAEcTc2zmJpxM58FHkjOInVpSWBX4uFo9eQsbWYBxwI/yA4itbGoaRx8nNhJ9qfZQVo8ze8HpT+enEXq0rLEzukDgOWTswyaDfwTsTnnp8lZpD/KoqY+m0Yswt8qOUebx4HziYL2VHIWqUvN8TYHEGWtkmZzzrFY0DQiLGrqm+YspunAB5OztHmUmAd4FjEbUOqLysfbNJtzPgP8MjmLNE8sauqL5iymmcB7c6O0+g0xbuZi4MXkLFKX3gkcQs3jbdyco5FnUdOoWwjYkdgk8O7kLG08zVx9tQ5wIDWPt3FzjnrDoqZR1ZzFdCywXnKWNrcBZwBfBV5PziJ1aWNiUPqOwILJWQY9B1xKnIP2UHIWqRMWNY2aJYDdgMOAdyRnaXMzcUjt1XhYpvplM+BQap4/+Ayx9vOzwJPJWaROWdQ0KpYCdgGOAlZJztLGwzLVV1sSv7uK5w8+BlxArP/8XXIWaSgsaqpuJWIX2T7U20kG8C1iJ9n3s4NIHfsEsXu64vE29xOD0r8EvJCcRRoqi5qqWoUoaPsBiydnGTQHuA44Efhhchapa9OA44FPZgdpcS9wDnAR8FJuFGlyWNRUzVrAwcAewKLJWQY1h2UeB9yUnEXqUvXzB5vd05cCryVnkSaVRU1VrEfMAtyFejvJPCxTfdWcP3gc8L7kLG1uJz5xuntaY8uipmybEjs4K+4kaw7LPB64OzmL1KWpwHbEQbAbJmdpcwvxYOTuaY09i5qyVN5J1pzFdBrwYHIWqUvN+YPTgfWTs7Rpdk9fiwVNAixqmnzTiMMyt80O0uJZYqv/6cATyVmkLi0C7AzMANZIztLG422kt2BR02SpvJPsceB8YjfZ08lZpC4tCexKPBytlpylzSyiPN6YHUSqyqKmYWp2ks0APpCcpc0jxEGZ5+FZTOqXpYC9iQ06yydnGdTsnj4B+FFyFqk8i5qGoVmoPBPYKDdKq3vxLCb104rAvsABwLLJWQbNBr5O/Lvws9wo0uiwqKlLCxGDmo8BNkjO0uZuYhagZzGpb1Ymzh+seEC0x9tIE2BRUxeahcrTgTWTs7S5DTgDz2JS/7wTOATYHVgsOcsgj7eROmBR00Q0C5UPB1ZPztLmp8ApeBaT+mcd4EBgT+JBqZLngUuIt9cPJGeRRp5FTfNjaWAvai5UBrf6q782JnZw7ki9CR7PApcRD0cPJ2eResOipnmxErAPNRcqQxS0Y4HvZgeROrYZcCg1J3g8AXweOBd4KjmL1DsWNc2NVYCDqLlQ2a3+6rOPEhM8tqHeBI/HiAOizwZ+l5xF6i2Lmv6YtYmCtgewaG6UN3Grv/qs8gQPzx+UJpFFTW3WI9af7UK9dTDNTrKTgDuTs0hdqzzB4148f1CadBY1vVHldTAvA5cTBe23yVmkLjUTPKYDH0zO0ubXxOYczx+UEljUBLXXwTxH3CBOAx5MziJ1aSrxm5sJvDc3SqvbgdPx/EEplUVtvFVeB/MMcCFxFtOTyVmkLjUTPI4CNkzO0uZm4GQ8f1AqwaI2nrYmdkl+JDtIi2Yn2TnA08lZpC4tDOxAfOJcPzlLm+b8wWuxoEllWNTGR/OZZQbwgeQsbdxJpr5qRqzNANZIztLGA6Klwixq/TcV2I7YSfae5Cxt7sWdZOqnZsTaEcBqyVnazCLK443ZQSS9NYtafzWfWY4BNkjO0uZuYv2ZO8nUN5VHrDUHRB8P/Dg5i6S5YFHrn+qfWW4FzsSdZOqfFYF9qTlirTkg+jjg58lZJM0Di1p/VP/McgNwKi5UVv+sDBxMzRFrrwJX4gHR0siyqI2+yp9ZwIXK6q+1iIK2O7BYcpZBzQSP44llBpJGlEVtdK0E7AMcCCyTnKXNLOBY4AfZQaSOrUP87vYklhpU8jxwCbH+84HkLJI6YFEbPe8EDgF2o95nFhcqq882JpYW7Ei9GbjPApcBpwAPJ2eR1CGL2uhonuL3ABZNzjLIhcrqs8ozcJ8APg+cCzyVnEXSEFjU6qv8FN+sgzkRuCs5i9S1yjNwmwkeZwO/S84iaYgsanVtTnzirPgU/zJwOVHQ7k/OInWt8gzc3xLH23wRJ3hIY8GiVs/HgCOp+RT/HHFA7anAQ8lZpK5NI9ZXfjI7SIt7cYKHNJYsanVUfopv1sF8DngyOYvUpSnEb2468MHkLG2c4CGNOYtavq2JT4gfzg7SwnUw6qupxFvrmcB7c6O0ug04Ayd4SGPPopajuUkcC7w/OUub+4CzgIuBF5OzSF1aiNiYczTw7uQsbW4GTgauxgkekrCoTbapwHbEOpj3JGdpcw+xzd91MOqbhYEdiBm470rO0sYJHpJaWdQmR3OTmA6sn5ylzR3EOpgrcB2M+mURYGeioK2RnKXN9cTn11nJOSQVZVEbriWICQKHUvMmcQvxidN1MOqbJYFdiQ06qyVnaTOLKI83ZgeRVJtFbTiWAnah7k2i+cxyLa6DUb8sDewFHA4sn5xlkCPWJM0zi1q3VgD2A/YHlkvO0sZ1MOqrFYF9gQOAZZOzDHLEmqT5ZlHrxsrA3sQszmWSs7TxM4v6ahXgIOIBafHkLINeBa4ETgLuTM4iaURZ1CbmncSYp92BxZKzDGo+s8wEfpIbRercWsDB1PztNSPWTiJGPknSfLOozZ91iLdnexK7yippnuJPBn6RnEXq2rrE2s+/I85Eq+R54BJiecGDyVkk9YRFbd5sQixS3hFYMDnLoFeAq4gpB3clZ5G6Vvm39yxwGXAK8HByFkk9Y1GbO5sTnzj/hji0tpLmKf504P7kLFLXKv/2mhm45wJPJWeR1FMWtT+uGZS+DTG8uRKf4tVnHwWOouZv71HgQpyBK2kSWNTaNQVt2+wgLXyKV59V/u05A1fSpLOo/d4U4uZwDPCh5CxtfIpXn20NnAB8JDtIi3uBc3AGrqQEFrVY97INcRjl+5KztPEpXn3VPBzNAD6QnKXN3cQM3EtxBq6kJONc1BYidpAdBWyYnKXNr4HPAV8gzmWS+qJ5OJoJvDc3SqvbgDNwBq6kAsaxqC0M7EA8xb8rOUub24kdnFfgU7z6pXk4Ohp4d3KWNjcT5w9ejTNwJRUxTkVtCWA34DDgHclZ2txMrD/7CjFVQOqL6g9HzsCVVNY4FLWlgF2AI4FVk7O0aW4S1+JTvPql+sPR9cTa1O9kB5Gkt9LnorYisC+wP7BccpY21xNrdGYl55C6tiSwK3HMxmrJWdrMAqYD/54dRJLeTh+L2srA3sBBwNLJWQbNAa4jhjV7k1DfLA3sRYx6Wj45y6DZwDeJh6Of5EaRpLnXp6K2FnAwsDuwWHKWQd4k1GcrAfsABwLLJGcZNBv4OvGJ8+fJWSRpnvWhqK0LHADsCSySnGXQq8CVxE6yXyRnkbq2CvHmej9g8eQsg14BriLeXt+ZnEWS5tsoF7VNiE8sOwELJGcZ1NwkTgB+lZxF6lrz9noPYNHkLINeBi4nCtpvk7NI0oSNYlHbgjiHaXvqDWt+HriEOM38geQsUtfWJTYI/B1xJlolzW/vNODB5CyS1JlRKmqVhzU/C1wGnAI8nJxF6lrlt9fNb+9k4JHkLJLUuVEoatOIRfhbJedo8zhwPnAu8FRyFqlrmwOHAH9DjH2qxN+epLFQuah9kviM8f7sIC0eJGYBXkx8cpH6ZFPit/fn2UFaPET89i7C356kMVCxqE0h1ngdQr01aPcSN7DLcFC6+unTwDnU20F9H/HvwiXAS8lZJGnSVCxqnyO2+1fyS2L92RXEkRtSH30auDA7xIBfAacCXyZ2U0vSWKlW1P4S+EZ2iDe4lVik/DUclK5+2wS4iTq7OX9G/PauBF5PziJJaSoVtSnEm6v1s4MQ450+g4PSNT7+GfiL7BDAzcQZaN/AhyNJKlXUPg78W3KG7xEF7V+Tc0iTaVXgfnKP3riR+O1dhw9HkvS/VSpqxxHHcGT4FnGT+H7S35cy/RXwj0l/+3vEG7RZSX9fkkqrVNQuA/52Ev/eHOLp/UTgh5P4d6VqDid2M0+m64mHs+9M8t+VpJFSqahdDnxqEv7O68QczpOBOybh70nVHUnsah62OcC/EG+vfzQJf0+SRl6lonYKccMYlleILf6n4qB06Y3+O/APQ7z+bGLn9MnETmpJ0lyqVNS2Ba4ZwnVfJA7JPJ04NFPSH1qP4Ty8vEacPXgysaNbkjSPKhW1hYkitUpH13uOOLzzLByULr2d7wMf6+harwB/T7y9vqeja0rSWKpU1AD2JgYtT8RTwHnEhIMnJpxIGg9/Anx3gtd4Efgi8fb6/gknkiSVK2pTiYM3t52P/+2jwNnABcAzXYaSxsTpwKHz8b97lt+/vX6k00SSNOaqFTWAxYldmXNb1h4gbjBfBF4YVihpDEwlHnb2n8v//mnizfW5wJPDCiVJ46xiUYMYJ7UXMIM4Nb3NncCZxLEeL09SLmkc/CWxvuzdb/H/f5goaOfj22tJGqqqRa2xCLAVMA1YmzgD7S5i1NT3cRagNCxTid/dJ4j5uwsA9xK/u+/gw5EkTYrqRU2SJGlsWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUVZ1CRJkoqyqEmSJBVlUZMkSSrKoiZJklSURU2SJKkoi5okSVJRFjVJkqSiLGqSJElFWdQkSZKKsqhJkiQVZVGTJEkqyqImSZJUlEVNkiSpKIuaJElSURY1SZKkoixqkiRJRVnUJEmSirKoSZIkFWVRkyRJKsqiJkmSVJRFTZIkqSiLmiRJUlEWNUmSpKIsapIkSUX9/4oEDyzb6CGXAAAAAElFTkSuQmCC",
-    "/data/translations.csv": "a2V5LGtvLGVuLGphDQphcHBfdGl0bGUsQ3JvcXVpcyxDcm9xdWlzLOOCr+ODreODg+OCreODvA0KaGVhdG1hcF90aXRsZSztgazroZztgqQg7Z6I7Yq466e1LENyb3F1aXMgSGVhdG1hcCzjgq/jg63jg4Pjgq3jg7zjg5Ljg7zjg4jjg57jg4Pjg5cNCmNyb3F1aXNfY291bnQs7YGs66Gc7YKkIO2an+yImCxDcm9xdWlzIENvdW50LOOCr+ODreODg+OCreODvOWbnuaVsA0KY3JvcXVpc190aW1lcyztmowsdGltZXMs5ZueDQpsZXNzLExlc3MsTGVzcyzlsJHjgarjgYQNCm1vcmUsTW9yZSxNb3JlLOWkmuOBhA0KYmFzaWNfc2V0dGluZ3Ms6riw67O4IOyEpOyglSxCYXNpYyBTZXR0aW5ncyzln7rmnKzoqK3lrpoNCmNyb3F1aXNfZGVjayztgazroZztgqQg642xOixDcm9xdWlzIERlY2s6LOOCr+ODreODg+OCreODvOODh+ODg+OCrToNCmNyb3F1aXNfZGVja19maWxlLO2BrOuhnO2CpCDrjbEg7YyM7J28LENyb3F1aXMgRGVjayBGaWxlLOOCr+ODreODg+OCreODvOODh+ODg+OCreODleOCoeOCpOODqw0Kc2VsZWN0X2RlY2tfZmlsZSztgazroZztgqQg642xIO2MjOydvCDshKDtg50sU2VsZWN0IENyb3F1aXMgRGVjayBGaWxlLOOCr+ODreODg+OCreODvOODh+ODg+OCreODleOCoeOCpOODq+OCkumBuOaKng0KaW1hZ2VzX2NvdW50LOydtOuvuOyngCxpbWFnZXMs55S75YOPDQpzZWxlY3RfZGVjayzrjbEg7ISg7YOdLFNlbGVjdCBEZWNrLOODh+ODg+OCreOCkumBuOaKng0KZGVja19ub3Rfc2VsZWN0ZWQs642x7J20IOyEoO2DneuQmOyngCDslYrslZjsirXri4jri6QuLERlY2sgbm90IHNlbGVjdGVkLizjg4fjg4Pjgq3jgYzpgbjmip7jgZXjgozjgabjgYTjgb7jgZvjgpPjgIINCmltYWdlX3NldHRpbmdzLOydtOuvuOyngCDshKTsoJUsSW1hZ2UgU2V0dGluZ3Ms55S75YOP6Kit5a6aDQppbWFnZV93aWR0aCzsnbTrr7jsp4Ag7LC9IOuEiOu5hDosSW1hZ2UgV2luZG93IFdpZHRoOiznlLvlg4/jgqbjgqPjg7Pjg4njgqbluYU6DQppbWFnZV9oZWlnaHQs7J2066+47KeAIOywvSDrhpLsnbQ6LEltYWdlIFdpbmRvdyBIZWlnaHQ6LOeUu+WDj+OCpuOCo+ODs+ODieOCpumrmOOBlToNCnJhbmRvbV9vcmRlcizrnpzrjaQg7Iic7IScLFJhbmRvbSBPcmRlcizjg6njg7Pjg4Djg6DpoIbluo8NCmdyYXlzY2FsZSztnZHrsLEg7ZGc7IucLEdyYXlzY2FsZSzjgrDjg6zjg7zjgrnjgrHjg7zjg6sNCmZsaXBfaG9yaXpvbnRhbCzsoozsmrAg67CY7KCELEZsaXAgSG9yaXpvbnRhbCzlt6blj7Plj43ou6INCnRpbWVyX3NldHRpbmdzLO2DgOydtOuouCDshKTsoJUsVGltZXIgU2V0dGluZ3Ms44K/44Kk44Oe44O87ISk7KCVDQp0aW1lcl9wb3NpdGlvbiztg4DsnbTrqLgg7JyE7LmYOixUaW1lciBQb3NpdGlvbjos44K/44Kk44Oe44O85L2N572uOg0KdGltZXJfZm9udF9zaXplLO2DgOydtOuouCDtj7Dtirgg7YGs6riwOixUaW1lciBGb250IFNpemU6LOOCv+OCpOODnuODvOODleOCqeODs+ODiOOCteOCpOOCujoNCnRpbWVfc2V0dGluZyzsi5zqsIQg7ISk7KCVICjstIgpOixUaW1lIFNldHRpbmcgKHNlYyk6LOaZgumWk+ioreWumu+8iOenku+8iToNCnRvZGF5X2Nyb3F1aXNfY291bnRfcG9zaXRpb24s7Jik64qY7J6QIO2BrOuhnO2CpCDsiJgg7JyE7LmYOixUb2RheSdzIENvdW50IFBvc2l0aW9uOizku4rml6Xjga7lrozkuobmlbDkvY3nva46DQp0b2RheV9jcm9xdWlzX2NvdW50X2ZvbnRfc2l6ZSzsmKTripjsnpAg7YGs66Gc7YKkIOyImCDtj7Dtirgg7YGs6riwOixUb2RheSdzIENvdW50IEZvbnQgU2l6ZTos5LuK5pel44Gu5a6M5LqG5pWw44OV44Kp44Oz44OI44K144Kk44K6Og0KZm9udF9sYXJnZV8yMCztgazqsowsTGFyZ2Us5aSnDQpmb250X21lZGl1bV8xNSzrs7TthrUsTWVkaXVtLOS4rQ0KZm9udF9zbWFsbF8xMCzsnpHqsowsU21hbGws5bCPDQpvdGhlcl9zZXR0aW5ncyzquLDtg4Ag7ISk7KCVLE90aGVyIFNldHRpbmdzLOOBneOBruS7luOBruioreWumg0KbGFuZ3VhZ2Us7Ja47Ja0OixMYW5ndWFnZTos6KiA6KqeOg0KZGFya19tb2RlLOuLpO2BrCDrqqjrk5wsRGFyayBNb2RlLOODgOODvOOCr+ODouODvOODiQ0Kc3RhcnRfY3JvcXVpcyztgazroZztgqQg7Iuc7J6RLFN0YXJ0IENyb3F1aXMs44Kv44Ot44OD44Kt44O86ZaL5aeLDQplZGl0X2RlY2ss7YGs66Gc7YKkIOuNsSDtjrjsp5EsRWRpdCBDcm9xdWlzIERlY2ss44Kv44Ot44OD44Kt44O844OH44OD44Kt57eo6ZuGDQpjcm9xdWlzX2hpc3Rvcnks7YGs66Gc7YKkIO2eiOyKpO2GoOumrCxDcm9xdWlzIEhpc3Rvcnks44Kv44Ot44OD44Kt44O85bGl5q20DQpmaWx0ZXJfYnlfZGF0ZSzrgqDsp5wg7ZWE7YSwOixGaWx0ZXIgYnkgRGF0ZTos5pel5LuY44OV44Kj44Or44K/44O8Og0KY3JvcXVpc19sYXJnZV92aWV3LO2BrOuhnO2CpCDsg4HshLgg67O06riwLENyb3F1aXMgTGFyZ2UgVmlldyzjgq/jg63jg4Pjgq3jg7zoqbPntLDjg5Pjg6Xjg7wNCm9yaWdpbmFsX2ltYWdlLOybkOuzuCxPcmlnaW5hbCzjgqrjg6rjgrjjg4rjg6sNCmNyb3F1aXNfaW1hZ2Us7YGs66Gc7YKkLENyb3F1aXMs44Kv44Ot44OD44Kt44O8DQphbGws7KCE7LK0LEFsbCzlhajjgaYNCmNyb3F1aXNfYWxhcm0s7YGs66Gc7YKkIOyVjOuejCxDcm9xdWlzIEFsYXJtLOOCr+ODreODg+OCreODvOOCouODqeODvOODoA0KYWxhcm1fbGlzdF9sYWJlbCzshKTsoJXrkJwg7JWM656MIOuqqeuhnTosQ29uZmlndXJlZCBBbGFybSBMaXN0OizoqK3lrprjgZXjgozjgZ/jgqLjg6njg7zjg6DkuIDopqc6DQphZGRfYWxhcm0s7JWM656MIOy2lOqwgCxBZGQgQWxhcm0s44Ki44Op44O844Og6L+95YqgDQplZGl0X2FsYXJtLOyVjOuejCDsiJjsoJUsRWRpdCBBbGFybSzjgqLjg6njg7zjg6Dnt6jpm4YNCmRlbGV0ZV9hbGFybSzslYzrnowg7IKt7KCcLERlbGV0ZSBBbGFybSzjgqLjg6njg7zjg6DliYrpmaQNCmFsYXJtX3RpdGxlLOyVjOuejCDsoJzrqqksQWxhcm0gVGl0bGUs44Ki44Op44O844Og44K/44Kk44OI44OrDQphbGFybV9tZXNzYWdlLOyVjOuejCDrqZTsi5zsp4AsQWxhcm0gTWVzc2FnZSzjgqLjg6njg7zjg6Djg6Hjg4Pjgrvjg7zjgrgNCmFsYXJtX3RpbWUs7JWM656MIOyLnOqwhCxBbGFybSBUaW1lLOOCouODqeODvOODoOaZgumWkw0Kd2Vla2RheV9yZXBlYXQs7JqU7J28IOuwmOuztSxXZWVrZGF5IFJlcGVhdCzmm5zml6XnubDjgorov5TjgZcNCnNwZWNpZmljX2RhdGUs7Yq57KCVIOuCoOynnCxTcGVjaWZpYyBEYXRlLOeJueWumuOBruaXpeS7mA0Kd2Vla2RheV9yZXBlYXRfc2VsZWN0LOuwmOuztSDsmpTsnbwg7ISg7YOdLFNlbGVjdCBSZXBlYXQgV2Vla2RheXMs57mw44KK6L+U44GZ5puc5pel44KS6YG45oqeDQpzcGVjaWZpY19kYXRlX3NlbGVjdCzrgqDsp5wg7ISg7YOdLFNlbGVjdCBTcGVjaWZpYyBEYXRlLOeJueWumuOBruaXpeS7mOOCkumBuOaKng0KbW9uLOyblCxNb24s5pyIDQp0dWUs7ZmULFR1ZSzngasNCndlZCzsiJgsV2VkLOawtA0KdGh1LOuqqSxUaHUs5pyoDQpmcmks6riILEZyaSzph5ENCnNhdCzthqAsU2F0LOWcnw0Kc3VuLOydvCxTdW4s5pelDQpsYXJnZSztgazqsowsTGFyZ2Us5aSnDQptZWRpdW0s67O07Ya1LE1lZGl1bSzkuK0NCnNtYWxsLOyekeqyjCxTbWFsbCzlsI8NCmJvdHRvbV9yaWdodCzsmKTrpbjsqr0g7JWE656YLGJvdHRvbV9yaWdodCzlj7PkuIsNCmJvdHRvbV9jZW50ZXIs7JWE656YIOqwgOyatOuNsCxib3R0b21fY2VudGVyLOS4reWkruS4iw0KYm90dG9tX2xlZnQs7Jm87Kq9IOyVhOuemCxib3R0b21fbGVmdCzlt6bkuIsNCnRvcF9yaWdodCzsmKTrpbjsqr0g7JyELHRvcF9yaWdodCzlj7PkuIoNCnRvcF9jZW50ZXIs6rCA7Jq0642wIOychCx0b3BfY2VudGVyLOS4reWkruS4ig0KdG9wX2xlZnQs7Jm87Kq9IOychCx0b3BfbGVmdCzlt6bkuIoNCmZpbGUs7YyM7J28LEZpbGUs44OV44Kh44Kk44OrDQpuZXcs7IOI66GcIOunjOuTpOq4sCxOZXcs5paw6KaPDQpvcGVuLOu2iOufrOyYpOq4sCxPcGVuLOmWi+OBjw0Kb3Blbl9yZWNlbnQs7LWc6re8IO2MjOydvCxPcGVuIFJlY2VudCzmnIDov5HplovjgYTjgZ/jg5XjgqHjgqTjg6sNCm9wZW5fcmVjZW50X2NsZWFyLOy1nOq3vCDtjIzsnbwg66qp66GdIOyngOyasOq4sCxDbGVhciBSZWNlbnQgRmlsZXMs5pyA6L+R6ZaL44GE44Gf44OV44Kh44Kk44Or44KS44Kv44Oq44KiDQpvcGVuX3JlY2VudF9lbXB0eSzstZzqt7wg7YyM7J28IOyXhuydjCxObyBSZWNlbnQgRmlsZXMs5pyA6L+R6ZaL44GE44Gf44OV44Kh44Kk44Or44GM44GC44KK44G+44Gb44KTDQpzYXZlLOyggOyepSxTYXZlLOS/neWtmA0Kc2F2ZV9hcyzri6Trpbgg7J2066aE7Jy866GcIOyggOyepSxTYXZlIEFzLOWQjeWJjeOCkuS7mOOBkeOBpuS/neWtmA0KaW1wb3J0X2ltYWdlcyzsnbTrr7jsp4Ag67aI65+s7Jik6riwLEltcG9ydCBJbWFnZXMs55S75YOP44KS44Kk44Oz44Od44O844OIDQpkZWNrX2ltYWdlcyzrjbEg7J2066+47KeALERlY2sgSW1hZ2VzLOODh+ODg+OCreeUu+WDjw0KaW1hZ2VfaW5mbyzsnbTrr7jsp4Ag7KCV67O0LEltYWdlIEluZm8s55S75YOP5oOF5aCxDQpzYXZlX2Nyb3F1aXMs7YGs66Gc7YKkIOyggOyepSxTYXZlIENyb3F1aXMs44Kv44Ot44OD44Kt44O844KS5L+d5a2YDQpzYXZlX3F1ZXN0aW9uLOydtCDtgazroZztgqTrpbwg7KCA7J6l7ZWY7Iuc6rKg7Iq164uI6rmMPyxEbyB5b3Ugd2FudCB0byBzYXZlIHRoaXMgY3JvcXVpcz8s44GT44Gu44Kv44Ot44OD44Kt44O844KS5L+d5a2Y44GX44G+44GZ44GL77yfDQp5ZXMs7JiILFllcyzjga/jgYQNCm5vLOyVhOuLiOyYpCxObyzjgYTjgYTjgYgNCnByZXZpb3VzLOydtOyghCxQcmV2aW91cyzliY3jgbgNCm5leHQs64uk7J2MLE5leHQs5qyh44G4DQpwYXVzZSzsoJXsp4AsUGF1c2Us5LiA5pmC5YGc5q2iDQpwbGF5LOyerOyDnSxQbGF5LOWGjeeUnw0Kc3RvcCzsooXro4wsU3RvcCzntYLkuoYNCmtvcmVhbiztlZzqta3slrQs7ZWc6rWt7Ja0LO2VnOWbveiqng0KZW5nbGlzaCxFbmdsaXNoLEVuZ2xpc2gsRW5nbGlzaA0KYWRkX21lbW8s66mU66qo7ZWY6riwLEFkZCBNZW1vLOODoeODouOBmeOCiw0KbWVtbyzrqZTrqqgsTWVtbyzjg6Hjg6INCm1lbW9fcGxhY2Vob2xkZXIs7Jes6riw7JeQIOuplOuqqOulvCDsnoXroKXtlZjshLjsmpQuLi4sRW50ZXIgbWVtbyBoZXJlLi4uLOOBk+OBk+OBq+ODoeODouOCkuWFpeWKm+OBl+OBpuOBj+OBoOOBleOBhC4uLg0KbWVtb19zYXZlX2ZhaWxlZCzrqZTrqqgg7KCA7J6lIOykkSDsmKTrpZjqsIAg67Cc7IOd7ZaI7Iq164uI64ukOlxue30sRmFpbGVkIHRvIHNhdmUgbWVtbzpcbnt9LOODoeODouS/neWtmOS4reOBq+OCqOODqeODvOOBjOeZuueUn+OBl+OBvuOBl+OBnzpcbnt9DQpjbG9zZSzri6vquLAsQ2xvc2Us6ZaJ44GY44KLDQpyZW5hbWVfdGl0bGUs7J2066aEIOuwlOq+uOq4sCxSZW5hbWUs5ZCN5YmN44KS5aSJ5pu0DQpjdXJyZW50X2xhYmVsLDxiPu2YhOyerDo8L2I+LDxiPkN1cnJlbnQ6PC9iPiw8Yj7nj77lnKg6PC9iPg0KbmV3X25hbWVfbGFiZWwsPGI+7IOIIOydtOumhDo8L2I+LDxiPk5ldyBuYW1lOjwvYj4sPGI+5paw44GX44GE5ZCN5YmNOjwvYj4NCm5hbWVfcGxhY2Vob2xkZXIs7ZmV7J6l7J6QIOygnOyZuCxFeGNsdWRlIGV4dGVuc2lvbizmi6HlvLXlrZDjgpLpmaTjgY8NCmludmFsaWRfY2hhcnMsIuKdjCDsgqzsmqkg67aI6rCAOiBcIC8gOiAqID8gIiIgPCA+IHwgLiIsIuKdjCBOb3QgYWxsb3dlZDogXCAvIDogKiA/ICIiIDwgPiB8IC4iLCLinYwg5L2/55So5LiN5Y+vOiBcIC8gOiAqID8gIiIgPCA+IHwgLiINCnRhZ190aXRsZSztg5zqt7gg7ISk7KCVLFNldCBUYWdzLOOCv+OCsOioreWumg0KdGFnX2luZm8s8J+Pt++4jyAnIyfroZwg6rWs67aE7ZWY7JesIO2DnOq3uOulvCDsnoXroKXtlZjshLjsmpQgKOqwgSDtg5zqt7gg7LWc64yAIDI07J6QKSzwn4+377iPIFVzZSAnIycgdG8gc2VwYXJhdGUgdGFncyAobWF4IDI0IGNoYXJzIGVhY2gpLPCfj7fvuI8gJyMn44Gn5Yy65YiH44Gj44Gm5YWl5Yqb44GX44Gm44GP44Gg44GV44GE77yI5ZCE44K/44Kw5pyA5aSnMjTmloflrZfvvIkNCnRhZ19sb2FkaW5nLO2DnOq3uOulvCDrtojrn6zsmKTripQg7KSRLi4uLExvYWRpbmcgdGFncy4uLizjgr/jgrDjgpLoqq3jgb/ovrzjgb/kuK0uLi4NCnRhZ19leGFtcGxlLOyYiCkgI+yXrOyEsSPsoITsi6Aj7Jet64+Z7KCBLGUuZy4pICNmZW1hbGUjZnVsbGJvZHkjZHluYW1pYyzkvospICPlpbPmgKcj5YWo6LqrI+ODgOOCpOODiuODn+ODg+OCrw0KdGFnX3BsYWNlaG9sZGVyLCPtg5zqt7gxI+2DnOq3uDIj7YOc6re4MywjdGFnMSN0YWcyI3RhZzMsI+OCv+OCsDEj44K/44KwMiPjgr/jgrAzDQpwcm9wZXJ0aWVzX3RpdGxlLOyGjeyEsSxQcm9wZXJ0aWVzLOODl+ODreODkeODhuOCow0KcHJvcGVydGllc19oZWFkaW5nLPCfk4sg7J2066+47KeAIOyGjeyEsSzwn5OLIEltYWdlIFByb3BlcnRpZXMs8J+TiyDnlLvlg4/jga7jg5fjg63jg5Hjg4bjgqMNCnByb3BfZmlsZW5hbWUs8J+ThCDtjIzsnbwg7J2066aELPCfk4QgRmlsZSBOYW1lLPCfk4Qg44OV44Kh44Kk44Or5ZCNDQpwcm9wX3NpemUs8J+SviDsmqnrn4ks8J+SviBTaXplLPCfkr4g44K144Kk44K6DQpwcm9wX2RpbWVuc2lvbnMs8J+TkCDtgazquLAs8J+TkCBEaW1lbnNpb25zLPCfk5Ag6Kej5YOP5bqmDQpwcm9wX2RpZmZpY3VsdHks4q2QIOuCnOydtOuPhCzirZAgRGlmZmljdWx0eSzirZAg6Zuj5piT5bqmDQpwcm9wX3RhZ3Ms8J+Pt++4jyDtg5zqt7gs8J+Pt++4jyBUYWdzLPCfj7fvuI8g44K/44KwDQpwcm9wX3NvdXJjZV9wYXRoLPCfk40g7JuQ67O4IOqyveuhnCzwn5ONIFNvdXJjZSBQYXRoLPCfk40g5YWD44Gu44OR44K5DQpub25lLOyXhuydjCxOb25lLOOBquOBlw0Kdmlldyzrs7TquLAsVmlldyzooajnpLoNCnNvcnQs7KCV66CsLFNvcnQs5Lim44Gz5pu/44GIDQpzb3J0X25hbWUs7J2066aEIOyInOycvOuhnCDsoJXroKwsU29ydCBieSBOYW1lLOWQjeWJjeOBp+S4puOBs+abv+OBiA0Kc29ydF9zaXplLO2BrOq4sCDsiJzsnLzroZwg7KCV66CsLFNvcnQgYnkgU2l6ZSzjgrXjgqTjgrrjgafkuKbjgbPmm7/jgYgNCnNvcnRfZGlmZmljdWx0eSzrgpzsnbTrj4Qg7Iic7Jy866GcIOygleugrCxTb3J0IGJ5IERpZmZpY3VsdHks6Zuj5piT5bqm44Gn5Lim44Gz5pu/44GIDQpzb3J0X2RhdGUs64Kg7KecIOyInOycvOuhnCDsoJXroKwsU29ydCBieSBEYXRlLOaXpeS7mOOBp+S4puOBs+abv+OBiA0Kc29ydF9hc2Ms7Jik66aE7LCo7IicLEFzY2VuZGluZyzmmIfpoIYNCnNvcnRfZGVzYyzrgrTrprzssKjsiJwsRGVzY2VuZGluZyzpmY3poIYNCmljb25fc2l6ZSzslYTsnbTsvZgg7YGs6riwLEljb24gU2l6ZSzjgqLjgqTjgrPjg7PjgrXjgqTjgroNCmN1c3RvbSzsgqzsmqnsnpAg7KCV7J2YLEN1c3RvbSzjgqvjgrnjgr/jg6ANCmN1c3RvbV9zaXplX3RpdGxlLOyCrOyaqeyekCDsoJXsnZgg7YGs6riwLEN1c3RvbSBTaXplLOOCq+OCueOCv+ODoOOCteOCpOOCug0KY3VzdG9tX3NpemVfcHJvbXB0LOyVhOydtOy9mCDtgazquLAgKCUp66W8IOyeheugpe2VmOyEuOyalDosRW50ZXIgaWNvbiBzaXplICglKTos44Ki44Kk44Kz44Oz44K144Kk44K6ICglKSDjgpLlhaXlipvjgZfjgabjgY/jgaDjgZXjgYQ6DQpjdXN0b21fd2l0aF92YWx1ZSzsgqzsmqnsnpAg7KCV7J2YICh7c2NhbGV9JSksQ3VzdG9tICh7c2NhbGV9JSks44Kr44K544K/44OgICh7c2NhbGV9JSkNCmRlbGV0ZV9zZWxlY3RlZCzshKDtg50g7IKt7KCcLERlbGV0ZSBTZWxlY3RlZCzpgbjmip7jgZfjgZ/poIXnm67jgpLliYrpmaQNCmNyb3F1aXNfbGlzdCztgazroZztgqQg66qp66GdLENyb3F1aXMgTGlzdCzjgq/jg63jg4Pjgq3jg7zkuIDopqcNCmNyb3F1aXNfbGlzdF9pbmZvLOydtOuvuOyngOulvCDshKDtg53tlZjrqbQg7ZW064u5IOydtOuvuOyngOuhnCDqt7jrprAg7YGs66Gc7YKkIOuqqeuhneydtCDtkZzsi5zrkKnri4jri6QuLFNlbGVjdCBhbiBpbWFnZSB0byBzZWUgY3JvcXVpcyBkcmF3biBmcm9tIGl0LiznlLvlg4/jgpLpgbjmip7jgZnjgovjgajjgIHjgZ3jga7nlLvlg4/jgafmj4/jgYTjgZ/jgq/jg63jg4Pjgq3jg7zjgYzooajnpLrjgZXjgozjgb7jgZnjgIINCmNyb3F1aXNfbm90X2ZvdW5kLOyEoO2Dne2VnCDsnbTrr7jsp4DroZwg6re466awIO2BrOuhnO2CpOqwgCDsl4bsirXri4jri6QuLE5vIGNyb3F1aXMgZm91bmQgZHJhd24gZnJvbSB0aGUgc2VsZWN0ZWQgaW1hZ2UuLOmBuOaKnuOBl+OBn+eUu+WDj+OBp+aPj+OBi+OCjOOBn+OCr+ODreODg+OCreODvOOBjOimi+OBpOOBi+OCiuOBvuOBm+OCk+OAgg0Kc3VjY2VzcyzshLHqs7UsU3VjY2VzcyzmiJDlip8NCndhcm5pbmcs6rK96rOgLFdhcm5pbmcs6K2m5ZGKDQplcnJvcizsmKTrpZgsRXJyb3Is44Ko44Op44O8DQppbmZvLOyViOuCtCxJbmZvLOahiOWGhQ0KbG9hZGluZyzroZzrlKkg7KSRLi4uLixMb2FkaW5nLi4uLizoqq3jgb/ovrzjgb/kuK0uLi4uDQpjbGlwYm9hcmRfbm9faW1hZ2Vfb3JfdXJsLO2BtOumveuztOuTnOyXkCDsnbTrr7jsp4DrgpggVVJM7J20IOyXhuyKteuLiOuLpC4sQ2xpcGJvYXJkIGhhcyBubyBpbWFnZSBvciBVUkwuLOOCr+ODquODg+ODl+ODnOODvOODieOBq+eUu+WDj+OChFVSTOOBjOOBguOCiuOBvuOBm+OCk+OAgg0KcGludGVyZXN0X2V4dHJhY3RfZmFpbCztlYDthLDroIjsiqTtirgg7J2066+47KeA66W8IOy2lOy2nO2VoCDsiJgg7JeG7Iq164uI64ukLiDsnbTrr7jsp4Drpbwg7Jqw7YG066at7ZWY7JesICfsnbTrr7jsp4Ag7KO87IaMIOuzteyCrCfroZwg7KeB7KCRIOydtOuvuOyngCBVUkzsnYQg65Oc656Y6re47ZW07KO87IS47JqULiwiQ291bGQgbm90IGV4dHJhY3QgUGludGVyZXN0IGltYWdlLiBSaWdodC1jbGljayB0aGUgaW1hZ2UsIGNvcHkgaW1hZ2UgYWRkcmVzcywgYW5kIHBhc3RlIHRoZSBkaXJlY3QgVVJMLiIsUGludGVyZXN055S75YOP44KS5Y+W5b6X44Gn44GN44G+44Gb44KT44CC55S75YOP44KS5Y+z44Kv44Oq44OD44Kv44GX44Gm44CO55S75YOP44Ki44OJ44Os44K544KS44Kz44OU44O844CP44GX44CB55u05o6lVVJM44KS6LK844KK5LuY44GR44Gm44GP44Gg44GV44GE44CCDQppbnZhbGlkX2ltYWdlLOyYrOuwlOuluCDsnbTrr7jsp4Ag7YyM7J287J20IOyVhOuLmeuLiOuLpC4sVGhpcyBpcyBub3QgYSB2YWxpZCBpbWFnZSBmaWxlLizmnInlirnjgarnlLvlg4/jg5XjgqHjgqTjg6vjgafjga/jgYLjgorjgb7jgZvjgpPjgIINCmRvd25sb2FkX2Vycm9yLOydtOuvuOyngOulvCDri6TsmrTroZzrk5ztlZjripQg7KSRIOyYpOulmOqwgCDrsJzsg53tlojsirXri4jri6Q6XG57fSxFcnJvciB3aGlsZSBkb3dubG9hZGluZyBpbWFnZTpcbnt9LOeUu+WDj+OBruODgOOCpuODs+ODreODvOODieS4reOBq+OCqOODqeODvOOBjOeZuueUn+OBl+OBvuOBl+OBnzpcbnt9DQpzYXZlX2NvbmZpcm1fdGl0bGUs7KCA7J6lIO2ZleyduCxTYXZlIENvbmZpcm1hdGlvbizkv53lrZjjga7norroqo0NCnNhdmVfY29uZmlybV9ib2R5LO2YhOyerCDtjIzsnbzsnbQg7IiY7KCV65CY7JeI7Iq164uI64ukLiDsoIDsnqXtlZjsi5zqsqDsirXri4jquYw/LCJUaGUgZmlsZSBoYXMgY2hhbmdlcy4gU2F2ZSBub3c/Iizjg5XjgqHjgqTjg6vjgYzlpInmm7TjgZXjgozjgabjgYTjgb7jgZnjgILkv53lrZjjgZfjgb7jgZnjgYvvvJ8NCnRlbXBfZmlsZV9taXNzaW5nLOyehOyLnCDtjIzsnbzsnYQg7LC+7J2EIOyImCDsl4bsirXri4jri6QuLFRlbXBvcmFyeSBmaWxlIG5vdCBmb3VuZC4s5LiA5pmC44OV44Kh44Kk44Or44GM6KaL44Gk44GL44KK44G+44Gb44KT44CCDQpzYXZlX2Vycm9yLO2MjOydvCDsoIDsnqUg7KSRIOyYpOulmOqwgCDrsJzsg53tlojsirXri4jri6Q6XG57fSxBbiBlcnJvciBvY2N1cnJlZCB3aGlsZSBzYXZpbmc6XG57fSzkv53lrZjkuK3jgavjgqjjg6njg7zjgYznmbrnlJ/jgZfjgb7jgZfjgZ86XG57fQ0KbG9hZF9lcnJvciztjIzsnbzsnYQg67aI65+s7Jik64qUIOykkSDsmKTrpZjqsIAg67Cc7IOd7ZaI7Iq164uI64ukOlxue30sQW4gZXJyb3Igb2NjdXJyZWQgd2hpbGUgbG9hZGluZzpcbnt9LOiqreOBv+i+vOOBv+S4reOBq+OCqOODqeODvOOBjOeZuueUn+OBl+OBvuOBl+OBnzpcbnt9DQp1cmxfcmVxdWlyZWQs7J2066+47KeAIFVSTOydhCDrs7XsgqztlbTso7zshLjsmpQuXG7tlYDthLDroIjsiqTtirgg7ZWAIFVSTOuPhCDsp4Dsm5Dtlanri4jri6QuLENvcHkgYW4gaW1hZ2UgVVJMLiBQaW50ZXJlc3QgcGluIFVSTHMgYXJlIGFsc28gc3VwcG9ydGVkLiznlLvlg49VUkzjgpLjgrPjg5Tjg7zjgZfjgabjgY/jgaDjgZXjgYTjgIJQaW50ZXJlc3Tjga7jg5Tjg7NVUkzjgoLlr77lv5zjgZfjgabjgYTjgb7jgZnjgIINCmNsaXBib2FyZF9lbXB0eSztgbTrpr3rs7Trk5zsl5Ag7J2066+47KeA64KYIFVSTOydtCDsl4bsirXri4jri6QuLENsaXBib2FyZCBoYXMgbm8gaW1hZ2Ugb3IgVVJMLizjgq/jg6rjg4Pjg5fjg5zjg7zjg4njgavnlLvlg4/jgoRVUkzjgYzjgYLjgorjgb7jgZvjgpPjgIINCmV4cG9ydF9pbWFnZSzsnbTrr7jsp4Ag64K067O064K06riwLEV4cG9ydCBJbWFnZSznlLvlg4/jgpLmm7jjgY3lh7rjgZcNCmV4cG9ydF9zdWNjZXNzLOydtOuvuOyngOqwgCDsoIDsnqXrkJjsl4jsirXri4jri6Q6XG57fSxJbWFnZSBzYXZlZCB0bzpcbnt9LOeUu+WDj+OCkuS/neWtmOOBl+OBvuOBl+OBnzpcbnt9DQpleHBvcnRfZmFpbGVkLOydtOuvuOyngCDrgrTrs7TrgrTquLAg7KSRIOyYpOulmOqwgCDrsJzsg53tlojsirXri4jri6Q6XG57fSxFcnJvciB3aGlsZSBleHBvcnRpbmcgaW1hZ2U6XG57fSznlLvlg4/jgpLmm7jjgY3lh7rjgZnpmpvjgavjgqjjg6njg7zjgYznmbrnlJ/jgZfjgb7jgZfjgZ86XG57fQ0Kbm9fdGl0bGUs7KCc66qpIOyXhuydjCxVbnRpdGxlZCznhKHpoYwNCnBhc3RlX2ltYWdlLOydtOuvuOyngCDrtpnsl6zrhKPquLAsUGFzdGUgSW1hZ2Us55S75YOP44KS6LK844KK5LuY44GRDQpyZW5hbWVfaW1hZ2Us7J2066aEIOuwlOq+uOq4sCxSZW5hbWUs5ZCN5YmN44KS5aSJ5pu0DQpkaWZmaWN1bHR5LOuCnOydtOuPhCxEaWZmaWN1bHR5LOmbo+aYk+W6pg0Kc2V0X2RpZmZpY3VsdHks64Kc7J2064+EIOyEpOyglSxTZXQgRGlmZmljdWx0eSzpm6PmmJPluqbjgpLoqK3lrpoNCnRhZyztg5zqt7gsVGFnLOOCv+OCsA0Kc2V0X3RhZ3Ms7YOc6re4IOyEpOygle2VmOq4sCxTZXQgVGFncyzjgr/jgrDjgpLoqK3lrpoNCnNldF90YWdzX2ZpbHRlciztg5zqt7gg7ZWE7YSwIOyEpOyglSxTZXQgVGFncyBGaWx0ZXIs44K/44Kw44OV44Kj44Or44K/44O86Kit5a6aDQpwcm9wZXJ0aWVzLOyGjeyEsSxQcm9wZXJ0aWVzLOODl+ODreODkeODhuOCow0KdW5rbm93bizslYwg7IiYIOyXhuydjCxVbmtub3duLOS4jeaYjg0Kc3R1ZHlfbW9kZSztlZnsirUg66qo65OcLFN0dWR5IE1vZGUs5a2m57+S44Oi44O844OJDQpzZWxlY3RlZF9jcm9xdWlzLOyEoO2Dne2VnCDtgazroZztgqQsU2VsZWN0ZWQgQ3JvcXVpcyzpgbjmip7jgZXjgozjgZ/jgq/jg63jg4Pjgq3jg7wNCnJlbGF0ZWRfY3JvcXVpc190aXRsZSzsnbQg7J2066+47KeA66GcIOq3uOumsCDri6Trpbgg7YGs66Gc7YKk65OkLE90aGVyIENyb3F1aXMgZnJvbSBUaGlzIEltYWdlLOOBk+OBrueUu+WDj+OBp+aPj+OBhOOBn+S7luOBruOCr+ODreODg+OCreODvA0KbGVnYWN5X2ZpbGVfbm9fcmVsYXRlZCzqtazrsoTsoIQg7YyM7J2866GcIOq0gOugqCDtgazroZztgqTrpbwg7LC+7J2EIOyImCDsl4bsirXri4jri6QuLENhbm5vdCBmaW5kIHJlbGF0ZWQgY3JvcXVpcyAobGVnYWN5IGZpbGUpLizjg6zjgqzjgrfjg7zjg5XjgqHjgqTjg6vjga7jgZ/jgoHplqLpgKPjgq/jg63jg4Pjgq3jg7zjgYzopovjgaTjgYvjgorjgb7jgZvjgpPjgIINCm5vX3JlbGF0ZWRfY3JvcXVpcyzsnbQg7J2066+47KeA66GcIOq3uOumsCDri6Trpbgg7YGs66Gc7YKk6rCAIOyXhuyKteuLiOuLpC4sTm8gb3RoZXIgY3JvcXVpcyBkcmF3biBmcm9tIHRoaXMgaW1hZ2UuLOOBk+OBrueUu+WDj+OBp+aPj+OBi+OCjOOBn+S7luOBruOCr+ODreODg+OCreODvOOBr+OBguOCiuOBvuOBm+OCk+OAgg0KZGF0ZV9sYWJlbCzrgqDsp5w6LERhdGU6LOaXpeS7mDoNCmNyb3F1aXNfdGltZV9sYWJlbCztgazroZztgqQg7Iuc6rCEOixDcm9xdWlzIFRpbWU6LOOCr+ODreODg+OCreODvOaZgumWkzoNCnNlbGVjdF9kZWNrX2ZpcnN0LOuovOyggCDrjbEg7YyM7J287J2EIOyEoO2Dne2VtOyjvOyEuOyalC4sUGxlYXNlIHNlbGVjdCBhIGRlY2sgZmlsZSBmaXJzdC4s44G+44Ga44OH44OD44Kt44OV44Kh44Kk44Or44KS6YG45oqe44GX44Gm44GP44Gg44GV44GE44CCDQpkZWNrX25vX3ZhbGlkX2ltYWdlcyzrjbEg7YyM7J287JeQIOycoO2aqO2VnCDsnbTrr7jsp4DqsIAg7JeG7Iq164uI64ukLixObyB2YWxpZCBpbWFnZXMgaW4gdGhlIGRlY2sgZmlsZS4s44OH44OD44Kt44OV44Kh44Kk44Or44Gr5pyJ5Yq544Gq55S75YOP44GM44GC44KK44G+44Gb44KT44CCDQpkZWNrX2ZpbGVfbG9hZF9lcnJvcizrjbEg7YyM7J287J2EIOu2iOufrOyYpOuKlCDspJEg7Jik66WY6rCAIOuwnOyDne2WiOyKteuLiOuLpCxFcnJvciBsb2FkaW5nIGRlY2sgZmlsZSzjg4fjg4Pjgq3jg5XjgqHjgqTjg6vjga7oqq3jgb/ovrzjgb/jgqjjg6njg7wNCmltYWdlX2xvYWRfZmFpbGVkLOydtOuvuOyngCDroZzrk5wg7Iuk7YyoOiB7fSxJbWFnZSBsb2FkIGZhaWxlZDoge30s55S75YOP44Gu6Kqt44G/6L6844G/44Gr5aSx5pWXOiB7fQ0KdGVtcF9maWxlX3NhdmVfZmFpbGVkLOyehOyLnCDtjIzsnbwg7KCA7J6lIOyLpO2MqDoge30sVGVtcG9yYXJ5IGZpbGUgc2F2ZSBmYWlsZWQ6IHt9LOS4gOaZguODleOCoeOCpOODq+OBruS/neWtmOOBq+WkseaVlzoge30NCnRlbXBfZmlsZV9sb2FkX2ZhaWxlZCzsnoTsi5wg7YyM7J28IOuhnOuTnCDsi6TtjKg6IHt9LFRlbXBvcmFyeSBmaWxlIGxvYWQgZmFpbGVkOiB7fSzkuIDmmYLjg5XjgqHjgqTjg6vjga7oqq3jgb/ovrzjgb/jgavlpLHmlZc6IHt9DQp0ZW1wX2ZpbGVfZGVsZXRlX2ZhaWxlZCzsnoTsi5wg7YyM7J28IOyCreygnCDsi6TtjKg6IHt9LFRlbXBvcmFyeSBmaWxlIGRlbGV0ZSBmYWlsZWQ6IHt9LOS4gOaZguODleOCoeOCpOODq+OBruWJiumZpOOBq+WkseaVlzoge30NCnBpbnRlcmVzdF9leHRyYWN0X2ZhaWxlZF9tc2cs7ZWA7YSw66CI7Iqk7Yq4IOydtOuvuOyngCDstpTstpwg7Iuk7YyoOiB7fSxQaW50ZXJlc3QgaW1hZ2UgZXh0cmFjdGlvbiBmYWlsZWQ6IHt9LFBpbnRlcmVzdOeUu+WDj+OBruaKveWHuuOBq+WkseaVlzoge30NCmVycm9yX2xvYWRpbmdfZmlsZSztjIzsnbwg66Gc65OcIOyYpOulmCB7fToge30sRXJyb3IgbG9hZGluZyB7fToge30s44OV44Kh44Kk44Or6Kqt44G/6L6844G/44Ko44Op44O8IHt9OiB7fQ0KZmFpbGVkX3RvX2xvYWRfaW1hZ2VfcHJldmlldyzsnbTrr7jsp4Ag66+466as67O06riw66W8IOu2iOufrOyYpOuKlOuNsCDsi6TtjKjtlojsirXri4jri6QuLGZhaWxlZCB0byBsb2FkIGltYWdlIHByZXZpZXcs55S75YOP44OX44Os44OT44Ol44O844Gu6Kqt44G/6L6844G/44Gr5aSx5pWX44GX44G+44GX44Gf44CCDQpzaG9ydGN1dF9zZXR0aW5ncyzri6jstpXtgqQg7ISk7KCVLFNob3J0Y3V0IFNldHRpbmdzLOOCt+ODp+ODvOODiOOCq+ODg+ODiOioreWumg0Kc2hvcnRjdXRfZGVzY3JpcHRpb24s6rCBIO2VreuqqeydhCDtgbTrpq3tlZwg7ZuEIOybkO2VmOuKlCDtgqTrpbwg64iM65+s7KO87IS47JqULixDbGljayBlYWNoIGZpZWxkIGFuZCBwcmVzcyB0aGUgZGVzaXJlZCBrZXkuLOWQhOmgheebruOCkuOCr+ODquODg+OCr+OBl+OBpuW4jOacm+OBruOCreODvOOCkuaKvOOBl+OBpuOBj+OBoOOBleOBhOOAgg0Kc2hvcnRjdXRfbmV4dF9pbWFnZSzri6TsnYwg7J2066+47KeALE5leHQgSW1hZ2Us5qyh44Gu55S75YOPDQpzaG9ydGN1dF9wcmV2aW91c19pbWFnZSzsnbTsoIQg7J2066+47KeALFByZXZpb3VzIEltYWdlLOWJjeOBrueUu+WDjw0Kc2hvcnRjdXRfdG9nZ2xlX3BhdXNlLOydvOyLnOygleyngC/snqzsg50sUGF1c2UgLyBSZXN1bWUs5LiA5pmC5YGc5q2iL+WGjeeUnw0Kc2hvcnRjdXRfc3RvcF9jcm9xdWlzLO2BrOuhnO2CpCDsooXro4wsU3RvcCBDcm9xdWlzLOOCr+ODreODg+OCreODvOe1guS6hg0Kc2hvcnRjdXRfcmVzZXQs6riw67O46rCS7Jy866GcIOy0iOq4sO2ZlCxSZXNldCB0byBEZWZhdWx0cyzjg4fjg5Xjgqnjg6vjg4jjgavmiLvjgZkNCnNob3J0Y3V0X2R1cGxpY2F0ZSztgqTqsIAg7KSR67O165Cp64uI64ukLER1cGxpY2F0ZSBrZXks44Kt44O844GM6YeN6KSH44GX44Gm44GE44G+44GZ",
-    "/icons/icon.ico": "AAABAAEAAAAAAAEAIAD6eQAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAAAFvck5UAc+id5oAAHm0SURBVHja7d0HuC1VeTfwY6zY0GAsRGMXVERFURB7AUQUNRBFscWCHaMRxRo1saCisRCQ2BA1ChITC0IsgaigscV8GktixGCMxogdqfPNb856j4t11+yzz+Wes/fsO+/zrHv32XvP7Jk1a73l/7alpZFGGmmkkUYaaaSRRhpppJFGGmmkkUYaaaSRlqlpmk3GWr476ftrOcc4Zj9GmsPNOI65HJdtx++04wrtuHI7btSO32/HFdtx6ew7V07/b8nfvlw7tmnHpdLvXyH7zOsrXdLfHWlYG/xyaTF64JdPi+By6f8rZotkm2xs244btOPa7bhaO/Zox0vb8dh23LwdN2nHrdpxz3bcJi3uG7fjhu24bTse1I7923GnduzYjh3acbN23DS9vmkaN0nf37sd+7Tjbu3Ysx37teOAdjw0neeR7XhZOx6Xvhuf75U+f0A7bt2Ou6S/923Hvdvxh+laHpheP7gdf5SOfUg6/wHpmIPb8cp2PKUdB6XvPbMdL2rHo9rx9HYcnr7zF+14dTb8/Yo0P455Xzve1o6PtuPUdvxnO77ejk+04+3pHMe34x/Td1+V3ntJusc/T+d9djuekz73G89qx/Oya3htO16XxmvS9X2gHSe346h2fDhdw+vb8YZ2fKQdn0y/e0J23lel+3xhOs/L2/HidA2Hp3u/wcgENnbDb5M20O5pg12nHddvx6PTwrAJ7pfGvmlxH5Y2ykvS8PD+Ni06C+ND7fhYO/4+LYxT0v8fS69PSYvnM+34Tju+2o7PtuO/m2U6vx3fb8f32vGDdvy8Hf/Tjm+048y00H/UjvPSd89ux1lp/Fc6Ll7H377/6zR+1o5ftePc7Bz+vzD9/kXtOCf7/Jz0v79/mI53zG/S+c6rjPMr47x07qAL0vv539PQhcV5Nocu6fHrRV9PTHFkAuuw+all123HbmmD4/rHteOnaRN9sx3/1o5vZQvz3LTQY5y33ivgggsuaM4999zmvPPOa375y182P/jBD5rf/OY3yxfTvm/4+7//+7+b7373u80vfvGL7nu/+tWvmnPOOae58MILu/9979e//nX3v+/813/9V/Mf//EfzY9+9KPunN/73ve68Y1vfKP5+te/3n3+s5/9rPnxj3/c/O///m83zjzzzO4c3/nOd5qzzjqr+42zzz67+eY3v9n9vu//53/+Z/fe//zP/zT//u//3p3z//2//9f9ls/+9V//tTu/3zHOOOOM7nxf+cpXut/8v//7v5XvOf5LX/pS8+1vf7s7v3N85jOfaU4//fTuN33mGNfonL7jGv2m737uc59rPvGJTzRf/epXuzn5/ve/392veXJ9vu/cP/3pT7vfcoz3f/jDH3bfcY8+c5xz/uQnP2n+6Z/+qTnttNO66/ae75sb9+7a/u7v/q454YQTmn/4h39oPvaxj3XX+LWvfa0bjvvWt77Vfd89uldz5Rq8Z27NaUHfTBrbyAC20OZniz21HR9Pk3t2Ju2qZPPZNB6YzeKhe4DGv/zLv3QL2SK2OD70oQ81H/zgB5u///u/b44//vjm/e9/f/PiF7+4ectb3tIcfvjhzbOe9azmr//6r5tXv/rV3es//dM/bQ499NDmmc98ZvOkJz2pecITntA87WlPa/7yL/+yecELXtA87GEPax7wgAc0f/iHf9jc+c53bm5xi1s0D3rQg5rHP/7x3fv3u9/9mr333rt7/0Y3ulGz++67N3vssUf33T333LN53OMe132+7777Nve85z2b+9///s2d7nSn5qY3vWlzvetdr9l5552bW97yls2Nb3zj7v8/+IM/aK55zWs2N7vZzZp99tmnuetd79rssssu3fl23HHH7py+e6tb3ar77A53uEPz+7//+93v3/GOd2xucIMbNPe4xz2a29/+9s11r3vd5iY3uUlzjWtco3vfb3p9rWtdq7n2ta/dXOc611k59nd/93e78zvfzW9+8+b3fu/3uu+7lutf//rdtd/tbndrrna1qzVXv/rVV64zjnG9t771rbtr3W+//bpzOOeVr3zl7rdct3t/+MMf3l2bOTJXrmu33XZrbnjDG3b35Ry3uc1tuvO6LvdtXpzf/W233Xbd7/u+z8zf7W53u25+XZNzX/GKV2yudKUrdf97z3X7HddhzsyP63Qtno9n7lo89+c85zndc3/ve9/bMe5EX0iYxsgEtgADeFKuXl500UXNz3/+805y4ODvec97mqc//enNn/zJnzTPe97zmkMOOaRbOHe5y12aXXfdtVv4HrpF6eFaqB6uzbfttts2l7/85ZvLXe5yK8Pffv5Sl7pU979x2cte9mJ/j2O6YfP/zu/8ztzOnesqr83fV7jCFS72t//dB0ZoLVzlKldZWReXvvSlu9fbbLNNt/5oBYkOHU2BS84A2PgnmU1qHWlNgpto0pQE8GAu6SK4pOcY8tjozWnD+E3/m/cYm3Md+TG1zbxe99q3ZggUZkOirybwd2QCl4ABXK8d3zabf/7nf95JbWr6XnvttcKlL3OZy6xw4VlKjiGP2IQbxSDyTb+R8+g3aXmby7hq1xyvrUMmzGGHHZZbo1/M8YCRCaxd/ee6OodN/4xnPKO5z33u0wE5n//85zsb/IEPfGD3Htvu3ve+d7PTTjt1diDbje3K7qOGUs+o9piGwdbzM+zDUPn7xmrq/zxqD67JfU7LGCdtROcyh7PQSNainU3DSNbCAGACuSmw2u/6n2lgzb35zW9eAX5b+lw7dhqZwOYxAL7VDsQDAgFkIL9BJhnq63OIL+YADf7nf/7n5pOf/GTz5S9/uTnxxBObv/3bv+1AmuOOO67DCl7xild0GsURRxzR/f2IRzyiA3Xue9/7duAV7AA4BHwD7r3whS/scAWgkvcAepiP73vt+/vvv38HLNFSgGEYEWAKY/LeVa961Q6PcA6MCuBmsbArMSRAFvAKPuF8sAp/A6x8FyPyt++TNAA1ixQo55qC+QHTfN91Adf8NlDR/N32trftrgeY53owSscD3gwM0fldv03vMwCa93w/NoWFjsHaTBY+Bhsby7kdC2/xvvM6Pjaya2e6mQe4jPt0Xv8HM6ZKm4/tt9++ew3DcW2uwe+QtrHxcibnPedwX87pGOdwD67X9QSzc02eh+txTiAfABdA6R5cj9/1HWvD3LreACgDfHR/JVNwrLVGcGWawC4jE1g7Azi0c65+/evNDjvs0D3Ez372sytg/5Zw6wEVPSjuHS4dACPvgcHVwy1n+IxLCrPxN+bjuwbvAq8DFJiLyABSYlbcXuFS+rd/+7cVtxZXG3cX9xRmxa3FleZYbq0vfvGL3fHO84UvfKHzVHCl/eM//mM3B5jcpz71qe4z3w9Xmrk69dRTO4bonrixuN0M1+KeuPB8h8vLb/p9f9OsPv3pT3fXEr/BPcYLwlX2kY98pFvYJ598cvfdd7/73c3RRx/dudLe9a53dQzV9bhG1+aaTzrppA6s9b2/+qu/6r7r3sMj4z4x6I9//OOdB+ZVr3pVd17X9jd/8zfdOdwbV6Jr8TvvfOc7O8YMhT/qqKOav/iLv+iYNMn7jne8o3Mncum5BudxrOvl6XHc61//+uatb31rN/cBJLsOHiPPyHsEh+s0FyFcPBtzx91o+P5DHvKQFRMAkw5GhPk897nP7QRUotOSSTsygSkZgDDNt5g5DxL3xn0trkS/TIEsI400E8JUeZtCE8EAMILQBGhKz3/+83Nz4P0pWG1kAlMwAPHg7+lmrZUMJphqBQQktUcaaR4YANOQWUTqW5/MOSZFeDv8LZ5EgFiif0jh4SMTWIUBXC6F6HYqWth6r33ta8eVN9J8xP225ha8JSR+HkOSg5JwBmZKFiPw/RSmPiYQTWAA10y+1C4yLyYTgDfSSPNAMBfAYKxNgK0IxJqXgAn7xje+scOPEskTeXI7th8ZQX8MwLdM2IEHHrgyocJqK/HXI400cwbAHACo8g7UXIZAbEFschqyBKrPt+O+SePdOhlBT6afKKof2ex8/TGJ4uEh1yONNGvilZE7EWuT29V65UnhJuyLTfijP/qjznzISIbmEc1yRuvWwwSa/jRfAKC0yl9z0fHV51yUm2akkWZN3I3s+1ib4i24ZBFNQJxHXwARBvG6172uczMmgBCy/aVmuZ7BtReeAVQ2/S2b5QILr0nuErnwnR/1Xve614qrRRAJ//RII82axBgIeIpNLbgp1HsxGEceeWSnIfRFFHIbimIVsFZ4ttSkuMZCMoDKxlch5/nNcqrvCpkQQTdiAES35UirqDZpmHysPARyyE855ZQusIRrZnQTjrQRJMArNwGkYwv06nT6n/2sCwwTACadOEKRS7MAc+DZEhiVYVvyiu+zUAygsvEV+JDqu2IMAfxk/Ykmk2tPTRKyOSl+W7AFNUz4qe/e/e53b97+9revFIoYaaT1IuHl+dqE9Is2RAq5nH/++Z0wIqAe85jHVHMqMAWgoToTmEAi4YN7LIwZUGz8yyTupt7auZ0/5Ac/6NQlm95kiIdf2sy0TA9ExKCYbkU5jj322K66DOYiDJbaJrz0ox/9aBeCitlk4ZojjTQ1WVv5+rNuwzzl88/8/p1G8OAHP/hiyUPBAJi2chde9KIXBR4gTuDmC8EAis2/XbNcXPHskPhixdlBm5sPXjKAyPyL17QCceKyCR/96Ed35oPPJXFQvyTVAG+EGOPYI400LcmPsMaWsgIohAqpL5dEfojX4fuX+0HdJ+TykOEY0twT03DAwYNnAMXmVxH3wwnt7BItlNaC6i+tY74+BhEPiXaQP7B8iOg65phj8rJOI400kSQ35dmIXgv7RbAoSUQkOtseI6DpKkcn0eqVr3xll52ZCzDxLlnewCsGzQCKza9c8kkh9YF1pO7SBle5gbqKza7lv3t40l/f9KY3jSDiSFMRN15ZT0KgD7LpmZYYAE2AdilTkekpGxRhBrTfOFZKeYCIzXJJ9MsuAgOA8n887CJ5+NRwed6bu7nlZrOnuAcViJQnL+d7LefACCJ9Mwa1THpnPKCRRppEL3nJSzapHcksCJs/sCWxLCQ7cNr6l5Yd5O8wB4DZWYyLpKErDpIBZJv/2iH5SVVqDzWc/T0J2ZdLrfqqDa4Ca5gJUfBBTDXOapLlaVOtBF4o7IE5TMNcTHpeWCLOD4yB2I7A4Eir0Z/92Z9tsq7e9ra3dZ9FuXdkrVr/NreCMzSH8BRY57EGebSs40TvS4D5oBnAgQnQ6Epwq04zSU230ZVeVvgh6uILkqCahz2PAWAkNcJpuf7EBKgeNE1JrJIJ0AyoZQppjDTSJOK5ygWZtQkERFFUJhgAYaXikApFCpeEOWytRzARwajYSiJ42eUHxwCai7fbepc7kTQRhRNqAzD3xCc+savKkoEgHbGZSOV8g6oKsxqpPEOTWI0BeGg5EOMYMd1juPFIq5HaFGVJsKc+9akdkKxiEBCQ5LemMYPHPvaxHfal6pH3MQb9JpQ6CwGn+lIiHai2GTIDuE3yZ3Y3PEndV6aJxE8kHIoe9EF/QEzzAAoS2/kmkYl96UtfuqIBUK0mFf8stREpnR/4wAfGFT7SRALqlaasWow0USYkRmCjAwBJewxD/UbeL+8pJ6cJSYDQBJ1zJrIHrjxkBqChYgd4UMdrG8/k2fyJmAoQlHu14+rNciPGTRiAITloElLP/oId5OCKc0xbJVdB0Kz02Egj9YKApTmpoxSyuWFTEQdgiBxUNUgIO8IEaAAhnAiqjAF8fJAgYNr8V23Hp90FlaYW9GBo7mGiEunzt13z22zA93VIyPvet7JxSWpI6x//8R9fLMqqJOeE5ueSPTr/TMMAPCQpnSONNIkEmJXr5sMf/nC3sa3PkPwRCCR3gL0P3LZGCSqYVx6zEnEELX25Hb83VAbA9adzbvPsZz+7CviZrKzC7+npmDheq+6OFUq5lAGYR/4p0yzWf5IJcPDBB29St99rJsdqmgDGJJtrpJEmkaq/+bqxuYF6Nn5Umbb5rUdD/QBVgwgnYekYgOi/fH0yD1I4sA7ROwyKAWQbWNHDX0I+udRKf7uhSWaKuvPPA5tNk4Xe6EOx+lwnOZcUMbXaBpWAgXE4LjQQx6rVD7iJiMCcOfnctXoII420GrH3y0Cz17zmNd2mj2S0KCGPMAApwwSMSEE4AXOzND+TC1om222HygBk+XU11qNoYmzE2HBZCyVpwNctNj/3R5dWJTKv1CBgCrjnasRbAGEtAUB/ixUocwm8FkcgP2GkkSYR215uSYkBiA3wmaxWLmyAYDQIUStASTulw8QIWMMlPgYUJDhb4kPcfagM4NAAAKXn1lD3zJX3D+HuyAYMoeuyqDlEXnXFUCIsgiwmke8IusiLNvQN7sUDDjigi1cYaaTNYQBAPPUpmAAC1Gx4ZkAwALElPEy6M9n8hg5T+TlkxCaAGzh292ZI+QDZBn4MVJ+aXmMABmwg0feaondas1wbrSsQopxyCd5xpbChpiH2lKIMOG0fCCh1WJhmlo890kirUl6tOo8EpPbr6GT9AwOjJ0A0EtFuTCkwnzMJSg1A/AAnQTv2HyoD2NX9svHzpJ9cldd/TqulRMcUWsC27ehEsRZO5cbVk2+SF6BGuLG2Vs961rO6ScYQeBMguR7GSCOtVQOg7udBagavFwZA/Rf8Yw9Emrn/X/CCF3R1KrgIfS6XJT9eenoqGOqghzRDywhsflvS+xsmSRffGgNgb7/sZS8LdUcUkLiBqzS/7QmgQGJXKaXkstwo02AAfRQumDHrb6RLwgDgWCW+JLmHxId/kfjU/2AAMv0OOuigTgMg/OAEvAL58cxddQOa5ZLhDxsqAyDNxTJ3OdN96bm6sGauQLN0fAI+9E/7es3VEgwg4qxHGmlWpElNGeNCqCGBZCQ5HCqiXG1sGACg+Tvf+U5XE6Osh6HsvTThtB8OHCoDMLpwJ5wu/PilX34pVVLNmACSi/tWDNMfb3jDGzZxI8IVRgYw0qxJl+KywIwoPyaAhDVMgAvQYArABbgJBf/IFdDfomQAAO5UEwADeOiQGQBg76zglBDSqIpaFuSQz69lcxYVuEIag5Z21k477XSxnOqRRtpossmFpJcaQATyYAAqWkcQULSOf+QjH9kxDiA2M4EWnB9vLyRsjH168JAZgGi+wwP9xPlE/4UWUGZRsaUe+tCHdn3iozxycNIyck8Q0agBjDRLYtc/7WlP2ySTFGblM1msp5566koQEDPg9NNP78qAqQHAA6AyVpmxyrzNCtL8WTPEsmCFFvCf7oSaT70J0KTMw89xAem40FQVVpVYyicZM6BCJVfJSCPNhIDIIlTztSvhTLEam53HSQyLoJ5ICOJq9h3hv6pT8xSUlaz8LYo10RFDZwDGc+Ju3DCfO7derS5fXh9AWyUVffNMwKjYo1FI5kIcaaQNJ2q9Mt75Go7mnxjAxz72sc7lR1DlVYGtXSHEXtsPZZCbkvbeT/TaZqiFQTMGcPV0I51eTw3ac889p8rKA/7VgneAioqMjDTSrMgmZ7KWyUAvf/nLOxOAi1DOCg0AA/Ceaj9UfIlqNITPf/7zK8VAYqiaxUOwSAwgmoEI/u+id7g5VEeBA0SKb00b8F4tc49m8JWvfGVchSPNjADWu+666yZrU6afIDXYlVoX0P6INznjjDO6KFZasOIgws5LgJv2S3sYPAOoMAElwp7ZLCc5dP7Rj3zkI138fQkIljX6SuZAjYKgjjTSrAhQHU1r86EwreAfAUFsfRmAQYSWWH99LXkBVBAuvQhMAJpBIhVGL90sUHMQnoE9m+VEn84woiJJoNAzXeowEJAtZdMrBqqQYhkHoAVTZieNNNKGUy2O3wBQwwcUlJHwFnX+aQXqTDIRhLfzjH3oQx/aJJKQCSBAKJEY9Rs2C9gf8FrNso/zS3Gn/KTUKjcvgEJpJI0Wo7NqPq5//evndtJII204ydmvmQBCe7molQZTHCTcgDQG9QHEuxB0goKUAKfhltovfCARpPsGzaJ0CW42Lfpx/WbZ1yns98fNcnGQ83OghUpVTrLeatItRxppliAg87WPAbDxlbNLuf2dgGO2chOKY8EcCLqSAcAEMjfgXyeteWlhqMIEooHIg9rxhXb8IDwGbKkaA+BFyHqpjzTSTEBAgF65NgX60A7Y+xhApK1by6JXFZtRsVqciyKhJcitYS1sLNGRzaK0CF+FAQgYUoc70vNW0vSitl+ZMikXWxqvhAv/K8EUedcjjbQRJgA0v6wIpMAHaa84qMQgGX+IVsB1LTiIeWDNwgjK3BjnoCUkUppqm2aBTYCbNstJQ2fGHfOZcp1QoXBK2VM196D4gH322afzCMAEdt555w5hFYopBHMMFR5pPYlEB1yXVaUEByGb3/pMmX0d6CfE9ylPeUqHawGxMYkSBKQRyKBNpCzeFRYRBNy2Wa4b+I24U+WStFXiItlhhx1623jnI5KLlirNRoQdQ1u5YSISK9BYahkOjkmMNQFG2hyyjqyxpaLPxWtf+9ruc54twki3q2gNrsCt7FYlwSQK8feX61zSXFaW7jULYQIUm//mzXLN/05f5yaRHcV26usfsDnDw+A+xEy4W2gFAjO4FWVx7bvvvl3QhoQOqlgtE3GkkfoIuq/AZ7nudK0GEEL4RQpC/pG4F+G/+k7CsCQCnXjiiZu4uGkE1mui1w6eARSbf+92/GvcHfWIGlXaQZs7+iIHmRGSLAQc+Vx+QTQajSosuLXko1SqfKSRJhLBdetb33qTtQYYJEx8rr2cUnShMdBGjz766C4xDoitf2VpAliXWcHcE5vlALqF2Pxq/38vABR2zh577NGbELQ5w+buyzJc6ukDaMIdQxVTqkmRhpFGWo3Y83mhmxiKfmIAwD9BPwECWvOkvhJ57373uzuGoAtQbY1qOZZIwNxVmgXIBdirSY1CAXxuvEyCWOuwYdX2n9T0cxKjABo6vlS/HvWoR608tJFG6iMBa1HfIhcugnxId9Lf64hXYQJYV7wE0oiZBgDD2vpklib6VDPEBqEFA7hFO74YXFN8dJkAURvUdfZ7mScQ2YB6rMss5C148pOf3IVgqvQ7DXgY4cQ8CHnXoDBFjjjiiHGFjzSRpKOr31euK2vWOqf6w7YiZ0XoMOEnFVgLcTEBZXPRGErhJxIRdKVmwPUAtm/HP4YbRIIEe3uSzW9zC/4RDSVaavvtt9/kO4oqlqW8xQDIveZJUHZJUsVqTMC5Sy6+lDoPjVrAdATwirp3vC3cY7nXZXNJ+iw8Zkucaz2IRC+9ADRIJb99xuevsE0g+u5H3wltwZSjt37th9q6POSQQ+JnHHzVZqAlwaJF2EUWCZ9+1AXsk8hRoz/KKLOb+E1Lux0TyTKmqtSnXtVMifyamCbUtLFJyG+JG8sGVwXHBgdwAUz9TwuDZnNvAbgg2GxdUXCknGcZCTFrIb8lao4gyGvrzwu5vpIBECjRVVokIG032sxzc6sCpD6moiFMAH0FamtSy/CMAQwHAyg2vwahXdUOk1KTtDGAgUV+P59cV0uZ665kGiKwwr3S56NVjKEP+CvxgPxzoZjQXV2Jt2aKQpYWuqAVG92m1mpNrjv1V4MVnZo1tyDV9Lxjv2qZJSbeAhfWyqRiE2Pu00p02hxVGah2zDHHTNUKbiOJOq84bbmWjjzyyO5zzMscifpD4gG896pXvapriiNOgKpfW5PWfKJPD0oDyDb/bZrU2osUtzD6Np9JxBkTnd2Oo5rleugd8wAYlgyAW4+U6SMLV+HF3C6LJqXTDOBglpG1VREEW6CUWHVzKCxVzASmaw7hN1RdWpiAK4zd85EaK5Wb6eV9cRjwFYAXVy/GyrwT6JXnyPcxH/XzbBSp4SI9BdHMEzER+fTLtcOTRPMh9CQLPf3pT+8EEoFlXcKsaLU0TNGC5fHmDL6VSN/MKw6RATx9RYdpbaC8rl8+5Purnhqu1XY8Oh2vMci3SAv2fJktRU3PMqaqDCDP1BKiKX9gWpcjUyVLyNgqVHyL1Oanyqttz58NgM0DVcy7Z4YB2+Q0Nxta7Tu5GSQetRgz8BnprUyWHHeps47DPLxW7r0v5kJ8CC9N/C6NjNsYoo45zQMuwKyRlVpLVafpYGJMov3337+7Zu9FMBCNimalhHh5vHiVrE/GO5ohZQNmDGC/Zjm1t1MX+zbaE5/4xLhRT/TZ2fHXaFKtAFF7S0UjEVIFQNhHtI6o1pIHB00bcCRWe2voO2DjW6jsVBuZNwXAyjtCwoeLVa16A4ClLyOtjWRm89rcXKfArzDzopgLXMcmYQJIgoEPKAWHIfuMP7zM2bBJSEkMO56H84qwo0lyrc1DRWjMiIbSxwBgFkwm6nxoVRgebZeNz40oKrW2/pgJQ9cAdrMPgX+1cMml1AJJjbQs4OGazcULhnQ6vmCKPLqPdMZVI8mijyy26LpS2vh9XYJDw6B+LjLxU1NBLWL3Ci+h4puvkPjmLHItSHvagHkLzCRMgaUpCrvuuOOOnZvWgCXAC7xPo9D6jYuskwKtZOc2IxjUfYznFs+cegxY42abdQ4HxlUrCUbLgQ9wA9KCaLDuT0FQGaukO9WfgMlxqp44gMFiANoan+eB6sZbu0kqelRLaenJzabtwbsdbrLKeGnSQTLFJMJtRV2RRDkDgPpjAhZ3zlh8x4IGbC1qxWFSKcJU2eEAKxLdZrO5zDPJ7/+Ii8i1pmAKmxO45fzmnWpPg+BqhSlgKqS658UMgb2QkBFm6/c8s/C5O5Z/3WaaJalIRVsq79P9sfcxAW5AIeaKgmC45p3Qe8ITntCZAX0MgJdg6AzgT8P3L/OpBv6xjxLxt+1QMABlkLqaX9wm5fEWwTSb1IQDXCy8WkhwuZipq5KGuLoW0V8PuKKKWoSkjHmkjkf4dJRhL8OpvTaHwRg2Z/PniV6YDDWXKUcLoF3Q9CDlPAdMC5s+npHfjqjNZz/72SuA2iwJCF029TCsdxseg8Bcub/Z+0wbzJf7Wo0LmYA5UJ0PQjPRZ4bKAA4C5rphdlstyw9olEg5sOsVDODG7fgu+5Q6WB7LHs08B6uitVTOWpLQUlaIkYoJWJzXwJNL4s6z+Gx8+edAWQvMhio3ef43FV+GZtj6vj9pDkvmmmMvNnO+WWxoOAsJucsuu3SYg/M/4xnP6DRDn3nGoQG4lmAAsICosjNLosJzf5b3zuRlYskpcW8yAglC2hcmDLtiDhBOfZGANIREagJef4gM4I5cubg0NacmNdRFS77dC3tMgC6GEgct7Xjgi0CUackDiDxsLkF2GjOCumaxQfwXtcSYZwAvAfRxSbHHmUW1DUv6U7Vteu6s8PdD8jcnMzMwBO6/srw7qY+xMD8wAteESfAQeEZAwtBEIskrXLrzYKLZwMyYpUpZcKYtE4U3hblCEBIs3me6eg6ehziH2tzxpKS9gdPt0gwwEpBE/yaghg3UF4EHJQ2Tqh27NqkGegIEv+oDdiqJAQmOBURib05jEA+Cbcb+JQnFc/t7EUuJkTiKUECbIfD8+jWJFSo6Hz78QwQlyUVNB7hNkvqeB2ZBKpN0FjTmzLbHbMUEkN5MB8NzLF2xNr1270wBDANTwHAwHoyjxGl4GzYnsnBLE5AvtJQyjBzoF5Wtvva1r3WSn1lAEJ1yyindnlAivOYFMEcwkBT5yBV1syEygO2alACkKk+5iGIRQEmVRw6zqh0fbIdMiNsHCEgKWaD5OUjvCLEcqW7vU0HllVOpzRemWWZgmlOuPcE+MJnb3/72vQlYOWZikULmbVIST5AO9N4iF0GpnLtajZi0SDhah2N4EwCtuRfGsxVzgFk4Z+AQri1GaCiuX5QhxjZrqmUDRjpwuDZ1uqYBBPjKfcl8MUckPK9Iebz5EVqdiJvsakNkACR5V9WAyuPBly3BQz2U+GDBFmQGvg+MA1YtVVqDbU2BOmslC82GZmOWKc+hfpPMNryQVEE5qiPZbDUpHb54DVt9xnwTmONYGMtquAnsQYzBTW5yk244vlbByQbHEHKTMfdE0Aycax7KuDFBa3MLS+LNcI20LkzY+gYEig/AmHm2gIEHHXRQVbMChGbu8as0A00GOqAdv2aDWlzhEy7teSqgIJTwBYermiCjmpeBQLFYqLUj/ZZsQjgGKUzNNG/U6XyubXCbn6rO1aSIKg2BN6B0i+aSnz3ONhfxJxeACbWWTei7NL1jjz22k+CYet9vlQygzAEheeeBAdjANS8AbQdTxAQwvTe96U2d1Pc3zcAwDxgIsK92n0yERWAA27bjk+6CykMF7UvMwRjEi4ufzmvz4ZzBPEoGkOEHIzXL0Y8WGqks2q7MVTfvNj8JpV6dzks2vrmnelPB83iL2ITMBxtf+apL6h7luREVyOVXi6LrWx/UYhoLYJJ5MQ/E5CnB1KXU2w+TsnYl+7Dz2fsEoedjfYsJYAKYh9ocMHsTsXMHXQ/g0JBOuF7YoLi/B1oW7zChJBL7nq8X2FMLlrBIsqIJW729T6rwO9v8Nkm5iTBMwBzXq8g/tifgDUOIkmg1nMbzcgzpXTHT1kwkN8kJF8II+nJEyuF7hg0zKQt0IwnGIey3vFYmjkjFMH/Z87wWNj7QmSaAEdISMNZVQoE/1QyxIlDGAB7RpCYfOJ6gnNj00OOaCmVB+owrhIpai7YyuAdHWl6IJDrtCcpfQ9mpoux8cQ40LWo48yDi/ctIy0j8oX1xIW7J2AjnAo598IMf7NbDNO7EwCAwjXnJ0YCzCGSq4SuBT8FJVAAi+QGXzFz7wL1jqoKaavfMTRhQQwLUB8sAdPz5VtyNCTAhtcCgWo1/gFQtio+0AqRs7UStJG1IEgyzzHHge5dL/5rXvKZT/amjNr34BxsKo609CwwB47WQ1yMwClYhIMYGmaY8nOdNcNAi56WPAzCvVq3KM1CVCokD4FrlDqS5eFbMKGHAGLYkqr4w+eQGPKtJUbJDrgkoKIhRc2ZwTn7OwAQmMYAyFj2PIchKJ2+VZCFZaEwhkqg0p0gikp83QEIKxBpAxd+PCfPTl3Mbf1Nj1zMhyiaWrCURqOYRyG1/12RTwSmyjjkzJ2o9cLSmObH5kWcjCpXWEt2vaQBcg3L+ucH7AoFSYJqAh52bBagKbNw3tAFSRdw3DsmlV4I/HnjEn9cy93yW9U/bKoktaQ5s5JJxAqIg7UwoGwyqzDzgjiXdYS00gdrigyGQTJ7PepKoOLZuWVWnzMx0veGJ4AKcF5ILENmmZTGZyHKlsZh7OIDnhQm4bxqA4/vSgc1/0nQUptyxWZC+AMZd2nF64ALUHKog9ZSt6mFT9yJyzGTWfK0GQGhrJSiy0GbRdyLPckkOLDvssMO6AB02PHUfkh+RlDX3mzmGykuGkqMvTXgjoiPFxO+999696dmkqXVBu1EHYrU6kBtJgLwaiGkuo5yceTSiTwBQkAYA5KYBAWNrz4MXJxE08UbNgrUGUylYsdAvN6k9mAmiNr3tbW/rVCOqE/UQh+yLQ+eP3hrJxjRHUV++jEKjVSmuCmCywdigVH72akTY1UKBpd8CpzbSxhZPIHmmr1ITBkBrsdGsieiyMy/gK3OqlqgWuQq8WOHaBgJGpikGoNRd2V04zB5rPzFgJsBtmgVsDmpct1kuAfbFYAQlWmzSau2XTBI7amsj6uMJJ5zQIflU+7Igh+w99r4IQAxCRJloMw0rMVJqdM4AvKYZ0BL4+bP6DBtCNgJcok8DiMCgiBMRTTcvpMpvrc6kPIrIVWD7K3knMQgIKGTaHLtvjKFWLIcG4XktHANYhRE8rB10+pPboeD/z5gJJjKvDZczgK0RBKROmo8I3sk3ioUHPLLpLSDx9VR6OedUzajAkzMA72EYXISzIDY9BtTXFDZcwvIVxDjME3Hj1VqDMaWi6Ck13yZXBQkugBlY07APAG6topAR3YUWkgH0MIHAB9RB5+g9GwPgNmT71fL3V6sItIiov41a63xElVQ4hVSC+kfMvs0u3Zn6z5bO4y5sLtIGQEXTmoV7jdaxWgMX+AX/fwTXzBMIyDxZqhT1jFR1jT/gMOIvRA4KBMIAYBnMAdpPjenBb5K2Yx/svsgawPWb5WChFzWpjHi4iSCmotuotTWblXSTaWaS+cHZu5ItRMUtWnqv+TAXUP1SWrJD+frlRqgyQ3qQTKQ96WpA06Mz8lLRyXZWpbXck02kNkNf7H+UaXOdWdbo3LgBaV1LlZqAIZykslubNjsQEOgdXYIBhbVw6Eh5TkVPLOSHLCoGoOjHxXJ6SXxx1NRYPdSBXJMCRSJxJKrGwAuovJBsrpZFqe5DGpgT0jLfLFR471GRBftwCfIts/95Vtio3H0CgspNRUvQqGKWxJPhuZXBXu4xWrrTAMXG2zjzBsZC68s1KcMyalWw9YHVNDMbOrobWeMStmpxAPAQUa5JiOECuy2aF2Dbdty/Wc797/ROUogHQGUY6v20padqw4KHGtMcIK3vfe97O9eLyccU/I6FL5kIo+CGnCd0uSS2IOBPGa8c9DNHNrmsPqAf7YdrFBNUyANWQOqXpb6WUgsr4aYSiGbJ1Pi7PasyJsEmIF3DdJmXBKASj6k1BsHQAlOJ6j/mmQYX4CDNh6tW96TaGs7cgPye2w2aARSbX71/LXfODS4KGOG+qsWjL21m2/CQeCSJ19RiARlQcH9Tj6PQJDDN72MW88gI2I02Q56n775oOtx9ykyz4YGi4gIwCd+zuGgCNaTaPKylpNp6uQBFHEawTy38171g5EJp5424rXMgNq+bEMVqTjvttA6TwQCsLYJODIe1JqqxjwHIkUj0xbRnFmLzU/nfTeqTxmwi8fx9EWmbO2yUEijLpaDP80YhHiJTAmNwPUVdgpkTSVFuEBJSGS7ShepPOxC7zxxQ0cciBFBxFeaxAjYUwJA5MetNRWOB4wAp+/oLiBKUMz9LTaWPAHm1IDXzj2kjyD9PAMmPKVjzcBrAIPyqLxkKCJhMAADNrZoFCAUG9n04wB910tj4tUSfjRg0gOg8Y+OHHxrjUJl2XuxN0qJWVl2lZQCT4BguJaG9mBibkt8fM8BYSf+o/hsDAyCNZp1UQxpaAwCvEtgMBi2IaZ5SgHOyhsuaC+EGDMCSrx9I7TmqDuQ+aGuSrGADNLTa+qTdJfwKBnDbZsDZgJdqx+3acULYs1QfD70WRbUWNZ/9BR0mQdi9bMVpe/9RO2ENcuJDW4hjMQb+6VkDiPLvpe3WmJfFRIUmVaiYwmmV1ubvj9ciAnOQKe5Po895qIBMKpKCauTn7knXiWkBAYGE7nMewVxuyVqRVcw3TEmeKS5MVZrkVtAAMF6MgGuQybY0uWnOj5uhVQUuGMCezXJKY0eKS9RSKGvRUCZBWau8R1wOYgHwTCwwyYTatPqwRaeb1X6D+s8GyxHy3MXIbztLslgk5pQ+cS4/m0dWJTVaMAkTgWRXX9ECtKFI1zJQhcSal4QawCxhwE2GYdUy4mykeUP/V4zzdkPX4gDgGrSDYHJqHzB5uacBh5iZ1wKBanEAwaSt7ZZwgQcMmQGsNDqn9kQFlZqktiEteGotv2mUUubiKlVE32Ub96HLQi4h5EtT1q/PU4/jOlZrYb3epJZced/MASqk2HKbn7uIRoABAMswA+i/ePQopBL3xySQHpzqzc+cqMk8GJ4V5hUVgONeSVcbaF5jOjyHWpAagFUH4DATrGf3Yf0TVBgApiaysa8iEk0uaWlqsP1hM9CagJdvx/vC72lhltI2l7qSV0i9cjOzA2vHAL8mEW1jWtAwFl5sFrbztJ2H1svHXLaNItXds0UkiET9fuZP2MqChGg0GEEAmzmj9V0JLPNCNgEmxoSxLoCVtDf36drhHMA/G2ZeioDkpK9ETZs19z4LBgBwFQfw+te/vvPYiOgEwArX7tMA1BBIZo/64rcfKgO4Vzt+6kag1X2SX6w3t0gmmdQMEKFyHqCoVINjkqlWk3zMgX7b3FFfYGlCG6sSI2C7zWrhkYpUyTJHPAJJor0XFRQASGJAzPn9gVDuPfd0QNk1Sp2nZJog/nEqL+2FyUJTgcsAOQM0nkeymQVT1cxTfv7OgP/xjzusgLajPgPvAMnOvBS5yZNTW5PWXkAl7bj1UBlAl7AvZLKvrp/FmRX39KQlAymBtC/7xwTWfKUWiYCeSdLFpoioOd8HGE4bYEStnlXyiUVCiucRfyQkk8AGFsTELIpmnYBCC2n33XfvJCczq2zHBiQlbeeNbG6mnqAsTE2lKJKRNjhrE2w1IsXNebl24EcR8MNMgNXQbGUzih3gZpYDQTOoZQMuXbwvwGAZgG4mn3UHkNw+d98+++yT+90FCF07HS9S8Fycs6YmCeyZtKBpHezL3MTgI8/bi03CBHDxWXUeEq1YAp8AUQCShUOSA80i/Jn0BO4xWyDnvCu5bYlJKBoyj660/HkhGo7XmMK8Sv4g1X5qAoVGS4MLQUSzBfoxAZhg0H3YFg2uLwaG+ZMwACbAHZoBNgcV9PMNtmyfrxPSLx460anNclpwHH8/GoBJqB0PaFmtLwBXWYkzmHAAWV/6adTO93A2Ojc+X1i5axIzEDBCreTa4xnhOrPpSRvS0jWT8qIdMYu4P6o/00CsQJgPI20ZkuJbZjJiyt4Tuh1ub4ybsCKQVFi2rjAFRT9qXoQIBErPCwPYbYgMgPvvZzL6+PyXKk0fxP2nHu/8PA8sAof28j5OWeZMR0NKEVWTCPAIXY7fjN52pGdfAYookBH25yyQZep9fk3AU3gHVZILj53sHswBFFrcP+CMGUDNzKU/RmmeaRUjbXkToFashvkWkYC0WxgAEJC6HwKPNiZAqFZPIHIBkgb0o0EFAmUb+LkRLCE7qnaT2lOFR6hJdc+ysXc7zoGY1oIlSLZpqtYCasT5hwYQqH9kEdaaYbCpZ9V+WthoGSAVjVC5Ri0gqj7JT9LQZjBI140JQPp9370BB6O45yJ2P541CQWuufEEqEUgEAEWSUByXgxmAeEkw7EW/2AQmqkRy7AwgGwDHxYoKMlU2t3+BvYkUunhBgUD6EBAtlMtFNbEsYWnUWsBL87R16E432hU7Qji2GiSlei+cpckCc7dZyHReI466qguuo/6T6JgbjQBG17JL67AaLMN9BRoQwUdacsTdb7WGYjWSQMgwQGZwoDFbcAAPB+bn3dLd6RaMpHBrEsEuNlpiAzg4dzZuB0VtHaTAnUSl+P/e1uoOmkwCc41UYDCWsYVVHxawojYzmUcAk2CRiDhROrmlmh/tbl+f5GNuU0Ycftsf/NACxD4QwOwcLj6RPuZC8kl7P/QdpZSB2UMIEWUjbSFiXZbK+jBbR3di9QFkHVJCxPjIG1bbIP1KE29lqlpwAsSaZR51yEygF0BGCR0HwMg3QpXz6eblPoYDAB4UlYFjtLhqwUClQR4EY0lXJiaT4LiwjaeBzJLcm1iJfKsOPODaWFMbH+LwjWHScUM4A2hhppjzCGXSEyE4447blT/14kw5loykOdGO0CKgGDeMBz2flRdtu6B2H17g5aXXIke3kOH6AaE6HezkLvjShVcQcpMQuF290nH78MEMIFl2aWw3zMNYrPcTpe00+2WJFKi7DRrwbDvZY1FSCk3H0lCU7DhIckATQuGepmbNbwnFuK8u9OGSpJ5ahgAxht9ASD+1hkz1PPkxkXcgUzYPnyMRpcAcnviHkNkANu046PuQBvqvgAci9fnGZ2RbB4JEL+BtOpLXx5HldczYFYq+3qo/6VPWPCUCElSQ/AP9yB7X4QgAEmos/oFvAaYYY5IW5jU/3nMo18UopnVmttyb3MRdu6t1gQ2gII2tZgYWjH3oMCnWjZhxLkkzQ0GsHMz0EjALpyJClRLmohBxS96vvGh8JecRwPI7drQHHBOEnERav5pMgnPyMuf03BsdPPCh2/zKzNlk9MUMAaAIdQffoER5AFTFuEHPvCBhamJOI8kzqQWVAaTiZqANDCb36aH0dDmArhmBsBwapoxEzXFoWAAtxoqA1gpbKaTTV/wTZ4PUAJWIgGjiWg+2c6V9VAfLNFg+Ohx/LD/aUW0HqaPeSNpeAio/AJEFMiAf5Dy7E2bn7tP8BB8BKjJRKBujur/+hGGXCtlBocJNzL/P0BQDAd3tmcSWmtfTUFeHC7u9Oz4E3ccKgO4aTu6mEjuvIjoi24vJfe08Kmzxx9//ErBCseFFyBP2mFSzCpYZ0uSGHG1/HLpbVHZ2DQjoKU5EB8gJ4LKqYgJ/z8tge0vn17pL54BrkwFQWgKbNSR1o/U+xOBWXNRRxwA9d/z4zEIFzPAVyAQzTgPksu1NxpAStwangZQMIE7pZvogJGweQLIq2kDkFX2vYKXqsH2FU7UCGPoxF9sYZR1Eqj5UkKpjb4jNBm4BPsQQcbmxyC0R5NlFrkD/jdfAMFZxTNsTSZAbQ3T3Eh8RJBJK1cfQLEWgVw0Auo/85bmV9MiMIbMBNhpyAzgMu2gq3eGzyc/+ckV18mkpJz4jB1cS5jAQAAqiyBF2IEREOK++e+ZAIJBAH2AUKYAHIU5RBuIKsrMAmplpA77HANw7KwafmwtJFu0ZtbSygT+IB4ADJwGwHxjtvL4YADMXVl/JZCIqTCHE3mIt2wGXhT0yu14Q7jf+D9redRrGVQvpsKQiYpHskemZJg4sAA2PA0IckyCWDyYBOnCPsQghAxLOgEQBk7CjKL+q0U3+v/X3wtQa1pj/iMdGAOw0QPxF/4O9GUC0AB0bS6P5y7M8lx+0I5bNAtQFfg67fibJnUBhpIKaomw1cAFpinWEUjrPPWK3xyyAEj2CHSy8SPFl4qvUo6aBkA/6r/PhQUD/ZgCJL1war39QkvCWC20oTPHIRDGW1uzzLmoJykZSJAZ89fGlpkpVVh+AJwAky/XuwAvWl3y4AATbt4sSF+AqyTX4K8C4MNFubFIs7646L4yXkPvDmxhUOFDigSjE17KXSRiUdXc5zznOR3iT1UkXWx8ICjtwWLiIVCL3vEWH0ygLK020pYnmmyNAWDoUXpNMA8mwCVrjWPmMj55t4CBcJ6acPP9RCsMYFGYwOXa8fZ8Ik2EQBeprBButq6FrNqKRV9DWqnI89Yueq0kU9H9hkfEsNHdmyAgseIYAKCIB4WdL6lJ/LhFJhgIExEPgQFwAwIP2f+Y60jrSwRQzZvFPAsGzNUnFgD25dl6djQHZgGAsGYCOJ8oweQGXKkJ2CxQezDFQl7YDmxOuPC54TLBHdlHVCj+cbHstXBJEjBLmBgcebjSe7k9w36P+H7qP9cnM0ndOC4hGxxjkFmpWoygIR4AiwhibNEABTFM6PQ8hTkvshuw1tocCBjVl2x00ZjRBs3zpbEx/wzFW2oarnWRvABM5gMHzwAqTMC4bLOcM/DodnymHT9N5oFxYdhQNQZgwWeFEwdHmB0VX/EIwFC4gkgImo8yX/z4UGObn/1PM1KqjKtP4JRgIJKey3Qp60qzWqGUkbYMEVC1giCeQZSrs34xaW5B6xgz9zrKhPVVvKb1JQ3AXth7IRhADxPIawjKIFQH4PCk+nQqVFkdN1wlb3zjGwe7eKDEUdtP+mj4k90rCcI1GF4AtfwxAJseswAk0QCAfxZaBBFRR6UIT1MoZaRLTuz0Wk9DQVoRCBQBbTQCzAIT4NYl/a0BzU9qDEBmaCJNdXZYGAYwgQncsFkOHf6b5Pu8KDhoLRmIBqBsEjuaesUjYNKH4voCEoneY9uzDaNcmdh+g2pJwgvxJfXDU8IMwDC4BQGozpO7VHkAxgjAjSHxGDU3oE0eGEAUN7Xh4T0iPKV2ywcQK1ADAY0synW4cQBTbn4Ip/Lh3wq134QBTti41Py+HoIkng2h4q1NYuIh5tRmTRnnmRmQAjY30M4isuFjI8M3uIzYh4ceeuhK+2ymQSw4+Af7UqQkzSDmhIeAi2mk9ae+kmAA2nADBgMQlIU5W6dMNM+OwOrrC2BtpFDg4aUDT7n5Ff6g5/xHrhbLmxb9ZjNY9Bb8tA0/8zwDefOKafAURFRWMBeuGWCjkEycehaAGRtQiSjSXCwEF6hBSogFVygCPhDYAKbA9of0c4FC/kWXSSPOQ0mZELPsaLQ1kbDemgbg+UVJec+ZP5+pBuz1DIGANj/ztq8vgOeYqgpBAh+4SB6AkPonh8Q3SdJh2b4mb9rmHZMGzmxjBXJO7RIdJ0ZeQQ3cWFQduwzqzj+rdttGEQ1FDgAQSBCPCD4ajPBmGWIkgAKS3KHcoLSckPS0BUlCFhBXYdih7lViULSmHmn9NYBaPQDrLqr/Ei6EDsCQf1+BFzkaGACBp8x7bf36XuqUJangjovCAH6nHfdtlot+dJJZsQu2cMlJ1yL1a1pAgGrBTJgRVLMoJ1Ye431SV8HGjSBSAAOIqrCulzsPMwL8MX1sbpoQic87IIeCio9ZAAPhI4DCuFfvSx6ah9bfWwPx7ZcxKrQ4wiXKgkfuv8hMDECeB+bv2fEG9GEABENKKMIF9mwWIAjoUu14fKD7uBtXRzTA2KgR3X+jqlAwg7DDSV+awnoSqfCMZzyjK/gpddccWBg2MJCIVLHBtT6D+LtG0t13/E3iYx5MGZ6EvEoS02AsAroxpNBn2Ybes4HVMDGRZ8QE8F1MnAkgfoCPH6MG5vZpAAlIXIkDGPrmV9jwx6E6iWcv21+tddgwNguzYa3HkqpcbWxwGyxP6+RXjwe4HkQq6A1PXX/iE5/YqfZsf/djAVH7xQgoAQ40ImUsnsBFaAKKmQI5mQxx/87j73lp/73oBIOpuajFbUQpdvEeGD7gz5rDpGm9wEEa8EEHHVQFt4WIJ+3h7Hbs3gw4HTj6/HXpUdBRtm4uifsGqQwNr+VLG4IqJFmYXK2yuNSoTtMwBL9tQ8EH8tLMzAcPyQNYL2ITMgF4K2ASrjfcfOZGuK9oPqHR/P25r5nJQMKIQ7e4aAB5qXOSY0wD3hhS96+Wqi6MOzwx0etQco/nyESA7dAACBlAb02wSQdODGDwBUGu1Y6uRCok1OKeVBoskiGUT7KxxcLXkoRI7cMOO2zlYZCGJpVtZXMJnnGe1RiB83DFlbjAeqLpGIByUioiMwOYAH4fAyDdxYez7SX7YFLh1YisQcAlNyLi5cgbr4qNGNOAN4ZI8lqeCq0yNIAoyUbrtR6tNUIQ8wYC0vxqqe7wqITlrDCAZqBlwQ6xP21OC57K3tcpmJuE5IWYRmNONdXKvgBLm/ZP24TK7sCTAENcPGcA7G3RdesVUuveBPGw8YX32uCh5WAGNBIYAfswkk28jxnY/Dr+RLsvpkLe51CZ8LEO4MZ5AWp9AYDa0WciBJM1bV3Bvfj3bW45AsDeEgCn0Wkgkkh4/J0GxQCai0f3CfDpgLVAvGsIvxBWjRYywv7ON1ki42o2vEChPjLxAZD11RSYhC14WHzs60GuTaKP64Pq03CCAQH5mD3Q/DPOOONi1ZS5l0gRwGF0nqEq5qYUm3JWXY23NqLm12L5uWzDDMOMDW5BWpwkH5IfBgCrEbVZ03CZEcktTZ17+FAZwJMIY0kP7Na+DYdjxoJuliugvK4dT2nH/1rMtdZgJOakoqCOU2cgGAA7u9bHrU8r8FDWM6beImCm4PbMDeHOmBovhIwxhT9oCJhBgJQYE41A/IKFw00kMzA3nUQPjpGAG0Okeq21F9wmqgLb/Gx5Gp/nQ9uMQjYYAG9PjQEwI1JGoe4g+w6RAfD5H+cOpL3WwJKlVAA0uqi0hOVFZyDtwc8RQ03i1UC8opfAJlI2suRsaJuL12E1/CG+78Fy16wXQYCBgCQ9xgQbYR5R9WkfwDw4AUSZJyCKqFosTB8INO3I8REghCnCFNRWGGn9iYZYazPvOUZjkCAM23MVjxLrnXfgcY973CbhxMBCpnDZHXhoDOB2zXLb785lVZsoQyRUol80Wd5zk3oDCqio1Q80katVBKJi5+pxtAOfxARsft+hgkVK53oQkIibDy6CMdEEbO4wVWgHkoEwABs8zBj3LQYgqs5aTGIHcvtxEmMcKvGn0+rmCeDsqwkIywoAOfAYpdvC1I11xUyopRN7zpkb8H+b1DR3aADgIQHGCWvti3eOiKmWjmqW6wPE8QdgksAUUq2mOWAsk4i7pXTxhTYwiQnYRK9+9avXvasOKQHxP/DAAzvpHYAfiW8BMI1oBrSB8BIIPNlrr71W2k+TLLkvGhNRRGRRyIbnQsMQeTxohPPCBGhaeTfnpUp34DAB5AbwAIgSZNu7B/fi+dbWIKA3tXWjAdxm0AxAht7S5P5nsnH2K2IH/tQHFroJrbkK+conkYkHkjE/8lgCG7yWxx3SFzAX3V3Xi0gzIJ8cBDEMoam4LpgH21BRkNyd6Tu0BXZ+ME4pqQGuRiIKzWJRgED19EPDwSh5P9jO8+DpsKlr7cGB1nk0pnUobV2oN1BXHcdgbjTAmnlb9AbcaYgM4End1f/whx2wVUPhqUWJzNZdCgYgbPhCx9c0AIveYliNcFnx1n2uxzKJg9SNTK71JIvC4oZTWNg0msAAaAIkuYXEHRS+ZpubtHc/MAAEpyhNJOfkZx46qfNAQ6L9YOCkpQjS9TTN1kK8VrS1pUpZ8LIoK6ZsfXl+ecVmTV5qe4NgCLw4MIChMQDVfX6EW4tPr+X0Z2WPvp8DHc1v+wpeAE1lB9e8AFDyaQgTUCkXI8mj5payvoQi8HQa2shimurD26ykCKCTphOMisuIl4O6TyK4buqmxSIugvYQ3gSaQn4/qswMPRqQmhyt5DBDEXPWgfmIe7d2rA8uVQxvo7UCqeu1bEBegJIB6N8gtoSbVxJRXD/tryaMNAxJNNjmoNfDxKkxyhvVbG6uryid1NKxzXLZ8Dj+ieYIWJaruHkE36Q4gJrKTWoqIybIhivNw7DIgG2yADe6LgAJQqKRGAb1kLS34XkG+PTZ/OYO2IQ5+IyZIAoScwUGyicosRXaxVAJgEY1jjBZ92t++NeBxsGkbUAMgYkprHajGYD1lPd0zPEp2ktOKjdh9MzR8BC4XkKwxgBUdk4Y1GAZgBp/HasmWcOPXdo6wLbQitvhD+WPtBPr4nxFAtYSLozNRbsxJRLSooEuz4q48dRBiJRfWk3kBRiwCBpCMM/wUPiuoik2P8mnPHiOcTiHZKMhEvvYxncPYiCCAYiNYENHjAPXMk8NbQjYO4sEKJK8pgHQdqM9eJDQbVqmEN+oFoRUfKp5EfSFSAIJA9i5GWgY8F+6A1GAJFst9dfDVtYqYwJsnlckZtDZ47WyS8419O43JICgEPYhHIApEm5K9wwJZu8zB/wdLicMgLag3RQGwBTK58iGISmHlhNgk1CJY52EbUwLIv1pOuInSF4MwUbzPwY4C8yjrz2451jiU4QNTIdmF01tSXgNQ2tRrrTUFAfwg2ZoNQEzBvAnof7g5hHTvlSpolpEr/F/nB4SoZbUY8ErmDF0krwkqURqsoVjQUVBE4vFPQKKbH5oeL7RYSs2+Tve8Y4OIMsTU6jGkTA072QjsOXlNVgnUacBIzREO8I1VEGy0cNuti5Ee2au5A0lGE4ZCei5YUxQ/5xoLDw4nlE0tSUAao1BwgRIJJbmxkNlAPdOm7lLUonGlyXq6T1lugRW5AIykGD+01rdPxlzQyeLH0BEwlFp80YTFgtgUFITABCImYdUYxrMCN1mgYjUUUizz6DTKs8Mgfi7ZT6yp2NtRNAWxmejY2g2lfTpAEppj/CCWbkEMaRSO3VtQMBSA+Ct8UzcX7ivPfuyIEjcf5YNyJ87yFDgaPxxTPjzLdgA8GquD6ruMcccsxJHjbwuswHDRgb+LAKZG7YgoCuX4u6RxiQoSGxAFAeJhWJTUC2BYaQkYDNsUgwSkjzvmYECvYTU5pV1ImDLvVsTbGIhz2pG2mBRs4FQmSWGg3GXGq1nRmCVzJcnigmAkUcEK+1N+beyGIhnSONJYCckcFjJQAUT2KNZrmrSTVhwzCiAsVTp+SdaStMFSDbVqXQhOs5GoDIuApEEQDvqLJUwnxfakcWgwjGvRTCA8AyIJTdH5iL6DMaxGIbFNo9YgI1LhRZ3kUfTuf4QEEwi9+j50/ZydRs4OmsTpw8D8MxEL5ZMnobHC0Db8czNgfuvhaJjdphGwsUeMmQGcMV2dP46oAZJF1FvfUzABPD9evAkQG2SLW4ltRaBSOmPf/zjHQOgPpbqIMlOJWQfMwlsCh6V6BdIQ1A4hTtTUdEwtcwv0yqFlM4NsePlwUP1cwkadn+4Ov3NpMEIgJ5ee+7WxTw0huWhsj5rmiyzLCcYV7gMAbueOcas6lMNA8jSunkBbtMMsTNQxgSu345/cjdcVxZ6uAQ3p/qvBcKnSiouSvELbiyqsAURSUExN/zKEHAYAMA0Ng2JSBUGDkpdlvwkdFjk5V3ucpdOW6B2RonqeSBxH2xnzCsansTmt9EDAIxCqO4hwrYxR5mQJGgU3Jg1gMtTs1RpDpqk9woJbBLPYt2G94oGgEHX1nim3SqScc1m4EVBjV3a0aVIceVI5CkDfPqwgVrRRHYWibdIJIGEWpk3+wxpKFaAdAcauXdaQRQRwTDUR1RDQLMRaj/XGImJ0QIYLdZZk/wKWIZrr4V2u69IinLPcIHY/P73udiPebiXYAC1OhdU/dI84br0PubM7c0E4OePaMdyiFxNwg0gdqNmAcqCR4rwGbkbRZRgxFNHzf6ySm9Z0Seq5Jqk9c7Y20ii8sE94ACRExA5CuYGGCYRCI5iM5CWpGgkCQkJVqGGZsQ1GE1WbB6A4CyrBYtZUA2nDAaL0GYqL4kfQiB//hgcxoepaaoxL0TK1xLVaDdlkxmAnvv3HKOWZXQMrjEA4GBKB5ZWeLNmgToD/UE7jg43H1xAaCTfLo5vUcfinwQYYgKKfy4aySKzybm+wiUY926TQ4iBpBiAjSEQxoJjdwIJvY8xmtPAE8wfRrFa9uR6EEkIEVd9OX+GnrHF73nbRMwcmyOedVQ/8jnvEb+4eJJ5IklJtXqVnkVZUBazgHn4LKJfMeS+7sBCxBMNsyrwKkzgask9KGOic3bidqLiFOIU2SZaymDL1iIBFy3vPQcEbV4AJ0YQbq9QLbn+qPSYJVWa/U+DwjBsePMFJ+AvV4fBgrOJbCbvsy2jmMh6EvWWrWuTk+xl+rXNTiJS/Y2yRoPPPWOx8m9+85u7GJFZuvz68IxangptpmzO4rueD8bm2UadAGZdjQHQAlMk4PDSgadkAldIqo2eAScHIyjRYsEftZRLY1HiAGrETmTTRzJQYB/UesCTBSIfINBxUYPelzchh4C5EKBZ1EJ0vOAZqabrBaJZtIK3jjvuuGqiTKj8ipyQ/F5j8GXlJvcNLBbnT5rOY30DUt1c1zZvyawwAOAg5p27CJlrtbWt6lPCANgSN2wWuD24sW2z3DPw9e34QLJ7Vvynfe3Bs0SihSPSwb1zGVHzA/ALdNymFgoM4WdTkrTU6EDWo40Y96GAGUFGNhpmSnMQOMRVxRW1JTwpUeHm6KOP7rSQstQV0wXzcY02NsaVl0DLNTtaDpvfRinR9HkieEStLDhtrCwpT5DR4DA9TC2IRlZrkCOXI0uV32FhGMAqjGCbdtyrHR+PCZKmW2MA7GERcItMAE75/roA5SHCJLmFR0OwmAQCMZcwCoEmtAQqtY1oswMExV8ATgNkxSSk3OqaLJpwc4OFSHz5Goq70Mg8l7LKrbRvC58dT+13jcySmseHFiOs2flSVdy5ZgBleztzC+kvMQDZgZ6hZycDNOZOgFMtzkXkY2IA30i42UJvfjf4uHZ8pFluh9wtSO5CnDOq3pbRVvziNgFwizdBNB2pOW+BL5dUslKnSfN8w9ACBAaRNsKnLRjags3G1o/FaKNhFlBlUYNhDsSio4ILylF3wYKcRhug3mIa0Z6c54GbslZ23YIHSopH4AN3LX0t4UQyukYei41s1b65ZH2WNf08I2ZBHs7e+fLavwF+NDAZgOaZWQMcrc2FdOBwlrXjOouIARjXaIe0JwnSF4bU8/BlTFnMVMm+isJlchC1l+0LNQa0yNcmQftAqiG5B1UHinTh8t5tLBIW+AT8873wpcfckf5ARRLY5wGs+h7blM0pYcVChb3kGoGEI4g3SS9zUSCO89isQMYaRhNIvgGXINkjUSk+x4R4A2h4mNaJJ564Ut1nCIQB1jAAnpiyzbw4ACm+7lPAVjDSvjgA+E5aoxbwbZsF8wJQ9Q9qx6dj4wuqkCsAQLGJp6nhN6m2n4VFOoq1FhwDhInqrOrseRgCiRTfJEEBV/OcPw+55+cv0fTwmdtoXKMWpA3uf/deft/cQK4xBAyTF8F7BmlGWtvgfO7mDWBIMsMYSHp2LO3D79VUV9dD1fU9v2Ez1DJAXaMgGtgApoW5lIxn3smaqvnxzXtW6aojLkzzx0yzxkMIRfOactAMUtzG8BlAsfkhmnpu/Tqkm41vkeWbfnNChCdFDrLLqMgkUaRlhjSlJkPMATLzXE1XJRkbkt+/1AQCPWf/s0ttKvdMuoadWqrezkPLigSc8M8HRhC++Dw9ty80O85tQytuEpmLZbZctED3P60lqh5thGtyPUyAWiSgtZR1umpCwNHQzItw72B0wL6cOXt+5idzcQ83FLiy+XfIAT4INj9orTXSJRkBdJWYwVJqOR4SKY8wtFjZp5D1lIc9t1JHR6HochTXXzLMWEg2eVlPodQeVsu7WI0Zx3dCre/TDIKpuC6D+QAEU0BziDkdovs0+qhpoFm3qxUMQAAXYQNzCU9PHvYdBVAIwqzgLfP4us0C5AKIZ/5ESH191Wqtkdcy1tr0swxEselrG4e9Pa8hxjYKc8UiYltbbKUPvc9M2JJMtvYcYkSqcsytubbwI5yZhGTOcE8OAeybxABqyTx5/78gNShpAIQM7ASu0pcMZN6YqYkpKgl286EzAAE/p8Tm5y6KTLZLsvAg2LgqLux1rdzYpAVLfeMPz0uOkVAPfehD576qLhXTIgHG0QZyKUyjwhiibsKWNKeWKq3VzXuUMosNz/SI9F7XEJ2NeQOkPts8Q8/jAFjmbdliWNtlYxmpwxgf5szNySSwwWFQq2QDsiVu2gw4FViF37cF6imsM6960zeordQjo6ZSRrQU25EtRiryiWMu3GPTgIgWKCaQxxlEJ2Fq9jyj0RaPexcsw47kEoXsR9ivKDwYgMizcv58r6zAUytKEQyl1l8xkpACc6j1yAsGZEOIg4f12AiLQoDLWtNb91vmLehl4H0mGTMzmB8mXtPOBp8LkDGA3Ziu7sRirSVP5IMvmQtPzXzElWfSapNE+pUZbsAV7hlx6LVMrT6QMN8ENpEgmnnpQLOai5CrkyeDZLHIuJq4lxQJgepzE2JyGIJ4Al6AAJzCNUcyBQBoroF5zodR5Fl60HuSPIBUf4vcI9n97bMo2eV3LGTqMJV30YgGUMNXzHMZau3+eVdoAbwrAQLyRtXWZNYZSIeXWzQDrQZ0qWY5868DrxSrqDVTjE1H2sMGSuTbou0LHCH9+0g13WlArJIB+D3egqEU1QwbE3ZBEyD1uacwW5KXf13Yr/RrIar+5otWdo1GJiKQFmExYsCRXoxpYAA0hqjBwGsAe2DHes2W90xJQgwXAyL1feb8ZVLMIhEBUVubGF/ZGYjmgzGYRy5WGhwtoNYb0ODFiRCCdtxkqAzgjs1yLHMX3dXXkZfdLfAhS6AQAE5XvNDC5p+ubWIASsqY2oREA0aqpQXNLq6pqTUwMfzq4tqHQhYTKYMJqCJssZH8GOuDHvSgTqsSVWnRltKY14PGJbRVNKXcAkxCijaGAriLuAIFPWAkXKp8/TSF0Bj8jjlXtEMo7JCCrTaHVP6tZaqa9zwS0LPR+0H+gz0gzDkYAKFYW5PiAwbrBcgYwBsiYirCU/ts+WzzcxPeuVkuhPgbySAi1WqhwFkP9U3IohZwEaaDB+XBUHunAbdIQEUshkYWlU3OjQTHIJ0xP/MF8KSu27xapAGqhPQCpAzmFNUV8zR/otmYUsKIbXbMwOaHZjMXnJPGAHcR5y+vwDGLUqZtNWLa1BgAzSsHAc2HcG5MGUOmPYXg8hxq8RUYQJrH/x6cFyBt/isz4d3Bscce2yt9qatZI0uZgNun4/drx7ns21oJKedj4/YtNtKnbLxo0fZdR8kAAIlD7a+HCWCMJNTDH/7wToJzPwlAEY1GowpmgLnCO2xgPnmgqO/QyHyPWs/OxzwdA3fxPKj+tA2Mhnk3bR7BIpHCpLXNC7Mi9HIGILCHaSRKkn2PwVqjeZHcXAPNOmerDb7rEBkA4OL7FiKJkd9cHjChQGRoVClWII5/xmoYgFTXSWqmuPVc4ge6za7N49JrmAB1dhHsV1KdOs71plYgaU4zwgy4UKn08A4gHsxEYBZ73pxjgpgDQNH3LcrDDz+8qzEgiCsYzSKVZVsLWV9lzIUh3Lfszqx6FTMJw1UDgJYFv6JR1ZhIlgx0QdKGB6f+38P6c5MWV40BAIpS5p742wOLwKGu7Y/Y/b5IQQtx0uJjVghLLd1ZJJpF3gcOAnEkxiwaKU3N1qeeilQD0qk2DAiUTkwa0QSkq8JsqKoAK88gcvNJrj6za2sjPS9rsSc2dR5Sbo0CYWm7Prcf7AtaU9nZeSlrDZbmmRS66xAZgIyHi2RB1ar/xkSlmzwrBQvlx0sWOt/x1M9aZJvJW03tpAZTXfv81HlOQAS2MB2iBfWiURQAiSGWwKa2SG1w6ryYCmYbKSYWwthapfwkYiLWUqCZTXlVYGscs2CO+dx6BMRiEkyqGiiuavYg4wCaojEoNLS2gf1P5Yy5bFLCQzb2JMRxyrL2uuO5pKLDymokKKOvD3vOkHBmpbjmoeb8POAII02mM888swP2liplwfNmt5gurcr74b2i+WIMwRRKDIDXIJFswFsPkQHsYwOTKmyi2sZTyz4FRHDmP6BgAHs7Hqdkj9cmSdHLaReq61A8hDcCLgCNxWnZZcI5mQpl/PZII02iT3ziE1UvAIGVa5A0LRiA+AmFUxRvoV0xAfJkoHzAYlKQG5f4LkMEAbkuzgLS9VU9gYhmpZM+3I6rZwxgLwzA8SR9eayNayLXKqkEaET1YS4uvnFBGvOcBjzSfJJAsZpbmcmbmwDWKLyFe1CgFLWflmnNlc1BA4QWLpxchRjA7YbIAKj0yhl1UWd96reIp4Tk28nyJK+UjqcRnAsD4FapZfOJohoBqZFmRYC9Wr1KJm9uAtBiIf/CpAVK8cKodwhbEalZ2xeE3iBNgIwBXL4dJ7oD3K9ESwPIA87xJyfCCXSvuFM7xEKeC5DKC2LmdjuEeqSRZokB5M1cY2AKeUkwQkrMAOlPY4A1iW9hGqhlWdMAsjgAIODOzUAjAR9hU/OnSyyZlNZbtFP+eeJ8F0p7FbBSywgUgba1BZ+MND8k+7TmXeIZyLMBAX6CrMRTEGb+jzoIZTJQFE5Rri5pxhDpOwyVAWzXjs6hLuBnUuUf3FEOdOl+M1G4bC0bEFCy6PHmI80vCRW3bst1yc2XNwZhy0cVJ9mZvF+EImygrx4AoZcqUw0PBCyYgKyGi9hB7J3c514G4kDlAYYnnXTSSsKKSMC8YMdSUXxxZAAjzYpkV5Z9AaxpodJlTwN5EgLfaLoYgHgLa1ykZR8DSF4AGsDth8wAfr8dnX9N9BlpjgnABPqKdihmYXO/853v7LLS+lKIhbGODGCkWZFo0TKk3NqWd5EnA9EAxAFwA0pgE2uCQXhftGXNvJWPkeJRhMrepRl4SbCHtaNjZ6R7rZJqbYizrtXCz1WtkQGMNCsixWsSXKxJrgEwa+UNSLMm3CRQRUk0pkENR8AAUpi8csm7D50BXLYdL3E3blqnV33iVivUsdrnWcrkSCNtOHHjaXJarkt5/3kykGA3yVNMYEFCAtLEo/AO1OIADGHuWXfgnZsFqAosyEd9gK7QHj+pKjQYQfSsKznhpKq/1CaTNGoAI82KeKhqjUFE++VeAEJKTUBdrgSv0YKVusNAaLE1zVdhllA02rFjsyB9AS7XjoOb5TJHHWeE8iuWIHiiVsG2jwlgADKmhtRJZqTFImu3THQzhJaXvQHFuggbVgBERqahCEstl4AwlJ2ZolzZAXs0C9QZaCmpNFqfXBBmgaw9lYHkBwiVlDfNZ2r0VRFWTmk0AUaaFbHza3iWgqm5BgDtV08hgt50tZaF6X1er1pKsfboyQswrHoAa2AEV23Hk5vl1kcrthLfpygpCCg/q86/ClPUGIBQ4DFrbaRZEV+/lPalSkl77usgZqqKQMwFrd5FxjKBbXAhwrXmqhhGigP42WC9AFNqAzdox3PbcUa6WTv6/DS6xJ1a7fXIJhwZwEizIqHAMKyaGzvveIRRiAQUDavQytvf/vZOuBFySqvVvFy02xRMJDLujgvDAHqYQEQN6iHw8HYIhD7T3VOlymCLGCZ1pJFmRfJUANilH5/rOi9vz0wV268egPwVWYTiBHgKavUuRb1m+THDSwbaTAagiOieafN/07y5e0kVtUhACRPUJOWqAlSJ4pQjjbQRZM3Z7OXa5Bosux0zZbmt4QZcgOpTeF1rXkMjEAQXUEMzxM5Aa9j82yep/7F2/CpHWOUG8JP29ROI1lSAQnYX/6sKK9ot4bIjMxhpPenb3/525/KrFQUtG4Ow+5VjZ/sTahKJuBFrBW95vTCMhdMAmov3C1Tk4KUJBOzsfYER6qxxldRsq2lGtGqimqkkJOhC7fvcHhOFpQkGLmzMcw/AkeaXrJ2aCg+zygrddOtaFKAqVFze6gi84Q1v6DTWvFRd3updc5WMAdxm8AygkPpPSTfWEXVJySSuD6nBl7SbbR47IMFIXoEKQKeeempX+ks+dnS7wa197oGMtQBHWqsGUPNQ8fdrHBqkRwAXt8Yquk1x/xFA1r3K1rXIV5WaMxNg52ZB4gCEBD8uNr9ACHHRqqRM0zF4cxhBIKxKiEUFV0lIZXoxIEeoZhnAMdJIfcSGLwvWLqWioLnWyd337ne/u0sEEhHoMyAgN98BBxxQXbu+uxAaQCH5H92OXwT3JPFrQRBbYuPno6xCVHvfUK8AR859uCON1EcEGNypXH80y5TI0xGJz2MlDFj9SWsfA2CO1oqCWosiARMNMx24svnvBttzR1wkVCJqeK3Qx7TDseKma+eYJtFI1lZgBvF95+KbXdS+ACNtOeLGE99fYwC5F8BGZ+v7LlMUEKhTEyYRyUClUBLmnvJcnOhOQ2cA3Hv/7m5IVzUBajnQS5XKv6Kk+pgEld2E6rcO/ReVZUP3eQ1qgKE2YZhIXqhELHdRomykkTYhMSq1epXWd44nAZkJvD333LMLHmL/qyUQjKGmraoTkCpVO9GuzYALgtySxh9oqBtbbWPy++OMoqXe8Y539BYOYT9FJKBzc/vRLiCokixs7mkYAaAwmEx0B2Lblf3dRhopJ+68WpAaYDnXIDEAocCK21ij3H/yAWgAwOeawFI5OOW5DNMNmDEAYb7djYuGqrVSyiW+KqkSg6JOPwS1lnJpw7761a/ufThqrrGjpvEolGaE2AIlmXDqkUbqI23Ya+uZqp9rALACsSkSf5QRwxxorbAAzVZrGi4GkPaAmoC3bQZaFPRazXLX3y4wp6+0lyEgQt20rM4/A+giEp76VIuWesELXjAxHVjttWkwgfIz/lrX86EPfWhc5SP1Ejufvb9UaQySewEAf9zPYlPkAWAA8v0Jt1rTGwM4ONiCIBkDuC8NiDRmr9daKUfQjpDejBRBOIbiAEHtq5oisqqPAVC71AzMNYZpsIFgBnAAARsjjTRJA1DnbzUGIKpV1p8GOTpRAQG5mwUS1XoDGjThtLYHzQBe5Q6+8pWvdAE+iiXW1O8s6OE3SWN4TDueSgPAZdVHq23Ul7/85RNdNLvtttvFGADJ3ldfsIzEgkPo/TbSSH0k3FfmX80EyL0A1j+//ste9rLmve99bxcXAAx3PCFWW4saiKYI1cGaANu247PuQE+A6KEWfvi4UX73lPYI8dAabLt0/HPC1RLNRfPjMA65An1EfcqbikZQEO/DapqAwg1UMDbaSCP1kY1cqwfAC5CDgDpcW6uG9HZrWqQgEFBCW5+Ha7BegOa35cC72si6nNRscEwB0p/og9nmj0rCF3Cb1NQsngHcdBKxt/LNHoFAtBHlnPtiCAQEqdY6JhONNIkILrZ9TXrnjUHE/KtfqRw4ov7zVMEA1LSoMQAZhVl34OE0B802sFLGZwP1qD+l6m3zaZGUGoAA/B7cXDxwqPMeiJiyYWtegCxhoko4rE4sZUcivltSXsx2eV1cgkqScdWMNNIkoqKLZi3X5l3veteVxjZI2rC03yOOOKIDudn+vAC8TH0YgOIhqSLQsNyAzcXDfi/kDuFSq0laLZAz2/9+BQN4UZgA9773vauTJLRytZqAuO9+++03dQixGm8j+DfSNASky5N5ok6FnpU5OC21l8CxXpFCIvAluQR9JoAEtWQCDAsEzDbwoWEnqd1Xi/zjpgszqR13LxjA03wATc3BvNwEOOaYY6Z6UOwttlqtAUPu+hNY5OGMNNK0RMMUrWr9ECBea/gZREDRADQQkRLsbwAh01ftyxqGEAwgmRGD1QAOasf50PhaxlSoSilgghgHud8sO55JcB47aYcddqhG70mtnJaoU8BIXBjAAqgRCnyzm92sixp861vfukk/t5FGmkRi9bn2yu5V1lfEs5Di4ljkndB4CUSmg9gA2u3BBx9c3Rs0i0T/2o7rDJEB3LQdZ+J4uGQt4YG69Ja3vCWf05dnx9/f/NEAalVTTDg7anMIuIexKNrgQYyJPyNtDlnbhxxyyCbmLVwgTFOBbNEXUFg7hsA8oGmKeO2LcREyHxBCsxxQNzgvwJ2b5YqmK/HOUn9LF5zKP9/97nfjZtVRenw7LtWO/exVG7Xmaw1Om4MtI4200QwAwF2u6WzzdponTIlZwBS1+YGAxx57bNcdqGbeLqW+l4PEADIGcEhMggQdnX/6QnK5QrLEGztaSVQVEc4F4lGfal4AkzRW8RlplgwAjlUmqynpvYJut5uYFsv/T5g5BlPADCaBgI961KPCjBheWfDEAO7RLAcxdMSvXgvAwRBMoKCdPHwyeQYu6osDYAI4ZtQARpolHXXUUR0AmK9N7r4g9v7JJ5/cacH+xwCExosJmBQJqCZFWtvD6w6cGMClkxrfRQPy5wuR5A0ocwIiQOfud7975zLJwThx07U4AIP9FFmDI400C6Le541rrGPqfRAkX+qvgCEtwhHc6XnPe173Ps9AbW3LHEyBaFTjWzYDzQWISkA/xfnkRAu+IfFt+ppGIGNQ0U7fxQGpSrXa6wYEdWwOOtIsyfrMW3tZ09ZuTlx+Ylm4AxFN13uGpJ/a2t5///1zBrBTM+B6AJdvB7j+QrYP90YU4CjzAiJCMMJxaQQqqfZVBAK2jOG6I82STj/99E2S3PL4FOtT1SprNUxcZq2SYLxPalos9bS9SxjA8JKBKkzgGu04pYM0W/UeEyjtpr7gnL7SYZiCiKusfsBII204nXLKKV1eSR8DECtA0sMKolmI5CA1/2gPegXWcDHvJ5JPc71mAYqC3j7dTOcG0fyjVk+thg30fS6XIBVOHGmkmRCpLqgsX5eCynJPgX4UJL3eF+ICBAM99alPbT71qU9tUuwmYmVgBIk+147fbRakLPh9muW+fx1BRYU8wgVCqq+lSnDubhlppFmQmP5Yv+Gd0v0nyIY/9NBDu4AhyH8kA+mHARRUKKS2tmm3ieSk/0GzII1BokioGN5zwk3CHhLUozIQwM//OSPoK+fFDTiaACPNkj73uc9dDARUiFYBkJwUrqEBnHXWWZ3Gqpow7wFvwPOf//zeQKCUCzBcDGACE7hCOw5uUqRg2EUYgSaKIqQEWOCOOqrmbpZ8yPIbGcBIs8YA9LeINcllnReTZQLIQREJGFWCFJrh7qYJCPipxbhY9/ZE2iN3aBasOagh3PeAdryvHZ9vlmsCbEIiqPoYgCSevAPLSCNtNGn5pZp1Xg0oryXB88UtyAxQBgxDkAUoBkD0a62gSJEqvxjNQScwAgFDv9eOA9uhwsdH2qFMkGigiwQQ9YGF0ozHQKCRZkmkuhoSebGZvDMwld9G5/0KwBpTwCTEBVjDtbqUIgSTdmsf3GqhGECFCeRagbiBKzfLTUTP5TrRbLGGlOZ51yOtH1mI0YBlWvJ9QVqOJfVKRu29vmIutd/q+/1Ze4EwgLw/IBOAbZ/Pne9gAmGu8gLIC2ACqP9fE24yCtO9/aAZWiTgFmAExl3b8QuLKOKlJ6Vdbg4J0gC0mGiv43+x2tI1lX2mtlHXgDbKO9NIgDweqIAOgxmCm6tB+LrXva77/6Mf/WjXV8CQ8qzsOX8w0AjG4X8x41JEvWY3Or/z+V3ns0igzBBjPRPUQJR9xkesywxU2Xd1nPU7XsNR1Jw/4YQTuu+4Vu4nsejugUvKexpUHH/88c273vWuziXLdcUu5cOm1qrjKNedp0XItcCU97znPd13hK/6HQEu7lVVZ5jNi170ouad73xndz717iHZItosct4eaeHcW5pkcH+9+MUvbl75yld26bKO5SuHoPst73GTucb3v//9nU3sc/PqGMzf/YkpkRbuPsyP//2O8wHeXKP7d33avanM6xqd13t88eZYlx+BOaJPSWgMC0DtNebjtf+tkZwh+p6WX7EmlZPLmZ3jrQ/uwjjGbwhxl8jWVxDE3CeG8T8LqQFMwRC2b8fXzYBFCRjJvQGYgQXEnsJJNR6BF9isNhjgxYP2HQ8aEqsqqw1qgeoaJI5AAUceCItOfTYL1mLdZZddut7vorwULxWirEORfgEKiahRcMMb3rBLVLIA2H7CQF2XaxXtqD6887hewSKwDF4O/zvWdwFIXkOPSQ/n97sqITvebzvWb+YVjbRTl16tWIpzeu08vhuVj10D6eScfksbK+XOnctwbp1tfF/QlXMK03ZszfPiN0Rq+lwhFceU0ZyO97u+s1r/x3im8T3XF4i6a3Y/zhet450zd7mZJxGjjndttYrPPjcnfsdcOd75nNt1en7m1e9hVBgTpsdmx3R4mqwhYedA6WCGGBEmgqlYL3klnzxBDTMIYREMAFOQ5YrBY2R9AHfyAvxwa2UAl094QOcvrbURB77YiMKFvbZJPWAL0/9lhNbSGtqLT+ofMO1wjkvS/bg0edZ6nDnr66u4HmNz79W9YYDTNIzdnHmoPYu+OZ32PddrjWEwkdvifUKClhhEg8UAaGeYAY3Va9+hkdFqag1zaEmJvtoMrSDIFmQCXeF/8dY55x/HdJtvSzGytTCczWUCmPa0XZ03Z9ik04SfX1IGZA7ySECbnrkFBAzcg6nHxIQV6BRE+yh/g/aa6D3tuMzWygA6lE/FICrntA/6kkiiLS15tqYxztFyU5lI+w0NAA4Bo4EfAABpBEZEBOamnbVLq4CxJDo89sPWyAAAgT9lOwF0Ji0wti27zv/s3rDxSBVMwSTnJkHJJPw9qWrwODaemUxjEsyCsdWyWF0rswCeRMLnROUPDQADAP4BmiOQKE93p0EwZbOGOa/e6hhAxgS2aUenC0Gu+2oDLqXagtBgxRi4DvliATTUMej1SSed1CHgmokAADEUSCu0Wk428MffSoM7F1wBECONU902/Qm9D9TDXBQ3AaJR3wBX7DjMB8BE1XStAUxhRI4B6gEA/e1/oJf3nCvAOOeyIJwb8+JXDiDSa+f0O5iV8xhhi1qUfj/MJd8B9gEXAyjznQDzdLalWfmO88S5uV2vc53rdAClc0SINmBSwwpz4Dfck2tyH8q2+Z5zmRPv+Rs2wwzBfG0Qv+9Yv2Ej+V2/gUn7Xpgs/na8zeDazQHQz/X5TddvTsy1c/iOOfUd1+2eHWte+OnZ5kBA9+u1EnXm2r1IO7/nPe/ZHeM7mnh45p6Le4bUe06AXoE72twDla0dHap5HADLvDLAvdxLQOrzIBgYQLzmGfC3jV4GupnXrDfF67ZmBmDsSQswEybYQ+uzFT08iL8HxJWF01K1MAYegNNOO61TuTABDIAb6atf/Wrzvve9r3PVcWeJ2pKkxJPAdab0OObgQXvgWjzd5z736dxPj3nMY7rFtccee3QbwOLgZrKYMBLeASClAUV2Dt+36ER66T/ofdenBJTF/cIXvrBDnWkxFilGBI3m+lM/DlNSLcZG0z7Kb0GqMSrX6TddJ3TZPbsO4abQafMC4cYUlWgzFxgjN5jrcTw3XLg+AVW+Y96ptVyVFq455XqMohZqPkK0HWcw2cwryec8zslLwxVqDsy/Y8y7c/t9qDq7F7PmgsS8Vc3lIvXb3HRaavldr3l5/DYXn9dUbM/XZ2LtHec5+k22tsAbktk18Rx57RpsWK997jPx+hB74bpeEybxfd9N3Xq6MF3ry736nER3jL/5/dn+RriXDRvecUrlOya0gzyU2PDcs3yCrZ4BXLYdLwtABSAIIa15BcJVxLVjc/FDS7awiUgL/Qlwd23Dwwd90EEHdVLK5uUGJPlIYxuJZPDaBve/z/l5SQK+ZpvL+zZcuA8xDefEjGzqkP6SO0gJG9xvkIaYmWNC4vgMUxHfwN9uczzpSU/qzmPTYmo2lvdtpNgAcsttHD5tm54/3DxxI9k0NoDNTP20+CxsPm92poXre4bPfJf0Wmvgz5CJ2y6vLGWdhRS3af3vb3MUsSPmCkPA8DAdzIrW6RlgSDYwjdO5zbHzO5fjMVHv+RvjLAPdrF9MLNFrt0oGUDABjUZPiRnB7amYk+y28LXbmKFikaryB0haXJZaa6OSplRFm9l3o26h36CmUucdZ6P7jg1LqpO8bD7hnDYqsIcUk9CEwZCoYg1IXWoipkEiOQ+10vuao1gAJDjJKE9csAxNgnQmgdiPpA0pYvEJEiKRSGKfe02yWLgWlAUWC88iBTblC9jidc6UbNIt2ghoIsUwhpBUJCMJjXlxWdGU+L9JYpKdFuW+fQ/T8WwwHQE5pHh0wbUpaB02heMNm4cUFvSDiWFyzgc1dx02Aa3Dd2wygUHuR7xHSHSMzf8hbZG/zZe/w/UWTM0cmhdS2ly5V3a4c4bmggn6HYzSHAvicQ8xx8EEaAMGZur3fO77no/5dLzvUfmDwTje/UR1IM+47F1JYGXhxK/bahlAwQR0RzkxIvio66v5uNnDNteuu+7abUSqFjteBJ5NatMK7KBi24Ckso1KgvqOiDeDKmljR5SbBWLRWKj+J4mpuCSsjefhWYQWcUgXi89GjEVjEfqMqUF1jQ3pM/9bQD4PGzLURpsGo2Aj2hQWsc+8Fv1n01GtbRZaAU3IPdAU/E3V95vUaovfRsTELDqbUN56ROcJmmLusKvZ8JggbYS2whTBYJk+z33uc7tz+B5m6ntwADa1EVoTxokhew7m2v9+l02O6UbAFbyF7e2ZwCnY/2xw7bUEbrHjaYF+xzmcE3Nxb66deUaLwlCsE/Mi8o4JRMvyng5RNDX/e76YMzME4/LcMB7PMcwa8+w5RHivNej/3N6PEF/HRbMZzCeYQLzG2DCYMGtLz5V7dp5EfzIygN8OrcNOi8lmF1sAk9x+QCIbnRSLUFGLnqps8i1eNqcFxMbGGEipsCU9CFI7bEmf4d4WQKiAJB7pYcPy7+LwZYx6TaXGGGpFTS0UCyti6cOexEBcj+smqUgaGkNc2+GHH95JYPeAMVmINoHvY1AGBgZzIJmFFwNEaTK0EmHGmAUmQoV1fhtNVJzN5Vw2mNBs5pCNZN7Mp/MwX5hFNrpNiJna+DQp7zGrbGALXOFX/8MxMA5M2rOigQWgiSnY+D5jSmEEmLrXALrw68d5gYYwlgAOaXG+y8RzDv9jULQ/1wk/cc2ePy3PNWFwzDUDk8MIA3fAND1/z4C2496tH+9bV8w/zJdUp5nQGmgaEVJuTWDwGHZgCcEAcq8C5pf6ZIgF/qOtmgFUmMCOKVuwI7YXCTJJGyC9SCiSlirq4VngNgAJRIUnXYBzcAKLzuLwMOEIVHmLnQRxHguG9OQ1sGhgCjQN/1sEGI6NSY0/8sgjO7XZJqIpuF7AmN92Huo+296mo0oH4OX6AJCYjGARi45Ut5BoAlTgkCb+jth1f9dqJASjCSAqNwkstnxx+tv9WbzmivZgMWM6tAjx/za9+cFUSVX3jIHajEBHGAYTh9eARLdB2bY+Yz7REGgGGImN6xmaQ52kaWU0C4wDXmLjBwNwvjKgx3ltGt+1wZdS78hwA+fRgMw/AgMjwSCsG7/je/Fd/2NCNBK/ScOAEVlHjnf98BveC5pMuJ39NlCXaRTmD0bgeRIQ5h1T9nfkC5jD0t1Ja8I0EgN4yFbPAHo0AZUXz7FwqaoW2Wr+XIvTJqRe0yAseExBroFNboPblJgELk6SYg42r83pfxLQprbYLVrMQmy4h2ZBYSgRm29xkFR+l0SxaZgiUHwLyjG+Y+H4n+SyGElFjMViw1Sc36Ki1vpdm5PrEoMJvMA9UGUtQCYCbwapRNqT4hKEAjH3nk3LpPEeTco5aRAkIvOH6u9exb97z++5JtqC67C5qc3mzQaglgNNXT8mqgw2pupeSFebmwfFNWKqtA0eGzY/5mrD0F5oaswbcfk8NeF1wWxpJxgObYO5Qn33vvPBXKj6GI/rcu/OZ96YNTQc6wSDJtUlYWGwGAozyTP1e+bbfGJOAFq/455dg/v2LGgzzA/z5hjXTDvC6DF3awqDDtMNIw38AbMOrwHy/RIDwFxSl+qRAUxgAldsx3tDvbaQAXSrMQEqqUXH5saNLRBSk90X7h+qLxuQtI1FaeECikhjXN3ipUZaUDaHBWcjUJVtdqooScYLgYlgFDaTzywi6qVFRP3FNGx2KqrjfBcTIQUtBuo0KURDAVqSpiRonNfGxABJQMyGGkuqhC+eJPQ//znw0ebDKACQGAdbG2Pyfb9hc8NKYCMYjN93fa4XI8E4MAfS3L343HcxFhqS+8YsMRLuONqODYKh8p8HiMd0oRFFURdaCduZpPR//M288Z5N47kFgk6rCS/GNFTLHKUB2aj+97nzEw4Bgjp34DlhigUmEH7+0K6mKVHv+OgQjDA7mka+RmlBaU4wgIeODKCfCdwkJQx1BjbpVtZoL4cgFL5tDwCIR+rDA2xgKht7novNpiRZSEpgkc1jE5KGpBPpb/PaRN4HjDm3jekaInMNRuEBUz+pjN6zkUh8m4paSRPwWSSoRNMUGzoCaUo1MYJofMZu9j3v0TzCRUpVpl04lhSm7lKXXWME0WBaVNrobx+2qP9pNKSTa4vswsgoxJgieCeSY1xDZANGcBImRjtwjPuJTEIaQgTikPIkLeZEi8DMaA7MA8zOfNGYuGPNewC3noXrx4RoAzQJUt0z47HA2DA7r31GM/A9z59G4HuYsnOT7mHG+B5N0PkxWeexJjBLdr/jMEnMjFbhNwInIf2BrFR7m5uw8V54MDBDGgbhg8lgLDSmMqgtwwBGBrAKE7huO74UHJ6qbgInMQEblxpJbaQOCpqxuGxiamts2FqW1iXJ7ivDRzc3y6+8ni2Rcbja6Au+2tzfD8ZRnpcZNM35IppxqWgqk0cSLmVZgGVb+vJ8mNak34uIxUluZ4wWg8XUI4rTa+sJc6StYb6+BzOgrWF6eT2BpZQKjTGAbtrxsJEBrM4E7tWOT4UmwM4HCk2TPbeWTRihvUuXMBU2fq+vO9LSGtOE13IPNSYUm2atyVARPjwp47Cs47C0xuzCWWeBTnvtwWgCZFxrzkP+DAmiZAJcMGoA0zOB7drxoqg0DL2mXtak+Hpktm2EFK79Zmy+zWUkgYhvjjaSx+5PkoyrSdetPekpn3vPgymSVRX6s5EBTM8ELpVUpi7QGtDEVhwX2jiWBpI2jWHCsjJ66cgA1sYEjKdE4xG2FCTexIZdCLACRMEKAFMRMEIVA1wFgAdAq0k4x5cS3/lzNNfnkQk4jXawVk3FeSPN2TW6bv+vZ1GNedgk09xf7dgtXRgltK+8CEpoYbnGE2su1Py4PuuF1woADH+CPQE3AdKRKNTSl9tx65EBrJ0RREfi34SrRmQcHzH0mb+W+8lEc/d5XzAOdJibK6LbBL1AqKHBXF0QYa+hwdx5PACi4qDA3GVcY3zEQBzADlcftBhyjZlwxXngmI9otAiNtQB8DzPiL+eS85nj/Z73oNWQ8nDTcbdBnl0zZJvHAnruNcTf8X7H/67T7zmP15BzzM/frond6rq8D7WPnAnHeg2J97n7ECDlHDAWx3FXOg/Xo88db/gckg/4cj2G97gOnTe8CQBZvniuTGi4v7lqPac4l3PYLJEw5XtxPl4DqD1PjfNwo0bWJv+9+XJd0H1z7XNuNpGB0H/zy4vgM/fpGCi9eADPwXm97xzO72/ncozYASi/uA6/x6PEK2Dt+IyrmAdCrEKsL2vP/3Aqvn5BQdZhuB8zkg64cy7YRlobE7hSajzyBQ6C3M+8ll4Cue/Y64jNj4yu8P1y6Xjfw+RKFC4sUYcfWXyB2IGoNOz9SPJxPlFi/MriD5gtzukzASTOGSWlvXb9ApiEBTu3a4hgE24m70lC8bnf9Z7P+bL9hs/871pcEx+7qEOvncPv+r6wZr/lPv0uTcq9RUah649wZNdnTiPJyPf8tuMjmSYSl2KOHMsN6/f9lvnz++bCtXsdBV8d63sSbqLGXsxfJDSJBYl5iTBqc+Nv54nn5t6jUm8enp1HRkbhzogNiGuOXH6fuZa8q9UWyJ68KIHYP09BbuPm30LmgExCXURPTX7VIOlYJ6euRBHB8cvkUvx8Gv+cGIjXQrN+nLSKC9IxF1XGBZX3SjonHX9+9vlF2SK4WOyIjNV0bXH+CyvnvzCNX6Xxi+x7F1QWW/57cY5fp2vz3tkJUJ2WW/reT1Lthl8Wv3FOOne8/uWE+bkoXftP0jX8JN1P3MfPsjm+INs030/fuzBdw9nZvf0m9dj7deW6/y095zNTCW5VeM9K9/5/6e9fFfP1m/R/zNUv0/dI7TPa8Vlh/u34dLPc3df4aLPcE/OoNF6ZEn3ekKr+6IPx8HbcI2mw4+bfwozgWims8glpsm+XehReI/UpPDq5XPytHfPVk2dhu/T39VKLpgekLkb7teMx6VzG49PwEP84jUen/73/FqkL6Xfu344HJw3lMemaHpvGI9MC8d0j0+/cJ7k6H5d++7HpvPH7jj8oHauAyn3T9x+ZPvfZn6fU0iel4x6f/d7j0znul67N93drxy7pNRfrJ9vxzHYclhKyTk5m1unpb9ezazvunK7h4Gxu7p/O7Tv7tuPe2bz4/CXpPB9O13fP9Pu7pb54e2X3vkf6/1EJ8H1E+v4O6XuPyI49KN3jg9Ozu1/6TRjRG9O93CA965um8tu3Sq9vn9bIrbLff1Q65/3S633S790rSexrtuNq7dg2beKrpr+vlqpbXSobS9OMkbYsE5jluHRaaJeZ4ruXSd+99Jxcu05NV8n+vmoysZbS4r7qFviNbdMmWdrax0gzZgZDZjRb4nrm5b76rmGWz3vcsCONNNJII4000kgjjTTSgtL/B0XjX/9xXFPtAAAAAElFTkSuQmCC",
+    "/buttons/정지.png": b'x\xda\xedYiT\x13\xd9\xb6\x0e\xa0\x0c"\xa1\x15[d\x16-\x06\x9b \\\x91y\xf2\xa2\x0c%\xe3}4`\x94\xd1\x08\x08\x06\x910\x84\x08\n*-\x8fV@+\x8c\x12B\x03\xdd\xc2Ud\n\xa8\x10&\x1b\x01\x8b!\xc8\x0c\x82AM!2%\x92\xb4@\x90\xe1\x16v\xbf\xbb\xdez\x7f\xde\xdf\xf7\xd6"k\xd5N\xd6>k\x7fg\x9fs\xf6\xd9\xb5\xbf\x9d\x147\x17{\x99]\x8a\xbb0\x18\x8c\x0c\xe8p\xea?0\x18\xd1\xd0\xadGR\x1c\xd5\xe4\xf5\x13\x13\xd0/\xa9+\x0e\xf8H\x0cFz\xef\xd6#\xd2\xff\xf6\xfa\x1a\xaaT\x8a\xb2=\x13\xe5\x1e\x1e\x14E\x0e \x05bN\x06\x12#)\x91\x07\xdd\xa3\xa2/\x84\x84\x1f\xfc1<\x9c\xf8\xa2\xe4}<\x06\xa3\xea\x04\x9e\xfa\xfb\x8f\xb1\xb4\x85\xb7\x11e%^>\xd3\x8b\xbd\xdd\x17F\x89\x17\x7f8 \xae.\xc7\xa8)\xdb\'\x0c\x1e\xc8\xaa\xc9\xa9\x8d\xd6}|\xe4\x1f\x9e\xea]\x0f\x0f\xfen\xb3\xb3P\x9c\xec\xe8\xe8\xf8\xe2]D\xf4oOj\xc5SmC\xce\xde(\x8ay\xf1S\xe9\x01\x87Q\xcf\xb0\x91\xda0\xb3w\x9aJ\xba9O\x89\x19\x83\x89\xf7#\x88\x8c1u\xd6\xbcZ\xef\xbd+\xaflz\xf3\'\x85\xf9\x93u\xcb\xcbW5\x8c\x07>w,\x9b&\xf8\xb0\x97)\xf4H\xfa5-W\xfan\x0cF0\xa65\x88\xc1|\x04P\xa1\xa9\xb1-\xb6\xc5\xffa1\xaa\x99L\xb5\xd0\x83\xf1 \x9d\x8e\x1c\x01\xe91\xb3\xcd\x9b!PBu\xddo"~\xd3\x9b\x9aBk\xb0\x89\x86\\\x84:\xa8\x16\xf7\x91>\xa0\xc0\x91\xffS\x8f\xaeL\xfb\x9e\xd0y[\t\xaaw\x0eR\x04\xe89\xf0\xf3Az\x01\xf2\xcf<\xef}\xaf\x87\xe4@\xd5\xd3|yp\xc3\x02n\x04\xb9\xae\xfcL\xe7\xa3\xbb\xae\xca\x85\xce\xef\xfcJm\xd0\x87\xefP\xbdi\x1a\xafO)\x10\x0b\xb4\xaaw\x8c[\x82\xdc\xd3|\x7fHN\xc9gO\x99CiU^>\x15\xb1wY\xa75\xbe\xaf\xc5\x08(\x00\xdcAm\xb0\x86\x83\x8d\x98\xfbL,mR\xdf~t\x83\xba\xa0\x06#X\xa8\xe4+]\x19\xa7\x0c\xf2o\x00dMa\xff\xed\x11\xd1\x9e$Ef[!\xe0\xa5%L\x89-\x93\xa25q\xf07\x17\x82\xcf\x9f\x14e&\xba\x11bzAR d\x1c8\xf6\x9b\xd4\xeb\xd6E@\xcd\x85\x1f\tZ1\xdf\xd7\xb6\x18\x03\x839C\x85\x80\xb1\x16\xc5#\xabG\x143w\xe5\x10\x1c\x06\xb2\x15\xd2O\xe5\xdes#\x18}\xa5\xae}\x05\x8c\x01J{P\xb6(\xf1~1\xc8\xceD\xbc\x08%\xdar{B\xbb\x91\t\xe0\x19@\xe9{(/J|r\x18,w\xe0\xb7\xa0?S\xdc\x08Xt7\n\x10\xebv\x82\x8b\xbf\xc0\x05\xa8;\x02\xbb\xb6\x89\xd4\x13s\xdc\x08\x03X-a\xfe\xf3;\xe2\xdd\xd3\x0ePB\x1e"P\xf2\x958\xe7TZ\x05\xea9\xf3_\xe0&\xc7w\xe4\xf4\xf5\x01\x15 \xffk\x9e\xaf\xe48XZ%\x85\xcem\x93E0^\n\x8b\xd5\xc5\xb8~\xbc\x905\x89\x1fi\xb3\x13\x13\x97\x0b\xbd\x1b\xa3\x0f\x87kR\xda\xd0\xf9*O\xaa\xc1|\xd8\x8c\xf7\xe4ow\xdd\x08\xbf\x1aT\xaf\x151\xa3\x06\xa4EL\x9c\xc9\x1a\xc2\xf7@z\xf8Uu\xa2Da\xbbv2\xb4\xe6KT\xc4\xc44\x1f\x06}\xf7J \xc7\xd0\rI:\tr\x1dIK\x0f\xe5I\x9dU\x80l\xa0\x905\xc9)\xb9\x9e\x16\x16e\xdb\xb2\xd9\x9b\x8b\xe7\xbe,\xb8\x1f\x98\xbc"p]\x0f7\x88\x05\xba\xd4\xe8\xe7Sk\xf7\x86\x96\x8d+\x80\x1b\xda\xe8\xce\xd7oT\x01\xcb\x9au\xe6\xf0-\xbc\xe8\xc2\x1d\xa5\xb3\xd2\x95\xf5\xc1ARO\xe55\xeb\x00\xd8v\xcc\xa9!\xdf\x81\x9f\x0bl\xfe\xa0z\xab\xda\xce&5\xda,\x07\x91\x03}-V\xea\xd3\x03M\x978\x04\xfc\x87y5\t?\xb5\x03\xd3\'\xb2.\xc6\xe1\xb3\x08\xc7\xe9\x96+\xab\xe4@\xca\xee\xd0["\x97\xd4\x07\xcfd\xaf\x83\xdc\xee\xe7o\xf3;\xa8\xf1\xc7\xe1\x05<\x97\x9eb0j%\x01\xc5\xfbA#\x9a\x14\nT\xb2\xbb\x9ek\x0fy\xef\xb7\'W\x8a\xa3\xe0\xc26 \\\xe5J>\x07\xbc\xdcEj\xef+\x16+\x97\x98\xc7\x06kP\xceA]\x06\x9a\xa3\x97\x9dH\x0b\x89s\x95\x81I\x8as\x9f\xfb\x81\xe6\xbc/\xaaAq\xc7\xe0\n\r\xa1+\xb8\x11\x94:"\x12\xf3\xac\x15d\xe7"\xce\xf8M\xde\xafj?\xeb\x1dx\x9d\xebV\x8c\xaa6p\xb0\xc1pl\xaa\xabV\xdd!x\xfdR\x83x\xe53Z\xdeT:S\x1a\xd5\x15\x97\x94\x0b\x84\x86\xbe\xb7t\x0f\x0f~\x9a\xf1\x87\xe2\xaa\x9b\x18\xfdiZuf\xb0\xee"V\xb12R\xa2z\xed>\xd9}x\xd9\xe4\x8f&@\xbe\xe3\xa3\xa8\xd9\x9e\xd0?jX\xcb\xfdVyH&\xfei\xabX\xd9\x87\t\x9c\x12\x86\xce|(d{\x15+\x15\xda\xe9\xc9\x03\xc2\x01\x1c\xd32\x8ei\x00\xa7w\x14\xd6\x9c\xb0\x0e\xd6\x14~\xc11\r\xe3\xcc\xef#L\xc8\xa2\xf2\xf6\x18Q\xa1\xd0N\x16\x8d\x05pX\xf0J\x90\rygN\xd9\xfa$\xd2\x974\x843\xee\xd6\x8d*0_\xa2\xec\xb0\xf9\x99\x14\xb7\xe2\xe4g\x80p\x8ae\xe0\xaaYw\x14\x96\xc9\x9f\x16\x8doD\xc3\xd3u\x95\xb7k\x1d\x06\x9a\xfb)\x9a\xe7\xecJ\xab\x1e\x9d\x04\xad\xb2\x91\x10\x95`z7i\xa9/<\x8a&\xf5\xb9\xa7\xe1hW\xee]K\xc2\xc2Eh\xbam\xf9\x04\xfe\x86\x1b\xc1\x83\x0cP\xa2\xa7s\xbd4\xea\xea\x04N\x89Z\x82a\\^\xd1\xd5zCX\xc9\xbc\xf7\xc2\x1dIC\xcfE\x1a [\xc2\x13\xbf9\xc7\xb0\xe0\xef\x18M\x9a\x1b w|L\x01\xf4^UG\xaa\xc4\xa0\x01\xfd\xf3\xb2\x06\xe5d\x07\x85\xacI\xf1 *c\x8c\x82\xfd\xa0\xc9\xd3\x93o\x7f\xe1>\x8ax\x93\xa4X2w\x05\xb2\xef\xe7\xbd~\x95L\xa5\xc9\xdb_\xc1\xe4\x91\x83\xb2\x8a\rY3\xc7y\xb1\x10\x83\x1a_8`\xf1\xf4?\xdd8Q\x8dZ]i\x0fU\xd3\x82M\xdf\xb4\x06<m\xc1\xb1z\xf8\x997|\x13\xee\xb2iS\xeb\xe7F\xf7\x14\xb6\xcf\x98d\xa09\xc8u\xe1x\xef\xfe\x18\x7f;Kcy4\'\x95\x8d\x8atb\xa5\x0c]:<\xf0M\x99#\xad%\x0c\xe5]3\xe3\xf9-D, T\x9bYV\'\'dT\x13lR\x07\x16\xfd!\x81y\xb7i\xee\x94\x81\xce29gg%V>Hh\xe1\x9b.\x18J\x03(\x01\xc9\xa6D\x14\xdd\x05M@\x85.\x0cv\x1e\xf2\xb3\x0b\x033<5\x0cX\x0f\x87\x0c\x0b8\xa5\xd8\x98\x13\xa5U\xee\xc6@\xdd\xc3Ve\xe6/\x89o?\xe0\xc1\r\xf2*\x11\xb72\x06\xf0f\xf5\x93u\xd5\x07GS\xd6\xc1\x8dc\x8e\xfeO:\xdf\x1e\xf77\xae\xd3\x80\xf3\xcc\xbb\xd1\x14F~\xd9\xf1&\x04@G\xa5\xfb\xa7\xafUs\xf0\x977\xad\xdf\x04\xeco\x91\x0c\x0e\xa4,\x14w\xf8\xd4\n>\x98\x1cR\x942\x8c\xf9P\x0fXO\x06\xb0\xf2A\xdf\xb1\x00l\x8bCs\xbe\x95\x1f\xee\xb9\xd9z\xf3\x91NU4?\xa7\xb8\x02u5\xad4\x9e+\xff\x9f\xd8H\x8c]\xfd\xf1.\xde\x0b\x8fk\xc7`G\xb3\xee\x00iI\xc3\xb3*N\xfc\xa9\xb2\xeb\xaf\x16\x08`\x93%\xcbY,\xa6@\x0c\xdc\xf8\x01fx\xd1\x04\xa7\xa0\x12-ag\xa7\xce\xf9^\xb9\xd0\x9aU.\xb0\x1c\x93\x13y-\xcb\xbe\x14\xc3\xec\xeb\x01\xcb\xe7\xf5\xa7\x8b\x80\xcd\xc6V\xe5%\x93B\xbb\xc7\xbe\xbc\x92Fm\xec\xf3\x9d1\x15\xd2\x8cx\xb1(\x0f\x9e\x03\x9f\x8b\x8d\x1c\xe5$)>\xe1:\xf0g\xbf\x0fVv\xe4?Y\x1c\x95\x1bmDw\x96\t\x04\x97\x9bL\x9f\x04\xafG}\x99\xaa\x1c\x912<\xfbe\x858\xa8\x06\x08_`/\x89\x8c\xfe\x9a\xae%\xbc\xf1}\xf0\nm\x9fs\x92\xa2.\x1a\xb2\xc9eM\xf7\xdf=\xc2\xf1\xc8\x98\xf9\xa0\xf0\x9e\xd9\x8eK\xca=\xd5\x85\x98\xa6#\x85vw\xd0[W\x8f.\r$\xb9&\x9bb\xf2\xa2" k\xae\xfet.\xd84\x18\x80\x8d\xcbq+nC\xd3\r\xb3\x95\x16\xee\xc8oC\x97n4\x83\xc7\xa7)\x9e\x1d\xd2\x007*Q\xaf\xf5Q\xfb\x11\xad\xba\xb06\x85\x0e(\xde1\xb9\x16\xd3\xfd\x8e\xc7X\xbd}\xb3\x8b:\xc1\x0e\xd0\x9d\x0f\xb0I\xdd\x8f\x06sH\x9b\x82\xec\x85\xb1al\xa5\xbc2\xcc\xefay\x98\x14\xdd\xd2\xd2\x18\xbc\xd8\xc7\xd9]\x9b\xaeA\xa1|3+\x06}\x9f~\xb8\xabD\xf5\x1e\xff\xcb\x0e=\xeb\xa06\x05\xf4B8\x7f\x1b\xbf\x85_W\xae9Gm\xa8j=;\xda\x8a\xae\x89\x9d\x8d\xc8\xe8\xb0b\xc3!\x1d\xb3\xb2\x9d\xfe\xe2\xe8\x8d\x13\xfcl\xa0|\xb5\x8b\xba7\xb4\xe6\xd3\xa2\x87\xe8\xe4\xca\x8e%h\x8e\xb1Jp,l\xdf\xd2\xad\\\x81\xbc\xcaL8\xc1P\xc6P\xb6\xa8\xfeO\x10R\xe2E[\xbc\x0fl^\xfe\xf2[e6\xba{\x92\x86\x89g\xd1w\x08\xa6\xd0N\xbaP\xdcMgO\xe8\xee\x83\x83\x17\xd5\x071\xa1\x1a6\xa9"\xe8|I\x8a\'\x9e\x9c*\xfd[\xa2[\xf1Onb\xa5\x99\x92\x86\xe2\xdf\x85\xd6|\x17\x8a\xa9\xdd[\xd8\x8eA\xdd\xb5\x91\xf9\xc5\xf3\xd0\xe0\x81\x13\xa5}6\xa5"\x83\xa7\x93\x14\xc5$\xb7A\xb7A\xb7A\xb7A\xb7A\xb7A\xb7A\xb7A\xb7A\xff\x02\xfd\xb3\x98E\xb9z=Z\xab\xe6\xbc\xf8\x02\x96\xfbD\xb4\xa3L\xf9brme2Z\x8b5\xe8\xc1J\x9e\xb4E6\xe0\x15uF\xbae\xf7e\x90\xff\xf1\xfb`ICz\x06Z\x8d\xca\x80\xe5\xf8\x88v\x15\xd0w @\x17c\xb0\xe2\xef\x99^\xf6\xdf\xaa\xc2rG\xbe@\x87\xb5r\x06\xca&oYZ\xd1\x11\tOZ\x04\xc13!\xbeSUk\xf0b\x84\x07\x94\x87\x02\x9f\x80\xa4\xcd\xb7\x8aF{\x88\xf6\xec\xc3\xdd\xc7\xd4\xb5\xf3\xff5\xb1\x15\x1c\xa6\xc32\xc9B\xce}+*\x13\n\x90n\xd4O:\xb2\x84\xbd\x14 \x8b\xd6\xef+l\x80L\xce\x11\x84\x81M\xa3(I\xd0\xb4\xd4\x81\t*\x1f\xbd!D\xd6\xbc\xfb\xdb\xb8\t\r\xa90\xef\x16\xd2\x81\xe5\xa8\x1c\xb1JP^K\xc8\xc1F\xd2s\x11G\x95\x8f\xdf\xf0\xe7\x1d\xf9\xb2 \xbd\xfe\x03\xed14\xd1\xb0J\xc2\x18\xcd\xbe\xc1M\x97>\xf9p\x11*A\xfd\x8d\xa3\xb9\x15\x0f\xdd\x02Y~\x11\xed\xff\xae\xe3U\xcd\xadx\x8e|\x1f\x95\xe1\xdf\xb7\xfc\x1f\xe2\xcc\xed@\x0b\xedKP\x82\xf75S\x8cR\xc4Ax2\xf0K\xea\x0e,\xf37\x94\x86z\xa43\x06!\xc4\x16\xe4\xf2\xf4%\xfc\xe5\xae6\x16,\xa5\x01<\xae~\xb2\xa5Ki\xdf,\x93:1\x1e\xc0\x92\x01\xd9\xec-\xc7\'hH\'6\xf2h7\xa9\t\x88w\xb7I\xf5\x94\xa0\xc6\x9b>\x0e\xd7\x8e\xc5\xc1\xcf:8\xae\xfe\xcb\xa6\xf7\x90\n\xc8"\xae\xcd\xd4\xf5\xc2\x98\xc3\xe7\xccL\xaf\x97t\xad\xff\x95\x04\xc5\x14\x8d\xc4\x85\xa2\xdc3\x10\xa5\x11\x87\xd7c\xa0.\xb3\xee\xc5\x19\xed\x07[\xdc\xea\xe6\x1fc\x92W,`\x01\xd5\xe2O\xee\xa5A\xd1\x86\xdd\xcd\xba\xcd\xf4\xe0\xe0\xbfl\xcf\'@\xcdN\xa4\x98d<\xcf\x99d\xbb\x050\xf1\x00\xe90\xfbF\xe0\x00\xd3\xbe\x80\xfd\xe7\xfeM\xffh\x1c\xfcM\x9e\xb4J\x90H\xd9\xc0{\xdc\x8d!\xce\xe57\xbd\x9a\x14/\x94>J}\xa3\x8fSK\t\xb2\xdcG"\xcc\xbfW0C`\xfe\x9b\x8e`\xf3\x9e\xf3\xe8\x04.\xf6\xe9\xbd\xa0\x06\x0c\xe3\n\xdc"0G\xf5\x1fKS\xd7B\xb2\xc2U+:\x83\x8bG\xff\x86\xb2\xdaXG\xc8\x8f{|n\x00ot\xc4\xc4K&\xa7\xe7\x06.\xb9\x9f>\x12\xc2v\xd5\x14f\xba0F\xf7\xa2\xf45B\xbb+\xad\xc7C\xb6y\xfd\x87\xe6\x86D\x85F\xc3\xf5\xb4\xbe\xd8C]\xac>\xbd\xe8\x07\x1dY\xdf\x85\xd2\xca\x97/H\x95\xa1\xccY(^\xba0\xdb\x82;\xeaDr]%\x1et\xc8ru\xf5\x19\n\xd9\x7f\xeeTiD\xfdU\xee\xcd\xd3P2\xc3\xc2\xd7d8D\xb5e\xc6\xcc\xa0\xeb\x92B/J\xa5\x8f\x92]\xf2\xdc\x08\xdf\xa3\'};M\xc0u\xe2?\xc2\xe5\xed\xc6\x18\x05\xf8A\x9b\x0f\x90@\x95`\xf6\x03$Ue\xba\xca6I\xf1q\xacK\x96y\xc0WsV\x83:<n\xce\x12\x1bM\xc9\xa3z\x8fE\xb0\x17q\x1d\x8a\xd7\x9a8N(\x85\'x4\xf2\x1eit\xc5)\x1b\x93\xe9R\x9f/\x94;\x93\xaeM\xe7r\x1fV\xa1\x17\xf6\x11VC\xe8\r\x95D\xd3(\xc7\xe0)\xf0z1\xc7)1\xfcc4x\xd9\xb1@\xd0\xdf4\x1bNm8\x18s\xb5Z\xb4\xd0N\xd6\xb2\xd7\xe3\xeb#*X\xde\xc5\xd7\xde\xe7\x9f\xcf\x86\x02\xb5\xe2z\x1d\x1c\xb3\xacM\xc2y\x16\xd4\xad\x06L@\x02d\r\x93^\xda\x857g a\x11\x07\x8f\xbe\x9el\x02x,\xfe+\xc6\xb3\xc3x\xac`i1\x1aM\n\x9f\xa6n\xe2\n\xf03uU\xef\x1e\xa3K\xe2DDI\xbc\xee\xcd\x05\xd9\x05ML\xf3\xe6\xd9S\x90|\xfb\xd8\xbd\xa8\x83\x83\x9ffn\x03#e!K\xad\xa0\xef\x9e\xe6\x95\xc4!\x9f\x1c\xc4x\x80G\xab\xa9 \x13\x86#\xb3\xd3t\x81\xadnO\x16\xb5adQ\xf28\xfei\x9d_\xf6\x94\xcf\xdet\x9b\x1b\xf9f\xf7\x10\xeb\x0b\x94\x89\xb1\xb9Jn\x05\xd9\x0f\xbaC\x8d\x0ft\x16\x8c\x1d\xb3Iec\xb5\x84\x0c\xa0\xf7\x0c\xc7\xd0*\x1f\xf9\x19X\xaeXTla\x93.C~]\xfc\x07\xed\xf5\xca\x96\xd1\xf9\xbd\xa8\x8a\xa8P\xd8n\xd6p\x1c\xe6=\xdc\xc4>\xaa\x88>\xd6\xe5\xb9\xba\xb7 P\xa4\xa9\xaa\x15\x7f\xdd\xd5\x9b\xfee\xd3e\xb5\x10hnn\xbfT\xf9S\x92\xe2\\5ky\xa8ix\x11\xf7bI\x1aTU\xb9b\xe9O6\xd1\x81\xcd\xa1\x06\xcd\xb9\xb8namCv;\x9a\xf2\x86\x03\x13 Y\x80\xf2\xe5\x979\x15W~\x9f\xfb\xc8\xda\x8f\r\xad\xe2\xe3\x9fN@\xe8\xa9\xbe\x01\xf4zsN8B\xb2\x81R6\x9b\xc9\xa7\xc9\xff\xa35\xd7\xcfi\x06(\xfaE2K\xd5b\xe0F \xa4\xe6B\xc2C\xc1\xb2M\x1bZ\xd4\xb5\xbcQ\x8b\x96\x07(\xf8\xc2] !\x03Y\x93\xf1\xd9<\x03\xc5Q\'\xf25\xdeXe#\xe1F5\xfb\xfd\xa3{O\xf3\x1bp\xd3\x19>\x10R\x84\x0b.\n\xfb\xfd\x1a\x9e\xfb\xce\xb2\xa9p\x8e\xb13I\xf1\xb0r\'_za\xdeY\x0f\xc9 \x80\xaa\x9d\xd5R\xef\x17\xdd\xad;\\\xd6\x9f\x7f\x15\xcf#\x1ft\x8c\xcf\xcf\x9dJo4\x80\xd6\x18\xc0\xa6E\xde\x9d\xea\x8ah4\xa0Y\xf2md\x0b\xbc\xc1_\xcd\xcbar\xbbb\x8b\xb6=\xd4\x00\x1c\xda\xca\xdd\x87\xf3\xef#\x87\xc1\xa3o\xff\xb0\xc1\xb8\x0c\xf8\xe0\xd9\xc9\x82\xe7T\xf5$\xc5b\x15\'R\\\xfb\x82\xf8\xceOS\'A_5%\x89\x03\x0e[}TF\xfc\xefSax\x9eH\x06\xc6\x92\xd6M\xf2\xe4\x8cs$\xb1\xe2r\xa1\xc4~G\xc6\x84\xcf\xb9\xe9\xe9\x87\x18\xcf\xc5gxn\x91\xf0\x03FI}p\xb4\xa6\x15\xbc\xaee\xa4\x80\x11\xd4\xe9\xc1:\x9c\xf1|\xe2=7\x82\xb8\x04u\xcd\x1bz\xcc\xb0\xd8\xbfs\xf4W9\xf0\xf2i\xbe\xfb\xa2\x95\xa2\x92\xe6`\x0e\\\x07^Na^j\xf9\xa8\x0c\x92l!\t\xa3\xc6\xef\x1c\x92\x14\x05c\xd9H4\xdej\x96\xfb\xd6\xd0?\xe3\xcf\xae1c\xe2\x1f\xb7\x8eH\x1a\x06Ek\xc3\t.$\x8a\x05v\xe7\xf0t\xec\xd6Q\x05+\xfbw%%)2\xe2\\ \x1dj\xc3\x11\xd8\xdd\x88\xb9\xcf_\xd6\x94\x8e\xb4\xe2\xd9\xe9\xeb\xf3\xb7GD\'Q\x07\x9e\x99d\x042^\xb8\x02\x94YT1\xef\x8b\xe6@]8\x15\xdf\xb4,\xed.\x17:o\x94\x0cyg!\xb5 k\xf2\xf3\xd9\xc4\xb7\x9c&\xa09\x13a\xc5\xbe\x84\x8f\x1e\x1a\x1c\xeda\x81\xfc\xc3%\xd7YltHh\x01!\x1c4\xf6\x11\x83<\x9f]4\xd5\xc2v\xdfJk\xb8\xd9\x81\x04B\t\xf9HQ\xac\xc5\xae\xf1O)\xc0\xb2\xa60\x1c\xe4\xba\xf0\xad\t\x12ZL\x9a\x1bA\x0f\x8d\x91\xdf\xd1\x98\xbb\tL\xe6"u \xfd)l+\xe2\xa3\xe2\xcc\xbf\x025;\xf0\xa7An\'i\xa4[\xa4v\xfe\x88Mj\x18\xc9\x04\x16@\xb4Ld\x06\xa4Sf\'O\xbd|q7\x8d\xbe\xba\xdc\x056\xc5\xceN\xdaS\xd7*b{\xef\xea\xaao\xff\xd5\xb2-\xfe\xbf\x88/\x9b\x98\x92\\\x89\xcf\xc6b\xac\x13\x18\xf4\x03\xda\xba\x9c*\xb7\xf1\xbf\xf9/7wl\xfd',
+    "/buttons/재생.png": b'x\xda\xedziTSY\xd6v(JPi@\xad*P\x10\xd1\xb6K\xf4C@K&eR(Q\n\x03(\x19\x80\x08DQ\x99\x02\x011\x0c\t\x93\x05HY\x1a\xd1FA\tCQb\xc0$L"\xa0 \x01\xb4\x85RD\x84p!\x8c\x11i\xc4\x84Y\x13\xc0@\xe0=\xf7^\xaa\xab\xfa{\xfb\xff\xfb\xa7]\xcb\xb8\xd6=\xe7\xee\xb3\x87g?{\xefs\xbd\xec\xe6rD}\xad\xceZ\x0c\x06\xa3\xeet\xf4\xfb\x13\x18\xcc\x17A\xf0\xdf\xd5*\xe0\t\xab\x83\x92\x00\xfeY\x13v\xd43\x02\x83Q\xdb\x00\xffU\xea\x18\x88_\x04\x0fu/\x1c\xf6\xb8\xe0N=w!\xea\xd4\xf9\xb3\x18\x87\xb3\x94\x88\x98\x88\xad\xee\x17hg\x02\xa9[qT*\xa5\xb1p(\x16\x83\xd9\x8aq\xfa\xfe\x10.:{b \x817+\x8b\x13\xcd\x19\xd40\xc7;\xbe\xd8\xa2\xbc\xe6\xf0\xf7\xab[yZ\x87\xfd\x84\x8f.\xdc6+\xaa\xad\xf8\xf6Z\xef\xb9kzfLwF\x11m\xec\xdbW\xcc\x89D\xe6\xb6\xc5\x9d\x1b\xc7\x85\x8d\xe5z\xd5\x11\xef.`\xfb\xef]i?\xd1\xe3\x1c\xd2\xfa\x97\xcb\xd0\\\xc7\x9bK\xc9!\x87\x0e5\x1e6d\xb6\xa8H&oj\xa8\xde\xfaI1c\xa3]\x9d@\x9e\xcf]89\x1ak7Z\xb3Es\x8d\'\x9e;\x15SM\x1b/,\xd1/\x1d\xbb9\x9a\xcb0\xc6`\x9a"~vS\xc6lL\x87\x7fn\xfe\xf7\xe7\xbf?\xff\x07?\xc3{\xacN\xe4\xb8\xe7\xe0\x15\x0ch\x93\xd5\xf2\x18\x11\x97\xe0\xa1W\xba4\xf1\xba~\x89%\x99\xe3\x96\x1a\x9d\xdf\x85\xc9\xfe2\xbf\xe9\xd4\xccG\x89+>\x13_Z\xbc4,y\'y\xe8m=\xdc#1\x84\x96\x97h\xcb\x8b\x04\x99\xd0\xcbdU\xa2\xd9\xfa\xa0\xab\xe3\xb7 \xdf\xa2A\\\x1cU\xf6 Nn\xa5\x89\xcf\x13}\x1e\x15\xda*\xd41B\xb3\xfc\xa6\x00\x1fO\x05Y\xe6K8\xd2Wo\xb9\x10\xc9?1\xe0\xad\x88\x95\xfd\xa6\xb4\x1c\x82\x99W\xb1g\x1e\x7f\xc2\xa9a\xcb\xb9\x13\x93\x13\xaf\x14\x1fO\xca\xec\xf0\x16D\xcd\xdd\x8c\xb5\x98\xbe\x1f\x8a\xca\x1f^\xc9:\xfd\x01\x0b\xedj\xc9\xfd\x18\x12W^SQC\x15;`\x84\xc6\xf6\xcc{\xd9\xee\x03\x04\xef\x81\xc6\xfa\xba\x98\x07\xb6\xbeu\x15\xf4\x0b\xf0\x82\x86=\xf3\xdb\xc5[\x92\xedP\x8f\xb3\xfe\xf9\r\xb9%\xa1\xc5\xb6\'\x15\xedO\xab1eC\xc9:\xaa\xe2~\xc9\x14AT!\xdd\x16\x1c\xc6\xa33\x04\x16\x8eJd\xdf\xd5f\x1a/\xa3\xf0\xcbq2=g\xfd\x07\x8emfq\x0e\xd2\x9a\'zk\x1bl\xd7\x05mN\xae\xf7T\xe0RG+\x02je\x17dQY\xfc\xb0\xe9\x7f\xc0\xa2\x0e%\xeb,\x88\x8f\xca\x04P\x02\x10\xa5\xfa\xcfhw^\xdcn;\xfc\xaa\x06\x9d\xd5f\xb3-7$\x99\\\x0b\x93\xb8\xdf\xbe\xe0{\r\x9c\x88;\xe0k\x89!k\x82\xfdCGe"<\xd5s\xfe\xda=\x9b\x93\x03B\xe9~\xf3\xe5$\x95\x86\x925f]\x137%\xda_\x05\xfaN-I\xe2\xa0:g\xfd/\x1a\x86\xfe\xda\xe9Q\xcd\xe2\xb22lO\xbb\xf9\xf2\x06I6\x8f\xa4\xdb0\x9b\x81a4z\x84\xcc\xcet\xd2\xf5\x10\x93l&\x0e\x8f\x8b\x97\xea%fn\xed\xf4\xc8\xbc\xc2I\xe8=oW\xb4\x84\x93\x9d\x11X\x98,\xff"\x1f\x86\x0c\xb9\x02V\xbc\xd2\xa9\x87\x81\xd7\xfd\xb9\xae\xe6\x8a\xab\x19N\x9a\x18\x9f\xebn~z>>\nG\xda\x0b%E\x9d\x1d\x85\xae;\x93\x87\xab\xef\x91\x12\xde]y\xfe:\x10\xbb-&P\xa6\x8f\x17\x11\xbd\xcb\xda,^\xcb.\x08\x9a\xfa\x8fd\x9d\xfe\n\x93k\xd0\xe9\x91\x9a\x86\x9b\xea\x1d\xad\x9f\xa1\xc8\xb8\x90?\xd77xmv:\xed\x07Y\xafD\x95\xbb\xcc\xd9\x1b\x1f!}\xc1n\x9b\x03\xf1|\xf5\xa0\x10\xb3gm~\x93O\x1d[\x0c=T\xd0\x83g\xeeK\xfc\xb3\x1c\xcf\xcc\r\x1b=\xdd\xc7\xa9\xf7R|/\xa0\xde0\x9e0\xc4\xda\xc9\x97\xe6*\x1aU\xcad\xc9:\x8c\xf0\x02\xb9\x88cW\xe7\xda\xb6\x8c\xa39\xa8~\xdaT"\xc8\xdaa:\xd8\xb71\xcf\x9fQ&\xce5\xd9\x1d\xb7\x1a\xd3\xb2>h\xfcy\x1fw9R?w!@@\xfa\xfb\xdc\xc4\xb3\n\xdf\x97g!Q\xb1\xb1\xcf[j\xfduFV\xbcTq\xf1\x9e\xa6\xd2\xdb\xb7k\xcc\\\xbaZ\xb8".?\xa2\xb5Mq\x04J\xc3-\xd3[\xdb\x06\x98\xee,\x1f\xcf\x85\xcbl*\xd3\xb8\xb5@\xb5!cCP6\xaf\xdes\xa0\xf2\xbd\x7f<G^.\x11\x15\x7f~l0\x96-1\xe0\xd6\xb7o\xa4\xa6\xda\x92\x14\xf6\x82_\xa6\x87\xd5D_4(\xad\x0b\xca\xbe\xba\x1d\xaa/\xe2\xfb1\xdb\x16q\xee\xeb\x98\xf3\xd4\xdf>e\xc5W|\x924\xad\xae*\xe4\xa6\x11\xa3\xcc\'\x9a\x94\xca\xf2\x93u\x0c\x86[\xa1R\xdeL\x0c\xf0\x7f\x0bs\x13\x08\xe8\xdf%\xca\x90n\x86\xed\x99\xe6tl\xf9\xec\xe5ct\x0c\xe5o\xf9M/\xe6\xcf\xcb\xe4f6c\xd5\x1c\xc3\xbe>\xe3\xdeC\x0b%\xec\x1b\xbd\xddFq\xbf]k\xce\xe2\xeb\x05w(\x93\x9f\xad6\x8b\x1c\xfbU\x12\xd5%\xe5\x15f\xb1m\xe2\xa3\xb0mV\x01GX\xb6\x85\x16/-\xbe\xd7\x0f\xd2i\xad\xab\x9d\xf1\xcd\xf9\x92\xac\x92\xdf\x14:\xd0/=5K\x9b/\x97\xf8wKy\xf7\xb2\xbd\xea\x8a\x03\x0b"\x93\x1b\xfb9~\xd8\xf4-\xcd\x19\xb6_&\xd6\x01\xdfuM\x11\x12\xce\xab\xb7}.\x84\x12:\xde?\xc1Gy\xd1\xb0\x82\xa3\x13w\xd4D\x0f>~f\xdf\xb9\x91\n\xefK\xdf\xde)d\x12\xcdB\n\x8b\x9f\xe1\x8d\xf6\x05\xd4\x8a^sJ\x8a\x07=\xebN\x0f\x91$\xffP\xe9\xa3a\x1d\x9eb6\xff\xd5\x9e9\xe0\xd1m\xb2>\xf6\xb1\xdc\xb5{:\xfbF\x0eq\x80\xa0\x08\x1b>F_\xcc\x91P\xcfv(\xbf}\xb3.h\xbc\xa9\xd4\x14\x1b1\x0e\xb1X>#=*\xda\xf8j\xa2\xa8^\xba\xcd\xea\x9a\x05\x96\x1e\xcb\x93\xf7\x82\xf4\x99\xde\x90\xacS;c\xd2\xbb\xe0\xeah3(\r\x12\xb0c\xcdCJ\x0c9\x9a\xe6\xd8\x1bW\xdfr!#\xa8\xb0\x8f\xbf\\\x8f\xb14M\xd6\x89\xc8qW\xd8\x05G\xbf6\xc8\xb2\xbdP_<\xf8\xe6k\xca\xddct\xeb~)Wm\x87\rF\xe5o\x9d\xb7\xc7\xda\xf0\xcb-:\xb9\x9f\xe2\xb0vO\xf8\xad\xd7pT\xca\xda*5-\xfe\xd9\x91%6\x957X\x0b\x12\'{+\xd8u\x84\xe5\xa3\xdew\xc5\x9f\xc56\xd4\x10\x94\xae\x1b/t\xb7\xda+\x0e\x9f}Z\xcd\x8b-\x0f\xec\x18n\x04\xd09X\xb4W\x94\x83\xfdJ\x931C\x82\x82\xbb\xc2Z\xd8\xfb\xef\xd2\x8f\xc8\x96$\xd2\x14\xea\xfd\xaf\xd2\xb7t\x13\xd3v\xc7\xaa5\x10\xbe\nz%s\x86H\xb3\xf3W\xeb\xbb\x1f\xbekS\xb3*\x15\x7f:M\xb4h*h\xae\x80\x0cX\xe7\x1cs=\xe6\xb5\x12\x8ba\xc5\x9c\xb1\xf5!\x8f\xb5\xab\xcdRV\x9bL>e;\xa5\xd1\x8e\xe5\xf3\x9e\t\xb0v\xf6\xcb7\xd8"\xffUo\x13W\x9b\xbd\x97\x03,\xd8\xd8\x0eO@m\xc5C\x19!\xe1\x9e\xb4#\x0c\xcd\x7f\xd2b\x1e\x88\xab}\x12\xf8\xf4s=\xee\x98\xaa$7\xbf\x12Q\x89q\xcf\xf0\xbe\xf8\x02\xf9+\x9d\xd0\x1e\xf3#\\M|\xa61\x02\x18\x1f\xbdJ\x90Em\xc0O\n\x17\xc1\xcb%\x1f\x8a\xc0d\x03\xafo\x17\xd6\xee\x08-\x18D\xc5Z(eBp\x065\xb07\x04\xbd\xfa\xb6\xb3),H\xa0\xfd]h\xf1k\xef\xd9\x9b\xa3z\xc1r\xc7\xe9r`\xb9\xd0\xd4\x9e\xf98\xb9\xd7\xc3e\x0c\xc4\x19\x06\xc5yW\xd9kI>\xbc\xf25\xb2r\x1b@!dm\x01qw\xac3@U\xbd\xdb@\xa7\xb4\xb6\x043~\xd1\xcd\xcf8\xdf\xbc\xea\x13K%\xe8H\x0f\x99Q#\x8f\x16\xb8}\x9cI\xa1*Y>\x04\n\xad\xa9|6\xf4+{\r\xf3\xb8\xb9\xf0\x9a\xc5\xf3\xdefN\xa9\x11\xf0_\xfe\xf6\xce\xdb\xceEz\xc6DS\xc5\x87\x85[\x80o\x9f\x81ttZ\x07+\xa7Qx\x17\xf2\x86\x9e\x83g\xc3\xf9l\xe2\xe2d\xa8\x1c{\x1c\xe3\x93\x0c\x1f\x12\x19\xadw\x7fP(]\xdb\xb7S\x972g\x11\xb7\xe6\x1d\x1f(\xb7\xf1\x0e\xb24\xcf< \x9e\xc9e\xcf\x9c\xc4\xf0/\xc3\x0f\xaa\xf6;\xb2\xa4\xd1%b\x91v7>\xcd\x18\x1c\xe9\x86(\xd3\x1a\xe1C\xf3\x03.\xe1\x99\x0bC\x8b\x90 m\x03\xfe\xdf\x10\xc4\x1a\x83\xb0vNf/\x0b\x9a\x83\x92&f%\xf7\x81\xfa\x1e7\x119\x9f\x8d\xa9\xbd\xd6\xb5ACV\x84\\\xca\xcf\x95i\xfe\x1d\xca\xc2\x13\x88;f-\xbd\xe2\x8aj@\xb1\x89\x04@\xd4*v\xd2$\x8f!\xa2\xfa\xcev:\xa5\xcd\xe1\xe7\x8c\x81\xbf\x0f\xad\x87M\xaa\x12\xdc\x87\xfa\xb2l\x9fEN>(\xb4\x9e\xcaeS\x7f\xb2-\x03\x88\\\xc0\x16\xed\xcdt\xeb\x0b\xf5\xc7M\x15\r\xfa\xe6\xf0\xa7\x8dh\xa7;\x86\xe5\x92\x1b\xe0p\xa1\x05|\x86\x0e~\x147\x15\x9a\xad^\x05\x154c!\x98\x88\xca"\x91\xe7\xbeS\x8blb\xc5 \x1f$\x14\xe0\x13]\'X\xd0p\xcaI\xc2@\xbb\x14\xdb\xbe\xde\xda3\xee\x91<@\xf6\n\xe4\xd88\xe2\x9d\xa6+\x9bB:\x86\xcb%U\x12A\x0fYYco~\xd3I{f\xe6\xf9\x1fdlv\xb5\xbe\xc9\xc9\xf9\x8c[\xa9\x1c\x16\xb7\xcd8\x16\x04\x01\xd1\xf8v\xf0?\x9c\xd2~\xe7\x0e\xb2\x05\xec:@F\x0f%Y\x80\xa4\xf6i\x83\xb4\x02F\xf0l\x1f\x02#"\x10\x9b\xb3y\x15\x9c\xe0}b\xa5\xb2`D=Fe\x96\xf4Q\r\xbd\xe7iu\xe7e\xa74+.\xac\xf9\xf4\x8f\x88\x94\xae\x91_\xd9\x9a\xf3\xf51\xc0\x9f\x7f\xc2\x83\x05\x12z\x8fjC\x98\xc1_\xde\xd3\xec9\xd5\xa1\xbc\xf1\x1a\xa2z\xfc~\xaf\x01\xbc\xf7\x13`)!}K\x94\x85\x82\xbd\xb3\xe14"iVpC\xc2\xc4\x96\x96y\x97M\x1b\x19\xfe\x0b\x0eU\x99\xc8[\x876\xd2:\x86m\xa0$PG)\xfa\x88\xb9I\xa6\xbd\x05\xcd\x11\xd8\xe5\xc1\xba\x12\xfa\x85!R\xa2\xd1_a\x08\x96\'\x7f\xe2\xe8\xea\xfaw\xf8U6F:\xc8\xe0\xa2N:\x08;\xd3\xcf\xa94T\xee\xc49\xbe\xc3\x86\xa0K\xa9&\xba\x02%\xcb\x1a\x91c\x1d\xc3b\x04\xef{\xf0j\xa2\xf2\x8fg@\xbd\xb7N\xdf\x02w\x08@\xfb\x8d/\xda%\x0e\xd0=\x18\xb8C\xec\xea\x00,\x1d\x13\xfc-|\xc4\xde\xac\xe3\x066\x83\xc4\x01@B\r\xe7\xd0\x9d\xd0\x7f\xc2C\xc3\xd0\x0ed{\xcd>N\x14n\xaa\xd4\xc5w>\xe3\x00`\xa78\xd9o@\xabT\x04\x8cM\xa7\xc2]d\x93M=d\x12\x96\xde\x8f\xb3\x01\x88i\xd8\x86dR\xb80\xdbw\xe0D\x1d\r\x80\xf1\xb6\x14\x13\x89\x00k\xb8\xac\x86WsW\xcc\xfau{\xf4\x03y\x98\xac]r\x07\xe0J\xc5\x00\xdd\xce4\x17\xcfx\xd0H21\xa5LIt\t\x91\xbd\xc3\xf2\x1e\xdd]\xd0\x97\xa6m\x1c\xdb\xf2\xd2\x01j\x85\xfc\xb5\xf9\xca\x1b\xaf\xa3k\x9b\xc2;\x86=\x04\x05\xcd0Q4mC<w\xd9\x85[\x12\xa8s\xdf&b\x88D\x00}\x97a\xfa\x96\x83\xf6\xcc\xcf\xc9:\xacq\x9e\xa4\x17\xa02\tA\x92Pe\xd4B\xbd\xd3\xc7\xbb\x8e\x02\x17\x90\x82\xe6\x1c\x08\xa6\x06\xad\xad\x88\x08\xacq\x90<q\x99\xa5\xcd\xf7\x1b\x01\xbd\xd3\x1di\xa2\x11bM9\xb3$@\xde>g\x98i{&\xd5IS\xf8\x1d\x82\xa9\xbe\xf1\x00\x1a\x916\xd3\x91:\xbeG\xacD\xb2G\x82\xd4\xb7\xc2\x07\xab`\xb6J\x10dn\x9d$\xc9\xd7\x91\x13\x10H\xee\x81U\xce\x95\xa0\x18\xe0!\xa8P\x11\x05<tJ\x1b\xcdZ\x1a\x1d\xab\x91\xb4\x035\xba\xbe\x87\xc5$iG\xfe\x7f\xa4@NCB\x1d\x1d\xfe\xbf@\x10\xf6wd\xe5\xf6\xe8Gvk\x05W\x0b(\xfe\x82\xed\xb1\x10\xbd\xc3\xe6\xed\x1b\xc4\\r\xd45\x82>\xc7\xd8[~]O\xd3\xa2\xee0#J0\xda\x93\xe8\x80@*i@\x17`\x12\xed\xed\x9e\x98\xc2\x98Tw\x19\x04@\xe0h\xe2\xfcM\x18/?M\x06\xca/}P\x06\x8b\xb1\x0c\xc4\xe0\xf1\x81M\x90\x15g\x8eXh\x12\xeb\x9cs[\xfa\x88O?\x03`\xab\x8dx\xaeQ\x9e\xed^W\x1bn.\x049a\x81O3\x89U\x9b\xa6!\x8ay\xd4\x7f\xe2\x928\xd5\xa0,h\xa4o\xd9\xb3\x119e\xb6\xed,\xa4\x87\x15}\xad\xd7\x98\x0e\xa5r\xd3\x08m\xa0\x82Q\xcc\xd0%Q@\xfa\x964|5>\xef\xb5\x8a\xeen\xc4\xa9II\xe1\xff\x81\x17(z\xc8~\x8d\xae\xa0\x8e\xe1.I\xffY\xd7\x98\xc1rP\xcc\xfc\x80\xba}\xe8kg\xb3\t\xde\x02\xd3\x13\x8c\xf7p5\xe5\xd3\x89;l\xc8\xa25p \xcaV\xb8\x81t\x18\xd9\xb77[d\xea\xc6\xa0\xc9\x1e\xa0\x055\x8a\xd0\xac\xcd_e\x8e\xe4\xba\x8a\xdf\xe3"\xb1\xf2\x12\xd5g\xfe\xda\xadal\xf9\xb9\x0e\xe5\xae\xa3\xe8;\xde\xed\xd2\xbbSD\xd4\xaa2G\xc4=W\'\xfe\x84\x87`\xd4+\xf3\xd7pv8\x05\x0e\x84\xb2_$\xfd\xf6\xa7\x05@^\x1a\xdbQ\xc5\xd3\xd6\x1b\xd8L\xde\x1ft\x87\x9b\xe8\xb0\xdb\x08B\xc2\xe6\xaf\x82,8)HP9I\xb4\xa9\x996\n\xdb\x89>\x8e\x06\xed\x8c\xd02}\x0bW\xbdJ\x97c\xa0\xc5_u\tI\xcc\xc6\xa19\t;\xaf@\xe7,B\x16\x0cY\xe7\xd3\xea\x86\xeb\x88\xd3\x85\x9b3-Br\xbd+\xa7\xf5\x0c}\x8bC_\x14\xa8\xc6\xaa!\x87\x9a\xb7\xfd\x1b#L\x85\xca\xadu)6\xe8\x12B^w\x1fk\xef\x06\xc9\xa6\xc0\x8a<\xea\xa2\xc4\x0e\xe4@\xc42J\x95;\xb7\x1a\xaf_\xf4\xda\x07\x94\xe7\x01\x81T\xbd]\x15\x18\x92\x81\xf0Uc\xa4\xe5\x7f\xe8G6["B\xabZ\xf6C\xb5QK\x9b@+\xc3\x96\x804\xbb\xa8\xbc\x1d}\xe7@\xbdX\xf7\x0e\x15\x06\xe5\x0e\x1b\xe1\xffC\x0f\xa9n\xe1Xe\xf1w\x1d\xf8\xd1\x80\xabI\xd4/\xce\xf5\x9c\xd7Z):n\xc3X\xba5a C\xdd\xdc\x1ca\x1d\x15^\xf6\x89\xba\xfb\xe2\x89f5\x98\xf9\xf3%\xef%\x15j"%\x94\xdc\x94D\x140\x82\x04\xd3\x10&[!\x88\x8b4\x84\xe5\x12\xa9\xa3\x7f*\x18\x9f\xa0\xda\xef\xc4\x8d\xdb\x10\xfaQ2\x19\x01\x14!\xc9\x81\x0c\xb5\xf8\xf7\x8e\xd1\xcb\x94\x10/\x92K\xe0\x16\xa24\xf4*R\xee\x10\x9e\xb8\xe8\x8d$U\xe2@\xcd\xbf\xe3"\xc9\xc1\x01\xc6\x85\xb2K\xd77`\x86\x88\x1fA@\xd0\x98\x8f\xf0\x92\x12\x83\xf6\xb0\x86[\x13\x8dP!9\x1a\xb1\xa8L\xe3\x08G\x9f\x13\xcf\t\xdfa3I\x95o\xf8G\x1c\x80\xad\xe8\x18"\xa2+\x10T:\x06g\x0e\xa7\t\xea5\x0f\x01@C\xfcFP-\x1f\xb3\x97\xb3k\x90R\x01\xb2\x97\xe5\xa6<+\x88\x81\x98\xcc}\xe2\xf2^rm>\x1d\xb4\xc3\xc2\xd3\x88\xec\xb0u>\x03\xd2t\xdc]\x94>Js\xbd\xe6\xb5\xaa\x10\xd2T\xd9\\\xd0\xc22o+\xf1\x02Z\x97\x12\xaa\xcft$)#8Rr\xfe\xb7\xc6ab\x00\x9b\xe7\x9f\x14\x87z\xd3\xd9\x13\x10\xbb\xd7JE\x03\xad\x11\xf0\xe6\xa9\n$\x8b\x1a:\\\xb8K\x8e\xc0\xc1=j\xa2\x13\x02m\x8dAR\xdc\x19\xb1\x83\xf0$\xa2\xc3\x9e\x9f\xf7q\xf2\x02z\xaduOu\x0c\'a\x1bU\x82Q7\xdf\xdd_H\x9f{m\xe7\xecJ_\xbc\xe0n)7\xc1w\xfd\x80\xd8\xecH;%\x88m\xeaH\xdfb7\xf05\xb3\xcc\x1c\x15Q\x83\xe2\xa1\xe6\xeb\xf2&/\xf4\xc4S\xe5\xd2\x82T\x0f\xbf\x10$:o\xf7x\xd2;\x86\x9b$U\xab\x96\x8cu\x1d\x111\x1aw\x01N\xcdV\xf5=V\x9d\x8f\xca\xe3\xf2K\xe5O\x95\x96\xb0\xe6+\xb6\x9f+\xc4w\x9b\x86\x94\xe5\xc4\x1cL\xf8\x14-\x93K\xf2\x95\xe5\x0c\xcaV\x04\xa6\xc2/Gqv=\xa6\xd9\x8cu\xe9[4\xcd\xe2^\x0c\x05\xabNW\x0b\x0f\xa2\x91rz]ZRZ\x12\xba\x9c\xd4\xba\xd5\xd8\x00\xa9c\xca\xe6\xed\x87\xa1\xd6\x89)\x95\xbe\nh\x04R^\x98\xb7\x10\xba\xa1{_\x94\x04\xd0G\xc6^\xc6\xd1\x97\x14V\t\xc3i\xb3\xe2\xcf\x94\x9d\xe8\t\x17\nqvnq\xbf\x88\xbb5\xba&\x8a!\x93\xc9g\x11=d\xf4\x1d#\x97\xe2\xa5S\xb2Kfvs\x86P\xde+n\xd0\xf8\x8f\x88\xbe\x94tw\xae\xef}~Bk\x9b\x8c\xa3S\x8b\xa4\x9aR\xdf\xfb\xa3\xb2;\x12\x93\xe2\x99;>x?"\x8aQ\xdd\x89f\xc3\xe0\x84ry\xbfN^\xb3\xcaW\x088Ch^2]\xe8y0}\xd0\x9f\xab\x7fRP!\x0cCOj5\xe6\xc5W\x1c\x88So\xa3W\xc9\xafI.\x9bY_QG\xc3\xd27y\x84\xeb\xca\x13{\xda\x11\x14\xe3Y\xb9\xcf\x7f\x17\x13U \x97Ih\xc1\xd1]6PT\xe9\xd0~\n\x9a\xd3\xe4^\xc2B\xa5\x99\xf5\xa8X\xc2\x93\xdc\x81e\xa0\x18:6I\xb5)\xe5x\xe3\x07\xaa/\x8d\xae4&\x89/|\xb9\xb6\x95\x97F\xfb;\xa4I\xd3\xd3!H\x0c1\xe9\xfb8\t=\x83\xf5J\xf2\xe7\x12\xc6\\\xbc\x06\x0b\x05\xbd\xe5\x10\xb1oa\xf5$\x91C,\x1e\xd22\xbf\x8dx \xec\xe9\x01\xf6\x81\xdc\xe2\xa5\xef\xf9n\rW\x90\x04\xc6\xb8<*\x90O\x80\xb3]\xf1\x9a\xc5@!\xd4\xb7o\x93\x05\x9ce\xaaz[\x8c\x83,\xc5\xcc:U\x1d\x05n\xec\xdd\x04\x1f\xef\xb2f\xffE\xb2\x80\x9a\xf0T\r\x1930\xfcv\xbb\x92\x92\xfe\xe1}K\xf4\xb1;r\xb2\x03\xaa\x91\xe8\x833\xd4\x0e\x86\x9dfnZ\t8\x1ce\x98if\xd7\xde\xf6p?Z\x9fN\xe8\xa9\xdf\xf7\xfdf\x184n\x85\x1e\xa9\xfb\xf9\xaa\xce\x82\x0b\xa2\xfa\xbc#_\xf6\x82\xff\x15\xaa_\xd9\xdd\xa6\x8b+\xaaN\xb7|\xb9y\xf5\x8a\x82Qx}0\'-v\x19\x988\xad\x98\xdb\x9d5X\xd5\x7f\xa5\x14W\xea\xf5\xcc\x88\xb2\x07u\xecy\x82l\x012\x9c\x9d\xcf6!\x88j\xe7"\x84g\x90\xb05\xfc\x13\x0e\xce\xd0\xfe\xa6\xd0\x18\'\xe4\xc1A\xbd@\xf9\x86\xc6\xe7 .\xb7\xa0r\xd8`4\x00\x9d$\x8e\xaf\xd7\xb3\x88\xdcP\xba\x1a\xa4\xbd&\xfa8\x1a\xf3\t\x90\xa4m\xb3\xb6\xe7I\xb6yM\xc7V\x1eM\xf2JH\x82\x8a\xc5\x0b_W\xa0\xecb^\xfb\x04\xcc{\x0f\xcc\xac\xc7\xc4\x92~\xc9\xfd?\xe1\x02\x848\xaf2\xb7\xda\x9ak\xeb\xae\xf8\r \xe3\xd2\n2.\x04\xc9\xec\x88D\x80\xc3eO\xda\xd4\x9f\x80\x17Q \x1fa/\x8f{e\xaar\x9d\r\x97GZv\xa3\'b\xaf\xe1\xf2J\x06k\xde\x8f.=\x97D\x04\xc7\xef\xd0E\x83^\xf5<\xfep\x16Q D+\xbfP\x05\xcc\x8f\xb8\xd2\xbeT\x7f\x86\x19\xd3\x1b\x15\x88\x8d<N\x8b\x18SX\xf7v\xef\x0bkA\x07\x81D\xec\x85xZ\x9cl6nQ\xd7\xd5Ba\xfe\xe1\xee\x9f\xd2\xcf\xe9\xf5\xfdA\xef\xba\n\xfas\xdb\xe5b\xfdR\xdb\x9a\xb6\x84\xa4\x154\xb0\xde\x02~\xd7\xd8\xf1\x863y\x9f_(\xbf\xab<OZI}\xcbW.\xc5\x83]\xd2\xc3\x17+4?P\xe3+\xe9!\xb2y%\x85\xcd\xef\x9c\xe1\xc8=X[)\x9e3\xd3|Y\x81\xad?\x176\x8eY\xde\xa1{\x14\xa5\x9atw\x8e\x05\xbe\x9a\xa8m<=\x97\xc0\x93\xf7\xfc\x89\x84\xae(\xfa\xedY\xc3\x19\xec\xfb\x9a\xc2}\xc8\x19\x1b\x07\xe0v\'\xbf\xeaf\xbd\xb7\xa2[m)\xce\xfc*"\xfd\xaa\x04\xc2\xe6\x1d\xea+-\xef}l+\x90\xc6X\x8a\xa6\xcf\xa0\xccF6\x1d\xc5[\x10\x88D\x13\xd2\xbc\xd6\x8d&>Z\xbb\x8eg\xe3\xeb\xaak\xd8I=\xf6\x8c]yA\xf4Z\xf7\x82rt\xf2*{(\xc8z7\x1e\x07\x81\x01\xf9\x84\xec\xa4,\x9f\xcdX\xcc\xdc\xb5\x80\xb4@\xca\x19\xe7\x83\x04\xd4\xf0\xc17\x8d\xa1\xf9u\xb7SY\xf1:\x125g\xfd\xa7\xe7P\xe7&UI\xb5z\xd5>\x07\t\x16\x9b\n?\x11\x0cT\x0f\xa2\xeaw\xb4\xb3\xab\xbf1\x81Ks3\xd7\x8a\x9b\x86\xf7\x05ZT\xfd\x84\xfa#\xb9\x85\xf5\xe3\x07N\xca\x94G\x0c<TcA\xa3\x94b\xf47\xc4\xc1\x0b\x817\x8d\x1e\xde\xf2\xe7\xfa\x16\x85\xbeL\xe3T\xac\xf0\xaa\xe6\xf6\x90|H:\xd1Z\xcb\x1d\xe3\x1e\x01}K\xb2\x0e\xa8\x1d\xe4\x1c\xe4\x06\xa7g#)\x00?\x87\xeb\xc6k\xee\xfeW\x9d;p\xb5*\x85@K\x10\xd8\xc0\xb3j,\xea=\xe1\x15wV\xfciqWS\xaf}m\xb9\xd8.s1s\x9b\x03\x92\xcd\x89\xe9{\xdfi\xf5\xfaA!=\xf6\xc3\xebP\'\r<HQa\xa0\nE\xf4\xd8\'\x99\xa1\x88\xc9<\x0fPT\xf5\x86\xbcR7\xfa\xcaST\x16\x90>[\x99\x7f\xc7\xc8T\xe8\x8f\xba\xf1\xb4\x9a\xba\x06j\xe6\xd5G)\xb3n\x82\xd1w\x94\xfc\xf2\x1bh;\xe5s\x84cA\xd0\xe7\x19{\xccg|C\n\xa0\xacB\x9b\x1bA\x00)\xc0\x95\xa0_b\xebeS1mT6\x85\xee5\x06\'a\xd0\x8eF\x95\x14\xb0g\x1d\xda]\xf5}\xc6\xd6\xfa\x81\x95\xad\xe8\n;\x82\x13e1\xa8\xd5\xcb\xe0\xa8f\x82N\nm\xe7\xce\xfdq\xb3\xe3\xf9\xb8>\xf0\xe0\x1c\x18\x1f/\x1eG<S\xb6\xc9q\xd0~a\xfciTC\x18r\x8ae?%\xbfq\xdb\xdf\xd0.\xf0,\xd0|\x17\xdaT\xe6\x19f\xf9\x1c\xaa=\x0f*9\xaf\xea\rZ\xfb-\xbfF\xdf\xb0\x06o\\B\xdcD\x8e\xbd\x1b\x9a\xef\xbd\xd2a"\xdc\xb6\xc7\x98\x14\x00\xdf\x14\x82}\x1b\xdb~"\x054gM\x02\'\xad\xf4\xb0\x96\x04R\xc0J\xef\x07|\x1a\x87>\xfc\x08\xa4e\xa0\x03\x86\xe7\x11n-\xe7\n<\x1a\x19\x99Z\xa2\x96\xef~\xa6\xa5C\xd9\x8b\xaa\x94ad\x8a\xf4+II\xe5\xbd\xf6\x8c\x05\xd0\x19\x95\xa5\xa8\xa0|LN\xe8\xb1W\xe6\xa7 N_\xf0\xeb4z8\x16\xb9\xf4\x8d\x07\x9a{c\xc0\xaah\x94\xf0x@0\xd9\x1c\x1d\x0f^k\xe9\x94\x19"O\xb3\xadI\x01+\x97\x03\xe49\xe3@\xf9\xdf\x1b@8,p\xae\xa0\xfb\xdc\x93\x84\x88\xf8\xe4-\x94\x06A;/\x9e\xfb\x97\x7f|zA\xcb\x04AP\x8b\x16\xff\xecs-\x9d\xcdh\xc3\x14\xcb\xf0\xc7w\x9bwy\x14\x030\xa0\xfa\xc7r\x05\x9c`\xce\x1c\xde\x1f\x9e<\x93\xb0\xd4\xda^\xfb$u\xd4\xf05\xdc\xf2^\x127"\xd3f$\x06\xccS\x13\xf4(\x81\x7fG"\xbav(\x07\xeeJ\xbf\xe1"])\x172\xda\xc4Ma"!*\x9f\xf8\xd7\x0c\xf6GN\x91\xf3\x90\xc8R\xb8p\x9bc\x1f\xf2%\x90k\xc5:\xad.D\xdb\x82\xbe\xf709\xe8\x9eU\x0b1#0\xdce\xf3`\xe2VE0\xebG\x029R\xa5\xc3\xadC\xa7/\xb4\x83+\x17;\xf6\xdb\xd7\x16\x06\xaaM\xc0\x97\xcd\x19\xe88|\x1f~V/\xcee\x00\x84yd S3\x1bD\xf5/\xae\x88\x18w\x18\xe5`\xe0\xaez\x93HE/\x1e\xd6P\xf2\x95R\x7fF\xa7\xfa\xc8\x18\xf7u\xc8\xf8\x00\x96=\x11\\hl\x07\xee\xceGN\x0b\xbf-\xb4W6\xff\x11\xddIVS\x17\xeeDT\xde^\x91\xa2\x02_$\x83\x0ep=\x88\xaby\x16\xb2\xe1\xe85\x1c\x95g\xeb\x81t\x90@X%\xc2=\x1b\x9f\xff[\xea4\\B\xc2\xe8\x91\x05\xe2\x8c^Y\xed\x1e\xf9U\xf2\x1e\xe8CB\xd8v\xf8\x17 \xaf*\x17\xbdG\x01&\x94!\xcd\xb6_=\xb3&%2\x84&\xeaH\xc5\xf49\xa1O\xfeH]\xa5+\x08\xc4<,H\x01\x18\x93C\xc8j\x0ex\xfa\n\x9d\xf35\x88\xb8j\x7f5u\xb2\x16\xa2n\x1d@d\xd8\x06\xc4L\x97&4Q1.\xa8}\xa1\xf0X;S\xf5\x06\x9d\xd30\x11H\xba\xbc\nw\x94]\x93( 1<\xe5\xf3\xc4[`\xcf \x83\xcd\xcc\xe9\x954\xc5d#\xf34S\x1b\xb0\nY\x1fy)\xb6\xe2\xf7kD\x90\x1ce\xe1\xc8i\x04\xd0/\xae\x9a\x80\xaf\x97@n\xd4\xd6\xd1\x83\x86H\x18\xb4%\x06{\x1a\x94\x10_Uu\x17\x91\x02V\xae\x0c\xf9\x88MUiF\xa6\x89)\x88\xd0\xbe\xdf\xb3\x86\x1c\x8c\xde\x1aR+Sf/J\xc6\xc18\x9c\x0b\x9c\xc9E6\xb1Z\x80\xb0_\xd0\xdb\xc63@\x1f\x04a\xbd\xe7\x80#\xc3V\xa3o\x9d\x02R\xd0\xc9\x92l\x89,\x0eU\xfd\x91\xabh6EZ\x16\x03/\x0cl\xf4\xab\x04\x89\x89f\xe3D\xd8~\xae|\x86]\xee\x05\\\x8c^\x07EZ\x82\x99\xdb\xbd\xae\xf4\x00|\x05\x03\xbc\x9d\x8d\xc0!\x84\xf2G\xce\x00\xcf\xce"1\xd5\x15\xec\x82XY\xe7\x8c\x8cO"\x9c\x8a\tF@\xc8\x1c\r\x90\xe5K:\x80C\xc2\x9f\xc8\xefH\xb6\x83\xb8{ \xa3k\xc8\xe6L|\x94iJ\xefj\x82_e\x94\xf9s\x9d\x95\xfdFSH\x9a\x84\xf0f\x91\xf9RIx\x14\xa8\x1f_[s&\xadm\xfe\x86d_\xf0\xa3\xb3}\xd9\xc4\x01\x0f\xef\x01Pl\x80\x12h\x15"\xdf]\xf3\xbfn\xb8\t\xb2A\xf6c&\x11\x1e~m\xb0\xa4\x00\xb8&5\x98\x03\xb6\x94\xdd\x9b]\xbaS\x94\xc7[\xea\xd2\t\xed\xb9PH{\xd7\xfd\xa5c\x0fH\xab@\xd6\xc4 |\x11\xbd\x03>\xef>\xbdeK\xde\xcc\\V\x15?\xfaT\xa1y\x9d$\xdaa\x98\x92o\xd3/\xad\x1a\x1b\xc0Rc\xbe\x08K\x04\xbe\x1f\xe8\x91ft\xfb,\x12dYf\xfd\x0f\x02Aj.\x04\xd1\x9c\x9b\x82\x94\xb4@\x83\xa2\x98Jz\x86\xc1\xa8\x9a\xc2\xff\x17`\x0ct{\xe33\x9b\x12<\x14\x0b\xd8\x08\x8dc\x83o\x1e\x0e\xdauh\xf5\x86@\x06\\\xe4b\xb2\x0b\xbe\xe8\xaf\x83\xec@\xab\xc7\xaf\x15+\x8b\xfb&?\xb2\x89\xbbJ\xc1L\x07{Q\x19\x00\x84\x16*+\xed\x9a\xce\xae\xe5D\x81\x1e9\x15:\x8c\xa5\x86\xc7/\x83PFW\x89Y\x8f\xaa\x01\x19\xc21\x1e\x98WH\xacf\xe7\xaf6\xb3"\x1b\xab&"\\A\\\xe0>,4\xb6D\xfe)8\xfa\xf5\x1c\xe8\xfa\x8ek&E\x80\x00\r\xb6[\x92\x02|y\x83y\x00tCk\xcc"\xfd\xf4|w\x16\x89\xf7\x05\x89\xea.\x8d^\x1d\xbf\n\x86fW\\\xa1\t|i\x00UB\xf0\x1c\xdb`\r\xc4G\xe3e\x8c`z\x17>\xe4\xdc\x9e\xec\xde\x87\xdfD\x05\xc3\x07l\x07\x07\xd8\x9cP\xa8\x82\x032\xb9v}\xef\x93\x9f\xdd\x90\xa4f}1\xf1#(x1\xbc@\xeb\xb9\xa9\xea\xb8\xbc5_\nW\x03\x015\x8fk\x02\xb1m\xbd7EK\xb1\x0e\xb2F\xc9;\x00\x89\x993\x82WM\x06\x1c\x7f\x10\xc2D\x9buA\xe3]\x87\xa1)0\xb5$\xb8y\x9fP\xf8\x82i\xe7\x10  8E\xb2\xaf\x8a\x8a\x96\xa4Y\xb9\xb2\x11I\x1b~9\x14\xdbf\xb5z{h~\xdc\x83\x1a@a\x18\xdd\xc3E\xe1\xdf-\xfd \xd0\xe4\x95\xb6\x9c\xfa\\>\xfb\x89\x15\xbf\xfc\xb1\x18\xbe\x11y\xccn\xcbS\x9c\x91}\x80\xbf\xa3j\xc2_\xcdF ;\xea\xd4p\xb5/\xf5\x9f\xbe\xbb-\xb9\x81]\xefr\x98\x15)\x91\xae4o`\x0b`\xb7\xe13\xde\xddR\xcf"Z\r70\x8ar\x93\xba\xf3\xda\xa3\x94H\x9exy"\xcd(n5f\xc1\xb5(\xfc\xc1\x92\x87\x00\xd7|\xc0\x17\xcf\x95\xa7b\xa9FK,3\xbb(\x0b\x97\x10\xb9\xa3\xa4\x15\xeaQ\x1b\x9c\x91m\t\x92\xa7$\xb5\xc1\xdbU\x8f\x14\x95k\x8f\xc9\xef\xfdH\x9de@\xbe%K=\xb6\xd6\x0b\xf7b\x89\x82\xe5\x1c\xc7;\xbd \x07\xcb\x9e\xa3\x1f$[\xd9\x97\x994FU`\xd0\xbb\xf7\x1a\xef\xa1J5VS\xd0r\x87\xd2b\xf1\xfe\\\x8a\xfc\x9cX\x04\xaacC\xd7\x86\xa0qh\x8c\x9bp2\xe7\x81k[\xc2\x03y\x98`\xcfd\xfd`\xea\xa8\xef\tE\xb4\xec\x19\xd42;\xf4\x19\xfef\xec\x0e\x1d\xe1\x14\xc2\x9e\x04D\xd25\x94\x0eY\xcd~\xa6Z\xe3\x15iP)\xce7\x88Z\x1b\xec\x8f\xb7{c\xba\xef\xfc\xc8\xa0+\xe9\n\x04\xe3\xef+\xf8\xab\xe3\xd6d\x9d\xb1\xe9\xe6,[\xd7\xc8v%E]a\x96c\xd4r\xb7\xa4\x9b+*^\x1a\xb9\xb2\x98gWH\xf7\x96\xf5J\xecJ\x97\x8e\xf9=\xa1\x13\x80\x9b\xa2\xd7\xdb3i\x8f\x0bvue\xac\xfd\xc5\x8e\xb7\x84\x17\xb8\x1a(\x0e\xc9\x9aY_|\\l\xba\xd35\x7f.\xaft\xb0O\xcat\xc1\xcck\x81}^s&Z\x14\xce\x02K\xe5\xc2\x14I\xbe\x0e\xd3\xb4\xa3\xd3\xa3\xda\x8a\xa5\xe2\xf9\x99\xa0i\x1e\x92\x1fwJ\xec\x80\xb1\xdc\x0c\x14\x88\x04S\x86\xa4\xd5Y\xff\xbb\xeb\xa5\xa6\xd8\x04P\x8b\xc8D\xf436\x17\xca\xf3\x95_O)f\x1f\xb6\x05\xa5\x04\xa1\xf0\xfa\'O\xe4\x94\xbeM\xc1\x00\xe7o\xe2w\x80\xf8\xc3_\x87\xec\xf4\x02{U`z\xdb|\xdd\x9f\x9bf\x16\xe7\xd2\xa6\xa5\x83a\xec\xe8\xb4\\ma\x1a\xe7\x18\\\x1f_G\x0el#,\xffR\xc3\x17W\xefW"\x1b%\xeb\xa8\x8e0\xb8\xbe\xbc\xd7>\xf2\xebf\x08\xc8\xd6\x07m.\x98\xa2\xc8\x1d?\x8c\x81\xbeG\xfd\x9aY\xeb\xf5\xcd\xb0\xca\xe6p\xad\xca9\xa1\xa8\x94$A\x86\xda\xfc\x913\x9b\xa9k\x1f\xe6\x05\xcb?\x1b`\xe0\xab\xac{\xb1\xfe\xb2\x8b\x92T\xab\xcdy\xde\xc8W)\xedU\xd7Lb\xd50$\xfb\xa2\xf2\x87\xdd\xb8j"\xfc\xfd_\xd4$\x80\xda\x88Q\xb84d\x05\x8c\x14?w\xe3\x12\xea\xe8\xce\xb4\xde\xa7\xd5\x9d\xa6\x84\x85\n\xab\xe5\xdb\xbd\x182\xf0k{6\xa9\xae\x92\xee\'\xab\xd1\x98\ri\xf7g\xc5\x1f\x1f\xda\x07\x95\x8e\x8c\xe6b<\xc0\xfc|F\xe4\xa98(\xf3\xc5%\xb0\x15\x9f?6\xa6C\xda\\\x13|^\xcbh\x1bf\xe3On\xc3e\x96\'@\xca\xf4H*\xa1\x84G\x9f\xdaB\xdfM\x88%s\x9c\xe5\xbbr\x03\xa8\x94\xa8\xf9\xfe\xd6>\x8c\xca\xb7\x9d\x96\xe3\xaf\x03\xe9#\x13\xb7\xa0<\xe1\xe7n\xe2\xf8\xe2\x94\xa2\x1e\xaa/^\x9ab\xfb\xfee\xdas\x1fF\xe3\x9b|\x15\xcc\x9e\x9d\xff\xfd\xf9\xef\xcf\xff\xe1O\xd1\xb2~\xe0\xcb\xcee\xb3\r\x8f\xeb1\xe0\x8f\xd3a\x97\xefK\xec\xc9?\xfe\x0f}\x9c\xcd\x02',
+    "/buttons/일시 정지.png": b'x\xda\xed\x97mLSW\x18\xc7\x0f\xa0\x8c\x17\x1b\x07\xc1\xf0"\x166\xb6\xb0\x17\x19l\x97\x17\x19\x85F\x86B]"0t\x8a\xccU2\xb8\x1d[M\x19\xc5AG_\xd0\xb0l\x1a\xb03c\x81#\xb5\x95M\x07\x9b\x0bU\xcc@C\xa1`elrl\x03\xa2\x90\t\x14\xa6\\f\x1a\xe8\x85;l\xefZ\xca\xae\xc6/\xdb\xe7e\xd9\x87{\x92\'\xe7\x97\xe7\xfc\xf2\x9cs>\xfe\x8f\xe7\xed\xce\xe6\x04D\x04\x00\x008\x82\x9c\xac\xb7\x00\xf0\xfe\xe0Q\xf9\xf92\x9d\x96Q\xb1\x8a\xd9\xfc\xcbs\n\xa5\x00\x04\x06?*\xaf\xd1)\xa5\x9bin\xae\xdc\xb1\xbf\xb2@\x82WV\x15W\x94\x827J\xc5R\x994\xba\xa0\xf2HI\x99$z\x8fD"\x1eh\x9b\x95\x03\x10\xc2\x11dm\xdfS\xadY\x984\xda\xd6\\\xee\xa1%\x97 \xd5T\x95\x1f\x96S\x12\xe43Hni<zS\xdd0rvkv\xf2pw\xc8\x89s}*\xf0\xcb\xa1\xce0\xb1r\xc3\x86\xc6\x07\x17BF\x05\xcd\x9c\xc6\xe5\xb8\xc03v\x92k\xb7\x16\x0c-(\xd22\x1c\x96\xb6\xe1R%O;\xf5I\xee\xb8V?n[\x9d|3\xbe7\x11\x80IJ\x93\xe7\x03\xae\x08\xda\xbd@\xe4\xf3c\x00\x9c\x0cf\xbe\x91\xed\x9f\x04j\xbf\xa9\x8b\x00\xfd\xf9\x99\x1c0\xf3B\xab/(od\xb4m\xbbX\x8d\xd5\xfe3\xed\xc0\xbbiX\x94\x06nD\xe8\xae\x888\x0f\xe9U\xe4\xae\xc4\x95\xc9\xd8\x9a\xbc\xe2\x96\xb69\x05\xa1!\x9c\xe8\xc5\xa8o!mC\xee\x8fqe\x02f\xac9\xd6S\xdbV\x97\xe7\xc3\xb5]\x85\xf4\x1fH^\x86O/\xbf&\xf2$`:\x1d\xb4{zv\xa6\x17\xeb[\xa0\xdel\xb2\xce\xd1M\xa9\x94\t\xd2\x93\xc8\xe0\xb4G\xac\xe7)\xea"\xc80\x8b\x05U\xe1\xc4==\xe9\xee\xc6\t\x8c\x12\x1b\x0f\xd6\xcc#\xf7\xfb\xf8\xf4\xc3\x00\xb3G\x81g\xa4b\xd6\x9a\xbd\xa1^\xb9q\xad\xbe\xe7\xb4-\x9f\xa5\x94\xe8\x9c\xa1v\x05spW\'\xbd\xd6""B)\xf2\xd5\xf9\x97W\xd4\x90&\x91\xdb\xb9\xb7p\x1d\xefv]\xc4\x17\x7f\x8e!y\x9a\xc15"sj\xef\\&\\\x18ujfZ\x87\x13[0\xaa{1r\xa6,v\xac\xf6\xfa\x878\xa1\xc6\xa8;\xa4\'^D(zSc\r*\\\xe9\xf9\xdc\xc5<Z\xffU\x17\xb0\xf8\xb5\xfa>\x97\x91\x88\xf1e\xf7\xb1\xe9t\xcc\xf8\xa2\xf8\xeao\x9b1\xeaZ\xcc\xa2q\x1bf\x7f\xe9\xb0\x976(\x93\x93#/\xc6\xfb\xdc?\x8b\x0c\t\x98u+#\xec\xa3\x9e\xd6}\xd7\x84\x13\r\x18\xd5d\x8e\x9c)\x8cf\xaey\xcf\xca\xbd\x89\xe4\xa5x\xdf\xfe\x89\x8aA\x9d\x88XQ\xcb\x7f\xaa\xc1\x89\xf1O\xe3\xfa\xb1\xccv\xaf\xe3\x12\x8bI\xed\xcf\xbdg\x14\x11F.\x7f\xae~\xed\x0c\\\xab\xbe\x8fy\xa4\xb8\xa7\xed\xe2\xfa\xea\x9d~I\xd1\xcf\x8c%\xb7\xfa\x8e\xf9\xb3\xc0\x02\x0b,\xb0\xc0\x02\x0b,\xb0\xc0\x02\x0b\xff6,5@\xd9\xec)\x8b\xf3\x06\x92_\xba8w\x82oA\xb6(\xba\xde\x81\x90>\xb0\xa8V\xc4\xa4\x9c`a3\x8c\xe7/\x87\xc7#\x94\x12X\xd4\xe1\xbc\x8d\x0c\xae \x87\xf04L1#\xe1\xeb\xd2Z\xd1Q\xc6\x89:\ru\xbc\xe5p\xbb\x16ZC\xba\xdeY\x9a\xe8\xae\x8f7\xa3\x9e]O&\xe8!\xe4\x9bQ\x91\xc9e\xd4@\xc7\n\xa1!=\x90\xa6c\x16UJ\xbc\xef\xed_\xbdy1\x8f\xf3\x0b\xcf\xdd\x1e\xbd4\x02\xe9\xed\x92\x1b\xe1V\x1dT\xafsx\x121{34\x1e\x99\x07\xb9i\x8f\xc3\x10\xb4\x9bQ\xacg\xb0F\xa8\x83\x96\x87\xf3\x1a\x92\x80\xf4 2<\x10^\xa1\xfe\x9e\x86\xfe\x19\xb20\xca\xb2\xef\xf0\xc8\x97\x0e3\xa4G\x90aa\x93f\xd5\x85\xe4\x15x\x9f\xe3\xfbW\xbc\xb5\x0729\xd5?\xcc\xe3\xc4-\x8c:\x0fe\xc3\xc3\x1a\xda\xc4\x93?e\xebY\xeb\xc8\xcf\x9d\xb0\xe1\xc4\x05\x8a\xac\x92yJ\xcd\xeer<#e#\xffY\xe0T\xf9\'\x9d\x9d\xfb\x11\xa3\x06 \xdd\x8f\x0c\n\xaeg\xea\xba]D\xb4a\xd4eY\x97\xf5\xeb^\xcd\x93\xd0H\x91\x1f\xfd.\x14\x11\xdd\x14\xb9j\xb0\xa6\x0f\x1c\xec/\xc8d\xa37\xab\xfdO\xb5\x15U\x7f\xe7\xa5\xd9\xe1\xd5M\x9d\x80Y\x82\x1d\xbb\xb3:2\x0f\x1d\xfb\x0b\x0frF\r',
+    "/buttons/이전.png": b'x\xda\xed{y<\x94\xeb\x1b\xf7,\x96\xec[\x91]\x1aK\x1a\x95l#"\xc9\x1e\x1aQ\xb6$e\xdf\x13\xa6l\xe38e$\ne\x19\x83B\x96$$K\x85\x9ej\xa2m(\xa6(\xdb4\x8a,a\x12\xd9\xbd\xf73:\xe7\xf7{\xdf\x7f\xdf\x7f\x7f\xe7\xf3\xe9t\xce\xccu\xdf\xcf\xfd\xdc\xf7\xf7\xbe\xae\xef\xf7\xba\xaeI>bk.\xc0+\xc5\x8b@ \x04,-\x0e\xd9#\x10(\x7f\xf8\xcf&.\xf0I^W`<\xf8\x8b\'\xd4\xc29\x1c\x81\xe0\x13\x85\xff \xbb\x06\xe2V\xc0\x87\xd2\xe7L\x9d\xce\x1d\r\xf1>\x17u\xea\xac\x17\xc2\xc4+0\xfc|\xb8\xc2\xd1s\x11g\xfcB\x14\x1cBB\x02\x9f\x96}\x89A \x14\x10\x96\x87\x8c\x1d\x08\x94\x1f\x03~t/\xaf\xf3S\xcb\xf1[l\xdeo\x89\xdd\xdd\xb5\xe9\xaf\xcb(E\x92\xcd\x0f\x11\xf4\r\x91\xceK\xe7\\\xfbQm\xc2c\x06\xbfn\x12\x0f\x18\xe3\xc1\xbf\x15\xba\n\x8e\xc8\xf0\xef\xf1\xe0>\xbb\xf7`&%\xe8\xd4\xaf+7U\xcb\xcf\xa9\x91\x14Tcw\xc7\xbaR\x84t5\x19\x9e\x8a\x8es\x1d\xbf[\xa6\xb5{\xd6\x7f{\xc5\xa7/\xbao\x8f~\xeb\xd2C\x99=_\x10\xdd\x15P\xddr\tc\x991\x9e{\x06\x9f\x89\xb1\xbc\xf3\xaaH\xd92\xc3\xe1\xba\xa9M\x06\xa6B5\x85\x8c\xb1\xb4\xc7\x8bk[f\x94\x14a\xfd30\x96\xa6\xcet`{\xf9~\xb9e\x06f\x8b\x17<@\xed\xf5\xff\x06\xfco\xc0\xff\x06l\x0c(I\xd6\xe4\xec\xe5\xcd\xe1\xba+\xd0\xcc\xdb\x8f\x8c\x11Z\xb0\xf3\x08>\xb6\xa7bTY\xec\xf7@\x19\xf17\x8a\x0f\x19\x05\xfeK\x1bJq~:\x98\x0c\xe6l\x1b\xea\x82\n C\xe8N\xc8\xec\x93\x87\xb2\xb8\xad\x0b\xd9\xc9\xbcJ\xa9\xc4\x1dP\x1at\x9c874\x12?\xab\x10\xaa\x15*~\xe4\xdef\xf0 \xbf\x15\xac\xd0\xa4\xf5\xe6\x07^\xa3\xac\'\x8b\xca5F\xad\'2\xdb<y<\x8e3\x0e0N\xcc.\x0c\xb9\xf1\xc4\x08\x12\x82\x9b\x0f\xaao\x02\xcb\x8c\x08\xd9\xc2x\x03MAt\xce\x85i;\xc58\x0f\x0c\xad\xf0v\xc2~RR\xfe\r\t\xc6\x93\'\xa2\x0b;y\xf7\xab\x82)+\xf4\x03\x849\x03\x8e{\xb04\xdc\x03\xac\x19Fm\x14\x0b)\x81\x9d\xc2!\xf7~seI\x0f\xd7\xcfst\xc8\x84\x17\xa59\x81GO~\xdc\xf61{u\x7f\x8d\xafyOs\x96\xd3\nv\xecG\xd5k\xe9\x90\xea\xec\xf1\xefd!d\x00jw\xc4\xb9\x16\x8d\xdar\xcb\xae\xbf\xfa\x10\xb8\xcd\xbdH\'\x82\xcc\xbd\'r\xa1\xa38\xb7\xe3R\x91\x01\xa2!\xd5Q\xde\x93!\xd5}+\x9c,I\xad|\xf0\xde#Cf\x87\x8c\x97\xb1\xb5?\xe2\x9bWdg\xae\x0e\x13b\xfdz\xef\x9a7\xb7\xac\xa1\x06ZZ\x82\xc3Q\xa1/q\xee\xf1\x05\xf0;\x0f\x06\t\xbeE\xac\x89\xe6h!\xe3\xa7\x85\x99\xdc&R\x11\xd2\xa2B\xe6\x85\xdb;\x0eH\x87\x0c)\xa7\xcdY\xf8\x80]\x8f\x9a\xb7d\xee\x88\x0bP.\xbd\xa9-\x88\x89$Z\x15\xfb\x9ff\xf2?\x90\xcd\xc9\xf9\xebc\x8eM\xcc1\x1b\xd8\xa6QW\x16\xc7\xbf\x90Y\xf2d\xdd(!\xdej\xa9\xcf\xbe\xd4\x8f\xda7a\xa7\xb2\xba\xea\x0c\xa5[\xc6/\x0b\x81\xd7\x1c\x13\xb2Q\x1c\xa4\xd0\x10\x86Y9\xc3\x8e\xcc\xa6\xab\xdcb\x9a\x16b?:I\xd1\xbb\'\xbe\x94\xb3v0\x96_I"\xc0\xe6j+\xa3\xe3M\x9a\x8d\xfb0z|\xd0\x13Q\xee\x10\xabX]\x9e\xdeK\xaa\xbe\xae\x18\x9f\x84\x9c\'\x8f\x91\xa6m\x96`\xe9\xa9\x8f.\x12\x7f\x90.\xbe\x96\xb7\xe8\xe8"H\xf6nn\xd2\xd6\'i\xa5)\x8b\xe9\x97\t)E\xda\x1fg\xe9n&?\x0c\xc0gj\xdd\x11WjX\x90?\x1c\xb8X}&\x8a19)\xdc\x85s\xfe\xbbW&t\x13k\xe4NFw2\x0f\xb7\x17XX*\xf9\x05i\xc0\x8d[$\xc9\xfb\xd8O\xc5\x1a\xf9,\xad\xb9\xee\xcd\x8c\x14\xe8xB}xq\xf3\x8b\x00\xe8\x15\xf5\t\xdf\xed\xcb\xe9\xa66]\xe5N\xa2\x0b\xa2\xa1\x88\x1a\x97\xb3Y:\xebf+\xc4\x81\x0c\xd9C\xe3\xbd\x19P0\xb5\xa5\xf1\x02\xf8LW\xf8\xf7`T]\xe2\x03pX\xe3\x8f+ [\xaaJ\x87cf\x1d\xff\x05\x81&^\x9c\xd4B\xd8Y\xf1\x8a\x00Z\xcboG\x7fC\x99\x13|\x14\x8b+\x97\xd5\\/\x01\xa4/\xf9sz\x84x\xb6\xbc:\xfb\xca\x99\x8b\xc6yO\xb9\xc3\x7f\xc92xsE\xf8\x8d\xe9\xfd\x84\xe2\x9b\'\xd2e\xcf\xb8\x83U\xce\xd1\xac\xa0\x02\xaaK\xb5WF\x1d?\x99\xcfM\xf0-G\xb0u\x87bD\x90\x97\x87\x90\xff`4"\x9c\xf8<a\xe2~\xe2[\xa1\x14rI\xab\x13go!!\xe3\xa4\xa2\xde\x9b\x9b\xd9D\xebd;J\x14\xc6\'\xfdQ\x83\xb2\xc6\x88\x1f\x80\xe3Wl\xe2\xa5\xb5\x1f\xf5\xe0}j\\\xf3T}\x1f\x8b\xe8\xef\xdby^\xa4\x89\xa8\xea\xfb[\x196\x13d\xcdOZS\xd3:\xac\xdc\xb9v!\xd3N\xbf\x1crw\xa5c\x04*\x7f\x0b\xa7\\\x8fB\x89\xdbv\xec\xfd.\xe9Y>\x9b\x0c\xad\xber.\xb9\x17{\r\xd7\xe6\x19=>\x10\xdd\x12\x1d\x1d\x046<\x90,\x9f,K\xaa@\xdd0\x10\xa0\xf0\xc4\x08\x10\x0c\xf4R\xe8\xf5\xa9`\t\x85*\xa5\xbc\x0e?\xb1\xa1ra\xd3\x03\xd9\x94\xdbG\xc1E\x7f\xee)\xe6I\x7f\xdb@\r\x84\xac\xe48;\x10\xb6\x9c\x05\x87\xe17\x92b\xcd_\x08\x003\xda\xa1G\xd1\xedh!e\x1fI\t`\xfc!6\x03\x87\xaeb^\xa5>\x87\x9c\xa1\x1d\xd0Q\xf8\xe16\xe84D\xa9\x0f\xb7\xdf{\x03\x99|.\x83t\x8a\x97\x1b\x80\x86\xe3\x07\x83\x17!\x99\xb2%/B\x92\xcfF\xee\x9a\x89\x01\xbbn\x9dI\x8a\x0e\xe6\xaa1\x05G\xb4\xfdw(\x88\xc5\x0e\xb4s\x9e\xdbf\xda\xef\'>X\x10`q\xc4\xeb\xd4\x16\x1f\x1dOyEu\x9d\xd8N\xbc\x8a\xf1\xf1\x0b\x17\x9a\x110\x9b\xf9\xf2\xb2H\xb9\xe2\xaf\x11sO\xe5\x1ag0\xd2HE|\xc7I\xfe\xe6\x0c\x8a\xe9x\x97"u\x8afB\xfc\xad\x04L%fl\xcc\x16`\xd3\x1d\xddg\x18\x9aP:\xb4\x9cY\xf7\xe0\xa1$N\xb2i\x13A\x1b\xbc\xfcm\xd3\x84\x1f\xa4\xcc\xa5\x1e\xeb\x8e\xae\x91c\x8c\x89\x05\xf8\xf1\xd7\x8b\xce_.D\xde-\xa4\xdc\xa6\t%\x9f8s;I\xdb\x9a\xcf\xc3\xd2C\x02v6\xaf\x9c?\xf7[\xc40\x9b\xaf\xe5\xa8\xed\xf9\t\xd0\xa1l?\xbb\xd9H\xccIW\xcf:\xef\x96\xd4G,-\xa9\x82\xfa\xe5\x1d7\xbaR\xd9\xc7\xaf\xbb?\xdaPF\xa0\xa6\xdc\x92\xbc\xe9C!\xb3Z\xe9\xf50\x00\x9f\x85\xac\xabH/_/\xb7\xd3.0" Y\x80\xbf\xe7\x0cw\x05p\xb4~\x06\x8eq\x97\xe3\x05\x9a.\xf7\x9eZ\x1a\xfe\x8a\xb5\xef9\xc65\xaf0\xc2\xd8\x95O\xf1:\x12>-\x8b^Q\xd5\xb3>\x0f\xf6y\xf8\x14@\xa3\xbf\xe1\x8bN\x80\xc4\x02f<\x19\xbc\xeeg\x17(;\xe1D\xc2\x0b\x00\xe5\x9f\x83\xae\x08`t\xc2\x85\xa7W\xacW\xc8I\x19FX\x825q\x98\xd8\x97Qgq"Z(\xec\xc0/\x89d\xda\xbe\x1b\x84\xe9\xd4\x04S\x1b{\x89c\xdb\x0ck\'\x05\xb0\xe0h\xdeYC\xb7\xc1}\xd0\x87\xed\x96\x15B\x85k\xd05G\xcef\x19\xd3Z\xa26\xcfL|\xc5\x9a\xbc\x01K\xc4~T\xe6\xfd\x1c\x0cy>\xc4\x0f2M\x19\xa8\xa2\x9b\x03y\xf0\xe3\x95\xa1[P\x03=/a\x19F\x8f\xc5\xaf\xd8W\xce\x97\n\x00z\xffr\xca&\\\x1e\xe2q\xc2\x81E\xf8\x10?A<\x10\x1a\x06\x85cA\xc2\xb2V\xa8a\x18\xd7\x97\xc4W\xce\x17\x9e\x83i\xe3bH8\xcfb\xa6OV\x19\xe9\x14\xed$Z\xce\x8e\x8d\xb2=|\xbdjz\xe6y\xe6\t\x9a\xc4\xa3\t*\x99u\xbf\xd2\xc0\x9c\xcd\xe5+\xb9/\xe4y\xe6>`\x98\xb4O\xa7 sp\x96\xe7s\x08\xb8}\x17\tG\xbap`\xa7\x97N\xab\xc5{\x9f\xcfYH\xc0\xc9\x12v\xc1\xa7\xfb\n\xfaH\x95~`\x13^\xfc\xe0Q\xd2\xd6\xd9s0\xde\xb2\x06\xeb\xca-\xfd5Sq\x13\xbe\x17"\xaf\x89\xafY\x94W\x93%\x9b\x92P\xd20\xb2$4F\xc6b\x98/\x05l\x80\xaf+\xd1\xcd\xb3\x9d\xccXq\x02FO\x90\xb6\xe8\x0e\xe5\xc8sV\xb1\xf8X\xae)u\xc8\x122\x85*_9\x9b\x815\xd9\xcf\xe6z\xfd\x83@\x9dMn\x7f\x10h\x0fuP\x05\xc7?\xc0XK\xc7\x95\xcc\xef\x95\xb9^\xd0V\xa4\x9cz\xef\x15\xe4C\xdc\x9e\xf0[\x05<J3t\xaf\xe1\x8b\xca\xf8R\xd1p\x9c\x10\xa6\xad\xca1\\\x9d\x95<{yR\x01\x04\xd4\xe2rgnM\xb4\x93\x11\x80\x88\xbc\xb0\xcf\xcd\x13\xc9v\xac\xf1\xec-\t-\xc4\xd8\x04/x\xca,B\xdd\xda\xc0\xa4\xc2\x85DS\x1b)\xd9\xa3D\xd9\xe4\xaa\xb5i\xdb\x8e\xae\xb62\xc2\x9c\xe37\x91\x80j\xe4q\x91\x80\xa3\xf1\x14\x8a\xa9:\xd6\xdf~]\x9dg\xf2\xe0@\xc4\x1e\xf0\xb0\xea\x8f\xa5S\xa4\xfa\x87\xd0\x07\xea\xd4T\xa1\xb2\xcf{\xf9S\xf8\xcc\xa5\x005\r\xe6\x98\x87\xc7\x07\xe0wb.\x1f/t\x94\xab\x9d\xdf\x1b\xca\x13\x8a\r\x8d>+NC\xa7\x90\xe9F;\x85\x0b\x9d\xe6\x91Y\xd6\x1d{_\x82\'8\x83\'\xecFI \xda\x11O\xac;\x8a\x16=\xc0\x14\xa7\xbd<U>\xc5A{\x81\x87\xd4\xb6c\xb5#\x1b\x95\x80\xa3\x9a?\xc5\x10\xf6Os\x8a\xe6\xca\xb1\xb9\xbb\xdel\xa4\x97"N\x04\xcb\x8d\x0b@\x9dDFr\x8a\xdb\x01?\xa5\xc4\xb0g\xa82z\xd8\xa8\x00O\xd5\nU\x06\xa8\x18~\xe5\xac\xc5%\xae\xedG\xa8\xb2\x19\xb8\xf8\x9a\xe6\x93U\x9c\x10\x9d\t@\x99gF1j\xf2\x02gq\x15\xe5\x83(C\xd9)\xfb\xe0\xb9\xb1\xfe]3\x15\xcdG\x1e.\xbe=\x8b\x9a9\xb0\xe1It}\x92\xd0y`\x7fg\x855\xd0\xbf\xcf1\x1e~\xc5\x8e_\x03\xcf\x95\xbb!\xa1f\xc4I\xb9X\xe8L7\xa2q\\u\x86\xb8\xcf\x02L\xe4\x11\xa2#\x05g\x0e\x06oN\xe5N!;\x0c\x01$\xd3\xdd\xca\'}\xc4\xe7\x1c5U[\xc69\xae\xea\'s\x17\x7f\xc2\xa1\x1b{\xc0>\x9e\x003,\xe7\x9a\xc6:\xc6\xfe\xd5\x0e\x10\x80CG\x9dq\xa2\x97\\(\x15)tn\xb0\xeax?"Wt3\x9f\xcf\xa0\xf0\xcf\xe9\xd3\xf3\x19,M\x06\x81\xb1\x97\x92\xa0o\x0fF\xcbv\'?Wm|)\xd8\xc5\xdc\xc5\xc8\x83>Q\xd3l+vgqE\xaa\xf0~\xfe\t\\\n\x98\x8c\xeaL/q\xcbL\xa8J\xce\\2\xca\x00\x9e\xa739b\x8f\xc4\xf0\xbe\xadso@`\x81Z\xa1\xfb\xc0\xec\xed6o\xc6\xda\x1e}\xd2Y`+C\xb3\xbd\xff\x07Ib\xa1\xbc\xf7\x12\xf1\xebw\x0f\x82\x1d\xd2\xad9\x04_[R}1q"\xb3\xae\x1c\xf0!\xad\xda;\xd3\x98ed\x18\xd7\xe7\x1bM\x82f\xab\xf7u"\x84H\x05|n\xb6wmVM\x837;\x9e\xc6g*\x9b\xcd\xe5\x9f\x013\x9ct4Tx$Y\x1b\xc9?S\xf9\x15\x0b\xb3\xbf\xd4j\xa5\x84\x13\xe5\x8f3\xdfF\xec\x19\xafL%\xa2\xcb\xcf\x1f8\xa7\xe9\xf9c+#\xea\x95\xb3\x03\x05\xec\xaa\xfc\xd1d\x95\x05\x13\x92\xb6\xc6\x8df.\xb7\x8b\x13\x1et\xbbB\x85\xa9\xc7U\x15Ql\xbbC\x8c\xb5\xafX)Qq\xed\n\xd7\x9d\xa8h\xe42\xe2\x8d\x92\x8f$\x1d\xeb`\x88Z\xf0\x83\x83\xed\r!R$\x95,\x9ecj3\xde\xf6\x1a\x92\xa3z~\xbb\r\x87c\xc9&\x0e\x9cx\xd3~82\x8dQ\xfb\xbe\\\x05\x11\x84\xb5)T9\xcd\xa9{+\xd8\xf0Zg\xb1\x05\xde\x9a\x9d5\x04\xf85\x0f~+&\x9eT\x01`\xa3S\x8cpb\xbdX=ki\xf3\xbb\x15\x9a\x00>O\xef\xa2\'\xcdiUk\x9d\xa8Qp@Sp,\xaeXZL\x8c\x12\x0b\xe9\xec@\xba\xbfL-j\x05\xeebv\x14\r=\x85\xe6\xe9}\xe3C`UH\x82\x02\xec2FV\x9e>\'\x82P\xeb7\xcb\xe7\x99H\x143\xa0\xeb\x81=\x0c1\xe4\x90\xb1\x00\xd3\xedr8vR{THN\xf0n:8#\x1a\xf4\n\xf7\xd4d\x18D\x97\xd50y\xe5\x86\xa5\x10\xeb\x96\r\x13u\xce\xc9\xc3\x93L7u\xb0\x1e\x15\x82\xef3\xb0\xec\xc8\x1b\x8dK\x8f\x8f8\xc7\xd6k\xd5\xe8\x03/\xcc>\xf4\xa7&b\x1d`\xe8-?jsKUF\xf8\x83\x87I\xaa\xbe`\xf4\xd0]\x8eI\xcb\xc0w\xce\xca\xe0\xfa\xebQG{\x00o\xf0\xfd\x05\xa6X(y(\xa0\xa1\x1a\x9b\xf2\x15\x1b4\xa5X\xc0\xecT\xe98\x94\xb9T\xf4\x93\xa5CC\xbe7G\xe9b|\xdeo\xaa+\xf7\xbb\xae\xed\xa3!\x8b\x8c\xc1\x80\xc1\xae\t\xd5\xc3\x07\xbd\xe6\xec\xbe\r\x07\x8d\xa0\xb2\xc5\xd6w\xad\xec\xd5K9\x83\xef\xb6\xb8\x13\'\xdem\x03\xa2\xf4E\xea\xd5Kt\ti\xd1\x00\xa3\x9dr!\xdd2\xc2\xb1Z\xa1\xe6g\xc5\xc7\x9e8\xd1\xb5\xac\xee\x14\xbe\x00G\x15\xa9\x92\xbb\xe4}\x9a)\xe6\xf3b8\xc8\x9dc\x97\x02\xef\xe7\x16p]\x1bk\xca\xfd6c\x91\x93\x07)\x89\xc7X\xd8\xd2\x00\xe2i\xe2\xb4\xd2\xe8\xb5G:\xa9N\xcb\x8bc\x93\n\xea\x05\xa8\x0e\x05\x9d\xef\x06\xc0\x15^p\x15\xd7\x9es\x0e\x17\xef6\x86\xc67\x10\xbc\x05F0\xbd\xf6u{\x9f\x01W\x0c\xdf\x82\xb2\x9cp\xd56\x0f\xfcQy\x1b\xce\xf9\x9b#\xce\x87a\xe7\x95\xd8U\xcd\x0e\x02\xfbX<\xac\xd3\x9f\x8c]\x0c\x0e\x1f\x9eY\xe0\x9aY\xfe\x8a\xed2\xa8+\xaf\xb0;\xc61\x8f\x9a\xe7\xcc\xb2\xe9\xd8[\xfei\xdcHl\xc1\x19\xbe\xfa\xb4\xa9\xb1\\\xc8\x1b<c%\xab\x97\x12\xcef\x16~\xad\xcet:\xf7N\xb1\x90w\xf3*\xb6:\xd5_\xbd\x18\xa2\x0c\'\xc6<\x08\xaf\xd9\xe2\xdb"C\xe4P\xcd\xbb\xc16\r!\xca\xbe \xdfK\x9d\x15\xd7\x16\xa8{\x9d\xe4\xa5\xe3\xbaz\x15\x15\x97\x0f\xee\xb1\xfd\xdc@\xb7\x11w+\xd7\x86S\x97\xd2L!_\xc2\x87;\x8dd\x13w\x00G\xb7\x9f\x8fb\xber\xa4?\x1b\xbe\xef\x19\xd4\xa91t\xf9\xc3\xe8Gz\xf1\xef\xd0E\x1fv\x82\x992\xc1L\x86\xe8\xb7\\i\xdcr0k\xf2S\xab\x11\x0b\xddS\xe3\x0f\xc2D\x81Q\xb9;8\xa7\xad19\x0bo\x7f\xf6P\x9f}\xb3\x92S\xf9\xf84F\x8c\xb0\x17F\xdf\x96\xe4T\xbdh|H\xb8 \x14E\xaa/\x1c\xea\x14TLUI!\xab-\xef\xa9=r\xde\xd53\xf4\x82\xd2U\x84\x0f\xf3X\xfc\x9c]\x9d\x9e\x8f\x91G.\xc0\xc2\x08"\t\xdd\xe3\xc5\x9d\xae\xfc\x97\xa9\xcd\x96\xd8\xcb\x84\xc4\x06\xc7\xb3i:\xbfE\x13\xbb\xd6w\xf7\x8fW\xc7U4\xeb\x95\xe9\rz\x8b\xcfd\xf6\xabvQ\xef\x97Wd\xf8Qo\xfeR\x07<\xb8)\x89\x10=\x02\xe6\xb2\xf9F\xd3\xa3\xb1t6\xfc\xb6\xbd\x13\xfdz\x90\xa8\x86\xf7\xc8\x1eF1LvL\xb1\x0e\x05\xa9\xae\xab\x1fv\xcbcJ\xa3\x1c\xfa)\xc3,\x9d\xae\t\xac\xff\xeb.\x8a\xb7!_\xaf\x96\xaeU\xa5+\xa0\x8f\xc1s\xc7\x87\x02\x0f\xc70W\x0c\xe6tF\t\xcd\xa9ZPQi\xf2\xb1U\xad\xd9<R\xfe\x99\xec/\xe0!\xd6\x9a\xaa\xb1\x01\xe3A\x1d\xe7\xa5p\xf2W\x1b\xd3\x07\x9f\x01\x83\xbd\x9c\x0b\x8a\xac\n\xaf|\xf0\x16k\x99\xaa\xbe\xeb\x050_/Dk\x12\xd7\xb3\x00A,\xa6\xb2t\xca\x86\xa7\xfc*n\x98\xda\x0c\x07\xf1\xd6l\xaf\xcdoe\xfa\x8d\xd0N\xe5\x1e?\xc3\x9d\xbe\x8f~w\x95\x82\x0c\x84\xaf!\xa0\x9cTLB\x19\xa0.\xb7\x9d\xe9Z\xeeY\xa8He\xc3\xfa\xbbY\x94\xdb\xa9>\x1a\x15W\xc9\xf5\x85\xe6\x08y\xcb\x8e\xae\xd2O\xfbcw\xc9\x85l\xa7\x89\xa5\x90\x1f\xe9\xdc\xc0ag\x15<\x16A\xd4sG\xdfS\x8c\xcc8Q\xc8>\xf1\xfa\xc2(\x91n\xfd\x0e.wpj\x02[\x80\xe1}E\r\x7f\xef\x93\xe3\xa9y~\x82o(<+\xd8\x7f8c\xe3\xf3\t\xc0/\xbb\'\x0bZ\xb7\x82\xd7\x11\'\x99\xda\x9c\xae\xdf;\xe3\xe5\x11\xe2\x91\x0c\xe6$?\xdf{\x953\x18\x06\xb1\xdf\xffK\x1c\tG2\x1e\x10\xb1\xfe.G\x02D8\xab\x98M\x92Bo\x1cN\xdapF\xa2\x04\xb9\x8e\xd9\xc0\x8b\xa4\x84+\x81EF\x80\xfdYt<\xdf\x7f%\xc9\xebN5\xf96\'\xdby\xfa\x85\xab\xd7&|!O*\xd8\x0f\x81+Z\xad\x83\x89\x0c=&\xa3;\xcb\xaf\xc1|\xf5|\xef\x07\xdd\x9dby\xe1\xf3\xdcY\xb6\xf0\xb5\xa0\x84\xf3\xcf\x14\x03\xa0\x878\xd3\x7f\xd9\xea\xa0\x04\x11\x91\x08q+\x10s5\x18\xae\xd4\x84\\;Xp8\x9c\xf73\xae\xd3\x1b\xdd\xc4(\x03W\x1a\x90\xa2\xb1\x1f1\x7f\xf5\x8e\x9f\x0c\xeb\x7f\xbb\x1d\xca\xa5zz\xd9i\x1e/lN"\x84\xaf\x9a2_\xa6Z\xf5S\xb6+\x81k\x7fDS(4\x0f\xdcp9\xc5\xd7\x9f\xc6\xa0p0rW,\xa9\xf7\xa93\x8bV\x9f\x17^rH\\[\xbb\x14i\x8er\xf5\xe6\xf6\x0b\xd3\rU\x0be\x07\xd7\x8a\xa3y\x88$T\x9f\xfd4\xdb\x06\x85\xf5/\xae\xca\xe5&l\x9dy\xcf\xf6d\rK\x9dm`\xf5\xbbo\x0c\xb9\x19\tP\xae\x02\x0bQ`Q\x91\xcb\x8d\xdb\x80\xd7\x88\xd6l\n\xf18L\x01\xc8f\xfdQ\xaeJ\xa3\xbe\xb3\xaa\xa1\\\xac\xf9\xa5W_\xb1\x19\xee>xi\xf5\x0f\xa3\xc8\xc1CX\x87V~\xb0\x95\xf1\x0e\xf1\xe1\xab{Byk\x13\x97>\x81\xef\xb9\x9c\xe8f&\x9aB3{\x18\xc0o}&\x90\x1f.\x95/\xe5MD\x93hz\xa3\xa8N\x108~\xe9`\xfdWu8{\xd3\xb7\xf66\x9b\x81\xcbic\xfcX\x11x\xa7[#\xb4\xb9[\x10\x17\x18\xa2\x15`\xd4\xa9\x92\xd6\x7f\xcd!\xc7\xb4\xaa\x10F\x96\xf8\xcej\x80,\x9aL\x91\x81{6\x80\xeb\xbb\xcd\x8cp\xe8\xb0\xc7\x00x\x95`\xa4\xed\xb3\xfa\xc2\xae#\xb5\xe5so\xba\xa0)\xc8\x18\xfa\t\x13\xa2\xb2\\yN76\xb8f=\xce\t\xd7\xb0\x85(\xaa\xfd\xcbg;?Ug\xfa\xd2-\xc9\xde\xe6\xdd5\x81 \x98\x85\'\xbcI\x8e\xd8\xf7\xe4e\xaab\x84\xbf\x9aF\xd2\xec\x01\x8f\x8b`R7\x17\x859\xa2iPS\xd5\xe1\xb7\xe8~i\'\xa0\x19\x15\xdai\xe5\xd5jF[\x8d7?\xc8\x85`E!\xa5\x9f\xf29\xf4\x8eA\xcdCI\xddpL\xa8\x0f\xec\x0b+\x11\xcbGg\x9f~\xd7f\xa81|\x19\xed\xaf\x9c1\x11/\x8bt\xdc>"\xe7\xd1\xad\x87\xb0n\xf7\xa8a\x9a\xe3\x95\xf5\xc9\x7f5H\xd78\x05_o\xf4\xfd\x18\'\x87\\\xd1\xd2K)\t\xf3\xc0K\x0bJ\x8b\xea\xe3\x1a\xb9a%\xf9\x12\xb6\x8bH\x16@\xe9\xe3\xa7[\xc3\xfd\x12\xb4\x14\xb1\xfe\xf5A\x1c2\x88I\x04\xf6:\xd0\x0c\xa7\xa9\x96#eH6\x98~m\xf3L<\xf0by\n\xe8\x02\x06\x9b\x1f`\x00\x85v\xb1)Th3\x08\xb2\xb9RX\xf1U\x84q\x98yhv\x08\x0e\xd6\xbfN1[\xfb\xb2.\xfc\x1e\xd0\x84\x02=%FWac\x85\x14\x17\xf5n\x92\x1d\xa5\xef\x0c\x88\xf6\xc2\xf8\x0e[\xee\x02v\xcc\xfe\x19\xfb{s\xa8x\xed\xfc,\xd0\xc5\x19\xa2Nt\xff\x1c3\x19\x8e\xe52\x10\x14\xfa\x05(\xbc\x14t\xf35i\xd3q\xba\x96g\xd4\xcf,8P\xf0R\x8c\xfb\xa3\x017L\xbf\xfe\xb2(\xcbG\x14\x88G\\\xcdy\xb0\xe34\x03\xe8\x13\xb4\x13f\x9aZ\x89]\x95\x83Q\xad\x0f\xb3~\x01\xfa(V\xbdx+\x873\x90,}\xfbC\x15\xd4\x13&ws\xc9k\xef\x8c$\xb3u\xf9@\xf0\xf5cQ\xc3y\x01\x96\x80A\x8b\xf9\x880\t\xa9&\t\x02\x19u\x0f`\x13_\xbc\x87\xbe\x07WM\x1c\x986Jt\xa23&\\\x1dx\xa8\xa0\x15m\xa3\xcdIh\xb6Ox\x8bn\x16\xe5#/\x9d\x06.+t\xeb\xcc\xd4\x1fh\xe8\xf6d\x0c&\x00;-\xd8.\x00\x88\x8da\xc8{\xee=,\x14\x8c\xeb+a\xc2\xaa\xc9\x0c\xf5\x1dr\xb3&\xab\x88\xd7O\x81\xc9Nr\x1e\x03\xa2\xd4[\x10/W\xfdFP1\xc2\xd7\xcf#\xaa\xe8\xa6:\x10\xa5\xa9Bf\x19\xc0\xdfT\xe9\xdf\x88W%\x9f\'\xb2C\x7f\xfa\xa3\x07\xa25*5l$\xe9\x84\x13s!!\x18\x18\xb6\xe2\xf5\xb5@n\xa6\x90\x8d6\xc3\xe8J\xa0=a\xc7\xa2-\x9eG\x96\x06!Q\x18\x9cBf\xe6\xc8\x1ep&Z_\xb1\xfe|\xf7~\n\x99j\xd6,ne\x1c\x87\xafu\x95M\x7f\xd4cd\xca7\xb3\xf3)#O}\xc5gR\xfaU3\x96\x9e\x15\xe9\xac\x7fD\xb5\xf2O\xf2b\x0b\xfe#\x1a\xe1\xcb\xe9\x92\xedt\xacF\xac&\x14\xa6e\xb1\xa3\x89\xe9%\x1d\xce\xf4\x91\x81h\x92\x00\xea$\xa6\xe3P\xe5Wg\x86\x01\xd3\xa0t\x19\xd6\x97\x9f7\xe1\x10\xbdH\'U \x0c%\x12\xf8H\x7f\xcd?\x06g{\xe1u\xd1|\x87\xa1\x85\xc1\xab\x10\xbb\x16\x95\xc5\xb2\x84\xd9\xe4\x1fkBp\xc2\xe3\x17\x0fC\xd8\xf3r{\t\xf0\xaa\x05\xdb\x04\xcb\xf7\x8b4\x01-QRPW\xde\xd2\x92\x9aP\x8d(Ti\xebt\xf8\xb9uF\x9d\xa1\xc5H\x86#{\xa9H\xc8\xbd\xc6W\x80h\xef``\x99\xb49\xa0\'0\xa9\x9bR>\xbb:\xc6e\xc4s\xe02\xb7~^Yf\x9b\x89=\xc6\x18\x15\xc8\x96\x98\x86\x0f\xe5\xf3\x1a\xe4RL\xbbH\xb5\xe5-\xb7~f\xae\x98\x1c\xd2\xd3\xdf\x90\x8f7^Q\xd1\xef\x0f{\xd4\x81\x13\x94\xc3\xbc\xce\xfd\x9d_\xa2%^\xff\xd9\xeeg\x94\x98\xd1\xe6Q\xc4\xee\xaff\xe9\xfb4%\x17\xf8k\xf5\x17Wa\xf7\x9e\n\x0c\x14\xcd\xea\xcb\xe1D\x9a\xac``\x01p\x13\xf9\xd4}9\x7f\x80\x87\xe5\r4\xe7\xb7\x8a\x0fa+\xc5\xa9\xc7)\xac\xd6L\x07j\xf9\x96\xfa\x91\xa3o\xb0\x1e\xdd\xfd\xaaU\x00$\xa8](w\x1bpD^\x00:,\x8f\x07\xb0G\xd2E\xab\x0c\xc7\xaaT\xdc\xc4\xef\xf0O\x11n\x0f\x90\xe1\r\xbc\x06\xe6M\x85\xc2 /\xc8b%\x9ed\xf6\x0c\x86\xd0\xe7\xce\x0f\x00\x9d\x8b\xc8PT\xa8\xd2`T\xc6\xe5\xf1h|\x80a\xbd\x8c\xe0\xddl`\\Ou>\xcc\x0e\x99\x0fP\x1a.A!p\xd0\x0bj\x9e\xc6\x08\xa4\xb6\x8a\xd7\x03\x82OD\'D\xb1c\x0bk1\xc2\xf6\xac`\x85\xf5Nd4j\x19\xf9\x06@T3\x89\xe0\xfbx\x97>\tC\xabl\xddR?^\xe8\xb2r\xeb\x88|\x95\xa5\x8c\xe0\x89\xb0\xb5\x1fn\x0c\x7f\xcf\xa41\x01\xb0\xbf~\xads\xb7\xcb\xd5\xadb\xbcs\x91\xd8l\x00\x0b7\xc6Y\xc0\xb3J\xe1m>\xa60\xc8?m\xd6\x9fx\xa3\xf9\xe0\xe4\xa0\x81\\\x93\xba^\nF\xbd\xc6p3\xa0\xf6\xb9\xe6\xd2\xde\xdc\x92\xef6?\xd8N<\t\x1f\xf4\x83=5b\x1aWbn\xc3!\x19\xb5\x8b3\x8dk\xca\xa2C\xd1\xf2\xb4\xce[\xd3 GO\x85\xc5\xb2\xbaD~\x02\xcf\x82\x0e\x0b\x13\x7f\x1cV\x0fyh\x89#\xd37?\x8f\x12\xc3\x93\x87\x83`\x82o\x99/\xf9\xb1\xa8A\x92\xd5\xe0O\x9bT\x08\xf9):\x13/\x16"\x19\x97-m*%qR\xc1v\xa2\xfa\x81\xe0\x0fI\xa6\xc7w1"7\x00\xa1\xfd\xe8\xa5\xda\xf2\x1ffo\x07+\xef+\x8f\x00lz>^\x87\x13f\xac=\x17q\xb5\xf1\x85\xf0\xf8\x7f!\x95\xa1\x15|\xa9\xaa\\VH\x86"\xcb\x8cx\xa2\xc2;\\\x01\xd3f\xf3\x14\xe4q$\x88s\xe7\x07\x12\xa9\x9b\x13\xea\x92\x1b\xfd2\xe8\x01\xcf\x1d\xe8\x82\xdbl\xa7;G2\x9b\xcd^(BFb\xe1au\xab\xe2\xb8\x8bNI\xf3\x80\x8eZ\x92\xf7<\xb7\xa7Grw\x1c\xee\x98Q\xa8=\xb2(\x13\x93q|]\xfd\xd0\xdb\xd6\x15\xb7\xb3i\xfa\xa49\x1f\t\xd1\x89\x03J~%\xfc&\xf8e#\x92sLf\xe6\xda\xda4iNo\x1d\xd1|\xed\xba1\xd9W\x05\xc5\xad\xb4\xb6\xea\x9a|[0\x9by\xf3\x9c\xe5\xf6\xbb\x17\xf0\xae"M\xb9\x94\x1d\xe8(\xb1\x89\xce\x8e\xa7\x7f\x95\xbe\xdf+\xb0 \xc7:\x16T4p\x08P\x8dM|d\xcc\x8d\xdd\xfe\xeb|\x0b\x93\x1c\xeb4\xfdd]\xdf\xba\xe4n\xdam\xfc}~|\xd6G2\xe3I\x1f\xbf\xd5\x13Q\xd5\xd5\xab\x19\x18\x9b\x92\xd7\xa6?B\x12\xe2)\xd0\x93\xa8\xed\x1a#c\x85\xc9\x15\xa8.U\xb2@L\x18j}0\x8a\xb4<\xb5,\xb6\xa0\xab\xe4\xe7\xeb\xa0\xee\x9f\x82jD\x07\xd8AC\x8f\xd2{m.H\x1a\xbe\nx\x10d\x81\xd5\xce!\xcd\xddd\xe78\x95\x19!\x96]\xef\xee\xb8\xd0\xe71i\xd0V;ZY\xd6\xce\xb6\xc5i\x8b\xe7\xcc\xb3\x8c\xf8+\xc3s\xa3\xa8\xe3b\x89\xfd\xf1{\xd3\xe2\xcd3.\x14{\xe2]\xaf\xf4f<i\xc3\x9dXw\x01>I{\xf8\\\xac\xdf\xd6X\x12\xe1\xb1\x01\x90#\xee\\\xbb\xb6\r\xba\r\xe9\x08\xf6d\x97\x0c\xdeq\xa2G*\xa7=\xfb\xfe\xd9\x11\xc2CWA\xf4\xec\xaay\xbc\xb5\xb7u8\xa0\xf5`\xff\x1b\x15\xd1\xc7\xe5J\x96\xb3\x15\x9e\xf8<t\xe0\x87/sS\x18\xc1\xb7\xab\xb6I=\xd7\x97\xceX2n\xf5\xac\x0f\xdd[\xe1\xae\xfd\xfbK\xb6\xac\xfb\xd1\x0c3\xdb\xfa\xa2\x06\xdeP\xf9\x81\xfc\xa1_\xd3T\xd7\xbfT\xf4\x1f\x15\xd0\xcd\xfb\xc4B\xe8\x8f\xce*\xeeAw\x1ag\x96hT\x1e\xa3\xcf+r\xe5G\x9d\x12\xd4(\x9ey\x91vOe\xee\xc3\x13T\xfc\xfb\xf7\xf5\xdeH\xf3\xc8s\xea\x96R\xe7?\\\x06\x0b\x89\x9ff\xec\x8bBJ\x0f\x1f\xb6\x1d\xcb\xc7\xf2\x1bpb\x07\x9f\xd6\xef\xe2l\x98`\xec\xcb(\xe9q\xdc\xe9/$Zh\xd4\xeeo\xed\x99z\xa5\xc4(\xf8\xb4g\xe3\xa8\xd3~\xae\xbbB\x06\xc0\ncY]\xe9@\x1f\x14XiH\x9cX\tat\xea7\xa5i\xf1>\xfa\xec\x15\xbb\xa7V\xc7&\x83~\xcb\xca\xf4Gu\xc2z\x19\xf8RI\xces\'\xadR3\xf9\xc4\xfb\xd3,\xd1\x1a\xa9V\x9b\xcc\x92\x0eG5\xffet\xd9\x15\x96T\'b\'\x93\x0b\xe5\xe7\xbe*=3\xa6\xe1>\xec\xef1!x\xdf"\x83\xcbA\xcd\xdf\\\xa4n\xbd\x8d\xb9\x0c\x95\xb5\xc9\x99JI\xf6 ]\x81u\x92H\xe2\x07%KY\xf0\xe0V\x9e\xc9\xfdm\x01\x14Z\xaf\xd1\xb0E\xf1W\x1d\x8fD08\xfe\x1d\xed>\xa7e\x17\x11<Z>\xe1\x89\xec\xb0v\xdav\xc1\xcf\xd7\xb5\x80F:&7\xac\xbd\xb6ya\xb0\xb7\x18\xcc\r\x9e=\xc4\xd5\xba\xa7-@FH\xe6\xb3\xb1\xb8\x9f\xc3\xb90LZ\xfb\x17\x8b.\\\x85\x03\xfd\xd1\xc2\xaf\xf3\x823\xf1\x91\xd7L\xa5\xb6\x9c\x88YZ\xe1\x9f\xe9\x94=\x93\x8e\x11(w\xa0\xa7qx\xa7\xb1\xa4\xd6\xe5gT\xc0\'f/\x84\x12\xae\xa6\x82\x15\xa1\xdb\xcf]3\xcd\xd0\xbai\x8f\x9f`\x12\xd2|\x92\x87\xf5\xdc\xb7F\xcb\xf8a\xce\x85\x19\xb4?yO\xfb\xae\xbb\xb1\xa0\xdd\xa4/\xefN\x7f\x13\xd4\xf2\x1b\xcc\x17\x9c\xd4n\x0bh>,CX\xee\xed\x1d\xb6\xc8\x18\xbck\x8fw\x95m\xaaN\x9cx\x8b\\\xbb\x9b8aQ\xcc\x98N\x98\xd5o\xea\xb8E\xf5\x96\xb3\xb4OR\xdb\xa2M\xe4&:\x82\x0f\xce1\xc8\x82\xf7\xb6\xcf\r\x98A6\xb2n\xa3a\x9e\xaa\x8fC>`*L\xc0A\xde8\xa7yy$\xd8\xe34\xa3B\xf0\x9e\xd2\xdc\xa7g\xd4\xd8\xfb\x04\xee\x9eG\xfc\x0b\x81\xdc=\xe9\x98\x96{.\xf8>\xb1\x85c\xe6=K\xbb\xf0K\xfdN\n\xaba\xeb\xa8\x15G\xf3\x9e}\xbc\xb8\xa2\xe2\x00\xcb\xae\x97\x00-\xc7\xb6}\xacP\xa7\xbf\x9f[\xd3\xad\xd9\xcfr6\xb3\x7f\xdc\x89\xcc>Gh\xc9$&&\x1c\xd7o.\xc5\xa4\x96\xf8\x9b\n0\xf4\xa9Ru\xf7V.\xe5\xac/\xaeG\x12l*\xec\xb20f\x96\xea\x9f\xbeh?\x11\x9aD\xae\x14=\x0f\xb0\xeazY\x01`\x8e\xea\x90N\x9ap\xb7\x91\xb9\xb3<\x1c\xd6\xd4\xa05\xb9\x8b\xc3p\x88\xa5}r\xdb\xd471RDqF\xc9\xa2Cm\xb9:\xef\n\xafS\x00\xe5^\xbc\xfa\x9e\x14\\\x9b\x89\xfd\x82B\xedr\xf8O\x9c\xdb\xb2\x17\xb3{<\x8c\xfaR\xcd\xb2\xcb\x00\\\x19\x05C\xc7\x02\xbd\x8e\xf8a\x17\xc6!\xc6\xe5\xb05\xfd\xae\x9a\x05\x15\x8f\xbe\xb0\xe657&m\x1e\xcbP\x19^\x88\xc2T\xe8\xde\x11\xaf7%\xf6%D\x80\xab;`a0v\x92\xeb\xfa\x8a\xd1%-c\x1d\x8e`\xef\x98\xc1;\x02d\x93\xb7\x9bZ\x82QkY\x18\x81\xaa;\xa6\x02\x9e-o/\x8a-\xfc\x0e\xe6H\xe3\\\xcb%\xfc\xcc6{o\x84\xd0\xb7c\x0c-\x0b\x86\r\xc5\xc6\xa3\xd6KA\\y\r\xccN\xbc\x19U^\x08\x19\xe4\x89\x11\xc8\xb1\xc1^\xca2{e\x0fu\x12\xe7\x94\x17\xa6u\xacE\xeeQu\xfb2~\x9d\xbc#Q\xef\x95l\xa71m\xbb\xd0\x17\x85.C\x8d\x0e\xf8\xf7\x17#\x10\xd2\xec^\x00\xc6\xad\x87R\xea\x85\x98\xc1\xd0\x88\x88\x82/+M<8\xce\xa6M\x9d\xa72K~\x82\x8d\xecL\xa8|\xb9\xf8\x1e\xb1 \xcb\xba\xf4C\xbe\xa6\xc6\xef\x9c\x8c5\xbfK\xe7\xd9\x9d\x1a_W\xed\xb1\x81\x19f\xbd{6k\x13O$\xeb\xbaf\x8aj\x1aXP\x9a\xe2\x04g\x0e{\n\xfa)\x1e\xe6\xda\x85X\xd3\xd1k\x97\xa5\xea\x05J\xa0v\x03\xb1[\xc2\xa3\x8b5\x15\xf0\x90g<\x98\x14\x86NS\r\xba\xba\x89* 8\x0c\xfbm\xf3\xcc\xffN\x90\xfb\xa4Q\x1dg\x1d#\xba_\x82`\x08\xc2\x96M\xce)5\x7fD;B\xf3\xbeI\xf3\xd4oh\x8c\xba\xaf\xa1\x1d6\xf6\xe2\xad\x85\x9e\xbc\xa9\r>\xcdR\x08\xdd\x1b\xaa\xd3\xfa)K\x0b\x05\x02\x06rE\x96u\xf5\x17\xf3\x93\xb1\xfbo\xac\x86\xf2h\x00\xf5\xc0\xf9\x8a\x10qe\xb9\x8cV\xb2\xecW\x1b\xb2n\xdf\x10\x07\x9c\xea\xb6\x1c\xf6\xde\x9a"\x05\x95R\xcf\xfb\x0ck{\xfb\x1b7\x1f\xc2\xc6\x18f\xe0\x98&\xe3y\x9db\x85r\xd9/\x05\x7f*w\n\x9b\x8fQ\x10\x06\xd7(\xa6\x19\xfbt\xef\x82\x05oa\xca\x7f\x07j\xf9\x0cd\r5&\xcb\x06D\xb1\xf3\xad"\x9e\x99O/}2\xe620\xbf\xfe2s\x86\xd6P"\'9R\xf41\xc7\xf6\xaeX\xe5\xfcs\r\x89&\x19\x1cj\xc1\x8b\x9d$M\x1e\xb8\xa9\x82\xdc\t\'\xe3\x9a?\x19\x92{5\xd4,M\xaa\x84\xc0\x99\xe9|\x1f\x84NAp\xa1K\xfb\xe2\x0f\'\xe6\x1e\xbb\x8a\xddY*\x86s\xd3\\X2\x88\xea;\xa1\x17\xd4\xbc\x1fp%\xa1\x0b5a\x8d\x0f\xc0\x9a\xbe\xdd\xb1\xa2\xc6\xae\xb6\t\x16\x1d\x93\xaf\xe2\x89\xe1\xec\xbd\xe82\xd1\xa3 w\xfd\x9e2\xef\xb7?\xc4\xa0\xaa\\;\x0b\x13\xa7%\x88\xf8h\x01\xd4mn\x00\xc14R\xb8\xc2\xe4\xbf(\x06w\x0e\xcf\xca\x9e\r\x8a!^\xdfV\x04ER]\xef&\xcb\xed\xdd\xbf[\xe6P\x95\xa1\x8bT\xaf,\x8e\xb4`\xe0\x92*d\x95q\xc9l(\xc5\xe5\xb4\x88G\xb4g\xe4\x17X\x9b\xf5o\x92\xe1v\xbbt\xd1f\x15\x1f\xbb\xe3\x99\x10\xe9\xf4\xfe\x98#\x19\x0e\x1f\xcb7\xd7\xb7\x9d\xf1\x08\xf0\x10\x0f\x13w\xd5n\x14\xd6\x1f\xdb\xf5\xcc\x98>~u\x07\x94\x06V\x7f\xd9Z$X\xb9T\x960d\xa9\xe6C\xbf\xecrZ\xb4F\x80\xf5\xbc\xf6<\x9b\xcag\nz\x8b=\xee)1\xf4\xcdR|\x8b\xf8h\xd7\xd1\xd5\xb6lk\xafW\xecB\x1f\x0c\x94\n\xdd<\xc3\xd6\x1c6\x14\x91\xa8\rM\xab\x99\x99\xd0)\xac\xaf1\x04W\x89\x06\xe0\xf9\x9e\x15\xcd_\xf2\xa3\xba\x90\x83\xee\'> lZ\xe0\xd2\xe0X{\x08\x18\xd0q\xf2\xedM\x8eC\x81\xd1C\x96V>\xf8\xe8J;D\x92\xb0\x91BfF\x1d\xff\x05@F\x17X\x0b\xb1\xf0\x89t\'\xeb\xf6\xc9w\nv\x15=\x9c\xde(\xb3\xf9Q\x9d\xe8\x83\x83m\xd4m\x05\xfa\x08>pP\xbf\xfe\x8b\xe0\xaa=\xf9\x14\xc7\x8bKqj\x9f\'\x00N\xb1\x1d<\xb7C\x07\x13\x87k`K\xb6\xef~\x8c\x18\xcf\xc3\x1d\x890\x83w\x8c\xab[\xe5\xaf\xfd\xc2`\xe7a3.t\x14\xe9L\x0f\xa2\'\xf9b\x92q\xc173|\x12fI*\xab\x1b|\x9c\x94\xb3\xc7\x9eE\x9bO\x818!\rh\x1a|4\xbe#\xe5\xf3\x8a+\xdf\xc2\xde?\x89\xd6\xdd\xc8l\xd1\xc7cSl\xf5p\xc2\xb3\xeb\xa9-=\xban\xa0?\xaa\x1d\xf1\xc4\xaaC\xb1\xc2\x07h\x87`\xaf\xa2\x9a\x1f6-\xc6\xf4\xdd\xe8l\x86P\xd2\x92O\x90G\xbc\x87\xaeGm\xbfj\x08\x80\x1e\x05wdY\xe2!\x1e3w\xd14h\xf2\x18\xc7\xbc\xa2a\xca\xae<\x8a\xd75#\x99\xf1JG\xd2\xb3c,c\xbf]\xa1\xda\xb5)sK`\xa1\x97(\xb0\xb6\xe1\xc6\xeb\x1a\xc9\xfc\x97\xb6\xd1\x96\xbf\xae\xc0\x05ur\xb4\xe6\xc9\x1e\xea\n\xbd_\x1eQ\xbd\xa40\xaeGE\x16\xc3\xb9\xaf}\x0e\x8b\xc6<E5\xf9\x9b\xdc\xd2\xe1ok\xcbS\x0b\xc7\x13\xcbW\xbf\x1c\x91\xd7\x16\xb2\xe2F\xfe\x91W\xb8\xfc7\x88u\xd6\x8d_iX\xff\xe1j\xc9C\xb1\xb8\x1awX\xf2\x9fz,\x1a\x8f\xa3\xcb\xd3\x12\xbbNA\x8f\xe1\xf2\n\'\x8eg\xa3:X\xf2lC\xfd\xbd\xeb\xffSM\x14\x0b\xc5\x1a\x8eU\x9e$/\x07\xff\xa3\xffF\xe5;\xb8\xdc-\xc1&(\xa4|\xa6\x06p\xe1;Q:\xb4\xd4\xaeq\xb8\x94XR\x1d\x97\xcb\x1fs\xa9i\xda\xf0\x1a\xd0\x97\x03T\xec\xfbp\xa2\xc4\xd9b\x8b;TX\x9ajt\xce\xfc\x93a\x8b\x11\x9d\xb3<\x19\xdb\xd5\x1f\xf5O\xe5bF\x80\xc1\xae\\d\xf0\xd6\x94\x7f\xd8\x93\x8a\xdbw\xfa\xcd\xa4\x82\xfaT\x9bJ\xec\xdc\xd1o\xcbSx\x06?s0z/X\xdf!\xf1z\x97R\x91\xf6\x0b\x81\x99\xb2%\x17\xed\x96\xc6+_\xff\x1e\xe8\x86r\xa9g\xff\x86=\x93\x95\x07\xberL\x8cZ\x9aX\x95l\xa7}\xc3\xe0\xe0Jh\x0cz\x03o\xf2\xcaS\x8f\x83*\xa2\x86\xf6\x9b`Mp\x1b\x82\x8a\xe7\x0c\xbe2h;\x03\xe1\xc1\xedq\x0b0p9t+\'\x05.\xda\x9a\x8ew%\x11\xd1\x15\xe7\x87Z6\xad\xecff\xfe\xc8\xdf\x90\xf6\x9fC{\xaf-h\xd5\xedg\x0b>;\xf4\xa8X\x12\xc10\x076~D}\xfa\x10N\x17DK6\xfd\x8d\xb3\x1f\x9d\x07o\xd1\x96n\x1a\xd4t\x17=\xc9\r\x90\xf7\xae\x8e\x8d<\xcd[\xec\x94\xbc\x9f:\xe3\r\x14\x0cy\xc2\x1e\'<\xe6*"\x8e\x0ct\x18\xae\xa6\\\xa0l$\xe9\xf4F-\x9c-\x056\xf2\xb1]j\xd0\x1a\xb4!\\[\xb8\xdc8e\x04Vp`\xe1\x82\xce\xf4K}\xaf\x0f\x9d\xaa\\x\xfe\xa5Lr\xee\xc3e\xc8\xfdO\xb9\xc4\xcd\xba\xf9\xd4ce}RIm]\xf9\x9c\xc97\xf9\xb4\x91\xee\xb7\x87=\x15\xea\xe9\x12G\x13\xf6\x93R\xb9wb`\xb1\xcejQ\x04&\x9c>\xf8\x89\xec\xdb\t\x03\xc9\x9c\xef\xde\xa8\x00\xc7\x18C\xd6\xe3m2\x84\x93}@!\x91\x96\x83\xe7`\x15\xcf\x91\xf6\\\xaf\xb5\xeb\xc8\xfd\xf2\xb9nXt\xd9\xbe\x87EW\xae\xc9\x95\x99\x87\xbb\xe0\xa4\x11;-\xd8>\xa1\x0c\x80\xc2\x17*\xda\xc1\xbaq\xe9\xb2i\xd5P)B_\xf4\xb6o*\x18\xbf\xa2Ul\xe8\xf27\xcej\xf4\x88G"\xf8_\xb2^\xeb\xa8X\x80\xa5\xd2\x16o\xbc\xb4\x00-s\xed\x14\x14\r\xd0\xe7\xc7\xdbwc\xc1\xcflU#7g\xd7\xde\x8d\x0cX4\x89g\xfb\x7f\xd2U\xc5\xb7\xcfw\x19q\x10N\xc2\xda\x10Y\x86\x90\x10\xcd\x13.1\xcc9\xf4Vd?\xff\x82/\xf8P\x08\xed#\xf2{\xf0(8&\x81\x9a\xf2\xd4\xd2q\xbb\xa5FQ\x93\xf2\x13\xd6\xc5\xad\xb9\xff\x95?K\xbb\x98i\x05\xaeI\x03\xf8\x9a\xe6B\xde\x90\xa8\xbbl\xb6\xeb,\xb3\xa1t\xfaK\xc9A\xac\xbf\xff\xe1\xed\\\xfbCr\x81F\xae\xcb\x1a\x91a\\\x84\x9d\x8f\xce6\x1d\xd9@k\x03\x9c#\xd3\tW\x81H!s9\xc6u\xc5\x93T\x03\xcb\xd0\x9dp\x10\xfae\xcc\x94i\x90%^\x04\xfe\xed,\x96r\xfdeQi\xe3l\x18\xd32>`|\xff\x98\x11\x8aby\xbda#\x03$\xe7\xf9\xece6i8B\xcd\xaf\xed\x99,w\x7f\x16\x05\xd0Tq\xed\x96L\xb8\xc8\xb4X\xb2\xbe\xb9\xd6\xf5G\x004\xccNC\x98\xbee\rlq2\xd0{s\xd3\x1b\xdb\x0fH\xcbC|\xc9Z]\xb9\x9f{\x90E\x8c\xe8\x80\xdcFy\x99$\xc0\xad\x82\x10b\xbb\x8a\xbd\x1av\xe7\xe2=\x0f\xb9)\xd1\x9c\x9aN\x13\xe5\xc1\xa2.\xbc)*]\xac\x17\xac\x91\xd76\xa25-8\xc7\xd6+\xd6H\xd4\x08\xd5\xb8\x81\xbd\xea\x11\r\xe9\x1d\xc1\x8c^\xbb\xd0^T\xcaY\xaf<\xb3\xc5?\x8e\x1c\xc6\xaa[\xf2\xffO\xba\xdeV2}\x9f7\xbe\xdb\xc9qM\xab\x1b\x1bg\xb8Q\x98\xba\xfd_\xb2y{\xed\xa7\xf6\x1d\xdb\xbb\xb6:\xd3\xe97\x00\xc0\xd8\xd0\xe3\xd2N)\xf4A\x19\xb13X\xb9\xc3\xd1\x1b\x8e\x86v==\x85\xf5\xce\xdf/\xc1\x89N\xaf\xaf\xa0J7$\x12\xbfe\xd6\xf1\xfb\x8b\x1b\xfd\x93 \x9c\xd3k}\xb2\xcd\xech\xbe@3\xb8JRj\xe2\xda\xa9\xd9\xb7\x89\xf9\xc9\xcf\x1a\xe0\xa4a8I7\xd0\xe8\xad\xa0bD9\x98\x91c&\x1d (\xce\x9a?\xde\x88MN\xb46c\xfd\xa5B\xe0R\xb0\x9d&\x9c[\x02Kme\'2\xbd\xd3\xa6\xf9=\xe0\x92\x91\x9cr\xc7\x81_\xef\xfc\xc7d\x9d\xe8Z\xf8R\xc4I\xcc`MU&\x88]\xf1\xa2y\x82k\xfb\xe1\x8a\x8c\x91\no_\xfc\x1b\xc1.&\x9e\x99\xf9}\xcc\xa9\xb7\xe4\x98\xb8\xb6\xcd\x83W\x90\x0f)\xc2sKOW\xff\xa1\x18rX#y\xa94w\xd85\x0c\xdb\xdf\r-B,\x08\x8e3\xf6X\xff\xd7\xf6\xb1\xea6u\xae?\x14\x19\x1f\xd8 \x01\xcfZ1\x08\x93?\xd6%\xe3\xb2\x1a\xc1\x18\x04\x9f\xf1\x88k{\x05|\xec\x92\xe1\x8a\xd1\xd2\xb3\xce{L\xd2\x0e\x1c\x15\x1b\xbdo\x19\xcb2\xf6\xdcq\xf0Em(\xed\xd6\x07s4\xdc\x07c\xefLwx\xa5\xc5\xb0\xf0`\xbb\xbcm\xe2\x86\x85\xe8\xe6k\xf0\xe6|c\x1b\xfd[\xa4p\xc0\xd7eyod\xa2y\xfb\xfed\xa2\x1d\xe5\xf8zd\\b1\xa1&g\xc5\xfd\x0e\x82\x89>%%\xa3\r\x1ao\x0f2G\xcd\x89\x9a,\x02r\xceNS<\xf8O\xd9D\xb8}\xd5-[\xf6\x10y\x93\xb8\xb6@\xa2\x90X@\xef\x1a\xf9BJ\xa1\xbcJ\x9a\xc4\x82\xf2\xcc\x19\xd8K\xee\x14\xdd\xfee\xbeh\xd0\tG\x9c\x166\x1f\x8f1\xd2\'i\x15\x80mV\x96G\x08\x96\x8e0G\xff\xd3\xd4\xb0\xcb\x863R1k;\\r\xb0\t\xf7\x9d\xbbA\xcd\xc1U\x1c\x07\x96f7$\x8ct\xdb\xf9b\x04\x9av\xff\x0b\x9ar=\xaf\x12=\xf4\xfb\xed\x11\xf4\x9d\xec\x82SJa\xde\xf0\xbf\x0e\x0ef?g\xfff\x17\x1f\xc3\x99\xc6c\x9e\x8c\x1b_\xb1]9p\x11\x8b\xc6\x1c]M\x80\xcb\xa3\xfei\x12\x7f\xaa\xa3\xb7\xbd_\xbf\xdc\xe8gY\x14\xa8\x8d\xa3o\x8f\xd0\xa2c\xfd\xc73\xb7$_\xec\\\xb6\x0fa\x85\x877C"\x90\x1d\x9c\x9b\xf3/\xbd\xf2\x96C\x07nqi\xa4\xaa\xbc\x0fO\x18\x05\x1f\xce\xd2\x8aJ\r\xc9V\xcd\xa7\xf479\x19\x82;\xd4C\xac$\xd9\x15\xc1\xb9\xc0G:\xf99\xca3\xb5`k\r\xec\xcdM^\x013W\xde\xde\\\xd5@8\x8aj&\x11\xf8X\xcf\'\x15\xec\xdb\xd5\xe4]V\x01)aZ\xe4\xb7\x83\xd9\xa6\xc1M\xc7\xd7p\x80k{\xc0\x7f\xea\xd8c.\x1c\xd7\x82\xfbY\xc1\x8a\x80n\xa2$TV\x07\x08\x11/.\x91\xf0|\xde\xe2\xac\xf8X\x903]\xcb\x8a<\xe0\xafI\x9c\x83\x97\x8e\x0c\x13\xcc\x1b5\xae\x08\xd1Q\x8e\xf4\x9d\xdeH+\x03\x1eBU\xe9\x83\xab\xfe!\xa7\xf0\xdd\xaawZ]\xab\xf4\x84\xc6\x0fz\x8a\xfd\x05\x17+\x0b\x0f\xed\x94s\x19\x90\xa9\x08\xffO\xb1\xf25\x98n\xa3\xc6\x03\xf7\xf0\x10\xe4\xae/\x95\xe9=\xb8\x00\xd8\x07\x88\x1f\xff]\xf9\xcct\xd7\xcdwRi0\x8d\xbc&\x1e%\xb2\xfdl\x87J\x87W\xe6R\x110\x95\xf0T\xf7S\xa2\xa5\xef\xfb\xb7\x8cj\x19\xef\xfbO\x07J4\xe9bg\x01\xf7\xedVg\x9e\xdeL\xc2\x9b\x86\xc3\xe0*N\xbd;&\x95B\xa6\xdf\xfb\xc9B\t\x89\\\xfc\xc1\x8e\xd5\xf6\xd9Y\\\x91e#\x92\xa4\x996\xc4\xc2\xce\xfb\x89\xbe\xe7\x9c\xe8@\xf7\x8b1\x8ex\xb8z\xd8\x83 yU\xb4\x9d\x8f\xc2\xce4\x8e\xdb\x87s1\x8f\'\xc0\xc1#,\xa9A\xf9\x8a)P\x03\xf2\x8a\x1d\xa7*\t\xcd\xd0Q\xc8\x99\xaa\xe0/4\xe3Px\x18\x19\xc9!\x08O\xa8\x8bVAK \xab\x95}\xf0v\xce\xf4\x92\xc5\xba],go\x95q\xd9\xdd3\xfc{\xf2\x08]\xf1\xec\xa2\xf5\xb8\x8f\xc2\xa0\xa5\x81*\xadM\xf6\xf3x\x8e\xa9\x8d\xcb\x9e\x00\xf4\xf2\xd1Y\x02\x12Lt\xd2\xd1\x08\xcd\n\xf6\xdc\xf1L\x0f\xe2{\x88\xa7K\x88k\xfb\x05\x92\x8797z0\xca\xf5\xa0\xd9\x8d\x16\x8c]\xda>\nr\xec\xa4e\xaat\x1c]\x12\xbc^\xea\x8d\x84\xfd\xe5\xe7\x9b\xa17\x90\x12T\x0b\xfd`wt\xa9\xc8\x99\x19\x16\xc8\x96\xbc\xd8\x0e\xe56}1?\xed\x81\xcf|T\x8f\xaa\xd1\xddp\xa7\xc64d\x819\xc2\x08N`V\xfdL\xdf\x17\xbc\xf0\x1e\x05vr\xf8\xb4\x1a\xe0\xa0\x1b\r&p\xa9m\xf0 \xdb\xd9}V!\x9a\x90\xec\x8a?\xa4\xd1\xfdtV(\x9b\xfa\xc1g&\xcf\xd8-\x07\xc9,\xdc\x06e\x0bW\x0fc.\xb1{\xa6\xfa6\xe1\x88d\xf3q-\xe9\xb84d\\6\xc5\xf4\x05\xd8\x88\xe4\xf7\x14\xee\x88\x8d\xf4\xbaA\xd8\x89X\xc7E\x8b|\xef\xe7\x9d\x1aPuF]\xb9*\xdc\xf6 \x8el(\x9b:\x7f\xa4\xa0\xe9^\xabK\xde#\xf3\xf1\xb7\x9c\xbbTF\xf8\xd7\x15u/\xdf\xa9-\xb7\xd4\xbbS\xc8\xfd-y\x82\xcd?\x1b6\xba&\xee\xc9\x7fp\x05\x87\xe6F;\x7fD3\x81\x06\xe7S\xf5j\x8f\xfe\xf0\x04\xb3\xaf\xde\xffOv\xfd\x9e\xfc\x16\xf0\xdaj\xb9\xb6w\x1d?)\xea[\xa4\x0c!\xca\x90>b|\xb7n\xb7:I\xf5\xe6;\xb57\xc4\xb0\x8dd\xc3\xc4\xb5+\n\x80 \xb8\xb1Q\xda\xc7\x85\xad\xba1\x16\xd98AE\x96N\t\xfe(D\xb6\xa3\xb3\xbf,\xbdO\xf7\xc4g\x8e\xdf\x89!\x8e>\x87v\xe0\x14\xcdW\x8f\xc6&\xcd\xabC\x96Mq\xe7\xe0\xfe\x92%\x1d\xa4 g\xc3\xedAd\xc1U\x94\x0f\x83$3g7\'\xfb9Jt\xc2\xdcgx\xe9\xbd;\xd8\xde\xe7\xc3&P\x02\xdd\x00\xea\x16\xd1\x1b\xaf\xf4N\x02\xb2\x1e\xfd\x10\xef2`c\xa0\x9a\xcf.\x8e\x0c?-R\x16(|\xcdM\xd0\xd9~\xd6\x16!g\x01\xb3.\xd1Z\xfe/\xa1\x1e\xb3pTP\xfcx\xf5\x91\xcc-\x1f\xb8\x93\x06l\x12\xdb*\x8dk\xca\x86\xdd\x82\x15\xc6\xc5\x84\x8b*M\x7f\xbe\x8f\xd6\xd5\xe8\x0e\xdd ed\x11\xbd\ro\xfd\xe8\xd8\xf9\xe7\x9d\x80qB=\t\x80q\xfa\xf2c\xfd\xed\xe3\xb5\xb8\tS\xdc\xd8Lp\x91a\xe4\x84AA\xecF\xc4\xad\xb8\xbf\xc9\xd2q\xe4o\x9bTP\xbfU|\xde\xa3j\xca-W\xebP\x1ar>\xf2\x1e\x0f\xd9\xd7\xf48\xfa_\xec\\*\x1c\xf91\x9fNM\xc3\x0b\xf0\x00\x1c\x9e<\x9a,\xc0\xcdn\xa9\x93\xa4\xbf\xd52\xf8\xd3\xa9yCwE+\xa4\x91]d-:\x0f7!\x85XzH\x8c\x174M\x1d6\x99\xfb\xe0\x02eW<\xfc\xd2\xde\xd8\xc7\x86T\x1aL\xcc\xec\x1f\x04\x83s\xe9\xd0r8Yup\xf2\xdd\xe0F)m(X\xc2\x07\x9fif7\'\xd6\x13\x7f\x80\xf2<R\t|\xff\xe4\xee\xa6I\xceI>l\x1e;s.\xdd\x10p?\xf1\xbb\x00\xb84\xe7\xb4U\xee\xc9\xf34\xc3MYy\t\x99a\xa5\xb7\x96\xca\x9c\x8d.lb5TI\x81i\xc0!jI\xf6\x92\x170\x8f6Z\xc1\xcc\x8e\x9e\xb8\xa2)\xf0a7m\xe9\xfd?<!\xac\xa4\xc3k!R?\xd5\xd4\xa6+\xcfF\xe5\xe3\x9d\x18\xec\xbf\xe8\xc9\x14*i-o\x8d\xfbu\x8c\xc9p\x1b\nV\x01{\xe3\x7ft\x91:7\x84*Cl\x10\xbfG\xf4\xbb\xf2\xfb7\xf7*\xb0c\xa7]\xd1\xa8X{\x8c/\xca\x89\x8eY\xd5\xb09\xd5G\xbe\xa0r\xcf\xe8\xf0f\x9d\xa4#\x95!`\x83\xeb\x88\x7f\xfa\xdd\x10\xd3\xcf\xbb8\xe0\xfeC\x89<a\xbb\xc5-\xe6_q\x7f\xbb\xc4j\'\x13*c7j\xafr\\\x1d\x8ar9\x05V\x1d]\xae\xe2\xda\x96\xb3\xc5?I\x14\xefMs=\xc4\xf6\x8d~\xab\xe6S}\xb0\xff\x1b95\xc6\x16\x9e-\xa7\xf1\x99\x0f\x14\xd4\xae\xbe\xf4\xbbt\xa4\x90\x9d\x8c\x18w\xf96Wl\'6\xd1\xc3nr\xe8\x92\x06\x93\x9c\xae\xd5\tc^x!\xa2\xb7\x1b%!\xfc\xd8iz\xe3<\xcf\xfe\rs\xfe\xc6>\xa0\xa1$/\xc0\xfd\x89\xe5\x06\x8a\xa3J\x0c\xfb\xa2\x9a\x01X`|\xe6Nn\xec\xdb\x92\xbd]\xeb\xf7 \x1e\xaa\x061N=\x85\x0c\x88\x1f\xc7$\xcf\xe4\x06\x8e\xdc\x18g\x99w\xef\xfc\xe9a\xd4 \x8f[C\xd7ag\xc2\xb5k\x9b`\xe7\xdc`\x9e\xddF_$\xf3\xc7gC\xe8\x9f.]q\xefu\x8c\xeee\xfa\xc3z\xe2n\xf4cT\n\xa0\xf4_[\x1a\x11X\xff\x8c\xb6\xa3\x9a\xdd3\xff\xf1F\x86\xc9k8\xb8\xd3\x08\xf8:\x92\x12\x8f5L\xfd\xfb\xa3\xdb\x11FV\x1d\xf6p\x13\xe3\xa1r\xc3\xee\x19\x17\xc0\x87\xfei\xddL!\x874n\x9bjq\x86(_e\xbc\x9c\xe9\x18\x9b\x92qM\x81j%\xb3\xaf\xb0\xf2\x1cw\xfa\xd6\xd87\xd3\xd6\x12\xa5$H\\G\x83UI\x92s/\xfd\x89s\x92a\xe2t\xaf\x85\xe2[q\x15k\x91\xcb\xca@C_\xa4\x92\x1b\xd2\x01\xfa\xae\xfb\xc1%\xc7\xeevvC\xda\x7f5\xa6\x82+\xf0\x05\xba\x00\x0bD\xde\x18\xd9\xa6\xad\x04%=k5\xb0/\xbc\xe4m\xf4\x7f\xbcS\x18a\xf4\xe5\xbaoy\x14\xb9\xb1/\t1\r\xc7w]\xaa\xef\x9d\xbad\x93\xbb\xe6pg\xa2vwr~\x8e<`t\x9e_\xe3\xb5\xe8\xae\xb4\xe7]"\x909<P\x9de\xf9\x8b\xed\x8c\xc4^\x17)W\xdcy\xad)`>on\xd2\xa2\x9b\xdc4\xea\x8dp\x05\xf4qvO\xa88\x10\xa1\xbf_9+\xff\r&\x8a(\xc4D\xde\t\xb2i\xc9\xbdD\xbb\xda\xf6\xa7\xb9\xd71\xce\xe9\x02\xff\x828\xeb\xd22\xc0\xc60\xdc\xc1\xea\x14x\xd8\xe0\xdbq\x99\x83\xab@^\x84\xaa\xb1)T\x80\r\x90e5\xbf\xb4B\rC\xe1\x06\xbd\xac\xb0Sp\x0f\xb2\x9a\xd0\xad8)\\f/a\x86\x00\xdbH\xa3O"\r\xed\xee\xfa\xb1k\x84\x9ee\xdf[^9\xef\xf3\x02vw\x07M\x0c\xbeMs`)\x00\x01\x9aP \x13\xd1\xb9\x0c\x033@.\xab\xa1l\xb0\xe5\xb7h\xe8\x8e\xdamci_\xb1\xf9\x00\xe2R\x91\x01b\xb3\xfcQh\xf17\xa9?\xc5a\xec\x19I\xb5\\x\x9dM\x8c \xae\x12w#\x8ff\xfci+\x13lR\xd7{\x93\x03\xb7k\xbfP;t\xaa\x8f\xed\x04n\x0e\xee\xfff\x1dr_\x99eyn\xc3\xb9\xb1]\x11L\x04\x9c\x15\xc0\x11\xc6\xd6\x01\xd7\xcf*yr\xf8O\x89>16ii\xc7I\xff\xda\xbd5\xdc\xda\xd3\xfbIO\xa7\xd9\xdd7\xb9\xf2\xb0i=\x8a\x15\x19\xb4\xe1\xcf\xc8e+\xce\x90\x1dP\xfb\xf9\x951\xd3O\xa5\xd1\x8c\xea\x97\x82{w\xc3\xed\xe4\xc1\xffW8D\x81\x80v\x1d\xbeJ\xe1\xd3\xb1[\x9c\xd4\xc1\xfd.\xad9a\xd9\x9f\xa2\x04w\xd1_VJ6\xed\xe4>2k><D\x92\x7f\xe0z\x1f\x86`F\xefd8\xa2\xe6\xffig\x97\xd2NA\xea\x8b\xb5\xf3\xdd\xcd\x85\xe9\x13u\xa9\xa0\x0e\xc0u\xd8\x83w\xc6\xb4hsU\xbe\xf47uw\xb4\xad\xf2\xda\tU\xc7+`\x05f\x1f\x8a \t\xe0D&\xc0m|\xa0\x9f\xa5=\xd7\xa3HM\xf8\x90\x84\x90\xc6\xf8H\x9e\xdbW\xdbp\x8f\x1f\xc0\x0c\xdf(\\#\x1b\xaa:\x93\xf0\x15\x9b\x9a\x9d`\x93\xe0\nO\xe8\xbbw\xc6\x999\xd8\xa7\xaa\xf7&oU`f\xf7\xa7mR\xe0\xady3\x93\xe3o\n\xa1u,;P3\xd5\xd0I\xaf\xa4k\xca\x10\xc6sf\x99-;\x84}d\x83\x0f\xa4\xdb\xdd\x04vK&\x99\xa4/\xdd\x9a\xc4\xabJ#\x84-Nh\xc2\x1e\x8dD\xad\xf7kW\x9a~\xafa\xf4\xda\xcb\x88\xd3*>\xf0\xf5\xfc\xd5~Xe\xb0\xc6k\xd5w\xc5\x8eQ\x98\xb1\xd6p\xddO\n\xdfk\x98\xff\xeb\xb7\x8fH7\x7f\x17\xd8\x94\xb1\xfc\xd8\x8c\xdes5\xda\xac\xb6\xa0"\x19\x8e\x98X\xd4z\x81\x03\xad\x8dJ\xb8#K\x9a+\x11\xfb\x16\xc3\xe4o:\x07\x9eF\x8e\xca\x13\xb3[\x8c\x7fE\xdd\xdc`B\x14SfL[|\x08\xb2\x08\xdc\xb7 #v\xb4\xb7U`\x12\x87\x8c\x1f\x95\x85\x7fc\xb1\x16th\xc57&\xab\xf7\xef=\xeek\x82\x0b\xeda\xcd\xadZ\x81\x1f\xb7\x0f\x06\xc7\'\xe0<}\x9a)\x07\x0cTo\xd7\xb1\x7f\xdbAT\r\xd4G\xf0]}>\xd7\x83\x9e\x92I\x9a\xb0z\x1el\xc38\xc0\x9c\x19\x7f\xd1\xfee)\xde\xf8J\x96\x15\xfcC\x8bZ\xd7$\xc2\xeb\xf5\xe8G\xd1\xaf\x9fd9\x1dQ\x1f\xfbQ\xc5\x1b\x93\x8b\xc3\\\xa8H\xbb\xb7(\x8c\xe789\xfe\xfd\xc2i\x10)J\xa6\xee\x1a\x03h\xbf\xee-\xfc\xd9\xc8\xb1v\xfamr\xc9\xfb\x1a\x94\x06\xde#\xc4\xe3\xa1\x86{\x80\x1d\xe3\xad\x86\xca8\xc9\xd4&\xe3Q#o\x88\xc17\xbb\x13\xc4\xf55L\xd1\x8c%\xd9\xc8\x1a\x1d\x8dXF\xef\xdc\r\xc5\xc7+\x85\xbd\xfb\xd5\xbf\xcb$\xf5"\xfcS\x9a\xce\x9fP+5s\xed\xfe\xec\xc2PL\xe6B\xfa\x8eY\x93m\x02\xb7\x94H\xba}\xdc\xa8ir\xfb\xfa\x88\x95\xe7\xf1\xb1\xf0\xe1-\xfe\xc6\xf0\xefYV\xd4mbl?%9\x1d\xed\x1e\x89\xf4\xccw\xcd\x95L\xb4\x17:\xbc-\xed\xd3\x02o\xcdZ\xdfJ\x88\x1cG\x1aWG\xd1\xcb\xder]\xf8\xc5\xa9\xb9\xa8@\xd3@Q\xa7\xbc\xadb\x11\xdc3\xfb\x19F,u\xb2\x96\xfb\x9f\xdf\xf4\x88\xfa\xd4\x0e\xd8\xf4G\xf5 v{sF\xab\xfc\xef\x07Q\xff\x1b\xf0\xbf\x01\xff\xdf\x03\xd6\xe2\x1f\xbfBc\xebs*\x0e \xc0?\x96\xa6\xb6\x87\xee\x1d\xf4\xf8\xeb\xff\x00\x19\xdeDw',
+    "/buttons/다음.png": b'x\xda\xed\xbbgTS\xdb\x166\x1c\x12 J/\x82\n\xa1(M1`\xa1\x05i\xc7B\t\x08H\x91. \n\x18j\x10\xa5\xb7\x88\n\x11\x01%\x82\x10\x9aR\x04\xa4\x08"E\xa5l5\xcaA\r(\x84&-\x82\x82"-\x07AD\xca\xb7v\xf0\xdc\xfb\xbdc\xbc\xff\xde\xbf\xf7\x8c\xe18\x0eX{\xee\xb5\xe7z\xe63\x9f9\xd7\x94|\xd2\xc2\x98\x9fG\x82\x07\x81@\xf0\xe3M\x8e[#\x10H\x1f\xf8\xcf\x16n\xf0\x93\xec.\xbfX\xf0\xbf\xadD\x13\xc7`\x04\x82W\x04\xfe\xc3\xd15\x1c\xb3\n~(y\xd1\xd0\xe1\xa2M\xa0\xd7\xc5\xd03\x17<\x11\xc7<\xfd\x82\xc3\x83em.^:G\x08\x94\xb5\r\x0c\xf4{^\xf2)\n\x81\x90E\xe0\x8f\x1f\xb1\r\xcb\x99\x19\x0e]\xf6\xba\x14>\xf7\xfb\'_\xf3Oe\x13\xd1\xe3\x87\x97\x0eMvm\x19P\x1a ^\xb8\xe0\xff\xb7\xc0\xcdf\x85{\xa6s\xd1\xdc\xd7v\x1b>\xdd\xb2\x85\xe7J)&1,\x8bs\xfek\xc7\xd7\x14o^\x11^k\x15\xd9\xcb&s]\xdf\xdf\xfd\x1a\xef\xf88\xf6\xf2\xa8\xd7DC\xdeh\xb4\xc1\xf7\xf0\xd6\xf57\x97\xb8\xfa\xe6\x16:\xd5\xbe\xd7\xf6\xae\xc4\xb4\xfe\xbc\xad\x1d<!\x8bO+\x8a\xb8\xef\xc0\x90\xc7\xa7\xf9<*\xc5\xa7\xc9\x8byZQ\xe4\xf1\xcao\n\x14\xf1i\xb6\xb7\r\xcd\xd3\xe4\xcb\xf6$Q\xe5\xf1\xd6V\xe2\x1a`m\x01\xd6\'M\x1eo\xe8\x08?p\xfd\x7f\x0f\xfc\xef\x81\xff=\x00?pj\xbfO\x12\xc2\x99\xa3;\xae\x8e\xd4Gz\x16\x17\x8bj\x11|\xd7\xc1\xa3\xb88d;\x16\xfas\xab{\xb4;\x07\xd3\x15\xfcM\x8a\xf9\xa5\xc2=M\xdd\xe2\x81x\xdd^\xc8\x15\xe2s\xefiX\x0e\x9c\xe5\xec\xe0Tm\xcb\xbe\xc6(n\xe5\xb4\xe0\x1aY\x13\xdf\xd8H urL\xa2:O\xd8\xed\xc1K\x18\x8b%}\x1c\x83NA\xf5\xc1\xbfF\r\x109\x02Q\xc2ag\x1c\xee\x15\x1d< \x86\x93\xec\x8fU\xdd\xf8]B~\x11\xa2:\xff\xb9\xfa(\xbe\x0bWn\xc7\xb8\x8f\xdcx7t\xe7\xb1V\xc4\xed\xc6v\x978\xcb_]\xab8)\xdcE\xfd\xf5\xd0N\xe4v\xa47G\xeaE\xaaI\xdak\x97\xba\x82z-\x96\xb6\xe7\xee<d\x87\\\xde\x8f\xfcL\xe2n\x82\xee\xea\xd6\xf9\xe1\xad\xae\xe3\x86c\xf4\xa5o\xd0\x9a\xa8\x05\xf8\xecS\x0cq\xeeY\x94\xdd\xb7\xaf\x11\x9d\xac\xdf%\xab\t:O\xef3\xecG\xd1\xfa\xbd\x1f\xea\\9\xd6\xf3\x1c&C,\x8d\xfbn\x17\xd5\xd8\x96\x95\xfa\xf3\xba\xa8]\xf9\xde\xb2\xc5\xe5\xa8\xee\x97Q\xad+\xdf\xcd\n\x03\xf4\x98\xf6\xc7\x1ag}!1\xa8\x1d\xda\x9f@\x8c\xc6O5\x9b\x1a\xcelc\xfe\xbd\xcbuC\x8c\xf9\x96f\xb3~ \xc0\xb4\xabte\x0e2\xe0c\xad\xd4\x92\x1e\n_\x9d\xe9\xdd\xb5.\x85\x9f\xca\x05\xeb.0m(\xf3\xa1\xaeJ!\xe9y|C\x07\xb7\xc6Z>\x985\x19;B\xe8\x9f@l \xa3\xb8\x97?\xc8\xaf\xea\xe1%\xc2\xd3\xaf\x7f,\x86F\xcd\xc7F\xb3Q.\xe8\x9c-\xabD\x91\x8d*[\xfa\x19\xc8[\xe9W\xa0\xab \xc6\x18\x93\xb7\x0f\x1f\xc1\x0bV\x05A\xef\x8aZ\xd7T\xc6\xf6n\xfc\xc6\xc7\xba\xbd\xf9a\x0f\x19(\xae\xcd\xccq(q\xd4\xa6\xad\xb7\xc8\xa7\xdb\x95\x95F\xe7\xec\xe0O\xff\x16y\xfc\xcc\xef\xbe\xcf\x98\xaesN\xe98\x8b\xb3$\x1a\x9f\x96Hk\xf3\xf7\xc4\x86\xe14y\x1f\xb1\xba\xbd\xb4\x8e\xea\xc5\xdax\xc4\x86\xc5\x90z\xd5\xab\xeck\xaf_\x1a\xa0boI!\x1b\xb3\xc2^.\xf1\xe7|\xd9\x87/\xbe.A\xbb\xf1<\xf0\\BX\xbc3\xd9\x1c\xed\xf62\xfb\xda\x8a\xbf(S\xd1\xfd\xde\xb4\xec\xc6\'oZ\xe0\x9c\xa9\x07\xea\xa6|r\xb1\x8f!\xbfG\x01\x143\xb0\x8b{5\xad_,\x94k\xde\xe7\x828\xc1A\xdf\x1c#r\xba\xfda\xa2\xdc\xa5\x96\x13\x98\x1a9\xfc\xd9b\x0f\xab\xec\xa3\xd3\x7f\xe9|6X\x9f3\x9d\xe5\xb2@\xa9\xa2\\;\x92w\xf3\xbf*!\x05\xc7\x19>\x8a\xe7kL]\x0e\xfd$\xc2,\xfe\x8cMS\'(\x8b\xd7\xbdV"[\xffX\x9f\x96U\x91\xe6\xec@\xa8r\xe7Yv\xec\xbe\xe4o3\xd6\xf0sr\xe0\x88\x93\xee\xf1\xd5%\xd5\x17\xa3yE\x07O>)\xd5\xb8/\xdc\x16\xe2\x97\x9eSH\x1f\xa7\t\xfd\n&\x9f\x99\xb7\xce\xf7\xb3h\x1aX\x97t\xf7\xb9\x90qd}I>\xf9\xaa\xd5\x1e\x9fd\x02$\x0ci2~\xcb\xaf`Y\xda?\xb6a\x10\x0f\xd7\x078q\x98~a\x87\x03\xdaoec#\xd3"\xfco_w:\xcb\xcb<\xef\x1e9%V?I\xd6P\xcf\xe7\x926\x81_{z\xec\xcc\xb7\xb9\xd2Z\x9d\xc7\x1fV\x97,\xe42\x14M\xac\xf7\xdf\xf0\xb0\xf2\xb5\x8dy\x13{5S)\x02)\x10g\xbfQ\xc1\x85\xe1\x9b\xe6\xc0Rs<\xdf\xbf\xa5\r1)q\xa3\x8a\xde\xb7\x8a\xb6J~)\xe8u\xd8\x8eC\xf4S"tz\\\x15:H\x87w.\x1b^\x10/\xf3-G\xa0\x85\xdb\xbea\xf3r<O.\x0c\xealmT\xd3N\x92\xa77\xe8o\xab3Z\xb8\xdd\xaaS\xed\x00v^K\n\x14\xc9\xde\x1d\x93&i85d\n\xe9\xd3P\xdd\x8f\xda\x1d\xb9\xe9\xdc-\x16\xefD\xd6\xc3/\x88\xe3\xa9\xde\xd1\xca>\xc9\xe9\xa4f\xb2\xd2Z1\xa5\x96\x8fz\xec\xdd!]\xf2\x0e\x1b\x85\xc5\xf6.\xc8\x95\x96v\xe5\x0b\xf8\xa1\x8ftF\n:&\'\xc70m\xc2I&\xc9\xe9\xac\xa1\xbb\x9b{\xac\xfb\x93\xcfX\xff*%q}7\x8a\xd4\xf1\xa9\xfe4\xa8\x8a\xf6:\xbe\'\xad\xf6q\x16\xd7\x89\xb6\x04\x05\xbc\xdc\xddN\xc3\xca\x9am\xd5\xbcD\xf9j\xe0DM\xf33\xc1\x88\xa6\x15\xaf\xad\xeeZ\xcc\x93\xee\xc9\xecg\xf5\xc91J:\x89\xf2\xcd\xe9A\xc0\xb7\x13\xf7\x83v\xcc\xa7\x80\x9f\x07pt [.\xa3\x98=\xfbyQ:\x08\xb5\xb8P\x05o\xc2\xf8\xa0?\xde3\xd9\x068\xac\x950$\x90c\xc1\x17\x17\xab\xa2\x9d\xc4(\xbe\x9a8~1\x85{$7\xa7\x98N\xa7\t\xcc\x94\xb3f\xea\x8bv\xbf\xae)\xd5\xa0f\xbf\xb6\x82\xae\xb5;~\x1c:v\xa3\xed\x17\xec\xde\xd6\x13\n\x8a7\xdeq\x8edK\x16\xf7\xf8\xd3t?<D>T\xf2\xbe\xa5>\xf1\xfa\t{u\x10\xf4\x1b\xec\xfdI\xea\xb2|\xc4\xc1y\x0f\xe0^3\x9b8\x7fr\xc3\xa0\x8cIG\xd7D\x80\xc7\x9b\xbf\x8b\x97C\x9c\xadE\x92>\xceih%\x9f\x8d\x13\x04\x9bZ\xd8C\xdcE\xd4\x9c\x7f\xf6\x19k\xddw_\x98\xa2\xbb.\xafc\x92\x14\t\xc0\x98\x14w\xe7B\xa1\x89\x84\x96x]\x08\x1d\xb1\xec_\x1b\xff8\x0c\xb9\xac\xcbr\xfcQ\x06/U\xdeX\x8a\xe1\xcd!\x076(\x98\xefN\xfa(\xf3\xf3\xe0\x98C\xaa\x7f\xa9\x16b\xdd\x91y\x88i\xcb\xbc\x07\xaf\xd17\xad\x90\xa9\\\x1e\x8c\xe4kD\x8c\x06\x98Q9\xc5\xeb\x9e\xd4j\x13\xb7T\x8bV\xff\x05N\xb5\x13uGH\xc7p\x0e\xc6s\xe5?\x81\x9d\r\x83i\xd7:\n4\x035\x15\xf5\xdfNo\xc1f\x02\xfc\xec\x03DI\x86N\xb7;\x16U\x9dZ\x9f\xd1\x08l\xb0\xe4\x90\xb6\xe8\xd8]\xe6\x8d\xf5Y\xf0\x96b\xfe\xe5n\xe9~\xeb36\x1es\xb4R\xbf|u\xd0w$ \x9f[73\xc7\xd0\xda\xd2\x81\xa18\x91K\xf3\xce\x1a&\xbdJ\xab\xe5\xbb\xb0\xa5n\xc5O\x85\xe9\xee\xb3\xbe\x04hN\x1aG\xee\x8f\x93\xc5/\xd0\x0bz\xff \xc6\x13>n\xc3\x9cS\x97\xce\x86\x08\x95\x9d\xdd\'z\xd5\xdf\xc0\x9d\x05\xec\xbarU\xc9\xf3\x0c\xe6\xb6;\xca\'\xefIrj\xb0\x93\r\xd8\xf1\x1b\xf5\x16>\xc7\x13\xc7\x16{\xaeC-\x10\x07\x04\x03\xf1\t\xe6HWTm)\x7f\x1b\x8c\x9e\xb1I\x18=\x04\x9e\xc1:\\\xf7\xc9\xb5G\xea\xd5\xdb\x89\xb8\xea(\xf0\xb9\xaa\xc67\xd5;\xb1>/\xeb8\xab%\x89{\xaa\x8d\x00\x98\x1a\x84\xc6\xcbr\x08\xa5-e\xeb\xd5\x9f/p\xe2\x83_\x15hj\x8bs\x87 \xee\xa3\xbe+y\x13\x82\xd1\x07\xbb\xe7y\xc0\xefc\x1c9\xfb\xb3\xf6\x18\x8a\xc9d\xb8\xa4\xc8~K}Tj^U\x06\x85\xd0JR\x7f\xca\x83U\x82Aa%j\xfc=Z\xf4\x97]|L\xe0\xab\x8f\x8d\x98#\xd6\xfb\x92\x9cR\xcah\xe7s\xce\x92~\xc2\x96dX\xf8\x1fI\x10/p\xa4\xaa\xcaq\x0c5r[\xf5\x19\xf0z-\x94\x12\xca\xfe\xec\x19\xca\x15\xc3\xca\xcb\x95d\x02R\xa6C\xa0\xebE\xd6\xb5\xa9\xf2\x893\x04\xc5\xf9\x91\xa1=\x95\x01\xa8\x0eh\xb1\xb0\xab\xbf\xb6\xb4\xe7`\xb2\xc3r\x93\x7f\xc8M\xf1N\xc4v\x91\xef\xfdy\'\xc0\xb1\x11xX\xd9\xd9\x02Q\x07\xb4\xcd\xb2\x9f\x91G\x87\x8b\x1bcl%\xcc\xc4\xeb"\xf4M\xa32\x06\xae5\x92m\xff\xc1\x04\xbd\xc4\x89\x85\xed\x01 \xaf#\xd0V>Xz\xa1\tA\xfb\x89\x02U2\xe9\xafS\x0c+\xab\xe8\x89g\xf5B\x90\xe2&\x1d\x87\xbez2/\x8cQf\xd6\xd8g\x1d\xf3lmK\xcd\xb6O\xba.\x06\xca\xc9\\IN\xd1\x92\xa2Z\xc9R$.\x10\xc3\x11\\\x8d<\xc6\x9fK\xf3\x95[\x87C\xd6J\xd5\x15\xb1>\x85g\xa5<2\xbeJC\x05\xe0 \xb4w\x1bG\xdb\xfd\x9aY\x12\x85&\xc9g/\xe5\x99v\xec&l\x01+\xbcO\x15T\x9f\xc2\x1c\x1d\xbe\xf1\xb76\xc7\xb2\x15\xcc9\xe9\xa3\x01\x06\xbc.\xdc9H]@\x07\xd6\t`\x8d\xaf\x82\xbbL\xc1c\x15\n\x08A\xecXN\xa3\xcc9\xf4\xad\xc3\xbdM\xc3#\x94\xcc\xa8\x93\xed\x0b\x90\x02\xcd\xe2\x03:\xad\xd6d*\xce\xd0\xff\xc7)\xe9\xa3\xfc)\x7f[\xc5V\xc2L\'\x80\xcd\x00\xccU\x1b\xf3#l,Q\x10/\xf7\xa6\xa0W\xa6\'\xe1\xe4\xe8_\x98\xef\x9f\x121\x8b\xf47\xc7\xcf\x947b>\x9db\x9a\x0e\xcd\xcb%c\x93\x9c6\xd4\x8f\x95\x96\xa0|\x15\xc1\xa9\xec#*\xe65V\xad;\n\xf7\x03^t\xd0\xd4~{\xd7\xebe\xe7\t\xa6\xf7\x13+y:o\x92S\xac\xc6\xb1\xd2T\x0eM\x10\xb9\xafE\xfbz\xec\xcd8"m\x82\xb5\x8f\xd6~\x9a\x0cc\xb6\x01L\xd2\x81g6\xcc\xb9\xea\xe5\xf2\x8a\xb4\xde$wM\xb9\xea\x06\x9d^\xb3\x8d\xd6~\x81u\xe7&\x02$\xe3\x03\xe9\x05\x9a\xfa\xd4]\x0c\xb58A\x80\x93q\xf2\xf7\xa9r/\xed\x17|l\xd6\x02\x9b\x11\xf3\xb2\x92\xb4t\x16\xf5\xce\x8d\x86\x03~\x82\xb6\x18\x1cWB\xa959\xed\x93!w\x02\xddk\xd9\xd1u\x7f\xaf_\xc0\xf2-\x9e\x9a\xd2\xe4\x867j\xfc\xf9\x1c\xaa\xf2\xbd5zY9\x86S]Gi\xf7\x9e\x18sH\xc2\xdf\xc0;\xbf\x93\xe9\x83\xf5\xb3>\x9cDE\xd4\xcb\x07H\x0c\xda\x04\xde\xff\x14L\xbb\x16\xdf\x1d\x87\xfec\xed\x0f[\xcd@\xdf\x1a\x8f9\x9bzZuK\x9e\xca#,\x1f"j\x07I3\x02\xe15\xd4\xa3M=y\x9b0r\x13\x154\x9d}\x9f!\xe2\xc0`x\xe9\x8d\x9d\'\x9d.\xd5\xea~\x8f\xd2\xed\xf1\xeeN,T\xd3\xcf\x92*z\xd5\x0c\x8cP/\x8ak\xac\x1d\xf4E\xa19"\x11I\x13F\xe1\xa2\x82\xf3\xb6\xf9\xa7\\\r\xa6\x04\xfc\t"\x8e\x0cu-\xbb]<\xce\xaf\x84\xb5\x83\xe3\xbe\'\x9e\xae00e3\xcc\xca\x07\xaf\x84\xa5\x01h\x0e\x9cb3\xd8D\x93\xc3\xd6\xfe\x04\xaa\xdc\x05\xd9\x94\xed8\xf1\xe5\x008\xf2\xd3\xfbR\xf59\xa2\xa4q\xdb\xc3\x94\x01`u\xc45\xe8\xa9\xc5\xa4\xe6R\xed\xddh]\xc8f\xad\xee \x0b\x7f\xd1x\xaaR&Z\xbc\x91\x0f\xc7\x15\x86\x03k$\xc55\xcc\x8f\xab\xed\x9e$\xba/\x02\xa7\xc6\x98\x0e\xa9\xeb\n\x9aF\xd7\n\x10e\xab\x95\x0e\xfe\xba\x9b6I2KT\x13\x02\xe4\xbb;Y7\x89\xfa\xf4\xfd\x8d\xbf\xb3\x04*\xb2\x00\xc6\xfc\xa1\x9da\xd2\xb7W&s\xa1]\xd0,\xe4\x01\xb0\xdb\x8ct1\xac\x90Y;\x05D\xc39G\x06\xa3\x18\x1cH!)\x14\x0e^-\xd6\xed\xb9\xf0\x93S\xd90Y\x99\x1b\x98)y\xefd`\xca\x16v2\xef\x80X\xb9u\xd6\xaa\xfb\x80\xbaR\x95\x8c\xe5\xb4S\xf9\x84\x16\xcdB\xa33\xdez\xb4b\xcb\xb4\x19\x9d\xdf\x00N\x9b\x9211\xd4\x1cC\x89\x9d\xe2\x1a\xfc6\x8b\xa2}z`{u\xdbX\xd7*\xc7\xae\xc9\xa42nM\x90\x0c\xcd)\xc5\xff\x90\xbf\xa7\xa2&EK\xaa\x0cr\xc1\xe9Z/\x82\'\xe3vB\xc9\x03G\x8a\x1e`}\xa8~\xe9\x96.\xb1\x198h\xe1\xe2\x98\xdf\x9e\xb2\xfdT~\x03\xb58\r@q,\x13\xa9o*\x0e\x8c\xdb\xf0\xe3\xd2\xfb\xef\xb68\xed\xe8\'9\xa4T\xc7\xb0\x93\xe43q`\x1d\x91D\xfd\xc7\x9f\x07cD\x17\xed\xcb\x1e\xe7JQ\n\xb9a\x1a}P\xac?\xc5A\xa9\x1e\xa6\x9f\x06\x847\x87\xdb.\xcd]&g\xdf\x16\xdcW\xeeU\xd0\'\xafK\x05\xbd3V\x80\x8d\xf9\x84\x9c\x97A7\xed\x07\x88\x18$\x17o\xc9#\x95\xd6xZ\xd9h\xf8r\xa0m\x16\x10\x9d\x13a\xa4\xf1\xb8\xec4\x18]`\x19*j\x0f\x1b8\xf9\xc7\xf5PVg\xdb\n\xee?\xb0\xdb%07$\xe8\xa0\x0b\x02\n,\x15%\xc9\x00\x01\xf2T\x93?s+\xac\x8d\x92\xbde}\xa6\x1d\x18\xb6\xc3\xa6\xc7\xcf\x0c&D(U\xa1\xa2\x92\x96\xe5W\xd6\xa6e\xad\xdb\xf4\x8f\xf8\x1d.u\xe8\x9f\x85S\xfa\xd6\xce\xbfl;\x01\x96\x943\x90!\x1c)\x9cv\xe6 \x0c\xc7\xb9\x18\xf6\xe9\xa1\xe7\r\x8c0e\xe3;\x13\xa7T\x92\xa8Ft\x11(\x00pC(\xcc\xc4j\xc4CD\r\xb0\xfb\x98\x01>\xdcm\xaa\xcec8dR\x18\xe1\x87\x00P\xf6\x82\xa5\xa7\x82\xa5\x19\x7f\x18\xda\xd9<\xbaN\x98\xe5\x15i\xec\xfe\x1c\xe4\x99<9ML\x0e\x8f\xeem\xe0\xfc+\x86\xe6\x85\x01\xbb\xc6\xae\x05\xa9\xcf\xcf\xc2\x88\xe2\x8f\x12XF\xce_\x80\x13\xf9w\x04\x1a\x19)B\x11Tf\xbd\xf7Y\xbcfh\x1e\xfd!\x07\xad!\x1a\x16\x18p\xdb\x8e\x1eP\x97D\xda\x0e\x87R\x84\x12q\x8bF*\x83 P\xa9\xcf\xb1\x0cc\xa9\x05D\x92VOg|\xc4m\x07\xb3`\xf1\x9a*\xa3\xa9$\x18G\xa7?\xf6\x84\x9c\x8f<_g\x94\x01\x0c\xd9\xfd\xd2-m#-\x90\x82I%\xb0S\x9d\xfe\xc3G\xb2\x82\x95\xbd\x7f\xd7\x94\x120Q9@\x0e\x97\xc0z\x93?*o\x8f_*\x90\x1cO\x1fc\xab\r\xac\xfa3,;\x0e\x9d\xd7\x9c\xb7\x84\xf0\x90%\xd8@,\xa8\xa9\xc6\xcf\xf1zt\x1fy\xb5p\xd7e\xb5\xa2\xc5I\xa4_\x0c\x87q\xd0\x03G\xe4\x08\xd5@\x82\x8f\xe2M\xfc\xb1>\x12\xc6\xd9BZ\xc9\xd7\xdbx\x1b\x97\x1d\xa3\xebv\xd4|b\x1e`\xd3R\xcb\xb1\xa63\xbf\x1b\x80Z\x97\xa9.%\xe4T\x9aEe\x94\x855\xfdU\xbb\xfc\xeb\x1cs;\x9c\xbc4\xbce-\xd8\xdc4\xc1=\x86\xa9\xf7\x05\x9e\x10s\xb7\xa2\xb8\xc3\xb9]z\xff{lL\xde\xd6Uy\xad\xeb\x8c2\x90\x1e!\x16\x14\tK\xa1\xab\xfd\xb93\xf7z\x00\xedPb\x1e\xfe\xc3B\xc2\x94`\xa9\xb6\x91\x07\x03=\x98{\xec\x8f^\x8aw\xd0\x89\xe0\x9aw\xba \x9e\xbc+\x89\xfa\xc3\x8b\xceB\xfeI\xf4\x88\xb0\xc5\x9e^\xdaK\x93WjB\xb9\x87\n\xb6\x89k|\xabTAM\x1bW\x9cu>\x08\xbeh\xc3\x10\xc3\xfc5\x03#g\xfd\x06\xce\xda\xdb\td\xc7\x9fB\x81\xfd\xaa/_\xdc\xc7\x83}\x8d\x8c\xc0\xe0\x08\xa8\x83\xc1\xd1]Q\xfc\x8b\xa7\xe6\xbe\xf9T\x12P\xdf\xb4\xc7\xb7|\xa4w\xbd~\x91\x8bn\xba\x99c\xa8\xe7eE\x99p\xadu\xf6\xe7\x9e\xaf\x82\x85#\xda\xa2\xadN}*_\x85TX\x1a\xce\xed\xa1\xe6\xf9\x193\x86\xf0-\xb3\x11\xd7 \x8c\xa8\x1c\xcfy\x1e\xb2\x99\xbc\x7f\nQ\x04\\\xcc\n[\x06n\x87\xd56\xff\x11TB\xc1Q\x06\xbc\xba\x80\xa2\xf5<\x80I\xb7\xc5a\x9f\x9f\xc2\xf9\xc7\xf7s\xbb\xb2\x93\xb5\x1c\xd3\xc4G\xdai\rC\xdc\x1b$>x\xac\xdd\x91\x81\x02&\xc7\xee\x0b\xf9\x9eO\xe1\xd6\xcf\x01\xa4TH\xa3\xaco\x12\xe4i\'4N\xa8\x1f\xe5\xa0\x0eB\xe8\x0e\xe9-\x88\xa1\xdf\x94\xda\xf3W\x1c\x19E\x01\xa7\\WW9[e\x10\x1b\xb60(\xe78\x05\xeeM\xdc\xebI\xb9\xda}\xc5\x81Q\xf4iy\x07\x8b\xe0%9\xa5\x12\x13\x93\x81s\x82,\xd5\xa6\xb2\xdf$\xd8\xe9\x88[,\xbc*P\xe4\xef\x9b\xa0Qb^\xbd\xea\xdc\xd4}k\xea\x85\xfa0L\xff$>\xecP\x10d\xde\xee\xa8\x8e\xc4\xfat}\xee\xcf\\\x96w\nb\x05/\x10&\x8e3\x81O\xac\xef\x80 \xdc\x15r\xfea\x1aH\xb5j\xe2\xb3\xc7\x99\t\xed\x8e\xb6\x99\x86\xe6T\x17\xfa\xd8\xa4\x1e\xc9\x10\x88<*\x7fTnX\xd7F8\xbc+3\xe43d\x02\xaa\x1c&O="v~xZ\xf6A[\x81\xe2\x97\xd2\xa6\xe5\'\xbf\xd4\x83u\xe7\xc7a\x93\xe2\x1c!\xdc\xf7\xd9\x89x\x1c\xe3\xd6L64\x7f\xd3\x83\x8d\xd1\xbf\x99\xa9\xe2D\xc7z\x88\xbc\x84\xe9O@\xc3\xc6(\x85\x9d\x81\'\xb8=j;\xebhJ\xd6\xc9\x07\x93\xa8\xb6/yh\x88\xe55\xd2\x17\x98\x05\xf1n\xd1\xea\x80\xd3\xc2"W\xf3\xe0\xc3\xe3\xea\xe0l\xe1i\x02\xf0\xc2c}\xacU\xe8NT\xb9\xb8M=\x98m\xb92E\x99\xb21\x9a\x955\xb2\xd1n\x0b\xe5\x03\xbe\xa4R\xeb\xd47\xb9\xf4\xc9\xd5\x1d\x96_(-+^\xbeLy\xe61\x10g\xb8\xcd\x15\x1f\xc1\x8an\xd2"e\xf3=\x1a\x7f(\x8c\x1e\x98x\x8b\xd8\xc1\x92\x82\xcfO\xdd\xd6\xcd\xac[\xf7\x9b\x1bg\x13L\x1f\xd6_j\x88\xa9"\x81\xf5\x9d(W\x93\x8e\x82]5\xa5\xf8\xc2bG\xb3`\xec\xfc:\xd8\xdb\xac\\\x00\xc6\x8d&\x99\xb0\xe2\xb9Y\xda%_\x8d\xc4\xe0dp\xe8\xb0\xc3\xdaI\x87\x01\x06\x8d\xfazie\x13\xb0\x08\x1c;\xc8D\x8e-\xbcc#\xe1\xe36\xdc\r\xea\xd9Oy\x80\xcb2\xe4`lI\xc1V\x1f\xfeS\xb23\x103U\xbe\x98\x88G?;\x19\x88\x1d\n\x86\x8ai\x8e~\xa0\x9e\xf8\xc0\t\xf6\xbd\xbe\xbc\xe7`7Qr*\x9a\xcaz}\xaf\xc5I\x12\xb7\x05\x06\x93\xd6\x9b\xec&>\x17\x8b\xa6\xf0V\x03\xed\xa4\t\x8a\xa1\xf9T>=\xeeX\xd9/\xc2k\xb0\xa9\x07\xff84\xda\xc7\x95\'\x8e\x0e\x03\x86TO\x05\xde\x8b\xf5?\x11%2|+"\xdf\x8b*\xd9\x86\x87ra\x028%\xcd\xfbS\x99\xa8@<4\x9f\xf4\x19K5\x13\xd7(\xdb\xe8\xdd\x15 !f@\x7f\x07\xaa\xc1\x9c-\x1b\x0b\xf0\xd1*\xa7^\xcd\xe6\x8f\xa2,\x0f\x0f\x03\xa7\x04\xbe,PLN=E~Q/S\x1d\x06\xa2\x84\x9e<\xce\xc94fKaC?\x1c.m\x99\xdf\xee\x10\xba1\x05\xe4\x80\x97\x9f\xb1\x11\xbc\xc0\xa7\xab\x15\x9c\xd3\xc7\xe8\x96j\x88\xda\xc4\xe0\xb1\x98\x9b\xa0.|\xbf\xc9\xf2=\xe0 \x9e\xe4-\x0fGk\xe9$\xae\xdf44\x97p3CE\nk\xa5\x80\xea\xf21\x81\x1bb\x97\x90\'\xd5\xdaB\x0fW{\x81\x08]\x9f\xbd\x0e\\\x05\x080\xbd?\xac\xda\t\xd6\xdbBm\x11.fQ\x0fn\xad\xb8\xef\xf2(\xec<\x08q\x83\\\xb0\x8a\xc0q\xc5\x86~\xc3\xfa\xa4I\xf4\xe4\xff\x08\xfc\x0f~\xa6L\x17\xb5[\xd6g\xd3\x1c\x19\xf2\xfcpj}j\xb9\x12*J\x11P\xe5r5\x03\xc1\\\xbc\x82\x19\xd5\x01\xbe\x12[~\x96m+\xae\x81\x0f,\x0e\xef\xca\xdf\xeaw\x1b\xe8\xacf\x9a\xd0\xd4f\xe9\x96\xfb\x91\x8a;;\x0f\xc3i\x08\x95\xc3\x1bE\xc2AN\xc7\xc09\xff\x08\xa1*\xad\xed\x84\x80\x9c}\x1c~e\xc7z\x8c\xf4\xfcQ8h\xba\x13\xd1\xc5\x95i\xc1\x8f\x9f\x08\xe2x\x1bw\x84\x01~{\x08\xdeMO\xaa$\xd7v\xe8\xa7\x01\xe5u\x16\xe2\xa29\xd7\xb35"\xd5\xc8oi@\x13\xc8Fc\xf2\x8b\x89\xf8\xae\x9b\x0e`a\xea\x1b\xad\x14\xef8^\xf2\xa2\xba%\x9co\x1fs\x11\xd5\xab\xf5\x0e(\x80\xe0\x06\xb9\x85u\xa4,\x18lS\xb4F\x81\xb8M#\x10\xd3),)`\x81\x92f\xd3\x92\r\xe0~%w\x12\x9c\x07\x15F\xfc~\xdfe\x08\'Q\x8bT\xfd\xb81\xa6t\xc9\xb6\xb7\xd0\x17\xda\xd8\xf4(\xdb\xa0t\x90\xfb\xa2*t\x19h%\rA\xd3\x12$\xc0\xdaN\x02\xb0y\xfaA\xd4x\x98Xc\xda\x1e\xbfP\xf62M\xa2P5\xba\xfa|\xc0m-\x82\xf4m\x0b\xceY\x90\xa0\xd2\x80w\xaf\x9d\xf1\x9f\x1a\xc1y\xa1\xdc\x94B\xba\xd7\xb0p\x92\xd0 k\r>C%\x013?x\x88bV\xfd\xb3\xa6\x1d\x87\xac\xe1\x95\x04\xb1\x82\xea\x194\xdc\x91x\x8fa\x1e\xf6\xd8\xfe=\x95M\x89[\xfb\x01):(\xc2\xaa\xe2\xc87\x078!\x19]64\xef:w>\x00\x83F\xbc\x85\xc5\xb0^\xd08[I\x1e\xdb\'$\x88gg\x90\x9d\xea\x92\xcb\x8a,\xaf\xdfJO\xac|jK\xf1\xd4\x130`\xbe\xc3Y\xb3k"\xc2\xe3\xceW\r\x98eT\x0c+$\xf5D\x1c4`\xcb\xf4%2$H\xa9\xbd}\xce\x8ar\xfb\x0c\xde\xdd\xbe\xa0\xba2\x0fP\xb3%\xc9&\xae\x9c,If\xa0\xcd\x10\xcf\xac~\x86Nf\xcf\x88\x83o\xcfb\x93\x98(\xef\xbd\xf2\'\xfc8\xd4\xb2\xf2|\x048\xc9}\xbc\xa8X\xb3\xe1\xd1\xdc\xc0\xfaQ\xa8@\xb1\xec\xf2\xd58)\xb2M\xdf(\xdc]\x18\xa6q\xe4\xddA>T\x00~\xeaZ\x9d\xdd\xa4\xb6\xd7Z\x83\xe0\xf8z\xba\xf8\xe2\xf2\xb76ii\x99\x96\x8f\n\xa1\x98\xfb\x91\xae\xb0j\xf6T\xae\x96"\xea\xce\xffa\xb6s\'F\xfd\x9c\x19\xf2\xa7\xd4\xaff\xca\x1d\x96Zv\x07\x90N\x15\xbaJ?\xc2\x98\xa2\xb0=\xb2\x067*\x8e4\r\xb4\\>\x18Q\xeboE\xb1\x1dV\x1f\xc3oP`:Kt\x8a\xae\xd3\xa8\x11]x\xf9\x1f0fF\xbd\xf7\x05_P\xe8!A\xe4d\xdd\xaf\xa4z\x93\xde\xc6Q\xc8\r\xfe\xd6n\xb6\xeb\xc3\xc3\xe8\x1c.\x17\xbe\xa6\xcc\x1c\xcf\xf3\xe0@\x8c\xe8\x19\x90\x15\xb4DS\xea2\xcdC\xab\xee\xd2\xef\xd4\xbd\ts\x9dM\x7f\xfd\xbd\x91\xb9Y+\xe6\xd1\x82\xc7z\xa0p\x83\x01V\xe8\xf3_8Q\x9f\\k\x13\xd51*n\xe9\xbf\xdc\x9f{\x1a \xf0\x8e\x990lm\xf8\x1aM\xb2>7\x8e]N^]\xc6\x06c\xe6\xcf\xc1\xf8\xcf\x16m\x8b\xf03\xf6;Z\xfay/S\x8d\xe6\x95o\x9fV{\x02\xa4\x18k\xb7\x8a\xff\x94y\xefm\x80\xff\xbc\xbb\xe3%\x13~p\x7f\x17\xa6\x08\x84\xdc\x1b\x89\xef:}<k\x15d~ru)~*;\x14\x91\x80\x045\t\xd0\xe8?\xd4\x986\xb8+Nk\xb5\xaa\xe0\xf8mh\x9f\xe3M\xd7\xdd\nL\xf4s\xa4\xce\xc5\x00w\xff\xff\xda\x07#_=w\xf7\xdd\x01\xba\xe8X5\x0f\x80\xaeL\x9d\xf4mi\xf9\xde\x9e5Y\x9d\xbf\x9b\x1e\x01\x9b\xcf\x8a\x13K\xbe\xc9\x91NQj\x9b>\xbc\xa2\xd1\xdfY\xde\x9b*L\x8f\x8b\x8eC\x91<\xd3j\xd5]w\xe9w\xe7eK\x9ds\x05F\x93\x93\x14H\x96\xa8\x84\x93%\xd5\xf4\xdd\x1d%Sk\xf7r%\x9c\xf7\ty\xfa\x1bLm\xab\xef\x14\xb2\xb1d\xc3\xb5\xd1qG?G&G\xd3>m^\xa8UHg\xf2\xb5\x97|\xcak\xeb:\xadAc\xa1I\xa9\x0co+\x8az\x958\xf7\xbad\xd0\xb8\x83\x81\xf6[\xfb\xb8\\\xd2@\xbbv\xd1\x19g\x91~J\xff<\xc5\xb1\x7f\x02\xe8\x9b\xfd\x16\xef\x0e\xd8\x03O\xbe\x1eFBn\xa2:\xbd\x9a\xf8w\x07\xad\xf3\xcf\x16mu\xda\xd6\x9f\xec\xa0V\xefe}m\x00\x8a\xe5n\xc9\xfd\xf1s\xf2\xba\xa1y\xda\x8bm\x1e\xcd\xfd\x07\xa1\x04\x91\xf5u?\x8f\xf9\xd5\x9f"\xeb\xf5\xb7=w\xb9\x1b\x8f\x856\x1cy1\x1a+\xd4\xcf\x17\xb6\xfbS`\xa7X\x12U\xbey@\xdd]\xb1\xbaG~c82QX\xaf9\xdb~Osr\x19\xcd\x89\x9e\x05\x19QV\x1bZ9V\xef\xe0\xd7\xb3\x83\xe9\x05\x8a\xf8\xc0\x99q W\xf2-\xc6FWE\x0e\x9e>"alC\xee\xba\xc8\xc7z\x7f\xc81\x04\xb9\x9e\x8f_\x8d\xdc\\\x15x\x08m\xd5\xb9\x9e\xda\x1a:xs#\xc5v\xb8\x17"C\tJ\x9f\x02\xd7\xae-\xffp\x9au9\x06^Io6O|\xd5\xa9sh\xe8\xc9\xb5\r\x13?\xe2\xcdmf\xc2)\xb2\xbd7\x05\xba\xa5\xa1\xed\t\xabZ\x13Y\xe0\x0b&\x86\x9f\xd2\xce?\x00B\xe3\x1aqM\x1b\xca\x80T\x8e5\xd6\xab?\xd07\xc2\x94\xd4\xf2\xbf\x0c\xaf\x8d\x96a\xd9U28\x18\x00\x80\xd4X_Q\xcb\x95g\x1f\xd6$\xeb\x1f\x8aL6\xe1W\x8e\xc9p\xa6\xc8\xa5\xf4~\xfd8\x8a\xbc#\xf8\xe9\xe9\x02\xbc+\xd1\x06a\xa2\xfe<Y\xe0\xe1/\xccA\xe6\xcaU\x81\x87{\x17\xdbc\x91\xaa\xf2#\xc4\xd0/\x83P\xfe\xa5\xb0\xe6\xad\x80,\xac\xb5\xc4\x11\x16\x8a\xbd\xd5\x97\xbe<$/\xfa\xa4}T\xb1\x9c\xee]\xb5\x94:=\xa7\xe1~\x89Y\x93R\xa5u\x06\xbco\xaaw+\r\xf3A\xf5\xb6\xfe(^\xd9\xe3\x0c3?\xce`\xeekD\xa4h\xe0\x94)\xc0\xa3\xf5\xcf*E\x81\xb9\x9c\xd2I\x92g\\\x9fNc\x06\xc3\xdbL4;\xb0w\x96\xe9\xd4\x87\x88\xfd\xf0\xfc\xd2\xe13V\x94\xa2\xd9J\xc4\x10>*#\xab\xd4\x9c4\xa8\xd3\x98\xc2\x08uFm||~I\x9as\xe4\xdf\x15\x9fp\xdc\xb8\xb2\xf8\xef\xab*\xafB\xee\xe1\xafF\'df\xe9X\x95\xa3\x04/\x11s\xe1mv\x11\xb1\x96\xab\xc7Z\xe79\x1f\x06KWo\xd0\xc6M\xce\x9e\x89d\xfaJ\xb9Ln \xabf\x98\x87E\xbd`\x0b\xbf4EG\x93C\xa4^\x1a\xdc:=\x95\xf4*\xae\x8d\xf4J),\x17E\nV\x92\xf6\x1e\x03HR\xd7m\xe3PS\nK\x96L\x14\x1dP\xa0\xe7\xce\xa9\xb1F\xdf\xb1N\xac6\x0cn\x05\x07\xc4o\xb9=\xffL\x8c\x05\xa6t\x1fa\xd6\x85oZ\xff\xb9o\x8eY\xd3)3o\xb6]\xf9\x9a\xc6\xf0\xdd\xd2\xdcv\xdfe\x93\xd4U-\x14\x8c\x9e\x99\xd3\x0c\x10:\xa17=_\xb0\xcd:s\xd4*\x86%\'$J\x9dO\x9b\xe8 \x9c\x88:\xfa\xf7\x17Z\xca\xf7\x8b\xc0q\x12y\xad\x1ecrwW\x7f\xec\xa5K\x1aD\x9b\xa6M\xbc9\xe1q\xec\xf9q\x17\xc1\x13\xd9a\xdb\x08~C\x88\xa8s\x97\xfbp);\xd0w:\xc0\x89\xbd\x1cga\xba>;\xe5\xec(\xd5\xff0\xae-\x80\xd0\xd7b\xe1D\xd9;p\xb8\xe5\xe0V\xcf\xe4|h3!zC\x1d\xb9\xbe\x8fx\n\xdd7\xc0\xbd\xec\x85\xee\xcb:\x00o\xbe\xed"\x93&P\xb5\xb0\x97\xf9V\xca\xc5X\x02\xbd!\xba|\x1c\xdd\xe7\x98\xdc\x1f\x94\x0b\xdb\x1dv\x16^V\x18\xe6\xf3\x1c\xe5l,\x8c\xffn\x12\xfd\xb3\x04\xda\xf8\xca<,\x88\xf0\xbdH\xcc\xb5\x001]\x16\xb9\xc1\xb9:\n\xbc\x19\xee\xbe\x93\xb9(P\xa5\xb08\xf0\x08R\x81tt\x1a{[\xdf\xd3\xe7\x1aD\xd9\x18h\x87\xac\xa4N\x7f\xffN\xbb\x88\xc2\x07\xfa\x9f)pY\xcb\x070\xe9\x86\x0c\xa5N\xfb\xc2~`$s\x91\xe35\x05g\xe7\xa9\x1b\xe9\xe4\xd4\xbbi+~\\LS\xf7\xef)U?\x95\x83\xa0\x1f\xe3R\xa7\x03\xd9\xde\n\x92DmGn\x18\'\xf4E\x89;p\x85\xd5\xbc\xf45\x8d\xfe\xc7\x9b6\x170\x03\x80\xaa\xc2\xec\xd4i\x1a\x01\x15\x80<a\xbd\x92\x1f\xb3u\xfa\r-\xf5\xd3\x8e\x1f\x9e\x1em%E\x06?\x8e\x8c\xfd\xf5qC\xf7\x8a\xef\x9dAO\xc0\xfbE\xe1\r\xaaA\xb2\x13y\xd0\xeec\x8d\xeb~\xeef\xcc\xde].\xce\x12\xa7\xba\x13\xcf|\x1fD\xd8\x80\x10\x1aEH"\x1e\xf2}\xfa\xc8\x0e\x86\xe0@Q\x8f\xfe\x05\x0b\x08ylU\xc7\x1e\xa9#\xc0Z\xe9\xdaC\xe0\xf9X\xadtq\x9a\xdb\xe5\xd0\xe7\xd6\x83\x9d`o?\x96\xea\x11)\x8a!\xee\x02\xe3\xf8\xf5dW\xb4\xa6\xc2\xb5\x1a\xb3q?\xdf\xb1\xf7_\x05-_\x8c*\xff\xd2\xe4\x87\x17\xb5Eap\xd7p&\xc1\x8f\xa2\x84\xfb\xcf\x8al\xe4\xd9\xb6\xdb2[\x85Z\x9f\xa9(\xb2\xe6f\xff\xd2*,9\x0c\x1f\x99V6\xf7;\xcez\xea\xe7\xd6H\xc1j\xed\x9aq\x1b\t%\x1b\xd2L\xdc8\xe9\xe7\x89\x7fFU\xa3]\xefm2\x16\xff\xbb\x8b\x1e\xf6\x03\xe7\xb2\xf9W\xb7\xceo(\xac\xfa\xef}{\x94\x16\xf1\xeel\xa2e*e\x86\xc3]\x8d\xd9~\xa5U\xef\xbf$\xd8\xcd\tH0H\x97%n)\x81N\x12I\xfa)\x88\xee=\xf1f\xfep\x10\xc3\x8d\xe9\x82@HD\xc3\xb3\x00\xe2\x83\x15E\xad\x06\xecgz^@\xb1r\x1dG\x9c\x01\xc5\x8e\xa2\x9e!\xd6\xe3+Z\x9c\xd3p\xbd\x13\'\xdd{h\x98\xe0\xc4\x820\x82\xc7\xb5\'\xa0\x86S\x0f\x10W\x14\x17\x90\xe1\xad\xb8\x93\xc3\xc5\xcc\'/\x1e|\xe8\x89\xbeu\xed\xfc\xde\xb13\x9fM.\xf0:\x8d\x1f`\xde\x98\x16\n\x06\x02\x97\xe0\x82\xc5\xf39\xeb_\x91\xd0\xe2\x89\xdb\xe0X\xe5\x9a\xbf\x10"D0\xb1C\x08p.\xa12\xf0\x1d]8R\xa6\xdf\x01\x11\xf0\xea\x95\xaa\xf04\x83\xeb\x99\xb9\x8e\xaf@.)\x1fzbn\x8d\xb6C.\xed2uJ\xbf\xbct\xa8z\xff|\xf1\xb4\xec\xc2\x0b\xa0\x1a\x1e\xda\xc9\xaf[m\x16g\x92\xcd\xc7?+\x87"\x9f2H\x1a\xe4Eo\xb6b\n/D\'*pky\xa1\xb3\xec\x01\xfe\xa2\x17\x04\xc6\x8cj\xd0lu\xdd\x80\xd2Ai\x81M\x1e\xaeWe\xf5\xae\xd8\xd0\x0e\xbf7\xad\xe2\n\xe1\x92\xa6\x0b\x1c2\x80_\xef\x01j\xf5\x82\xbb*Tv2eIN\x8e\xdf\xe7X|\x1bA\x13\x96|\x86\xe0U\xf4\xdeyq;+\xf0E\xdd\xc0\x11E\xb0\x07\x02\xc3\xdfD\xb7}\xeex\xb3\xe4\xab}4\xa7\xc7\xe3{\xa2\xee\xdeW\x97\xd1T\x12(\x1bN\xc9T>\xd9n\x03\xe1\xa1p\xa8\xbc\xddQ\xf1\x1dXl\xebo\xeaW3J\xc6=\xaeO\xb3O|BjC\x85*\xfdQ\xa15#\xbe\xa6`g\xa9\xa2\x81\x95\x9d\x1cy\x16\x1d];\x81\xc0\xb4\xaaU`qW\x8e%\x8fi\x8f!\xe8\x7fz\x95Tn\xcc\x91\x1b\x8e\xe5\x13@Q0\xb1\xcc\xac\xcf\xd8\\@o\x12b\xe9\x81\xdb:\x91\xdb\x11%(Ky`Q=y\xf9b\xeb%\xb8\xd2\x17\xfe2\xed\xc1|\xf5\x19{\xec\xec\xa6\xd4\x11\x1dS\xaa\x8d\x7f\xfc\xf5K\x898y\x8f\x97\x12\xbb\x9b>&\xcdta\xf2\xdex~\xe6\x03p\x93\x98\xf9\xae\x91\x1c:B\xff&\x10br\xd0\x00\xcd\xe3\xcbvXWf\xf1\xf8\x1d\xbba\x1f\x19\x0b\xd4T("\x9f\xab\xca\xfdF\x88%\xac\xb2\x0e\xa5\xf7\x1bj\x8a\xf6\xef\x01\x8a,\x92\xdc\xe0\xbd]\x18\xddg\x1a\xfd\x1e\xa86\xf4\x08\xdc\xa5\xae\x84\xb2 {R\x1f\xa5\xf6\xc4a\xf09<\xe2\xc8\x10\xf9\xfa\xdf\x817\xd9"\x8f\xb2Z|\xe3\x03\xa5)\xe2\xe1\xca\xdc,\x1a\xdaK\xd3>\x7f\xd6\xd9\x0ex\xff\x90\xca\xd1\x1c\x86A\xee\x0e=\x1b\xb8\x01y\xe3\x1bXR\x0e\x96DxL\xfe\x00BT\x19d\x8c7\xd5\xf2\x07\xbb\xbe\xfc\xdb\xce\xd4mw\xa3\xef0h/\x0f\xcd@\x84\x14\xce\xc2\x0b\xa3\x87Bk\xe3madfep/\xed\x0e\xd8\xf6\x16\x14\xd9\xe3\x94\xa6\x95\xf3{=h\xdd\xb7\xa0\x07\xf0\xbd\x1cG\x95\\H\xe6\xfa\x01m3<\xf8j\xca\x19\x05w\x19&\xc2}\x00X\x8cJ\xb3\x97\xa9DL\xa3\xa7\x05\xb1w\x00\x00\xfc\x98\xd9\xb4\x9d\xfeZ\n\xde{\x01\x0f\x102\xed8\x04v\x07\x88\xc3\xda\x89\xa1\xdb\x9e\x8fX\x85o\r\x8a\xd3I\xcd$\xb6\xd2\xe1\x8b\x10k\x14\xc1\xc1w\x86\x19\xb7\xdc\xc1\xfb\xf9|E\xb9\xfc\x05\xdd?\x0c\xed\t<$\xb9|8\x88\xf3\xefN\xb8\xe4\x81\x1b`\xd5\x9b\xb7\x86\xf4\xd5AQ\xd2\xb3\xb4\xda\x1b\xdb\xe0\x82\xa2\xd2\xb8\xc2`\x90\x0b\xbe\xe2\xbc;a\x14$B\xf4\x865\x9f\xaf\xcd\xcf\xe7\xf0\xcdC\xc1\xdd\xe1\xfc\x1cOy\xc0n\x97\xce\xa81O\xfe+ %_\xe1!v\x87\xfa\xc1\xaa\xfb\x0fL\xd0,\xb3\x0c:\x06T?\x15\xc8\xa8\xe3Q\xdbp\xd7w\xe8\xa8)l\xda\x93\x98wgkHd\x82\xd5\xc2\xf3\xaf;\x99G\xc7\xe2\xbe*Qj\x7f\xc0\x8ak5\x13\xe0\xea\xddx\xc5k\xc9\xab+>\x9b\xa5\xb7\xde\x0e=\x81\x1c\xcb\x1b\x0e\x91\x87A\x95\xe5\xb0Ye\x9dN\x93i\xdf,\xbd\x9b\xacJc\x95\rv\xe8\xf1\xe4p\xe5\xc0\x1d\xa2\xe2;\xe0\xecF:l\xc7\xba\'\xf8\x98( \xb2u\x919\xc9Z<\x8b\x9d\xea\x1e\xa1\xff\xd8\xb5k\x7f\\\xbd\xb6<|\x1a\x96\xcb\xc5}\xf0\xca7\xb6\xee:\xcc0\xa6\x1e,\xc7\xcd\x9a\xf4\x9em\t\xdb\x0b\xd7;\x95d\xfa~\x997\xff\x82\x92f$\xc5\x0f\xa4M\xd7\xdd\xab$\xa9\xb8\xb3q\xfcp\x17"\xdb!6d/\xdc\x06+\xdbG\xcf\xfe>\x1e\xf7S\x01\xbe\x85b={\x86\x8c\r\xa5\xbc\x01\xacP\xb3\xa5Z\x8dE\x0eN\xfe?:\x1d\xa0R\xd5\xea\xdb\xacTU\xb6N\x9bb\xed\\U\xb4\xcd\xb2%\x13k3\xab\x14^\xeb\xe3\xa3O\xae\xd1\xebZ\x9f\xed\xc6\xfat-;I\xf4\'\xe1\x0e\x04\xffb\xdf\x9bv\xfc\xf5LQ\'\x91qo\x82\xbex\xd1\x9d\x0e~\xb4:,\x06B\xe9u\xa7)\xa4\xcf\xc0\xf4\xf3\x1d\xe0\xc5\x89/\x1f\x81\xcb)P\xf3\x08\x0b\x1am\xf6sX\xcf~\x83\x12kmW\x12U]\x9fJ\xa2?\xe3\x80\x01\x03WY5\x16\x93m\x9bU\xfd\x8d\xb0\xc3<\x0e\xf0\xc1hC\x97h\x98\x0e\x19E\xef\x0f\xce\x00\xdbk\r\x02\xac\xa5\x8a1hb\x00\xea#\xe7\x06\x18\xc0\x17\x8f\x84\xff\\\x02\xc7S\xd1\x85\xec\xae\xf2W\x7f\x07F\xd1\xfa\xc7\xcc~\xd9j\xb9En\xcdV\xa4\x8b\xa1n\xfbh:|\xef\xf1\x06\x1a\x81\x8e\xc0\x94\xe6\xcaU\xc5i\xc1\x1ds+\xc70\xb8\xbd@q\xb1s\x82\xa6\xd4q\x1d\x95\xed\xc6\xad\xaa\xc4\xf3q\x8d\xdd\xa94\xe3\rA\x8b\x9bu\x1c*\r?p\x98\xdd\x8a\xa5\xcb%Q\x1922\xa8\x14y\x01z\x85f\xf5/\xed\xb1\xb8\x8f6\xa4\x04\x98\x02\x1e4=\x86\xd0\x85\xd2\xd5\xec\xc6\n4\x01W\xd1\xa2\xf4\xfc\xcd\xa6\xdd\xd8\xf3\xd2\xb1.\xa4\xcc\x8d\x08Z\x81brU%Y\xe9\x8b\xa07\x9a\xc0\xdaA\xe48\xf8\xf8W(\xfc*v\x8b\xbd\x98K\x7f\xc7"\xdc\x92P\xa1\xebB\xff\xde\xfa\x11\xc5\xe7\r\x99W\xe1\x8eH\xbd|J\x7f\x7f^\x84\x19\xaf4\xba\x03\xdd\x01\xb3`A\x8a#\xa3\xe8\xc3\xc9hi\xa6\x1e\xf4\x042\x84\xcc\xd8\xed\x15W\xa7\xf9=,\xf7\x8b\xd2\xc0X\x86\xa1\xf9\x83\xca,4N\n\x14\x02f\xd9:\x89\x9dX{\x04\xbbrT\xffo\x1b\xca\x93k;j?p\xefMv7+H-\x01\xe9\x0b7\xc2yY\xf2\x1b\xa7\x98\x80C\xac\xed\xef\x0b\x05v\xa4p\xe8\xdf\x06\xbc\xf4\x90\xd4\xc9\xe1&\x1br\xd1\x87\x0f8\xd8\t\xac6F\x94\x03\x80u\xf3\xf9\xb5d\xec0\x90[<R\xbb\xb4\x80cF\x03\xd4.OD\xdc\x00\x16%\xec\x10K\x85\x13\x8d;\x97\xa3\x8fl"e\xca\xd7 :X%\x89z\xbbb\xa7V\xb0l\xf5\t@\x99\xff\xdeT\x08\x9cr\xfb\x1d\x8e\n\xe2\xa6\x06VyZQ\xd2l\xa5\xb5\x80]}\xe9\xe5 8,\x93\x10:\x80,`\x88E\x05Wj\xd5\x94\xe2)\xe5;\xb5j\x95\x82\xbaKi$\xfaT\xb9\x02\xe94\xe9%i\xb3\xb9\x13\x16\xbcfP\x1b_*\r\xe0\xa5\xad\xb9+@D\xac\x8d\xae\x8e\xca\xb6\xe4\x9c\x85\xcba\xc2^\x0f\xc2\xf3O\xd0?\x7fH\x8e\xbbx\x03p\x14\x0fH\x12/\xeb\xb4Y\xe4\x85\xc0\xc4\xabo\xd3u\x05]\x909)\xa8\xec\x9e\xfd\xfb\x90\xbf\x91\xec\xc6\xc0N\x06V\x05\'\xd0\xb8W;\xc9(\x0e\x9cP\xca\x84\xfa\x82\x7f\xa9V\xc0\x04|S\xbe\x8d\xf9\t>\x1f*]\x1b\xcd\xc1\xbe\xda\xc1\xaa,\xf3\xcd\xbf\xfd\x8c\x95\xd8%\xaeQ\xe6\x9c\xdeF\xd7\xe5\x88\xca\xdb\xb1\xf8\x83\xddnM\xd7\x9aT7\xe3\xb5@\xc4\x008\xca\xfd]\xa0h\xee\xb2\xd8\xfdN\x86KU\xde\xa8cU\x15\xa6\xcb7\xd9\xc1.Nw\x81p,\xfae\xbf\xa6\xbe\xf0;\xf1\xe5\xa1\\ti\xcb\xc0\x16\\\x1a5;8\x0f\xa5\xaa\xd0q$\x12l:\x02*P\xa4?\xbb\x9a(I\xfbw\xbe j\xe4\xa2\xf4\xdd\x15/5\x8f\xf5\x19\xa0\xc5\xc0\x17\xea\x1dkz\xb2\x8e\x85k\xe3\xc5DCsj$\x9d0\xb19\xc5\x10\xac\xc3\xcaz\x15\x1e7\x95\xadBF\x17\xce\x945hO\x02\xcebb\x98\xdf>c\xa7\xe0\xf6\xf9\x12\xc8\x16(\x01\xd4\xc8\xad\x9cbs5\xc1\xf9}\xb4\xde\xd8\xb2\xfd\xca\x81\x1d\xe1W\x1c~\x86\xb3\x9bM\x8b\xa0\xae\x8e\xf0}+\x14\xdf%(\xdb\xe1\xf9`"V\xd8y\xad5\x17\x9e\xbf\xc8\x17\xce\x0e\xbe\xef\x89&\x04\t\xb2\xc2\x17\x0e\x81Oa\xf7\xd1+\xb4\xb1\xc1\x7f&5\xd0^"\xa8\xee\xe2\x96\xd2\x96\xc8\x95>\x10\xdbo\x13\xd5>\x14\xe1\xcf\xb0\x9b\xfbg\xb2\xe8\x8dY\x94\xb8X8\xae\xcbVf\t}1\xca\xe9\x86\xe6\x97\xeb\xe2\xe2\xcb\xc2\x1d\xbc\xd4\x02\xbc\x14\xe7)C{\xacK\xee#\x07\x85\xd1\xcf\xed\x86\xf4f>Z\xa6\xbb[u\xe3\x9c\xef8\xc4\xda\xb1\xaa\xdfy\r\xbdk\x87\xf6o\xde+YZ\xfe{\xcf\xc0\xf7\xd8\x97\xac5`\xad\x9cD}\xfdA\x11\xfa\xc4\xd0Mj\x0fR\x9b*7\x8c\xcb%\x8f\xfb\xf7\x9a\xb0\x1b9\xfc\x1f\xe1F\x8e\xd6\xa3RB\x8e\x1f\x07\xc6\x9c^\x9b\t\xe0\xfdgh\x86\x80w\xb7\x1f\xfbt\x1e\xce\xa8^\x1cmH\x83\xbf\x05v\xd7m\xde\xa9\xf4\xe37\xefT\xe8s\xe8b\x03\x98H\xbb\x1e\xd1:\xbe\xa1\xe2\xe0a\x15*\xff\xaah\x8d\xf6d\t\x88J\x837\x05\xf7\xf5\xb3\x8d\xb0@\xe7j\x1bg\xb7\x91\x16\xc8\x97\x97\xd8h\xa0\xb34\xd1B\x9e\x95i^\xc1\x1d5\x0e\xef\xd5\x01\xc3NeO`\xef\x7f\x83\x80\x9ay\x1c~;\x13\x1d&~P\xf2\xe4T\xd2\x9b\xb6A\xf5\xec`}\xd4\xea!\xed$uK\xb0*\t\xac\xca\x82"\x83\x0b\x1f\xaf\xf0\x1f\x0c\x98`\xab\x18\xeb;#[1G\xe9\xe3\xfeC9\x85\xb7\xbc\xad\xbaK\x9d\xb7\xf4\xdf\xea\x97g_C\xe9\xd2]\xa2\xeb\x04\x88\xb2\x1a\xa9\rA\xc1)\x11/\x0b\xee[\xf5\xe4\xbc\xba\x88\xadv\x85\xaf\xf18\xbc\x11n\\\xael6=\xebqr%\x85\xdd\xa2\xd3C\xbb\x98\xe6\xc4/\x9d\x04\xfb\x04%J2U!n8\xeee\xdc\xe65Y\x90\xc9LO\x98\xc3\xfd\x15O\x90j}\xf2\x0c\x96\xf9j\x96\x16j!\n\xf8T\x8b\xff\\\xb8!\xed\x80j}\xfd\xf2P\x8f\xbd\xb3H\xeb\xb3\xeb\x93\x82\xfa\xdc.\x7fUl\xac\x9e\xbe N\xd8\x83\xf5y\x10\xa0\xe0\xb1}@\x9f1\x88\xe7\x9eW\xf1P\x1a\xf8Y\x1bo"\xf5\x9b\xb3&\xf2\xe9\x18K\xf3\xa7h|W+\'|\xb5"\x01N\xed\x81\xd3\xd5=\xe7\x7fo\xa6\tt\xa3\x00Nx\xf9\x0c<\x02\xd0\r\x14\xff\xbf\xe3\x08D\xe1y\xeb\x80m\x84\x0b\x0e\x0c[\xba\x13\xf4\x1c\xda\x9c&\xd0H\xf0\x94F\x0f\xb1\xdb\xea\x8b\x0b\xe8\xec\xe1\xee\xcd\xce\x99"\x00\xd5\xa9\n\xe3w\xc8\xa1\xab\x11:\xed\xbaX\x9b\xe8\x9e\x1c\x830\xcc|\x0b\x9c\x14\x95\xf4\x83\x9eF:\xc1\x17\x9a~\xd9":\xb8}\xb3\xf2\xbe\x02ou\xa5\x1bu\xe0\xe0\x84\x876\x8eTo^\x9b\xb3\xdc?\xcf\x12\x92\xf5\x92\xa8\x8flG\xf0\xbd\xc0\x99\x7f\x14\x04\xfdW\xfcf\xc3\x9f\x10b\xe9\x96\xc4e\x8e\xc4\xfaP\xa3\xbaA\x187\xd0A\xe6v\xf4(\xdf\xf8\x06\x89\xb2\xd3\x1cr\x9a\xef\x1d\x02\xc6\xdf\xebq\xff\xa2\x06\x80\xe3seM\x94\xe9 f\x94\x87\xd6@7{\x05H\xc6\xba\x98\xca\x0cx\xa4\xa1@w$S\xea\xf8\x03\x80\xa43>!i\xff\x8aP\xda\x91\xac\xc9O\x8e\'\xa6\xee\x14\xc75\x93\xf9\x0f\xbf\x85\xf9g:O\x7fsHB7\x89z\xed\x9ec\xa9\xee\x1f\t\xca\xc2*.v\xffw\xe6\x05\x1e\xbeZ}6_;\xb4\xa7\xebkui\x99\x19\xafp<usXa"\xc0C\xfc\xae\xf7\xc1\xb2@;\xc5\x0e\x99\x8a\xb0\xbf\x1e\xb7\r\x9a\x88\xba[\xd9l\xa7^}\xd3M\xd2\x80Y\x96\x1f\x87\xea\xf4\xb0\xdeh\x12\xc5q\xf6K9`\xb5\xdf\xca\xa66\xdc:\x0c>\xe1\xb8:o\xba \xda\x0e\x0e\xbc\x12ho\x988ees\xccg\xecH\x19\xfb.\xbd\xa1O\x10hp\xa3<C\xf3\x85\xb3\x04\xf7\xfd>\xaa\xb6\xdc\r+\xe5\xad\x9a\x8a!\xc4Y\x93\xe6\xad\xd2\x9d\xc8;\xc2\x82\xc6\x82@\xf9\xc3 \r\xaf\x11\xa9\x16\xd4\xd8\xae|l\xdb\xe3\xb3\xa49/\xb8(\xd9I\xdc\xa3\xa1\x14\xa6\xfb\x7f\xde\xf2\'\x9f\x8a\x8b/}rr\xa0r}\xaa6UDT\xb7\xfe\xde\x08gj["\xaa\xa0\x93;\xe6\x0e8~\x90q\xd63\xeb\xc8\x97\xeb7\xdb\xcaA\xe5\xad+\x15\xffp\nv\xca\xdcV\xbceh\xee\xdf+\xd7\x9b?s\xb4\xf9\xd2\x01\xba\xc5#J\x9c\x0e\xac\x17\xcbu\x9f\x8f\xbb\xea\xc6\x9e\x84\x07\x15\x9a\xad\xbe\\:\xb0\x1fuG\x94k\xa6\x81\xad\x0cDu\xef\xa3dN\x80O\xec\xa3M`\x80\x11\x11\x07\x06g]\xdfs]\xe3!\xd9\x7f{\xe2\xca\xac\xec\xec\xcdf\xec \xa9\x9b\xb5zdo\xba\xa1\x7f\xd3)W\xf4\x02\x1fqW\x90x7\xe5\x8f\x9d\x14\xa4&l\xc7\x8by\x0e\xbcK\xf9y\x81f^\xbdb\x08>\x06\x9e\xe7\xf0R\x1a\xd0\x866a\xc07\xfdW\xd4\x98\x0b\x9c\xc4\'V\x9f\xfb\xd6\xdc\xc5{:0^\x1b/dyr\xcf\x93\xe0Q\x10\xfc\xfd\x16\x1f\xa3\n\xfa&\x96P\x05\xc5/\xb0>kZb\xfd)\x80\x9e\xe0\xc6\xef\xec\xab\xdcsS%^\xb4\x8f\xc2\x90\x0f\xc8\x14\xefv\xbf\x19\x07\tW\xbeY\x03\x9eP\xc9wL\xf9\xf7\xd0\xd7\xb2t\xda\x19Z\xe9\xc6\x15\x1a\xe8\xe32\x82\xab8\xed\xa4\xa2\'\xeeV\xdf\xf3\xa7\xf2\x1d\x81V\xa4\x01#\xf9b\xa4\xe82m\x8fJm\xd9\x15\x1cs\x12\x1eaA\x01\x1b\xb6\x1b\xef.\xa0\x88\xca\xaa\xb6v\x1b\x15|\x98\x13ta\xdf\x87H\xfb1\x8e\x0f]\x7f?*Mny\x93\xef\x08]}3\xf5\xb0.\xf1r\xfd\x1fY\xcf\x99:N\xf6\xe4N3\xbam\xe8\x7f\xb1\x92s\x1a\x85\xd9\x82e\x8f\xed0\x1d\x98h\xc0\xc2)\x95\xc7Vg\x97\xe43$l\xff\xd1%n\xadY_\x00\x1f\x99\x06\xc0%\xa97\xc7)\xc0\x11R8\xe2-\xbe]\xb9\xbcSS1C|\xda\xa4yg#\xc0\x0cG\t\x02\xc6\x0ccW\xd2\xc7\xaf\xe7\xf3\xc6~"\xc4\xcd;\x0e\xfd\r^[\xfbF\x8d\x98\x8f\xd0\x17\xcc\xe1\xd5\x05\x19\xb7K\xc8\x811U\xbe\xbam\xb4"^[\xb8q\x1f<\xd4\x04~\x9f\xbdU\xda\x1b\xd5j\xd6\xb1\x9b\x90\x88\xf5\xb9\xe4o\x115V\xb1\xbcm\xe3\x10Q\xdb\xea\xfd\xec\xe6l\x1b\xdf\xd0\xa8H\xdb`\x94\xb0R\x98\xc9\xd9\xe7\x05v\x9dmqre\xbf\xb6m`\x82\xfe\x9aa\x17\x14EU\xe6r\xbd\xf61\x87\xe0\xb9\xbb\xa0\xcb\t\xea\x19\xc0\x8em\xcc\xf5\xc0\xde\xe7Q\x02a\xf0\xf4@\xf1^Z`\xc0\xe1\xf9\xe7\xe04r\x98\xbb\x92\xb5\x93\x9cZ*\xc9\x96\x89\xecy\xadK\x07\xa6\xca\xcbh\xce\xdf7\xf9\xfc)\x08-\xf85\x9d\x05\x19\x85O\xf0\x18\xde&\xf8\xd8\x7f\xc7\xd5\xc6\xfd\x99\x0fpJ\xec\xcf\x0c\xde\x9c-\x08\xe0\xb6\xe0\xaez\xbdU:\xad\xba\xd4\xbc\x1e\xa6\xa6\xc3\x99\x9b\xf3d5\xf4Q`4\x1b\xd4\x05\x89;\x1b\xe7L\x01(\xc0"\'G\x86\xa2q0%S\xa0"\x1f\xf8Z\n,\xdeG\x94\xba\xb1\xe2)\xec\xee]p\xb7\x12\xa4z\xfa"m\xb2\xcf\xb1]\x1b\x1e\xb1\x96\xacRH\xdc\x8aL\xb0^P\x0c\xe2e\x91\xbbak@c\x01\x86\x81\xf5\x9eZ\xd2\x9eT-\x10\x8c\xb6\xd9\x86\xfe8\xc0\xf5\xf7f\xcd\x0b~\xbd\xbb\xa0R\x15o\xd5\x8a\xe5\x9f\xe6\xc2\x08`A-vS\xaeW\x9e\xae\x06O\xdd!\x96PK\xe8\x0c3\xb0\r\xf8S\x01\x84H\xa88O\x90!/\xd0\xa8E\xbf\xbc\xac\xbe\xbf\x06\xaa\x9c\x86\xed\x80\x87\xf8XjI+>bL\xd91\x0e\xc2\x9f\xf9=N\x0b\xe4,\x88(\xc2qG\xf6D`f\xc9\xe6D\xa0\x8f~\xed;\xce\xcdyR\xc0\xf7\x8c\xd5\x19\r\xb9^\x8b\xddF\xfaxx\x8e\x8f\x9e\x7f)\xb1\xc1;R\xe4\xd9\x1beB\xde\x98%[\xe6O}|J\xfb\xd8\xd9*\xd7q\xbc\xfcs8S\xc4#\xfcy<\xc0\xef\xe2\x15C\xff\x11\xbf\xa3X\xeb\x11\xf6\xec\xec]\xf8\xfer/:\x14\x16\xc9v\xbf\x1a~b\x89;\x89<\xf3\xc4\x0b\xe2x\xbd\xb3V\xd9:\xd9\xa2\xf9\xb8\x8dkp\x83bb\xef\xfaE\xe6\xfa\x9f)J\xea\xce\xc6I\xa4%x\x86a#^gP\xb5\xf3v\x0b\xff\xc1\xa6\'"\xf9c=\xde2\\)\x05\x13\x81sV\xcc\xa39\xa4}\x04\xc0\x13\x1f5\xb8\xfc\x07\xa7eU\xa2\xae\xdb\xe7\x9fZ\x9f\xd1F\xd9w\x15\xd5\x96\xae\x8dl\x1b\x9b \xf2\xcd\xdf\x83\x05.\xf8\x8d?\x7f\x0e"\xea\xcf\x14\'\x91\xbb\xaa\x88S\xbc\xce\xe1\xe7#\xfe\xa0\x1d_\xe0a\x07\xd6^\xd7\xe8\x1e]\xcc\x9f\x1c0L\xe3\x1b2\x0b\x02\x8b\xe4\xc7]\x18\xe2\xbbCnJq\xf9e\xfeG\xac\x03\xaf\xae\x14\x84\xe3\xa8\x7f\xb8(N\r6\x87|]S\n\x93\x8a\xee\xab\xd6}\xec\x01\x1d\xa9\x1c{\xa6M\xd3Jq8\xee\xb0DX(|\xd1):)\xe8\x9a\xacFT\x10;ha\xe8\x0f\xcf\xca\x1e`J\xc1*\xf3D\x85\xc1o\x9e\x83\xa7\xfe\x9aJ\x9a\x124\xee\x80\xd2m{q\xdb\xea\x8a\xe3N\xc7\xb1\xef7\x1e\x13\x02D\xfa\xc6`K+/?,\xd2>2\xe6\xce\xa1o\x155tM\x16\xd4\xef\xae\xde_mP\xed\x02l\xf7\x89\xfa^\xf4R\x98\xbc\xf9\xb4^\xbez_\xd0\xbb\xd7lNB\xdeGm\xe4I\x1dO\x1b\xb1\x90I\xfa\xc8\xae\xd2\xa0\xae?"\xfd\x9aF$\xe5\xe4(\x00\x96\xe1\x8d\x08\'}pH\x03\x90\x169\xa10\xff\xb3\xd1\xad\xa2\'}%\x05\xf5\xe2\xc4\x03\x7f\x1a\x06#\xf2\x0c\xef}\x1c\xbf\x11h\xe4[yvMy\x18\x88z\x98\xa7\x08y\x8b\xf7J+y1\x88\xe9\xad\xd8\xb4\x1c\xcf\xf7\xe5P:\xcd\xe2\x91\x1b\xdc\x0e\xaa\xe7aMD\xfc\x19\x17\xe5\xa8\xda=\xe2:\x9a\x05\x0f\x18\x0f\xee\xd9^g\x9eh\x89\xd5\xe1\xe0\x05\xa6\x18C\xf2\x9b\x9a}\xcaia)B\xd0\xfd\x03\xbc\x9a]+\xc2\xdd\x85\xae+\xc9\x1eV\x83\x97q\t\x84\xc8)~\xdf\x18\xe9\xc6+8\xfa*\tFG\xaf\x82\xe6\x96U\xa9 E\'\x05z\xe0\x9c:\x13\xc4\x7f\x1a#\xcbJ\xd9\'=A\xe3\xbf\xe3\x8bSN_\x1a\xfa\xc0\xef\xcf1o\xc1\xbf\x7fb\xb5\xc7\xa7;\xd1p\xd9Ya\xf2\xfc\x02\x8e\xa8OT\x9d\x87\xc5\xa2o6*\x01\x11{\xecF\xf4\x03\xdah^Q\xcd\xc9\'\xa5\xd1i\xcb7X\xec\xb9ry/\x0e\xd7\x13Q\x17n\xad\x9c\xfb\xbf\x8c\x95\xd7\x94\x9a\xef\xea\r\x93:\xda\xacq\xfe\xa7\x88V\xf5[\xe2\xc9\xa7+\xdf\xba!m\xc6\xe0\x91h\x19\xd6\xdc\x0b\x05\xb8r\x94\'t\xd9b}\xf2\xe5\xea\x7f\xdb\xffc\xe6\xb16 F\xbb%i-\x13-\xd1x@\x87\x16\xe7\xc6Q\x82tS\x0c\xb11\xebr(\xb3c\xac\x8b,\x1b\x85$j5\xa6;\x14\xadj`nW\xc5\x0cr6\x92\x0f?\xd3\x8e5Z]\xaa\xe2\x84e$\x9e\xa0\x0c\x0f\xe6g\x97/\xd6\xc6\x0b\x8d\xe7\xea\xc7\xc7wi\xe8\xaf\xef\\N\x9a\x16\x82\xe8\xb4\x9d\xe7G\xa1\x049\xf8\xdf2\xe8\x0b\xac:_\xb86\'\xcc5\xe3F\t6\xa1\x10N1c.\xa4\x8e4\xdeZ\x9e9\x9d h\x9c\xf6\xa3\xf5\x94\xb2O\x9bp\x1b\xf1\xdc\xb2x\x10e9\xa6k\xf4\xce\xa15\xb1\xf9T|\xec\xefH\x9a\xe4cG|\xac[\x9ai\xb9-C\x15\xb5\x1e"\xb21\x82\x19\xfb\xb6v\x9c\x99@Y\x0e-\xf6\x11P\nQ\xb3\xbc\xff\x9d\x9cP;w\xe2\x9f\xd1\xf4\xa2[\xd6e\xa5\xa7\x05\xa2|D\xd6;\xbe\x83\xa2\x83B\xd2Q\xfc4\x87\xef\x91\xc2O\xfbH\xd7kC\xadB\x81\x0fc\xd5\xb7\xc6Z\xa6\x19\xb9\x16\x17\x84\xf0\x04\xbd\xdc\x91a\x9f\xa8\xb2^2v\xf7\xe2\xb7\xe4u\x9dy\xc1cM\xeb~\x1e\x93?\xdai\x16>\xf8.\x97\x07\xb6\x8cz\xae\xaa\x9d/.\xb9\xc9\x0b\xb4\xeb\xe6\xe2\xd4m\xbad\x9cR?\xe965\x19\xe5\xe8\x85\x1d\xaa)tNSO\x05>\xb8J\xde]gj\xdc\x17\x99\x82kZ\xc0bn\xab6\xe7\xce\xa1d\xbe\x7fuz\x88\x88\xb5ljn))\xf45\xedr\x00\xc6\x10K\x8a\xdc*\x964\x1b(\x9cv%^I1\xc7DB0\x16\x19\x15z\xb9/Lxy7kie}\xabR\x9a|\xfa>\x1f\x1br\xbcVCn\xea\xc6L!4\x00qAj\xa7\xaf\xa5\xbd\xa6}\x83\xee-\xb0Z#3F[\x9bc\x8a\xba\x8f\xa7\xa9O<\x10\xd3\x88{E>\x9d\x15\xec\xdc+-\x1bp\xc0\x8d\xd3u\x87\xdd\x1e\x02\xdf\t\x05\xe9\x90\xa5\xfc\xb7\x1b\xeb\x841\xfa\xe2\x13\x88\xf2\x92G\x01?^\xe1a\x15\xbfC\xa9n\xfb\x81x\x9cF3=\x17\xca\xa2\xd5H\xef\xb7\xb4V%`V\x15jZ\xa6\x87\x03Y\x1b\xb1\x99{\xceO\x8e\x0f\xfa\xe2%\x1e<0\xac\xac\xd9R-v\x80\xdf!\x1b\x87\x9aQ\xf5`0~\x06\x89\xdfU\xc7\xda\x90G\x87\x95\x12\x7f=\xe3E\xfc\x04b\x7f\x8e\xf9\xf2\x96\xbc\xf9\xf5)\xf8_\xe7\x10\xfc\xfe\xf7/\x96\xfe\xf7\xc0\xff\x1e\xf8\x7fx`m\xe3:\xa7 v\xf0\xeb\xae;\x08\xf0\x1f\xde\xd0\xe2x\xd5Q\xf7\xcb\xff\x1f\nt\xf9\xd2',
+    "/data/translations.csv": b'x\xda\xcd[\xebs\x13I\x92\xff\xae\xbf\xa2\x02bc\xe0\xa2\xcf\xb3\xc3\xee}QL\xcc\x04\x07\xc3\xedD03\x04fn\xe2"&B\xd1Hm[\x87\xa4\xf6\xaa\xa5\x01\xef\xdeFX\x0f\x8c,\xdbc\x8cm,\xdb\xb2-\xc0\xd8\x06?\x10\xd8f\x04\x18\xfc\xbfl\xbb\xe5G\xb7\x82\xf9\x13.3\xab\xfa\xa5\x07\xcb\xec}\xb9\x08\xc2\x92\xaa\xb2\xb2\xb2\xb2\xb22\x7f\x99U\xdcP\x06\xa4\x1b\xaa\xa4$\xa4\xff\x96\x03r\x7f\x7f(\x15M\xc5\x14\xe9BR\xfds:\xaa9\x9fz\xf6\x99\x9e\xdb\xd4s9=\x0b\x7f\xf7\x02}\x8a\x9c\x8a\xcb6u#\xb3a>(7\xb2\xcb\xac\xb1Xh\x14k\xe6\xea\xae=\x92\xfd\x89S6s\xd0s\xf7\xe8oA\xcf-bcn&\x10\xe6#Ba5\x9dHyy\xce-Y\x85\x92\xc3\xf0\x02u7\xb13\xe6\x17\xeb\xd3U\x87E*\x1aW4\xa917*\xf1o\xd0\x1d\x88)\x9a&]v\xfe\x18\xd5\t=\xf3T\xcf\xe4\x03q5\xa9H\xdf8\x7f\x8c\xe59l\xbd.k\xd1pHSR\xa9h\xa2W\x93NjUs\xbb\xc6\xac\xfc\xb2U\x99\x96\xfe\x1d;Y\xb7\xddi,\xbd\xae\x977\x8e\xd66\x8d\xad9G\x86\x88\x12\xbe\xe1Y\x859\xf6<\xe8\xac\xe1"\xf4\x05[Ur\x87\x7f\x0f\xfax\x84z\xa2>\x15\x03#\xd6\x18\x1d\xb5\x16\xf6|\xec\xd8%$\xeb\xc4R\xcfM\xeb\xd9\x07zvY\xcf\xad\x074%\xa6\x84S\xff\x809,\xb5\xd2\xc8-H\xddD\xcc\xfe\xb9\xa9\xf4\xec\xbd\xe3L\xad^\\\x0cD\xe3r\xafb\xef\xad\xb5\xb0c>\xabY\xab\x83\x12o\x96\x0e\xa7\xde\x18\xb9q\xaf`\x12J\xe2\x17\x01\xa7\x96\xdci\x1c\xd6\xb4\x8e\x84\x9a\n\xf1\xe1J\x04\xc7\xc2\x14b\xb8y\xb7\x0431k\xbahM\x97\xac\xe2\xae9R0G\x96\xbb$Z\t\x0cc\xf6\xb0.\x0f\xf3\xcc(g\xaeg`1\xa3zf\x05LB\xcf\xbc\xd33\xf3zvR\x1f\xcc\xf2\xf5\xb8\xe6\xe1\xac\xc8\xb6\x90\xaf\xb1\xdf\xb5\x10\xbe@a!|\xec\xcdh$\xd5\xe7\x1dX}\xcb\xcc|\xc1|\x95\x0f\x8a\xd1?D\x13\x11\xf5&|\x00aP\xb0\xd0\xb3+z\xf6\x91\x9e\xdb\xd6s\xc3\xf0\xddxu;(\xf8\xf5)\xd1\xde\xbeT3\xc3\xa1{\xd0\xd0\xc4\xf0OD\xd9\x81\xe3\xf1z\t\x16\x1d\x0c$e\xa0\x8d\x87\xd4dDIJ\xe6b\xd9\x1c[fV\xa1l\xe5\xcb\xd2U\xeab\xdfQ\x97\x9e{Bc\x07\xf5\\\xe5\xb82d\xbc\x1e\x0f\xf4&\xe5\x01-,\xa3a-L\x98U\xb0\xa8\x89\xb25R\x96\xfe\xc3i\xd7\xb3U=\xb7\x81V\x93}\xa5g\x9f\x93\xf9\xac\x07zb\xd1\xfeP\x9f\x9a\x8c\xfeEM\xa4\xe4\x98d=\x1c\xb5\xe6\xaa\xcc\xac\x96\xacJ^\xba\x04\xbd\xecOn\xaf\xf1\xcb\x8a1\xbem\x8c\x8f\x1d\xbdy\x18\xc0c\x9et\xb7\xa3\x91\x1bD=\xac9\x07\xf6\x1a\xf6\xbb\xdb\xa1g\xf7\xc9@\xc1\xf5\xecq\n\xc1\xa1_\xd5\xa2\xa9\xa8\x9a\xf0r(\xe7\xadW\xa5\xa0`qE\x10\x04}<\x0e\xde\x8e\x1d\xbe\xdd\n\n&= `H\x8b\xfeE\xf1pi\x8cW\xc1128i\xe0Ilf\x97\x80\x90u\x03\xa1\x9f\x1b\x9d \xae\xd5\x82\x9e\xdd\xc5\xf6\xeck\xce\xdc^\xa2\x04\xfa<\xa9\xe6\xc5\xf2\xd8\x19k\xa7p\x96s\xb5\x17\xc9\xcehJ\x18\xda\xea\xb3\xd9\xe3\xfb\x93\xdc\xf2\xde\xef\x15\x0eW\xef\xbd\xdf\x1b\x06fjD\x1e\x08\xf9\\\xae\xbbx\xab\xb4l\x16K\xd6\xe2]\xe6z\x06p\xc1\xae*p\xf0\'\xc2\x15{Tr\xf0\xa6X\x9fy\xacg\xb6\x8c\xad\xd1\x83\xd7C\xe0\x91\x1d\xc5\xb4\x99\xceUS\xa7\xf9\x9a\x95\xe6\x9b\xd6\xa3\xbc\xd6y;\xa8\x90\xa6\x8c\xc9I8.\xe7~\x8fn\xef\xe4\xc5\xa8t\x19\x7f\x83\xdb_\xe5\xddq%\x12M\xc7C\x9f\xfd\x9bdn\xef4\x86v\xa5o\xa8A:\xa8mr\x02-.\xc7b\xa1\xcf~/Y\x8b\x138\xbe\x1b\x7fC<\x19\x0f\xa8\xa9>\xaf\x15\x82\xd0`\x00\xb6\t~\x87\x9d\x1e\x13\xcc,\x80\xc0\x07o\xee\xc3_\xe1\x17br\xa27\r\xe7T\xb2\xee\xd7\xac\xfbpj/\x8b\x86\xa0t\xb46x\xf4t1\x18\x88\xc8\xc9\x1b\xa1\xb8\x1aQ$\xf0a ?3\x9f\xae\x99\x93e\xe9"\xb4\xb3o\xb0\x9dN\xe2\x1e9\xe7\x87dK\xc3\x01-%\'S\xb6\xf2=\xce\x1el\x08\x96 uc7\xeb\x10\xe9\x8f\xef\x8f\x18\xab#\x01PA\xaaMDc\x8d\x9f\xc1\xd5LH_A\xb7/Dt\x8c\x0e\x87\xbf\xac\x1d\xcf\x0f9\x01\xae/\xaa\xa5\xd4\xe4\x80\x1fAX\xc5\xe5\xc6P\xc5\\\xd9pA\x84 k\x8e\xfa\xcf\x1f\xd77w\x02\x10\xc3R\xa0\xf7\xeb\x03\xa1\x88\x9c\x02\xcdd+\xd6j\x995\xa6\xf3\x8d<X\xcd%\xeae\xd7\x07\xd8E\xe8\x85\x031\xf3\xf8\xe0M\x89\x0c\xe4\x11\x85\xa8}\xe0\xe4\x86\\n\x1d?E\x95\x9b^M\xe52V\xbe\xc6\xc0 `O\x1d\xa9\xc8p\xd8\x7f"i\x93`GO\xb6\x0fw\xc0\x08\'\xf5\xdcc\x84K\xe0\xb5z\xa3\t9\x16"W-Y\xf3w\x01LH\xdf\x89V\x18\xfdT\xcf=\xd5\xb35=WDGh\xcb\xc2\xa9\x1d1:\xa21\xb4?p\x91\xd6\x8b\x1d\xe9<\x9a\xe2\xed5\x88X\x0e\x17\x19\x96\x14\xf7.fz\xd4\\\x1cuVq\x9e\xba\x9b\xf7+\xfb\x90\x1c;l\\%@\x0cB1\xd8\x03\xd0\xceu\x05\xe6"\x8b6\xef\x96\x05/\xb0\xc2\'\xe6\x83\x05\xc07j\xa2\'\xda\x9bN*\x11\xce\x96]\x86Ah\xbdh\xdfv,]\xf22?\xa8\r\x1e\xad\xac\x06\x03r$"\x04\x15,\xad\x97S\'\xd5A\xe9|$\xe2H\xe8\x8e:\xda\x7fk\x14+\xdc*\xfd\xa3\n%<kd\x8f\xad\xc3\x84\xf1E \xe0\xa7\x94\xa6\x81\xd9M\xab\x02\xe7\x88\xba\xda\x0c5\x86\x8b\xc7\xb3\xcbB\x15\x1c\xf5\xda#+eX\xbe\xc4\xd7{\x8dz\xbc\x03m\xc7^\xc0\x8d\xe5\xc3\x01\x91jd\x06ByO\xa6\xf0$\x02\x1a\xe2<\xbe\x11\xdd>.\xb9\x07\xb47ohoj\x8e\x1cqW\x0c\n\x08\x8e\x18q\xffx\x1e\x05\x027\x15\xe5\x06:\xe2\xa4\xd2\x0f\xb0\\\xb2\xe6\xa6\x10\xe9A\x805\xb7w\xa5\x1fx\'\xbb\xca;\xeb\xf3e8*\x87\xaf\xaaz\xb6x\xb4?\xa5gf\x02Z\xbf\x12\x8e\xf6\x00,\xa6s\xd6(\xbe\xc2\xd8\xc3\x8f\x9b\xd4-\xfa\xe8\x94I\x87\xc3\xafh\xc7\xb7\xf8ik\x9aX 5\x89O\xcc\x84\x18~\xb4\xc7\xa5`B(@P\xae \xb3\\4\x17\x01\xfa\xe4r\x98s7\xe0\xe7\xfaA)]\x86q\x0c\x82\xf3S\x90\x10$\xa4z\xb9\x10H\xa5a\xb9\xb3S\xd25\xf8<\xcc\xac\xc3r"\x12\xe6$?\xc0g\xbd\xba\x13H\xf5\xa5%4\x82k\xf0Y/\xaf\x05z\x92Q\xf0\xfe\x05\xe9\x12|\x1e\xdf\x99\x08h\xa0OpiR7|\x1a\xe5\xa5\x80\x96\x06\xfe\x00\xe0\xbb\xe1\x13\xe6\x0e\x90\xd3i\x8dG<\x14\xb5\x89C\x14\x82Z\xe3\xcfu5\x95\x02\xcc\x96\xe4@\x10\x82\xea\xe3\x9a\xf5\xf4-\x1c\xd2\xbc\xb9X\x92|\xbd\x00\x9d\x0ej#\xf6\x88\xb0\x92\x00\x1f)qB\x06\xe7\xce\x9a\xdb1\xc7\xaa\x92\xbf\x1bf6\x96\xb7<\xc3bJ\x0f\xcc3\xbb\xd7:\t\xf5\x00BC\xe2\x94\xda\xdf*R9/\xb9\xed$L\x91\x08\xc5T\x8e\x08\x0ee\x93\x0c\x9c\xda\'\x80 t\xa7.\x06xv\xc3\x93%\x9e\xb4x\xf3\xa0\x048n+W\x00\xb7\xc8\xcc\xd5Qsr\x19\x9d\xfb\xb7\xd0X\xbf_=Z\x81p\xde\x0fi\xb1\xf9\xb2`.m\x80\xe4\xd8\xf9\x1d\xb6@H\xd43\xbc\x17\xec\x19\xe5\x92\xac\xdd\xf2\xc9/{vZ\x86T`\xbf\xd4S/\x0f\x1e\xedO\xd0\x90<\xba>\xef\xfc\x1e\x0e\xa1pL\x91\x93~>\xc2\xab2\xf0\x0c\x00\x83)\xf0 \x91\xe0LI\x98\xf6!\xfe`\xce\xe4\xd5!\xb0<\xf4\xcd\xa5\xc4\xfbS\x03MsY3C\xd6\xc2\xa8\xf4\xad\xfa\xf1\xec3\xe0\xcb\xb3p&\x9d\xbc\x08\xcc\xfc\'\xf0G\x95Ak\xf11\x98:|?\xd8_06K\xd4\x1e\x925\xc4,\xb0\xff\x0c!\xf1J\xde*\xef\xa1\xe6=\xe4\xec<\xa4\xd2w\xc7\x8c\xe11\x10\x1d\xcfc\x06R\xf4\x15\xc1#\x1a\xefW\x01\xc5\x88\x84\xd1\xcdr|\xfb\xf35\x11\xb1\xaf\xbdY%\xa9a\x99\xa0\xe0\x02/9\xf0\x8cQp\xa2<\xd3\xc9G))\x14\xc3]\xcc\xc2\xb3S\x9efE\x13=\xaa7\xc9\x828\xb8\xbd#\xf2\xab\xaf\xb1\x8fS\xd7s\xb7\x8d\xcas\xbe\xf26\xc8\xcb\xb3\xe8\x0eA\x1dU\xe0\xd1\xde\x9f\xd3\x8a\xc6\xb19$\xb6\x0e#\xf3\xf1\x9e\xe0\xd5\x80\xdc\x16"\xc0\x8b\n\xcfpO^\x8d~)]T\xd9\x80\x9af7e\xd8\xce\x94\xca\x90\x0fK\x01\xe2bB\xa0/\x01\x84N\x82\xf7\xeb43\xb8|\xda\xdbY=3\xf2~o)0\x80\x8a/\x15\xa4\xffB\xe5d\x9ea\x95$\xa1\x92\xd3\x18)\xc0\x06\x80\xf1Hd&\xf0\xaf\x10\xe8O*?E\xd54m\x15\xa6oW\xec\xdf\xb8\xbd\x99\x1a\x1c\xbe[)4\x08\xb2:\xfc^\xdfx\x80\xed\xfdrZC#\x9a\xc6\xed\xb8B?\x00#@\xfc22\xe5\xfa\xe6\xc3@\x7fL\x06\xdb]\xdc\xb0\xc0\xa9_\xc1\xef\xc6\xd0\xd8\xe1\x14\xb8T8\xfb\x901\xde6\x1f\x81G\xc4\xef\x87\xbbY\xc8\x05\x027\xd4\xa4"C>7]>\xd9\xdd\x04T\xed\xfff\xcc\xbf\x05\\\x1dP\x12\xbd\x00o\xfa\xa4\xaf\xda\x7f\x12:\x89+qU\x82X\r\x88\x1b\x94\x8d\xd6\x86\xd8\xe4\x1bl\xa5\xe8\xfc\x10\x15\x95\x1d\tx\xe8$O/\xb5\x87@\xfa\xb0\xd2\xa7\xc60s\xb6f0\xad\xb1f\xee2NM\x9b\xb9x\xdb\xac\xd0f\xe6k\x10\x16\xbb\xba\xba@\x06\x84\xaf8\x9aA\x02\xa1`\x13m\x1b\xfc[\x17\x13g\xef\x19\xb7\x1f\x1b\xc5y\xda\xb0\x15pNz\xa6\x82h+\x93\x07j>1\x19Q\x8f\x0c\x87:"\x84\x13\x86\xc3\xac\xe5\tF\x8e\xb9\x04N\x17\xb0@\x194\xdb\xb8_p*%\xc1\x1f\x13\x7f\xfd\x9bt\x89\x86:f\x84<y\x07\x17\x81\x1b\x0c8g\x14*\xbb&pGf\xf4p\xf65l\x8emH\xf0w\x89F\x05\xc21U\xc3\x1cf\x9d\xbb5\xfcq|\x7fX\xcf\x94P\x83I%!C\xaa+P\x169\x0b\x90k\xea\xe4]\r\xa9\xafR\xaf\xeb(\x8c\xe5\xe1\xfa\xfcN \x9cN&\x95\x84\x8dP?\xbf\xfeE\xa3\x94\x073\t~\xfe\xe9\xf5/\xf0\xe7\x05\xde\xef\xfc>\x1c\x7fg\x94\xd7\xe8\'\x06\x82\x10M\xe9\x0c\x86\xb0 \xdc\x943\x00\x02\x03C"\xa7\x01\xa2\x04-)\xcfE\x11\xac\x90\x8dw\x97\x1b\xb3\xd3\xa0e\xccm\x01(Z\xb35\xe9\xab[\xe1X:\xa20\xb0y%\xa1\xe1\x91\xae\x8f<0\xf6v\x8d\xcd\xbb\x08@f\x971\xb8D\x13?\xc9\xb1h$\x14\xee\x93\x93\x9at\xea\xef\x0b\x88P7\xac\xb9\'\xe8\xef`\x9f\x82\xecG\xf6)\x0b\xb2\x7fa_\xb2S\xa7\xd8\xe7\xec\x0b\xf6?\xac\xeb\x14\xa7\xfcVM1\x80\x04*\xa0\x94\x0f\xd2\x1d\xbc\xdd?\x9cZ;\xa8\x8d\x19\xe3\xcf:\x10\x06Rr\xaf]\xe4\xcdA\xbcp\n*\x90\xc7\xb2k\xb2]J\xa9\x8a\x0c\x16\xa9\xc9A\xfe\xba4\xfe\xcb\xfb\xda8\xfb\xe4\xf4\'\xe8\xe4Ov7\xcc\x97y4\xeb\x99\r\xc6\x19\xb5\xb1vv\xe6\xa4\x9aa\xf6<\xbbest\x90\x9d\xfb#\xa8\xee\xac\xc3\xef{MA\x9ed\x87J\xbf\x9c\x04\x14\xc7`R\x8d\x9d\x89\xcb\xb7\x80\x98\x91\xc2\x98"\x87\xfb\xcez\x85\xd03\xab\xc6\xe8k\xa3pG\xcf<\x82#\xd2\xe9\xb8\xbc\xdf+\x18w\xf3|I\x10\xfa\x00\x83\x9d\xfbc\xfd\xfe\x1dcs\xe6\xfd\xde0\xad.\xa6\xca\x11\xac\xbf\xb8\x8bp\x02\x90Y\x9c\xc2\xc3\x84\x07\xf42\xa7"\xd1\xe8\xc0\x12G\xd8\xde\xa3\xa7pB\xf6\x8f\xde\xc1\xd9\xd8\x87\xd3\x82\xc7\x13\xb9*\xb7\xe4x?\x1a{\xa9p\x96\x9d\x06%Y\xf9\xe7\xa71\xa3\x1b\xa9\xc0\xafMs|\xd6\xaad$\xa5\xab\xb7\x0b\xba{\x14\x00|\xca\xe9\x9et,v]\x8d\x0c\x9c\x8e\x0c\x80\xd1E\xc3\xd2\xc1\xbb\x11\xe85\x1eo\xd7\x07WOC\x0ex\xf4z\xfd4V\x030\xf8AZ\xb9D\x0e\xfe\x19\xcd\xe75\xd0\xd3|)\x9f\x89\xcfs\xe2\xf3\x0f\xd2i\xa0\xfc\x0c\xff\x9c\xc3?\xf0\x9b\xaf\xe23\xf1yN|\xfe\x01\\=\xa0\x8bd*\xaah\xf6\x99\x1d\x1a\x83\x05\x80\xcb\xb7\xdb\xc1K\xccP\x88\x99\xd0sC\x90w{\x87\xf4)\\\xa3\xbf.M\x8e0O`\xe5<\xa8\x95GW\x0f;j\x15\xe1\x1d\xe2W\x1b\xe6T\xd8&G\x01\xb4y\x07\xe5\xd0\x91\xe6M\x08p\xd8\xb7\x0e\x85\x17\xda\xc0\x81\xe6L\xa8:\xf5\xeb\xd2\xbdw\x90\xa3<1\x97\x86\xf9\xf7n\xa7\xd5)-q\xf2\x08\xa4]t\xa4I\xc2\xbb\xa2p\xc5\xbf_l\xea;Z}\x04\xd2\x1b\xafW\xec\xa1=\x90\x96\xa4c\x00\xcc\xfe\xbe\t\x11![FY\xc7\xf3\xf4\xeb\xa2\xbf\xf3x\xfeQ\xbd4\xe9\x0cE#sl\x9do\x9e\xf3\xf3\x9a\xb7\x8f\xef\x97X\x99\x9aN\x86\xc1S\xc9\xa9>\x94g\x8c\xf1\x9a\x04;y\xf1\x16\x0e,o\xea&\x1av\xc5\xa11n\xe7H\xdd\x13z\xf6\x15\x84\xfe\x04\xec\xb4\r\x1b\xe1;]\xa7\xcc\x04\xa8t"*%T\x1b9z\xb0v\xb8\xfc:\xa0\x012\xc3\xb8nV6\xa4n\xfc~P\x83\xb3\xb7]\x9f\xdfG\xb8\x80\xbd\xe4\x83m\x87\x8f\xb5f\x1b!:c\xb0\x8a\xf3\xad\xc7\xfbgV[\x99\xf0\xc2+i\xbe3\x13\xdaBg\xf7\xda\xf2\xf1\xec\x88\xb3\x1b\x9d\x19z\xb6\xc8\xd9\x9e\xf6l=%\xaa\xce\xdc\x90H$\xa5\xed\x98\xc8Z\x98\x92)@\xd1\xd55\xe0"\x9d\xd7\x00\xb4\xd31\xaa\x97\xee\x1cW\x86\xc4\\\n\xd0\x99Y\xd0\xe7\x9e\xa0\xbb\xa88\x84\xc7\xb3cH\x18\r\xab\tQ\x85\x9d\xce#V{[\xb2\xed\xf6k\xe8\xb25\xf5\x904\xb5\x8d0\xda\xb1\xf9p\x1a@W\\\xe2\x81\x89G\xb8ik\xa1$]\xe0\xedzv\x9d\xca\xfb\xfbXC\xe2\xb44\x91\xed$\x9a\x86\xd9\xb3\xf2\xd1\xf6\xbc.\x8b\xe6y9/0f\xc8fZdgg~w\xb6M\x84\t\n4\x85\x8bf8\x1e\xe9\x82\xed\x97\x87]\xec\x03\xd0*h\xcbq3\x9a\xea\x0bA\xb8N\xb7Y\xd3\x99\xbf\xd2\x85\xc7\xdf~w\xd6^\x97\xa7\xc5\xbb:O\xbb]\x9fr\xae\xb3x\t\xa3\xa9D\xd5m\xf7\xda\x17U\x08\xae\x8e+\xb7\x0f\xe7\xb7Ph^\xaer\x8a\x9aQ\xcd{\xa3\xca\x13K\xb7\x8e\x89\xbdMI\x00\xaf\xcb\xf9\x184\xa5>\xa4^\x92\x0c\xd4k>\x81\xacdz\xc7\x1cy\xe5\xbap\n\xfc\x10#W\xaa\xacyjJb\xe8R\xc8\xbc\xfb\xc4\xbe\x90\x13%\x1a9\xc1(\xd3\xe21^\xb1\x93\x15\x16I\xca7\x13\xac\x07\xf6\x9bES]nrg\xaf\x1f\xc1\xb7\x9eY\xd3\x073\xbc\xb4n\x87\x87\xd5\xfa\xf8\xb8\xc8^\x9b\xf2\x9c\xcc(wMva\x92R\x9d\xc1\xac\xb3h\xbcS\xecQ\xd3\t{\x07 _\xf8\xf0\xea\x10@\xa3Gt/\x19!\x9f\xb6\xe5\'N\xdeU\xa4\xfa\x14\xe7\xee\x91/\xb9\xcb\xb7\x99\xfe\x05\x8c\xd8\xb5\xd3\x965\xac\xc0\xb2\x97\x89\xa0\xe8\xbb\xa2\xd4\xd2\xe10\xdetC\x18=\xd9\xde\x95\xba\xc5\xcfz\xe1\xaeQ\\\n\xdc\x94\x93\tt\x03\xe0\xf0O\xb6+\xd2\x0f\xe2\xe7\xd1\xe6\x8a1Q\x0c(\xc9\xa4\x9a\xe4\xf5\x9a\x92\xf4\x15\xfdp`}\x80\xdb\xc1t\x01<\x8bD)o\xfdA\xc1\x18\xba\x1d\xb0\xb1\x11(\xc3\x9cz"\xb0\x90\x03\x86\xe8{+\xfe\xe9\x82\\ \xda\x7f]\x95\x93\x11P8\xcf\xcaCj2\x94N\xc6\xc0b\xc1u\xbd\x85XbN\x961Or\x95\x9f-\xb1\xef\xaf^\xa6K^\x9f\xbe/\xd8\xbcX\x9f\xac\xb1\x84*LIM"y\x97$\xea!\xf4\xde@\xcf\x95\xf9\xfd\x08\xa4,\xb61\xe5\x81\xaa\xb5\xae\x81\xca\xec\x8f\xa2\xe3\x80\x1c\x1c\xb0Z*)\x87S\x94LA\n9\xd8\xc8W\xcd\n\xddY\x14k\xcc\x7f:^NY/\xcb\x8d\xe9\n\xbf<\xf3\n\xdaD8W\xa5\xa5n\n\x84\xfc\x89\x07\x06=\xda\xb3\x86F\x99\xb9\xbd\x0b\xbe\x85\xb0\xb4\xb5\x9a\xb1*\x13\x1e\xa4D\x8a\x80\x0ci\xb2l.\x96\xc0$\xe1\x1c\xe2(\x9e@J\xa7.\xa8\xe9X\x84.\xba\x85\xe4\xec\x8a\xbd\x16au\xec*V\xe1\xfe\x15\xf6!|\x83\xac\x92\xdf;\xb0\xb0\xda? \x14\x08\tp\x12\x8d\x07Ng\x84\xf5\xcb\x1a\xc2n \x8cD\x93xdQ\xb7\xa7$\x87\xads4\x8d\xf1\xfb\xc6;0\xe5U=3\xe6\xd5\xa6\x87`\xdb\xdd\x12\xf8\xc2\x9d\xec\xe0\xcf6\xc1C\xdc\x9e\xdc\x06y\xc9{\xe4\x9f\xa7p\xcf\x06\xc7\x91r0s8\xbfS\xff\xf91\xee\x19 \xeb\x17{\xb0gN\xd5\xc8\xeb\xa9\xe9\xbe^$T\xe2\x02\xa6\xb4\x01\t\xa5]\x8b\xe2j\xe4\x10\x91L\n+\x1a\xb3\xb6I]\xc3\x8aIT#\r\xca\x8c\xb8\x08\xa5 \xc4\xec\x92\xea\xe5a\xa3\xf8\n\xc0\x8f\x10\xdaW"[\xa5:I\x8b5E\xd4\x9b\t<-!q\xce\xbc\xc6\x805\x91\xb9\x1d<C\x93e\xf4\xac<\xab\xf8\x88\x14\x9d\x8e)\xbb\xd9\x87\xb8\xd6\x9e\x00\x93\x10\x12\x96\x93x \xf3 \xde\xfbcQ\x8c_\xcf\r\x7f|\xee\xcekZx\xd3\xe3^\x85\xf0R\x02\xe6\xba\x0b5Q\xd6\xe2\x042\x15\xad\xecz\xd2\xd6\xe1\xc3\xd7GO\xc7\xfc,0\x89\x91x\xb6\xee\xdd\x04\xba\xc9\xc1\xc7\x1b3\x05\xef\xb9\xe9X\xed:u\xad\x8fo\t\x1d}\xc8\x03\x13\xbd\x8a\xd6\xc5H\x98\x84z\xf3\xcbSRS\xf5\x92\x17\x0eZ^x`\x08h_\xffJ)q\x9eW\x84\xe2QM\xa3[\xf8EH\xd1\xca\x8e\xd4\x80\x0f\xab\xef\xe8\xa3\xf9\xbcK\xd7\x14,M\xca\xc9\x01."\x1a\x13\x05\x84.Q\xddj\x92\xad\xb3SG\xcdq\xab\xb1s\x9a\xdfR\xc69\x9f`4\x98\xa9a*\x98D\x84\xbd\x00[X\x0f\xa7\xf9\xad\xb5\x1c\x8f!\xbb\x8ah\xce\x8a\xff\x0f\xb2\t;\xe6DM\x01\xe4#E\x84`\x12J*\x10\x86\x93\x08\xa7Z<\'9W\x9f\xdb\xfc1\xd1\xec\xd9\xe17\xd2S\x12\xb0:\x08\xd9Rc\xdaA.\x17\xd0Q:\xb8\x05\xbd\xa1\xc7\xc7B\xe4\xc0&\x8d\xc9I\xf0\xa31\rPM\xba\x1f\xcb\xd4\xf8\xe2\x88\x1fH\xee\xc1\\\xff\xd6\x825a\xe7\x1d\x86tz\x81l\x9bFe\x8dg\xef\x8c\xfd\xb2=$\xefA1NX\xe5\xf5\xfe\xffG\xc1T\xb9\xe5\xd6\xf2\xbd\xa5|\xc8T@\xbc,\xa5\x8e_\xddrK\xf9.\xd8\xab\xcf\xd7 \x96\x18w^c\xa6)\xd888\xc7fD0\x8cNE\x93\xfb\xe0&\xc4\xab\tx\x90\xb0\x9e\xe9s\x8c\xcd\x95o\xd7\x82\xc4\\\xa2\x82\xda^\xe6\x7f\xc2Os\xb6\xed\xbd\xb4o\xb5\xb3\xc7s\xf3\x1fi\xec\x80\xa2l\xaf\x8c7\xd3\xf6\xd5\xce\xf7\tj\x8dH\x87\xf9\x07\xc7\x0fF\x03\x14\xc5[\xf7\xe0\xe5, \x103\xff\x08\xf7\xe0\n\x05\xfa\xa6-\xf0\x06Z\xbbT\xebr\xf9\x98Rm\xbb\xccZj\x97@\x074\xa5S\x1e\xeeV!\xdbf\xde \xa6S\x91\x14\xb5:\xe9\x1a|\x15%\x10\xe4Ke\x13_QS\x94\xf5\x9bJ\x9b./{T\x88?8\xb1\x07\xf3\x87&\xcd\x85Q\xc6\xdf\x9d\xd8L\xfc\xcfM\x04C\xb7\n\xf6\x11%\xb3t\xe2\x06\x84\xb1\x04\xde\xf7;\xf1\x85\xb6\x957\x1f\xd4\xc6\xea\xa5\x9f\x03Z*\x1d\x19\xe0/\x84\x1a\xd3\xb3`y\xf6\x0b\xa1n\xec\xe0O\x84\x8c\xcd\x95\xc3\xfd{\x9e\xf7A"\tq.\xaa\xdct\xc7}{b\xe7\x9b\xce}\x95\xff\x81dsb\x02\x96\x11\x93=<\xddj~\xdb\x14J\xdc\x0c\xba\x17[\x93\xcb\xe2\xc1\x94\x9d\xa4R\xcaDX\x8c\xdb#\xbf\xbajM\xf2\xf8\x8b\xaafibJ\xaf\x1c\x1e\xe0\xc1\x1b\xce\x87\x10N\xc2\xba\xf4\x8b\xbcU\xb1\x0b\x84$\xd1\xce\xa0YYk\xbac\xeb\x14\xd6/\xc8\t\n\xe5Q\x80\xc5\x82\xa9\x93\xf0\x9d\xe1\x93R\xc0?\x8b\x8fK\x01\xc7\xc2\xbf_\xec\x17~N\xb4\xdf"\xf5e\x8e\xef?<\x1e|\xf4\x1b\x12<w!\xee\xce}\xa4~\xdbf\xaa\xf4|\xad]\xbeM\x97\x86"Cm\xa7w\x91\x9b\xb6U}\x07\x00\x8c\x0f5\xf8m\x0b\xaf\x85\x05%\xef\xeb\xac\xa0\xef%\xb7 \xf4=\\;\xa9\xe6\xdd\xe7\xd4\xf8\xdc\xa5\xe595\x7f\xf2\x12lz\xed\x9c\xd4R\x92\xb9\xb6\x07\xe1\xc1\xf3\xd6\x99\xf6V\xd8\xbc7w\xba\x12Sd\xcdN\xd2\x01\xfc#\x0f\x8e\xdf\x88\x11*\x03\xd64\xf7\xe1\xa7\xcfm\xa3\xb9\xfdh9\xe4\xc9J\xf8]\xb4\x90\x08\x03t\xb9\xd2\x98[\xf3\x15\x1d\xdan\x9b\'%\x81]J\xf0\xc4\xcc\x96\xd4\xfb\xa8\xd9gt\xeb\xcdyK\xdbH\xed\xbc\x11\x0fyP\x9e_q\xbf\t\xe9\x89\xe0g\xa7&\x8e\x98\x9d\xa4\xdc\xf2\xe2=O\x05\x82\xaa\x04$RkD\xa6\xcc\tld\xb91\xba\x16dN\xc0Gj\xc6\xa9\xa9\xd5\xc9\x85|Sd\xd6\x8d\xe5\xe7\xf5\xe9\x19$\xf1\x00~\xef\xf5\xa9\x0f\xf4;\xf0\xdb\x9d\xae\t\xea\xd3}\xa9g\xdevx\x7f\xcb\x86\x1d\xedg\xf7-\xd47{\xebb\x9bfo^u\xdb\xd9?F\x03\xa2(\xd9^\x07T\x99\xfc\x80\x14|\xf0?\x94\x83W-\xfd\x12\xb4/\xbc\x80\xcb\x8bk\xbd\x9d\xcb/\xa2\xf6\xe2\x15\xa9\xa9\xeaaWC =\xf5\xca\xd5\\\xc4\xc8l\xd5\x8bo\t\x81y\x85\xa2s`\xdf\x05\x86<\xaf\x8c\x9c\r\xa13\x00\xa4\xc4\xd4o\xf4\xa2\xd1\xbb\xf6\xb6V.\x08\x03b\xbd)\x95\xdb\x01\xb7}z^\x81\xef\x97\\\xbb\x7f\x06\x9e~\x83_\xbc4\xdfK\xd2C*R\x85\xf70vI=\xce\xad>\xd9\tW\x8c\xcd\xda\xaeg\xcc\xd0S}\xf1\x94\xb5\x93\xb5xa(\xe5\xa9}\x80k\xc3\xe9\x94\xfb\x1a\xda\x1cY\xb3^N\x93\xfb\x16HI\x90x\x9f\xe5Cp\\\x15\xff/(\xbbN\xa9E\xc1\x06_6C\xbc\xd4HF\xfb\xa9\xae@\xf7\xc5\xd3\x9b\x80r\xd1\x13\xd954\xb0\xcb\xf9<\xa3\x14\x8d\xca\'"\x88\x9b\x85QT\x88\xeb\xde/P\xc1\x0b\xef\x8a\xc1J\x95X\x84\x17\xb7\xb0\xce%|\xa8\x86\xf9"\xbb\xa1\x0ct\x01\x86\xcd;\xc5\xf5\xd6\x92\x95Q\x1b\xad\x97\xe7)\xf8\x89\x174\xf5b\xfb4\xce]\x07>\x80\x11\xc0\x99?\x83\xf1<C\xc2\x071\x02\xe7\xd0\xb3\x98-\xfb?\xc8\xd8\x83\xed\xd75.\xf2F\x10\xe32\xb0_\xdb\x08&tW\xd6\xc2$\xa5\xf6\xf6\xc6\xf0\x0e\x90^\xdc\x807\x1f)\xf3w7\x9f\xda\xefk\xb0\x87}\xca\xae*Z:\xee\x7f\x87\xf3\xa9\xfd\xec\xc6\xd9gz\xa4\xd7\xfa\xd2\xc9}\x91\xd3\xe9\xa5\x93x\xa8\xe3p\x82\rPR\xe2?\\\x9dT\xef\xd97d;\x05|O?;\x05Y\x05\xf4\xa3\xcd^Tzd\xc0\xfd\xe2\xa5\x16\x7f\xf0\xbf\x8e\xa6\x03\xc1\xad\xf0\x06r&\x8f\xd1\xa4\xfba\xb3\xe9\xd5\xaa\x00?\xcb\x13\x90\xf6;\xb7\x0f\xd2E\x9b\x00\xb7[r\xb0\xd7\xf1\x9d\xb1\xa3\xe5;M\xd9\xf5\xff\x02\x7f\x1f\xaa\xcc',
+    "/icons/icon.ico": b'x\xdal[eT\x1cM\xb3\x9eeaqww\r\xee\x16\\\x03\x04\x82\xbb\x84\x84\xe0\x0e\xc1Y\x08\x04w\x82\x07\x87\x00\xc1\xddY\xdc5\xb8Kp\xcfBp\xf8\xf2\xde\xdfw\xe6\x9c\x99\x9e3==U]\xd5\xf5<\xd5}\x1a\x00@\xff\xce\xff\x0e\x10@\x03\xdc{\x03\x00\xd1\xbfr\x84\xc6[EL42\xb4\x7fELe%9M\xe0\xff\xea\x80\x00\x14\xc8\xbf\x9b\xb1k\x89\xd5\x7fON\xaeo\xb5A\x93\xf9\x9f3\x00\xc0\xbb^YNZ\xdbk\xf9t\r\xb9\x99C\xc7[\xe8\xc2\xb2|q\xca\x9c]\xce\x92X[N\xfe\x1d\x8e/H\x8e@\x00G\xbe\xa6?\x98\xb2\x00\xb7\x9fL\xa0&7\xbf\x06\'~\x11G\x00\r\x0f\x1f]\x86=\xa8$\xb7\xa6\xdf\x8fL\xe5}\x9fy\xf4@8e)|\xdci\xc2\'.\xcac\xe1\xa4nr7\xbb\xee\xe6D\xec\x1c^\xee{\xb3\xe4;y\x92.`\xd7\xb1\xfb\xd2XT\x94\xa0@fS\xf8\xff^RJm2\xd4\x06\x0c;\xc5\x0e\x1f\xecD\x06\x85\xad$\x152z\xc7\x85c[(R\x1d\x06\xcf\xebw\xd0N\x9b]\xc5\x1cgc7\x9c\x06\tW\\\x0eO\xc4\xf4\xde\xbe8\rot\x1a\x8b5\xda\x0c\x16\xcd\x9c\x9b\xd1>\x8c\x1d\xbf2\x99\xd9\xa0\xb4\xd1\'\x7ft\xb5\xe1\xf1\xd9LU\x8f\xdat=|ye\x15\xf5!\xd3\xde~%\x96\xbc~g\xf9\xb4\xd9P\xec\xaf\xf5\xa0\xca\xca\xe5\xa2\xe7j;\xa5\x90\xcd`\xc5\xb2\xcb\xa4\xe7*\x13\xc7\x19y\xd3\xce\xd7\xd3f\x071\xaa\xd9\xd8\xa7\x15\x97\x1f\x9e\'\x8b\xb1\x94\xcb.u\x9e\xab\xfc\x1d\x9d6dB\xca\x1b\x1bm\x94\x0f\xf5;\x8e\xa7\x8bu\x94\x0f\r;POq\xfe\xef\xfb\t\xa7^\x06bT\xa9\x9d\xe49\xe7\xdf$\x02\xa5\xc4\x1c\xd7b\xdb\n\xbbn\x1c\x06;V.\xc3\x0e\r\xa9\xd2L%\x9b)\x03\x93c\xfd\x95D_@\x87i_V.G<\xc5\x8b(\x91\x8b\xce_\xd7Qr\xd9\x0e\x16,_^yRdw\xc2\x89O\xbd<\x04\x1f\x9f"\xf9%c\xbd\xcd\xc4\xd6\xe7c\xe3\x1awf=\x1f?\x89u\xae\xc7\xaa\xd7\xef\x9c\x1eR\x0c6\xedP\xff\xfal\xf6m\xddW\xb9uPR}\xdf\xdfS,;I\xe2\x86|\xd2v\x10^k\xe7\xe5 f\x9a:`7s\xed\x9fK\xc9\xdc\xb4S\xe2\xe9\'l\xd2{\xbcr\xf9\xd5\xd3\xaf\x902G\xb5\xcbW\xc6s]\xaf\xe8\xc1\xcfBtrt\xe5r\xdb\x1d3\xec\x87oW\xf7\x10\xa2\xa0g\xafS\x92\xe0\xd4\x99\xcd\x17\x93\x1f\x94\x0bN\x83\x05\xbfz\xaaQ\xcfR\x07:m\\\xa8S\x04GTf..\x9e\x059D\xd1wdOo\xf5\xc5\x9e%8\xa2\xb5f^\xa8U\xaa\xd4\x95\xa3\xf6\xf9No\xdf\x8au.\xc7N6\xeete~\x14\xed\xa2\xfcg\x9c\x9b\xe5\xcb/\x9e\x8f\xed\x94/\xbfb\x9d\xeaw\xc6\xea\xa7\x02gc\xe13\x9f\'\x1d\x07\rl\x1e\xf5D9M\x077:_\x8e\xf9\x03\xe6c\xcd\x1avVO(\x9e\xbb\xb8\x9f\x9e\xe5O\x85\x99\x1f\x1e\xb3\xae\xba\xba\x02\xd3b?\x8f9\xcd\xdcM\xfc\x8c\x86\xbf\xdaiw?\xcbE\x9fy\xb8\xdb\xf85\x15\xda\xef-\x18\xc6yxy,o\xa6\xae\xea\xf2\x01\xe1\xb8\xfa\xae\xf4\xe3\x82\xc3\xa0\xa3\xcd\x97\x9d\xfb\xc1\x86\x9d\x1f6\xf8\xfeu\x94/\xf3\xb1N\x1f\xd1\xe1\xab\xf5S\x96YM\xeb\xaf6\x83\xd19\xad\'^\xdf\xac\xee\xb5\xc3\'\xec\x02\xeeF\xcd\x04%o\xbb\xb136\x1e\xf7\x84F\x89\x7fu:\xdd>t\xbd<te\x9e\x07\xdc\xb4\x8ds\x05\\F\x9d\xf9v\xdd\xcfUe\xb8M\x88\xfch\xb9\xe8Ao{\xf1?_\xe8z\xf6\xb8\xe9:\x7f\\\x08|\xd2\x83S\xbf\\R\x8f\xc7\x05\\\x15\x9cem<\xac\xdf\xb4^\xc68\xf9\x15\xdc\xdd/t\xad\xfb?\xd7\xe5<\x95\xdf]\xc6\x05\xae>\x9e\xbf<;\tM\x88\xc3\xc7\xce(6\xee&>g\xd4M\x88\xfe|\x88\xa9\x9b\x94h\xbb\xdb\x13\xeaZz\xea<\x7f\xd9\x0f|\xfet\xb3\xfe\xf28\xf9\xc2\xff\xf2|\xfe\xb2\xfe\x1d\xfe\xf2\xd4\xf5\xb2\xf0\x942\xf9|m\xf6\xd2 \xd6\xb5\xc13!\xbc\x13}\xe6gv7\xa2\xd7\xba\xf1\xf8\x9f\x98\xdf\xceE\x9eU\xcc\xee5\xe1\xa7N\x81mb]n~{|96o%\x9f\xae\xce\x84\xfc\xf7H\x16\x0e\xb2:w\xc8\x9e\x8a\xcf\x03\xce\xdcr\xec$.#\xd4\xf9\xcd\x9e\x8e\xf4\xdaD\xee\x9eo\xba6\xd6\xaa\xbc]\xfd;\xcfW%\x9f\x0e\xd5\xdb6\\\xa3o\x02o{\xa9=7\\\xe2$\xdc\xb2\xdc\x9e\x7f3K\xda<\x1f\xe6<\x97\x8a\x9c\xd6\xffj=\xfe\x9b}\x9eI~s\xb6\xfc|v\xfe\\)\xb2\x15\x82\x9f\x11x\x1b\x16h-\xf1\xb7&\xcec\xe1\xb6\xa1\xca\xbf\x82<\xf6a\xbe\xa9s\xce\x7f\xe3u\xab\x9e\xdb.Y\xfb\'\xc7q\x1b\xe9\rU\xb2\x95!\xa0qj\xefS\xd4\xeb\x06Jj\xf5$_O\xa6\xd3\xb2\x0f\xf0%~\xaa\xb4\xf1\xed<_\xe8@\xd7\xe3h\x97;\xfa\x12]\xa3\xb0\xc4U\x1e\xb6\x00\xf5\xe3&r\xe6\x7f\x9a9\xc5J>\xdf\xee=\x9d\x07\x06\xc2\xb7\x89\xbb\x9a\xbdG\x8d\xd6g(\x02n\xb7\xc6\xeb\xb2\xaf\xcb\xf7\xaa^\xee\xab2\xf5\xfe\x19f\xedX\xf2\xe9\x97\xa4\x03\xd6\xeb\xab\xa9\xbd\xf4I?+x!\xf3\xebR\xef\x1e\xfc\xec)\xf1S\x1bu\xbb\xe7?\\/\xb5\xde\xdd\xe8\xa6S\xe2\'\x16\xd8vT\x17Pd\xfe\xff\x04_\\\xfdg\x04GG\x97(#~l\x9f\xa9/\x19\x83\x92\xcf\x97k\x0f7m\x1bO\x19\x1d7\xebm\xbe/\nB\xad\xef\xea\x1e\xce\xda\x84|Oj\x14o\xd6\xfe\xf9K\x9d\xf7\xea\x0e\xd5\xc2\xbf\x0e\xeb|\x10\xbci\xdf\x7f\x9d\xf9\xb0\xf1\xf2<\xfe\xfd\xcc\xfd\xc7^\xb1P\x87\x8d[\xc7\xb1I\xd5\x92\xf7\xfe\xf7L\xa3\xf5?)\xe3\xff\x9c`\xe7\xecE\xf2\xf6\x8b\xa4u\xa5\xf7\xb8\x9d\xa0P\xdb\xd2x\x86\xff\xdf\xa5\x1f-\xc7&\xe7\xcb\'\xb5\xa3\x9ckw\x9e\xab.\x83gY\x9d\xbe?\x8d\xd6\xca\x1eN\xb0>7\xcb\xc2\xff\xf3\xbd\xb5\xf3\x8d\xcb\xd8\xcf\xf6\x8e\xce_\xc8\xf9o\x9a\x07_g\xacl<\xff\x1d\xf7\xa8\xf2]\xdbc\x12jQv\x8b\xb13.\xf0\xddp\xf2\xf1\xaf\xb03\xf9\xd9\xf2\xb7\xa1j\xcdx_t\xc1@\xe4\xef\xe7\xc0\x9b\xcfmp\xb1\x8dq\xa7\x00\xf8\xdeM\xc0\xf9M\xeby[\xca\xb1\xd9\xcb\xfdZ\xc3\xc6\xa9\xe3g\xbbJ\xcf\x86\x9f\x02\xffu\x9a^%_\xacKGS\xe7uE\x9b\xdd\x9aS\xd7S\xab\x9b\xf0\xfe\xb7*\xbf\xdd\xb3&\xe3&\xdf\xff\xbc`\xdd$S\x84W\xaf\xd2\xaei\xcd\xd3\xce\xd1\xab\x97\xdc\xf3f\x97\xa2\xa9e\xdc\xa1\x15\xde\xcay\xe3`\x9a\xb5\xf1\xe4\xf0\xef\xd5\xda\xf9C\xe7\xe4\xd8\x7fM\xb79\x06\x98$\xb9\x99]F\xea\xd9W\xba\x17\xbd\xf2x\xf1\x9d\xf4x\xa0\\\xb0\x98\x18\x8b;v\xe7\xc8\x8e\xfbtf(~\xb3/\xbe/\xb2\xe6\x16x\xee\xbb\xb1\xc2s&g\xa6\x9460\x84\xd8\x08\x80\xbd4+MM\xdd\xa7\xe5\xc7\'\x03\x9f\xe1o]77\xcf\xbd\'}3~\xfc\xf3\xca\xf1\x9c\xc7\xe1\x1c\xfeI\xdfux\x86,\x96H\xa1\x91\xf0\xe7\x96Q\x93\x0c\x93\xcfk\rF\xb7T\xad\xf2\x87[\x86%T\x95\xe3M\xa7\x8d+\x82\xa9]\x8f\xbb\x99\xa3&g\xae\xafz7\x02\x9e5S[\xb5o\xba\\\x96FM\xff\xbe\x0f\x8c\xb3l\xb5\x80\xbfL\x9c?N\xacN|?f\xab\x1a\xdf\xd0k\xee!\xe4\xfc\xdb\xf4\xb2\x86\xac`\xcda\xbc\xcb\xa6g`@\x9c\xdayU\xd4\xb6\xb0b_\xa7\xd6\xf4l\x8d\x14\x81E\xa9\x16\xa42\x01,\xde2\xa7\xab\xd9R\xda\xa8\x05gZ\xcf$#^\x98s\x1e\xd25\x17\xee\x93\xfcY<\x18\xb7\xe9\xbdU{\xc9\xbc!\xc9t\xa3\xbc\xe3i\x18o7\xbdYn\xb2B!\xb0\x92\xcd\xafb\xba\xf8\xfc\x01!\x15\n2\xae\xa2\xdc\x10\xcc\x0c|\xde\x0f\\Wv\xb0\xbd7\xf5=m\xe8)\xe2rK\x1f-w\xde2x\x13K\x1b\xb7\x18B\xdeO\xf3G\xad+\x01~ d\xe3\x9d9\xdal\xbb@QU!\xcb4f\x11F\x99bT`6v\tM@-7y\xdao\x15\rS{\x89\xfe$^\xd02\xe9\x7f\xf6\x0b$\x92\xf3\xf2\xb8/F\xfe\x18\x84\xedg~C\xb5r\xb6~\xd3\xf9\xb9\xee\xd7[1\x0fO\x9a\x95\x98\xd3\x91\xb3\x82\xaf\x9a\x93%\x7f\xd3\xbev\xcf\xc3\xf9Nz5\xee\x1e\x06l\x8f^\xc4m\xb1+\x87\xfd\xdf\x8e\x920;\xc8\xed\xf3\x86\xd5M)\xcd\xe7\x7fW\xebU\x9a\xef\x01\xcc\x11ZX\xab\x97\xcf\xefsl\xcc\xc7;\xee\xc6\x9dLA\x01F\xf7\xc6b\x9ed\xe9\xb0=\x1e\xa0s\x0e\xab\x0f\x8c\x00\xfa@\xd3%\xcdDzt\xec\x16\xce\xb5\x07`\xfeS\xeay\x7f/)\xe7\xf1\x03|\x97+\xb0E\xe4\xb2\x0f?\xb3\xebi\xa5\xebT*c\'V\xac\xb2\x17\xcd\xf4\x9f7\xb8\x93\xf5\xe3*RL?=\x85+\x8a\xe7\x83=\xce|7\x1e<7\tO\x00aD?\xf0Y\xc7E(\xd7\x893Rn\xe2\r\xe0\x93\x16w\xee{\xfa\xf0p\xde\x15\x88\xcc>\xad\t\xb5 \xc15G\xb3\xfc\xb3\xaeS\xe53\x87\x15\xe7\x8c\x15\x8d\xb6iUS\xfd\x8a\x87A\x8a\xe8\x02Mb\xcb\xaf\x1a-\x10\\\xeeGL\xff\xa7\xe9<\x89\x1f\x10\x88"`\xd9\xcf\x08\xbe\x03\xfd\xf2\xdb\xf0\x00-<\njL?\xae\xfdml:\xadDN\xdb\xf7\xe1~3\x08^\xc7\xc0\x98\xbe3\xe9R;\xe7\x032n\xfc$\x05CCc\xbb\x97U\x89$ \xe4\xe4\xa3-\x94\xe8N\x97\x9dpQ\t\xc1Z\xbbO\xad\xe9\xc8\xcd\xd1\x0f\xee\xa6/\xc8|\xc5o2\xe3N\x9b6:}1{]\x1c*\xbb\xcf\xe3\x1bk.]\x99\xf6_\xef;\x9bM\x1c\x92\xec;cW.\\#\xd6\xb9\xa9e\x87\x1d\xbb\xbc\xa5\xa1\x06\x88\xa5\x0e\xa9\x8c\xe36\xae)\xedzW[\xd7\x01\x16\xb0\x9f{ \xa3\x96sy\x83\x82\xf3\xc7\x0c\x18\'=\xbe\xbe\x18X\xb8\xde\xad2\xe0\xe9x\x1cK\xecd\xeau\xdfd\xc0\xdf\xbaW\xe6/)\xce\xc7 \xc2\xd7,g\x94\x9c\x94\x00\xfdyP\xf7\\/\xc7\xa7\xdbh\x15\xb4\xbaK\xa1\xbd\x9d6\xc89B\x15\x98 -j\x08\xd0|\xaf\xbbj\xba\xa5y\xdf\x14\xf8\xd0D\xd8D\xa4G\xfe\x99\xf8\x86\xc0\xaa\xbf\xa2\xff\xdb\x9e\xbec\xc5\x7fP\xb5v9\x01\x0f\xe5\xf2\xcb\x83k;\x17=\xedH>[\n!\xa7\xad\xfe\x90\xb8.=\xe3\xdb\xc0\xd6\xcbh\x11\xbd\x9e\xd5\x12\xfbz\x90\xdd\\\xd3\xbc\x86\xb1\xb0\x9d\xdd|\xe1\x176:\xeat\xef\x1f\xf8\xab\\\xe2\x1f\n|^\xc0\xeb\xea~=\x80\xde\xa3\xf37!\xce\xaf\xd0h\x919\xc7\xcf\xf5f\xeds\xd7\xc3\xda\xf8\xb4"\xf5Z\xcb\xcc\xfau\xe5g\x0f\x8c\xb9\xebf\x85\x85\xbd\x0cu\xd1\xc3B\xac\xf2\xeb\x8e\xae\xfb\x9f]G\x9d\xc7\xeb\xbd\xf4;\x12<\x07q\x81\x8f;\xdf\x91\xf7\xfe\x99N\xe7\xb3\xe9\xc2_\xa1@\xb8\xd0\x9a\xc8*\xb9^\xbe\xdd\xa5\xd8\xb9\xdf\xbe\x98\xd8\x00F\xa8\xe4QIAF\xd7mT\xd7A\x1a\xff\xf0C\xec\xe7\xf6\x027f\xd7\xc3\x16\xc8\xbeK\xf9\xf1\xee\xa1\xcb\xea\x7fAk\xaf\xc2\xc9\xdfN\xe8\x06\xc4\xd0\x86EE?9\xe4\x8b\x18v\xccOLk,N\xee6\xb8f}\xfb,K\xf5\'\x9e\x10\x1fH\xc2R\x08\xb9\x13\xbfi\x99<E\xd4\xce\xff\x95\xa8,\xc6\x1b\xc4J\n\xe5\x1eoJ\x13\xc1\xc6\xbb\x19\xf0\xe7\xa8\x94\xebR\rb\xa7\x8f\xe1\xc7\xef\xd1\xf6\xce\x94\xc1\xef\x06\xb8\x83\xa7\x10\xad\xdf\xfc\x17m\xdc\xdc6\x9fX\xf5\x1d> hq\x03\x97\x9b\xe7\x87V\x15\xdf0\x98\xd2l\x91\x10\x19\x1a\x14\xc9l\xa8H\x80_\xf1\x06rGF9c"L\xf2^b\x8f\x1c\xd9rP\xfd\xfc@\xa5\xad\xad\x7f\xc6\x0c\x05\x19s\x86\x1ex\xb2\x19.\xfaT\xf9\x9f\xda\r~\x13\x9a\xf1\xeb{j\xdc#jgd\x08\xa0\x92M\xfc\x92\xe8\x0c\xb1zCD\x7f\xf1DP,\xc1\x84\xa3f\x0e,\xa8v\xcer\xf2r1\xe1C\x85f\x94\xe0R\xdc\xc40\xf3r5h\x05J_F*\x14\xf5a@\xa8\xb3\xa67\x0eo\x18\xdf\xdbU\xac\x91\x9aT:\x10\x03\xd6\xa4\xba\x18\x84L\xd5\xcc\x9b\xd7c\xfb\xear\xe1\x9f\nn\x10\x18\x05P\xf2\x07k\xd6\xf8\xab\x94\xbd\xb4\xbd+Y-b\xd9d\xd3N\xa7\xf2\xce\x9a(\xa9\xb4zq\x0eK\x19\xf5\xd2\x89\xdf\x13O\xc4\xf6\x16\xed\x7f\x1f\xd8m\x7fK\x10\xc3\xb5KZ\x99\xf3\xd9U\xdeb:\x89R\xbb-\x90\xbc/\x98\xf0\x1bR\xfa\xba\x87;\xee\xaap<\xdf\x8b\x98\xf1\xcco\x06\xe4\xd6\x8f\x98\xb9M_\xce\xed\x1b\'gZ\x15&X\xa9\xad\xc6\x9c<\xe8gns4\x7f\xc0U\x93\xcaR4\x03p!\x97\xad\x0b\x1d\x95n|LP\x9c\xda\xa7"\xab\x96\xec\xee\x06\xe2l\x90\xb6\xe0\x13G\xe6.\x02z\x95\xf2\x19^\xcb\xc5w\xeak\xd3\x9b\xd6\x85\xc8\x9f\xf28\xa8/WJ\xf4\xe3\x19}$(^\x91j\x1c\xcd\xac\xb3\xbe<$\x8aT\xde\x1f~\xd0^\xc9\x13\xb8\x92G\xbe\'\xac\xd6\xf5j\x9c-l\x1e\x90\xe1\x85\x8e\x0c\xe8\xd1\xee\xdf\x8d\xbb\x96\x9d\xa3\xa5\xe3H\x0b\xbd\x07\xe4\x9av\x95~\x96\x08\xda\xa4\xf9\x95\x8b#\xba\x0e\xa9\x8b\xec&sV\x87\xd8Y\xb9\xe3\xc7\xd6\xe32\xc0^\t\x81\n-\xd1\xaf\x8e\xdc\xef\xff1,t\x0c|\x80\xe9\xbb\xb0L\x82J\x1d\xe0\xb6\xb9\x84G\xf2\xcd\xc2\xe8O\xe4y\x9d\x06Fn\xed%\xe1m\xfcQ\xdb{\x0c\xd0\xe3\x87\xa7\x08\xa6$;u5\xbcZ\x11\xd6\x00\xa3j$\x01\xd5\xdb\xd2\xf3\xf5\xa7\xb3\xcfN\xeb\xcf\x7f\x9b\xaa\x08"Il\n\xaf\xe9\xb6v\xef\x96C\xae\xa2\x04\xe5\xd0Z\xb2\x02\x9f\xef\xbes\xd3\xe5R\xc1\xd3\x06\xb5\xdd\xd8\xb8\x91r\xf3D\xf1\xd3\xa4\xe8\xb6\xbe\xf8\xb2G\x93j\xd8?\x8e2\x9c\x15\xaf/\xb7|\x97\xfc\x8d,y0\xcb\x98\xb9\xfe!<\xccly\xac^\x15[\xae/7\xcdQ^$\xf6\xf5\xdf\xc5\xcaV\x8c=:\x8c\x94e\xa6\xf6\xab\x02\xea\'k\xe2\xe0\xc8\xa5\x0f[\x19\xffl#``tw_\xe7\xd8+\xbe\x0b\x9f||\xfe\xaep\xb1\x89,y\xfb~X\xb6\x1bHkt%6\xbd\xca\'F\xa2\xa2y\xbb\xb9\x87\xde\rD\x8ew\x99\xd4\x19\x1b_\x9e\xc4\xdf\xbe\xef_\x92\xce\xcc\xc46\xe5\x85\x0e=F-\xd4#\xb8l\xd7\xa2R?\x1d(~\xde\xfb2\xc9\xe8\xa2\xd1\xc50\x078\x85\x90\xec,\xfe\xfb\x01\xc7p\\\xf5@J-\x02K\x08Z)W\xaa\\@\xf8\xc2\xd6C\xea\x83\xf4\x1a\xf3\xef?\xf1[$3\xab\xf8\xbf\x9ca\xdd_>\x01\xfd{z\xb87\xbd\xa8\xa7\'x\x1c\xc9\xf3\xc1G\\\x15\x96\x9d\x12\x10\\\xec\x08\xcfx\xc9j\xbf\xf0\x03\xd1\xbd4\xcb?\xb5o\xff5\x98\xc0 \xb4\xbb\x14n\x8a\xfe _\xcd\xa2,\xc7 \xbaBE\x9f{\xc8\xa6\xc8<}\xf4\x8f<|L\xfd\x9e\x8e\xce}\xc9i\xb0\x0e{\x05\x19\xff\'r\x95\xf1\x1fe\xda\xeb \x8f\xc2\xb3\x19\x88^KPk\xe4x\xe5n\x97\xaf\xd7\x8c\xd9\xc6U\xb1P\x0c\xcd\xb6\x92\x16\xae\x90\xa9\x81\xbaL.v\xedaz\n\t\xa0\x06\xf5d\xd5J8d%\'\xb0\x80\xd4o\x08\xeb\xbe\xf1\x86\x86\x8f\xbb*_\x8dr"\x80\xa1\x7f\x02\xc5O\xe8\xbcog\x9d\xbd\xd73\xdbZv\xad\xea~4#\x13\x86\'3s\xed\xfbr\xec\xc3P\xe8\xfc\xf9 \r\xaa>\x9f\xc4s\x13\x142\xe4\xb8\xbc\x87U\x04K)\x87\xd9Q2%\xab\x19k\xd8\x19\xc4\x9c\x97\xefSS(\x7f\x9fs#C\x97\x0c\xa2\xa3\n\xf3^a%\x82>d\xbe,\xd3\xde)\xeb\xd8b\x0bd=\xbdF]JU\xa9\xb8/\xc3\xacD\xb0KC}w!\xad*0a\x9b\xb8k\xa3U\x81h\xcar\x12$\xa2\xdak\xac\xeac\xaaO7\x81\x1d\x1d\xb4\x18\x0b\xdbT\xfa9\x9d\xf3\xb4\x94\xe3P[\xb9\xfe\x0fi<r\xe4[>\x7f\xa80|\x11l\n\xe6\xe3\x0f\xbb \xd0\xdf\xaf\x81x\xd7\x97\xef\xc8\x9d\xab@\xefrIaA\xa8S\x07o\x9c\x7f\xbe\xe5SVk\x9a\xfef\xaa{K{\xb4\x8d\x9e\x98\x9b\x11\xf6:\x0ed\xce \xd0c\xd3\xf2\xdc\x87XB\xc5\xaf\xa6\\\x9e\x88:\x85Q\xf2\x11\xcd&\x9a\x7f\x86a\xbbe\x04)\xbd\x01\x15Q\xee\x9d6\x13\t`Q\xb4\x1d\x8f&\x8f\x96\x1a"b_\xa1\xc8\x8d\xdb]\xb2\xf8\x86\xceki\x17y\x10\xc8\x88jZ\xf1I\x15K\xe0\xc7\r\xc5\xb7\x05s\xdf\xf41K\xd4\xfc\x1cI\x0c\xa2\xa1\xacIW\xda\xf5\xfbR\x86VGV*.\x9b\xa4\x1f\x03\xf2\xb2\x16\xc1\xd9!\xe1Y\xb3l\xbeT\xfa\x99\xb0L\xf0Q\xb9\xfa?\x84\xa0\x8c/\x7f\x8f\x83\x13\xff\xbb\xa9\x98\xe7\xcb\xe0?VO\xf9\xb7\xe8(\xe1\x86\x07\xf2\xc4\x94,\x8a\x0e\xfaq\xafIGY\xd2H\xca\x0bnV\xfb\xf3\xc9SH\\yM\xaf8\xa2O\x9d\x81"\x92\xeaJ:PJ\x15\x0e\xa0\xe1\xad\xdc1%D\xf8\x1f\xaa\x98\xb5\xe6\x834*\x98\x08_\xd8\x1bpY\xbfS\xdf\xc2\x90\x07\x08%f\xe4\x10\x8e\xbe\x15\x97\x1bF\xf3\xbfcbP0/\x00\x03\xca\xbe\x18\xb2O\n\xeb\\\xe7\xac\xcc?P\x95\xa1S\x88\xdf\xdd\x98j\x91+\xc5?@r\xf3\xde#{i\x0c\xda\x91O\xfe^z\x8cHC\xc3I\xf6m\xd89\x1aw\xa5\x1fP#\x81\xd2\x8aX\xe3iN>\x07S\xfe\xde\x8ctS5b\xd4\x93\x9e*\xbfZT\xa2\xbf\x0e\x86\x16\x89\x94\x16\x10\xd4\xb6Xh\xe1"\x9b\x87Sh\x0b(\xa1\x88\xf5 Z\x03\xb4Y(e\xd1 ?\xbfx\x1a\xf3\xe5G=\x87\xc1\x1fkH\xdf\x8a\x89\xae\xcc\xad\xcf,\xf2\xf1\x0e\xe1M&\xf0\x15{\xd8\x8d\x87\xd2\xd0\xc3zS\xad\x8b\xb2\xad\xd2\xf1\x7f)\x9d\x19\xfbH\x19\xc3~\xc8\xde~\xe2k\xd1\x17\xd5^@\x9c\x81\xf5\xfb\xbf1\x10\x81\x98\xf6\xedx\xaf\x97\xfa\xd9\xb9\xa9\xa6b2\xfe\x11\x17\x85\xe13\xb4\x03{\xb5Q\x01\x95-M\x8f\xaa\x0e\xcf\x05\x91\xc3\xbf\x85\xb2KH\x1b\x02\xbb\xfe\xe1\xe6\x08?\xf9$\xd9\x86v\x9b^^\xdes~x\x98&l\xfa\xf3,\x96\xf0MK2(M\xf1\x99\xf5\x17\xfb|`"\xaa\xf3E7\xb2\x93f\xd3\x86\x1d\xd3\xa0m\x060\xc0\x90iW\x98\xc0\x94P\xd6u\xd7Z\xd3\x12\xe4#\x18\xa0\x9d\xdexW\xa1(\xfb\x04\xe8|Aa\xb68$\x81\x1et\xf9\xf9\xf3bk\nWcM\x8baD\x82>\x90\xebO\xf7\x9a\xc9H\xb4\xcc\xbe\tl\xcbS\xb6\x8al\x85O\x823\xd5\x92B\xd7\x0fdk\xee\x8d\x99ER\tx\x1a\x96!\xdf\xa0A.\xc2\x9c\xfc8\x83es\xd8\xcd\x11\xe1\xb0,\x91\xbb\xd5\x06\x1f\x14\xfa\x98z\xb2\x9a\x9bQ\xa9\xba\x85\xf6=\x81\xb5\xe2\xb8\x0f\xf5,\xb4q\xdc\x00k/b\xb4\x92\xb40\xc8\xad\x8e_2\t\xdd\x90i\xc5!l\x04\xf8p\xe7!0_`\xfd\xde\xbeo\xd1\xd9\x00\x9d\xd1\x06\xb6\xc0!(y\xa3\x98\xaa\xcb\xc8[5Kc\x8e\xd6\xbco\xdbg\x04Xp\x80\xa4\x02\xa3\x08Y\xdcP\xdb\x89\x14i$-\xfei\x83\xbbb\xea\xa8\x1c\x01\n\xc7\xbcH/\xd7\xe5\xb4\x87\x9a\xf3\xa3\xbc{%\xa5,V\xd4\xdb\x87\xa2\xdf\xcb(\x01!`\x106\xda\x96]\xf5/\xc1\xd8\x9c\x02\x80\xa2\xfdy\x8d\x9b\xb1o7\xd8[gC\x10\x8c\xbc\xe3\xda\x12\x119S\x8f~\r:\xf6`v\xa6\x84s\x94\xd6\xa1(\xc1+\xcc\xb3~0\x96pn\x94\xde\xbf\xb8=n\x01H\x89_\xb3\xa6\x01\x08\xb3\xf6^VR\xdc@\r\xa3\xb8j+\xdf\xd2\xe3W,\xad;\x91\x0f}LPra\xcf\x1b+\xa5;`\t\x12\x80\xa1\x9d\x93aj\t@\xeci\xa6o2\xf2?\x1b\xd6\x19\x93W\xbc\xc2\xc9\xcfrE]w)\xaa\xce+\xa6\xfd\x9b\x9c\x8f!\xec@\x8d\xc2\xe2\xa1\x9ff\x95\x12\xf7zF\xe9\xa7\xa6i\x85h\x1cb\xe1\xdf\xe3\x83\x0fO`p\x01\xb3\x14?\xde\xb4\xa3*+w\x0e\x1f\xea\x1bL\xa9G\x80YZ\xec/5\x1bxq\xee\xa9\xf6\x12^\x98c\xfcm!\xf0\xed\xcf"\xb9A\x02CX\xe3\xe9\x81\\\r\xd1\xdb\xdd\x81\xb9$\xa7D\xe2\\\x85\xe6\x9aF\xddI\x9f\xf9\xbaV\xe5\x01\x1c/|\x9a\x16\xaa\x01%\xfa\n\x1dp\xee\xd9\xbe\xb4-\xa4\x8a\x18"\xf5D\xfch\x89-\x97\xd1\xf2bv\x11L\xec\xee\xc1\xd6\x8c\xe2\xcf\x99\xca(i\xea\xe3\xc3Fr\x94\x1b\xc6/;\x8ab\x1f`4\xf3@\xce\xa4L\xbcA\x066w\xea:\xf9\xc8\x85\xee\xa1H\x10\xdf\x1c\xf4\x93\xbf\xeb\x145W\xea\xbd\x1ek\xd1\xef\xdaU\x96_\xe6\x80?\x01g\x1a\xcf\xb1S\xa1J\x0f\xb0\xa9\xcf\xd8\xc9\xd0\x12\xd6\x17\x16\x98p;\xfbb\x0e\xf0>a\x89\x1e\xe4\xbe\x05\xd3<n"\xb6#\xdc]\x8e\x99x\x803v\x13\xb7\xb0\xc9\xd9\xc04\xe3\xfd\xbc\x9fE~\xf9\x1f\xb6\xb4V[UJ\xd5\xb9\xfb!H\\\xa9?\xf8\x8c\xcf\xe1a\xd0l\x97\xff\xa3G\xba\x85\xcaj\xa4;2%\xb4A\x1f\x18D(\xd8\xf2\x8d\x1d\xecI\x80\xdc;\xb1\x8d\xbb\xb7z\xf8\x05\xe5ay\'\x1d\xfc[\xf5\xd4X\x14l`\xeeVg\xe6,\xce\xc7\xdb"\xb3\x00V\x1d\xcd\xf14 1\xeaA\x17\xe3\x17\xb5\xd3\xbf\xd4R\xd0\x85\xbe\x87P\x01\xc2=S\xae\x9c\xba]\x0b\x8bf\x91d\x82\x86\x08\xa8B\xd1\xa7\xcc\xd1`H\xcd\xa8H/C\x84S\x1b\xf9\x1f\x00\xe0L\x1b\xff_\xb6x\x10O\n\x98\x9f\x97o&\xe3\xcc\x94D\x1a\x12\xfd\x8e\x9f\xac\xfa\xe8FD\xd8,C\xf6%\xc5s\xfe\xad\xd8\xa9{M\xd6Q\x82\xc2\xb2u\xedpha*\x99\x14\xe2\x1fs\x80\xcdP\x11G\xa3>6\xf07=\xf5\x12\x0f\x16\x8d _\x10Q\x16\xb5\x13\x17\x83}\xb4\xbf\xcfE<)\xd4\xba\xb3\x17\xfc\xd4w\'\xf7\x12J\xa4a\xf5\xae\xa6\x88\xea~*\xcc\xd3\x7f\xbb@\xdc\xd5y\x86\xd7U\x1dg\xba\x04\x14\xcd\xaf\xf2~A\xf2\xd4F}\x85!\x89\xc0j\x97\xcf\xa0\xfcG\xb6\xcf\xd1\x1b\x1c\x1c\xbe\xcd\xab_\xea\xe7#\xd0R\x10\x0c\x9c\xcb\xab\x9b^3\xd2>\x8e6\xf3h\xc0\xd7Wk\x1eJt\x91s\x16\x92\xa1\xde\x81:U8\xd6;\xe9\x02:l\x9e\xd2&\xd4\xfd\xa6?\xc2L\xca\x97+\xc3\xa87\xfc\x8f!\x85@\x87\xe8\xb4\xe1\r\xaf\xb6Tk\xc82\xbf\x0f*cD\xe5f+\xa1l\xdb\xfe\xa5\xdc\xea*\xd3\x82\x13$\x7f+\x7f\xe4\x88\x14\x98\xc6\x95\xfd\x04\x0c\xb8m;\xaer\xe7\x885\x99Vp\x9a\x99RK\x191\x12\xfa\xc3Ua%\x8b\x05\xef\x94\xf6d(l\n1\x99m;x\xd7\xef\xc8b\xf7rH`\xff\xc5\xf1\x89]E\x8d]\x9d\xa0\n\x13\xda>\xd3\x15\xec\x8f\xf1\x99\x89\x7f\xd7\xd5\xaf\x96\xadJB\xa5\xf9 \xce\xd7\xee\xf4\xdfM\xd51\x97\xdd&_\xff\x18\x19\x01?\xcf\x05\x7f\x86FFF\xff\x83\x9e\xf2!\xa6O\xb5)\xc3R\\\x81w\xa3b\xf8\xd0(\x8d\t4L\x00|\x91m+\xa9\xed\x17a\xcb\x1f\xf2\x1f}~\xd5/\xf5\xbe$\xa3_\xb6Z\t\x83&#\x08\xe5\xf9<\xffs\xb3\x88\xb6b\x10X.\xd2I\x8d\xfc\xc2\x94\xc3-\xce\xea\xe2?j`\x1cJ?\x1e\r\xcc\xb7\x9d\xb5\x1e3\xd9i\x15\xe7\xd0\x08,~3$\x9ez\x0e\x17\x12\xd9\x89\xe6ke\xd15\xac\xde\xa6\xe9\x99P\x81f\xfeU\xf1%\x11\x07\x97p\x83\x18{\xb2\x97\xd8\x99E\xdc\x9f\xa7\xe3\xfc~\xd3\x9b<\xfa\xa3\xa2\xa4\x08\xdc\xbf\xd9\x93\x8a\t\xce\x8d\xfd\'\x1e\x8a\x06\xa5\x9a\x1d<\x8f\xbbb\x93\x1a$m\xefO\n\x95\x0eI\xd1\x0f\xf4\xe7\xf0\x06i\xe3pv\xa0\xa8\x02\x19\xd2t\x84\n\\k\xec\x1an8\xd9A\xaf3w\xe5r&\xb8\xf3\xe9\x94s\xa7\xf8L\x8e\xb8q\xe29>\xfez\x05)\x8b\x7fO\x8a\x9c\x8b\xa4e\xc5\x1c\xc3?\xf3U\x8b#v\x03\xd0\xe8E&HN\xb8 \xf2x\xb6A:R\xe5\xc5\ri\x82G\xfb\x1f\xc8R/3$\xc6\xa3\xd2H\xb1$\x90\\\x93\x0b\xa2/R_\x18\x8e\xd7\xc6\xc1U\\~<\x16\xce\xb2\tqAel\x18b\x88\n\xeal%*\x03\x9f\x8e\xf7=g\x94\xe8\x1d\x84\x87\x97\xaa\xd2\x01\x19\xdf\x96\x92o\x10-\n\x86U(?\xe4\x1a\xd4\xd7\x86\xe3\x1e\x1c\x9c\x0c\xfc\xd8JY\xe6\xf2\xa3\xc1-|\x80\x8c\xe7\xbb\xa3:\nr\xdc\xbb<Y--\xb0\x9e\xdc\x0c\x8e\xbb\xba\xc4\xc3\xddrC\xdf\xe8\xbc\xad]\xb7\x9d\xe1\xf87\xd8Rhh\xe0\rq\xa0\xea\xcbou*-O\xdf\xa1\x96\x8d\xae\xf8\x91\x96\xdd\x14(\xad\x89 \x18"\xaf\xd0\xa6\x19s\x85\xb7\x8dEI\x0fb~\xd0\xd0\x97\xe5\xcbP\xcfG\x1aq\x88})\x19xS~\xc8\xa74\x8e\x7fFUJ\nj\xda"\x88t?\x85\xb5\xf8@"UXa4\x9a\xafG\x98\xf9\xae\xc60+\x8a.\x8fq\xa8\xc2\x82\xc3\x9e}:a<\xbf\x1e\xc5,\x14\x84B\xa2\x19&6\x03\xd7\x9d\xb9\xcao4K\xe7e%6"\xab\nA\x7fy\xd5M\xe0\xfd/\xaf\xa8\xc7e\x02\xf8\xbb\xcaQ\na\xc86U\xc2%}4\xa4\x81\xe1\xba0\x0f\x0e\xe1po\xf3\xf1\x1e\x94\x91U\x92\xfd\\F\x06\xcd\x0c\xdbL\xab 5h\xa6\xe0\xa8\xb2\xec\xa7\x01Jx\xba\xebw\x8d<\xe77KZ\x027\xb9\xb7\xd0\xff&\xc3\xe0(0D\xcfu\xef},\x0b\xc2HVD7\x0cB*\x9b\xd7\x11r\xc8\xc6\xa9:E\x88\xc8\xb4\x99\x1b\xf7\xaa\xe9\xfe\x94\x07\xcc}7\xac\xea\xdeo\xc2\xec@5<\x11x\x88\x85\xb8C\xb9j\x85\xec\xeb\x84D\xb8\x88\xab\x8d\x06\x95\xe4\xb71\xcdZ\xbb\x89\xf5:\xdbtK\x16a\x94>+^\xfb\xf4\x89Q)l\xe3\n!\x94\xb2F-\x16tx\xaf\xa6\xf4mI\xb1b\x95\xa3\x05@\n\xcb\x14\xb5\xb1\xe55E\xf9\x93\xfdvf\x0f\xcbgn\xd9\x1c=JM?\xad1+a\x15\'\xba\x8c\xdd\x0ch\x977\xa9\xc7\xc63\xc6\xba)g\x02\xe8\x16\x08\x04\x99/{\xe3\xae\xe3/o\xcd\xf6\x99\x12(\xfb=\x8f\x8e\xa9\xabEz{7%\xfaT\x9b\x8d\xac\x91\x10\xf8\x9a\t?\xba\x9c\xb6\x9dw\x9aL}\r\xc1*\xd3\xe7\xc0w)L\xb8Gi\xad\x82}j9s\xaf\x80\xe0\xc8\xdc\xca\xa3\xc9<\'4\x13ou\xdd\xbf\xed\xa9f@\xf8\xee\xb5\x1d\x91\xd9\xdcl\x838o\x97\xbf\x80\x95\r"\xc8\x0c<\xf7|\xb4[\xa5\xbc\x0e\'\xd3Y\x96\xce\x14\xbb\xa7CN\xc7MdG\xa4\xb83\x0e\x90\xe6\'\x8bacon\xf8]\xa0]\xe6\xf7\x0fH\xf1\xba=\x8e\x8d6|\x92\x1a $\x0c\xaa~\x95\x1dY\x9a\xeey<S\nq\x12\xf7\x07\x9c<X\xe1\x15\x81\x1fm\x10\xf4S\r\xbaW\xf13w\x81\xd6\xd0\xc5G\xdb\x97@.\x80\xc0s\x82\xca\xf7d:\x13\xa7^\xa4w\xefl\x94\xd7\xf8\xe8\x10l\xddC)K\xa8U\xa6\x9c\xf05A\xc10f\x11\xee\x9d\x97I\x12\x19\xf0\x1e\x80IJK\x82\x10\x0c\xe1\x85\x9dx\xde\xff\xcd\x81\x8b}\xcdE\xd7p\x88\xb1\x15IQ\x82\xad\xead \r!-\xfeT\x8e\x91\x01\xf99\xb6\xab\x06\xeb\x1fW[\xcc\xfd\xcd\x99\xbdr\xc3+\x00\xc8D;\xb5\xbb\xa8\xaeK\x14+\xc4\xeb\x13\x14\x8e\xe8Av\xef6\xe8\x889\x83\xfd\x94>\xcfl\x1c\x87\xebY \xe8\xeb\xb5#\xce\x84\xa7C\x80\xde\xe5\xfb\x0f)L\xf7\xda|}\x90<$p\xb3\xbcX\'\x89\xb1\x96\x9f{:\xf0\x8e|\xd6\xe3\xafo:3\xce\x12\xd4\xa7|\x94\xfd7\x87\xd7\x9f\xa4\x9c\xd5P\xf3\xb2+1L/\x92\xad>q\x14\xef\x85\\n\xf9X\xe1\xedp\x97\xd08\xfe\x84\xc2\x82\x9f\x1bz\x95\xaf\xec\xe6E\x7f\xdc\xf76\xd2}\x92?\xe0\xdeb&\xd4Gw\xe1\x01}t\x9b&y\xb3\xc5\x8c\x87\xeb^d\x05\xbb\x06\x1a\x9d\x06%\xbf\x92\xcb\x05#\xfa\xfa&\x8e;\xb9\xa1?\xe3b2\x1a\xda>\x9c6m\xfc\x16\x8bdK)j\xef\x07\x86:\xf6\x945<\x955\xfbmUa-*\x9c\x9d\xc9\xa2\xd81\x860w\xc4\x8b\xc8\xd6\xcf\xed\x1c\xab\x96-\x0b\x1f\xdd\x94\xef\xd9\xc5\xadT\xb2\xec^\x87\xcbqu\x00\xfcJ\x8c]\xfe\x03\xfbU\xd5j4\xf7g\x8a\x1b\xa8\x0e\xdd\xc9\x05M\x01\xa7a\xcb\xad\xe2\xbf\xe3e\xb7?Q\xf8\xcdY\xe52v\xe7\xcb/\xca\x13\xa1\xe6\x04\xcc"\x9d$\r\xbd+\x90\x1ca\xa9\xcb\xbcUSi\xa3\xc4\x1f\xe6-.\x9b\xfda:\xa7\x1a\xf1\x98\x91\xc64[_\xa3<\xe4\x14A>\n\xd1C\x1a\x84 ;\x83T\x9f\xd4\xd1\xbfX\xb99\x81\x9ai\x16\xedM\xde9\x17f}"E\xe5\xb1\xa3\xedb\xb4\x8d\xa5\x19\xb2;\x9eDo\xe9L\x04\xe1\xb0L\xeb\x182\xd08\x08-\x8f\xb9\xb9\xfdD(\x94(\xce\xa7U\x05\xfc\x91l\xed4G/\xa2A\x18\xc8`\x16\xc1.H\x9e\xc9\x1cV\x92fR=\x0f4H>@2\xc7XO%\xfd\xb8\xf2\x03\x19]uO\xc7\xcc~\x81Nt\x1e\xf6\xed\xabK\xe8\xa3[^\xda\x94\x89ID\x93U\xa4L\nQk.!\xf9Z\xf1\xbc\xadZ\xa5\xd8\xb5\xde\x17\xc2\xef\x19\x02M4sW\xed\x96]\xb6\xe9\x8cL\xeb\x08\xc4\xf3#\x85\xef\xf1-\xcf~\xbdq_\xa6\xd0!-\xf1\x1c\xe3\x19T\x9dCs\xa4\x8f\x10\xad\x12vhI\x89\x15\xff3t\xe666J\x11q/\xbb\rj\xbf)\xd3\xeb(\xb3\x8b\xa4\x7f\x0b-33J\x9a\xf7\xcbW\xc7~\x03\x1e\x12|q\xc8\x98]\x8e"h\xe2\xbe\x17\xccQ\xee#\xc5\xff\xbe\x16[\x90\xb1\xebs@\t\x07HR0\xa0Fq\xc9\x87\xf4\xe8z[\xfd\xab\x9cQLE\xbf06\xcdS\x12\x1atp\x11\x8dr\x93\xf5=\xdcX\xd8u\xc6\x10\x8b\xed\xb0\xb6\x84\xb4M\x0c\xd3\xa0\xaf\xa2\xd7\xe0\td\xaf\xbee\x1e\xee\xfa\xbb\x90\\\x10B\x89\xf5\xb8\x06F\xda\xf1\x0f\xbe\xed\x0f\xdd\xf0P_\xc3\xed\tJ\xb7\xe8^#M\x8f\xe1\xf3\xe0\xde]\x8d6\xf4&\xc9\xc1i\xaf\x18\xd0_?\x1d\xaa\x9f#\xe2\x05}4\xe9)\xb7n\xe0W\x9d\x0e\xde\xbd\xdc\xc3\xe8\xfc\xa6\xb41\xf6\n+\x01$\xee/\x1ff\xe3\x90\xdb^i&\xf1\xfb\xe1g6Y\xe5\x9c\xa7\xb8(e\x15\xcfP\x93\x12\xfa_\xbft\x0ey\xb5\xc9\x7f\x96\xc4\xa0\x99\x9c\xc5\xcbg\r47L\xa5\xd7bT\x19Zd\xd3\xf6\x8b\x9a\xdd\xfb1\xf2\xd3a2\x07\x13:\x0e\xd6\x19k\xfb\xf4\x15\xb4\xf2\x9b_\x88\xdc\xf0T\xac\x85\x94\x81\xaa\x81\x84\xef\x82\xf4\xb0B5\x85\xe2si]l\xafx\xbb\xeeY\x07\xd7\x9e\x8c\x1f\n\x97\xda#gL\xf4\nI~\xac\xc88\x98\x13V\x9e\xf0\xcdPE\xe7\xc7\xa1\xf9{\xd5\xfc\xa7\x9b\x8d\xae6\xabsyn\x9c\x98H\xab\xa2\x10/\xefv\xafo\xe5\xea\x03b\x19\xb4\x1f\xc1V\x18\xe6]V"\rMZ\xc4\x0f\x82\xcb\xf89\xb7}\xcd\xef\xd4\xaf\x96\x96.\x17\xac5+\x80w\xbe*\xf2\xf4\xb8\x9aHR\x8b\x8a\xf5\xb1%\xf3\x89\xc8\xc8j\xe4\xce\x0c\xba\xbev\x07b\xe6;F%\'\xda\xe4\xe9BH\xb0\x111\x99\x9e\xb0(\x9d\n\x1f0\xb4\x88\x8b\xbe"\xe6\x83\x15|y\xd5\xf8\x07\xac\x8a\x1b\x9e\x9f\x86n<\xc8d\x81\xa0\x14\x1c\x84\xcd\x82\x14F\xfb\x10-\xd9>\xb6T\xad\xac\xa4\x8c!\x96\x1d\x06\x8f\xac.Pv\xad\x18\x97\x95\xb7\x1e\x0b\xff:3\x08\x98\x13\xa92\x1d\xf9Y\xeb\x90P9\xa4\xc6L\xc6\xb0\xb054>\xa7\xa1\xca.\x00\x9eu\xd8A\x81\r\xce\xc3E\xb3\x08\xca1\xf5\xec\x9b[\x19\xe3\xfd\xe8_\xddE;\xcd#\xc5[\xe3\xdc\x07t\xe8\x87\xf3\xe3\xd8\x1b\x0fZ5\x97o\xfdM\x82e{s\x038y/\xb5\xb4\xa49\xde\xdf\xa0q\xe5mgV\xc5\xdf\xee\xb1\xbbr(\xf9.C\xbd\xd1\xc7\x18T\x83\x8aX\xd1\xda\xce\x9awb\xbfg\xceC\x19a\xe8\xed\xea\x05S\xf71Q\xe5I\x08\x15\x1f\xf6\x05\xe9If\xfd\xa3\xf7\x89&\xb3|0\xf4w\xac2=\xb0\x90\x07t^\xa1*\x8c\x06a;\x83g\x82\xad\xab\xcf\xd4\xa55H\x7f\x16\x8a\xcd\xe5@\x87]\xca\xb2\x85\xa1\xdd\xef\x81e\xb2\x9c\xfd\xa0\xa3\x01\xa36e6\x1fm\x15\x9b\xc3\xe1\xf1\xe2\xd3\xee6J\xc7\xda\x11/\x9b\x19i\xde~\x86\x1e\x07y\x93\x049\x110\xf4\xde\x12\x81\xe8\xf3\x84\xbe\xdf`0\xc4\x9e\xc3\xb6\xdfB\x93\xb5G{i\x0bx\x85\xb7fU\xd72\xc67|\xfe\x12\x1e5\xd4Pl\x8e\x96\x89\xdf\xbc\xfb\xb8\xf7\xddV\xfd\xcb\xa6m(\xab9[a\xeb~?FPG|<\xae\xd5\xf1\x8dx\xddE\x8bXJ\xe0\x9aU\x06c\xa9\x92\xbc\x11\xdb\xf9\xaf\xa7\x9a\x1b\x1e\x90\xa3\x14\xed^d\xb0y\xf3\xde\xf7)\xdf\xffV\xb5\xd2A\xfe\x18\xd0T\xf3\x03\x8cM\xf5\xde\x1b.x)\xe4\xb9&\x0e\xef\xb2\xe9T\x83\x1b\xf8\x18\xdf\x9aa\xb6\xca\xb4{I\xd4\xcd\x9f9\x1b\x026fo7TrnI+\xfd\x99\xf8\xb5\xb9\x95h\xda\x0c\xbb9?\xd20\xa40\xda\xbb0V\xf1\xd6=\xd9\x82\xab\xb7\xb4C0\xac\x9bD\xf0\x13|?\xc24\rC \x95U\x11=\xd7d\xea\x8afW\x1cY\x15=S";a#\xb6d\xfc\x93\xe4\xc3\xd2+\xe82;*\x8a\x89\xe05w\xf9gr\xaa/0\xe3\x96\xae\xa5\x07U\xf2\xb1\xd4\x07\xc3\x18\xf4t\xa8\x88\xc6wl\x19\xbe\xe9O_G\x00,\x84\xbdV\x0bO#\x8eQl\xebd%\x91\xeacB\x8c\xcd\x81\xd3[\xce\x87dQ}\xaaQ\xaaqq\xe4\x9f\xf9\r\xda\x13\x86\x89S\x9a\xba\xe1\t\x91\xa8\xfaY\x0b\xb0$\x95\xed\x89\xba[{\xbf\xbb})\x03\xf4\xb1\xaflB\xde\xcfB\x84f_\xad\x16\xef;%m\xb0T\xf62,\xb9\x04\xdd:\r\xec\xad\x85\xd1Q[F9\xdb\xdc\xd3\xbe\xc0%wH\'\x0f\xf8es\xbc\x07\xf2@\xcd)\xe6@5\xb4\xa4\x96O%\xbf\xc7-0\xe5f\xe2\xf7\xc7\xf7\xc3\xac.N\xbc\x08\xa82\xcb\xc4L\x18m\xef\xb1p\xde\xfa\'@\xf9C\xe4l\x11L\x03\xc316c\x8d[\x9a\xf9\x05~0\t\xcc\xca\xabt\xae\xa1\xfb\xaaB9\xbf\xe2!s\x9czmFI%\xdb\x0c\x83\xc3\xc5\xed9\xa5=\xc9\xf8\x82[\xadj\xa4\x1f\x89\x1b\xfa\xd2>\x01\\\xa0+\x17\xe5\x9a\xc1t\xf9\x06L\x95{\xad\x06\x07\x9f\xb3\xf2\x8b\x1b\xd9?B\xcc||\xdc\x88g]\xb5\xedb\xa5q5\xdc\x92\xdc\x08\x0b!\xca\x178^\nR=Srt\xc3\xaf\x8c[\xe1\xe6\xf9K\xb0\xb1\xb4\xa27\x06\xce\xc5\x1c\xf8\xa1B\xa1-28x\xec\xeb\x9fZ}\xb0\xb2\xc3\x84\xc3\x96W/\x0b\x0b;\x82~\x9d\xce`p\xe3\xc5\xcb\xbd0\xe5~\xc5\x9c%\x0eBf\xc4L*\xa3l\x13,\x85\xf8  v\x1d\x81=\xd9"@\xa8\xb1Hr\xef\x9d\xdeZ\xe2`\x07;\x0c<3\xa2\xf6\xbb=\xf8\xe2\xaaD$\x08GjHe\xd2^<\xde\x0bD\x10\xb2\x89RK<\xca"2\x0e\xcb\xab!7\xab%\xdeg#[I\xb3%\xb9\x13\xf1\xef\x8d5\x0e\xda\xf7#\xc6\xaf\xab"\xf7\xba\xb1\x9b\xd4\x08vx\x9e\xab\x820\xc0Z0gn\xaa\xe8\x82>\x1b/rA\xe6Zg\x15\xfcx\xae\xfad\xdeh\x8a\x03\xe2o\x15\x9d\x7f\x1b\xaa<\x12s\x0c\xa4p\xbe\xbb\x8e\xb0\xaeek\xd0\xb5\xef!q+r\xc7\x13\xdc\r\x11z\xd4\xd1\xf2BO3\x92\x81B6\xf5\x96\xf0\xf7\xb8R\xca\xdf\x14\xb1\xea\xca(\xa9\xed\xc3T\xc3W\x90Q\x94\xd0\x0cr\xefD\x94\xceQj(J\x1d\xcf\xb5\xa4w\xbfi\x95\x8e\x13\x17\x1bX\x99ghU\xbe\xee\x96\xe0N\xffoa\xb3\x03U_\xc4\xea}\x82\xcc\x9e\x83&\x9ez<\xd6\xd5:\x1d\xb1tiV\x9baLZ\xbd\x92\xb0a\x98\xa5\x17>P\xd1B<PG\xe8\x065\x10\xfe\xb4\x89S\xc9\xa1`\xcdRi\x96L; hW\xf6\x11\xac \xea\xdc,\xe8\xd1Z\x0cB\xbc\x1d\xf1\x1f\xf6\xe3Qd\x10\xafR\xf2n\xbf\xc35\xfc\x1e\x9eyb+\xfb\x01`\xf0\xd6\x9b\x83\x8e\xect\xa7rt\xcb\xbeN\xbe5\xef&\xfa\x00\xe9\xc4\x8e\x06\xebr\xe8\x18~qP\x0b\x12\xb5cD\x1f\xffje\x99\xc2:\x99\x17\x904&\xd8\x1e\xaf--RF\xbfd/\xc0J\xd9\xe9\x85i\xe4?\xe0\x87\x9f\xb6\xa3O2j\xdb\x8cz"\x1d\xdd\xad\xe6\xe8\x9a\xe4(\xdc\xa9\xdb=\x0c\x19\xc4qM\xe2\xb9\x91\x9b\xc2\xc8\xb2\xa3\x1ai\xe6\x91\xb6sCW\xd9\x1ew\x8e\xa9\xe7T]\xbc\x87 Fb\xc3\xd2\xbc\x1b\xa1A\xc8\x94\xee\x1a:u\x08!Vg\x97?\xf9\xc1j\x10\xd1\\\xca.\xab/\x86\xc6[\xf8\x9c\xa7\xdel\xb94\xc9\x17Ha?3h\n2R\x83\xa4j\xf4K\x1a\xe8\x9fR\xece\x84!\xac\xaa\xe3\xfcN\xb3\x87~\x95\x0e\xce\x999e\x13s\x85\xe1l\x98AB\xb9\xeeQ{\x899\xaf\'\x04\x89/\x99\x89\xa1\xa8\r)j\x07m\xfc\x1d\x96q\xaf\x1b\x936\xd3|6\x9c\xbea\xe4\x8e\x81h\xbd\xf7\x83@\x8b0\x01.\xc0\x01Y\xab\x0f\x91\xbbC\xa8\xe3P\xed\xfb\xec\x8d\xd08\x8c\x1b\x9b\x04\xa5\xba\xca3G5D\xde\x1cXi\xdcI:\x0b\x1e\x91E:U\x19\xeb&\xe9\x8b\x8a\xca\x99\xb0\x83oeu\x8b\xbf\x81\xc4o!\xd3\x0b\x8cN\xc7\x11\x91\x95\xb2/W\x8e\xe9\x08\x9d\x0bJ\xa2\x16\x99~\x9fP\x11\xecl\xf9\xe1\xa3\xd5\r\xf7\x8aZ\x0c\x19C&7\xbb+S9\xa2\xdam\xc1%\x1c\xda\xd5\x8b\xca?6\xa2\x9e}O\x86n\x9e\xe8\xcd\x83\xdd\xf7\x9b\xb5{\xb6hv\x05;\xa9\xd6\x93\xf1\xa1\x1a\xbe\xf4\x80\x98\xb7o\xe9\x1f\x85j\x8e\x90\x16\xb6L\xc1\xed\x8b_\xe3\x86l\x82\xbd9\x15\xff\xb6\xd9t1\xb7\xb9\x0b\xd9\x90\xe8\x9c;\x8f\x01\xef!\xbb\x8axQ\x0b=\xa5Z\xa96\x1f\xd5\xa8\xa3C\xbd\xecBl\xe5QP\xb9%\x82[\x15F\xb1\xf0sH\xb2\x91y\x13S6<\xd1Z k\x00\xee\x8aqh\xc2\xf3k^\x95Ah\x18\x95\xb8\x07\xe5\xdeUnd\xcb\xf7+&\x1f+\xba;=\xea\x00\xedIS\xbb.S\xacR?w\xe0\x12\xbc\x9dHPb*\x9d\t\x8a;\x83\xc7=\xaf#\x13$9\x87QC\xa71\x00PM\x172Q\x0bg\xe7f-^M\xedd\xa0}\x94\xbe\x8f~\x15\x12i\x18\xd5\xc8\xdb\x8c\xachh\x1a\xce z\x8a:b&\xbbT\x9a\x7f\xe2\xe7\x82\xc5\xcfa+\x0c\xa7\xd9~\x1aU\x1aUz\xcc\xf3w\xa1u\x1c^D\xd9G\x88\xf5\xbf\xf8B}2\xdf\xcb\x7f\xd6\x07\xa3\xe1\x8e\xf1\x1e\x9e\x86\xd6\xa1|(\xdbz\x15\xa4\xde\xad\xac\r\xd0\xdd\x81R\xc7\x8c\x1f`\x1d\x96e\xc1\x19\xb67cj$\x1a\xb2\x08\xb3\xc8\xa3\x80\xfb\xe3\x9d\xeej\x0c*7m\x03,\xd70&\x10\xaa\xcd\x11\x19W\x8fPh\x7f*W\xc1\xe0\xa0\x84\x87Q7\xe6\xb2\xe9\x9b\xaa\xf2\x92\xb1\xd0^\xac\xf5TZ \xd8q\x8bL\x8eVP\xf1\x1a\x1d\x03\xb4\xd3\x10\xbf@\xcf\x8d\xa6KK3\x00I/\x16\xcf\xdaWs\x9e\xa2\xdb/\x8a\x03sW\xe9V\x8c\xf0i|C\x8b\x00o\x1a\xeeb\x15\xb6x\xe9\x8e\xb1X\xc0H\x1a\x19\xca:\xb9\xef~C\xc4\x7f*\xbf\xab\x95\xadDea\t\x7f\xe7f\xe5\xfc6`\x02\x86\xc8\xc4\x03\xe5%z\x1dG;\xf4\x86\xd9\xe9\xdb\x07Z\x03kU\xda\xc4\x12\xfe\x1fJt\x899BR2h}dR\xfd\x1bq\xa8\xf0_\xa9n\xe4\x81Z\x96\x0b|\xb4#L)\xe5\x8c\xb8%{\xb8C\x0e\x81\x0b\x1f\xb4\xbaYkcE\xf8\x98m_;\xd7\x17\x8b\xd4\xdc%|\xa2G\xfb6\x8f\xb7Ve\x03\x18\x7fq}n\xe9~@\x08\xd24\xcf\x80\x86}\xcfD*A\xb3_\x15\xaa\x07i\xca\xaf\na\r\x17\xe9\x05KRy\xf5\xe5,\xf0\xde\xf8\xa5\\\xab\xaf\xb0Ep\xd8`\xd9\xffNtA\xc8\xa79Ue!\xc7(\x1b\x13\xdf\x8ce\\\xb3\xe0\xe0\x0fZ\xde\xfeB\x1b\xaf\x9a=\xe9\x93X"\xdc\xe8h\xa0\xf3cl\xcc\xbdc+b\x13!\x8b8\x11\x1dg\xa9\xf8#O\xfa\x90kQM\x9a\xaf0t?\x14\xb5\xd9\x89\x0c\xba\xf30\x134\x1e8\xe3NP\xbcZc\x10\xdf\t\x0c\x98,\xbb\xf8l"\xccR\x94\xd1\\\'W\x1cYh\xdd\xd0\xb9\x8e}\x98\xf7\xab\x80HY\xdb1\xb2\xd4NYM\x7f\xa6\x9btU\xc6b\x17;\xa9\xeem\x05(\x05\xc5=\xa8\x13\xa9\x13\x92\x05n2E\xbe\x8e\xa8|M,\xe0R\xf3\xa2\xcf\xa7\xef\xef;\xef\xb8Y\xef8\\*,\xf5\x90n{\x87\xfc\xbeA4\x9e\\\x19\xdaN\x16n\xc3Y\x90\x95\xe5\xcd\x9f\xaf\x0eh\xc4C\x80\xdf\xc5 \x90\xa5\xdd\xe4\x17bf\\\xfeK\x85\xf1\xe0\x06\x88\x16\xab~\xcd\x14\x97P\xe9\xeb4\xd4|\xc1\x8eS\x07\xa7cm\xfa2\xfck\x9c\xb0\x93(\xd9\xfd\xb8u\xb2\xe1\x01~\xc5wf\x9d\xd12\x05:\xac\x95h\xe6\xb5\xdd\x8b\xb9\xda\x01\x7fm\xe5\x16\xe7d\x82\x8a6\x10~\x08\xce\x0c\x10\xa9\xd3x\x17Wi\xe2C\xa4\xecj\xa6\xcb#\x0ej\xf9\xb86_\xb9\x95\xa5\x94\x10\xb5\xa0\xb5\xebo-C\x10\x14\x8aY!\xb9\xb3&K&\xc2cTv\x92<\xe6L0\x87\x0c${,[\xe3&\x03N\xd0\xdf~sDFC\xfb\x19\xdb\xd3TU<1[;\xfa\xa3\x1dT\xe6\xac)\xda;\xed\x87Z\x9a\xb0\x93\xd7\x7f;Q\xa40d\xe4\xd2\xad\xf90_\xf1h\xda\xbaO\x00\xed\xc5\xa4Sx\xb7wu\xf7\x18\xe42\x82\x08\xc6\xf9\xea\xe0pXn8>\xae\x9a\x10W\xe1\x88S\xc5D\xa1x\xe4\x90\x8e\xf9\xc3+of\x1e\x14\x14\x96\x0f\xcb\x14mN\xd1y\xba\xeca\x90-o\x0e\n\xb0~(\xaex9\xa5\xfb}\xd2J\xde\xe6\xcbd\x1a*\x13o\x15f*\x1f\xb4\x02\x17\xb1\xf0mF\x1c\xca\xfa\xb0Pd(\xb2x\xed!\x07\xcd\xe5\xb5\xb6\x8f\xc8\xbe\xf6x\t,\x89\x0f8\xb7 1\x0e\xa9\xa3\x11|\r\x99] \x104\xee\xf9C\xd8\'<\x86\xef\xb23g\xf8\x85\xa7(\xff\x80U`\x83I\x0f\t\x95\x13J\xaa\xff\xab\x1a\x1bp\xac\xc8\x8f\xc7]\x0b%J\x04]q\x07\xc1\x90g\xa5\xf7\x0f^\x93\x837\x05?<\xcc\xfd\xb9\xd1\xfb\x89R\x1f^\xd2\x15cx\xec\'\xf7M[8T;\xf8^q\xacs\x9cs-\xfd~2eb\x87\xd3\x9es\x06"%\xff+#\xd47f\xbe\xc6\x10L|\x8b\xf4\x12\x88\xb80\x86\x8f2$nPFp\x1d\xad\xed\x11#\xb9\xc9\xbd\xcd%\x87\x85\x86\xd8\x03\x98\x93\x8e\x81\x96\xd5c\x0e\xbb\x9d\x12\x1b-\xa9O:\x87\xc8`\xd7\x99\xbb\xe6y\xc4\x02\xa5\xd1^\xcd\x114\xc5\xf9+%\r\x02\x99\xdf\xdc\x93l\xac\x12\xef\xba\x97\xda\x129\xe4\xfa9\x0c}\xaa\xee\xb8\x895\x9e4\rke\xef\xeew\x15Jxe}\xe2U\x0b_\x1f\xdaJ\xfd*\xe0\xfb\xa39=\xec\xa9[\xd4\xb0\x9a\xa4V((kv\x12\x98l\xe3\xf6\xdd`\xfe`\xb5\x19dc\xa2\xf2-\x03J\x9bUXk\x94)(\x86\x83s@i\x12\x0c\nmp>P\xf2~+\xaf\xce\xfe;\x8c\x9d\r\x92{0\xd8\xef\xea\xa3\xec\xe72;\xab\xffz6\xc88\tA\x9e\xce\x85\xa1l\x00\x86^\xd2\x1eo_\x99"_z&K\x96\x86?\xc3\xbb\xc1\xae\xedu\xfe.\x01\xe9\xc1\x19\xf5\x0fG\xdd\x8b\xb7\xeeb\xc9\xaa?B\xf0\x88\x9a\xbc\xcaT\xc9\xfb\x94\xbe\xa4\xad\x96o\xdd\xa6g<\x86\xad\xbf\x80\xfe\x81\x15a8d@\xe6xT\x80\xb5\x97\xd7V\xa7\xfa:h\x8e\x9f\x8f\\\xb4\x95\xdc`\x07\xaf\xd1\xd6\x05\xb8\xc0yW\xa9\x1c\xbe\x85\xd0\xc6\x91Al\xbe\xe2\xb9\xdae0\xf1t~\xf5V3\x1cY\xea#\xc9\xd1S}\xd1\x0f\xdb\xde\xe00\xb2_\x144\x15\xe7\xfe\xe7\xbeb\x0bQ\xc3\x83\x04\x8f\xb1\xa1\\\xe9(\x05\x9b_\xb3\x98\xdd[\x18\x1ai6\xd5I\xab(\xae\xf8\x14\x05[\xca%r\xa9O\xc3\xec\x08\xf0\xb5\x87\xc0\xbaRG\xa9E\x9d)\x9a\xe8\xaf\xb6\x8a\xf1\xc2\xad\x86go\xdb^\xff\xe4e\xeaf\xa21\xe9uOOE\xcc\xc5\x8b+\x15\x80tO!hE\x1cI\xee\xa5C\x887i\xc6\xc3~\xea\xde\x14.\x93M\xacB\x1f\xb3W03@\x04\x99f\x1d\x81\x1c\x9f\'09\xd1H\xb6:\xcb\xfa\x0b\xb8\x1c\xacV.\xe2\xbd\x18"\x16f\xdf\x83H5\x9c\x03\xb5\xe2\n\xa6\x18\xb8\xc7\xcf-\x89\xe0C(\x8b1\x82\xb2\xd9?\xce;\xadEW\xfdGT\xeb\xb6\x82\xf2\xb7\x11\xb8Q7\xea\x9a\xad\x11\x04\n\x97\xc5\xcb\x8b\n\x97}Z\x00y\n\x85ju\x8e\xc7\x85\x0e\xf3\xdf26\xfb1\xcd\x15n4\x82U\x998\xfd\xb6o\xc5N\xeb\xb1\x92\xba\x81r\x8e\xe0\xb7\x18a\rLe5q\xa0\xa1\x04\xa5\xab\xfe\xfaOD\xef\xe1Zw\x1bjGI\x03\xf6t\x97\x8f\xfe\xb86\x99b\xf6\xc9x,\xa3E\xb9\x93p\x05Z*:-\x04K\xe7\xd7\xf2&\xc1\xe9\xf8\xca\xef\x1cq\xf04I9gB\x8f\xd4\xc5p\xda&)4\xa6\x07\xe9\x105\\\x08\xf7j\x10\x04\t`\xf1"<\xc7j\xf2\x96A;\x00\xeb\xc3=z8^2\x9f\xa4\x8aZQ\x1c\xe0\xdd@#\x00\x8f\xb3\xa1\x1f\x92T\x07\x86\xe3X\xf5\xe1\xced0\x9a\xc72.R4\x944U\x00\x18\xaf\xc8@BA\x82\xfc\xf5\x17\x86Q{\xcc,\xde6\xc8\xe5\xc4\x90\xf0C\x0f\xc4-w\xc2\xa8\xc9v4\xd2=MO\xd4f\xf2uuM\x8a>\x02I\x9b$\x9c\x8cy\x1di$\x99\x89\x1b\xd4|0}\xe5\x97\x92gr0\x98&\xc6\xea\xbb\xb6,\x99!\x18\xa8\xc2[\xc4\x80p\x84\xdbdkB\xddj\xbf\x8ef\xa0oA0`\x89U\xd4J\xa7"eX\xbf%\xac\xed\x12\xcb\xcd\xc1\xfc\xf5\xcb\xf7\x85k\x8c\x8fh\x10\xe7\x15+\xd8\x124\xd5v\xf0t\xd9Ef\xb1N\x9b\x1a\xbb\x83H\xbe\x81H \xe7\t\x89\x92Iz\xb1\xc3\xbe\xdf\xc6\xf7\xe5\x9d\x98\x05\xa6\xeb\xb6\xacQ\xb8%\x0f\xe4\xf9\xd0\x00\x1c\xfe\xe7\xbc\xe8t>-\xb5_.\x94I\xa7$\xad\xc7\xe6\xdb\xfc\xdey\xdc\x02\x1d\x82[<\xeb\x99z\xc1\xa4w\tT\x95-1\xd8\xf6\xf7\xfe\x99\xf2B\x84\r\x08\x14\x14r\xe6F\xd5m\xec8l\x98\xa03&\xa4\xaa\x9c\xcd\xca\xa9\xaa\x93\xf1[w\n\xe06\x8d\x86\xda\xc5\x0f7\xf2\xb7\xd8L\xc4e\xe6\xe9 q\x92\xc0\xb2\xc7]\xdfX*F\xaa\xccj\xb2\xd8Mk0I\x1b\xfclW4\xc6z\x0f\xbaPe\xe7\x1e\x0eY\xae\xbf\xaf\x96\xff\x919\x17\xf0\xe5~\x122\x8a\xfbg\xb5\x7f\xc8IL\xa5V\x9fa/Y\xc2\x85S2SQ\x97Q\xc0\x90\x1b\x15?\xe8\x83\x9e\xd94B}\x9e\xd2\x02\xafFh_Fj\x08\x19\x8c\xdd\x02\xa6\xf6\xd5b\x8ew\xdb\xbe\xd0[\xf6E/\x1a\xee)\xbb\xb0\rl\x92\xd5\x7f1w\xb5\xa5\xe6\xf6n\xf9\x01\nKK_@\x08\xfa7z\xba\x0b+NS\x9c\x83\x901\xd2A\xe5\xfc\xa2?\xfe\xca!}\xcb(l\xa4\xe5\xf0\xb2\xe5\xe8\xb2I\xd6\xdc\xdbf\xd3\x91\xdb\xf8H~\x937*\xc3I\xfb[Ek\xbejR+nGT\xd7\xce\xa2c\xbd0\xc5\xd8{c\x0c\xc4V\xb8\xe8\x9a\x99\xd3\x16\xae\x00\x05\x01\xa3\xdc\xe0\x83.\xaf+\x96B\xbc\x9bA\x86x\xaa\xac\xa3\xf1\xc9\xac\x92aq\x92l\xc2=BB\xe8\x8e\xa9\xb2\x1e\xb9\xb5\xa9\xa5\xa8x\x98a<\x19T\x07y\x93\x1b\xbf\xfc\xd3\x8d\xc5\x13\xbe6\tP\xccT[SE\x87\xa7\xc6icc[\xfdd\xc17\x95\x01Mu\x1a|\xe89\xb7\xb1H\x99\x11LmM\xd4S\xeap\xe5\xab\x03\xdb\r\x02]L\xb8\x0e\x96\x86S\xdcD\xa6\xf6D\x8d\xf0\xfa\xefa\xf3\xa3\x83\xc6\x8d1tsku\xf2\x0c\xe1rO\x01{\xea\x8b#\xc1!\xd6\xfc$\xd2@\xa6H\xc1\xb5\t*;\\F\x10\xc44\x10R\xc3\t\xfdV/ts\xb8\xbcE\x01\x93$\xb72\x8d\x84\xfe.\xac\x92S\xcb\x14\xb8\x91@\x87\x00\xce\x84\xc8\x17\xf7\x0b]\x9d\xf0\xc5\xf0\x03D\x18\xda\xc2\xd9/`\x16G\xc9*\xee~\xbb\x89\x9a\r\xdc\xac\'\x16p\xa4\x90;\xe7\x9fhV.\xd4\xa4\xc4\x94>\x8b\x81\x93\xe7J\x95[\xa2\xfd\xc52\xb1T7\xc9o,(`e\xf5\x9d\x99\xb9\x8d\x0c\xf9O<z\xf3\xb6q\xdb\xad\x84H\xeda^Eq\x04\xe5\xfc\x0ebB\x02@\xe9\xbd\xd4\xd8\xddS\x90\xc6\xd9\xeb\x1bw\xa9%\x817\xdf\x7f|\xc8\xa0yva\xe3:\r\x1d\x96\xd1\n\x1a\x05D\xc0\xfc\xd9\x8a\xb5\xe9HZscZ\x01\xcf\x13\xd0\x97\xcb8\xb1rhc\x81\x04\xf8\x1c\x18\x9eh\'h\x19N\xd22J\x9a7\x95b<m\xbe\xd6 \x95J\xad\xe6\xfaP[U\x99\xd3\x9fNxsU\xc8\x08f\r\xaa\xe7z\x18D\x9c\xf7+"\x8a\x80f+\xcf\xf4\x17\x87\x97\x88l \x93\xbc%7\x97\xab\xc8\xd6\xf9\x13!/\x13\xb9\x8f\x1b\xc8\xc0\x90\x04\x83\x10\xf5\xf5\xb1GZ}\x87\xca\xa0\xdb\xdc\xac}>g`\xe6\xfbi?\x08a`t\xd8\x8f\xb1w,\xce\xceeWU+bIL\x10\x14\xb6\xc3\xb7\x17\xa0\xeb\x1f\xf7n\xf1\xdcT\xc4\xbd\xe8U\x85\xceM\xd9\x7f\xe4\x8b\xa4\xdc\xb4J\x01K\xf3\x95|\x04s\x9a\xb4s\xc1\xccI\xa1\x8eL9\x1e\xc8\xf1\xab\x12\x9f7$\x1eN\x92\x1e\xd6\x90PL\xc4(\xb94/\x8c\xb3\xea\x8a\x99PO\xd2\xebsm(OFW\xfb6\xe9\'W\xa2\xd4z\x10\x9d/\r<\xa8\xf0*\xf4\x11r\x80w@b\xa8l"x\x9c\xee1\xfd\n\xf1\x8c\xc7\x88f\xbf\xfdU\x8bC\x842\x0b\x19o\\e\xfd\xa37-Y\xecBZO\xfb\x9bg\x9a\xb9\x00[\x84P\x05\x95/\xe8\xd2ruH\xf7<\xa04\xf3)\xffE"\xccJ.\xc8\xd7\xbb$n\x80\tF\x99\x01\x12D&\xbc\x82c6\xda\xe7T\xe1\xcfpQ\x89N\x97\x8e\xbb\x1a:S\x04J\x92A\x95K(\xb1\xad\r*\xb8\x00=\x83\x08\xbe4g\xc0\xc0\xec\xdefv\xe2\xc6YPTH\xc2L\xbf\xc5\x0e\x8f\x0f\x87[\xa6\xe2\xf7\xf2\x0e\xe9\x96h\xdd\xa12\xf9\xcc\x8c@\xd2\x9f|J\x9e\xa8f\xc92\xc9_R\xe5Ri\xd8\xf4\x0e\xa4\x89\xdbFV\xbc\xefG\xd6\xf1[)\x1d\x9d\xa23\xab\xe9\xe2\xb5\xf5\x1b+\xb9\x91\xe4%mMCP\x10\xdfL\xa2\x83\x17\x1d\xc21\xa0\x0f\xe7\x9fx\xefo\x1fS\xd9\xd4\xa8\xfb\x9e~P\x9d?\x8ac\xb3#\x84\xfd\xfd#\xf1\xd6`OUQ\xf6\r\xaeN\x12\xca\x05\x8aI\xecF\xf4\xbag\xe1\'3P$K<\xee\xdf}\xf6\xf8\x8fG\xfe\x01j0-/d\x9dD\xf4\xb8\xef\'Tc \x02\xc3U\xc9\xcdhR\xa9\xf1\xb1"I\x05\x9bl\x1bBz\x07o\xfc\\\xdd\xf2\xafwD\t\xd0z#\x12\x00\'\xbe\x95\x1a!N\x90I\xaaDW\x9d\xc6\x15\x94\x08\xb9*\x90FB\xf8H~\xdb\x82\xcbN+V\xe6\x99\xb4\xac\x15\xaaX\xa2\xec1Y[\xf3Yl"(m>\x98Q\xa9\xd1\xa6l\x1e\xc1\xb6\xef.\x0c\x82S\x12\xf8\x01w>\xc3\xa2\xba\xf4\xd3\\\x80\xe1\xa25)\ra\x8cF\x8b\x02\x07M\x99\xc4\xb0\xfa\xcc\x94\x15\xb7\xd2B\x0c\xaa\xd4\xbd\xffF\x07\x08\xb9\xa0y\x9f\xceS2[\x00\x15\xa9\xb2\xe5\x12\xb1D\x9e\x06\x07D\xa4,\xe5j\x8aa\x05\xdab\xe8\xad!z1\xc7\xc9(\xc5\x1d\xad\xe6\x86\xda\x83\xa9\x89XX\x86\xb5\x97\xd7\x9e!\x7f\x194\x0f\xb7 H\xe0\x03)\xa9F-\x0e\x82\xf9\xbe\x9a\xd0\x1f\xef\xec@\\\x13\xd3\x0by\xc2\x1b\xd6\xda\xa7(\xdb\x8b\xd6\x89\xdf\x0e:]S\x19P\'\xd6>\xd1N{\xc5\x8a\x1e\x95p\xb6\xc6\xdd\xab\xe7\x9b;\xf2\x83\xc8M\x87\xb9*a\xd6u\x98W\x04\xd6\xb2H\x946\xa3\xf8\x1e\x9d\xf3\xa4\xe1\xf3\xca`\x9anPz\x0f\xb4\xdf\x01\x06\x88Sg\xe6|V\xf9\\h\xc8\x9b\xd0]\xae\x82\xd8\xbcd\x13\x8e\xb1\xb9\xb5\xba\xd4LIX\xef\x99\x84\xe0\x81\x97\xba\xf3\xe2kT"j\xc3\x8d:!\xf0\x0e\xdac8@\xa8\xedg\xd8\x13\xbe8\xf1\x91\x02A-X\x81fK\xeeh/\xc5:\xb0\xa1% 0!\xa6E\x8d\xc4\xe5\xc1>\x10.\x85\x8es+\x0b\xaevn\xbe\x97{HG\x1ff<y\x99\xf2L\xd1D\xfe\x88A#\x9f\x1cS\x1f\x1a\xe1i\xf4\xea\xa0\xdb\x81r-j\x16)\xdeC\x19\x1d\x7f\x87\xc6\xc1\xc8\xfe\xcb5\x8bZGJ\xa9\r\x0c\x1d\xcf&\xd9{\x81\x96\x17j\x02"ap\xa7\x06\xd3\xac\xa1\xe9M\xfe\xc8L\xbe\'\xc1\x00\xbc4u\x91bg\xb6~"!|C\xf4\xc2\x8da4N\xcbP\x0f\xde\xee\x11\xccF\xe6Uqux\xcf\xf8\xa7\\\x18\xfe\xc5\xc6B\xd5>0\xaaG L\xb9\x1fc\x133\xefk\x86\xe5\x18m\xaa\x92j\xc8N\xac\x98\xa3\xf6\xcbB\x04\xf7\x9e!o\xfc\xbe\x82\x98T$\xd4|\x9d\x9b\xe2o\x80\xb6I\xe3Y\xd0\xa2\xbf\xef\x97\x94T\xe3\x08\xaau\xd9\xb0\x03H\xc8\xc1\xe7\xba\xf8\xb6\x9d7\x84\xc6\xd2#\xaa2[\x9e7\xca\x83\xe7\xbd\x88\xdcA\x1f\x97\x8a\xaa7\xf80\xdf\xd7\xad\xbeM\xad\xffu\x9a\xc2\xa0\x99\x7f\xc2o\xd7]}\xfe1F^\x89U\x88ZYF\xabz\x8bv\x18PC\xff\xea\x93\x9e)\xd0\xceL\xb4\xdd\xde\xf6\xeb\xeb\x9bDo[\x12`\x80\xdc\x1fD\xf3<O\xca7\x0b\xff= \xbf\x1a\xa4\xba(\xe1\x17\xad\x90\n\xb8\xfanS\xc9~\x00V\xeaw\n\xce\xa4\xc8\x8f:\x01\x8a\xa8\x85}\xd2\xef\t\xf6T\xa88]A\xf5G*fT\x8a\xdf\x16\xf8\xccu\xd9\x1e|J^\x8a\xd4\xf5/\x92Q\x945e/\xb0oh|\xcdBh\x00\xe5\x92\xba{\xa4vH\x9aE\xac\x92Q\xda\xec\x8b\xf7X\x81\x19A~\xfa\\\xc6\x8a\xab\x93\x1b\xae\xe7Y\xc5<\xa2 4X\xb0!\x8d\xc4\x90\xe7&\x17\xf6\xc3P\xd0\xa2\xaf\x85a\x1c\x13R\xed\xc67\xa5\x04\xe3\xcc\x8a@\xd3V\xc9\x08\x97\xee\xe7\xf2\xe9\xbc\xcc\xbbH\xcdR\x04\x0f\x9d.OQ8\xbf\xc5s\xc1\xb5}\xb6\xe1E\x9d\x1c\x1a\xcd\xf9\xe5l\xef\x0e\xef\ts\x82\xbf\xe2\xfb\x98\xf4\x8b\x80\x1b\x02\xa5\x9d\xa5\x0e\x08\xc2\xfd\r\xd2"\xdaB\x96\xb8\x08\n-\x8d\x10\x8ec\x98($\xd2\x86$Ed@\xf9\xb937\x8a\xc3\xa6\xa7\xf6\x10\x9a\xad 0g\xdb\x0c\x1e|\x81\xfe<s\xa0\x89\x8c\r\xac\xcfj_\x9c\xa4fv\xa1\x96\x8d\xad\x81\xa0K\x07*\x88\xb0\x96X\x9a\xf8v\xadA\xcd>m~{\xe0\xf2X\xfdb#_OU\x1c\xe7Mo\xe3\x85R\xf2\x88 G0\x04\r\x8c\xffs\xa2\xf6\x0f7\xd5/p\xfc\x10K\x86\xe5r\x1dc\x8f^\xeeq\xbf\x1a\xbf\xfa\x08\tC\x15\xe2}\x91\x94\xd2\xc0@\xfe\xdc\xf8\t\xcf\xd0\xceLM\xda\x94\x82\xf3\xec\xea\xe4\x16\xff3\xc5?$\xb2\x11kMS:k\x0f?\x88r\xe4b\xbc\xa9\xbf(\xad\x1b\xa4\x0e||\xd3\x8d6\x18JL\xa3\xbel\xa19\xc6\xa6\xffI%\x91\xc4\xa5\xe1\xd1\xf5\xd0\xe1\xdd\xd2"?}n\x91\x08\x0e5\rs\xf0Hi8\xea\x8b$G\xd0)W\x8e\xe9!W6\xa8R\x15I\xda\x1a\xcd~6a>n\xf6\x01?\xc8\xc0\xed\x9d"\x05p\xbd\x01\xdf\xe1A!\xe6\x83\xe9\xd1\xe0\x8c\x0bc\'\x8e6\x08\x91I\xbdY%\xcb\x86hp\x07\x89\x15e\x1e@\x13\xaa\xbd\x11\x86~\xda\x80\xe3u\xfev\x04\xa7\x96u\xff%|;\x8bby\xd0gfo\x91\xec\x81Wr\xa7)S\x1a\xd3I\xcfO\xda\x8c\xf8\x80#=\xb07HS\xaf\x98\xf4\x91\xa8\x05\xfc,d\x06t\x1b\xf4\xf3\xd9\xab1I9`\xfeZU\xf2\x93\x8bW~\xa5G-UC\x14d\xcc\x8fp$\tO\xd9\xd3\xfbE\xc7\xfdu\x0cq\xd1f\x08c\x93\xf74\xf7\xe7\xe7\xaf\x93\xcc\x92w\xc3\x84\x0b\xc3\x85\x85Y\xb7\xd1\x94\xc6*i0)\x80-\x8aF~1\x08\x17g\xbb\xf3\xee<\x1d\x08\x96\x06\xfc\xa1\x1a\xc5\x00E\xa8\x88\x1cy8\xdb\xc8\x18\x82\xed\xc7B\xac\x07\n\xb0\xf3I9Y\x80=\x07\x83Q\xbd\xd5\xfc\xcc\x08\xe23\r\x15\x80\x91\x05\x81\xf9Y6\xfe\xb95\x07\xc6L\x0c\x02\x19\xe3\xc3K\xb9\xc3\xf0\xbd\xc3\x9b\xec!\xa6\x04W#\xa7^\xb2\xcd\x1b\xb7\x92v\xde\xb3v\xa4\xda\\\xc5=\xf1\x11\x91\x8a\xb5\x8a\xc5\x1f\xd2\x84\xab\x01AqL\x14W\xd5`}\xf14\xc4\xc3\x1e\x89>\x9a\x10\x0c\x15Q\x10\x0e\xe4mOt\xfe\xf3Oy\xa1\xfb\x97\x85\rt\r;C\xcbgzJ\x12p\xf54\xf8\x92\xf8\x19\xeb\xea#\xc2\x14\xe0\xee\xc0\x19\xb7\xcf9\xf6\xc78`*\xd6\x88\x1f]\x83\xf0V\xf4\xf46\x93\xc9\x03\xf45\x11\xcd6\xa2z\x0e\x86T\xcc:\x8f\xabt,~\x1d\xb9AQ\x0b(\xfdEq\xaf\xbd\xa4\xefO\x8d\xac\xd2\x8c\xcd\x80HI\x1euM\x86"\x81\x9f\xd2\x10\x18:\x9cm;\x9edTz\xf49\xea\xf3\xf8\x06iq\x06\x8c\x8c\xea\xc6ZJ\x98YI\x95\xe2I\xe1\x0b\x03)\xe9\xac:\xfa\x01@\x16\x90\xc4\xb5\xd0\x06p\x19\x9a\xfc\xd9\x04\xf0\x1d\xd7\xd9\x95\xcc\xa0?\x19\x166\xab\x106{\xe5[j\x94\xea:\x9b\x0f:yMe\xcf\xb1\xec-4\xb6d#\x11\x0b\xf0MGL\x18\xde\xbf\x9b[\xfdo\x9f\x04\xe5\xb6\xba\x0e\x83\x89\xbd\x1f\r\xcbi\xf7\xfbmZ\x8d\xa8\xf5K"j\xd5\\\xf6\n\xc1\x99\x14\xe6\x0c\xfb\x18\x90\xf9\xc1;\x1f5nl&\x18\xa3]\x8c\xe5\x1e\xaf\x84w\x134\xc89;\xc3\x19\xfe$\xf7\n\xc3\xfc]\x1alw\xf9\xf2\xaf\x1f\x9dZ\x88\x14qi9\x8ecceh\xf9r\xa4\xbc\x99\xaca\xe9\x10|\x9e\xd3\xa7\x82Ak\xfa\xe9\xabb_\xf5\xf4Z&\rM\xcd6\t\x90\x1b\x8e\x1c\xfa\x9d\xabT\xf9\xb1Y\x9e\x89\x04\x05\x1f\x17;\x08\xe4\x0cF\xc0^zI;V:VA\xd4\x18\xcf\xec\x17G\x87\x8c\xcd1\x13\x01\x7fw\x97|<\xf9\x91\xad@\xd0j+\x04\xe1\x1c\x96\xee\xdf\x10\xe3R\xd4Ev\r_\xee~\x19\xd3E,\xfb\xb7\xcd\x17-[\xbc\xdd\x94K\x8a\xda,\xcf.5\'\r\xce\xcax\xdc*i$\x14\xde\xcd3\xbe-\xaf{\x03\xe2n\x03\x8e$\x17\x98\xf9\x94\xd7\x849i\xc9),\xe3\rJ\r\xa3si\xa9\x80(\x94\xf7\xf6\xd3\x00\x12\x8f\xea\xc1\x95x\xa8\x08W-y\xf5\xfc2\x05\n\xc9\\\xaa\xbd\xfbt\xda4d\x1c^T\xc3\xf3\x82\xd1odKV\xe9\x91\xd0\x0e\xa8\xee\x81\x91\'\x016UX\xb3}]\x16\xdf\xc5\x81\xa7_1\xa5\xa4\xda^\x90\x8b\xc5\xa2\x86\x00\xc4\xbc\xfbS(>\xb2b\x1a%\xa1\xd9%\nL\xa39X\t%#\x8e\xd7\xec\xf1V\xc323\xe7I\x9dO\xb3,\xfa\xa7\xfaf\xb29Mb\xf6\xa8;\xeb\xf1\x9b:\xc3\xbc\xe4\x84F\x0c\\\x8d\x86`\x9al\xe9\xe4\x9fu\x01<6\x8e\xd2\xc7$|7\xa2#!\xd7:\xed\xc5\xd7\x8c\x980\xd3E_Z\x12)l\xfc!;\x94\x11\x1am\xe4\xcd\x8b\xc2{w6m\x03J!cF\'\xbf\x1dr\xe46\xaf\xdc\xbew+\xea\xf7\xd6\xb7Ik\xafP{\x04HL\x81\x86G\x1e \x93\xaa\x0e`\x98\x06\xa0\x81D\x86\x88\xb8\xef\x14\x8bP\xd4\xb5X>\x16\xaa\xbc=\xb92T\x97\x956\xc4E!\x009\xf0#\x8c!\xe0o\xce3>U\x80\xc6\xd5m1\xa4\xac\xac\xe9\xd4<<\xf5I \xdcA\xa8\xab\xd5\x06X\x94\xcf\x99\xbf\x1f\xdaY\x84\xad9H\xc3!\xb9\xf6xb\x19>\xfd\xf4\xe63a\xdb\xf7\x08x\x11\xeb\x96+u\x98\x05\xc6\xe9\x8b\x01_l\x95{\xd0/\x19\xaf{\xb5z0`\xdc\xcdH\xa0\x92\x89\xa46mo`\x00\x05\x16C{I" \x94\xabFE"E \xd4\xb0\xb5\xf5\x9aN\xbc\xc8s\x14\x19\xe7\x95\x06\x18\x14\xc3>\xe2\xd1\xec\x02h9\x06\xa0\xfc\xf8\xb3\xb5\x81\xd6\xb0\x11\x02z\xbb\xd8<\xfb\xd8I\x15\xcc\x90\x8d\x99\xb7]\xa1\xf6\xcf\x13\xf7f\xad\xd4H\xf7\xd3I\xe3\x11\x04\x85\xa6&\xe8j\xb7,\xe9{\x85\x9a\xa3\x17\xc3\xc2\xa8|\x0e\xde<\xd8\x17K\xb3\x0b\xdf"?h\x162\x8c\xd3\xec\x85\x84A\xa3l\n\xaf\x7ft&\x9a\x03\xcb\xce`\x08\x18\'9T\xc4\xe8\x87*\xffd,\xec\xe8\x18\xdd\xdc\xa1Pcs\xab\x08\xac\xderG\xf8\x9c\xbb\xff\xa8XI4\x9aI\xf4d\xc5\xa7\x7fE\xf4X\x8f)\t\x17\x07{\xc3#m.\x08\xe4\xb4u\xb9\x89+I\xcd\x0b\xe2U\xb3|\x88\xa0\xa4\xe4\x1a\x11,3\xc6\xec\x88\xc4%\xd2o\xc2\x91\xf4X\x10$p\x16\x81b\xd8\xdf\xb0+\xb7 \x99g\xf9Te\xfa\tY\xe5t\x9c\xba\x13\xebz\x81\x84\xea\xf5\x0c\xc8\xe6\x9d\xbc\xb2\xf7d\xbadN)\xe4\xe4\x1a#\x08*(\to\xac\xe2\x82\xee\xa7\x95\xa1I#P7+QA\xe3\xef\x99\xc3\xfa\x84\x94g,\x96:\x99\x9c\x96\xf7(\x93 \x13\xf6\x96H\xaeoO\xf1(\x99\x15L\xa51W\xf5\xb5)\xdb0\x8e&$\x7fz\xae(\xe0b\xcac\x018J8q(\x12d\xd1\x17V\xa4\xef\x19\xa0\x08\x89\xaby\xab\xb9\xf5Y\xf1W\xf5H\xca2D8z\x16\x8byg:\xef5\xea\x8b\xa9l\x9e\x04\xa0\x86\xaf\x81c\xce\xb2\x17<\xce\x10,X|\xa0Y\x10\xb1\x08\x19\t\x10\xf4c\xcc\xd7\xe1\xe9\xde\xf4(\x99\xb1t36\xaa\x07\x08\xf8Ay\xe3\x90\x12\x15\xe0\x9ehP\x83\xde\xe8<\xac\xbc@wmg(\x05\xb5\xedVM\xc3\xd5\xaeca\xd6\xa5\xda\xf1\xd7\xd4\xeb\x1e\x88\xa1\xd1\x04\xc0\xe1e\xd5\x95\xa9b\xd8|\x08\x8f<\xfe\xf6\x8e\x198\x11\x93b4a\xc1\x91q\x06\x00x\x8b\x1e\xda\xd3\xacw\xaeB\x95\x116\xbfa\x04\xbe<M\xe5a\xab\x17\xeea\x1c\tV<\xeb\x1aR\xc5\x90\xcaF\xde;_\xba\x84\\Y\x00\x88\xb2oXz\x90\xfe\xda\x13\xd1\xa0\x1ch\x9ez\xf9\xe5>4\x93\xeb)\xf2\xc3\x16Kp\xd7\x02\x0b\xca4\xb8\xbfT\xf7*\x9be\xf4\xf8\xe0\x95^\xfc\xb7\x01\xe9\xd5-\xab\xc7\x02\x85>\x89 w|\xb8vMw\x83\xc4\x97\xdb6\x85\x99\xb5\xcf\x8fj\xdb\x96T\xaa\xa4\xd9!\xedo\xf0~\x99\xb3#\xb4\xf2\x14N}Z\xfa\xba^\x174\xc7\xcd\x93\xf0\xa9\x0f\xf1\xc2D5\x0b\x95&\x00\x1aG]\x00\xd9\xfbk\x03\xa0*\x19G\x80I\xee\xf7\xf4\x16/\x06\xf3D#>q\xad\x98Ux,r\x0b\xa2\xd7YT\x0c&\x96\x19;\xd8;\x93\xb3\xab\x1f\xff\xd6\x8bCn\xa6\x92c;\xc0T7\t\xdc\xc6\xcfY,\xfdk\x1fxc\tz\xf7\xd0\x8f\xc2\x02\xc2\xe2\xa7\xfb\xc8\x9e\r\x93\xb7F\x88LG\x10I\xc7py\x99\xd89\xf7\xb6y\xe98@\xfcR\xdaR\xd2\xef \xc7\xeayIE"\xb19\x99\xd1[h\xd3\x01\x93&\xbb\x90F\xa6\xd4Fj\n\rg>\xdd:\xf1<Y\xc7\x10\xa6\x14\xbe\x7f\xf48|7\xf5\xae\xd1\x913\xe2\x01R\x8a\x81Y\xb5\xabB\x1e\xcc\xc6`\x90f\\Q\xdb<[\xf2\xf6\x177b\x97\x83l7\xf2\x9f\x99\xb11d\xeca\xb0>\xd7{|^\x90\xd7+s\xbcJ\xa1U\xbf=\x85\xe6*k\x89\xbc\xe9\xc7\xa7\x96\xaa\xf4a\xa9\x9ep\xd9\xa6fk\xc0\xbb\xd4-\xd1R\x15\xbcN\xa2yS\x95R\xc6\x19-&\xce3}\xac\xe1\x1a\xb7?$\x07=\x9d\x02PH\xa5\x9c\xd4\xaa\x95\x91\xdfb\x98_ IW\xce\xc5V\xca\xb11\xccngk\x93\xb1\'\xd2&\xab\xd7\xd6\xf4\xf7,$\x86(\x9d\xf6b\x89\xd9\xefZ\xc4\x7fe\xfa\xe6\xf0\xd1\r5\xdb%{\x8e$\x08\xee\xdc\xff\xad\x19\xe6\x93\x7fH\x02u\xd5d\xa3\xe3\x03\xa7\x01\x01\xff\x11\xdb\xfe\xb0\xbaS\xc6\x07s\xcd\xad\xb9\xf0ri\x18\xa3\x10\xdd\xf6\xee\x10yUd\x0c\xc9/\xa8\xd0W\xa5?\x86\xd9h\x15\xbc\xfcP\x96a\x85\xe3\x06\xaa\n\x01\x19\x1c8\x04a\xe6\xd1\xb6\xf4\xec\xa2$d\xb7\x9c\x1bj\x95\xfb\xb1\x1b\xabF\xd2\xe1-z\xf6\xc8\xfa\x02kZf\xc8\xef\xd04\x05\xcb\xb7\x02s#\x9d\x80J\xe6_\xf5\x95\x90\x913X\x12 k,\xfe\t8q\x98\xf68&\xd4<^G\xbc\xac\xbe\x0c\xbdY\xde\xcc\xdb5\x87\xf0\xe3\x91\x80\x1e\xb8\x13\xd5\xda\xe3H\x17\x1fE\x9f\xe5\xda\xb8\x8ae\xd6\xf75\xd2/j\xb06\x07\xbcA\xb6\xfe \xe8\xf2\xf4\':\xc4$\x01\x07\x93\xee\x8e\xdb\x1b\x07G\x11\x04\xd8:\x1e\xf0c\xda\x86&Q\xc9\xeb\xf1;\xa4\x1f\xc8\x88R\xbcA\xbd8\x846H\xb5\xdb\xa1t\xe1\xe8\xc6\x10\xf1\xf6<O\x08\x19\xd0\xed\xd8\n\xb6K\xe5I\xf0^\x82\xe2\xaf\xe7\x08\xd2B8\xbc\xf4\xfdN\x8e\xa5+\xd5\xf2\xe3\x8e\xbf\x1c\xfdr\x0e\x06\x81\xee\xd2^O=\xf2M\x08\xef\xbc\x9fKnIU\xc2\x85Y\xb8g\xe7\xb1\xed\x15\x13d\xba\xea\x9a\xc44\t\xe6\xef-\xbc\xbfk\xb1\xef\xc5\xe8\x8d\xc6t\x946\xccb\xa0N\xa4\x86\x00?q\x1b\x0c~9\xa7\xe3\x0es\xa8}\xf7\xbd\xd5 \x85%\xa1X*c\x9f\xccwb\x86Y\x0e\x04;\xa6\xbc\xcam\xaf\xa4T\xb7\x19|1\x1ck\x987g\xd8+\xcc\xcf\x8d\xd5\xfaDC\x02\x88\xb5\xcd\x0fV\xa8\xbf\xba\xd0\x98\xe7+^\xa73/\xde\xfc;\x86\xb95\x91F\xc6\x15\x12\xcd\x13*i\x8d\x92&\rM&\xc1\x8f\x91z\x0c\x0e\xedUc\xe0\xe3\x16\xfa.\x87\x1d\x9b\x00%\x97-\xf4\xa9h ^e*CXy\xb4\xf7&\xcb\xd9\x97]\x89\x96\x11$\x01\x9c\xd4c@\xdc\xf4\x9a\nyg4\x0fX\t\xa0\x8b;\xea}\xac\xc2\x8eyXb\x916\xc0\xdfZR\x1f\xb2+\xff\x89\xe6\xb4{\x12WVm{N\xaa=?\x15\xc6\xa4)X\xfb\xdb\xde:3j\xc1B\xe0\x91\xb6\xf3\xbc\xdbu\xa1\x9cX\x1a\x1a\x04ex=\x80HnA\xf5\xee\xda\x86\x1a&.\x0c\x92Kg\xa6\x89,1dW\xa5F\xe1?\x1d\xba\xc4\xa5\ta\xed!\x98\xd5%\xb1y\x8a\xf8\xaao\xc7w.\xa2`\x19O\x83\xb1\xe2F\x18\x87w\xfc\xfd\xf3\xa6K\x9c\xef*\xd3V\x1fL\xa6\xd8y\x89\xd2\xcb\x1ac\xd3s\xdcu\xe5|\xe2\xa3N&\x8b,\x83v\xbe\x19\xbf\xc1\xba[\x92\x0f\x18\xad\xa4d\x0e\x9b?\xe1\xa7\x0eb\xfe\xfb\xfd#\x97zpN\x1f\xa2}\xc0F^\xb0\xfc\x9b}\x1f\x9c\xf8\xf0Ll\xce`\x9eiD\xfb3n\x1dk\xe4\xc4 n\x80\\|\x8c\xe4\x86\x03BS6a\xa8\xfa\x1e\xd9\xf5\xc1\x05\xcf\x92\x82\xed\xf2\x7f\x01X9\xa7\xc6\xa7\xd3\xea\xe6\t\xe0\xec\xab\t\x08\xcb\n\x009\xf0\x18\xa5\xdb\xc2\xd4\x8du\xc5L\xa8\xa5\x13{\xce\x99\x1b\xf0\x7f\x9b\xd44wh\x00\xe0!\x01\xc6\tk\xed\x8bw\x8e\x88\xa9\x96\x8ej\x96\xeb\x03\xc4\xf1\x07`\x92\xc0\x14R\xad\xa69`,\x93\x88\xbb\xa5t\xf1\x8560\x89\t\xd8D\xaf~\xf5\xab\xd7\xbd\xab\x0e)\x01\xf1?\xf0\xc0\x03;\xe9\x1d\x80\x1f\x89o\x010\x8dh\x06\xb4\x81\xf0\x12\x08<\xd9k\xaf\xbdV\xdaO\x93,\xb9/\x1a\x13QDdQ\xc8\x86\xe7B\xc3\x10y<h\x84\xf3\xc2\x04hZy7\xe7\xa5Jw\xe00\x01\xe4\x06\xf0\x00\x88\x12d\xdb\xbb\x07\xf7\xe2\xf9\xd6\xd6 \xa07\xb5u\xa3\x01\xdcf\xd0\x0c@\x86\xde\xd2\xe4\xfeg\xb2q\xf6+b\x07\xfe\xd4\x07\x16\xba\t\xad\xb9\n\xf9\xca\'\x91\x89\x07\x921?\xf2X\x02\x1b\xbc\x96\xc7\x1d\xd2\x170\x17\xdd]\xd7\x8bH3 \x9f\x1c\x041\x0c\xa1\xa9\xb8.\x98\x07\xdbPQ\x90\xdc\x9d\xe9;\xb4\x05v~0N)\xa9\x01\xaeF"\n\xcdbQ\x80@\xf5\xf4C\xc3\xc1(y?\xd8\xce\xf3\xe0\xe9\xb0\xa9k\xed\xc1\x81\xd6y4\xa6u(m]\xa87PW\x1d\xc7`n4\xc0\x9ay[\xf4\x06\xdci\x88\x0c\xe0I\xdd\xd5\xff\xf0\x87\x1d\xb0UC\xe1\xa9E\x89\xcc\xd6]\n\x06 l\xf8B\xc7\xd74\x00\x8b\xdebX\x8dpY\xf1\xd6}\xae\xc72\x89\x83\xd4\x8dL\xae\xf5$\x8b\xc2\xe2\x86SX\xd84\x9a\xc0\x00h\x02$\xb9\x85\xc4\x1d\x14\xbef\x9b\x9b\xb4w?0\x00\x04\xa7(M$\xe7\xe4g\x1e:\xa9\xf3@C\xa2\xfd`\xe0\xa4\xa5\x08\xd2\xf54\xcd\xd6B\xbcV\xb4\xb5\xa5JY\xf0\xb2(+\xa6l}y~y\xc5fM^j{\x83`\x08\xbc80\x80\xa11\x00\xd5}~\x84[\x8bO\xaf\xe5\xf4ge\x8f\xbe\x9f\x03\x1d\xcdo\xfb\n^\x00Me\x07\xd7\xbc\x00P\xf2i\x08\x13P)\x17#\xc9\xa3\xe6\x96\xb2\xbe\x84"\xf0t\x1a\xda\xc8b\x9a\xea\xc3\xdb\xac\xa4\x08\xa0\x93\xa6\x13\x8c\x8a\xcb\x88\x97\x83\xbaO"\xb8n\xea\xa6\xc5".\x82\xf6\x10\xde\x04\x9aB~?\xaa\xcc\x0c=\x1a\x90\x9a\x1c\xad\xe40C\x11s\xd6\x81\xf9\x88{\xb7v\xac\x0f.U\x0co\xa3\xb5\x02\xa9\xeb\xb5l@^\x80\x92\x01\xe8\xdf \xb6\x84\x9bW\x12Q\\?\xed\xaf&\x8c4\x0cI4\xd8\xe6\xa0\xd7\xc3\xc4\xa91\xca\x1b\xd5ln\xae\xaf(\x9d\xd4\xd2\xb1\xcdr\xd9\xf08\xfe\x89\xe6\x08X\x96\xab\xb8y\x04\xdf\xa48\x80\x9a\xcaMj*#&\xc8\x86+\xcd\xc3\xb0\xc8\x80m\xb2\x007\xba.\x00\tB\xa2\x91\x18\x06\xf5\x90\xb4\xb7\xe1y\x06\xf8\xf4\xd9\xfc\xe6\x0e\xd8\x849\xf8\x8c\x99 \n\x12s\x05\x06\xca\'(\xb1\x15\xda\xc5P\t\x80F5\x8e0Y\xf7k~\xf8\xd7\x81\xc6\xc1\xa4m@\x0c\x81\x89)\xacv\xa3\x19\x80\xf5\x94\xf7t\xcc\xf1)\xdaKN*7a\xf4\xcc\xd1\xf0\x10\xb8^B\xb0\xc6\x00TvN\x18\xd4`\x19\x80\x1a\x7f\x1d\xab&Y\xc3\x8f]\xda:\xc0\xb6\xd0\x8a\xdb\xe1\x0f\xe5\x8f\xb4\x13\xeb\xe2|E\x02\xd6\x12.\x8c\xcdE\xbb1%\x12\xd2\xa2\x81.\xcf\x8a\xb8\xf1\xd4A\x88\x94_ZM\xe4\x05\x18\xb0\x08\x1aB0\xcf\xf0P\xf8\xae\xa2)6?\xc9\xa7<x\x8eq8\x87d\xa3!\x12\xfb\xd8\xc6w\x0fb \x82\x01\x88\x8d`CG\x8c\x03\xd72O\rm\x08\xd8;\x8b\x04(\x92\xbc\xa6\x01\xd0v\xa3=x\x90\xd0mZ\xa6\x10\xdf\xa8\x16\x84T|\xaay\x11\xf4\x85H\x02\t\x03\xd8\xb9\x19h\x18\xf0_\xba\x03Q\x80$[-\xf5\xd7\xc3V\xd6*c\x02l\x9eW$f\xd0\xd9\xe3\xb5\xb2K\xce5\xf4\xee7$\x80\xa0\x10\xf6!\x1c\x80)\x12nJ\xf7\x0c\tf\xef3\x07\xfc\x1d.\'\x0c\x80\xb6\xa0\xdd\x14\x06\xc0\x14\xca\xe7\xc8\x86!)\x87\x96\x13`\x93P\x89c\x9d\x84mL\x0b"\xfdi:\xe2\'H^\x0c\xc1F\xf3?\x068\x0b\xcc\xa3\xaf=\xb8\xe7X\xe2S\x84\rL\x87f\x17MmIx\rCkQ\xae\xb4\xd4\x14\x07\xf0\x83fh5\x013\x06\xf0\'\xa1\xfe\xe0\xe6\x11\xd3\xbeT\xa9\xa2ZD\xaf\xf1\x7f\x9c\x1e\x12\xa1\x96\xd4c\xc1+\x981t\x92\xbc$\xa9Dj\xb2\x85cAEA\x13\x8b\xc5=\x02\x8al~hx\xbe\xd1a+6\xf9;\xde\xf1\x8e\x0e \xcb\x13S\xa8\xc6\x9104\xefd#\xb0\xe5\xe55X\'Q\xa7\x01#4D;\xc25TA\xb2\xd1\xc3n\xb6.D{f\xae\xe4\r%\x18N\x19\t\xe8\xb9aLP\xff\x9ch,<8\x9eQ4\xb5%\x00j\x8dA\xc2\x04H$\x96\xe6\xc6Ce\x00\xf7N\x9b\xb9KR\x89\xc6\x97%\xea\xe9=e\xba\x04V\xe4\x022\x90`\xfe\xd3Z\xdd?\x19sC\'\x8b\x1f@D\xc2Qi\xf3F\x13\x16\x0b`PR\x13\x00\x10\x88\x99\x87Tc\x1a\xcc\x08\xddf\x81\x88\xd4QH\xb3\xcf\xa0\xd3*\xcf\x0c\x81\xf8\xbbe>\xb2\xa7cmD\xd0\x16\xc6g\xa3ch6\x95\xf4\xe9\x00Ji\x8f\xf0\x82Y\xb9\x041\xa4R;um@\xc0R\x03\xe0\xad\xf1L\xdc_\xb8\xaf=\xfb\xb2 H\xdc\x7f\x96\r\xc8\x9f;\xc8P\xe0h\xfcqL\xf8\xf3-\xd8\x00\xf0j\xae\x0f\xaa\xee1\xc7\x1c\xb3\x12G\x8d\xbc.\xb3\x01\xc3F\x06\xfe,\x02\x99\x1b\xb6 \xa0+\x97\xe2\xee\x91\xc6$(Hl@\x14\x07\x89\x85bSP-\x81a\xa4$`3lR\x0c\x12\x92<\xef\x99\x81\x02\xbd\x84\xd4\xe6\x95u"`\xcb\xbd[\x13lb!\xcfjF\xda`Q\xb3\x81P\x99%\x86\x83q\x97\x1a\xadgF`\x95\xcc\x97\'\x8a\t\x80\x91G\x04+\xedM\xf9\xb7\xb2\x18\x88gH\xe3I`\'$pX\xc9@\x05\x13\xd8\xa3Y\xaej\xd2MXp\xcc(\x80\xb1T\xe9\xf9\'ZJ\xd3\x05H6\xd5\xa9t!:\xceF\xa02.\x02\x91\x04@;\xea,\x950\x9f\x17\xda\x91\xc5\xa0\xc21\xafE0\x80\xf0\x0c\x88%7G\xe6"\xfa\x0c\xc6\xb1\x18\x86\xc56\x8fX\x80\x8dK\x85\x16w\x91G\xd3\xb9\xfe\x10\x10L"\xf7\xe8\xf9\xd3\xf6ru\x1b8:k\x13\xa7\x0f\x03\xf0\xccD/\x96L\x9e\x86\xc7\x0b@\xdb\xf1\xcc\xcd\x81\xfb\xaf\x85\xa2cv\x98F\xc2\xc5\x1e2d\x06p\xc5vt\xfe:\xa0\x06I\x17Qo}L\xc0\x04\xf0\xfdz\xf0$@m\x92-n%\xb5\x16\x81H\xe9\x8f\x7f\xfc\xe3\x1d\x03\xa0>\x96\xea \xc9N%d\x1f3\tl\n\x1e\x95\xe8\x17HCP8\x85;SQ\xd10\xb5\xcc/\xd3*\x85\x94\xce\r\xb1\xe3\xe5\xc1C\xf5s\t\x1av\x7f\xb8:\xfd\xcd\xa4\xc1\x08\x80\x9e^{\xee\xd6\xc5<4\x86\xe5\xa1\xb2>k\x9a,\xb3,\'\x18W\xb8\x0c\x01\xbb\x9e9\xc6\xac\xeaS\r\x03\xc8\xd2\xbay\x01n\xd3\x0c\xb13P\xc6\x04\xae\xdf\x8e\x7fr7\\W\x16z\xb8\x047\xa7\xfa\xaf\x05\xc2\xa7J*.J\xf1\x0bn,\xaa\xb0\x05\x11IA17\xfc\xca\x10p\x18\x00\xc046\r\x89H\x15\x06\x0eJ]\x96\xfc$tX\xe4\xe5]\xeer\x97N[\xa0vF\x89\xeay q\x1flg\xcc+\x1a\x9e\xc4\xe6\xb7\xd1\x03\x00\x8cB\xa8\xee!\xc2\xb61G\x99\x90$h\x14\xdc\x985\x80\xcbS\xb3Ti\x0e\x9a\xa4\xf7\n\tl\x12\xcfb\xdd\x86\xf7\x8a\x06\x80A\xd7\xd6x\xa6\xdd*\x92q\xcdf\xe0EA\x8d]\xda\xd1\xa5Hq\xe5H\xe4)\x03|\xfa\xb0\x81Z\xd1Dv\x16\x89\xb7H$\x81\x84Z\x997\xfb\x0ci(V\x80t\x07\x1a\xb9wZA\x14\x11\xc10\xd4GTC@\xb3\x11j?\xd7\x18\x89\x89\xd1\x02\x18-\xd6Y\x93\xfc\nX\x86k\xaf\x85v\xbb\xafH\x8ar\xcfp\x81\xd8\xfc\xfe\xf7\xb9\xd8\x8fy\xb8\x97`\x00\xb5:\x17T\xfd\xd2<\xe1\xba\xf4>\xe6\xcc\xed\xcd\x04\xe0\xe7\x8fh\xc7r\x88\\M\xc2\r v\xa3f\x01\xca\x82G\x8a\xf0\x19\xb9\x1bE\x94`\xc4SG\xcd\xfe\xb2JoY\xd1\'\xaa\xe4\x9a\xa4\xf5\xce\xd8\xdbH\xa2\xf2\xc1=\xe0\x00\x91\x13\x109\n\xe6\x06\x18&\x11\x08\x8eb3\x90\x96\xa4h$\t\t\tV\xa1\x86f\xc45\x18MVl\x1e\x80\xe0,\xab\x05\x8bYP\r\xa7\x0c\x06\x8b\xd0f*/\x89\x1fB \x7f\xfe\x18\x1c\xc6\x87\xa9i\xaa1/D\xca\xd7\x12\xd5h7e\x93\x19\x80\x9e\xfb\xf7\x1c\xa3\x96et\x0c\xae1\x00\xe0`J\x07\x96Vx\xb3f\x81:\x03\xfdA;\x8e\x0e7\x1f\\@h$\xdf.\x8eoQ\xc7\xe2\x9f\x04\x18b\x02\x8a\x7f.\x1a\xc9"\xb3\xc9\xb9\xbe\xc2%\x18\xf7n\x93C\x88\x81\xa4\x18\x80\x8d!\x10\xc6\x82cw\x02\t\xbd\x8f1\x9a\xd3\xc0\x13\xcc\x1fF\xb1Z\xf6\xe4z\x10I\x08\x11W}9\x7f\x86\x9e\xb1\xc5\xefy\xdbD\xcc\x1c\x9b#\x9euT?\xf29\xef\x11\xbf\xb8x\x92y"II\xb5z\x95\x9eEYP\x16\xb3\x80y\xf8,\xa2_1\xe4\xbe\xee\xc0B\xc4\x13\r\xb3*\xf0*L\xe0j\xc9=(c\xa2sv\xe2v\xa2\xe2\x14\xe2\x14\xd9&Z\xca`\xcb\xd6"\x01\x17-\xef=\x07\x04m^\x00\'F\x10n\xafP-\xb9\xfe\xa8\xf4\x98%U\x9a\xfdO\x83\xc20lx\xf3\x05\'\xe0/W\x87\xc1\x82\xb3\x89l&\xef\xb3-\xa3\x98\xc8z\x12\xf5\x96\xadk\x93\x93\xece\xfa\xb5\xcdN"R\xfd\x8d\xb2F\x83\xcf=c\xb1\xf2o~\xf3\x9b\xbb\x18\x91Y\xba\xfc\xfa\xf0\x8cZ\x9e\nm\xa6l\xce\xe2\xbb\x9e\x0f\xc6\xe6\xd9F\x9d\x00f]\x8d\x01\xd0\x02S$\xe0\xf0\xd2\x81\xa7d\x02WH\xaa\x8d\x9e\x01\'\x07#(\xd1b\xc1\x1f\xb5\x94KcQ\xe2\x00j\xc4Nd\xd3G2P`\x1f\xd4z\xc0\x93\x05"\x1f \xd0qQ\x83\xde\x977!\x87\x80\xb9\x10\xa0Y\xd4Bt\xbc\xe0\x19\xa9\xa6\xeb\x05\xa2Y\xb4\x82\xb7\x8e;\xee\xb8j\xa2L\xa8\xfc\x8a\x9c\x90\xfc^c\xf0e\xe5&\xf7\r,\x16\xe7O\x9a\xcec}\x03R\xdd\\\xd76o\xc9\xac0\x00\xe0 \xe6\x9d\xbb\x08\x99k\xb5\xb5\xad\xeaS\xc2\x00\xd8\x127l\x16\xb8=\xb8\xb1m\xb3\xdc3\xf0\xf5\xed\xf8@\xb2{V\xfc\xa7}\xed\xc1\xb3D\xa2\x85#\xd2\xc1\xbds\x19Q\xf3\x03\xf0\x0bt\xdc\xa6\x16\n\x0c\xe1gS\x92\xb4\xd4\xe8@\xd6\xa3\x8d\x18\xf7\xa1\x80\x19AF6\x1afJs\x108\xc4U\xc5\x15\xb5%<)Q\xe1\xe6\xe8\xa3\x8f\xee\xb4\x90\xb2\xd4\x15\xd3\x05\xf3q\x8d66\xc6\x95\x97@\xcb5;Z\x0e\x9b\xdfF)\xd1\xf4y"xD\xad,8m\xac,)O\x90\xd1\xe00=L-\x88FVk\x90#\x97#K\x95\xdfaa\x18\xc0*\x8c`\x9bv\xdc\xab\x1d\x1f\x8f\t\x92\xa6[c\x00\xeca\x11p\x8bL\x00N\xf9\xfe\xba\x00\xe5!\xc2$\xb9\x85GC\xb0\x98\x04\x021\x970\n\x81&\xb4\x04*\xb5\x8dh\xb3\x03\x04\xc5_\x00N\x03d\xc5$\xa4\xdc\xea\x9a,\x9aps\x83\x85H|\xf9\x1a\x8a\xbb\xd0\xc8<\x97\xb2\xca\xad\xb4o\x0b\x9f\x1dO\xedw\x8d\xcc\x92\x9a\xc7\x87\x16#\xac\xd9\xf9RU\xdc\xb9f\x00e{;s\x0b\xe9/1\x00\xd9\x81\x9e\xa1g\'\x034\xe6N\x80S-\xceE\xe4cb\x00\xdfH\xb8\xd9Bo~7\xf8\xb8v|\xa4Yn\x87\xdc-H\xeeB\x9c3\xaa\xde\x96\xd1V\xfc\xe26\x01p\x8b7A4\x1d\xa99o\x81/\x97T\xb2R\xa7I\xf3|\xc3\xd0\x02\x04\x06\x916\xc2\xa7-\x18\xda\x82\xcd\xc6\xd6\x8f\xc5h\xa3a\x16PeQ\x83a\x0e\xc4\xa2\xa3\x82\x0b\xcaQw\xc1\x82\x9cF\x1b\xa0\xdeb\x1a\xd1\x9e\x9c\xe7\x81\x9b\xb2Vv\xdd\x82\x07J\x8aG\xe0\x03w-}-\xe1D2\xbaF\x1e\x8b\x8dl\xd5\xbe\xb9d}\x965\xfd<#fA\x1e\xce\xde\xf9\xf2\xda\xbf\x01~40\x19\x80\xe6\x99Y\x03\x1c\xad\xcd\x85t\xe0p\x96\xb5\xe3:\x8b\x88\x01\x18\xd7h\x87\xb4\'\t\xd2\x17\x86\xd4\xf3\xf0eLY\xccT\xc9\xbe\x8a\xc2er\x10\xb5\x97\xed\x0b5\x06\xb4\xc8\xd7&A\xfb@\xaa!\xb9\x07U\x07\x8at\xe1\xf2\xdem,\x12\x16\xf8\x04\xfc\xf3\xbd\xf0\xa5\xc7\xdc\x91\xfe@E\x12\xd8\xe7\x01\xac\xfa\x1e\xdb\x94\xcd)a\xc5B\x85\xbd\xe4\x1a\x81\x84#\x887I/sQ \x8e\xf3\xd8\xac@\xc6\x1aF\x13H\xbe\x01\x97 \xd9#Q)>\xc7\x84x\x03hx\x98\xd6\x89\'\x9e\xb8R\xddg\x08\x84\x01\xd60\x00\x9e\x98\xb2\xcd\xbc8\x00)\xbe\xeeS\xc0V0\xd2\xbe8\x00\xf8NZ\xa3\x16\xf0m\x9b\x05\xf3\x02P\xf5\x0fj\xc7\xa7c\xe3\x0b\xaa\x90+\x00@\xb1\x89\xa7\xa9\xe17\xa9\xb6\x9f\x85E:\x8a\xb5\x16\x1c\x03\x84\x89\xea\xac\xea\xecy\x18\x02\x89\x14\xdf$A\x01W\xf3\x9c?\x0f\xb9\xe7\xe7/\xd1\xf4\xf0\x99\xdbh\\\xa3\x16\xa4\r\xee\x7f\xf7^~\xdf\xdc@\xae1\x04\x0c\x93\x17\xc1{\x06iFZ\xdb\xe0|\xee\xe6\r`H2\xc3\x18Hzv,\xed\xc3\xef\xd5TW\xd7C\xd5\xf5=\xbfa3\xd42@]\xa3 \x1a\xd8\x00\xa6\x85\xb9\x94\x8cg\xde\xc9\x9a\xaa\xf9\xf1\xcd{V\xe9\xaa#.L\xf3\xc7L\xb3\xc6C\x08E\xf3\x9ar\xd0\x0cR\xdc\xc6\xf0\x19@\xb1\xf9!\x9azn\xfd:\xa4\x9b\x8do\x91\xe5\x9b~sB\x84\'E\x0e\xb2\xcb\xa8\xc8$Q\xa4e\x864\xa5&C\xcc\x012\xf3\\MW%\x19\x1b\x92\xdf\xbf\xd4\x04\x02=g\xff\xb3Km*\xf7L\xba\x86\x9dZ\xaa\xde\xceC\xcb\x8a\x04\x9c\xf0\xcf\x07F\x10\xbe\xf8<=\xb7/4;\xcemC+n\x12\x99\x8be\xb6\\\xb4@\xf7?\xad%\xaa\x1em\x84kr=L\x80Z$\xa0\xb5\x94u\xbajB\xc0\xd1\xd0\xcc\x8bp\xef`t\xc0\xbe\x9c9{~\xe6\'sq\x0f7\x14\xb8\xb2\xf9w\xc8\x01>\x086?h\xad5\xd2%\x19\x01t\x95\x98\xc1Rj9\x1e\x12)\x8f0\xb4X\xd9\xa7\x90\xf5\x94\x87=\xb7RGG\xa1\xe8r\x14\xd7_2\xccXH6yYO\xa1\xd4\x1eV\xcb\xbbX\x8d\x19\xc7wB\xad\xef\xd3\x0c\x82\xa9\xb8.\x83\xf9\x00\x04S@s\x889\x1d\xa2\xfb4\xfa\xa8i\xa0Y\xb7\xab\x15\x0c@\x00\x17a\x03s\tOO\x1e\xf6\x1d\x05P\x08\xc2\xac\xe0-\xf3\xf8\xba\xcd\x02\xe4\x02\x88g\xfeDH}}\xd5j\xad\x91\xd72\xd6\xda\xf4\xb3\x0cD\xb1\xe9k\x1b\x87\xbd=\xaf!\xc66\ns\xc5"b[[l\xa5\x0f\xbd\xcfL\xd8\x92L\xb6\xf6\x1cbD\xaar\xcc\xad\xb9\xb6\xf0#\x9c\x99\x84d\xcepO\x0e\x01\xec\x9b\xc4\x00j\xc9<y\xff\xbf 5(i\x00\x84\x0c\xec\x04\xae\xd2\x97\x0cd\xde\x98\xa9\x89)*\tv\xf3\xa13\x00\x01?\xa7\xc4\xe6\xe7.\x8aL\xb6K\xb2\xf0 \xd8\xb8*.\xecu\xad\xdc\xd8\xa4\x05K}\xe3\x0f\xcfK\x8e\x91P\x0f}\xe8C\xe7\xbe\xaa.\x15\xd3"\x01\xc6\xd1\x06r)L\xa3\xc2\x18\xa2n\xc2\x964\xa7\x96*\xad\xd5\xcd{\x942\x8b\r\xcf\xf4\x88\xf4^\xd7\x10\x9d\x8dy\x03\xa4>\xdb<C\xcf\xe3\x00X\xe6m\xd9bX\xdbec\x19\xa9\xc3\x18\x1f\xe6\xcc\xcd\xc9$\xb0\xc1aP\xabd\x03\xb2%n\xda\x0c8\x15X\x85\xdf\xb7\x05\xea)\xac3\xafz\xd37\xa8\xad\xd4#\xa3\xa6RF\xb4\x14\xdb\x91-F*\xf2\x89c.\xdcc\xd3\x80\x88\x16(&\x90\xc7\x19D\'aj\xf6<\xa3\xd1\x16\x8f{\x17,\xc3\x8e\xe4\x12\x85\xecG\xd8\xaf(<\x18\x80\xc8\xb3r\xfe|\xaf\xac\xc0S+J\x11\x0c\xa5\xd6_1\x92\x90\x02s\xa8\xf5\xc8\x0b\x06dC\x88\x83\x87\xf5\xd8\x08\x8bB\x80\xcbZ\xd3[\xf7[\xe6-\xe8e\xe0}&\x1933\x98\x1f&^\xd3\xce\x06\x9f\x0b\x901\x80\xdd\x98\xae\xee\xc4b\xad%O\xe4\x83/\x99\x0bO\xcd|\xc4\x95g\xd2j\x93D\xfa\x95\x19n\xc0\x15\xee\x19q\xe8\xb5L\xad>\x900\xdf\x046\x91 \x9ay\xe9@\xb3\x9a\x8b\x90\xab\x93\'\x83d\xb1\xc8\xb8\x9a\xb8\x97\x14\t\x81\xeas\x13br\x18\x82x\x02^\x80\x00\x9c\xc25G2\x05\x00h\xae\x81y\xce\x87Q\xe4Yz\xd0{\x92<\x80T\x7f\x8b\xdc#\xd9\xfd\xed\xb3(\xd9\xe5w,d\xea0\x95w\xd1\x88\x06P\xc3W\xccs\x19j\xed\xfeyWh\x01\xbc+\x01\x02\xf2F\xd5\xd6d\xd6\x19H\x87\x97[4\x03\xad\x06t\xa9f9\xf3\xaf\x03\xaf\x14\xab\xa85S\x8cMG\xda\xc3\x06J\xe4\xdb\xa2\xed\x0b\x1c!\xfd\xfbH5\xddi@\xac\x92\x01\xf8=\xde\x82\xa1\x14\xd5\x0c\x1b\x13vA\x13 \xf5\xb9\xa70[\x92\x97\x7f]\xd8\xaf\xf4k!\xaa\xfe\xe6\x8bVv\x8dF&"\x90\x16a1b\xc0\x91^\x8ci`\x004\x86\xa8\xc1\xc0k\x00{`\xc7z\xcd\x96\xf7LIB\x0c\x17\x03"\xf5}\xe6\xfceR\xcc"\x11\x01Q[\x9b\x18_\xd9\x19\x88\xe6\x831\x98G.V\x1a\x1c-\xa0\xd6\x1b\xd0\xe0\xc5\x89\x10\x82v\xdcd\xa8\x0c\xe0\x8e\xcdr,s\x17\xdd\xd5\xd7\x91\x97\xdd-\xf0!K\xa0\x10\x00NW\xbc\xd0\xc2\xe6\x9f\xaemb\x00J\xca\x98\xda\x84D\x03F\xaa\xa5\x05\xcd.\xae\xa9\xa9501\xfc\xea\xe2\xda\x87B\x16\x13)\x83\t\xa8"l\xb1\x91\xfc\x18\xeb\x83\x1e\xf4\xa0N\xab\x12Ui\xd1\x96\xd2\x98\xd7\x83\xc6%\xb4U4\xa5\xdc\x02LB\x8a6\x86\x02\xb8\x8b\xb8\x02\x05=`$\\\xaa|\xfd4\x85\xd0\x18\xfc\x8e9W\xb4C(\xec\x90\x82\xad6\x87T\xfe\xade\xaa\x9a\xf7<\x12\xd0\xb3\xd1\xfbA\xfe\x83= \xcc9\x18\x00\xa1X[\x93\xe2\x03\x06\xeb\x05\xc8\x18\xc0\x1b"b*\xc2S\xfbl\xf9l\xf3s\x13\xde\xb9Y.\x84\xf8\x1b\xc9 "\xd5j\xa1\xc0Y\x0f\xf5M\xc8\xa2\x16p\x11\xa6\x83\x07\xe5\xc1P{\xa7\x01\xb7H@E,\x86F\x16\x95M\xce\x8d\x04\xc7 \x9d1?\xf3\x05\xf0\xa4\xae\xdb\xbcZ\xa4\x01\xaa\x84\xf4\x02\xa4\x0c\xe6\x14\xd5\x15\xf34\x7f\xa2\xd9\x98R\xc2\x88mv\xcc\xc0\xe6\x87f3\x17\x9c\x93\xc6\x00w\x11\xe7/\xaf\xc01\x8bR\xa6m5b\xda\xd4\x18\x00\xcd+\x07\x01\xcd\x87pnL\x19C\xa6=\x85\xe0\xf2\x1cj\xf1\x15\x18@\x9a\xc7\xff\x1e\x9c\x17 m\xfe+3\xe1\xdd\xc1\xb1\xc7\x1e\xdb+}\xa9\xabY#K\x99\x80\xdb\xa7\xe3\xf7k\xc7\xb9\xec\xdbZ\t)\xe7c\xe3\xf6-6\xd2\xa7l\xbch\xd1\xf6]G\xc9\x00\x00\x89C\xed\xaf\x87\t`\x8c$\xd4\xc3\x1f\xfe\xf0N\x82s?\t@\x11\x8dF\xa3\nf\x80\xb9\xc2;l`>y\xa0\xa8\xef\xd0\xc8|\x8fZ\xcf\xce\xc7<\x1d\x03w\xf1<\xa8\xfe\xb4\r\x8c\x86y7m\x1e\xc1"\x91\xc2\xa4\xb5\xcd\x0b\xb3"\xf4r\x06 \xb0\x87i$J\x92}\x8f\xc1Z\xa3y\x91\xdc\\\x03\xcd:g\xab\r\xbe\xeb\x10\x19\x00\xe0\xe2\xfb\x16"\x89\x91\xdf\\\x1e0\xa1@dhT)V \x8e\x7f\xc6j\x18\x80T\xd7Ij\xa6\xb8\xf5\\\xe2\x07\xba\xcd\xae\xcd\xe3\xd2k\x98\x00uv\x11\xecWR\x9d:\xce\xf5\xa6V iN3\xc2\x0c\xb8P\xa9\xf4\xf0\x0e \x1e\xccD`\x16{\xde\x9cc\x82\x98\x03@\xd1\xf7-\xca\xc3\x0f?\xbc\xab1 \x88+\x18\xcd"\x95e[\x0bY_e\xcc\x85!\xdc\xb7\xec\xce\xacz\x153\t\xc3U\x03\x80\x96\x05\xbf\xa2Q\xd5\x98H\x96\x0ctA\xd2\x86\x07\xa7\xfe\xdf\xc3\xfas\x93\x16W\x8d\x01\x00\x8aR\xe6\x9e\xf8\xdb\x03\x8b\xc0\xa1\xae\xed\x8f\xd8\xfd\xbeHA\x0bq\xd2\xe2cV\x08K-\xddY$\x9aE\xde\x07\x0e\x02q$\xc6,\x1a)M\xcd\xd6\xa7\x9e\x8aT\x03\xd2\xa96\x0c\x08\x94NL\x1a\xd1\x04\xa4\xab\xc2l\xa8\xaa\x00+\xcf r\xf3I\xae>\xb3kk#=/k\xb1\'6u\x1eRn\x8d\x02ai\xbb>\xb7\x1f\xec\x0bZS\xd9\xd9y)k\r\x96\xe6\x99\x14\xba\xeb\x10\x19\x80\x8c\x87\x8bdA\xd5\xaa\xff\xc6D\xa5\x9b<+\x05\x0b\xe5\xc7K\x16:\xdf\xf1\xd4\xcfZd\x9b\xc9[M\xed\xa4\x06S]\xfb\xfc\xd4yN@\x04\xb60\x1d\xa2\x05\xf5\xa2Q\x14\x00\x89!\x96\xc0\xa6\xb6Hmp\xea\xbc\x98\nf\x1b)&\x16\xc2\xd8Z\xa5\xfc$b"\xd6R\xa0\x99MyU`k\x1c\xb3`\x8e\xf9\xdcz\x04\xc4b\x12L\xaa\x1a(\xaej\xf6 \xe3\x00\x9a\xa21(4\xb4\xb6\x81\xfdO\xe5\x8c\xb9lR\xc2C6\xf6$\xc4q\xca\xb2\xf6\xba\xe3\xb9\xa4\xa2\xc3\xcaj$(\xa3\xaf\x0f{\xce\x90pf\xa5\xb8\xe6\xa1\xe6\xfc<\xe0\x08#M\xa63\xcf<\xb3\x03\xf6\x96*e\xc1\xf3f\xb7\x98.\xad\xca\xfb\xe1\xbd\xa2\xf9b\x0c\xc1\x14J\x0c\x80\xd7 \x91l\xc0[\x0f\x91\x01\xecc\x03\x93*l\xa2\xda\xc6S\xcb>\x05Dp\xe6?\xa0`\x00{;\x1e\xa7d\x8f\xd7&I\xd1\xcbi\x17\xaa\xebP<\x847\x02.\x00\x8d\xc5i\xd9e\xc29\x99\ne\xfc\xf6H#M\xa2O|\xe2\x13U/\x00\x81\x95k\x904-\x18\x80\xf8\t\x85S\x14o\xa1]1\x01\xf2d\xa0|\xc0bR\x90\x1b\x97\xf8.C\x04\x01\xb9.\xce\x02\xd2\xf5U=\x81\x88f\xa5\x93>\xdc\x8e\xabg\x0c`/\x0c\xc0\xf1$}y\xac\x8dk"\xd7*\xa9\x04hD\xf5a..\xbeqA\x1a\xf3\x9c\x06<\xd2|\x92@\xb1\x9a[\x99\xc9\x9b\x9b\x00\xd6(\xbc\x85{P\xa0\x14\xb5\x9f\x96i\xcd\x95\xcdA\x03\x84\x16.\x9c\\\x85\x18\xc0\xed\x86\xc8\x00\xa8\xf4\xca\x19uQg}\xea\xb7\x88\xa7\x84\xe4\xdb\xc9\xf2$\xaf\x94\x8e\xa7\x11\x9c\x0b\x03\xe0V\xa9e\xf3\x89\xa2\x1a\x01\xa9\x91fE\x80\xbdZ\xbdJ&on\x02\xd0b!\xff\xc2\xa4\x05J\xf1\xc2\xa8w\x08[\x11\xa9Y\xdb\x17\x84\xde M\x80\x8c\x01\\\xbe\x1d\'\xba\x03\xdc\xafDK\x03\xc8\x03\xce\xf1\'\'\xc2\tt\xaf\xb8S;\xc4B\x9e\x0b\x90\xca\x0bb\xe6v;\x84z\xa4\x91f\x89\x01\xe4\xcd\\c`\nyI0BJ\xcc\x00\xe9Oc\x805\x89oa\x1a\xa8eY\xd3\x00\xb28\x00 \xe0\xce\xcd@#\x01\x1faS\xf3\xa7K,\x99\x94\xd6[\xb4S\xfey\xe2|\x17J{\x15\xb0R\xcb\x08\x14\x81\xb6\xb5\x05\x9f\x8c4?$\xfb\xb4\xe6]\xe2\x19\xc8\xb3\x01\x01~\x82\xac\xc4S\x10f\xfe\x8f:\x08e2P\x14NQ\xae.i\xc6\x10\xe9;\x0c\x95\x01l\xd7\x8e\xce\xa1.\xe0gR\xe5\x1f\xdcQ\x0et\xe9~3Q\xb8l-\x1b\x10P\xb2\xe8\xf1\xe6#\xcd/\t\x15\xb7n\xcbu\xc9\xcd\x977\x06a\xcbG\x15\'\xd9\x99\xbc_\x84"l\xa0\xaf\x1e\x00\xa1\x97*S\r\x0f\x04,\x98\x80\xac\x86\x8b\xd8A\xec\x9d\xdc\xe7^\x06\xe2@\xe5\x01\x86\'\x9dt\xd2J\xc2\x8aH\xc0\xbc`\xc7RQ|qd\x00#\xcd\x8adW\x96}\x01\xaci\xa1\xd2eO\x03y\x12\x02\xdfh\xba\x18\x80x\x0bk\\\xa4e\x1f\x03H^\x00\x1a\xc0\xed\x87\xcc\x00~\xbf\x1d\x9d\x7fM\xf4\x19i\x8e\t\xc0\x04\xfa\x8av(fas\xbf\xf3\x9d\xef\xec\xb2\xd2\xfaR\x88\x85\xb1\x8e\x0c`\xa4Y\x91h\xd12\xa4\xdc\xda\x96w\x91\'\x03\xd1\x00\xc4\x01p\x03J`\x13k\x82Ax_\xb4e\xcd\xbc\x95\x8f\x91\xe2Q\x84\xca\xde\xa5\x19xI\xb0\x87\xb5\xa3cg\xa4{\xad\x92jm\x88\xb3\xae\xd5\xc2\xcfU\xad\x91\x01\x8c4+"\xc5k\x12\\\xacI\xae\x010k\xe5\rH\xb3&\xdc$PEI4\xa6A\rG\xc0\x00R\x98\xbcr\xc9\xbb\x0f\x9d\x01\\\xb6\x1d/q7nZ\xa7W}\xe2V+\xd4\xb1\xda\xe7Y\xca\xe4H#m8q\xe3irZ\xaeKy\xffy2\x90`7\xc9SL`AB\x02\xd2\xc4\xa3\xf0\x0e\xd4\xe2\x00\x0ca\xeeYw\xe0\x9d\x9b\x05\xa8\n,\xc8G}\x80\xae\xd0\x1e?\xa9*4\x18A\xf4\xac+9\xe1\xa4\xaa\xbf\xd4&\x934j\x00#\xcd\x8ax\xa8j\x8dAD\xfb\xe5^\x00BJM@]\xae\x04\xaf\xd1\x82\x95\xba\xc3@h\xb15\xcdWa\x96P4\xda\xb1c\xb3 }\x01.\xd7\x8e\x83\x9b\xe52G\x1dg\x84\xf2+\x96 x\xa2V\xc1\xb6\x8f\t`\x002\xa6\x86\xd4If\xa4\xc5"k\xb7Lt3\x84\x96\x97\xbd\x01\xc5\xba\x08\x1bV\x00DF\xa6\xa1\x08K-\x97\x800\x94\x9d\x99\xa2\\\xd9\x01{4\x0b\xd4\x19h)\xa94Z\x9f\\\x10f\x81\xac=\x95\x81\xe4\x07\x08\x95\x947\xcdgj\xf4U\x11VNi4\x01F\x9a\x15\xb1\xf3kx\x96\x82\xa9\xb9\x06\x00\xedWO!\x82\xdet\xb5\x96\x85\xe9}^\xafZJ\xb1\xf6\xe8\xc9\x0b0\xacz\x00k`\x04Wm\xc7\x93\x9b\xe5\xd6G+\xb6\x12\xdf\xa7()\x08(?\xab\xce\xbf\nS\xd4\x18\x80P\xe01km\xa4Y\x11_\xbf\x94\xf6\xa5JI{\xee\xeb f\xaa\x8a@\xcc\x05\xad\xdeE\xc62\x81mp!\xc2\xb5\xe6\xaa\x18F\x8a\x03\xf8\xd9`\xbd\x00Sj\x037h\xc7s\xdbqF\xbaY;\xfa\xfc4\xba\xc4\x9dZ\xed\xf5\xc8&\x1c\x19\xc0H\xb3"\xa1\xc00\xac\x9a\x1b;\xefx\x84Q\x88\x04\x14\r\xab\xd0\xca\xdb\xdf\xfe\xf6N\xb8\x11rJ\xab\xd5\xbc\\\xb4\xdb\x14L$2\xee\x8e\x0b\xc3\x00z\x98@D\r\xea!\xf0\xf0v\x08\x84>\xd3\xddS\xa5\xca`\x8b\x18&u\xa4\x91fE\xf2T\x00\xd8\xa5\x1f\x9f\xeb:/o\xcfL\x15\xdb\xaf\x1e\x80\xfc\x15Y\x84\xe2\x04x\nj\xf5.E\xbdf\xf91\xc3K\x06\xdaL\x06\xa0\x88\xe8\x9ei\xf3\x7f\xd3\xbc\xb9{I\x15\xb5H@\t\x13\xd4$\xe5\xaa\x02T\x89\xe2\x94#\x8d\xb4\x11d\xcd\xd9\xec\xe5\xda\xe4\x1a,\xbb\x1d3e\xb9\xad\xe1\x06\\\x80\xeaSx]k^C#\x10\x04\x17PC3\xc4\xce@k\xd8\xfc\xdb\'\xa9\xff\xb1v\xfc*GX\xe5\x06\xf0\x93\xf6\xf5\x13\x88\xd6T\x80Bv\x17\xff\xab\n+\xda-\xe1\xb2#3\x18i=\xe9\xdb\xdf\xfev\xe7\xf2\xab\x15\x05-\x1b\x83\xb0\xfb\x95cg\xfb\x13j\x12\x89\xb8\x11k\x05oy\xbd0\x8c\x85\xd3\x00\x9a\x8b\xf7\x0bT\xe4\xe0\xa5\t\x04\xec\xec}\x81\x11\xea\xacq\x95\xd4l\xabiF\xb4j\xa2\x9a\xa9$$\xe8B\xed\xfb\xdc\x1e\x13\x85\xa5\t\x06.l\xccs\x0f\xc0\x91\xe6\x97\xac\x9d\x9a\n\x0f\xb3\xca\n\xddt\xebZ\x14\xa0*T\\\xde\xea\x08\xbc\xe1\ro\xe84\xd6\xbcT]\xde\xea]s\x95\x8c\x01\xdcf\xf0\x0c\xa0\x90\xfaOI7\xd6\x11uI\xc9$\xae\x0f\xa9\xc1\x97\xb4\x9bm\x1e; \xc1H^\x81\n@\xa7\x9ezjW\xfaK>vt\xbb\xc1\xad}\xee\x81\x8c\xb5\x00GZ\xab\x06P\xf3P\xf1\xf7k\x1c\x1a\xa4G\x00\x17\xb7\xc6*\xbaMq\xff\x11@\xd6\xbd\xca\xd6\xb5\xc8W\x95\x9a3\x13`\xe7fA\xe2\x00\x84\x04?.6\xbf@\x08q\xd1\xaa\xa4L\xd31xs\x18A \xacJ\x88E\x05WIHez1 G\xa8f\x19\xc01\xd2H}\xc4\x86/\x0b\xd6.\xa5\xa2\xa0\xb9\xd6\xc9\xdd\xf7\xeew\xbf\xbbK\x04\x12\x11\xe83  7\xdf\x01\x07\x1cP]\xbb\xbe\xbb\x10\x1a@!\xf9\x1f\xdd\x8e_\x04\xf7$\xf1kA\x10[b\xe3\xe7\xa3\xacBT{\xdfP\xaf\x00G\xce}\xb8#\x8d\xd4G\x04\x18\xdc\xa9\\\x7f4\xcb\x94\xc8\xd3\x11\x89\xcfc%\x0cX\xfdIk\x1f\x03`\x8e\xd6\x8a\x82Z\x8b"\x01\x13\r3\x1d\xb8\xb2\xf9\xef\x06\xdbsG\\$T"jx\xad\xd0\xc7\xb4\xc3\xb1\xe2\xa6k\xe7\x98&\xd1H\xd6V`\x06\xf1}\xe7\xe2\x9b]\xd4\xbe\x00#m9\xe2\xc6\x13\xdf_c\x00\xb9\x17\xc0Fg\xeb\xfb.S\x14\x10\xa8S\x13&\x11\xc9@\xa5P\x12\xe6\x9e\xf2\\\x9c\xe8NCg\x00\xdc{\xff\xeenHW5\x01j9\xd0K\x95\xca\xbf\xa2\xa4\xfa\x98\x04\x95\xdd\x84\xea\xb7\x0e\xfd\x17\x95eC\xf7y\rj\x80\xa16a\x98H^\xa8D,wQ\xa2l\xa4\x916!1*\xb5z\x95\xd6w\x8e\'\x01\x99\t\xbc=\xf7\xdc\xb3\x0b\x1eb\xff\xab%\x10\x8c\xa1\xa6\xad\xaa\x13\x90*U;\xd1\xae\xcd\x80\x0b\x82\xdc\x92\xc6\x1fh\xa8\x1b[mc\xf2\xfb\xe3\x8c\xa2\xa5\xde\xf1\x8ew\xf4\x16\x0ea?E$\xa0ss\xfb\xd1. \xa8\x92,l\xeei\x18\x01\xa00\x98Lt\x07b\xdb\x95\xfd\xddF\x1a)\'\xee\xbcZ\x90\x1a`9\xd7 1\x00\xa1\xc0\x8a\xdbX\xa3\xdc\x7f\xf2\x01h\x00\xc0\xe7\x9a\xc0R98\xe5\xb9\x0c\xd3\r\x981\x00a\xbe\xdd\x8d\x8b\x86\xaa\xb5R\xca%\xbe*\xa9\x12\x83\xa2N?\x04\xb5\x96ri\xc3\xbe\xfa\xd5\xaf\xee}8j\xae\xb1\xa3\xa6\xf1(\x94f\x84\xd8\x02%\x99p\xea\x91F\xea#m\xd8k\xeb\x99\xaa\x9fk\x00\xb0\x02\xb1)\x12\x7f\x94\x11\xc3\x1ch\xad\xb0\x00\xcdVk\x1a.\x06\x90\xf6\x80\x9a\x80\xb7m\x06Z\x14\xf4Z\xcdr\xd7\xdf.0\xa7\xaf\xb4\x97! B\xdd\xb4\xac\xce?\x03\xe8"\x12\x9e\xfaT\x8b\x96z\xc1\x0b^01\x1dX\xed\xb5i0\x81\xf23\xfeZ\xd7\xf3\xa1\x0f}h\\\xe5#\xf5\x12;\x9f\xbd\xbfTi\x0c\x92{\x01\x00\x7f\xdc\xcfbS\xe4\x01`\x00\xf2\xfd\t\xb7Z\xd3\x1b\x0388\xd8\x82 \x19\x03\xb8/\r\x884f\xaf\xd7Z)G\xd0\x8e\x90\xde\x8c\x14A8\x86\xe2\x00A\xed\xab\x9a"\xb2\xaa\x8f\x01P\xbb\xd4\x0c\xcc5\x86i\xb0\x81`\x06p\x00\x01\x1b#\x8d4I\x03P\xe7o5\x06 \xaaU\xd6\x9f\x069:Q\x01\x01\xb9\x9b\x05\x12\xd5z\x03\x1a4\xe1\xb4\xb6\x07\xcd\x00^\xe5\x0e\xbe\xf2\x95\xaft\x01>\x8a%\xd6\xd4\xef,\xe8\xe17IcxL;\x9eJ\x03\xc0e\xd5G\xabm\xd4\x97\xbf\xfc\xe5\x13]4\xbb\xed\xb6\xdb\xc5\x18\x00\xc9\xdeW_\xb0\x8c\xc4\x82C\xe8\xfd6\xd2H}$\xdcW\xe6_\xcd\x04\xc8\xbd\x00\xd6?\xbf\xfe\xcb^\xf6\xb2\xe6\xbd\xef}o\x17\x17\x00\x0cw<!V[\x8b\x1a\x88\xa6\x08\xd5\xc1\x9a\x00\xdb\xb6\xe3\xb3\xee@O\x80\xe8\xa1\x16~\xf8\xb8Q~\xf7\x94\xf6\x08\xf1\xd0\x1al\xbbt\xfcs\xc2\xd5\x12\xcdE\xf3\xe30\x0e\xb9\x02}D}\xca\x9b\x8aFP\x10\xef\xc3j\x9a\x80\xc2\rT06\xdaH#\xf5\x91\x8d\\\xab\x07\xc0\x0b\x90\x83\x80:\\[\xab\x86\xf4vkZ\xa4 \x10PB[\x9f\x87k\xb0^\x80\xe6\xb7\xe5\xc0\xbb\xda\xc8\xba\x9c\xd4lpL\x01\xd2\x9f\xe8\x83\xd9\xe6\x8fJ\xc2\x17p\x9b\xd4\xd4,\x9e\x01\xdct\x12\xb1\xb7\xf2\xcd\x1e\x81@\xb4\x11\xe5\x9c\xfbb\x08\x04\x04\xa9\xd6:&\x13\x8d4\x89\x08.\xb6}Mz\xe7\x8dA\xc4\xfc\xab_\xa9\x1c8\xa2\xfe\xf3T\xc1\x00\xd4\xb4\xa81\x00\x19\x85Yw\xe0\xe14\x07\xcd6\xb0R\xc6g\x03\xf5\xa8?\xa5\xeam\xf3i\x91\x94\x1a\x80\x00\xfc\x1e\xdc\\<p\xa8\xf3\x1e\x88\x98\xb2ak^\x80,a\xa2J8\xacN,eG"\xbe[R^\xccvy]\\\x82J\x92q\xd5\x8c4\xd2$\xa2\xa2\x8bf-\xd7\xe6]\xefz\xd7\x95\xc66H\xda\xb0\xb4\xdf#\x8e8\xa2\x03\xb9\xd9\xfe\xbc\x00\xbcL}\x18\x80\xe2!\xa9"\xd0\xb0\xdc\x80\xcd\xc5\xc3~/\xe4\x0e\xe1R\xabIZ-\x903\xdb\xff~\x05\x03xQ\x98\x00\xf7\xbe\xf7\xbd\xab\x93$\xb4r\xb5\x9a\x80\xb8\xef~\xfb\xed7u\x08\xb1\x1ao#\xf87\xd24\x04\xa4\xcb\x93y\xa2N\x85\x9e\x9598-\xb5\x97\xc0\xb1^\x91B"\xf0%\xb9\x04}&\x80\x04\xb5d\x02\x0c\x0b\x04\xcc6\xf0\xa1a\'\xa9\xddW\x8b\xfc\xe3\xa6\x0b3\xa9\x1dw/\x18\xc0\xd3|\x00M\xcd\xc1\xbc\xdc\x048\xe6\x98c\xa6zP\xec-\xb6Z\xad\x01C\xee\xfa\x13X\xe4\xe1\x8c4\xd2\xb4D\xc3\x14\xadj\xfd\x10 ^k\xf8\x19D@\xd1\x004\x10\x91\x12\xeco\x00!\xd3W\xed\xcb\x1a\x86\x10\x0c \x99\x11\x83\xd5\x00\x0ej\xc7\xf9\xd0\xf8Z\xc6T\xa8J)`\x82\x18\x07\xb9\xdf,;\x9eIp\x1e;i\x87\x1dv\xa8F\xefI\xad\x9c\x96\xa8S\xc0H\\\x18\xc0\x02\xa8\x11\n|\xb3\x9b\xdd\xac\x8b\x1a|\xeb[\xdf\xbaI?\xb7\x91F\x9aDb\xf5\xb9\xf6\xca\xeeU\xd6W\xc4\xb3\x90\xe2\xe2X\xe4\x9d\xd0x\tD\xa6\x83\xd8\x00\xda\xed\xc1\x07\x1f\\\xdd\x1b4\x8bD\xff\xda\x8e\xeb\x0c\x91\x01\xdc\xb4\x1dg\xe2x\xb8d-\xe1\x81\xba\xf4\x96\xb7\xbc%\x9f\xd3\x97g\xc7\xdf\xdf\xfc\xd1\x00jUSL8;js\x08\xb8\x87\xb1(\xda\xe0A\x8c\x89?#m\x0eY\xdb\x87\x1cr\xc8&\xe6-\\ LS\x81l\xd1\x17PX;\x86\xc0<\xa0i\x8ax\xed\x8bq\x112\x1f\x10B\xb3\x1cP78/\xc0\x9d\x9b\xe5\x8a\xa6+\xf1\xceR\x7fK\x17\x9c\xca?\xdf\xfd\xeew\xe3f\xd5Qz|;.\xd5\x8e\xfd\xecU\x1b\xb5\xe6k\rN\x9b\x83-#\x8d\xb4\xd1\x0c\x00\xc0]\xae\xe9l\xf3v\x9a\'L\x89Y\xc0\x14\xb5\xf9\x81\x80\xc7\x1e{l\xd7\x1d\xa8f\xde.\xa5\xbe\x97\x83\xc4\x002\x06pHL\x82\x04\x1d\x9d\x7f\xfaBr\xb9B\xb2\xc4\x1b;ZIT\x15\x11\xce\x05\xe2Q\x9fj^\x00\x934V\xf1\x19i\x96\x0c\x00\x8eU&\xab)\xe9\xbd\x82n\xb7\x9b\x98\x16\xcb\xffO\x989\x06S\xc0\x0c&\x81\x80\x8fz\xd4\xa3\xc2\x8c\x18^Y\xf0\xc4\x00\xee\xd1,\x071t\xc4\xaf^\x0b\xc0\xc1\x10L\xa0\xa0\x9d<|2y\x06.\xea\x8b\x03`\x028f\xd4\x00F\x9a%\x1du\xd4Q\x1d\x00\x98\xafM\xee\xbe \xf6\xfe\xc9\'\x9f\xdci\xc1\xfe\xc7\x00\x84\xc6\x8b\t\x98\x14\t\xa8&EZ\xdb\xc3\xeb\x0e\x9c\x18\xc0\xa5\x93\x1a\xdfE\x03\xf2\xe7\x0b\x91\xe4\r(s\x02"@\xe7\xeew\xbf{\xe72\xc9\xc18q\xd3\xb58\x00\x83\xfd\x14Y\x83#\x8d4\x0b\xa2\xde\xe7\x8dk\xacc\xea}\x10$_\xea\xaf\x80!-\xc2\x11\xdc\xe9y\xcf{^\xf7>\xcf@mm\xcb\x1cL\x81hT\xe3[6\x03\xcd\x05\x88J@?\xc5\xf9\xe4D\x0b\xbe!\xf1m\xfa\x9aF cP\xd1N\xdf\xc5\x01\xa9J\xb5\xda\xeb\x06\x04ul\x0e:\xd2,\xc9\xfa\xcc[{Y\xd3\xd6nN\\~bY\xb8\x03\x11M\xd7{\x86\xa4\x9f\xda\xda\xde\x7f\xff\xfds\x06\xb0S3\xe0z\x00\x97o\x07\xb8\xfeB\xb6\x0f\xf7F\x14\xe0(\xf3\x02"B0\xc2qi\x04*\xa9\xf6U\x04\x02\xb6\x8c\xe1\xba#\xcd\x92N?\xfd\xf4M\x92\xdc\xf2\xf8\x14\xebS\xd5*k5L\\f\xad\x92`\xbcOjZ,\xf5\xb4\xbdK\x18\xc0\xf0\x92\x81*L\xe0\x1a\xed8\xa5\x834[\xf5\x1e\x13(\xed\xa6\xbe\xe0\x9c\xbe\xd2a\x98\x82\x88\xab\xac~\xc0H#m8\x9dr\xca)]^I\x1f\x03\x10+@\xd2\xc3\n\xa2Y\x88\xe4 5\xffh\x0fz\x05\xd6p1\xef\'\x92Os\xbdf\x01\x8a\x82\xde>\xddL\xe7\x06\xd1\xfc\xa3VO\xad\x86\r\xf4}.\x97 \x15N\x1ci\xa4\x99\x10\xa9.\xa8,_\x97\x82\xcarO\x81~\x14$\xbd\xde\x17\xe2\x02\x04\x03=\xf5\xa9Om>\xf5\xa9OmR\xec&be`\x04\x89>\xd7\x8e\xdfm\x16\xa4,\xf8}\x9a\xe5\xbe\x7f\x1dAE\x85<\xc2\x05B\xaa\xaf\xa5Jp\xeen\x19i\xa4Y\x90\x98\xfeX\xbf\xe1\x9d\xd2\xfd\'\xc8\x86?\xf4\xd0C\xbb\x80!\xc8\x7f$\x03\xe9\x87\x01\x14T(\xa4\xb6\xb6i\xb7\x89\xe4\xa4\xffA\xb3 \x8dA\xa2H\xa8\x18\xdes\xc2M\xc2\x1e\x12\xd4\xa32\x10\xc0\xcf\xff9#\xe8+\xe7\xc5\r8\x9a\x00#\xcd\x92>\xf7\xb9\xcf]\x0c\x04T\x88V\x01\x90\x9c\x14\xae\xa1\x01\x9cu\xd6Y\x9d\xc6\xaa\x9a0\xef\x01o\xc0\xf3\x9f\xff\xfc\xde@\xa0\x94\x0b0\\\x0c`\x02\x13\xb8B;\x0enR\xa4`\xd8E\x18\x81&\x8a"\xa4\x04X\xe0\x8e:\xaa\xe6n\x96|\xc8\xf2\x1b\x19\xc0H\xb3\xc6\x00\xf4\xb7\x885\xc9e\x9d\x17\x93e\x02\xc8A\x11\t\x18U\x82\x14\x9a\xe1\xee\xa6\t\x08\xf8\xa9\xc5\xb8X\xf7\xf6D\xda#wh\x16\xac9\xa8!\xdc\xf7\x80v\xbc\xaf\x1d\x9fo\x96k\x02lB"\xa8\xfa\x18\x80$\x9e\xbc\x03\xcbH#m4i\xf9\xa5\x9au^\r(\xaf%\xc1\xf3\xc5-\xc8\x0cP\x06\x0cC\x90\x05(\x06@\xf4k\xad\xa0H\x91*\xbf\x18\xcdA\'0\x02\x01C\xbf\xd7\x8e\x03\xdb\xa1\xc2\xc7G\xda\xa1L\x90h\xa0\x8b\x04\x10\xf5\x81\x85\xd2\x8c\xc7@\xa0\x91fI\xa4\xba\x1a\x12y\xb1\x99\xbc30\x95\xdfF\xe7\xfd\n\xc0\x1aS\xc0$\xc4\x05X\xc3\xb5\xba\x94"\x04\x93vk\x1f\xdcj\xa1\x18@\x85\t\xe4Z\x81\xb8\x81+7\xcbMD\xcf\xe5:\xd1l\xb1\x86\x94\xe6y\xd7#\xad\x1fY\x88\xd1\x80eZ\xf2}AZ\x8e%\xf5JF\xed\xbd\xbeb.\xb5\xdf\xea\xfb\xfdY{\x810\x80\xbc? \x13\x80m\x9f\xcf\x9d\xef`\x02a\xae\xf2\x02\xc8\x0b`\x02\xa8\xff_\x13n2\n\xd3\xbd\xfd\xa0\x19Z$\xe0\x16`\x04\xc6]\xdb\xf1\x0b\x8b(\xe2\xa5\'\xa5]n\x0e\t\xd2\x00\xb4\x98h\xaf\xe3\x7f\xb1\xda\xd25\x95}\xa6\xb6Q\xd7\x806\xca;\xd3H\x80<\x1e\xa8\x80\x0e\x83\x19\x82\x9b\xabA\xf8\xba\xd7\xbd\xae\xfb\xff\xa3\x1f\xfdh\xd7W\xc0\x90\xf2\xac\xec9\x7f0\xd0\x08\xc6\xe1\x7f1\xe3RD\xbdf7:\xbf\xf3\xf9]\xe7\xb3H\xa0\xcc\x10c=\x13\xd4@\x94}\xc6G\xac\xcb\x0cT\xd9wu\x9c\xf5;^\xc3Q\xd4\x9c?\xe1\x84\x13\xba\xef\xb8V\xee\'\xb1\xe8\xee\x81K\xca{\x1aT\x1c\x7f\xfc\xf1\xcd\xbb\xde\xf5\xae\xce%\xcbu\xc5.\xe5\xc3\xa6\xd6\xaa\xe3(\xd7\x9d\xa7E\xc8\xb5\xc0\x94\xf7\xbc\xe7=\xddw\x84\xaf\xfa\x1d\x01.\xeeUUg\x98\xcd\x8b^\xf4\xa2\xe6\x9d\xef|gw>\xf5\xee!\xd9"\xda,r\xde\x1ei\xe1\xdc[\x9adp\x7f\xbd\xf8\xc5/n^\xf9\xcaWv\xe9\xb2\x8e\xe5+\x87\xa0\xfb-\xefq\x93\xb9\xc6\xf7\xbf\xff\xfd\x9dM\xecs\xf3\xea\x18\xcc\xdf\xfd\x89)\x91\x16\xee>\xcc\x8f\xff\xfd\x8e\xf3\x01\xde\\\xa3\xfbw}\xda\xbd\xa9\xcc\xeb\x1a\x9d\xd7{|\xf1\xe6X\x97\x1f\x819\xa2OIh\x0c\x0b@\xed5\xe6\xe3\xb5\xff\xad\x91\x9c!\xfa\x9e\x96_\xb1&\x95\x93\xcb\x99\x9d\xe3\xad\x0f\xee\xc28\xc6o\x08q\x97\xc8\xd6W\x10\xc4\xdc\'\x86\xf1?\x0b\xa9\x01L\xc1\x10\xb6o\xc7\xd7\xcd\x80E\t\x18\xc9\xbd\x01\x98\x81\x05\xc4\x9e\xc2I5\x1e\x81\x17\xd8\xac6\x18\xe0\xc5\x83\xf6\x1d\x0f\x1a\x12\xab*\xab\rj\x81\xea\x1a$\x8e@\x01G\x1e\x08\x8bN}6\x0b\xd6b\xdde\x97]\xba\xde\xef\xa2\xbc\x14/\x15\xa2\xacC\x91~\x01\n\x89\xa8Qp\xc3\x1b\xde\xb0KT\xb2\x00\xd8~\xc2@]\x97k\x15\xed\xa8>\xbc\xf3\xb8^\xc1"\xb0\x0c^\x0e\xff;\xd6w\x01H^C\x8fI\x0f\xe7\xf7\xbb*!;\xdeo;\xd6o\xe6\x15\x8d\xb4S\x97^\xadX\x8asz\xed<\xbe\x1b\x95\x8f]\x03\xe9\xe4\x9c~K\x1b+\xe5\xce\x9d\xcbpn\x9dm|_\xd0\x95s\n\xd3vl\xcd\xf3\xe27Dj\xfa\\!\x15\xc7\x94\xd1\x9c\x8e\xf7\xbb\xbe\xb3Z\xff\xc7x\xa6\xf1=\xd7\x17\x88\xbakv?\xce\x17\xad\xe3\x9d3w\xb9\x99\'\x11\xa3\x8ewm\xb5\x8a\xcf>7\'~\xc7\\9\xde\xf9\x9c\xdbuz~\xe6\xd5\xefaT\x18\x13\xa6\xc7f\xc7tx\x9a\xac!a\xe7@\xe9`\x86\x18\x11&\x82\xa9X/y%\x9f<A\r3\x08a\x11\x0c\x00S\x90\xe5\x8a\xc1cd}\x00w\xf2\x02\xfcpke\x00\x97Ox@\xe7/\xad\xb5\x11\x07\xbe\xd8\x88\xc2\x85\xbd\xb6I=`\x0b\xd3\xffe\x84\xd6\xd2\x1a\xda\x8bO\xea\x1f0\xedp\x8eK\xd2\xfd\xb84y\xd6z\x9c9\xeb\xeb\xab\xb8\x1ecs\xef\xd5\xbda\x80\xd34\x8c\xdd\x9cy\xa8=\x8b\xbe9\x9d\xf6=\xd7k\x8da0\x91\xdb\xe2}B\x82\x96\x18D\x83\xc5\x00hg\x98\x01\x8d\xd5k\xdf\xa1\x91\xd1jj\rshI\x89\xbe\xda\x0c\xad \xc8\x16d\x02]\xe1\x7f\xf1\xd69\xe7\x1f\xc7t\x9boK1\xb2\xb50\x9c\xcde\x02\x98\xf6\xb4]\x9d7g\xd8\xa4\xd3\x84\x9f_R\x06d\x0e\xf2H@\x9b\x9e\xb9\x05\x04\x0c\xdc\x83\xa9\xc7\xc4\x84\x15\xe8\x14D\xfb(\x7f\x83\xf6\x9a\xe8=\xed\xb8\xcc\xd6\xca\x00:\x94O\xc5 *\xe7\xb4\x0f\xfa\x92H\xa2--y\xb6\xa61\xce\xd1rS\x99H\xfb\r\r\x00\x0e\x01\xa3\x81\x1f\x00\x00i\x04FD\x04\xe6\xa6\x9d\xb5K\xab\x80\xb1$:<\xf6\xc3\xd6\xc8\x00\x00\x81?e;\x01t&-0\xb6-\xbb\xce\xff\xec\xde\xb0\xf1H\x15L\xc1$\xe7&A\xc9$\xfc=\xa9j\xf086\x9e\x99Lc\x12\xcc\x82\xb1\xd5\xb2X]+\xb3\x00\x9eD\xc2\xe7D\xe5\x0f\r\x00\x03\x00\xfe\x01\x9a#\x90(Ow\xa7A0e\xb3\x869\xaf\xde\xea\x18@\xc6\x04\xb6iG\xa7\x0bA\xae\xfbj\x03.\xa5\xda\x82\xd0`\xc5\x18\xb8\x0e\xf9b\x014\xd41\xe8\xf5I\'\x9d\xd4!\xe0\x9a\x89\x00\x001\x14H+\xb4ZN6\xf0\xc7\xdfJ\x83;\x17\\\x01\x10#\x8dS\xdd6\xfd\t\xbd\x0f\xd4\xc3\\\x147\x01\xa2Q\xdf\x00W\xec8\xcc\x07\xc0D\xd5t\xad\x01LaD\x8e\x01\xea\x01\x00\xfd\xed\x7f\xa0\x97\xf7\x9c+\xc08\xe7\xb2 \x9c\x1b\xf3\xe2W\x0e \xd2k\xe7\xf4;\x98\x95\xf3\x18a\x8bZ\x94~?\xcc%\xdf\x01\xf6\x01\x17\x03(\xf3\x9d\x00\xf3t\xb6\xa5Y\xf9\x8e\xf3\xc4\xb9\xb9]\xafs\x9d\xebt\x00\xa5sD\x886`R\xc3\ns\xe07\xdc\x93kr\x1f\xca\xb6\xf9\x9es\x99\x13\xef\xf9\x1b6\xc3\x0c\xc1|m\x10\xbf\xefX\xbfa#\xf9]\xbf\x81I\xfb^\x98,\xfev\xbc\xcd\xe0\xda\xcd\x01\xd0\xcf\xf5\xf9M\xd7oN\xcc\xb5s\xf8\x8e9\xf5\x1d\xd7\xed\x9e\x1dk^\xf8\xe9\xd9\xe6@@\xf7\xeb\xb5\x12u\xe6\xda\xbdH;\xbf\xe7=\xef\xd9\x1d\xe3;\x9axx\xe6\x9e\x8b{\x86\xd4{N\x80^\x81;\xda\xdc\x03\x95\xad\x1d\x1d\xaay\x1c\x00\xcb\xbc2\xc0\xbd\xdcK@\xea\xf3 \x18\x18@\xbc\xe6\x19\xf0\xb7\x8d^\x06\xba\x99\xd7\xac7\xc5\xeb\xb6f\x06`\xecI\x0b0\x13&\xd8C\xeb\xb3\x15=<\x88\xbf\x07\xc4\x95\x85\xd3R\xb50\x06\x1e\x80\xd3N;\xadS\xb90\x01\x0c\x80\x1b\xe9\xab_\xfdj\xf3\xbe\xf7\xbd\xafs\xd5qg\x89\xda\x92\xa4\xc4\x93\xc0u\xa6\xf48\xe6\xe0A{\xe0Z<\xdd\xe7>\xf7\xe9\xdcO\x8fy\xccc\xba\xc5\xb5\xc7\x1e{t\x1b\xc0\xe2\xe0f\xb2\x980\x12\xde\x01 \xa5\x01Ev\x0e\xdf\xb7\xe8Dz\xe9?\xe8}\xd7\xa7\x04\x94\xc5\xfd\xc2\x17\xbe\xb0C\x9di1\x16)F\x04\x8d\xe6\xfaS?\x0eSR-\xc6F\xd3>\xcaoA\xaa1*\xd7\xe97]\'t\xd9=\xbb\x0e\xe1\xa6\xd0i\xf3\x02\xe1\xc6\x14\x95h3\x17\x18#7\x98\xebq<7\\\xb8>\x01U\xbec\xde\xa9\xb5\\\x95\x16\xae9\xe5z\x8c\xa2\x16j>B\xb4\x1dg0\xd9\xcc+\xc9\xe7<\xce\xc9K\xc3\x15j\x0e\xcc\xbfc\xcc\xbbs\xfb}\xa8:\xbb\x17\xb3\xe6\x82\xc4\xbcU\xcd\xe5"\xf5\xdb\xdctZj\xf9]\xafyy\xfc6\x17\x9f\xd7Tl\xcf\xd7gb\xed\x1d\xe79\xfaM\xb6\xb6\xc0\x1b\x92\xd95\xf1\x1cy\xed\x1alX\xaf}\xee3\xf1\xfa\x10{\xe1\xba^\x13&\xf1}\xdfM\xddz\xba0]\xeb\xcb\xbd\xfa\x9cDw\x8c\xbf\xf9\xfd\xd9\xfeF\xb8\x97\r\x1b\xdeqJ\xe5;&\xb4\x83<\x94\xd8\xf0\xdc\xb3|\x82\xad\x9e\x01\\\xb6\x1d/\x0b@\x05 \x08!\xady\x05\xc2U\xc4\xb5cs\xf1CK\xb6\xb0\x89H\x0b\xfd\tpwm\xc3\xc3\x07}\xd0A\x07uR\xca\xe6\xe5\x06$\xf9Hc\x1b\x89d\xf0\xda\x06\xf7\xbf\xcf\xf9yI\x02\xbef\x9b\xcb\xfb6\\\xb8\x0f1\r\xe7\xc4\x8cl\xea\x90\xfe\x92;H\t\x1b\xdco\x90\x86\x98\x99cB\xe2\xf8\x0cS\x11\xdf\xc0\xdfns<\xe9IO\xea\xcec\xd3bj6\x96\xf7m\xa4\xd8\x00r\xcbm\x1c>m\x9b\x9e?\xdc<q#\xd946\x80\xcdL\xfd\xb4\xf8,l>ov\xa6\x85\xeb{\x86\xcf|\x97\xf4Zk\xe0\xcf\x90\x89\xdb.\xaf,e\x9d\x85\x14\xb7i\xfd\xefos\x14\xb1#\xe6\nC\xc0\xf00\x1d\xcc\x8a\xd6\xe9\x19`H60\x8d\xd3\xb9\xcd\xb1\xf3;\x97\xe31Q\xef\xf9\x1b\xe3,\x03\xdd\xac_L,\xd1k\xb7J\x06P0\x01\x8dFO\x89\x19\xc1\xed\xa9\x98\x93\xec\xb6\xf0\xb5\xdb\x98\xa1b\x91\xaa\xf2\x07HZ\\\x96Zk\xa3\x92\xa6TE\x9b\xd9w\xa3n\xa1\xdf\xa0\xa6R\xe7\x1dg\xa3\xfb\x8e\rK\xaa\x93\xbcl>\xe1\x9c6*\xb0\x87\x14\x93\xd0\x84\xc1\x90\xa8b\rH]j"\xa6A"9\x0f\xb5\xd2\xfb\x9a\xa3X\x00$8\xc9(O\\\xb0\x0cM\x82t&\x81\xd8\x8f\xa4\r)b\xf1\t\x12"\x91Hb\x9f{M\xb2X\xb8\x16\x94\x05\x16\x0b\xcf"\x056\xe5\x0b\xd8\xe2u\xce\x94l\xd2-\xda\x08h"\xc50\x86\x90T$#\t\x8dyqY\xd1\x94\xf8\xbfIb\x92\x9d\x16\xe5\xbe}\x0f\xd3\xf1l0\x1d\x019\xa4xt\xc1\xb5)h\x1d6\x85\xe3\r\x9b\x87\x14\x16\xf4\x83\x89ar\xce\x075w\x1d6\x01\xad\xc3wl2\x81A\xeeG\xbcGHt\x8c\xcd\xff!m\x91\xbf\xcd\x97\xbf\xc3\xf5\x16L\xcd\x1c\x9a\x17R\xda\\\xb9Wv\xb8s\x86\xe6\x82\t\xfa\x1d\x8c\xd2\x1c\x0b\xe2q\x0f1\xc7\xc1\x04h\x03\x06f\xea\xf7|\xee\xfb\x9e\x8f\xf9t\xbc\xefQ\xf9\x83\xc18\xde\xfdDu \xcf\xb8\xec]I`e\xe1\xc4\xaf\xdbj\x19@\xc1\x04tG91"\xf8\xa8\xeb\xab\xf9\xb8\xd9\xc36\xd7\xae\xbb\xee\xdamD\xaa\x16;^\x04\x9eMj\xd3\n\xec\xa0b\xdb\x80\xa4\xb2\x8dJ\x82\xfa\x8e\x887\x83*icG\x94\x9b\x05b\xd1X\xa8\xfe\'\x89\xa9\xb8$\xac\x8d\xe7\xe1Y\x84\x16qH\x17\x8b\xcfF\x8cEc\x11\xfa\x8c\xa9Au\x8d\r\xe93\xff[@>\x0f\x1b2\xd4F\x9b\x06\xa3`#\xda\x14\x16\xb1\xcf\xbc\x16\xfdg\xd3Q\xadm\x16Z\x01M\xc8=\xd0\x14\xfcM\xd5\xf7\x9b\xd4j\x8b\xdfF\xc4\xc4,:\x9bP\xdezD\xe7\t\x9ab\xee\xb0\xab\xd9\xf0\x98 m\x84\xb6\xc2\x14\xc1`\x99>\xcf}\xees\xbbs\xf8\x1ef\xea{p\x006\xb5\x11Z\x13\xc6\x89!{\x0e\xe6\xda\xff~\x97M\x8e\xe9F\xc0\x15\xbc\x85\xed\xed\x99\xc0)\xd8\xfflp\xed\xb5\x04n\xb1\xe3i\x81~\xc79\x9c\x13sqo\xae\x9dyF\x8b\xc2P\xac\x13\xf3"\xf2\x8e\tD\xcb\xf2\x9e\x0eQ45\xff{\xbe\x9833\x04\xe3\xf2\xdc0\x1e\xcf1\xcc\x1a\xf3\xec9Dx\xaf5\xe8\xff\xdc\xde\x8f\x10_\xc7E\xb3\x19\xcc\'\x98@\xbc\xc6\xd80\x980kK\xcf\x95{v\x9eD\x7f22\x80\xdf\x0e\xad\xc3N\x8b\xc9f\x17[\x00\x93\xdc~@"\x1b\x9d\x14\x8bPQ\x8b\x9e\xaal\xf2-^6\xa7\x05\xc4\xc6\xc6\x18H\xa9\xb0%=\x08R;lI\x9f\xe1\xde\x16@\xa8\x80$\x1e\xe9a\xc3\xf2\xef\xe2\xf0e\x8czM\xa5\xc6\x18jEM-\x14\x0b+b\xe9\xc3\x9e\xc4@\\\x8f\xeb&\xa9H\x1a\x1aC\\\xdb\xe1\x87\x1f\xdeI`\xf7\x801Y\x886\x81\xefcP\x06\x06\x06s \x99\x85\x17\x03Di2\xb4\x12a\xc6\x98\x05&B\x85u~\x1bMT\x9c\xcd\xe5\\6\x98\xd0l\xe6\x90\x8dd\xde\xcc\xa7\xf30_\x98E6\xbaM\x88\x99\xda\xf84)\xef1\xabl`\x0b\\\xe1W\xff\xc310\x0eL\xda\xb3\xa2\x81\x05\xa0\x89)\xd8\xf8>cJa\x04\x98\xba\xd7\x00\xba\xf0\xeb\xc7y\x81\x860\x96\x00\x0eiq\xbe\xcb\xc4s\x0e\xffcP\xb4?\xd7\t?q\xcd\x9e?-\xcf5ap\xcc5\x03\x93\xc3\x08\x03w\xc04=\x7f\xcf\x80\xb6\xe3\xde\xad\x1f\xef[W\xcc?\xcc\x97T\xa7\x99\xd0\x1ah\x1a\x11RnM`\xf0\x18v`\t\xc1\x00r\xaf\x02\xe6\x97\xfad\x88\x05\xfe\xa3\xad\x9a\x01T\x98\xc0\x8e)[\xb0#\xb6\x17\t2I\x1b \xbdH(\x92\x96*\xea\xe1Y\xe06\x00\tD\x85\']\x80sp\x02\x8b\xce\xe2\xf00\xe1\x08Ty\x8b\x9d\x04q\x1e\x0b\x86\xf4\xe45\xb0h`\n4\r\xff[\x04\x18\x8e\x8dI\x8d?\xf2\xc8#;\xb5\xd9&\xa2)\xb8^\xc0\x98\xdfv\x1e\xea>\xdb\xde\xa6\xa3J\x07\xe0\xe5\xfa\x00\x90\x98\x8c`\x11\x8b\x8eT\xb7\x90h\x02T\xe0\x90&\xfe\x8e\xd8u\x7f\xd7j$\x04\xa3\t *7\t,\xb6|q\xfa\xdb\xfdY\xbc\xe6\x8a\xf6`1c:\xb4\x08\xf1\xff6\xbd\xf9\xc1TIU\xf7\x8c\x81\xda\x8c@G\x18\x06\x13\x87\xd7\x80D\xb7A\xd9\xb6>c>\xd1\x10h\x06\x18\x89\x8d\xeb\x19\x9aC\x9d\xa4ie4\x0b\x8c\x03^b\xe3\x07\x03p\xbe2\xa0\xc7ym\x1a\xdf\xb5\xc1\x97R\xef\xc8p\x03\xe7\xd1\x80\xcc?\x02\x03#\xc1 \xac\x1b\xbf\xe3{\xf1]\xffcB4\x12\xbfI\xc3\x80\x11YG\x8ew\xfd\xf0\x1b\xde\x0b\x9aL\xb8\x9d\xfd6P\x97i\x14\xe6\x0fF\xe0y\x12\x10\xe6\x1dS\xf6w\xe4\x0b\x98\xc3\xd2\xddIk\xc24\x12\x03x\xc8V\xcf\x00z4\x01\x95\x17\xcf\xb1p\xa9\xaa\x16\xd9j\xfe\\\x8b\xd3&\xa4^\xd3 ,xLA\xae\x81Mn\x83\xdb\x94\x98\x04.N\x92b\x0e6\xaf\xcd\xe9\x7f\x12\xd0\xa6\xb6\xd8-Z\xccBl\xb8\x87fAa(\x11\x9boq\x90T~\x97D\xb1i\x98"P|\x0b\xca1\xbec\xe1\xf8\x9f\xe4\xb2\x18IE\x8c\xc5b\xc3T\x9c\xdf\xa2\xa2\xd6\xfa]\x9b\x93\xeb\x12\x83\t\xbc\xc0=Pe-@&\x02o\x06\xa9D\xda\x93\xe2\x12\x84\x021\xf7\x9eM\xcb\xa4\xf1\x1eM\xca9i\x10$"\xf3\x87\xea\xef^\xc5\xbf{\xcf\xef\xb9&\xda\x82\xeb\xb0\xb9\xa9\xcd\xe6\xcd\x06\xa0\x96\x03M]?&\xaa\x0c6\xa6\xea^HW\x9b\x9b\x07\xc55b\xaa\xb4\r\x1e\x1b6?\xe6j\xc3\xd0^hj\xcc\x1bq\xf9<5\xe1u\xc1li\'\x18\x0em\x83\xb9B}\xf7\xbe\xf3\xc1\\\xa8\xfa\x18\x8f\xebr\xef\xceg\xde\x9854\x1c\xeb\x04\x83&\xd5%aa\xb0\x18\n3\xc93\xf5{\xe6\xdb|bN\x00Z\xbf\xe3\x9e]\x83\xfb\xf6,h3\xcc\x0f\xf3\xe6\x18\xd7L;\xc2\xe81wk\n\x83\x0e\xd3\r#\r\xfc\x01\xb3\x0e\xaf\x01\xf2\xfd\x12\x03\xc0\\R\x97\xea\x91\x01L`\x02Wl\xc7{C\xbd\xb6\x90\x01t\xab1\x01*\xa9E\xc7\xe6\xc6\x8d-\x10R\x93\xdd\x17\xee\x1f\xaa/\x1b\x90\xb4\x8dEi\xe1\x02\x8aHc\\\xdd\xe2\xa5FZP6\x87\x05g#P\x95mv\xaa(I\xc6\x0b\x81\x89`\x146\x93\xcf,"\xea\xa5ED\xfd\xc54lv*\xaa\xe3|\x17\x13!\x05-\x06\xea4)DC\x01Z\x92\xa6$h\x9c\xd7\xc6\xc4\x00I@\xcc\x86\x1aK\xaa\x84/\x9e$\xf4?\xff9\xf0\xd1\xe6\xc3(\x00\x90\x18\x07[\x1bc\xf2}\xbfas\xc3J`#\x18\x8c\xdfw}\xae\x17#\xc180\x07\xd2\xdc\xbd\xf8\xdcw1\x16\x1a\x92\xfb\xc6,1\x12\xee8\xda\x8e\r\x82\xa1\xf2\x9f\x07\x88\xc7t\xa1\x11EQ\x17Z\t\xdb\x99\xa4\xf4\x7f\xfc\xcd\xbc\xf1\x9eM\xe3\xb9\x05\x82N\xab\t/\xc64T\xcb\x1c\xa5\x01\xd9\xa8\xfe\xf7\xb9\xf3\x13\x0e\x01\x82:w\xe09a\x8a\x05&\x10~\xfe\xd0\xae\xa6)Q\xef\xf8\xe8\x10\x8c0;\x9aF\xbeFiAiN0\x80\x87\x8e\x0c\xa0\x9f\t\xdc$%\x0cu\x066\xe9V\xd6h/\x87 \x14\xbem\x0f\x00\x88G\xea\xc3\x03l`*\x1b{\x9e\x8b\xcd\xa6$YHJ`\x91\xcdc\x13\x92\x86\xa4\x13\xe9o\xf3\xdaD\xde\x07\x8c9\xb7\x8d\xe9\x1a"s\rF\xe1\x01S?\xa9\x8c\xde\xb3\x91H|\x9b\x8aZI\x13\xf0Y$\xa8D\xd3\x14\x1b:\x02iJ51\x82h|\xc6n\xf6=\xef\xd1<\xc2EJU\xa6]8\x96\x14\xa6\xeeR\x97]c\x04\xd1`ZT\xda\xe8o\x1f\xb6\xa8\xffi4\xa4\x93k\x8b\xec\xc2\xc8(\xc4\x98"x\'\x92c\\Cd\x03Fp\x12&F;p\x8c\xfb\x89LB\x1aB\x04\xe2\x90\xf2$-\xe6D\x8b\xc0\xcch\x0e\xcc\x03\xcc\xce|\xd1\x98\xb8c\xcd{\x00\xb7\x9e\x85\xeb\xc7\x84h\x034\tR\xdd3\xe3\xb1\xc0\xd80;\xaf}F3\xf0=\xcf\x9fF\xe0{\x98\xb2s\x93\xeea\xc6\xf8\x1eM\xd0\xf91Y\xe7\xb1&0Kv\xbf\xe30I\xcc\x8cV\xe17\x02\'!\xfd\x81\xacT{\x9b\x9b\xb0\xf1^x00C\x1a\x06\xe1\x83\xc9`,4\xa62\xa8-\xc3\x00F\x06\xb0\n\x13\xb8n;\xbe\x14\x1c\x9e\xaan\x02\'1\x01\x1b\x97\x1aIm\xa4\x0e\n\x9a\xb1\xb8lbjkl\xd8Z\x96\xd6%\xc9\xee+\xc3G77\xcb\xaf\xbc\x9e-\x91q\xb8\xda\xe8\x0b\xbe\xda\xdc\xdf\x0f\xc6Q\x9e\x97\x194\xcd\xf9"\x9aq\xa9h*\x93G\x12.eY\x80e[\xfa\xf2|\x98\xd6\xa4\xdf\x8b\x88\xc5Ing\x8c\x16\x83\xc5\xd4#\x8a\xd3k\xeb\ts\xa4\xada\xbe\xbe\x073\xa0\xadazy=\x81\xa5\x94\n\x8d1\x80n\xda\xf1\xb0\x91\x01\xac\xce\x04\xee\xd5\x8eO\x85&\xc0\xce\x07\nM\x93=\xb7\x96M\x18\xa1\xbdK\x970\x156~\xaf\xaf;\xd2\xd2\x1a\xd3\x84\xd7r\x0f5&\x14\x9bf\xad\xc9P\x11><)\xe3\xb0\xac\xe3\xb0\xb4\xc6\xec\xc2Yg\x81N{\xed\xc1h\x02d\\k\xceC\xfe\x0c\t\xa2d\x02\\0j\x00\xd33\x81\xed\xda\xf1\xa2\xa84\x0c\xbd\xa6^\xd6\xa4\xf8zd\xb6m\x84\x14\xae\xfdfl\xbe\xcde$\x81\x88o\x8e6\x92\xc7\xeeO\x92\x8c\xabI\xd7\xad=\xe9)\x9f{\xcf\x83)\x92U\x15\xfa\xb3\x91\x01L\xcf\x04.\x95T\xa6.\xd0\x1a\xd0\xc4V\x1c\x17\xda8\x96\x06\x926\x8da\xc2\xb22z\xe9\xc8\x00\xd6\xc6\x04\x8c\xa7D\xe3\x11\xb6\x14$\xde\xc4\x86]\x08\xb0\x02D\xc1\n\x00S\x110B\x15\x03\\\x05\x80\x07@\xabI8\xc7\x97\x12\xdf\xf9s4\xd7\xe7\x91\t8\x8dv\xb0VM\xc5y#\xcd\xd95\xban\xff\xafgQ\x8dy\xd8$\xd3\xdc_\xed\xd8-]\x18%\xb4\xaf\xbc\x08Jha\xb9\xc6\x13k.\xd4\xfc\xb8>\xeb\x85\xd7\n\x00\x0c\x7f\x82=\x017\x01\xd2\x91(\xd4\xd2\x97\xdbq\xeb\x91\x01\xac\x9d\x11DG\xe2\xdf\x84\xabFd\x1c\x1f1\xf4\x99\xbf\x96\xfb\xc9Ds\xf7y_0\x0et\x98\x9b+\xa2\xdb\x04\xbd@\xa8\xa1\xc1\\]\x10a\xaf\xa1\xc1\xdcy<\x00\xa2\xe2\xa0\xc0\xdce\\c|\xc4@\x1c\xc0\x0eW\x1f\xb4\x18r\x8d\x99p\xc5y\xe0\x98\x8fh\xb4\x08\x8d\xb5\x00|\x0f3\xe2/\xe7\x92\xf3\x99\xe3\xfd\x9e\xf7\xa0\xd5\x90\xf2p\xd3q\xb7A\x9e]3d\x9b\xc7\x02z\xee5\xc4\xdf\xf1~\xc7\xff\xae\xd3\xef9\x8f\xd7\x90s\xcc\xcf\xdf\xae\x89\xdd\xea\xba\xbc\x0f\xb5\x8f\x9c\t\xc7z\r\x89\xf7\xb9\xfb\x10 \xe5\x1c0\x16\xc7qW:\x0f\xd7\xa3\xcf\x1do\xf8\x1c\x92\x0f\xf8r=\x86\xf7\xb8\x0e\x9d7\xbc\t\x00Y\xbex\xaeLh\xb8\xbf\xb9j=\xa78\x97s\xd8,\x910\xe5{q>^\x03\xa8=O\x8d\xf3p\xa3F\xd6&\xff\xbd\xf9r]\xd0}s\xedsn6\x91\x81\xd0\x7f\xf3\xcb\x8b\xe03\xf7\xe9\x18(\xbdx\x00\xcf\xc1y\xbd\xef\x1c\xce\xefo\xe7r\x8c\xd8\x01(\xbf\xb8\x0e\xbf\xc7\xa3\xc4+`\xed\xf8\x8c\xab\x98\x07B\xacB\xac/k\xcf\xffp*\xbe~AA\xd6a\xb8\x1f3\x92\x0e\xb8s.\xd8FZ\x1b\x13\xb8Rj<\xf2\x05\x0e\x82\xdc\xcf\xbc\x96^\x02\xb9\xef\xd8\xeb\x88\xcd\x8f\x8c\xae\xf0\xfdr\xe9x\xdf\xc3\xe4J\x14.,Q\x87\x1fY|\x81\xd8\x81\xa84\xec\xfdH\xf2q>Qb\xfc\xca\xe2\x0f\x98-\xce\xe93\x01$\xce\x19%\xa5\xbdv\xfd\x02\x98\x84\x05;\xb7k\x88`\x13n&\xefIB\xf1\xb9\xdf\xf5\x9e\xcf\xf9\xb2\xfd\x86\xcf\xfc\xefZ\\\x13\x1f\xbb\xa8C\xaf\x9d\xc3\xef\xfa\xbe\xb0f\xbf\xe5>\xfd.M\xca\xbdEF\xa1\xeb\x8fpd\xd7gN#\xc9\xc8\xf7\xfc\xb6\xe3#\x99&\x12\x97b\x8e\x1c\xcb\r\xeb\xf7\xfd\x96\xf9\xf3\xfb\xe6\xc2\xb5{\x1d\x05_\x1d\xeb{\x12n\xa2\xc6^\xcc_$4\x89\x05\x89y\x890js\xe3o\xe7\x89\xe7\xe6\xde\xa3Ro\x1e\x9e\x9dGFF\xe1\xce\x88\r\x88k\x8e\\~\x9f\xb9\x96\xbc\xab\xd5\x16\xc8\x9e\xbc(\x81\xd8?OAn\xe3\xe6\xdfB\xe6\x80LB]DOM~\xd5 \xe9X\'\xa7\xaeD\x11\xc1\xf1\xcb\xe4R\xfc|\x1a\xff\x9c\x18\x88\xd7B\xb3~\x9c\xb4\x8a\x0b\xd21\x17U\xc6\x05\x95\xf7J:\'\x1d\x7f~\xf6\xf9E\xd9"\xb8X\xec\x88\x8c\xd5tmq\xfe\x0b+\xe7\xbf0\x8d_\xa5\xf1\x8b\xec{\x17T\x16[\xfe{q\x8e_\xa7k\xf3\xde\xd9\tP\x9d\x96[\xfa\xdeOR\xed\x86_\x16\xbfqN:w\xbc\xfe\xe5\x84\xf9\xb9(]\xfbO\xd25\xfc$\xddO\xdc\xc7\xcf\xb29\xbe \xdb4\xdfO\xdf\xbb0]\xc3\xd9\xd9\xbd\xfd&\xf5\xd8\xfbu\xe5\xba\xff-=\xe73S\tnUx\xcfJ\xf7\xfe\x7f\xe9\xef_\x15\xf3\xf5\x9b\xf4\x7f\xcc\xd5/\xd3\xf7H\xed3\xda\xf1Ya\xfe\xed\xf8t\xb3\xdc\xdd\xd7\xf8h\xb3\xdc\x13\xf3\xa84^\x99\x12}\xde\x90\xaa\xfe\xe8\x83\xf1\xf0v\xdc#i\xb0\xe3\xe6\xdf\xc2\x8c\xe0Z)\xac\xf2\ti\xb2o\x97z\x14^#\xf5)<:\xb9\\\xfc\xad\x1d\xf3\xd5\x93ga\xbb\xf4\xf7\xf5R\x8b\xa6\x07\xa4.F\xfb\xb5\xe31\xe9\\\xc6\xe3\xd3\xf0\x10\xff8\x8dG\xa7\xff\xbd\xff\x16\xa9\x0b\xe9w\xee\xdf\x8e\x07\'\r\xe51\xe9\x9a\x1e\x9b\xc6#\xd3\x02\xf1\xdd#\xd3\xef\xdc\'\xb9:\x1f\x97~\xfb\xb1\xe9\xbc\xf1\xfb\x8e?(\x1d\xab\x80\xca}\xd3\xf7\x1f\x99>\xf7\xd9\x9f\xa7\xd4\xd2\'\xa5\xe3\x1e\x9f\xfd\xde\xe3\xd39\xee\x97\xae\xcd\xf7wk\xc7.\xe95\x17\xeb\'\xdb\xf1\xccv\x1c\x96\x12\xb2NNf\xd6\xe9\xe9o\xd7\xb3k;\xee\x9c\xae\xe1\xe0ln\xee\x9f\xce\xed;\xfb\xb6\xe3\xde\xd9\xbc\xf8\xfc%\xe9<\x1fN\xd7w\xcf\xf4\xfb\xbb\xa5\xbex{e\xf7\xbeG\xfa\xffQ\t\xf0}D\xfa\xfe\x0e\xe9{\x8f\xc8\x8e=(\xdd\xe3\x83\xd3\xb3\xbb_\xfaM\x18\xd1\x1b\xd3\xbd\xdc =\xeb\x9b\xa6\xf2\xdb\xb7J\xafo\x9f\xd6\xc8\xad\xb2\xdf\x7fT:\xe7\xfd\xd2\xeb}\xd2\xef\xdd+I\xeck\xb6\xe3j\xed\xd86m\xe2\xab\xa6\xbf\xaf\x96\xaa[]*\x1bK\xd3\x8c\x91\xb6,\x13\x98\xe5\xb8tZh\x97\x99\xe2\xbb\x97I\xdf\xbd\xf4\x9c\\\xbbNMW\xc9\xfe\xbej2\xb1\x96\xd2\xe2\xbe\xea\x16\xf8\x8dm\xd3&Y\xda\xda\xc7H3f\x06Cf4[\xe2z\xe6\xe5\xbe\xfa\xaea\x96\xcf{\xdc\xb0#\x8d4\xd2H#\x8d4\xd2H#\x8d4\xd2\x82\xd2\xff\x07E\xe3_\xffq\\S\xed\x00\x00\x00\x00IEND\xaeB`\x82Z\x00\x89\xba',
+}
+
+# Resources whose content is identical to another entry
+_ALIASES = {
 }
 
 def qInitResources():
@@ -27,21 +35,22 @@ def qInitResources():
 def qCleanupResources():
     """Cleanup Qt resources"""
     pass
-def get_resource_data(resource_path: str) -> bytes:
+@lru_cache(maxsize=256)
+def _decode(name: str) -> bytes:
+    """Decompress a resource once; keyed by the normalized resource name"""
+    return zlib.decompress(_RESOURCES[name])
+
+def get_resource_data(resource_path: str, _r=_RESOURCES, _a=_ALIASES, _dec=_decode, _EMPTY=b"") -> bytes:
     """Get resource data by path (e.g., ":/buttons/정지.png")"""
-    # Remove :/ prefix if present
-    if resource_path.startswith(":/"): 
-        resource_path = resource_path[2:]
-    
-    if resource_path in _RESOURCES:
-        return base64.b64decode(_RESOURCES[resource_path])
-    return b""
-
-def resource_exists(resource_path: str) -> bool:
+    # Remove :/ prefix if present and resolve aliases; misses are not cached
+    name = resource_path.removeprefix(_PREFIX_SLASH)
+    name = _a.get(name, name)
+    return _dec(name) if name in _r else _EMPTY
+
+def resource_exists(resource_path: str, _r=_RESOURCES, _a=_ALIASES) -> bool:
     """Check if resource exists"""
-    if resource_path.startswith(":/"): 
-        resource_path = resource_path[2:]
-    return resource_path in _RESOURCES
+    name = resource_path.removeprefix(_PREFIX_SLASH)
+    return name in _r or name in _a
 
 # Auto-initialize
 qInitResources()
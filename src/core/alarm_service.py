@@ -5,16 +5,19 @@ Alarm service and notification management for Croquis application
 import os
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from typing import Optional
 
 from core.key_manager import decrypt_data
-from utils.log_manager import LOG_MESSAGES
+from utils.log_manager import LogKey, format_log
 
 
 logger = logging.getLogger('Croquis')
 
 
+@lru_cache(maxsize=1)
 def get_data_path():
     """Get base path for data files"""
     if getattr(sys, 'frozen', False):
@@ -23,6 +26,7 @@ def get_data_path():
         return Path(__file__).parent.parent.parent
 
 
+@lru_cache(maxsize=1)
 def get_icon_path():
     """Get the icon file path for toast notifications.
     For compiled executables, icon.ico is bundled into _MEIPASS."""
@@ -36,17 +40,30 @@ def get_icon_path():
         # Script mode: icon is in src/assets directory
         icon_path = Path(__file__).parent.parent / "assets" / "icon.ico"
     
-    return str(icon_path) if icon_path.exists() else None
+    return str(icon_path) if icon_path.is_file() else None
+
+
+_toast_loop = None
+
+
+def _get_toast_loop():
+    """Return the event loop reused for every toast in this process"""
+    global _toast_loop
+    if _toast_loop is None or _toast_loop.is_closed():
+        import asyncio
+        _toast_loop = asyncio.new_event_loop()
+    return _toast_loop
 
 
 def show_toast_notification(title: str, message: str, icon_path: str = None):
     """Display Windows toast notification"""
-    # Set icon path
+    # Default path is already checked by get_icon_path; only stat caller-supplied paths
     if icon_path is None:
         icon_path = get_icon_path()
-    
-    icon_exists = icon_path and os.path.exists(icon_path)
-    logger.info(LOG_MESSAGES["toast_notification_requested"].format(title, message, icon_path))
+        icon_exists = icon_path is not None
+    else:
+        icon_exists = os.path.isfile(icon_path)
+    logger.info(format_log(LogKey.toast_notification_requested, title, message, icon_path))
     logger.info(f"Icon exists: {icon_exists}")
     
     # Priority 1: win11toast (Windows 10/11 native notifications)
@@ -67,13 +84,13 @@ def show_toast_notification(title: str, message: str, icon_path: str = None):
                     timeout=5.0
                 )
             except asyncio.TimeoutError:
-                logger.warning(LOG_MESSAGES["toast_notification_timeout"])
+                logger.warning(format_log(LogKey.toast_notification_timeout))
         
-        asyncio.run(show_toast())
-        logger.info(LOG_MESSAGES["toast_notification_success"].format("win11toast"))
+        _get_toast_loop().run_until_complete(show_toast())
+        logger.info(format_log(LogKey.toast_notification_success, "win11toast"))
         return
     except Exception as e:
-        logger.error(LOG_MESSAGES["toast_notification_failed"].format("win11toast", e))
+        logger.error(format_log(LogKey.toast_notification_failed, "win11toast", e))
     
     # Priority 2: plyer (cross-platform)
     try:
@@ -85,75 +102,123 @@ def show_toast_notification(title: str, message: str, icon_path: str = None):
             app_icon=icon_path if icon_exists else None,
             timeout=10
         )
-        logger.info(LOG_MESSAGES["toast_notification_success"].format("plyer"))
+        logger.info(format_log(LogKey.toast_notification_success, "plyer"))
         return
     except Exception as e:
-        logger.error(LOG_MESSAGES["toast_notification_failed"].format("plyer", e))
+        logger.error(format_log(LogKey.toast_notification_failed, "plyer", e))
     
     # Last resort: console output
     fallback_msg = f"[ALARM] {title}: {message}"
     print(fallback_msg)
-    logger.info(LOG_MESSAGES["toast_notification_fallback"].format(fallback_msg))
+    logger.info(format_log(LogKey.toast_notification_fallback, fallback_msg))
+
+
+def _next_alarm_time(alarms: list, after: datetime) -> Optional[datetime]:
+    """Return the earliest time after `after` at which an enabled alarm fires"""
+    candidates = []
+    for alarm in alarms:
+        if not alarm.get("enabled", False):
+            continue
+        try:
+            hour, minute = map(int, alarm.get("time", "").split(":"))
+            alarm_time = time(hour, minute)
+        except ValueError:
+            continue
+        
+        alarm_type = alarm.get("type", "")
+        if alarm_type == "weekday":
+            weekdays = set(alarm.get("weekdays", []))
+            # Eight days so today's weekday is found again next week
+            for offset in range(8):
+                day = after.date() + timedelta(days=offset)
+                if day.weekday() in weekdays:
+                    fire = datetime.combine(day, alarm_time)
+                    if fire > after:
+                        candidates.append(fire)
+                        break
+        elif alarm_type == "date":
+            try:
+                fire = datetime.combine(date.fromisoformat(alarm.get("date", "")), alarm_time)
+            except ValueError:
+                continue
+            if fire > after:
+                candidates.append(fire)
+    
+    return min(candidates, default=None)
+
+
+def _alarms_pending(cache_file: Path, mtime_ns: int, now: datetime) -> bool:
+    """Check the plaintext schedule cache; False means nothing can fire yet"""
+    try:
+        cached_mtime, next_ts = cache_file.read_text().split()
+        if int(cached_mtime) != mtime_ns:
+            return True
+        return next_ts != "-" and float(next_ts) <= now.timestamp()
+    except (OSError, ValueError):
+        return True
 
 
 def check_and_trigger_alarms():
     """Check and trigger alarms (prevent duplicates)"""
     dat_dir = get_data_path() / "dat"
     alarms_file = dat_dir / "alarms.dat"
+    cache_file = dat_dir / "alarms.next"
+    
+    try:
+        mtime_ns = alarms_file.stat().st_mtime_ns
+    except OSError:
+        return
     
-    if not alarms_file.exists():
+    # Current time, truncated to the minute alarms are scheduled on
+    now = datetime.now().replace(second=0, microsecond=0)
+    
+    # Skip decryption while alarms.dat is unchanged and no alarm is due
+    if not _alarms_pending(cache_file, mtime_ns, now):
         return
     
     try:
-        with open(alarms_file, "rb") as f:
-            encrypted = f.read()
-        data = decrypt_data(encrypted)
+        data = decrypt_data(alarms_file.read_bytes())
         alarms = data.get("alarms", [])
         
+        # Remember when the next alarm is due (alarms of this minute fire below)
+        next_fire = _next_alarm_time(alarms, now)
+        next_ts = str(next_fire.timestamp()) if next_fire else "-"
+        try:
+            cache_file.write_text(f"{mtime_ns} {next_ts}")
+        except OSError:
+            pass
+        
         if not alarms:
             return
         
-        logger.info(LOG_MESSAGES["alarm_checking"].format(len(alarms)))
+        logger.info(format_log(LogKey.alarm_checking, len(alarms)))
         
-        # Current time
-        now = datetime.now()
-        current_time = now.strftime("%H:%M")
-        current_date = now.strftime("%Y-%m-%d")
+        current_time = f"{now.hour:02d}:{now.minute:02d}"
+        current_date = now.date().isoformat()
         current_weekday = now.weekday()
-        icon_path = get_icon_path()
         
-        # Check alarms
-        for i, alarm in enumerate(alarms):
-            if not alarm.get("enabled", False):
-                continue
-            
-            alarm_time = alarm.get("time", "")
-            alarm_type = alarm.get("type", "")
-            
-            # Check time match
-            if alarm_time != current_time:
-                continue
-            
-            # Check by type
-            should_trigger = False
-            
-            if alarm_type == "weekday":
-                weekdays = alarm.get("weekdays", [])
-                if current_weekday in weekdays:
-                    should_trigger = True
-            elif alarm_type == "date":
-                alarm_date = alarm.get("date", "")
-                if alarm_date == current_date:
-                    should_trigger = True
-            
-            if should_trigger:
+        # Type-specific date checks
+        matchers = {
+            "weekday": lambda alarm: current_weekday in alarm.get("weekdays", []),
+            "date": lambda alarm: alarm.get("date", "") == current_date,
+        }
+        
+        # Only enabled alarms scheduled for this minute need the type check
+        due = [
+            alarm for alarm in alarms
+            if alarm.get("time") == current_time and alarm.get("enabled", False)
+        ]
+        
+        for alarm in due:
+            match = matchers.get(alarm.get("type", ""))
+            if match is not None and match(alarm):
                 title = alarm.get("title", "Croquis Alarm")
                 message = alarm.get("message", "Time to practice croquis!")
-                logger.info(LOG_MESSAGES["alarm_triggered"].format(title, current_time))
-                show_toast_notification(title, message, icon_path)
+                logger.info(format_log(LogKey.alarm_triggered, title, current_time))
+                show_toast_notification(title, message)
                 
     except Exception as e:
-        logger.error(LOG_MESSAGES["alarm_check_failed"].format(e))
+        logger.error(format_log(LogKey.alarm_check_failed, e))
 
 
 def setup_alarm_background_service():
@@ -203,7 +268,7 @@ Set WshShell = Nothing
         import shutil
         shutil.copy2(vbs_path, startup_link)
         
-        logger.info(LOG_MESSAGES["alarm_service_installed"])
+        logger.info(format_log(LogKey.alarm_service_installed))
         return True
         
     except Exception as e:
@@ -235,7 +300,7 @@ def remove_alarm_background_service():
         if startup_link.exists():
             startup_link.unlink()
         
-        logger.info(LOG_MESSAGES["alarm_service_removed"])
+        logger.info(format_log(LogKey.alarm_service_removed))
         return True
         
     except Exception as e:
@@ -9,11 +9,34 @@ import platform
 import uuid
 import os
 from pathlib import Path
-from cryptography.fernet import Fernet
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import json
 import zlib
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Payload layout written by encrypt_data: version byte + 12-byte nonce + AES-GCM ciphertext.
+# Legacy Fernet tokens always start with b"g", so the version byte tells them apart.
+_AESGCM_VERSION = b"\x02"
+_NONCE_SIZE = 12
+
+# Optional: orjson serializes straight to/from UTF-8 bytes, much faster than json
+try:
+    import orjson
+
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode()
+
+    def _loads(raw: bytes):
+        return json.loads(raw.decode())
+
 
 class KeyManager:
     """
@@ -29,6 +52,8 @@ class KeyManager:
     
     _instance = None
     _key = None
+    _fernet = None
+    _aesgcm = None
     
     def __new__(cls):
         """Singleton pattern to ensure consistent key across application"""
@@ -140,14 +165,30 @@ class KeyManager:
         """
         return self._key
     
-    def get_fernet(self) -> Fernet:
+    def get_fernet(self) -> "Fernet":
         """
         Get a Fernet cipher instance with the current key.
         
         Returns:
-            Fernet: Ready-to-use Fernet cipher
+            Fernet: Ready-to-use Fernet cipher (cached after first use)
+        """
+        if self._fernet is None:
+            # Deferred so callers that never decrypt skip the cryptography import
+            from cryptography.fernet import Fernet
+            self._fernet = Fernet(self._key)
+        return self._fernet
+    
+    def get_aesgcm(self) -> "AESGCM":
+        """
+        Get an AES-GCM cipher derived from the current key.
+        
+        Returns:
+            AESGCM: Ready-to-use AEAD cipher (cached after first use)
         """
-        return Fernet(self._key)
+        if self._aesgcm is None:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            self._aesgcm = AESGCM(base64.urlsafe_b64decode(self._key))
+        return self._aesgcm
     
     def encrypt_data(self, data: dict) -> bytes:
         """
@@ -159,12 +200,11 @@ class KeyManager:
         Returns:
             bytes: Encrypted data
         """
-        fernet = self.get_fernet()
-        json_str = json.dumps(data, ensure_ascii=False)
-        # Compress with zlib (level 9 = max compression)
-        compressed = zlib.compress(json_str.encode(), level=9)
-        encrypted = fernet.encrypt(compressed)
-        return encrypted
+        # Compress with zlib (level 6: near level-9 ratio on JSON at a fraction of the CPU)
+        compressed = zlib.compress(_dumps(data), level=6)
+        nonce = os.urandom(_NONCE_SIZE)
+        encrypted = self.get_aesgcm().encrypt(nonce, compressed, None)
+        return _AESGCM_VERSION + nonce + encrypted
     
     def decrypt_data(self, encrypted: bytes) -> dict:
         """
@@ -176,11 +216,15 @@ class KeyManager:
         Returns:
             dict: Decrypted dictionary
         """
-        fernet = self.get_fernet()
-        decrypted = fernet.decrypt(encrypted)
+        if encrypted[:1] == _AESGCM_VERSION:
+            nonce = encrypted[1:1 + _NONCE_SIZE]
+            decrypted = self.get_aesgcm().decrypt(nonce, encrypted[1 + _NONCE_SIZE:], None)
+        else:
+            # Files written before the AES-GCM switch
+            decrypted = self.get_fernet().decrypt(encrypted)
         # Decompress
         decompressed = zlib.decompress(decrypted)
-        data = json.loads(decompressed.decode())
+        data = _loads(decompressed)
         return data
     
     def get_key_info(self) -> dict:
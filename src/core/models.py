@@ -15,7 +15,7 @@ DEFAULT_SHORTCUTS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CroquisSettings:
     """Croquis settings data class"""
     image_folder: str = ""
@@ -34,7 +34,7 @@ class CroquisSettings:
     shortcuts: dict = field(default_factory=lambda: DEFAULT_SHORTCUTS.copy())
 
 
-@dataclass
+@dataclass(slots=True)
 class CroquisRecord:
     """Croquis record data class"""
     date: str
@@ -106,26 +106,11 @@ class ImageViewerWindow(QWidget):
         if total_weight == 0:
             return images
         
-        result = []
-        remaining = images.copy()
-        remaining_weights = weights.copy()
-        
-        while remaining:
-            # Build cumulative probability
-            cumulative = []
-            cumsum = 0
-            for w in remaining_weights:
-                cumsum += w
-                cumulative.append(cumsum)
-            
-            # Pick by random threshold
-            rand_val = random.random() * cumsum
-            for i, cum in enumerate(cumulative):
-                if rand_val <= cum:
-                    result.append(remaining[i])
-                    remaining.pop(i)
-                    remaining_weights.pop(i)
-                    break
+        # Efraimidis-Spirakis: key = u ** (1 / w), sorted descending, gives a
+        # weighted permutation in one pass plus a sort
+        keys = [random.random() ** (1.0 / w) if w > 0 else 0.0 for w in weights]
+        order = sorted(range(len(images)), key=keys.__getitem__, reverse=True)
+        result = [images[i] for i in order]
         
         return result
         
@@ -426,8 +411,8 @@ class ImageViewerWindow(QWidget):
                         QTimer.singleShot(150, self.start_screenshot_mode)
                 
     def start_screenshot_mode(self):
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["screenshot_mode_enabled"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.screenshot_mode_enabled))
         self.screenshot_overlay.start_capture()
         
     def on_screenshot_taken(self, screenshot: QPixmap):
@@ -480,14 +465,14 @@ class ImageViewerWindow(QWidget):
             self.start_screenshot_mode()
             
     def on_screenshot_cancelled(self):
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["screenshot_mode_cancelled"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.screenshot_mode_cancelled))
         self.start_screenshot_mode()
         
     def save_croquis_pair(self, screenshot: QPixmap):
         """Save the croquis image pair with encryption"""
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["croquis_pair_saved"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.croquis_pair_saved))
         # Calculate croquis duration
         if self.settings.study_mode:
             croquis_time = self.elapsed_time
@@ -522,8 +507,8 @@ class ImageViewerWindow(QWidget):
         self.croquis_saved.emit(self.current_pixmap, screenshot, croquis_time, image_filename, image_metadata)
         
     def previous_image(self):
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["croquis_previous"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.croquis_previous))
         if self.settings.study_mode:
             # Study mode: switch to screenshot capture
             self.timer.stop()
@@ -534,8 +519,8 @@ class ImageViewerWindow(QWidget):
             self.timer.start(1000)
             
     def next_image(self):
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["croquis_next"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.croquis_next))
         if self.current_index < len(self.images) - 1:
             self.current_index += 1
         else:
@@ -554,9 +539,9 @@ class ImageViewerWindow(QWidget):
             self.next_image()
         
     def toggle_pause(self):
-        from utils.log_manager import LOG_MESSAGES
+        from utils.log_manager import LogKey, format_log
         self.paused = not self.paused
-        logger.info(LOG_MESSAGES["croquis_paused" if self.paused else "croquis_playing"])
+        logger.info(format_log(LogKey.croquis_paused if self.paused else LogKey.croquis_playing))
         
         # Swap play/pause icon
         resource_loader = QtResourceLoader()
@@ -570,8 +555,8 @@ class ImageViewerWindow(QWidget):
                 self.next_image()
                 
     def stop_croquis(self):
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["croquis_stopped"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.croquis_stopped))
         if hasattr(self, 'timer') and self.timer:
             self.timer.stop()
             self.timer.deleteLater()
@@ -585,8 +570,8 @@ class ImageViewerWindow(QWidget):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        from utils.log_manager import LOG_MESSAGES
-        logger.info(LOG_MESSAGES["croquis_window_closed"])
+        from utils.log_manager import LogKey, format_log
+        logger.info(format_log(LogKey.croquis_window_closed))
         if hasattr(self, 'timer') and self.timer:
             self.timer.stop()
             self.timer.deleteLater()
@@ -4,50 +4,146 @@ Image viewer window for croquis practice
 
 import os
 import random
-import base64
 import logging
+from collections import OrderedDict
 from datetime import date
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 from pathlib import Path
 
+# Optional: pybase64 is a SIMD-accelerated drop-in for the stdlib decoder
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QDialog,
     QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, pyqtSignal, QRunnable, QThreadPool, QMutex, QMutexLocker
+)
 from PyQt6.QtGui import (
-    QPixmap, QImage, QFont, QMouseEvent, QTransform, QGuiApplication,
-    QKeyEvent
+    QPixmap, QImage, QFont, QMouseEvent, QGuiApplication,
+    QKeyEvent, QPixmapCache
 )
 
 from core.models import CroquisSettings, DEFAULT_SHORTCUTS
 from core.key_manager import decrypt_data
 from utils.helpers import get_app_icon, get_data_path, tr
 from utils.qt_resource_loader import QtResourceLoader
-from utils.log_manager import LOG_MESSAGES
+from utils.log_manager import LogKey, format_log
 from gui.widgets import ScreenshotOverlay
 
 logger = logging.getLogger('Croquis')
 
 
+class _DecodeTask(QRunnable):
+    """Decode an upcoming image into a QImage on a worker thread"""
+    
+    def __init__(self, image_item: Any, key: str, store: dict, lock: QMutex):
+        super().__init__()
+        self.image_item = image_item
+        self.key = key
+        self.store = store
+        self.lock = lock
+    
+    def run(self):
+        image = QImage()
+        try:
+            if isinstance(self.image_item, dict):
+                image.loadFromData(base64.b64decode(self.image_item.get("image_data", "")))
+            else:
+                image.load(self.image_item)
+        except Exception:
+            pass
+        with QMutexLocker(self.lock):
+            # The viewer drops the entry if it decoded the image itself meanwhile
+            if self.key in self.store:
+                if image.isNull():
+                    del self.store[self.key]
+                else:
+                    self.store[self.key] = image
+
+
+class _ScaleTask(QRunnable):
+    """Smooth-scale the displayed image on a worker thread"""
+    
+    def __init__(self, image: QImage, width: int, height: int, token: int, done):
+        super().__init__()
+        self.image = image
+        self.width = width
+        self.height = height
+        self.token = token
+        self.done = done
+    
+    def run(self):
+        scaled = self.image.scaled(
+            self.width,
+            self.height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        try:
+            self.done(scaled, self.token)
+        except RuntimeError:
+            # Viewer was closed while scaling
+            pass
+
+
 class ImageViewerWindow(QWidget):
     """Croquis image viewer window"""
     
     croquis_completed = pyqtSignal()
     croquis_saved = pyqtSignal(QPixmap, QPixmap, int, str, dict)  # original, screenshot, duration, filename, metadata
+    _smooth_scaled = pyqtSignal(QImage, int)  # scaled image, load token
     
-    def __init__(self, settings: CroquisSettings, images: List[Any], lang: str = "ko", parent=None):
+    # Decoded source images are kept in QPixmapCache (limit in KB)
+    _PIXMAP_CACHE_KB = 256 * 1024
+    # Number of upcoming images decoded ahead of time
+    _PRELOAD_AHEAD = 2
+    # Grayscale/flipped variants kept per (index, grayscale, flip)
+    _PROCESSED_CACHE_MAX = 16
+    # Bold Arial point sizes for the timer / today's count labels
+    _TIMER_FONT_SIZES = {"large": 24, "medium": 18, "small": 12}
+    _TODAY_FONT_SIZES = {"large": 20, "medium": 15, "small": 10}
+    # QFont needs a QApplication, so fonts are created on first use
+    _FONT_CACHE: dict = {}
+    
+    def __init__(self, settings: CroquisSettings, images: List[Any], lang: str = "ko", parent=None,
+                 today_count: Optional[Callable[[], int]] = None):
         super().__init__(parent)
         self.setWindowIcon(get_app_icon())
         self.settings = settings
         self.images = images
         self.lang = lang
+        # Live source of today's count (the heatmap); without one it is read from the history file
+        self._today_count_source = today_count
         self.current_index = 0
         self.paused = False
         self.remaining_time = settings.time_seconds if not settings.study_mode else 0
         self.elapsed_time = 0
         self.random_seed = None
         
+        self._processed_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        
+        # Background decodes: cache key -> QImage (None while still decoding)
+        self._prefetched: dict = {}
+        self._prefetch_lock = QMutex()
+        self._pool = QThreadPool.globalInstance()
+        # Incremented per load so late smooth-scale results are ignored
+        self._scale_token = 0
+        self._smooth_scaled.connect(self._on_smooth_scaled)
+        
+        # Today's count, re-read from disk only when the history file changes
+        self._history_mtime = None
+        self._history_day = None
+        self._today_count = 0
+        # Geometry the timer label was last positioned for
+        self._last_timer_geom = None
+        if QPixmapCache.cacheLimit() < self._PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(self._PIXMAP_CACHE_KB)
+        
         # Always shuffle using difficulty-weighted random order
         self.random_seed = random.randint(0, 1000000)
         random.seed(self.random_seed)
@@ -75,24 +171,11 @@ class ImageViewerWindow(QWidget):
         if total_weight == 0:
             return images
         
-        result = []
-        remaining = images.copy()
-        remaining_weights = weights.copy()
-        
-        while remaining:
-            cumulative = []
-            cumsum = 0
-            for w in remaining_weights:
-                cumsum += w
-                cumulative.append(cumsum)
-            
-            rand_val = random.random() * cumsum
-            for i, cum in enumerate(cumulative):
-                if rand_val <= cum:
-                    result.append(remaining[i])
-                    remaining.pop(i)
-                    remaining_weights.pop(i)
-                    break
+        # Efraimidis-Spirakis: key = u ** (1 / w), sorted descending, gives a
+        # weighted permutation in one pass plus a sort
+        keys = [random.random() ** (1.0 / w) if w > 0 else 0.0 for w in weights]
+        order = sorted(range(len(images)), key=keys.__getitem__, reverse=True)
+        result = [images[i] for i in order]
         
         return result
         
@@ -170,8 +253,11 @@ class ImageViewerWindow(QWidget):
         self.prev_btn.setToolTip(tr("previous", self.lang))
         self.prev_btn.clicked.connect(self.previous_image)
         
+        # Both pause button states are loaded once; toggle_pause only swaps them
+        self._play_icon = resource_loader.get_icon("/buttons/재생.png")
+        self._pause_icon = resource_loader.get_icon("/buttons/일시 정지.png")
         self.pause_btn = QPushButton()
-        self.pause_btn.setIcon(resource_loader.get_icon("/buttons/일시 정지.png"))
+        self.pause_btn.setIcon(self._pause_icon)
         self.pause_btn.setIconSize(QSize(24, 24))
         self.pause_btn.setToolTip(tr("pause", self.lang))
         self.pause_btn.clicked.connect(self.toggle_pause)
@@ -220,9 +306,29 @@ class ImageViewerWindow(QWidget):
         
     def setup_timer(self):
         self.timer = QTimer(self)
+        # A 1s countdown tolerates coarse (~5%) accuracy; lets the OS coalesce wakeups
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.on_timer_tick)
         self.timer.start(1000)
         
+    @staticmethod
+    def _overlay_position(pos: str, default: str, cw: int, ch: int, w: int, h: int, margin: int) -> tuple:
+        """Return the (x, y) of a w x h label anchored at pos inside a cw x ch container"""
+        match pos:
+            case "bottom_right":
+                return cw - w - margin, ch - h - margin
+            case "bottom_center":
+                return (cw - w) // 2, ch - h - margin
+            case "bottom_left":
+                return margin, ch - h - margin
+            case "top_right":
+                return cw - w - margin, margin
+            case "top_center":
+                return (cw - w) // 2, margin
+            case "top_left":
+                return margin, margin
+        return ImageViewerWindow._overlay_position(default, default, cw, ch, w, h, margin)
+    
     def update_timer_position(self):
         pos = self.settings.timer_position
         margin = 10
@@ -233,38 +339,42 @@ class ImageViewerWindow(QWidget):
         cw = self.image_container.width()
         ch = self.image_container.height()
         
-        positions = {
-            "bottom_right": (cw - w - margin, ch - h - margin),
-            "bottom_center": ((cw - w) // 2, ch - h - margin),
-            "bottom_left": (margin, ch - h - margin),
-            "top_right": (cw - w - margin, margin),
-            "top_center": ((cw - w) // 2, margin),
-            "top_left": (margin, margin),
-        }
-        
-        x, y = positions.get(pos, positions["bottom_right"])
+        x, y = self._overlay_position(pos, "bottom_right", cw, ch, w, h, margin)
         self.timer_label.move(x, y)
         
+    @classmethod
+    def _label_font(cls, size: int) -> QFont:
+        """Return the shared bold Arial font of the given point size"""
+        font = cls._FONT_CACHE.get(size)
+        if font is None:
+            font = cls._FONT_CACHE[size] = QFont("Arial", size, QFont.Weight.Bold)
+        return font
+    
     def update_timer_font(self):
-        sizes = {"large": 24, "medium": 18, "small": 12}
-        size = sizes.get(self.settings.timer_font_size, 24)
-        font = QFont("Arial", size, QFont.Weight.Bold)
-        self.timer_label.setFont(font)
+        size = self._TIMER_FONT_SIZES.get(self.settings.timer_font_size, 24)
+        self.timer_label.setFont(self._label_font(size))
     
     def load_today_croquis_count(self):
-        """Load today's croquis count from history data"""
-        dat_dir = get_data_path() / "dat"
-        data_path = dat_dir / "croquis_history.dat"
-        if data_path.exists():
-            try:
-                with open(data_path, "rb") as f:
-                    encrypted = f.read()
-                decrypted = decrypt_data(encrypted)
-                today = date.today().isoformat()
-                return decrypted.get(today, 0)
-            except Exception:
-                return 0
-        return 0
+        """Load today's croquis count from history data (cached until the file changes)"""
+        if self._today_count_source is not None:
+            return self._today_count_source()
+        data_path = get_data_path() / "dat" / "croquis_history.dat"
+        today = date.today().isoformat()
+        try:
+            mtime = data_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if mtime != self._history_mtime or today != self._history_day:
+            self._history_mtime = mtime
+            self._history_day = today
+            self._today_count = 0
+            if mtime is not None:
+                try:
+                    self._today_count = decrypt_data(data_path.read_bytes()).get(today, 0)
+                except Exception:
+                    pass
+        return self._today_count
     
     def update_today_count_display(self):
         count = self.load_today_croquis_count()
@@ -272,10 +382,8 @@ class ImageViewerWindow(QWidget):
         self.today_count_label.adjustSize()
     
     def update_today_count_font(self):
-        sizes = {"large": 20, "medium": 15, "small": 10}
-        size = sizes.get(self.settings.today_croquis_count_font_size, 15)
-        font = QFont("Arial", size, QFont.Weight.Bold)
-        self.today_count_label.setFont(font)
+        size = self._TODAY_FONT_SIZES.get(self.settings.today_croquis_count_font_size, 15)
+        self.today_count_label.setFont(self._label_font(size))
     
     def update_today_count_position(self):
         pos = self.settings.today_croquis_count_position
@@ -288,16 +396,7 @@ class ImageViewerWindow(QWidget):
         cw = self.image_container.width()
         ch = self.image_container.height()
         
-        positions = {
-            "bottom_right": (cw - w - margin, ch - h - margin),
-            "bottom_center": ((cw - w) // 2, ch - h - margin),
-            "bottom_left": (margin, ch - h - margin),
-            "top_right": (cw - w - margin, margin),
-            "top_center": ((cw - w) // 2, margin),
-            "top_left": (margin, margin),
-        }
-        
-        x, y = positions.get(pos, positions["top_right"])
+        x, y = self._overlay_position(pos, "top_right", cw, ch, w, h, margin)
         
         # Check for overlap with timer
         if pos == timer_pos:
@@ -310,40 +409,119 @@ class ImageViewerWindow(QWidget):
         
         self.today_count_label.move(x, y)
         
+    @staticmethod
+    def _pixmap_cache_key(image_item: Any) -> str:
+        """Return the QPixmapCache key for a deck image or file path"""
+        if isinstance(image_item, dict):
+            return f"croquis:{hash(image_item.get('image_data', ''))}"
+        return f"croquis:{image_item}"
+    
+    def _decode_pixmap(self, image_item: Any) -> QPixmap:
+        """Decode an image item, reusing the QPixmapCache entry when present"""
+        key = self._pixmap_cache_key(image_item)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            with QMutexLocker(self._prefetch_lock):
+                prefetched = self._prefetched.pop(key, None)
+            if prefetched is not None:
+                pixmap = QPixmap.fromImage(prefetched)
+            elif isinstance(image_item, dict):
+                pixmap = QPixmap()
+                pixmap.loadFromData(base64.b64decode(image_item.get("image_data", "")))
+            else:
+                pixmap = QPixmap(image_item)
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def _decode_image(self, image_item: Any) -> QImage:
+        """Decode an image item straight to a QImage (for grayscale/flip processing)"""
+        key = self._pixmap_cache_key(image_item)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap.toImage()
+        with QMutexLocker(self._prefetch_lock):
+            image = self._prefetched.pop(key, None)
+        if image is None:
+            image = QImage()
+            if isinstance(image_item, dict):
+                image.loadFromData(base64.b64decode(image_item.get("image_data", "")))
+            else:
+                image.load(image_item)
+        return image
+    
+    def _prefetch_upcoming(self):
+        """Start background decodes for the next few images"""
+        for offset in range(1, self._PRELOAD_AHEAD + 1):
+            index = self.current_index + offset
+            if index >= len(self.images):
+                break
+            image_item = self.images[index]
+            key = self._pixmap_cache_key(image_item)
+            if QPixmapCache.find(key) is not None:
+                continue
+            with QMutexLocker(self._prefetch_lock):
+                if key in self._prefetched:
+                    continue
+                self._prefetched[key] = None
+            self._pool.start(_DecodeTask(image_item, key, self._prefetched, self._prefetch_lock))
+    
+    def _processed_pixmap(self, index: int, image_item: Any) -> QPixmap:
+        """Return the image at index with grayscale/flip applied (LRU cached)"""
+        key = (index, self.settings.grayscale, self.settings.flip_horizontal)
+        pixmap = self._processed_cache.get(key)
+        if pixmap is not None:
+            self._processed_cache.move_to_end(key)
+            return pixmap
+        
+        if self.settings.grayscale or self.settings.flip_horizontal:
+            # Apply grayscale and flip on a QImage from the start; one QPixmap is made at the end
+            image = self._decode_image(image_item)
+            # Grayscale sources (common for reference photos) need no conversion
+            if self.settings.grayscale and image.format() != QImage.Format.Format_Grayscale8:
+                image = image.convertToFormat(QImage.Format.Format_Grayscale8)
+            if self.settings.flip_horizontal:
+                # Per-row reversal rather than a general affine transform
+                image = image.mirrored(True, False)
+            pixmap = QPixmap.fromImage(image)
+        else:
+            pixmap = self._decode_pixmap(image_item)
+        
+        self._processed_cache[key] = pixmap
+        if len(self._processed_cache) > self._PROCESSED_CACHE_MAX:
+            self._processed_cache.popitem(last=False)
+        return pixmap
+    
     def load_current_image(self):
         if 0 <= self.current_index < len(self.images):
             image_item = self.images[self.current_index]
             
+            try:
+                pixmap = self._processed_pixmap(self.current_index, image_item)
+            except Exception as e:
+                print(tr("image_load_failed", self.lang).format(e))
+                return
+            
             if isinstance(image_item, dict):
-                try:
-                    image_data_b64 = image_item.get("image_data", "")
-                    image_bytes = base64.b64decode(image_data_b64)
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_bytes)
-                    self.current_filename = image_item.get("filename", "unknown")
-                except Exception as e:
-                    print(tr("image_load_failed", self.lang).format(e))
-                    return
+                self.current_filename = image_item.get("filename", "unknown")
             else:
-                pixmap = QPixmap(image_item)
                 self.current_filename = os.path.basename(image_item)
             
-            if self.settings.grayscale:
-                image = pixmap.toImage().convertToFormat(QImage.Format.Format_Grayscale8)
-                pixmap = QPixmap.fromImage(image)
-            
-            if self.settings.flip_horizontal:
-                transform = QTransform().scale(-1, 1)
-                pixmap = pixmap.transformed(transform)
-            
+            # Show a fast preview now; the smooth version is swapped in from a worker
+            width = self.settings.image_width
+            height = self.settings.image_height
             scaled = pixmap.scaled(
-                self.settings.image_width, 
-                self.settings.image_height,
+                width,
+                height,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+                Qt.TransformationMode.FastTransformation
             )
             self.image_label.setPixmap(scaled)
             self.current_pixmap = pixmap
+            self._scale_token += 1
+            self._pool.start(_ScaleTask(
+                pixmap.toImage(), width, height, self._scale_token, self._smooth_scaled.emit
+            ))
             
             if self.settings.study_mode:
                 self.elapsed_time = 0
@@ -351,6 +529,14 @@ class ImageViewerWindow(QWidget):
                 self.remaining_time = self.settings.time_seconds
             self.update_timer_display()
             
+            # Decode upcoming images off the GUI thread while this one is shown
+            self._prefetch_upcoming()
+            
+    def _on_smooth_scaled(self, image: QImage, token: int):
+        """Replace the fast preview once the smooth scale is ready"""
+        if token == self._scale_token:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
+            
     def update_timer_display(self):
         if self.settings.study_mode:
             minutes = self.elapsed_time // 60
@@ -360,7 +546,15 @@ class ImageViewerWindow(QWidget):
             seconds = self.remaining_time % 60
         self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
         self.timer_label.adjustSize()
-        self.update_timer_position()
+        # Reposition only when the label or container size (or the setting) changed
+        geometry = (
+            self.timer_label.width(), self.timer_label.height(),
+            self.image_container.width(), self.image_container.height(),
+            self.settings.timer_position
+        )
+        if geometry != self._last_timer_geom:
+            self._last_timer_geom = geometry
+            self.update_timer_position()
         
     def on_timer_tick(self):
         if not self.paused and hasattr(self, 'timer') and self.timer:
@@ -377,7 +571,7 @@ class ImageViewerWindow(QWidget):
                         QTimer.singleShot(150, self.start_screenshot_mode)
                 
     def start_screenshot_mode(self):
-        logger.info(LOG_MESSAGES["screenshot_mode_enabled"])
+        logger.info(format_log(LogKey.screenshot_mode_enabled))
         self.screenshot_overlay.start_capture()
         
     def on_screenshot_taken(self, screenshot: QPixmap):
@@ -388,7 +582,7 @@ class ImageViewerWindow(QWidget):
         layout = QVBoxLayout(dialog)
         
         image_label = QLabel()
-        preview = screenshot.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        preview = screenshot.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
         image_label.setPixmap(preview)
         image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(image_label)
@@ -426,12 +620,12 @@ class ImageViewerWindow(QWidget):
             self.start_screenshot_mode()
             
     def on_screenshot_cancelled(self):
-        logger.info(LOG_MESSAGES["screenshot_mode_cancelled"])
+        logger.info(format_log(LogKey.screenshot_mode_cancelled))
         self.start_screenshot_mode()
         
     def save_croquis_pair(self, screenshot: QPixmap):
         """Save the croquis image pair with encryption"""
-        logger.info(LOG_MESSAGES["croquis_pair_saved"])
+        logger.info(format_log(LogKey.croquis_pair_saved))
         if self.settings.study_mode:
             croquis_time = self.elapsed_time
         else:
@@ -451,18 +645,22 @@ class ImageViewerWindow(QWidget):
         else:
             current_image_path = current_image
             image_filename = os.path.splitext(os.path.basename(current_image_path))[0]
+            try:
+                image_size = os.stat(current_image_path).st_size
+            except OSError:
+                image_size = 0
             image_metadata = {
                 "filename": os.path.basename(current_image_path),
                 "path": current_image_path,
                 "width": self.current_pixmap.width(),
                 "height": self.current_pixmap.height(),
-                "size": os.path.getsize(current_image_path) if os.path.exists(current_image_path) else 0
+                "size": image_size
             }
         
         self.croquis_saved.emit(self.current_pixmap, screenshot, croquis_time, image_filename, image_metadata)
         
     def previous_image(self):
-        logger.info(LOG_MESSAGES["croquis_previous"])
+        logger.info(format_log(LogKey.croquis_previous))
         if self.settings.study_mode:
             self.timer.stop()
             self.start_screenshot_mode()
@@ -472,13 +670,14 @@ class ImageViewerWindow(QWidget):
             self.timer.start(1000)
             
     def next_image(self):
-        logger.info(LOG_MESSAGES["croquis_next"])
+        logger.info(format_log(LogKey.croquis_next))
         if self.current_index < len(self.images) - 1:
             self.current_index += 1
         else:
             self.current_index = 0
         self.load_current_image()
-        self.update_today_count_display()
+        # Refresh the count after the new image has been painted
+        QTimer.singleShot(0, self.update_today_count_display)
         self.timer.start(1000)
             
     def next_image_no_screenshot(self):
@@ -490,20 +689,19 @@ class ImageViewerWindow(QWidget):
         
     def toggle_pause(self):
         self.paused = not self.paused
-        logger.info(LOG_MESSAGES["croquis_paused" if self.paused else "croquis_playing"])
+        logger.info(format_log(LogKey.croquis_paused if self.paused else LogKey.croquis_playing))
         
-        resource_loader = QtResourceLoader()
         if self.paused:
-            self.pause_btn.setIcon(resource_loader.get_icon("/buttons/재생.png"))
+            self.pause_btn.setIcon(self._play_icon)
             self.pause_btn.setToolTip(tr("play", self.lang))
         else:
-            self.pause_btn.setIcon(resource_loader.get_icon("/buttons/일시 정지.png"))
+            self.pause_btn.setIcon(self._pause_icon)
             self.pause_btn.setToolTip(tr("pause", self.lang))
             if self.remaining_time == 0:
                 self.next_image()
                 
     def stop_croquis(self):
-        logger.info(LOG_MESSAGES["croquis_stopped"])
+        logger.info(format_log(LogKey.croquis_stopped))
         if hasattr(self, 'timer') and self.timer:
             self.timer.stop()
             self.timer.deleteLater()
@@ -517,7 +715,7 @@ class ImageViewerWindow(QWidget):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        logger.info(LOG_MESSAGES["croquis_window_closed"])
+        logger.info(format_log(LogKey.croquis_window_closed))
         if hasattr(self, 'timer') and self.timer:
             self.timer.stop()
             self.timer.deleteLater()
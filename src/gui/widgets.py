@@ -2,14 +2,15 @@
 Reusable GUI widgets for Croquis application
 """
 
-from datetime import date, timedelta
-from typing import Dict, Optional
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRect, QRectF, QPoint
 from PyQt6.QtGui import (
-    QPainter, QColor, QBrush, QPen, QFont, QPixmap,
+    QPainter, QPainterPath, QColor, QBrush, QPen, QFont, QFontMetrics, QPixmap,
     QPaintEvent, QMouseEvent, QKeyEvent, QGuiApplication
 )
 
@@ -22,6 +23,7 @@ def tr(key: str, lang: str = "ko") -> str:
     return TRANSLATIONS.get(lang, TRANSLATIONS["ko"]).get(key, key)
 
 
+@lru_cache(maxsize=1)
 def get_data_path():
     """Get base path for data files (dat, logs, croquis_pairs etc.).
     Returns the project root directory."""
@@ -37,6 +39,21 @@ def get_data_path():
 class HeatmapWidget(QWidget):
     """GitHub-style croquis heatmap widget"""
     
+    # Top-left corner of the cell grid (below the month labels)
+    _X_OFFSET = 10
+    _Y_OFFSET = 20
+    
+    # Cell colors per activity level: none, 1-2, 3-5, 6-10, 11+
+    _COLOR_LUT = (
+        QColor(200, 200, 200),  # Darker gray for empty cells
+        QColor(155, 233, 168),
+        QColor(64, 196, 99),
+        QColor(48, 161, 78),
+        QColor(33, 110, 57),
+    )
+    _BRUSH_LUT = tuple(map(QBrush, _COLOR_LUT))
+    _BORDER_PEN = QPen(QColor(150, 150, 150), 1)
+    
     def __init__(self, parent=None, lang: str = "ko"):
         super().__init__(parent)
         self.lang = lang
@@ -46,7 +63,25 @@ class HeatmapWidget(QWidget):
         self.weeks = 53
         self.days = 7
         self.total_count = 0
+        self._month_font = QFont("Arial", 9)
+        self._tooltip_font = QFont("Arial", 10)
+        self._tooltip_metrics = QFontMetrics(self._tooltip_font)
+        self._cells_today: Optional[date] = None
+        self._cell_dates: List[List[Optional[str]]] = []
+        self._cell_paths: List[QPainterPath] = []
+        self._month_labels: List[Tuple[int, int]] = []
         self.load_data()
+        
+        # Coalesce history writes; flushed by timer and on application exit
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self.flush)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+        
         self.setMinimumHeight(120)
         self.setMouseTracking(True)
         self.hover_date = None
@@ -59,9 +94,7 @@ class HeatmapWidget(QWidget):
         data_path = dat_dir / "croquis_history.dat"
         if data_path.exists():
             try:
-                with open(data_path, "rb") as f:
-                    encrypted = f.read()
-                decrypted = decrypt_data(encrypted)
+                decrypted = decrypt_data(data_path.read_bytes())
                 self.data = decrypted
                 self.total_count = sum(self.data.values())
             except Exception:
@@ -70,36 +103,86 @@ class HeatmapWidget(QWidget):
         else:
             self.data = {}
             self.total_count = 0
+        self._rebuild_cells()
+    
+    def _rebuild_cells(self):
+        """Precompute cell dates and one cell path per color level"""
+        today = date.today()
+        # Work in day ordinals; cell (week, day) is start + week * 7 + day
+        today_ord = today.toordinal()
+        start_ord = today_ord - 365
+        self._cells_today = today
+        self._cell_dates = []
+        self._cell_paths = [QPainterPath() for _ in self._BRUSH_LUT]
+        self._month_labels = []
+        pitch = self.cell_size + self.cell_gap
+        
+        current_month = 0
+        for week in range(self.weeks):
+            week_ord = start_ord + week * 7
+            month = date.fromordinal(week_ord).month
+            if month != current_month:
+                current_month = month
+                self._month_labels.append((week, current_month))
+            
+            x = self._X_OFFSET + week * pitch
+            dates: List[Optional[str]] = []
+            for day in range(self.days):
+                if week_ord + day > today_ord:
+                    # Future cells are not drawn
+                    dates.append(None)
+                    continue
+                date_str = date.fromordinal(week_ord + day).isoformat()
+                dates.append(date_str)
+                
+                # Bucket the cell into the path of its color level
+                y = self._Y_OFFSET + day * pitch
+                self._cell_paths[self._level(self.data.get(date_str, 0))].addRoundedRect(
+                    QRectF(x, y, self.cell_size, self.cell_size), 2, 2
+                )
+            self._cell_dates.append(dates)
+    
+    def _ensure_cells(self):
+        """Rebuild the cell table when the date has rolled over"""
+        if self._cells_today != date.today():
+            self._rebuild_cells()
     
     def save_data(self):
         """Save history data"""
         dat_dir = get_data_path() / "dat"
         dat_dir.mkdir(exist_ok=True)
         data_path = dat_dir / "croquis_history.dat"
-        encrypted = encrypt_data(self.data)
-        with open(data_path, "wb") as f:
-            f.write(encrypted)
+        data_path.write_bytes(encrypt_data(self.data))
     
     def add_croquis(self, count: int = 1):
         """Increment daily croquis count"""
         today = date.today().isoformat()
         self.data[today] = self.data.get(today, 0) + count
         self.total_count += count
-        self.save_data()
+        self._rebuild_cells()
+        self._dirty = True
+        self._save_timer.start()
         self.update()
     
+    def today_count(self) -> int:
+        """Return today's croquis count, including saves not yet written to disk"""
+        return self.data.get(date.today().isoformat(), 0)
+    
+    def flush(self):
+        """Write pending history changes to disk"""
+        self._save_timer.stop()
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+    
+    @staticmethod
+    def _level(count: int) -> int:
+        """Return the color level index for a count"""
+        return (count > 0) + (count > 2) + (count > 5) + (count > 10)
+    
     def get_color(self, count: int) -> QColor:
         """Return color based on count"""
-        if count == 0:
-            return QColor(200, 200, 200)  # Darker gray for empty cells
-        elif count <= 2:
-            return QColor(155, 233, 168)
-        elif count <= 5:
-            return QColor(64, 196, 99)
-        elif count <= 10:
-            return QColor(48, 161, 78)
-        else:
-            return QColor(33, 110, 57)
+        return self._COLOR_LUT[self._level(count)]
     
     def paintEvent(self, event: QPaintEvent):
         """Draw the heatmap"""
@@ -110,42 +193,26 @@ class HeatmapWidget(QWidget):
         months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         
-        today = date.today()
-        start_date = today - timedelta(days=365)
+        self._ensure_cells()
         
         # Draw month labels
-        painter.setFont(QFont("Arial", 9))
+        painter.setFont(self._month_font)
         painter.setPen(QColor(100, 100, 100))
         
-        x_offset = 10
-        y_offset = 20
+        x_offset = self._X_OFFSET
+        y_offset = self._Y_OFFSET
+        pitch = self.cell_size + self.cell_gap
         
-        # Compute start position per month and draw labels
-        current_month = 0
-        for week in range(self.weeks):
-            check_date = start_date + timedelta(weeks=week)
-            if check_date.month != current_month:
-                current_month = check_date.month
-                x = x_offset + week * (self.cell_size + self.cell_gap)
-                painter.drawText(x, y_offset - 8, months[current_month - 1])
+        for week, month in self._month_labels:
+            x = x_offset + week * pitch
+            painter.drawText(x, y_offset - 8, months[month - 1])
         
-        # Draw heatmap cells
-        for week in range(self.weeks):
-            for day in range(self.days):
-                cell_date = start_date + timedelta(weeks=week, days=day)
-                if cell_date > today:
-                    continue
-                
-                date_str = cell_date.isoformat()
-                count = self.data.get(date_str, 0)
-                color = self.get_color(count)
-                
-                x = x_offset + week * (self.cell_size + self.cell_gap)
-                y = y_offset + day * (self.cell_size + self.cell_gap)
-                
-                painter.setBrush(QBrush(color))
-                painter.setPen(QPen(QColor(150, 150, 150), 1))  # Add light border
-                painter.drawRoundedRect(x, y, self.cell_size, self.cell_size, 2, 2)
+        # Draw heatmap cells, one path per color level
+        brushes = self._BRUSH_LUT
+        painter.setPen(self._BORDER_PEN)  # Add light border
+        for brush, path in zip(brushes, self._cell_paths):
+            painter.setBrush(brush)
+            painter.drawPath(path)
         
         # Draw legend
         legend_x = x_offset
@@ -154,11 +221,9 @@ class HeatmapWidget(QWidget):
         painter.setPen(QColor(100, 100, 100))
         painter.drawText(legend_x, legend_y + 10, tr("less", self.lang))
         
-        legend_colors = [0, 1, 3, 6, 11]
-        for i, c in enumerate(legend_colors):
-            color = self.get_color(c)
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.PenStyle.NoPen)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i, brush in enumerate(brushes):
+            painter.setBrush(brush)
             lx = legend_x + 35 + i * (self.cell_size + 2)
             painter.drawRoundedRect(lx, legend_y, self.cell_size, self.cell_size, 2, 2)
         
@@ -170,8 +235,8 @@ class HeatmapWidget(QWidget):
             count = self.data.get(self.hover_date, 0)
             tooltip_text = f"{self.hover_date}: {count} {(tr('croquis_times', self.lang))}"
             
-            painter.setFont(QFont("Arial", 10))
-            fm = painter.fontMetrics()
+            painter.setFont(self._tooltip_font)
+            fm = self._tooltip_metrics
             text_width = fm.horizontalAdvance(tooltip_text)
             text_height = fm.height()
             
@@ -209,34 +274,23 @@ class HeatmapWidget(QWidget):
     
     def mouseMoveEvent(self, event: QMouseEvent):
         """Track mouse movement over the heatmap"""
-        today = date.today()
-        start_date = today - timedelta(days=365)
-        x_offset = 60
-        y_offset = 20  # Start below month labels
+        self._ensure_cells()
+        pitch = self.cell_size + self.cell_gap
         
-        mx = event.pos().x()
-        my = event.pos().y()
+        # Map the cursor straight to a grid cell
+        week, wx = divmod(event.pos().x() - self._X_OFFSET, pitch)
+        day, dy = divmod(event.pos().y() - self._Y_OFFSET, pitch)
         
-        found = False
-        for week in range(self.weeks):
-            for day in range(self.days):
-                cell_date = start_date + timedelta(weeks=week, days=day)
-                if cell_date > today:
-                    continue
-                
-                x = x_offset + week * (self.cell_size + self.cell_gap)
-                y = y_offset + day * (self.cell_size + self.cell_gap)
-                
-                if x <= mx <= x + self.cell_size and y <= my <= y + self.cell_size:
-                    self.hover_date = cell_date.isoformat()
-                    self.hover_pos = event.pos()
-                    found = True
-                    self.update()
-                    break
-            if found:
-                break
+        cell_date = None
+        if (0 <= week < self.weeks and 0 <= day < self.days
+                and wx <= self.cell_size and dy <= self.cell_size):
+            cell_date = self._cell_dates[week][day]
         
-        if not found:
+        if cell_date is not None:
+            self.hover_date = cell_date
+            self.hover_pos = event.pos()
+            self.update()
+        else:
             if self.hover_date is not None:
                 self.hover_date = None
                 self.hover_pos = None
@@ -265,6 +319,18 @@ class ScreenshotOverlay(QWidget):
         self.end_pos = None
         self.selecting = False
         self.screenshot = None
+        self._dimmed = None
+        self._ratio = 1.0
+        
+    def _source_rect(self, rect: QRect) -> QRect:
+        """Map a widget rect to screenshot pixels (accounts for devicePixelRatio)"""
+        ratio = self._ratio
+        return QRect(
+            int(rect.x() * ratio),
+            int(rect.y() * ratio),
+            int(rect.width() * ratio),
+            int(rect.height() * ratio)
+        )
         
     def start_capture(self):
         """Begin screenshot capture"""
@@ -275,6 +341,14 @@ class ScreenshotOverlay(QWidget):
         
         screen = QGuiApplication.primaryScreen()
         self.screenshot = screen.grabWindow(0)
+        
+        # Cache the DPR scale and a pre-darkened copy of the screen
+        self._ratio = self.screenshot.devicePixelRatio()
+        self._dimmed = QPixmap(self.screenshot)
+        dim_painter = QPainter(self._dimmed)
+        dim_painter.fillRect(self._dimmed.rect(), QColor(0, 0, 0, 128))
+        dim_painter.end()
+        
         self.setGeometry(screen.geometry())
         self.showFullScreen()
         self.activateWindow()
@@ -282,12 +356,11 @@ class ScreenshotOverlay(QWidget):
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
         
-        if self.screenshot:
-            painter.drawPixmap(0, 0, self.screenshot)
-        
-        # Semi-transparent dark overlay
-        overlay = QColor(0, 0, 0, 128)
-        painter.fillRect(self.rect(), overlay)
+        # Screenshot with the semi-transparent dark overlay already applied
+        if self._dimmed:
+            painter.drawPixmap(0, 0, self._dimmed)
+        else:
+            painter.fillRect(self.rect(), QColor(0, 0, 0, 128))
         
         # Draw selection rectangle
         if self.start_pos and self.end_pos:
@@ -295,16 +368,8 @@ class ScreenshotOverlay(QWidget):
             
             # Show the original image within the selection (1:1)
             if self.screenshot:
-                # Account for devicePixelRatio when mapping to source
-                ratio = self.screenshot.devicePixelRatio()
-                source_rect = QRect(
-                    int(rect.x() * ratio),
-                    int(rect.y() * ratio),
-                    int(rect.width() * ratio),
-                    int(rect.height() * ratio)
-                )
                 # Draw using the original pixels
-                painter.drawPixmap(rect, self.screenshot, source_rect)
+                painter.drawPixmap(rect, self.screenshot, self._source_rect(rect))
             
             # White border
             pen = QPen(QColor(255, 255, 255), 2)
@@ -321,8 +386,14 @@ class ScreenshotOverlay(QWidget):
     
     def mouseMoveEvent(self, event: QMouseEvent):
         if self.selecting:
-            self.end_pos = event.pos()
-            self.update()
+            pos = event.pos()
+            if pos == self.end_pos:
+                return
+            old_rect = QRect(self.start_pos, self.end_pos).normalized()
+            self.end_pos = pos
+            new_rect = QRect(self.start_pos, self.end_pos).normalized()
+            # Repaint only the area covered by the old and new selection (plus border)
+            self.update(old_rect.united(new_rect).adjusted(-3, -3, 3, 3))
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton and self.selecting:
@@ -333,14 +404,7 @@ class ScreenshotOverlay(QWidget):
                 rect = QRect(self.start_pos, self.end_pos).normalized()
                 if rect.width() > 10 and rect.height() > 10:
                     # Adjust for devicePixelRatio to crop accurate region
-                    ratio = self.screenshot.devicePixelRatio()
-                    scaled_rect = QRect(
-                        int(rect.x() * ratio),
-                        int(rect.y() * ratio),
-                        int(rect.width() * ratio),
-                        int(rect.height() * ratio)
-                    )
-                    cropped = self.screenshot.copy(scaled_rect)
+                    cropped = self.screenshot.copy(self._source_rect(rect))
                     self.hide()
                     self.screenshot_taken.emit(cropped)
                     return
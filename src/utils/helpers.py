@@ -3,11 +3,13 @@ Common utility functions for Croquis application
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from PyQt6.QtGui import QIcon
 from utils.language_manager import TRANSLATIONS
 
 
+@lru_cache(maxsize=1)
 def get_data_path():
     """Get base path for data files (dat, logs, croquis_pairs etc.).
     Returns the project root directory."""
@@ -24,8 +26,9 @@ def tr(key: str, lang: str = "ko") -> str:
     return TRANSLATIONS.get(lang, TRANSLATIONS["ko"]).get(key, key)
 
 
+@lru_cache(maxsize=1)
 def get_app_icon() -> QIcon:
-    """Load application icon from file (optimized for PyInstaller)"""
+    """Load application icon from file (optimized for PyInstaller, shared by all windows)"""
     icon_path = None
     
     if getattr(sys, 'frozen', False):
@@ -1,3 +1,12 @@
+"""
+Log Manager Module
+Centralized log message templates
+"""
+
+from enum import IntEnum
+from string import Formatter
+from types import MappingProxyType
+
 LOG_MESSAGES = {
     # Program lifecycle
     "program_started": "Program started",
@@ -83,4 +92,52 @@ LOG_MESSAGES = {
     "memo_saved": "Croquis memo saved: {}",
     "memo_loading_failed": "Memo loading failed: {}",
     "memo_saving_failed": "Memo saving failed: {}",
-}
\ No newline at end of file
+}
+
+
+def _precompile(template: str) -> tuple:
+    """Split a "{}"-style template into its literal segments (one more than the argument count)"""
+    literals = []
+    pending = ''
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        pending += literal
+        if field_name is None:
+            continue
+        if field_name or format_spec or conversion:
+            # Indexed/named fields or format specs are left to str.format
+            return None
+        literals.append(pending)
+        pending = ''
+    literals.append(pending)
+    return tuple(literals)
+
+
+# Integer keys for LOG_MESSAGES, in declaration order (LogKey.program_started == 0, ...)
+LogKey = IntEnum('LogKey', list(LOG_MESSAGES), start=0)
+
+# Message templates indexed by LogKey
+_MESSAGES = tuple(LOG_MESSAGES.values())
+
+# Pre-parsed templates indexed by LogKey: tuple of literal segments
+_COMPILED = tuple(_precompile(message) for message in _MESSAGES)
+
+# Read-only view so templates cannot be mutated at runtime (kept for string-keyed lookups)
+LOG_MESSAGES = MappingProxyType(LOG_MESSAGES)
+
+
+def format_log(key: LogKey, *args) -> str:
+    """Format a log message by LogKey without re-parsing the template on every call"""
+    try:
+        literals = _COMPILED[key]
+    except (IndexError, TypeError):
+        raise KeyError(f"No log message for {key!r}") from None
+    if literals is None or len(args) != len(literals) - 1:
+        # Indexed fields, or an argument count mismatch: str.format keeps its behavior (IndexError on too few)
+        return _MESSAGES[key].format(*args)
+    if len(literals) == 1:
+        return literals[0]
+    parts = [literals[0]]
+    for arg, literal in zip(args, literals[1:]):
+        parts.append(str(arg))
+        parts.append(literal)
+    return ''.join(parts)
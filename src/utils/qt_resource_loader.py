@@ -22,15 +22,18 @@ if str(assets_dir) not in sys.path:
 try:
     import resources_rc  # type: ignore[import-not-found]
     RESOURCES_AVAILABLE = True
-    # Get the _RESOURCES dictionary
-    if hasattr(resources_rc, '_RESOURCES'):
-        _RESOURCES_DICT = resources_rc._RESOURCES
+    # Get the (cached) lookup helpers; they also resolve deduplicated aliases
+    if hasattr(resources_rc, 'get_resource_data'):
+        _resource_exists = resources_rc.resource_exists
+        _get_resource_data = resources_rc.get_resource_data
     else:
-        _RESOURCES_DICT = {}
+        _resource_exists = lambda resource_path: False
+        _get_resource_data = None
     logger.info("Qt resources_rc module loaded successfully")
 except ImportError as e:
     RESOURCES_AVAILABLE = False
-    _RESOURCES_DICT = {}
+    _resource_exists = lambda resource_path: False
+    _get_resource_data = None
     logger.warning(f"resources_rc.py not found: {e}. Run 'python scripts/compile_resources.py' first.")
 
 
@@ -65,13 +68,11 @@ class QtResourceLoader:
             return QPixmap()
         
         try:
-            import base64
             # Strip : prefix to match dictionary keys
             dict_key = resource_path[1:] if resource_path.startswith(":") else resource_path
             
-            if dict_key in _RESOURCES_DICT:
-                encoded_data = _RESOURCES_DICT[dict_key]
-                raw_data = base64.b64decode(encoded_data.encode('ascii'))
+            if _resource_exists(dict_key):
+                raw_data = _get_resource_data(dict_key)
                 pixmap = QPixmap()
                 pixmap.loadFromData(raw_data)
                 if pixmap.isNull():
@@ -151,14 +152,12 @@ class QtResourceLoader:
             return self._read_file_fallback(resource_path, encoding)
         
         try:
-            # First try: Load from _RESOURCES_DICT directly
+            # First try: Load from compiled resources directly
             # Strip : prefix to match dictionary keys (keep the leading /)
             dict_key = resource_path[1:] if resource_path.startswith(":") else resource_path
             
-            if dict_key in _RESOURCES_DICT:
-                import base64
-                encoded_data = _RESOURCES_DICT[dict_key]
-                data = base64.b64decode(encoded_data.encode('ascii'))
+            if _resource_exists(dict_key):
+                data = _get_resource_data(dict_key)
                 return data.decode(encoding)
             
             # Second try: QFile (for compatibility)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Same import root main.py sets up for the application
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,104 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+pytest.importorskip("cryptography")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QBuffer, QIODevice, Qt
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+import main
+from core.key_manager import decrypt_data
+
+
+@pytest.fixture
+def editor(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "get_data_path", lambda: tmp_path)
+    app = QApplication.instance() or QApplication([])
+    window = main.DeckEditorWindow()
+    yield window
+    window.cleanup_temp_file()
+    window.deleteLater()
+    app.processEvents()
+
+
+def _png_bytes(width: int, height: int) -> bytes:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(Qt.GlobalColor.red)
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return buffer.data().data()
+
+
+def test_thumb_data_persisted_after_list_paints(editor):
+    entry = main._build_image_entry(_png_bytes(600, 400), "red.png", "red.png")
+    # Force the list to render from the full image, as for decks saved without thumb_data
+    entry.pop("thumb_data", None)
+    editor.deck_images.append(entry)
+    editor.update_image_list()
+    
+    # Painting the list requests the thumbnail; wait for the worker and its queued signal
+    editor.image_list.grab()
+    deadline = time.monotonic() + 5
+    while "thumb_data" not in editor.deck_images[0] and time.monotonic() < deadline:
+        editor._thumb_pool.waitForDone(50)
+        QApplication.processEvents()
+    
+    assert editor.deck_images[0].get("thumb_data")
+    editor.flush_temp_file()
+    saved = decrypt_data(editor.temp_file_path.read_bytes())
+    assert saved["images"][0].get("thumb_data") == editor.deck_images[0]["thumb_data"]
+
+
+def test_item_edits_reach_deck_entry(editor):
+    editor.deck_images.append(main._build_image_entry(_png_bytes(40, 30), "small.png", "small.png"))
+    editor.update_image_list()
+    item = editor.image_list.item(0)
+    
+    # Items carry only the filename; edits go straight to the deck_images entry
+    assert item.data(Qt.ItemDataRole.UserRole) == "small.png"
+    editor.cycle_item_difficulty(item)
+    assert editor.deck_images[0]["difficulty"] == 2
+    assert editor._entry_for_item(item) is editor.deck_images[0]
+
+
+def test_save_marks_clean_only_after_copy(editor, tmp_path):
+    editor.deck_images.append(main._build_image_entry(_png_bytes(40, 30), "small.png", "small.png"))
+    editor.update_image_list()
+    editor.save_temp_file()
+    editor.mark_modified()
+    
+    editor.show()
+    deck_path = str(tmp_path / "deck.crdk")
+    editor._save_to_path(deck_path)
+    # The copy runs on the writer thread; the deck stays modified until it reports back
+    assert editor.is_modified
+    assert editor.current_deck_path == deck_path
+    editor._temp_write_pool.waitForDone()
+    QApplication.processEvents()
+    
+    assert not editor.is_modified
+    assert editor.current_deck_path == deck_path
+    saved = decrypt_data(open(deck_path, "rb").read())
+    assert [img["filename"] for img in saved["images"]] == ["small.png"]
+
+
+def test_waiting_save_reports_result(editor, tmp_path, monkeypatch):
+    editor.deck_images.append(main._build_image_entry(_png_bytes(40, 30), "small.png", "small.png"))
+    editor.save_temp_file()
+    editor.mark_modified()
+    
+    # Close/New/Open save with wait=True and only go on once the copy succeeded
+    assert editor._save_to_path(str(tmp_path / "deck.crdk"), wait=True)
+    assert not editor.is_modified
+    
+    editor.mark_modified()
+    editor.save_temp_file()
+    monkeypatch.setattr(main.QMessageBox, "critical", lambda *args: None)
+    assert not editor._save_to_path(str(tmp_path / "missing" / "deck.crdk"), wait=True)
+    assert editor.is_modified
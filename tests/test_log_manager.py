@@ -0,0 +1,20 @@
+import pytest
+
+from utils.log_manager import LOG_MESSAGES, LogKey, format_log
+
+
+def test_format_log_matches_str_format():
+    assert format_log(LogKey.image_exported, "a.png", "/tmp/a.png") == "Image exported: a.png -> /tmp/a.png"
+    assert format_log(LogKey.deck_saved) == LOG_MESSAGES["deck_saved"]
+
+
+def test_format_log_too_few_args_raises():
+    with pytest.raises(IndexError):
+        format_log(LogKey.image_exported, "a.png")
+
+
+def test_format_log_unknown_key_raises_key_error():
+    with pytest.raises(KeyError, match="9999"):
+        format_log(9999)
+    with pytest.raises(KeyError, match="deck_saved"):
+        format_log("deck_saved")